@@ -0,0 +1,54 @@
+from functools import lru_cache
+
+from django.contrib.sessions.middleware import SessionMiddleware
+
+
+@lru_cache(maxsize=None)
+def lazy_session_store(store_class):
+    """Extend a SESSION_ENGINE's SessionStore with lazily created sessions."""
+
+    class LazySessionStore(store_class):
+        @property
+        def key_salt(self):
+            # Signed with the engine's own salt, so existing sessions still decode
+            return "django.contrib.sessions." + store_class.__qualname__
+
+        @property
+        def session_key(self):
+            """
+            The key of the requesting session, or None if it has none yet.
+
+            The session is loaded first, so a cookie whose session has
+            expired or been deleted yields None rather than its stale key.
+            """
+            if self._session_key is not None and not hasattr(self, '_session_cache'):
+                self.accessed = True
+                # load() reads session_key itself, so mark the session loaded first
+                self._session_cache = {}
+                self._session_cache = self.load()
+            return self._session_key
+
+        def get_or_create_key(self):
+            """The session's key, creating the session first if it has none yet."""
+            if self.session_key is None:
+                self.create()
+            return self.session_key
+
+    LazySessionStore.__name__ = LazySessionStore.__qualname__ = f"Lazy{store_class.__name__}"
+    return LazySessionStore
+
+
+class LazySessionMiddleware(SessionMiddleware):
+    """
+    SessionMiddleware that only stores a session once a view writes to it.
+
+    Visitors that just read (polling whether they are in a room, say) cost
+    no session writes. A view that writes to the session gets it saved, and
+    created if it is new, when the response goes out. A view that needs the
+    key before then, to store something under it, calls
+    request.session.get_or_create_key().
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.SessionStore = lazy_session_store(self.SessionStore)
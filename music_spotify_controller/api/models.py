@@ -1,17 +1,35 @@
-from django.db import models
+from django.db import models, transaction, IntegrityError
 import string
-import random
+import secrets
 
+CODE_ATTEMPTS = 5
 
-def generate_unique_code():
-    length = 6
 
-    while True:
-        code = ''.join(random.choices(string.ascii_uppercase, k=length))
-        if Room.objects.filter(code=code).count() == 0:
-            break
+def generate_unique_code(length=6):
+    # 26^6 codes, so a random pick practically never collides. Uniqueness
+    # is enforced by the unique constraint on Room.code, see create_room.
+    return ''.join(secrets.choice(string.ascii_uppercase) for _ in range(length))
 
-    return code
+
+def create_room(**fields):
+    """
+    Insert a room with a fresh random code in a single write.
+
+    If the code is already taken, the unique constraint rejects the insert
+    and another code is drawn, a longer one after the first two tries.
+    """
+    for attempt in range(CODE_ATTEMPTS):
+        room = Room(code=generate_unique_code(6 if attempt < 2 else 8), **fields)
+        try:
+            with transaction.atomic():
+                room.save(force_insert=True)
+            return room
+        except IntegrityError:
+            # The host may have created a room concurrently, only retry code clashes
+            if not Room.objects.filter(code=room.code).exists():
+                raise
+
+    raise IntegrityError(f"Could not find a free room code in {CODE_ATTEMPTS} attempts")
 
 
 class Room(models.Model):
@@ -22,3 +40,7 @@ class Room(models.Model):
     votes_to_skip = models.IntegerField(null=False, default=1)
     created_at = models.DateTimeField(auto_now_add=True)
     current_song = models.CharField(max_length=50, null=True)
+
+    class Meta:
+        # The room export walks this index newest first, see api.views.export_rooms
+        indexes = [models.Index(fields=['created_at', 'id'], name='room_created_id_idx')]
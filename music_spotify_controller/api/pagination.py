@@ -0,0 +1,22 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class RoomCursorPagination(CursorPagination):
+    """
+    Rooms newest first, a page at a time.
+
+    The cursor holds the id of the last room served rather than an offset,
+    so every page is a range scan of the primary key, however deep the
+    client pages and however many rooms are added between pages. DRF's
+    cursor only holds the first ordering field, and pages through rooms
+    that share it by offset, so the ordering is the unique, increasing id
+    rather than created_at, which rooms created together can share.
+    """
+    ordering = '-id'
+    page_size_query_param = 'page_size'
+
+    def get_page_size(self, request):
+        self.page_size = getattr(settings, 'API_ROOM_PAGE_SIZE', 50)
+        self.max_page_size = getattr(settings, 'API_ROOM_MAX_PAGE_SIZE', 500)
+        return super().get_page_size(request)
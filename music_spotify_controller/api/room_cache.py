@@ -0,0 +1,39 @@
+"""
+Read-through cache of rooms by code, in the shared cache.
+
+Every poll, vote and playback command looks up the room in the session
+first. Those lookups are served from here, and go to the database only
+when a room was changed, or its entry is older than API_ROOM_CACHE_TTL
+seconds. Rooms that don't exist are not cached.
+
+Code that changes or deletes a room calls forget_room() for it.
+"""
+from django.conf import settings
+from django.db import transaction
+
+from spotify.shared_cache import SharedCache
+from .models import Room
+
+room_cache = SharedCache('rooms')
+
+
+def get_room(code):
+    """The room with this code, or None if there is none."""
+    if not code:
+        return None
+
+    room = room_cache.get(code)
+    if room is None:
+        room = Room.objects.filter(code=code).first()
+        if room is not None:
+            room_cache.set(code, room, getattr(settings, 'API_ROOM_CACHE_TTL', 60))
+    return room
+
+
+def forget_room(code):
+    """
+    Drop a room's cache entry, now and once the current transaction
+    commits, as another request may cache the old row in between.
+    """
+    room_cache.delete(code)
+    transaction.on_commit(lambda: room_cache.delete(code))
@@ -9,6 +9,13 @@ class RoomSerializer(serializers.ModelSerializer):
                   'votes_to_skip', 'created_at')
 
 
+class RoomListSerializer(serializers.ModelSerializer):
+    # Host session keys are not for everyone to see, unlike the room codes
+    class Meta:
+        model = Room
+        fields = ('id', 'code', 'guest_can_pause', 'votes_to_skip', 'created_at')
+
+
 class CreateRoomSerializer(serializers.ModelSerializer):
     class Meta:
         model = Room
@@ -1,3 +1,229 @@
-from django.test import TestCase
+from base64 import b64decode
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+import json
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.db import IntegrityError
+from django.test import Client, TestCase, override_settings
+
+from spotify.tests import FakeSpotifyTestCase
+from .models import CODE_ATTEMPTS, Room, create_room
+
+
+class RoomBudgetTests(FakeSpotifyTestCase):
+    """Room views work from the database and the session alone, and never call Spotify."""
+
+    def test_create_room(self):
+        host = Client()
+        with self.assertBudget(queries=5):
+            response = host.post('/api/create-room', {'votes_to_skip': 2, 'guest_can_pause': True},
+                                 content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+
+    def test_create_room_again_updates_it(self):
+        host, code = self.create_room()
+        with self.assertBudget(queries=3):
+            response = host.post('/api/create-room', {'votes_to_skip': 4, 'guest_can_pause': False},
+                                 content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['code'], code)
+
+    def test_get_room_as_host(self):
+        host, code = self.create_room()
+        with self.assertBudget(queries=1):
+            response = host.get('/api/get-room', {'code': code})
+        self.assertTrue(response.json()['is_host'])
+
+    def test_get_room_as_guest(self):
+        host, code = self.create_room()
+        guest = self.join_room(code)
+        with self.assertBudget(queries=0):
+            response = guest.get('/api/get-room', {'code': code})
+        self.assertFalse(response.json()['is_host'])
+
+    def test_join_room(self):
+        host, code = self.create_room()
+        with self.assertBudget(queries=3):
+            self.join_room(code)
+
+    def test_user_in_room_without_a_session(self):
+        with self.assertBudget(queries=0):
+            response = Client().get('/api/user-in-room')
+        self.assertEqual(response.json(), {'code': None})
+
+    def test_user_in_room(self):
+        host, code = self.create_room()
+        guest = self.join_room(code)
+        with self.assertBudget(queries=0):
+            response = guest.get('/api/user-in-room')
+        self.assertEqual(response.json(), {'code': code})
+
+    def test_guest_leaves(self):
+        host, code = self.create_room()
+        guest = self.join_room(code)
+        with self.assertBudget(queries=2):
+            guest.post('/api/leave-room')
+        self.assertTrue(Room.objects.filter(code=code).exists())
+
+    def test_host_leaves_and_closes_the_room(self):
+        host, code = self.create_room()
+        self.link_spotify(host)
+        self.join_room(code).get('/spotify/current-song')
+        with self.assertBudget(queries=5):
+            host.post('/api/leave-room')
+        self.assertFalse(Room.objects.filter(code=code).exists())
+
+    def test_update_room(self):
+        host, code = self.create_room()
+        with self.assertBudget(queries=2):
+            response = host.patch('/api/update-room', {'code': code, 'votes_to_skip': 3, 'guest_can_pause': False},
+                                  content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+
+    def test_room_list_does_not_grow_with_rooms(self):
+        for _ in range(3):
+            self.create_room()
+        with self.assertBudget(queries=1):
+            self.assertEqual(len(Client().get('/api/room').json()['results']), 3)
+        for _ in range(7):
+            self.create_room()
+        with self.assertBudget(queries=1):
+            self.assertEqual(len(Client().get('/api/room').json()['results']), 10)
+
+
+class CreateRoomTests(TestCase):
+    def setUp(self):
+        Room.objects.create(code='TAKEN', host='other-host')
+
+    def codes(self, *codes):
+        return mock.patch('api.models.generate_unique_code', side_effect=codes)
+
+    def test_taken_code_is_drawn_again(self):
+        with self.codes('TAKEN', 'FREE') as generate:
+            room = create_room(host='host')
+        self.assertEqual(room.code, 'FREE')
+        self.assertEqual(generate.call_count, 2)
+
+    def test_codes_get_longer_after_two_clashes(self):
+        with self.codes('TAKEN', 'TAKEN', 'LONGCODE') as generate:
+            room = create_room(host='host')
+        self.assertEqual(room.code, 'LONGCODE')
+        self.assertEqual([call.args for call in generate.call_args_list], [(6,), (6,), (8,)])
+
+    def test_gives_up_after_every_attempt_clashes(self):
+        with self.codes(*['TAKEN'] * CODE_ATTEMPTS) as generate, self.assertRaises(IntegrityError):
+            create_room(host='host')
+        self.assertEqual(generate.call_count, CODE_ATTEMPTS)
+        self.assertFalse(Room.objects.filter(host='host').exists())
+
+    def test_host_clash_is_not_retried(self):
+        with self.codes('FREE', 'OTHER') as generate, self.assertRaises(IntegrityError):
+            create_room(host='other-host')
+        self.assertEqual(generate.call_count, 1)
+
+    def test_view_updates_the_room_a_concurrent_request_created(self):
+        host = Client()
+
+        def create_concurrently(host, **fields):
+            Room.objects.create(code='RACED', host=host, votes_to_skip=1)
+            raise IntegrityError("UNIQUE constraint failed: api_room.host")
+
+        with mock.patch('api.views.create_room', side_effect=create_concurrently):
+            response = host.post('/api/create-room', {'votes_to_skip': 3, 'guest_can_pause': True},
+                                 content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['code'], 'RACED')
+        self.assertEqual(Room.objects.get(code='RACED').votes_to_skip, 3)
+        self.assertEqual(host.session['room_code'], 'RACED')
+
+
+class RoomListTests(FakeSpotifyTestCase):
+    def setUp(self):
+        super().setUp()
+        self.codes = [self.create_room(guest_can_pause=i % 2 == 0)[1] for i in range(5)]
+
+    def test_pages_walk_every_room_newest_first(self):
+        client = Client()
+        url = '/api/room?page_size=2'
+        codes = []
+        while url:
+            with self.assertBudget(queries=1):
+                page = client.get(url).json()
+            self.assertLessEqual(len(page['results']), 2)
+            codes += [room['code'] for room in page['results']]
+            url = page['next']
+        self.assertEqual(codes, self.codes[::-1])
+
+    def test_rooms_created_together_are_paged_by_id(self):
+        Room.objects.update(created_at=Room.objects.first().created_at)
+        client = Client()
+        url = '/api/room?page_size=2'
+        codes = []
+        while url:
+            page = client.get(url).json()
+            codes += [room['code'] for room in page['results']]
+            url = page['next']
+            if url:
+                cursor = parse_qs(b64decode(parse_qs(urlparse(url).query)['cursor'][0]).decode())
+                # A position to start after, with no offset from it
+                self.assertNotIn('o', cursor)
+        self.assertEqual(codes, self.codes[::-1])
+
+    def test_hosts_are_not_listed(self):
+        room = Client().get('/api/room').json()['results'][0]
+        self.assertNotIn('host', room)
+
+    def test_filters(self):
+        rooms = Client().get('/api/room', {'guest_can_pause': 'false'}).json()['results']
+        self.assertEqual({room['code'] for room in rooms}, {self.codes[1], self.codes[3]})
+
+        newest = Room.objects.get(code=self.codes[-1])
+        rooms = Client().get('/api/room', {'created_before': newest.created_at.isoformat()}).json()['results']
+        self.assertEqual(len(rooms), 4)
+
+    def test_invalid_filter_is_rejected(self):
+        response = Client().get('/api/room', {'created_after': 'yesterday'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_export_is_for_staff_only(self):
+        self.assertEqual(Client().get('/api/room/export').status_code, 403)
+
+    @override_settings(API_ROOM_EXPORT_BATCH_SIZE=2)
+    def test_export_streams_every_room_in_batches(self):
+        staff = Client()
+        staff.force_login(User.objects.create_user('admin', is_staff=True))
+        response = staff.get('/api/room/export')
+        self.assertTrue(response.streaming)
+        with self.assertBudget(queries=3):
+            rooms = json.loads(b''.join(response.streaming_content))
+        self.assertEqual([room['code'] for room in rooms], self.codes[::-1])
+        self.assertTrue(all(room['host'] for room in rooms))
+
+
+class RoomCacheTests(FakeSpotifyTestCase):
+    """Rooms are served from the cache, but changes show up straight away."""
+
+    def setUp(self):
+        super().setUp()
+        self.host, self.code = self.create_room(votes_to_skip=2)
+        self.guest = self.join_room(self.code)
+        self.guest.get('/api/get-room', {'code': self.code})
+
+    def get_room(self):
+        return self.guest.get('/api/get-room', {'code': self.code})
+
+    def test_update_room(self):
+        self.host.patch('/api/update-room', {'code': self.code, 'votes_to_skip': 5, 'guest_can_pause': False},
+                        content_type='application/json')
+        self.assertEqual(self.get_room().json()['votes_to_skip'], 5)
+
+    def test_create_room_again(self):
+        self.host.post('/api/create-room', {'votes_to_skip': 4, 'guest_can_pause': True},
+                       content_type='application/json')
+        self.assertEqual(self.get_room().json()['votes_to_skip'], 4)
+
+    def test_host_leaves(self):
+        self.host.post('/api/leave-room')
+        self.assertEqual(self.get_room().status_code, 404)
+        self.assertEqual(self.guest.get('/spotify/current-song').status_code, 404)
@@ -1,17 +1,126 @@
+from django.conf import settings
+from django.db import IntegrityError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
 from django.shortcuts import render
-from rest_framework import generics, status
-from .serializers import RoomSerializer, CreateRoomSerializer, UpdateRoomSerializer
-from .models import Room
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import generics, permissions, status
+from rest_framework.exceptions import ValidationError
+from .serializers import RoomSerializer, RoomListSerializer, CreateRoomSerializer, UpdateRoomSerializer
+from .models import Room, create_room
+from .pagination import RoomCursorPagination
+from .room_cache import get_room, forget_room
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from django.http import JsonResponse
+from django.http import JsonResponse, StreamingHttpResponse
+from spotify.now_playing import now_playing_cache
 
 # Create your views here.
 
+EXPORT_FIELDS = ('id', 'code', 'host', 'guest_can_pause', 'votes_to_skip', 'created_at', 'current_song')
+
+
+def boolean_param(params, name):
+    value = params.get(name)
+    if value is None:
+        return None
+    if value.lower() in ('true', '1'):
+        return True
+    if value.lower() in ('false', '0'):
+        return False
+    raise ValidationError({name: 'Expected true or false.'})
+
+
+def datetime_param(params, name):
+    value = params.get(name)
+    if value is None:
+        return None
+    parsed = parse_datetime(value)
+    if parsed is None:
+        raise ValidationError({name: 'Expected an ISO 8601 date and time.'})
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def filter_rooms(rooms, params):
+    """
+    Narrow rooms down by the query parameters guest_can_pause,
+    votes_to_skip, created_after and created_before.
+    """
+    guest_can_pause = boolean_param(params, 'guest_can_pause')
+    if guest_can_pause is not None:
+        rooms = rooms.filter(guest_can_pause=guest_can_pause)
+
+    votes_to_skip = params.get('votes_to_skip')
+    if votes_to_skip is not None:
+        if not votes_to_skip.isdigit():
+            raise ValidationError({'votes_to_skip': 'Expected a whole number.'})
+        rooms = rooms.filter(votes_to_skip=int(votes_to_skip))
+
+    created_after = datetime_param(params, 'created_after')
+    if created_after is not None:
+        rooms = rooms.filter(created_at__gt=created_after)
+    created_before = datetime_param(params, 'created_before')
+    if created_before is not None:
+        rooms = rooms.filter(created_at__lt=created_before)
+    return rooms
+
+
+def export_rooms(rooms, batch_size=None):
+    """
+    Yield rooms as the pieces of one JSON array, newest first.
+
+    The rooms are read batch_size at a time, each batch starting after the
+    last room of the one before on the (created_at, id) index, so no
+    cursor is held open while the response is sent and memory stays flat
+    however large the table is.
+    """
+    batch_size = batch_size or getattr(settings, 'API_ROOM_EXPORT_BATCH_SIZE', 1000)
+    rooms = rooms.order_by('-created_at', '-id').values(*EXPORT_FIELDS)
+    encoder = DjangoJSONEncoder()
+
+    yield '['
+    last = None
+    separator = ''
+    while True:
+        batch = rooms
+        if last is not None:
+            batch = batch.filter(Q(created_at__lt=last['created_at']) |
+                                 Q(created_at=last['created_at'], id__lt=last['id']))
+        batch = list(batch[:batch_size])
+        if batch:
+            yield separator + ','.join(encoder.encode(room) for room in batch)
+            separator = ','
+        if len(batch) < batch_size:
+            break
+        last = batch[-1]
+    yield ']'
+
 
 class RoomView(generics.ListAPIView):
-    queryset = Room.objects.all()
-    serializer_class = RoomSerializer
+    """Rooms newest first, a page at a time, optionally filtered (see filter_rooms)."""
+    serializer_class = RoomListSerializer
+    pagination_class = RoomCursorPagination
+
+    def get_queryset(self):
+        rooms = Room.objects.only(*RoomListSerializer.Meta.fields)
+        return filter_rooms(rooms, self.request.query_params)
+
+
+class ExportRooms(APIView):
+    """
+    Every room matching the RoomView filters, as a streamed JSON file.
+    Staff only, as it includes the hosts' session keys.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request, format=None):
+        rooms = filter_rooms(Room.objects.all(), request.query_params)
+        response = StreamingHttpResponse(export_rooms(rooms), content_type='application/json')
+        response['Content-Disposition'] = 'attachment; filename="rooms.json"'
+        return response
 
 
 class GetRoom(APIView):
@@ -21,10 +130,10 @@ class GetRoom(APIView):
     def get(self, request, format=None):
         code = request.GET.get(self.lookup_url_kwarg)
         if code != None:
-            room = Room.objects.filter(code=code)
-            if len(room) > 0:
-                data = RoomSerializer(room[0]).data
-                data['is_host'] = self.request.session.session_key == room[0].host
+            room = get_room(code)
+            if room is not None:
+                data = RoomSerializer(room).data
+                data['is_host'] = self.request.session.session_key == room.host
                 return Response(data, status=status.HTTP_200_OK)
             return Response({'Room Not Found': 'Invalid Room Code.'}, status=status.HTTP_404_NOT_FOUND)
 
@@ -35,14 +144,9 @@ class JoinRoom(APIView):
     lookup_url_kwarg = 'code'
 
     def post(self, request, format=None):
-        if not self.request.session.exists(self.request.session.session_key):
-            self.request.session.create()
-
         code = request.data.get(self.lookup_url_kwarg)
         if code != None:
-            room_result = Room.objects.filter(code=code)
-            if len(room_result) > 0:
-                room = room_result[0]
+            if get_room(code) is not None:
                 self.request.session['room_code'] = code
                 return Response({'message': 'Room Joined!'}, status=status.HTTP_200_OK)
 
@@ -55,37 +159,36 @@ class CreateRoomView(APIView):
     serializer_class = CreateRoomSerializer
 
     def post(self, request, format=None):
-        if not self.request.session.exists(self.request.session.session_key):
-            self.request.session.create()
-
         serializer = self.serializer_class(data=request.data)
         if serializer.is_valid():
             guest_can_pause = serializer.data.get('guest_can_pause')
             votes_to_skip = serializer.data.get('votes_to_skip')
-            host = self.request.session.session_key
-            queryset = Room.objects.filter(host=host)
-            if queryset.exists():
-                room = queryset[0]
-                room.guest_can_pause = guest_can_pause
-                room.votes_to_skip = votes_to_skip
-                room.save(update_fields=['guest_can_pause', 'votes_to_skip'])
-                self.request.session['room_code'] = room.code
-                return Response(RoomSerializer(room).data, status=status.HTTP_200_OK)
-            else:
-                room = Room(host=host, guest_can_pause=guest_can_pause,
-                            votes_to_skip=votes_to_skip)
-                room.save()
-                self.request.session['room_code'] = room.code
-                return Response(RoomSerializer(room).data, status=status.HTTP_201_CREATED)
+            host = self.request.session.get_or_create_key()
+            room = Room.objects.filter(host=host).first()
+            if room is None:
+                try:
+                    room = create_room(host=host, guest_can_pause=guest_can_pause,
+                                       votes_to_skip=votes_to_skip)
+                    self.request.session['room_code'] = room.code
+                    return Response(RoomSerializer(room).data, status=status.HTTP_201_CREATED)
+                except IntegrityError:
+                    # Another request from this host created its room first
+                    room = Room.objects.filter(host=host).first()
+                    if room is None:
+                        raise
+
+            room.guest_can_pause = guest_can_pause
+            room.votes_to_skip = votes_to_skip
+            room.save(update_fields=['guest_can_pause', 'votes_to_skip'])
+            forget_room(room.code)
+            self.request.session['room_code'] = room.code
+            return Response(RoomSerializer(room).data, status=status.HTTP_200_OK)
 
         return Response({'Bad Request': 'Invalid data...'}, status=status.HTTP_400_BAD_REQUEST)
 
 
 class UserInRoom(APIView):
     def get(self, request, format=None):
-        if not self.request.session.exists(self.request.session.session_key):
-            self.request.session.create()
-
         data = {
             'code': self.request.session.get('room_code')
         }
@@ -97,10 +200,11 @@ class LeaveRoom(APIView):
         if 'room_code' in self.request.session:
             self.request.session.pop('room_code')
             host_id = self.request.session.session_key
-            room_results = Room.objects.filter(host=host_id)
-            if len(room_results) > 0:
-                room = room_results[0]
+            room = Room.objects.filter(host=host_id).first()
+            if room is not None:
                 room.delete()
+                forget_room(room.code)
+                now_playing_cache.discard(room.code)
 
         return Response({'Message': 'Success'}, status=status.HTTP_200_OK)
 
@@ -109,20 +213,16 @@ class UpdateRoom(APIView):
     serializer_class = UpdateRoomSerializer
 
     def patch(self, request, format=None):
-        if not self.request.session.exists(self.request.session.session_key):
-            self.request.session.create()
-
         serializer = self.serializer_class(data=request.data)
         if serializer.is_valid():
             guest_can_pause = serializer.data.get('guest_can_pause')
             votes_to_skip = serializer.data.get('votes_to_skip')
             code = serializer.data.get('code')
 
-            queryset = Room.objects.filter(code=code)
-            if not queryset.exists():
+            room = get_room(code)
+            if room is None:
                 return Response({'msg': 'Room not found.'}, status=status.HTTP_404_NOT_FOUND)
 
-            room = queryset[0]
             user_id = self.request.session.session_key
             if room.host != user_id:
                 return Response({'msg': 'You are not the host of this room.'}, status=status.HTTP_403_FORBIDDEN)
@@ -130,6 +230,7 @@ class UpdateRoom(APIView):
             room.guest_can_pause = guest_can_pause
             room.votes_to_skip = votes_to_skip
             room.save(update_fields=['guest_can_pause', 'votes_to_skip'])
+            forget_room(code)
             return Response(RoomSerializer(room).data, status=status.HTTP_200_OK)
 
         return Response({'Bad Request': "Invalid Data..."}, status=status.HTTP_400_BAD_REQUEST)
@@ -103,6 +103,11 @@ export default class Room extends Component {
     this.getRoomDetails = this.getRoomDetails.bind(this);
     this.authenticateSpotify = this.authenticateSpotify.bind(this);
     this.getCurrentSong = this.getCurrentSong.bind(this);
+    this.handleSongData = this.handleSongData.bind(this);
+    this.handleSongDelta = this.handleSongDelta.bind(this);
+    this.extrapolateProgress = this.extrapolateProgress.bind(this);
+    this.openSongStream = this.openSongStream.bind(this);
+    this.startPolling = this.startPolling.bind(this);
     this.skipSong = this.skipSong.bind(this);
     this.pauseSong = this.pauseSong.bind(this);
     this.playSong = this.playSong.bind(this);
@@ -113,13 +118,60 @@ export default class Room extends Component {
     this.getRoomDetails();
   }
   componentDidMount() {
-    this.interval = setInterval(this.getCurrentSong, 1000);
+    // The page turns the stream on only when served by the ASGI application,
+    // where an open stream doesn't hold a worker thread
+    const app = document.getElementById("app");
+    if (window.EventSource && app.dataset.eventStream === "true") {
+      this.openSongStream();
+    } else {
+      this.startPolling();
+    }
   }
 
   componentWillUnmount() {
+    if (this.songStream) {
+      this.songStream.close();
+    }
     clearInterval(this.interval);
   }
 
+  startPolling() {
+    if (!this.interval) {
+      this.interval = setInterval(this.getCurrentSong, 1000);
+    }
+  }
+
+  openSongStream() {
+    // The server pushes a full "state" event when the song, play state or
+    // votes change, and a small "progress" event otherwise.
+    this.songStream = new EventSource("/spotify/current-song/stream");
+    this.songStream.addEventListener("state", (event) => {
+      const data = JSON.parse(event.data);
+      this.handleSongData(data);
+      // Device activation only happens on the host's regular request
+      const deviceInfo = data.device_info || {};
+      if (this.state.isHost && deviceInfo.has_devices && !deviceInfo.has_active_device) {
+        this.getCurrentSong();
+      }
+    });
+    this.songStream.addEventListener("progress", (event) => {
+      const data = JSON.parse(event.data);
+      this.setState(prevState => ({
+        song: { ...prevState.song, time: data.time, is_playing: data.is_playing }
+      }));
+    });
+    this.songStream.addEventListener("closed", () => {
+      this.songStream.close();
+      this.getRoomDetails();
+    });
+    this.songStream.onerror = () => {
+      // EventSource reconnects on its own unless the server refused the stream
+      if (this.songStream.readyState === EventSource.CLOSED) {
+        this.startPolling();
+      }
+    };
+  }
+
   getRoomDetails() {
     return fetch("/api/get-room" + "?code=" + this.roomCode)
       .then((response) => {
@@ -171,8 +223,15 @@ export default class Room extends Component {
   }
 
   getCurrentSong() {
-    fetch("/spotify/current-song")
+    // Ask only for what changed since the song we already have
+    const headers = this.songEtag ? { "If-None-Match": this.songEtag } : {};
+    fetch("/spotify/current-song?delta=1", { headers })
       .then((response) => {
+        if (response.status === 304) {
+          this.extrapolateProgress();
+          return null;
+        }
+        
         // Check if we got a 401 Unauthorized (auth required)
         if (response.status === 401) {
           return response.json().then(data => {
@@ -190,26 +249,22 @@ export default class Room extends Component {
         }
         
         if (!response.ok) {
+          this.songEtag = null;
           return {};
         } else {
+          this.songEtag = response.headers.get("ETag");
           return response.json();
         }
       })
       .then((data) => {
-        // Check if we need to reauthenticate
-        if (data.requires_authentication) {
-          this.showNotification("Spotify authentication required. Redirecting...", "info");
-          setTimeout(() => {
-            if (data.auth_url) {
-              window.location.replace(data.auth_url);
-            } else {
-              this.authenticateSpotify();
-            }
-          }, 2000);
+        if (data === null) {
           return;
         }
-        
-        this.setState({ song: data });
+        if (data.delta) {
+          this.handleSongDelta(data);
+        } else {
+          this.handleSongData(data);
+        }
       })
       .catch(error => {
         // Ignore auth errors as they're handled above
@@ -218,6 +273,48 @@ export default class Room extends Component {
         }
       });
   }
+
+  handleSongData(data) {
+    // Check if we need to reauthenticate
+    if (data.requires_authentication) {
+      this.showNotification("Spotify authentication required. Redirecting...", "info");
+      setTimeout(() => {
+        if (data.auth_url) {
+          window.location.replace(data.auth_url);
+        } else {
+          this.authenticateSpotify();
+        }
+      }, 2000);
+      return;
+    }
+
+    this.songReceivedAt = Date.now();
+    this.setState({ song: data });
+  }
+
+  handleSongDelta(delta) {
+    this.songReceivedAt = Date.now();
+    this.setState(prevState => {
+      const song = { ...prevState.song, ...delta.changed };
+      delta.removed.forEach(key => delete song[key]);
+      return { song };
+    });
+  }
+
+  extrapolateProgress() {
+    // Nothing changed but the clock: move a playing song along locally
+    const now = Date.now();
+    const elapsed = now - (this.songReceivedAt || now);
+    this.songReceivedAt = now;
+    this.setState(prevState => {
+      const song = prevState.song;
+      if (!song.is_playing || song.time == null) {
+        return null;
+      }
+      const time = song.duration ? Math.min(song.time + elapsed, song.duration) : song.time + elapsed;
+      return { song: { ...song, time } };
+    });
+  }
   skipSong() {
     // Set loading state for skip action
     this.setState(prevState => ({
@@ -594,7 +691,12 @@ export default class Room extends Component {
                       <Typography variant="h6" color="textSecondary" gutterBottom>
                         {song.artist}
                       </Typography>
-                      
+                      {song.stale && (
+                        <Typography variant="body2" color="textSecondary">
+                          Spotify is not responding, showing the last known song
+                        </Typography>
+                      )}
+
                       {/* Progress Bar */}
                       <Box my={3}>
                         <Grid container spacing={2} alignItems="center">
@@ -1,2 +1,2 @@
 /*! For license information please see main.js.LICENSE.txt */
-(()=>{var e={45:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(8587);function o(e,t){if(null==e)return{};var n,o,a=(0,r.A)(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(o=0;o<i.length;o++)n=i[o],-1===t.indexOf(n)&&{}.propertyIsEnumerable.call(e,n)&&(a[n]=e[n])}return a}},53:(e,t,n)=>{"use strict";function r(e){var t,n,o="";if("string"==typeof e||"number"==typeof e)o+=e;else if("object"==typeof e)if(Array.isArray(e))for(t=0;t<e.length;t++)e[t]&&(n=r(e[t]))&&(o&&(o+=" "),o+=n);else for(t in e)e[t]&&(o&&(o+=" "),o+=t);return o}n.d(t,{A:()=>o});const o=function(){for(var e,t,n=0,o="";n<arguments.length;)(e=arguments[n++])&&(t=r(e))&&(o&&(o+=" "),o+=t);return o}},296:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(7800);function o(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,a,i,l=[],s=!0,u=!1;try{if(a=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=a.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(i=n.return(),Object(i)!==i))return}finally{if(u)throw o}}return l}}(e,t)||(0,r.A)(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}},345:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M19.14 12.94c.04-.3.06-.61.06-.94 0-.32-.02-.64-.07-.94l2.03-1.58c.18-.14.23-.41.12-.61l-1.92-3.32c-.12-.22-.37-.29-.59-.22l-2.39.96c-.5-.38-1.03-.7-1.62-.94l-.36-2.54c-.04-.24-.24-.41-.48-.41h-3.84c-.24 0-.43.17-.47.41l-.36 2.54c-.59.24-1.13.57-1.62.94l-2.39-.96c-.22-.08-.47 0-.59.22L2.74 8.87c-.12.21-.08.47.12.61l2.03 1.58c-.05.3-.09.63-.09.94s.02.64.07.94l-2.03 1.58c-.18.14-.23.41-.12.61l1.92 3.32c.12.22.37.29.59.22l2.39-.96c.5.38 1.03.7 1.62.94l.36 2.54c.05.24.24.41.48.41h3.84c.24 0 .44-.17.47-.41l.36-2.54c.59-.24 1.13-.56 1.62-.94l2.39.96c.22.08.47 0 .59-.22l1.92-3.32c.12-.22.07-.47-.12-.61l-2.01-1.58zM12 15.6c-1.98 0-3.6-1.62-3.6-3.6s1.62-3.6 3.6-3.6 3.6 1.62 3.6 3.6-1.62 3.6-3.6 3.6z"}),"Settings");t.A=i},364:(e,t,n)=>{"use strict";n.d(t,{A:()=>m});var r=n(6540),o=n(961),a=!0,i=!1,l=null,s={text:!0,search:!0,url:!0,tel:!0,email:!0,password:!0,number:!0,date:!0,month:!0,week:!0,time:!0,datetime:!0,"datetime-local":!0};function u(e){e.metaKey||e.altKey||e.ctrlKey||(a=!0)}function c(){a=!1}function d(){"hidden"===this.visibilityState&&i&&(a=!0)}function f(e){var t,n,r,o=e.target;try{return o.matches(":focus-visible")}catch(e){}return a||(n=(t=o).type,!("INPUT"!==(r=t.tagName)||!s[n]||t.readOnly)||"TEXTAREA"===r&&!t.readOnly||!!t.isContentEditable)}function p(){i=!0,window.clearTimeout(l),l=window.setTimeout((function(){i=!1}),100)}function m(){return{isFocusVisible:f,onBlurVisible:p,ref:r.useCallback((function(e){var t,n=o.findDOMNode(e);null!=n&&((t=n.ownerDocument).addEventListener("keydown",u,!0),t.addEventListener("mousedown",c,!0),t.addEventListener("pointerdown",c,!0),t.addEventListener("touchstart",c,!0),t.addEventListener("visibilitychange",d,!0))}),[])}}},816:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(2284);function o(e){var t=function(e){if("object"!=(0,r.A)(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=(0,r.A)(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==(0,r.A)(t)?t:t+""}},961:(e,t,n)=>{"use strict";!function e(){if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(e){console.error(e)}}(),e.exports=n(2551)},1198:(e,t,n)=>{"use strict";function r(e){var t,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:166;function r(){for(var r=arguments.length,o=new Array(r),a=0;a<r;a++)o[a]=arguments[a];var i=this;clearTimeout(t),t=setTimeout((function(){e.apply(i,o)}),n)}return r.clear=function(){clearTimeout(t)},r}n.d(t,{A:()=>r})},1305:(e,t,n)=>{"use strict";n.r(t),n.d(t,{capitalize:()=>r.A,createChainedFunction:()=>o.A,createSvgIcon:()=>a.A,debounce:()=>i.A,deprecatedPropType:()=>l,isMuiElement:()=>s.A,ownerDocument:()=>u.A,ownerWindow:()=>c.A,requirePropFactory:()=>d,setRef:()=>f.A,unstable_useId:()=>g.A,unsupportedProp:()=>p,useControlled:()=>m.A,useEventCallback:()=>h.A,useForkRef:()=>v.A,useIsFocusVisible:()=>y.A});var r=n(7515),o=n(8521),a=n(4507),i=n(1198);function l(e,t){return function(){return null}}var s=n(7570),u=n(1475),c=n(6182);function d(e){return function(){return null}}var f=n(4960);function p(e,t,n,r,o){return null}var m=n(8060),h=n(2319),v=n(4801),g=n(4232),y=n(364)},1475:(e,t,n)=>{"use strict";function r(e){return e&&e.ownerDocument||document}n.d(t,{A:()=>r})},1991:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M3 9v6h4l5 5V4L7 9H3zm13.5 3c0-1.77-1.02-3.29-2.5-4.03v8.05c1.48-.73 2.5-2.25 2.5-4.02zM14 3.23v2.06c2.89.86 5 3.54 5 6.71s-2.11 5.85-5 6.71v2.06c4.01-.91 7-4.49 7-8.77s-2.99-7.86-7-8.77z"}),"VolumeUp");t.A=i},2284:(e,t,n)=>{"use strict";function r(e){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},r(e)}n.d(t,{A:()=>r})},2319:(e,t,n)=>{"use strict";n.d(t,{A:()=>a});var r=n(6540),o="undefined"!=typeof window?r.useLayoutEffect:r.useEffect;function a(e){var t=r.useRef(e);return o((function(){t.current=e})),r.useCallback((function(){return t.current.apply(void 0,arguments)}),[])}},2429:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M12 3v10.55c-.59-.34-1.27-.55-2-.55-2.21 0-4 1.79-4 4s1.79 4 4 4 4-1.79 4-4V7h4V3h-6z"}),"MusicNote");t.A=i},2551:(e,t,n)=>{"use strict";var r=n(6540),o=n(5228),a=n(9982);function i(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}if(!r)throw Error(i(227));var l=new Set,s={};function u(e,t){c(e,t),c(e+"Capture",t)}function c(e,t){for(s[e]=t,e=0;e<t.length;e++)l.add(t[e])}var d=!("undefined"==typeof window||void 0===window.document||void 0===window.document.createElement),f=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,p=Object.prototype.hasOwnProperty,m={},h={};function v(e,t,n,r,o,a,i){this.acceptsBooleans=2===t||3===t||4===t,this.attributeName=r,this.attributeNamespace=o,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=a,this.removeEmptyString=i}var g={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach((function(e){g[e]=new v(e,0,!1,e,null,!1,!1)})),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach((function(e){var t=e[0];g[t]=new v(t,1,!1,e[1],null,!1,!1)})),["contentEditable","draggable","spellCheck","value"].forEach((function(e){g[e]=new v(e,2,!1,e.toLowerCase(),null,!1,!1)})),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach((function(e){g[e]=new v(e,2,!1,e,null,!1,!1)})),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach((function(e){g[e]=new v(e,3,!1,e.toLowerCase(),null,!1,!1)})),["checked","multiple","muted","selected"].forEach((function(e){g[e]=new v(e,3,!0,e,null,!1,!1)})),["capture","download"].forEach((function(e){g[e]=new v(e,4,!1,e,null,!1,!1)})),["cols","rows","size","span"].forEach((function(e){g[e]=new v(e,6,!1,e,null,!1,!1)})),["rowSpan","start"].forEach((function(e){g[e]=new v(e,5,!1,e.toLowerCase(),null,!1,!1)}));var y=/[\-:]([a-z])/g;function b(e){return e[1].toUpperCase()}function x(e,t,n,r){var o=g.hasOwnProperty(t)?g[t]:null;(null!==o?0===o.type:!r&&2<t.length&&("o"===t[0]||"O"===t[0])&&("n"===t[1]||"N"===t[1]))||(function(e,t,n,r){if(null==t||function(e,t,n,r){if(null!==n&&0===n.type)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==n?!n.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,t,n,r))return!0;if(r)return!1;if(null!==n)switch(n.type){case 3:return!t;case 4:return!1===t;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}(t,n,o,r)&&(n=null),r||null===o?function(e){return!!p.call(h,e)||!p.call(m,e)&&(f.test(e)?h[e]=!0:(m[e]=!0,!1))}(t)&&(null===n?e.removeAttribute(t):e.setAttribute(t,""+n)):o.mustUseProperty?e[o.propertyName]=null===n?3!==o.type&&"":n:(t=o.attributeName,r=o.attributeNamespace,null===n?e.removeAttribute(t):(n=3===(o=o.type)||4===o&&!0===n?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach((function(e){var t=e.replace(y,b);g[t]=new v(t,1,!1,e,null,!1,!1)})),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach((function(e){var t=e.replace(y,b);g[t]=new v(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)})),["xml:base","xml:lang","xml:space"].forEach((function(e){var t=e.replace(y,b);g[t]=new v(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)})),["tabIndex","crossOrigin"].forEach((function(e){g[e]=new v(e,1,!1,e.toLowerCase(),null,!1,!1)})),g.xlinkHref=new v("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach((function(e){g[e]=new v(e,1,!1,e.toLowerCase(),null,!0,!0)}));var w=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,E=60103,k=60106,S=60107,A=60108,C=60114,R=60109,P=60110,T=60112,N=60113,O=60120,M=60115,L=60116,z=60121,_=60128,I=60129,D=60130,F=60131;if("function"==typeof Symbol&&Symbol.for){var j=Symbol.for;E=j("react.element"),k=j("react.portal"),S=j("react.fragment"),A=j("react.strict_mode"),C=j("react.profiler"),R=j("react.provider"),P=j("react.context"),T=j("react.forward_ref"),N=j("react.suspense"),O=j("react.suspense_list"),M=j("react.memo"),L=j("react.lazy"),z=j("react.block"),j("react.scope"),_=j("react.opaque.id"),I=j("react.debug_trace_mode"),D=j("react.offscreen"),F=j("react.legacy_hidden")}var B,W="function"==typeof Symbol&&Symbol.iterator;function $(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=W&&e[W]||e["@@iterator"])?e:null}function V(e){if(void 0===B)try{throw Error()}catch(e){var t=e.stack.trim().match(/\n( *(at )?)/);B=t&&t[1]||""}return"\n"+B+e}var H=!1;function U(e,t){if(!e||H)return"";H=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),"object"==typeof Reflect&&Reflect.construct){try{Reflect.construct(t,[])}catch(e){var r=e}Reflect.construct(e,[],t)}else{try{t.call()}catch(e){r=e}e.call(t.prototype)}else{try{throw Error()}catch(e){r=e}e()}}catch(e){if(e&&r&&"string"==typeof e.stack){for(var o=e.stack.split("\n"),a=r.stack.split("\n"),i=o.length-1,l=a.length-1;1<=i&&0<=l&&o[i]!==a[l];)l--;for(;1<=i&&0<=l;i--,l--)if(o[i]!==a[l]){if(1!==i||1!==l)do{if(i--,0>--l||o[i]!==a[l])return"\n"+o[i].replace(" at new "," at ")}while(1<=i&&0<=l);break}}}finally{H=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?V(e):""}function q(e){switch(e.tag){case 5:return V(e.type);case 16:return V("Lazy");case 13:return V("Suspense");case 19:return V("SuspenseList");case 0:case 2:case 15:return U(e.type,!1);case 11:return U(e.type.render,!1);case 22:return U(e.type._render,!1);case 1:return U(e.type,!0);default:return""}}function K(e){if(null==e)return null;if("function"==typeof e)return e.displayName||e.name||null;if("string"==typeof e)return e;switch(e){case S:return"Fragment";case k:return"Portal";case C:return"Profiler";case A:return"StrictMode";case N:return"Suspense";case O:return"SuspenseList"}if("object"==typeof e)switch(e.$$typeof){case P:return(e.displayName||"Context")+".Consumer";case R:return(e._context.displayName||"Context")+".Provider";case T:var t=e.render;return t=t.displayName||t.name||"",e.displayName||(""!==t?"ForwardRef("+t+")":"ForwardRef");case M:return K(e.type);case z:return K(e._render);case L:t=e._payload,e=e._init;try{return K(e(t))}catch(e){}}return null}function X(e){switch(typeof e){case"boolean":case"number":case"object":case"string":case"undefined":return e;default:return""}}function Q(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function Y(e){e._valueTracker||(e._valueTracker=function(e){var t=Q(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&void 0!==n&&"function"==typeof n.get&&"function"==typeof n.set){var o=n.get,a=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return o.call(this)},set:function(e){r=""+e,a.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function G(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=Q(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function J(e){if(void 0===(e=e||("undefined"!=typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}function Z(e,t){var n=t.checked;return o({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=n?n:e._wrapperState.initialChecked})}function ee(e,t){var n=null==t.defaultValue?"":t.defaultValue,r=null!=t.checked?t.checked:t.defaultChecked;n=X(null!=t.value?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:"checkbox"===t.type||"radio"===t.type?null!=t.checked:null!=t.value}}function te(e,t){null!=(t=t.checked)&&x(e,"checked",t,!1)}function ne(e,t){te(e,t);var n=X(t.value),r=t.type;if(null!=n)"number"===r?(0===n&&""===e.value||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");t.hasOwnProperty("value")?oe(e,t.type,n):t.hasOwnProperty("defaultValue")&&oe(e,t.type,X(t.defaultValue)),null==t.checked&&null!=t.defaultChecked&&(e.defaultChecked=!!t.defaultChecked)}function re(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!("submit"!==r&&"reset"!==r||void 0!==t.value&&null!==t.value))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}""!==(n=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==n&&(e.name=n)}function oe(e,t,n){"number"===t&&J(e.ownerDocument)===e||(null==n?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}function ae(e,t){return e=o({children:void 0},t),(t=function(e){var t="";return r.Children.forEach(e,(function(e){null!=e&&(t+=e)})),t}(t.children))&&(e.children=t),e}function ie(e,t,n,r){if(e=e.options,t){t={};for(var o=0;o<n.length;o++)t["$"+n[o]]=!0;for(n=0;n<e.length;n++)o=t.hasOwnProperty("$"+e[n].value),e[n].selected!==o&&(e[n].selected=o),o&&r&&(e[n].defaultSelected=!0)}else{for(n=""+X(n),t=null,o=0;o<e.length;o++){if(e[o].value===n)return e[o].selected=!0,void(r&&(e[o].defaultSelected=!0));null!==t||e[o].disabled||(t=e[o])}null!==t&&(t.selected=!0)}}function le(e,t){if(null!=t.dangerouslySetInnerHTML)throw Error(i(91));return o({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function se(e,t){var n=t.value;if(null==n){if(n=t.children,t=t.defaultValue,null!=n){if(null!=t)throw Error(i(92));if(Array.isArray(n)){if(!(1>=n.length))throw Error(i(93));n=n[0]}t=n}null==t&&(t=""),n=t}e._wrapperState={initialValue:X(n)}}function ue(e,t){var n=X(t.value),r=X(t.defaultValue);null!=n&&((n=""+n)!==e.value&&(e.value=n),null==t.defaultValue&&e.defaultValue!==n&&(e.defaultValue=n)),null!=r&&(e.defaultValue=""+r)}function ce(e){var t=e.textContent;t===e._wrapperState.initialValue&&""!==t&&null!==t&&(e.value=t)}var de="http://www.w3.org/1999/xhtml";function fe(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function pe(e,t){return null==e||"http://www.w3.org/1999/xhtml"===e?fe(t):"http://www.w3.org/2000/svg"===e&&"foreignObject"===t?"http://www.w3.org/1999/xhtml":e}var me,he,ve=(he=function(e,t){if("http://www.w3.org/2000/svg"!==e.namespaceURI||"innerHTML"in e)e.innerHTML=t;else{for((me=me||document.createElement("div")).innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=me.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}},"undefined"!=typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,t,n,r){MSApp.execUnsafeLocalFunction((function(){return he(e,t)}))}:he);function ge(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var ye={animationIterationCount:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},be=["Webkit","ms","Moz","O"];function xe(e,t,n){return null==t||"boolean"==typeof t||""===t?"":n||"number"!=typeof t||0===t||ye.hasOwnProperty(e)&&ye[e]?(""+t).trim():t+"px"}function we(e,t){for(var n in e=e.style,t)if(t.hasOwnProperty(n)){var r=0===n.indexOf("--"),o=xe(n,t[n],r);"float"===n&&(n="cssFloat"),r?e.setProperty(n,o):e[n]=o}}Object.keys(ye).forEach((function(e){be.forEach((function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),ye[t]=ye[e]}))}));var Ee=o({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function ke(e,t){if(t){if(Ee[e]&&(null!=t.children||null!=t.dangerouslySetInnerHTML))throw Error(i(137,e));if(null!=t.dangerouslySetInnerHTML){if(null!=t.children)throw Error(i(60));if("object"!=typeof t.dangerouslySetInnerHTML||!("__html"in t.dangerouslySetInnerHTML))throw Error(i(61))}if(null!=t.style&&"object"!=typeof t.style)throw Error(i(62))}}function Se(e,t){if(-1===e.indexOf("-"))return"string"==typeof t.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}function Ae(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Ce=null,Re=null,Pe=null;function Te(e){if(e=no(e)){if("function"!=typeof Ce)throw Error(i(280));var t=e.stateNode;t&&(t=oo(t),Ce(e.stateNode,e.type,t))}}function Ne(e){Re?Pe?Pe.push(e):Pe=[e]:Re=e}function Oe(){if(Re){var e=Re,t=Pe;if(Pe=Re=null,Te(e),t)for(e=0;e<t.length;e++)Te(t[e])}}function Me(e,t){return e(t)}function Le(e,t,n,r,o){return e(t,n,r,o)}function ze(){}var _e=Me,Ie=!1,De=!1;function Fe(){null===Re&&null===Pe||(ze(),Oe())}function je(e,t){var n=e.stateNode;if(null===n)return null;var r=oo(n);if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!=typeof n)throw Error(i(231,t,typeof n));return n}var Be=!1;if(d)try{var We={};Object.defineProperty(We,"passive",{get:function(){Be=!0}}),window.addEventListener("test",We,We),window.removeEventListener("test",We,We)}catch(he){Be=!1}function $e(e,t,n,r,o,a,i,l,s){var u=Array.prototype.slice.call(arguments,3);try{t.apply(n,u)}catch(e){this.onError(e)}}var Ve=!1,He=null,Ue=!1,qe=null,Ke={onError:function(e){Ve=!0,He=e}};function Xe(e,t,n,r,o,a,i,l,s){Ve=!1,He=null,$e.apply(Ke,arguments)}function Qe(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{!!(1026&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function Ye(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&null!==(e=e.alternate)&&(t=e.memoizedState),null!==t)return t.dehydrated}return null}function Ge(e){if(Qe(e)!==e)throw Error(i(188))}function Je(e){if(e=function(e){var t=e.alternate;if(!t){if(null===(t=Qe(e)))throw Error(i(188));return t!==e?null:e}for(var n=e,r=t;;){var o=n.return;if(null===o)break;var a=o.alternate;if(null===a){if(null!==(r=o.return)){n=r;continue}break}if(o.child===a.child){for(a=o.child;a;){if(a===n)return Ge(o),e;if(a===r)return Ge(o),t;a=a.sibling}throw Error(i(188))}if(n.return!==r.return)n=o,r=a;else{for(var l=!1,s=o.child;s;){if(s===n){l=!0,n=o,r=a;break}if(s===r){l=!0,r=o,n=a;break}s=s.sibling}if(!l){for(s=a.child;s;){if(s===n){l=!0,n=a,r=o;break}if(s===r){l=!0,r=a,n=o;break}s=s.sibling}if(!l)throw Error(i(189))}}if(n.alternate!==r)throw Error(i(190))}if(3!==n.tag)throw Error(i(188));return n.stateNode.current===n?e:t}(e),!e)return null;for(var t=e;;){if(5===t.tag||6===t.tag)return t;if(t.child)t.child.return=t,t=t.child;else{if(t===e)break;for(;!t.sibling;){if(!t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}}return null}function Ze(e,t){for(var n=e.alternate;null!==t;){if(t===e||t===n)return!0;t=t.return}return!1}var et,tt,nt,rt,ot=!1,at=[],it=null,lt=null,st=null,ut=new Map,ct=new Map,dt=[],ft="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function pt(e,t,n,r,o){return{blockedOn:e,domEventName:t,eventSystemFlags:16|n,nativeEvent:o,targetContainers:[r]}}function mt(e,t){switch(e){case"focusin":case"focusout":it=null;break;case"dragenter":case"dragleave":lt=null;break;case"mouseover":case"mouseout":st=null;break;case"pointerover":case"pointerout":ut.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":ct.delete(t.pointerId)}}function ht(e,t,n,r,o,a){return null===e||e.nativeEvent!==a?(e=pt(t,n,r,o,a),null!==t&&null!==(t=no(t))&&tt(t),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==o&&-1===t.indexOf(o)&&t.push(o),e)}function vt(e){var t=to(e.target);if(null!==t){var n=Qe(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=Ye(n)))return e.blockedOn=t,void rt(e.lanePriority,(function(){a.unstable_runWithPriority(e.priority,(function(){nt(n)}))}))}else if(3===t&&n.stateNode.hydrate)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function gt(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=Jt(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(null!==n)return null!==(t=no(n))&&tt(t),e.blockedOn=n,!1;t.shift()}return!0}function yt(e,t,n){gt(e)&&n.delete(t)}function bt(){for(ot=!1;0<at.length;){var e=at[0];if(null!==e.blockedOn){null!==(e=no(e.blockedOn))&&et(e);break}for(var t=e.targetContainers;0<t.length;){var n=Jt(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(null!==n){e.blockedOn=n;break}t.shift()}null===e.blockedOn&&at.shift()}null!==it&&gt(it)&&(it=null),null!==lt&&gt(lt)&&(lt=null),null!==st&&gt(st)&&(st=null),ut.forEach(yt),ct.forEach(yt)}function xt(e,t){e.blockedOn===t&&(e.blockedOn=null,ot||(ot=!0,a.unstable_scheduleCallback(a.unstable_NormalPriority,bt)))}function wt(e){function t(t){return xt(t,e)}if(0<at.length){xt(at[0],e);for(var n=1;n<at.length;n++){var r=at[n];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==it&&xt(it,e),null!==lt&&xt(lt,e),null!==st&&xt(st,e),ut.forEach(t),ct.forEach(t),n=0;n<dt.length;n++)(r=dt[n]).blockedOn===e&&(r.blockedOn=null);for(;0<dt.length&&null===(n=dt[0]).blockedOn;)vt(n),null===n.blockedOn&&dt.shift()}function Et(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var kt={animationend:Et("Animation","AnimationEnd"),animationiteration:Et("Animation","AnimationIteration"),animationstart:Et("Animation","AnimationStart"),transitionend:Et("Transition","TransitionEnd")},St={},At={};function Ct(e){if(St[e])return St[e];if(!kt[e])return e;var t,n=kt[e];for(t in n)if(n.hasOwnProperty(t)&&t in At)return St[e]=n[t];return e}d&&(At=document.createElement("div").style,"AnimationEvent"in window||(delete kt.animationend.animation,delete kt.animationiteration.animation,delete kt.animationstart.animation),"TransitionEvent"in window||delete kt.transitionend.transition);var Rt=Ct("animationend"),Pt=Ct("animationiteration"),Tt=Ct("animationstart"),Nt=Ct("transitionend"),Ot=new Map,Mt=new Map,Lt=["abort","abort",Rt,"animationEnd",Pt,"animationIteration",Tt,"animationStart","canplay","canPlay","canplaythrough","canPlayThrough","durationchange","durationChange","emptied","emptied","encrypted","encrypted","ended","ended","error","error","gotpointercapture","gotPointerCapture","load","load","loadeddata","loadedData","loadedmetadata","loadedMetadata","loadstart","loadStart","lostpointercapture","lostPointerCapture","playing","playing","progress","progress","seeking","seeking","stalled","stalled","suspend","suspend","timeupdate","timeUpdate",Nt,"transitionEnd","waiting","waiting"];function zt(e,t){for(var n=0;n<e.length;n+=2){var r=e[n],o=e[n+1];o="on"+(o[0].toUpperCase()+o.slice(1)),Mt.set(r,t),Ot.set(r,o),u(o,[r])}}(0,a.unstable_now)();var _t=8;function It(e){if(1&e)return _t=15,1;if(2&e)return _t=14,2;if(4&e)return _t=13,4;var t=24&e;return 0!==t?(_t=12,t):32&e?(_t=11,32):0!=(t=192&e)?(_t=10,t):256&e?(_t=9,256):0!=(t=3584&e)?(_t=8,t):4096&e?(_t=7,4096):0!=(t=4186112&e)?(_t=6,t):0!=(t=62914560&e)?(_t=5,t):67108864&e?(_t=4,67108864):134217728&e?(_t=3,134217728):0!=(t=805306368&e)?(_t=2,t):1073741824&e?(_t=1,1073741824):(_t=8,e)}function Dt(e,t){var n=e.pendingLanes;if(0===n)return _t=0;var r=0,o=0,a=e.expiredLanes,i=e.suspendedLanes,l=e.pingedLanes;if(0!==a)r=a,o=_t=15;else if(0!=(a=134217727&n)){var s=a&~i;0!==s?(r=It(s),o=_t):0!=(l&=a)&&(r=It(l),o=_t)}else 0!=(a=n&~i)?(r=It(a),o=_t):0!==l&&(r=It(l),o=_t);if(0===r)return 0;if(r=n&((0>(r=31-Vt(r))?0:1<<r)<<1)-1,0!==t&&t!==r&&!(t&i)){if(It(t),o<=_t)return t;_t=o}if(0!==(t=e.entangledLanes))for(e=e.entanglements,t&=r;0<t;)o=1<<(n=31-Vt(t)),r|=e[n],t&=~o;return r}function Ft(e){return 0!=(e=-1073741825&e.pendingLanes)?e:1073741824&e?1073741824:0}function jt(e,t){switch(e){case 15:return 1;case 14:return 2;case 12:return 0===(e=Bt(24&~t))?jt(10,t):e;case 10:return 0===(e=Bt(192&~t))?jt(8,t):e;case 8:return 0===(e=Bt(3584&~t))&&0===(e=Bt(4186112&~t))&&(e=512),e;case 2:return 0===(t=Bt(805306368&~t))&&(t=268435456),t}throw Error(i(358,e))}function Bt(e){return e&-e}function Wt(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function $t(e,t,n){e.pendingLanes|=t;var r=t-1;e.suspendedLanes&=r,e.pingedLanes&=r,(e=e.eventTimes)[t=31-Vt(t)]=n}var Vt=Math.clz32?Math.clz32:function(e){return 0===e?32:31-(Ht(e)/Ut|0)|0},Ht=Math.log,Ut=Math.LN2,qt=a.unstable_UserBlockingPriority,Kt=a.unstable_runWithPriority,Xt=!0;function Qt(e,t,n,r){Ie||ze();var o=Gt,a=Ie;Ie=!0;try{Le(o,e,t,n,r)}finally{(Ie=a)||Fe()}}function Yt(e,t,n,r){Kt(qt,Gt.bind(null,e,t,n,r))}function Gt(e,t,n,r){var o;if(Xt)if((o=!(4&t))&&0<at.length&&-1<ft.indexOf(e))e=pt(null,e,t,n,r),at.push(e);else{var a=Jt(e,t,n,r);if(null===a)o&&mt(e,r);else{if(o){if(-1<ft.indexOf(e))return e=pt(a,e,t,n,r),void at.push(e);if(function(e,t,n,r,o){switch(t){case"focusin":return it=ht(it,e,t,n,r,o),!0;case"dragenter":return lt=ht(lt,e,t,n,r,o),!0;case"mouseover":return st=ht(st,e,t,n,r,o),!0;case"pointerover":var a=o.pointerId;return ut.set(a,ht(ut.get(a)||null,e,t,n,r,o)),!0;case"gotpointercapture":return a=o.pointerId,ct.set(a,ht(ct.get(a)||null,e,t,n,r,o)),!0}return!1}(a,e,t,n,r))return;mt(e,r)}zr(e,t,r,null,n)}}}function Jt(e,t,n,r){var o=Ae(r);if(null!==(o=to(o))){var a=Qe(o);if(null===a)o=null;else{var i=a.tag;if(13===i){if(null!==(o=Ye(a)))return o;o=null}else if(3===i){if(a.stateNode.hydrate)return 3===a.tag?a.stateNode.containerInfo:null;o=null}else a!==o&&(o=null)}}return zr(e,t,r,o,n),null}var Zt=null,en=null,tn=null;function nn(){if(tn)return tn;var e,t,n=en,r=n.length,o="value"in Zt?Zt.value:Zt.textContent,a=o.length;for(e=0;e<r&&n[e]===o[e];e++);var i=r-e;for(t=1;t<=i&&n[r-t]===o[a-t];t++);return tn=o.slice(e,1<t?1-t:void 0)}function rn(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function on(){return!0}function an(){return!1}function ln(e){function t(t,n,r,o,a){for(var i in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=o,this.target=a,this.currentTarget=null,e)e.hasOwnProperty(i)&&(t=e[i],this[i]=t?t(o):o[i]);return this.isDefaultPrevented=(null!=o.defaultPrevented?o.defaultPrevented:!1===o.returnValue)?on:an,this.isPropagationStopped=an,this}return o(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!=typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=on)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!=typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=on)},persist:function(){},isPersistent:on}),t}var sn,un,cn,dn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},fn=ln(dn),pn=o({},dn,{view:0,detail:0}),mn=ln(pn),hn=o({},pn,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Rn,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==cn&&(cn&&"mousemove"===e.type?(sn=e.screenX-cn.screenX,un=e.screenY-cn.screenY):un=sn=0,cn=e),sn)},movementY:function(e){return"movementY"in e?e.movementY:un}}),vn=ln(hn),gn=ln(o({},hn,{dataTransfer:0})),yn=ln(o({},pn,{relatedTarget:0})),bn=ln(o({},dn,{animationName:0,elapsedTime:0,pseudoElement:0})),xn=o({},dn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),wn=ln(xn),En=ln(o({},dn,{data:0})),kn={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Sn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},An={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Cn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=An[e])&&!!t[e]}function Rn(){return Cn}var Pn=o({},pn,{key:function(e){if(e.key){var t=kn[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=rn(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?Sn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Rn,charCode:function(e){return"keypress"===e.type?rn(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?rn(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),Tn=ln(Pn),Nn=ln(o({},hn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),On=ln(o({},pn,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Rn})),Mn=ln(o({},dn,{propertyName:0,elapsedTime:0,pseudoElement:0})),Ln=o({},hn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),zn=ln(Ln),_n=[9,13,27,32],In=d&&"CompositionEvent"in window,Dn=null;d&&"documentMode"in document&&(Dn=document.documentMode);var Fn=d&&"TextEvent"in window&&!Dn,jn=d&&(!In||Dn&&8<Dn&&11>=Dn),Bn=String.fromCharCode(32),Wn=!1;function $n(e,t){switch(e){case"keyup":return-1!==_n.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Vn(e){return"object"==typeof(e=e.detail)&&"data"in e?e.data:null}var Hn=!1,Un={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function qn(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!Un[e.type]:"textarea"===t}function Kn(e,t,n,r){Ne(r),0<(t=Ir(t,"onChange")).length&&(n=new fn("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Xn=null,Qn=null;function Yn(e){Pr(e,0)}function Gn(e){if(G(ro(e)))return e}function Jn(e,t){if("change"===e)return t}var Zn=!1;if(d){var er;if(d){var tr="oninput"in document;if(!tr){var nr=document.createElement("div");nr.setAttribute("oninput","return;"),tr="function"==typeof nr.oninput}er=tr}else er=!1;Zn=er&&(!document.documentMode||9<document.documentMode)}function rr(){Xn&&(Xn.detachEvent("onpropertychange",or),Qn=Xn=null)}function or(e){if("value"===e.propertyName&&Gn(Qn)){var t=[];if(Kn(t,Qn,e,Ae(e)),e=Yn,Ie)e(t);else{Ie=!0;try{Me(e,t)}finally{Ie=!1,Fe()}}}}function ar(e,t,n){"focusin"===e?(rr(),Qn=n,(Xn=t).attachEvent("onpropertychange",or)):"focusout"===e&&rr()}function ir(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Gn(Qn)}function lr(e,t){if("click"===e)return Gn(t)}function sr(e,t){if("input"===e||"change"===e)return Gn(t)}var ur="function"==typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e==1/t)||e!=e&&t!=t},cr=Object.prototype.hasOwnProperty;function dr(e,t){if(ur(e,t))return!0;if("object"!=typeof e||null===e||"object"!=typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++)if(!cr.call(t,n[r])||!ur(e[n[r]],t[n[r]]))return!1;return!0}function fr(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function pr(e,t){var n,r=fr(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=fr(r)}}function mr(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?mr(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function hr(){for(var e=window,t=J();t instanceof e.HTMLIFrameElement;){try{var n="string"==typeof t.contentWindow.location.href}catch(e){n=!1}if(!n)break;t=J((e=t.contentWindow).document)}return t}function vr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}var gr=d&&"documentMode"in document&&11>=document.documentMode,yr=null,br=null,xr=null,wr=!1;function Er(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;wr||null==yr||yr!==J(r)||(r="selectionStart"in(r=yr)&&vr(r)?{start:r.selectionStart,end:r.selectionEnd}:{anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},xr&&dr(xr,r)||(xr=r,0<(r=Ir(br,"onSelect")).length&&(t=new fn("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=yr)))}zt("cancel cancel click click close close contextmenu contextMenu copy copy cut cut auxclick auxClick dblclick doubleClick dragend dragEnd dragstart dragStart drop drop focusin focus focusout blur input input invalid invalid keydown keyDown keypress keyPress keyup keyUp mousedown mouseDown mouseup mouseUp paste paste pause pause play play pointercancel pointerCancel pointerdown pointerDown pointerup pointerUp ratechange rateChange reset reset seeked seeked submit submit touchcancel touchCancel touchend touchEnd touchstart touchStart volumechange volumeChange".split(" "),0),zt("drag drag dragenter dragEnter dragexit dragExit dragleave dragLeave dragover dragOver mousemove mouseMove mouseout mouseOut mouseover mouseOver pointermove pointerMove pointerout pointerOut pointerover pointerOver scroll scroll toggle toggle touchmove touchMove wheel wheel".split(" "),1),zt(Lt,2);for(var kr="change selectionchange textInput compositionstart compositionend compositionupdate".split(" "),Sr=0;Sr<kr.length;Sr++)Mt.set(kr[Sr],0);c("onMouseEnter",["mouseout","mouseover"]),c("onMouseLeave",["mouseout","mouseover"]),c("onPointerEnter",["pointerout","pointerover"]),c("onPointerLeave",["pointerout","pointerover"]),u("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),u("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),u("onBeforeInput",["compositionend","keypress","textInput","paste"]),u("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Ar="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Cr=new Set("cancel close invalid load scroll toggle".split(" ").concat(Ar));function Rr(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,function(e,t,n,r,o,a,l,s,u){if(Xe.apply(this,arguments),Ve){if(!Ve)throw Error(i(198));var c=He;Ve=!1,He=null,Ue||(Ue=!0,qe=c)}}(r,t,void 0,e),e.currentTarget=null}function Pr(e,t){t=!!(4&t);for(var n=0;n<e.length;n++){var r=e[n],o=r.event;r=r.listeners;e:{var a=void 0;if(t)for(var i=r.length-1;0<=i;i--){var l=r[i],s=l.instance,u=l.currentTarget;if(l=l.listener,s!==a&&o.isPropagationStopped())break e;Rr(o,l,u),a=s}else for(i=0;i<r.length;i++){if(s=(l=r[i]).instance,u=l.currentTarget,l=l.listener,s!==a&&o.isPropagationStopped())break e;Rr(o,l,u),a=s}}}if(Ue)throw e=qe,Ue=!1,qe=null,e}function Tr(e,t){var n=ao(t),r=e+"__bubble";n.has(r)||(Lr(t,e,2,!1),n.add(r))}var Nr="_reactListening"+Math.random().toString(36).slice(2);function Or(e){e[Nr]||(e[Nr]=!0,l.forEach((function(t){Cr.has(t)||Mr(t,!1,e,null),Mr(t,!0,e,null)})))}function Mr(e,t,n,r){var o=4<arguments.length&&void 0!==arguments[4]?arguments[4]:0,a=n;if("selectionchange"===e&&9!==n.nodeType&&(a=n.ownerDocument),null!==r&&!t&&Cr.has(e)){if("scroll"!==e)return;o|=2,a=r}var i=ao(a),l=e+"__"+(t?"capture":"bubble");i.has(l)||(t&&(o|=4),Lr(a,e,o,t),i.add(l))}function Lr(e,t,n,r){var o=Mt.get(t);switch(void 0===o?2:o){case 0:o=Qt;break;case 1:o=Yt;break;default:o=Gt}n=o.bind(null,t,n,e),o=void 0,!Be||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(o=!0),r?void 0!==o?e.addEventListener(t,n,{capture:!0,passive:o}):e.addEventListener(t,n,!0):void 0!==o?e.addEventListener(t,n,{passive:o}):e.addEventListener(t,n,!1)}function zr(e,t,n,r,o){var a=r;if(!(1&t||2&t||null===r))e:for(;;){if(null===r)return;var i=r.tag;if(3===i||4===i){var l=r.stateNode.containerInfo;if(l===o||8===l.nodeType&&l.parentNode===o)break;if(4===i)for(i=r.return;null!==i;){var s=i.tag;if((3===s||4===s)&&((s=i.stateNode.containerInfo)===o||8===s.nodeType&&s.parentNode===o))return;i=i.return}for(;null!==l;){if(null===(i=to(l)))return;if(5===(s=i.tag)||6===s){r=a=i;continue e}l=l.parentNode}}r=r.return}!function(e,t,n){if(De)return e();De=!0;try{return _e(e,t,n)}finally{De=!1,Fe()}}((function(){var r=a,o=Ae(n),i=[];e:{var l=Ot.get(e);if(void 0!==l){var s=fn,u=e;switch(e){case"keypress":if(0===rn(n))break e;case"keydown":case"keyup":s=Tn;break;case"focusin":u="focus",s=yn;break;case"focusout":u="blur",s=yn;break;case"beforeblur":case"afterblur":s=yn;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":s=vn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":s=gn;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":s=On;break;case Rt:case Pt:case Tt:s=bn;break;case Nt:s=Mn;break;case"scroll":s=mn;break;case"wheel":s=zn;break;case"copy":case"cut":case"paste":s=wn;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":s=Nn}var c=!!(4&t),d=!c&&"scroll"===e,f=c?null!==l?l+"Capture":null:l;c=[];for(var p,m=r;null!==m;){var h=(p=m).stateNode;if(5===p.tag&&null!==h&&(p=h,null!==f&&null!=(h=je(m,f))&&c.push(_r(m,h,p))),d)break;m=m.return}0<c.length&&(l=new s(l,u,null,n,o),i.push({event:l,listeners:c}))}}if(!(7&t)){if(s="mouseout"===e||"pointerout"===e,(!(l="mouseover"===e||"pointerover"===e)||16&t||!(u=n.relatedTarget||n.fromElement)||!to(u)&&!u[Zr])&&(s||l)&&(l=o.window===o?o:(l=o.ownerDocument)?l.defaultView||l.parentWindow:window,s?(s=r,null!==(u=(u=n.relatedTarget||n.toElement)?to(u):null)&&(u!==(d=Qe(u))||5!==u.tag&&6!==u.tag)&&(u=null)):(s=null,u=r),s!==u)){if(c=vn,h="onMouseLeave",f="onMouseEnter",m="mouse","pointerout"!==e&&"pointerover"!==e||(c=Nn,h="onPointerLeave",f="onPointerEnter",m="pointer"),d=null==s?l:ro(s),p=null==u?l:ro(u),(l=new c(h,m+"leave",s,n,o)).target=d,l.relatedTarget=p,h=null,to(o)===r&&((c=new c(f,m+"enter",u,n,o)).target=p,c.relatedTarget=d,h=c),d=h,s&&u)e:{for(f=u,m=0,p=c=s;p;p=Dr(p))m++;for(p=0,h=f;h;h=Dr(h))p++;for(;0<m-p;)c=Dr(c),m--;for(;0<p-m;)f=Dr(f),p--;for(;m--;){if(c===f||null!==f&&c===f.alternate)break e;c=Dr(c),f=Dr(f)}c=null}else c=null;null!==s&&Fr(i,l,s,c,!1),null!==u&&null!==d&&Fr(i,d,u,c,!0)}if("select"===(s=(l=r?ro(r):window).nodeName&&l.nodeName.toLowerCase())||"input"===s&&"file"===l.type)var v=Jn;else if(qn(l))if(Zn)v=sr;else{v=ir;var g=ar}else(s=l.nodeName)&&"input"===s.toLowerCase()&&("checkbox"===l.type||"radio"===l.type)&&(v=lr);switch(v&&(v=v(e,r))?Kn(i,v,n,o):(g&&g(e,l,r),"focusout"===e&&(g=l._wrapperState)&&g.controlled&&"number"===l.type&&oe(l,"number",l.value)),g=r?ro(r):window,e){case"focusin":(qn(g)||"true"===g.contentEditable)&&(yr=g,br=r,xr=null);break;case"focusout":xr=br=yr=null;break;case"mousedown":wr=!0;break;case"contextmenu":case"mouseup":case"dragend":wr=!1,Er(i,n,o);break;case"selectionchange":if(gr)break;case"keydown":case"keyup":Er(i,n,o)}var y;if(In)e:{switch(e){case"compositionstart":var b="onCompositionStart";break e;case"compositionend":b="onCompositionEnd";break e;case"compositionupdate":b="onCompositionUpdate";break e}b=void 0}else Hn?$n(e,n)&&(b="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(b="onCompositionStart");b&&(jn&&"ko"!==n.locale&&(Hn||"onCompositionStart"!==b?"onCompositionEnd"===b&&Hn&&(y=nn()):(en="value"in(Zt=o)?Zt.value:Zt.textContent,Hn=!0)),0<(g=Ir(r,b)).length&&(b=new En(b,e,null,n,o),i.push({event:b,listeners:g}),(y||null!==(y=Vn(n)))&&(b.data=y))),(y=Fn?function(e,t){switch(e){case"compositionend":return Vn(t);case"keypress":return 32!==t.which?null:(Wn=!0,Bn);case"textInput":return(e=t.data)===Bn&&Wn?null:e;default:return null}}(e,n):function(e,t){if(Hn)return"compositionend"===e||!In&&$n(e,t)?(e=nn(),tn=en=Zt=null,Hn=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return jn&&"ko"!==t.locale?null:t.data}}(e,n))&&0<(r=Ir(r,"onBeforeInput")).length&&(o=new En("onBeforeInput","beforeinput",null,n,o),i.push({event:o,listeners:r}),o.data=y)}Pr(i,t)}))}function _r(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Ir(e,t){for(var n=t+"Capture",r=[];null!==e;){var o=e,a=o.stateNode;5===o.tag&&null!==a&&(o=a,null!=(a=je(e,n))&&r.unshift(_r(e,a,o)),null!=(a=je(e,t))&&r.push(_r(e,a,o))),e=e.return}return r}function Dr(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag);return e||null}function Fr(e,t,n,r,o){for(var a=t._reactName,i=[];null!==n&&n!==r;){var l=n,s=l.alternate,u=l.stateNode;if(null!==s&&s===r)break;5===l.tag&&null!==u&&(l=u,o?null!=(s=je(n,a))&&i.unshift(_r(n,s,l)):o||null!=(s=je(n,a))&&i.push(_r(n,s,l))),n=n.return}0!==i.length&&e.push({event:t,listeners:i})}function jr(){}var Br=null,Wr=null;function $r(e,t){switch(e){case"button":case"input":case"select":case"textarea":return!!t.autoFocus}return!1}function Vr(e,t){return"textarea"===e||"option"===e||"noscript"===e||"string"==typeof t.children||"number"==typeof t.children||"object"==typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var Hr="function"==typeof setTimeout?setTimeout:void 0,Ur="function"==typeof clearTimeout?clearTimeout:void 0;function qr(e){(1===e.nodeType||9===e.nodeType&&null!=(e=e.body))&&(e.textContent="")}function Kr(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break}return e}function Xr(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}var Qr=0,Yr=Math.random().toString(36).slice(2),Gr="__reactFiber$"+Yr,Jr="__reactProps$"+Yr,Zr="__reactContainer$"+Yr,eo="__reactEvents$"+Yr;function to(e){var t=e[Gr];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Zr]||n[Gr]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=Xr(e);null!==e;){if(n=e[Gr])return n;e=Xr(e)}return t}n=(e=n).parentNode}return null}function no(e){return!(e=e[Gr]||e[Zr])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function ro(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(i(33))}function oo(e){return e[Jr]||null}function ao(e){var t=e[eo];return void 0===t&&(t=e[eo]=new Set),t}var io=[],lo=-1;function so(e){return{current:e}}function uo(e){0>lo||(e.current=io[lo],io[lo]=null,lo--)}function co(e,t){lo++,io[lo]=e.current,e.current=t}var fo={},po=so(fo),mo=so(!1),ho=fo;function vo(e,t){var n=e.type.contextTypes;if(!n)return fo;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var o,a={};for(o in n)a[o]=t[o];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=a),a}function go(e){return null!=e.childContextTypes}function yo(){uo(mo),uo(po)}function bo(e,t,n){if(po.current!==fo)throw Error(i(168));co(po,t),co(mo,n)}function xo(e,t,n){var r=e.stateNode;if(e=t.childContextTypes,"function"!=typeof r.getChildContext)return n;for(var a in r=r.getChildContext())if(!(a in e))throw Error(i(108,K(t)||"Unknown",a));return o({},n,r)}function wo(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||fo,ho=po.current,co(po,e),co(mo,mo.current),!0}function Eo(e,t,n){var r=e.stateNode;if(!r)throw Error(i(169));n?(e=xo(e,t,ho),r.__reactInternalMemoizedMergedChildContext=e,uo(mo),uo(po),co(po,e)):uo(mo),co(mo,n)}var ko=null,So=null,Ao=a.unstable_runWithPriority,Co=a.unstable_scheduleCallback,Ro=a.unstable_cancelCallback,Po=a.unstable_shouldYield,To=a.unstable_requestPaint,No=a.unstable_now,Oo=a.unstable_getCurrentPriorityLevel,Mo=a.unstable_ImmediatePriority,Lo=a.unstable_UserBlockingPriority,zo=a.unstable_NormalPriority,_o=a.unstable_LowPriority,Io=a.unstable_IdlePriority,Do={},Fo=void 0!==To?To:function(){},jo=null,Bo=null,Wo=!1,$o=No(),Vo=1e4>$o?No:function(){return No()-$o};function Ho(){switch(Oo()){case Mo:return 99;case Lo:return 98;case zo:return 97;case _o:return 96;case Io:return 95;default:throw Error(i(332))}}function Uo(e){switch(e){case 99:return Mo;case 98:return Lo;case 97:return zo;case 96:return _o;case 95:return Io;default:throw Error(i(332))}}function qo(e,t){return e=Uo(e),Ao(e,t)}function Ko(e,t,n){return e=Uo(e),Co(e,t,n)}function Xo(){if(null!==Bo){var e=Bo;Bo=null,Ro(e)}Qo()}function Qo(){if(!Wo&&null!==jo){Wo=!0;var e=0;try{var t=jo;qo(99,(function(){for(;e<t.length;e++){var n=t[e];do{n=n(!0)}while(null!==n)}})),jo=null}catch(t){throw null!==jo&&(jo=jo.slice(e+1)),Co(Mo,Xo),t}finally{Wo=!1}}}var Yo=w.ReactCurrentBatchConfig;function Go(e,t){if(e&&e.defaultProps){for(var n in t=o({},t),e=e.defaultProps)void 0===t[n]&&(t[n]=e[n]);return t}return t}var Jo=so(null),Zo=null,ea=null,ta=null;function na(){ta=ea=Zo=null}function ra(e){var t=Jo.current;uo(Jo),e.type._context._currentValue=t}function oa(e,t){for(;null!==e;){var n=e.alternate;if((e.childLanes&t)===t){if(null===n||(n.childLanes&t)===t)break;n.childLanes|=t}else e.childLanes|=t,null!==n&&(n.childLanes|=t);e=e.return}}function aa(e,t){Zo=e,ta=ea=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(!!(e.lanes&t)&&(Ii=!0),e.firstContext=null)}function ia(e,t){if(ta!==e&&!1!==t&&0!==t)if("number"==typeof t&&1073741823!==t||(ta=e,t=1073741823),t={context:e,observedBits:t,next:null},null===ea){if(null===Zo)throw Error(i(308));ea=t,Zo.dependencies={lanes:0,firstContext:t,responders:null}}else ea=ea.next=t;return e._currentValue}var la=!1;function sa(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null},effects:null}}function ua(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function ca(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function da(e,t){if(null!==(e=e.updateQueue)){var n=(e=e.shared).pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}}function fa(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var o=null,a=null;if(null!==(n=n.firstBaseUpdate)){do{var i={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};null===a?o=a=i:a=a.next=i,n=n.next}while(null!==n);null===a?o=a=t:a=a.next=t}else o=a=t;return n={baseState:r.baseState,firstBaseUpdate:o,lastBaseUpdate:a,shared:r.shared,effects:r.effects},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function pa(e,t,n,r){var a=e.updateQueue;la=!1;var i=a.firstBaseUpdate,l=a.lastBaseUpdate,s=a.shared.pending;if(null!==s){a.shared.pending=null;var u=s,c=u.next;u.next=null,null===l?i=c:l.next=c,l=u;var d=e.alternate;if(null!==d){var f=(d=d.updateQueue).lastBaseUpdate;f!==l&&(null===f?d.firstBaseUpdate=c:f.next=c,d.lastBaseUpdate=u)}}if(null!==i){for(f=a.baseState,l=0,d=c=u=null;;){s=i.lane;var p=i.eventTime;if((r&s)===s){null!==d&&(d=d.next={eventTime:p,lane:0,tag:i.tag,payload:i.payload,callback:i.callback,next:null});e:{var m=e,h=i;switch(s=t,p=n,h.tag){case 1:if("function"==typeof(m=h.payload)){f=m.call(p,f,s);break e}f=m;break e;case 3:m.flags=-4097&m.flags|64;case 0:if(null==(s="function"==typeof(m=h.payload)?m.call(p,f,s):m))break e;f=o({},f,s);break e;case 2:la=!0}}null!==i.callback&&(e.flags|=32,null===(s=a.effects)?a.effects=[i]:s.push(i))}else p={eventTime:p,lane:s,tag:i.tag,payload:i.payload,callback:i.callback,next:null},null===d?(c=d=p,u=f):d=d.next=p,l|=s;if(null===(i=i.next)){if(null===(s=a.shared.pending))break;i=s.next,s.next=null,a.lastBaseUpdate=s,a.shared.pending=null}}null===d&&(u=f),a.baseState=u,a.firstBaseUpdate=c,a.lastBaseUpdate=d,jl|=l,e.lanes=l,e.memoizedState=f}}function ma(e,t,n){if(e=t.effects,t.effects=null,null!==e)for(t=0;t<e.length;t++){var r=e[t],o=r.callback;if(null!==o){if(r.callback=null,r=n,"function"!=typeof o)throw Error(i(191,o));o.call(r)}}}var ha=(new r.Component).refs;function va(e,t,n,r){n=null==(n=n(r,t=e.memoizedState))?t:o({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var ga={isMounted:function(e){return!!(e=e._reactInternals)&&Qe(e)===e},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=cs(),o=ds(e),a=ca(r,o);a.payload=t,null!=n&&(a.callback=n),da(e,a),fs(e,o,r)},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=cs(),o=ds(e),a=ca(r,o);a.tag=1,a.payload=t,null!=n&&(a.callback=n),da(e,a),fs(e,o,r)},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=cs(),r=ds(e),o=ca(n,r);o.tag=2,null!=t&&(o.callback=t),da(e,o),fs(e,r,n)}};function ya(e,t,n,r,o,a,i){return"function"==typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,a,i):!(t.prototype&&t.prototype.isPureReactComponent&&dr(n,r)&&dr(o,a))}function ba(e,t,n){var r=!1,o=fo,a=t.contextType;return"object"==typeof a&&null!==a?a=ia(a):(o=go(t)?ho:po.current,a=(r=null!=(r=t.contextTypes))?vo(e,o):fo),t=new t(n,a),e.memoizedState=null!==t.state&&void 0!==t.state?t.state:null,t.updater=ga,e.stateNode=t,t._reactInternals=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=o,e.__reactInternalMemoizedMaskedChildContext=a),t}function xa(e,t,n,r){e=t.state,"function"==typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"==typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&ga.enqueueReplaceState(t,t.state,null)}function wa(e,t,n,r){var o=e.stateNode;o.props=n,o.state=e.memoizedState,o.refs=ha,sa(e);var a=t.contextType;"object"==typeof a&&null!==a?o.context=ia(a):(a=go(t)?ho:po.current,o.context=vo(e,a)),pa(e,n,o,r),o.state=e.memoizedState,"function"==typeof(a=t.getDerivedStateFromProps)&&(va(e,t,a,n),o.state=e.memoizedState),"function"==typeof t.getDerivedStateFromProps||"function"==typeof o.getSnapshotBeforeUpdate||"function"!=typeof o.UNSAFE_componentWillMount&&"function"!=typeof o.componentWillMount||(t=o.state,"function"==typeof o.componentWillMount&&o.componentWillMount(),"function"==typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount(),t!==o.state&&ga.enqueueReplaceState(o,o.state,null),pa(e,n,o,r),o.state=e.memoizedState),"function"==typeof o.componentDidMount&&(e.flags|=4)}var Ea=Array.isArray;function ka(e,t,n){if(null!==(e=n.ref)&&"function"!=typeof e&&"object"!=typeof e){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(i(309));var r=n.stateNode}if(!r)throw Error(i(147,e));var o=""+e;return null!==t&&null!==t.ref&&"function"==typeof t.ref&&t.ref._stringRef===o?t.ref:(t=function(e){var t=r.refs;t===ha&&(t=r.refs={}),null===e?delete t[o]:t[o]=e},t._stringRef=o,t)}if("string"!=typeof e)throw Error(i(284));if(!n._owner)throw Error(i(290,e))}return e}function Sa(e,t){if("textarea"!==e.type)throw Error(i(31,"[object Object]"===Object.prototype.toString.call(t)?"object with keys {"+Object.keys(t).join(", ")+"}":t))}function Aa(e){function t(t,n){if(e){var r=t.lastEffect;null!==r?(r.nextEffect=n,t.lastEffect=n):t.firstEffect=t.lastEffect=n,n.nextEffect=null,n.flags=8}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e,t){for(e=new Map;null!==t;)null!==t.key?e.set(t.key,t):e.set(t.index,t),t=t.sibling;return e}function o(e,t){return(e=Hs(e,t)).index=0,e.sibling=null,e}function a(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags=2,n):r:(t.flags=2,n):n}function l(t){return e&&null===t.alternate&&(t.flags=2),t}function s(e,t,n,r){return null===t||6!==t.tag?((t=Xs(n,e.mode,r)).return=e,t):((t=o(t,n)).return=e,t)}function u(e,t,n,r){return null!==t&&t.elementType===n.type?((r=o(t,n.props)).ref=ka(e,t,n),r.return=e,r):((r=Us(n.type,n.key,n.props,null,e.mode,r)).ref=ka(e,t,n),r.return=e,r)}function c(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Qs(n,e.mode,r)).return=e,t):((t=o(t,n.children||[])).return=e,t)}function d(e,t,n,r,a){return null===t||7!==t.tag?((t=qs(n,e.mode,r,a)).return=e,t):((t=o(t,n)).return=e,t)}function f(e,t,n){if("string"==typeof t||"number"==typeof t)return(t=Xs(""+t,e.mode,n)).return=e,t;if("object"==typeof t&&null!==t){switch(t.$$typeof){case E:return(n=Us(t.type,t.key,t.props,null,e.mode,n)).ref=ka(e,null,t),n.return=e,n;case k:return(t=Qs(t,e.mode,n)).return=e,t}if(Ea(t)||$(t))return(t=qs(t,e.mode,n,null)).return=e,t;Sa(e,t)}return null}function p(e,t,n,r){var o=null!==t?t.key:null;if("string"==typeof n||"number"==typeof n)return null!==o?null:s(e,t,""+n,r);if("object"==typeof n&&null!==n){switch(n.$$typeof){case E:return n.key===o?n.type===S?d(e,t,n.props.children,r,o):u(e,t,n,r):null;case k:return n.key===o?c(e,t,n,r):null}if(Ea(n)||$(n))return null!==o?null:d(e,t,n,r,null);Sa(e,n)}return null}function m(e,t,n,r,o){if("string"==typeof r||"number"==typeof r)return s(t,e=e.get(n)||null,""+r,o);if("object"==typeof r&&null!==r){switch(r.$$typeof){case E:return e=e.get(null===r.key?n:r.key)||null,r.type===S?d(t,e,r.props.children,o,r.key):u(t,e,r,o);case k:return c(t,e=e.get(null===r.key?n:r.key)||null,r,o)}if(Ea(r)||$(r))return d(t,e=e.get(n)||null,r,o,null);Sa(t,r)}return null}function h(o,i,l,s){for(var u=null,c=null,d=i,h=i=0,v=null;null!==d&&h<l.length;h++){d.index>h?(v=d,d=null):v=d.sibling;var g=p(o,d,l[h],s);if(null===g){null===d&&(d=v);break}e&&d&&null===g.alternate&&t(o,d),i=a(g,i,h),null===c?u=g:c.sibling=g,c=g,d=v}if(h===l.length)return n(o,d),u;if(null===d){for(;h<l.length;h++)null!==(d=f(o,l[h],s))&&(i=a(d,i,h),null===c?u=d:c.sibling=d,c=d);return u}for(d=r(o,d);h<l.length;h++)null!==(v=m(d,o,h,l[h],s))&&(e&&null!==v.alternate&&d.delete(null===v.key?h:v.key),i=a(v,i,h),null===c?u=v:c.sibling=v,c=v);return e&&d.forEach((function(e){return t(o,e)})),u}function v(o,l,s,u){var c=$(s);if("function"!=typeof c)throw Error(i(150));if(null==(s=c.call(s)))throw Error(i(151));for(var d=c=null,h=l,v=l=0,g=null,y=s.next();null!==h&&!y.done;v++,y=s.next()){h.index>v?(g=h,h=null):g=h.sibling;var b=p(o,h,y.value,u);if(null===b){null===h&&(h=g);break}e&&h&&null===b.alternate&&t(o,h),l=a(b,l,v),null===d?c=b:d.sibling=b,d=b,h=g}if(y.done)return n(o,h),c;if(null===h){for(;!y.done;v++,y=s.next())null!==(y=f(o,y.value,u))&&(l=a(y,l,v),null===d?c=y:d.sibling=y,d=y);return c}for(h=r(o,h);!y.done;v++,y=s.next())null!==(y=m(h,o,v,y.value,u))&&(e&&null!==y.alternate&&h.delete(null===y.key?v:y.key),l=a(y,l,v),null===d?c=y:d.sibling=y,d=y);return e&&h.forEach((function(e){return t(o,e)})),c}return function(e,r,a,s){var u="object"==typeof a&&null!==a&&a.type===S&&null===a.key;u&&(a=a.props.children);var c="object"==typeof a&&null!==a;if(c)switch(a.$$typeof){case E:e:{for(c=a.key,u=r;null!==u;){if(u.key===c){if(7===u.tag){if(a.type===S){n(e,u.sibling),(r=o(u,a.props.children)).return=e,e=r;break e}}else if(u.elementType===a.type){n(e,u.sibling),(r=o(u,a.props)).ref=ka(e,u,a),r.return=e,e=r;break e}n(e,u);break}t(e,u),u=u.sibling}a.type===S?((r=qs(a.props.children,e.mode,s,a.key)).return=e,e=r):((s=Us(a.type,a.key,a.props,null,e.mode,s)).ref=ka(e,r,a),s.return=e,e=s)}return l(e);case k:e:{for(u=a.key;null!==r;){if(r.key===u){if(4===r.tag&&r.stateNode.containerInfo===a.containerInfo&&r.stateNode.implementation===a.implementation){n(e,r.sibling),(r=o(r,a.children||[])).return=e,e=r;break e}n(e,r);break}t(e,r),r=r.sibling}(r=Qs(a,e.mode,s)).return=e,e=r}return l(e)}if("string"==typeof a||"number"==typeof a)return a=""+a,null!==r&&6===r.tag?(n(e,r.sibling),(r=o(r,a)).return=e,e=r):(n(e,r),(r=Xs(a,e.mode,s)).return=e,e=r),l(e);if(Ea(a))return h(e,r,a,s);if($(a))return v(e,r,a,s);if(c&&Sa(e,a),void 0===a&&!u)switch(e.tag){case 1:case 22:case 0:case 11:case 15:throw Error(i(152,K(e.type)||"Component"))}return n(e,r)}}var Ca=Aa(!0),Ra=Aa(!1),Pa={},Ta=so(Pa),Na=so(Pa),Oa=so(Pa);function Ma(e){if(e===Pa)throw Error(i(174));return e}function La(e,t){switch(co(Oa,t),co(Na,e),co(Ta,Pa),e=t.nodeType){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:pe(null,"");break;default:t=pe(t=(e=8===e?t.parentNode:t).namespaceURI||null,e=e.tagName)}uo(Ta),co(Ta,t)}function za(){uo(Ta),uo(Na),uo(Oa)}function _a(e){Ma(Oa.current);var t=Ma(Ta.current),n=pe(t,e.type);t!==n&&(co(Na,e),co(Ta,n))}function Ia(e){Na.current===e&&(uo(Ta),uo(Na))}var Da=so(0);function Fa(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(64&t.flags)return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var ja=null,Ba=null,Wa=!1;function $a(e,t){var n=$s(5,null,null,0);n.elementType="DELETED",n.type="DELETED",n.stateNode=t,n.return=e,n.flags=8,null!==e.lastEffect?(e.lastEffect.nextEffect=n,e.lastEffect=n):e.firstEffect=e.lastEffect=n}function Va(e,t){switch(e.tag){case 5:var n=e.type;return null!==(t=1!==t.nodeType||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t)&&(e.stateNode=t,!0);case 6:return null!==(t=""===e.pendingProps||3!==t.nodeType?null:t)&&(e.stateNode=t,!0);default:return!1}}function Ha(e){if(Wa){var t=Ba;if(t){var n=t;if(!Va(e,t)){if(!(t=Kr(n.nextSibling))||!Va(e,t))return e.flags=-1025&e.flags|2,Wa=!1,void(ja=e);$a(ja,n)}ja=e,Ba=Kr(t.firstChild)}else e.flags=-1025&e.flags|2,Wa=!1,ja=e}}function Ua(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;ja=e}function qa(e){if(e!==ja)return!1;if(!Wa)return Ua(e),Wa=!0,!1;var t=e.type;if(5!==e.tag||"head"!==t&&"body"!==t&&!Vr(t,e.memoizedProps))for(t=Ba;t;)$a(e,t),t=Kr(t.nextSibling);if(Ua(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(i(317));e:{for(e=e.nextSibling,t=0;e;){if(8===e.nodeType){var n=e.data;if("/$"===n){if(0===t){Ba=Kr(e.nextSibling);break e}t--}else"$"!==n&&"$!"!==n&&"$?"!==n||t++}e=e.nextSibling}Ba=null}}else Ba=ja?Kr(e.stateNode.nextSibling):null;return!0}function Ka(){Ba=ja=null,Wa=!1}var Xa=[];function Qa(){for(var e=0;e<Xa.length;e++)Xa[e]._workInProgressVersionPrimary=null;Xa.length=0}var Ya=w.ReactCurrentDispatcher,Ga=w.ReactCurrentBatchConfig,Ja=0,Za=null,ei=null,ti=null,ni=!1,ri=!1;function oi(){throw Error(i(321))}function ai(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!ur(e[n],t[n]))return!1;return!0}function ii(e,t,n,r,o,a){if(Ja=a,Za=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Ya.current=null===e||null===e.memoizedState?Mi:Li,e=n(r,o),ri){a=0;do{if(ri=!1,!(25>a))throw Error(i(301));a+=1,ti=ei=null,t.updateQueue=null,Ya.current=zi,e=n(r,o)}while(ri)}if(Ya.current=Oi,t=null!==ei&&null!==ei.next,Ja=0,ti=ei=Za=null,ni=!1,t)throw Error(i(300));return e}function li(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===ti?Za.memoizedState=ti=e:ti=ti.next=e,ti}function si(){if(null===ei){var e=Za.alternate;e=null!==e?e.memoizedState:null}else e=ei.next;var t=null===ti?Za.memoizedState:ti.next;if(null!==t)ti=t,ei=e;else{if(null===e)throw Error(i(310));e={memoizedState:(ei=e).memoizedState,baseState:ei.baseState,baseQueue:ei.baseQueue,queue:ei.queue,next:null},null===ti?Za.memoizedState=ti=e:ti=ti.next=e}return ti}function ui(e,t){return"function"==typeof t?t(e):t}function ci(e){var t=si(),n=t.queue;if(null===n)throw Error(i(311));n.lastRenderedReducer=e;var r=ei,o=r.baseQueue,a=n.pending;if(null!==a){if(null!==o){var l=o.next;o.next=a.next,a.next=l}r.baseQueue=o=a,n.pending=null}if(null!==o){o=o.next,r=r.baseState;var s=l=a=null,u=o;do{var c=u.lane;if((Ja&c)===c)null!==s&&(s=s.next={lane:0,action:u.action,eagerReducer:u.eagerReducer,eagerState:u.eagerState,next:null}),r=u.eagerReducer===e?u.eagerState:e(r,u.action);else{var d={lane:c,action:u.action,eagerReducer:u.eagerReducer,eagerState:u.eagerState,next:null};null===s?(l=s=d,a=r):s=s.next=d,Za.lanes|=c,jl|=c}u=u.next}while(null!==u&&u!==o);null===s?a=r:s.next=l,ur(r,t.memoizedState)||(Ii=!0),t.memoizedState=r,t.baseState=a,t.baseQueue=s,n.lastRenderedState=r}return[t.memoizedState,n.dispatch]}function di(e){var t=si(),n=t.queue;if(null===n)throw Error(i(311));n.lastRenderedReducer=e;var r=n.dispatch,o=n.pending,a=t.memoizedState;if(null!==o){n.pending=null;var l=o=o.next;do{a=e(a,l.action),l=l.next}while(l!==o);ur(a,t.memoizedState)||(Ii=!0),t.memoizedState=a,null===t.baseQueue&&(t.baseState=a),n.lastRenderedState=a}return[a,r]}function fi(e,t,n){var r=t._getVersion;r=r(t._source);var o=t._workInProgressVersionPrimary;if(null!==o?e=o===r:(e=e.mutableReadLanes,(e=(Ja&e)===e)&&(t._workInProgressVersionPrimary=r,Xa.push(t))),e)return n(t._source);throw Xa.push(t),Error(i(350))}function pi(e,t,n,r){var o=Ol;if(null===o)throw Error(i(349));var a=t._getVersion,l=a(t._source),s=Ya.current,u=s.useState((function(){return fi(o,t,n)})),c=u[1],d=u[0];u=ti;var f=e.memoizedState,p=f.refs,m=p.getSnapshot,h=f.source;f=f.subscribe;var v=Za;return e.memoizedState={refs:p,source:t,subscribe:r},s.useEffect((function(){p.getSnapshot=n,p.setSnapshot=c;var e=a(t._source);if(!ur(l,e)){e=n(t._source),ur(d,e)||(c(e),e=ds(v),o.mutableReadLanes|=e&o.pendingLanes),e=o.mutableReadLanes,o.entangledLanes|=e;for(var r=o.entanglements,i=e;0<i;){var s=31-Vt(i),u=1<<s;r[s]|=e,i&=~u}}}),[n,t,r]),s.useEffect((function(){return r(t._source,(function(){var e=p.getSnapshot,n=p.setSnapshot;try{n(e(t._source));var r=ds(v);o.mutableReadLanes|=r&o.pendingLanes}catch(e){n((function(){throw e}))}}))}),[t,r]),ur(m,n)&&ur(h,t)&&ur(f,r)||((e={pending:null,dispatch:null,lastRenderedReducer:ui,lastRenderedState:d}).dispatch=c=Ni.bind(null,Za,e),u.queue=e,u.baseQueue=null,d=fi(o,t,n),u.memoizedState=u.baseState=d),d}function mi(e,t,n){return pi(si(),e,t,n)}function hi(e){var t=li();return"function"==typeof e&&(e=e()),t.memoizedState=t.baseState=e,e=(e=t.queue={pending:null,dispatch:null,lastRenderedReducer:ui,lastRenderedState:e}).dispatch=Ni.bind(null,Za,e),[t.memoizedState,e]}function vi(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},null===(t=Za.updateQueue)?(t={lastEffect:null},Za.updateQueue=t,t.lastEffect=e.next=e):null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function gi(e){return e={current:e},li().memoizedState=e}function yi(){return si().memoizedState}function bi(e,t,n,r){var o=li();Za.flags|=e,o.memoizedState=vi(1|t,n,void 0,void 0===r?null:r)}function xi(e,t,n,r){var o=si();r=void 0===r?null:r;var a=void 0;if(null!==ei){var i=ei.memoizedState;if(a=i.destroy,null!==r&&ai(r,i.deps))return void vi(t,n,a,r)}Za.flags|=e,o.memoizedState=vi(1|t,n,a,r)}function wi(e,t){return bi(516,4,e,t)}function Ei(e,t){return xi(516,4,e,t)}function ki(e,t){return xi(4,2,e,t)}function Si(e,t){return"function"==typeof t?(e=e(),t(e),function(){t(null)}):null!=t?(e=e(),t.current=e,function(){t.current=null}):void 0}function Ai(e,t,n){return n=null!=n?n.concat([e]):null,xi(4,2,Si.bind(null,t,e),n)}function Ci(){}function Ri(e,t){var n=si();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&ai(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Pi(e,t){var n=si();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&ai(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Ti(e,t){var n=Ho();qo(98>n?98:n,(function(){e(!0)})),qo(97<n?97:n,(function(){var n=Ga.transition;Ga.transition=1;try{e(!1),t()}finally{Ga.transition=n}}))}function Ni(e,t,n){var r=cs(),o=ds(e),a={lane:o,action:n,eagerReducer:null,eagerState:null,next:null},i=t.pending;if(null===i?a.next=a:(a.next=i.next,i.next=a),t.pending=a,i=e.alternate,e===Za||null!==i&&i===Za)ri=ni=!0;else{if(0===e.lanes&&(null===i||0===i.lanes)&&null!==(i=t.lastRenderedReducer))try{var l=t.lastRenderedState,s=i(l,n);if(a.eagerReducer=i,a.eagerState=s,ur(s,l))return}catch(e){}fs(e,o,r)}}var Oi={readContext:ia,useCallback:oi,useContext:oi,useEffect:oi,useImperativeHandle:oi,useLayoutEffect:oi,useMemo:oi,useReducer:oi,useRef:oi,useState:oi,useDebugValue:oi,useDeferredValue:oi,useTransition:oi,useMutableSource:oi,useOpaqueIdentifier:oi,unstable_isNewReconciler:!1},Mi={readContext:ia,useCallback:function(e,t){return li().memoizedState=[e,void 0===t?null:t],e},useContext:ia,useEffect:wi,useImperativeHandle:function(e,t,n){return n=null!=n?n.concat([e]):null,bi(4,2,Si.bind(null,t,e),n)},useLayoutEffect:function(e,t){return bi(4,2,e,t)},useMemo:function(e,t){var n=li();return t=void 0===t?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=li();return t=void 0!==n?n(t):t,r.memoizedState=r.baseState=t,e=(e=r.queue={pending:null,dispatch:null,lastRenderedReducer:e,lastRenderedState:t}).dispatch=Ni.bind(null,Za,e),[r.memoizedState,e]},useRef:gi,useState:hi,useDebugValue:Ci,useDeferredValue:function(e){var t=hi(e),n=t[0],r=t[1];return wi((function(){var t=Ga.transition;Ga.transition=1;try{r(e)}finally{Ga.transition=t}}),[e]),n},useTransition:function(){var e=hi(!1),t=e[0];return gi(e=Ti.bind(null,e[1])),[e,t]},useMutableSource:function(e,t,n){var r=li();return r.memoizedState={refs:{getSnapshot:t,setSnapshot:null},source:e,subscribe:n},pi(r,e,t,n)},useOpaqueIdentifier:function(){if(Wa){var e=!1,t=function(e){return{$$typeof:_,toString:e,valueOf:e}}((function(){throw e||(e=!0,n("r:"+(Qr++).toString(36))),Error(i(355))})),n=hi(t)[1];return!(2&Za.mode)&&(Za.flags|=516,vi(5,(function(){n("r:"+(Qr++).toString(36))}),void 0,null)),t}return hi(t="r:"+(Qr++).toString(36)),t},unstable_isNewReconciler:!1},Li={readContext:ia,useCallback:Ri,useContext:ia,useEffect:Ei,useImperativeHandle:Ai,useLayoutEffect:ki,useMemo:Pi,useReducer:ci,useRef:yi,useState:function(){return ci(ui)},useDebugValue:Ci,useDeferredValue:function(e){var t=ci(ui),n=t[0],r=t[1];return Ei((function(){var t=Ga.transition;Ga.transition=1;try{r(e)}finally{Ga.transition=t}}),[e]),n},useTransition:function(){var e=ci(ui)[0];return[yi().current,e]},useMutableSource:mi,useOpaqueIdentifier:function(){return ci(ui)[0]},unstable_isNewReconciler:!1},zi={readContext:ia,useCallback:Ri,useContext:ia,useEffect:Ei,useImperativeHandle:Ai,useLayoutEffect:ki,useMemo:Pi,useReducer:di,useRef:yi,useState:function(){return di(ui)},useDebugValue:Ci,useDeferredValue:function(e){var t=di(ui),n=t[0],r=t[1];return Ei((function(){var t=Ga.transition;Ga.transition=1;try{r(e)}finally{Ga.transition=t}}),[e]),n},useTransition:function(){var e=di(ui)[0];return[yi().current,e]},useMutableSource:mi,useOpaqueIdentifier:function(){return di(ui)[0]},unstable_isNewReconciler:!1},_i=w.ReactCurrentOwner,Ii=!1;function Di(e,t,n,r){t.child=null===e?Ra(t,null,n,r):Ca(t,e.child,n,r)}function Fi(e,t,n,r,o){n=n.render;var a=t.ref;return aa(t,o),r=ii(e,t,n,r,a,o),null===e||Ii?(t.flags|=1,Di(e,t,r,o),t.child):(t.updateQueue=e.updateQueue,t.flags&=-517,e.lanes&=~o,rl(e,t,o))}function ji(e,t,n,r,o,a){if(null===e){var i=n.type;return"function"!=typeof i||Vs(i)||void 0!==i.defaultProps||null!==n.compare||void 0!==n.defaultProps?((e=Us(n.type,null,r,t,t.mode,a)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=i,Bi(e,t,i,r,o,a))}return i=e.child,o&a||(o=i.memoizedProps,!(n=null!==(n=n.compare)?n:dr)(o,r)||e.ref!==t.ref)?(t.flags|=1,(e=Hs(i,r)).ref=t.ref,e.return=t,t.child=e):rl(e,t,a)}function Bi(e,t,n,r,o,a){if(null!==e&&dr(e.memoizedProps,r)&&e.ref===t.ref){if(Ii=!1,!(a&o))return t.lanes=e.lanes,rl(e,t,a);16384&e.flags&&(Ii=!0)}return Vi(e,t,n,r,a)}function Wi(e,t,n){var r=t.pendingProps,o=r.children,a=null!==e?e.memoizedState:null;if("hidden"===r.mode||"unstable-defer-without-hiding"===r.mode)if(4&t.mode){if(!(1073741824&n))return e=null!==a?a.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e},xs(0,e),null;t.memoizedState={baseLanes:0},xs(0,null!==a?a.baseLanes:n)}else t.memoizedState={baseLanes:0},xs(0,n);else null!==a?(r=a.baseLanes|n,t.memoizedState=null):r=n,xs(0,r);return Di(e,t,o,n),t.child}function $i(e,t){var n=t.ref;(null===e&&null!==n||null!==e&&e.ref!==n)&&(t.flags|=128)}function Vi(e,t,n,r,o){var a=go(n)?ho:po.current;return a=vo(t,a),aa(t,o),n=ii(e,t,n,r,a,o),null===e||Ii?(t.flags|=1,Di(e,t,n,o),t.child):(t.updateQueue=e.updateQueue,t.flags&=-517,e.lanes&=~o,rl(e,t,o))}function Hi(e,t,n,r,o){if(go(n)){var a=!0;wo(t)}else a=!1;if(aa(t,o),null===t.stateNode)null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2),ba(t,n,r),wa(t,n,r,o),r=!0;else if(null===e){var i=t.stateNode,l=t.memoizedProps;i.props=l;var s=i.context,u=n.contextType;u="object"==typeof u&&null!==u?ia(u):vo(t,u=go(n)?ho:po.current);var c=n.getDerivedStateFromProps,d="function"==typeof c||"function"==typeof i.getSnapshotBeforeUpdate;d||"function"!=typeof i.UNSAFE_componentWillReceiveProps&&"function"!=typeof i.componentWillReceiveProps||(l!==r||s!==u)&&xa(t,i,r,u),la=!1;var f=t.memoizedState;i.state=f,pa(t,r,i,o),s=t.memoizedState,l!==r||f!==s||mo.current||la?("function"==typeof c&&(va(t,n,c,r),s=t.memoizedState),(l=la||ya(t,n,l,r,f,s,u))?(d||"function"!=typeof i.UNSAFE_componentWillMount&&"function"!=typeof i.componentWillMount||("function"==typeof i.componentWillMount&&i.componentWillMount(),"function"==typeof i.UNSAFE_componentWillMount&&i.UNSAFE_componentWillMount()),"function"==typeof i.componentDidMount&&(t.flags|=4)):("function"==typeof i.componentDidMount&&(t.flags|=4),t.memoizedProps=r,t.memoizedState=s),i.props=r,i.state=s,i.context=u,r=l):("function"==typeof i.componentDidMount&&(t.flags|=4),r=!1)}else{i=t.stateNode,ua(e,t),l=t.memoizedProps,u=t.type===t.elementType?l:Go(t.type,l),i.props=u,d=t.pendingProps,f=i.context,s="object"==typeof(s=n.contextType)&&null!==s?ia(s):vo(t,s=go(n)?ho:po.current);var p=n.getDerivedStateFromProps;(c="function"==typeof p||"function"==typeof i.getSnapshotBeforeUpdate)||"function"!=typeof i.UNSAFE_componentWillReceiveProps&&"function"!=typeof i.componentWillReceiveProps||(l!==d||f!==s)&&xa(t,i,r,s),la=!1,f=t.memoizedState,i.state=f,pa(t,r,i,o);var m=t.memoizedState;l!==d||f!==m||mo.current||la?("function"==typeof p&&(va(t,n,p,r),m=t.memoizedState),(u=la||ya(t,n,u,r,f,m,s))?(c||"function"!=typeof i.UNSAFE_componentWillUpdate&&"function"!=typeof i.componentWillUpdate||("function"==typeof i.componentWillUpdate&&i.componentWillUpdate(r,m,s),"function"==typeof i.UNSAFE_componentWillUpdate&&i.UNSAFE_componentWillUpdate(r,m,s)),"function"==typeof i.componentDidUpdate&&(t.flags|=4),"function"==typeof i.getSnapshotBeforeUpdate&&(t.flags|=256)):("function"!=typeof i.componentDidUpdate||l===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!=typeof i.getSnapshotBeforeUpdate||l===e.memoizedProps&&f===e.memoizedState||(t.flags|=256),t.memoizedProps=r,t.memoizedState=m),i.props=r,i.state=m,i.context=s,r=u):("function"!=typeof i.componentDidUpdate||l===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!=typeof i.getSnapshotBeforeUpdate||l===e.memoizedProps&&f===e.memoizedState||(t.flags|=256),r=!1)}return Ui(e,t,n,r,a,o)}function Ui(e,t,n,r,o,a){$i(e,t);var i=!!(64&t.flags);if(!r&&!i)return o&&Eo(t,n,!1),rl(e,t,a);r=t.stateNode,_i.current=t;var l=i&&"function"!=typeof n.getDerivedStateFromError?null:r.render();return t.flags|=1,null!==e&&i?(t.child=Ca(t,e.child,null,a),t.child=Ca(t,null,l,a)):Di(e,t,l,a),t.memoizedState=r.state,o&&Eo(t,n,!0),t.child}function qi(e){var t=e.stateNode;t.pendingContext?bo(0,t.pendingContext,t.pendingContext!==t.context):t.context&&bo(0,t.context,!1),La(e,t.containerInfo)}var Ki,Xi,Qi,Yi,Gi={dehydrated:null,retryLane:0};function Ji(e,t,n){var r,o=t.pendingProps,a=Da.current,i=!1;return(r=!!(64&t.flags))||(r=(null===e||null!==e.memoizedState)&&!!(2&a)),r?(i=!0,t.flags&=-65):null!==e&&null===e.memoizedState||void 0===o.fallback||!0===o.unstable_avoidThisFallback||(a|=1),co(Da,1&a),null===e?(void 0!==o.fallback&&Ha(t),e=o.children,a=o.fallback,i?(e=Zi(t,e,a,n),t.child.memoizedState={baseLanes:n},t.memoizedState=Gi,e):"number"==typeof o.unstable_expectedLoadTime?(e=Zi(t,e,a,n),t.child.memoizedState={baseLanes:n},t.memoizedState=Gi,t.lanes=33554432,e):((n=Ks({mode:"visible",children:e},t.mode,n,null)).return=t,t.child=n)):(e.memoizedState,i?(o=function(e,t,n,r,o){var a=t.mode,i=e.child;e=i.sibling;var l={mode:"hidden",children:n};return 2&a||t.child===i?n=Hs(i,l):((n=t.child).childLanes=0,n.pendingProps=l,null!==(i=n.lastEffect)?(t.firstEffect=n.firstEffect,t.lastEffect=i,i.nextEffect=null):t.firstEffect=t.lastEffect=null),null!==e?r=Hs(e,r):(r=qs(r,a,o,null)).flags|=2,r.return=t,n.return=t,n.sibling=r,t.child=n,r}(e,t,o.children,o.fallback,n),i=t.child,a=e.child.memoizedState,i.memoizedState=null===a?{baseLanes:n}:{baseLanes:a.baseLanes|n},i.childLanes=e.childLanes&~n,t.memoizedState=Gi,o):(n=function(e,t,n,r){var o=e.child;return e=o.sibling,n=Hs(o,{mode:"visible",children:n}),!(2&t.mode)&&(n.lanes=r),n.return=t,n.sibling=null,null!==e&&(e.nextEffect=null,e.flags=8,t.firstEffect=t.lastEffect=e),t.child=n}(e,t,o.children,n),t.memoizedState=null,n))}function Zi(e,t,n,r){var o=e.mode,a=e.child;return t={mode:"hidden",children:t},2&o||null===a?a=Ks(t,o,0,null):(a.childLanes=0,a.pendingProps=t),n=qs(n,o,r,null),a.return=e,n.return=e,a.sibling=n,e.child=a,n}function el(e,t){e.lanes|=t;var n=e.alternate;null!==n&&(n.lanes|=t),oa(e.return,t)}function tl(e,t,n,r,o,a){var i=e.memoizedState;null===i?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:o,lastEffect:a}:(i.isBackwards=t,i.rendering=null,i.renderingStartTime=0,i.last=r,i.tail=n,i.tailMode=o,i.lastEffect=a)}function nl(e,t,n){var r=t.pendingProps,o=r.revealOrder,a=r.tail;if(Di(e,t,r.children,n),2&(r=Da.current))r=1&r|2,t.flags|=64;else{if(null!==e&&64&e.flags)e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&el(e,n);else if(19===e.tag)el(e,n);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(co(Da,r),2&t.mode)switch(o){case"forwards":for(n=t.child,o=null;null!==n;)null!==(e=n.alternate)&&null===Fa(e)&&(o=n),n=n.sibling;null===(n=o)?(o=t.child,t.child=null):(o=n.sibling,n.sibling=null),tl(t,!1,o,n,a,t.lastEffect);break;case"backwards":for(n=null,o=t.child,t.child=null;null!==o;){if(null!==(e=o.alternate)&&null===Fa(e)){t.child=o;break}e=o.sibling,o.sibling=n,n=o,o=e}tl(t,!0,n,null,a,t.lastEffect);break;case"together":tl(t,!1,null,null,void 0,t.lastEffect);break;default:t.memoizedState=null}else t.memoizedState=null;return t.child}function rl(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),jl|=t.lanes,n&t.childLanes){if(null!==e&&t.child!==e.child)throw Error(i(153));if(null!==t.child){for(n=Hs(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Hs(e,e.pendingProps)).return=t;n.sibling=null}return t.child}return null}function ol(e,t){if(!Wa)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function al(e,t,n){var r=t.pendingProps;switch(t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return null;case 1:case 17:return go(t.type)&&yo(),null;case 3:return za(),uo(mo),uo(po),Qa(),(r=t.stateNode).pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==e&&null!==e.child||(qa(t)?t.flags|=4:r.hydrate||(t.flags|=256)),Xi(t),null;case 5:Ia(t);var a=Ma(Oa.current);if(n=t.type,null!==e&&null!=t.stateNode)Qi(e,t,n,r,a),e.ref!==t.ref&&(t.flags|=128);else{if(!r){if(null===t.stateNode)throw Error(i(166));return null}if(e=Ma(Ta.current),qa(t)){r=t.stateNode,n=t.type;var l=t.memoizedProps;switch(r[Gr]=t,r[Jr]=l,n){case"dialog":Tr("cancel",r),Tr("close",r);break;case"iframe":case"object":case"embed":Tr("load",r);break;case"video":case"audio":for(e=0;e<Ar.length;e++)Tr(Ar[e],r);break;case"source":Tr("error",r);break;case"img":case"image":case"link":Tr("error",r),Tr("load",r);break;case"details":Tr("toggle",r);break;case"input":ee(r,l),Tr("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!l.multiple},Tr("invalid",r);break;case"textarea":se(r,l),Tr("invalid",r)}for(var u in ke(n,l),e=null,l)l.hasOwnProperty(u)&&(a=l[u],"children"===u?"string"==typeof a?r.textContent!==a&&(e=["children",a]):"number"==typeof a&&r.textContent!==""+a&&(e=["children",""+a]):s.hasOwnProperty(u)&&null!=a&&"onScroll"===u&&Tr("scroll",r));switch(n){case"input":Y(r),re(r,l,!0);break;case"textarea":Y(r),ce(r);break;case"select":case"option":break;default:"function"==typeof l.onClick&&(r.onclick=jr)}r=e,t.updateQueue=r,null!==r&&(t.flags|=4)}else{switch(u=9===a.nodeType?a:a.ownerDocument,e===de&&(e=fe(n)),e===de?"script"===n?((e=u.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"==typeof r.is?e=u.createElement(n,{is:r.is}):(e=u.createElement(n),"select"===n&&(u=e,r.multiple?u.multiple=!0:r.size&&(u.size=r.size))):e=u.createElementNS(e,n),e[Gr]=t,e[Jr]=r,Ki(e,t,!1,!1),t.stateNode=e,u=Se(n,r),n){case"dialog":Tr("cancel",e),Tr("close",e),a=r;break;case"iframe":case"object":case"embed":Tr("load",e),a=r;break;case"video":case"audio":for(a=0;a<Ar.length;a++)Tr(Ar[a],e);a=r;break;case"source":Tr("error",e),a=r;break;case"img":case"image":case"link":Tr("error",e),Tr("load",e),a=r;break;case"details":Tr("toggle",e),a=r;break;case"input":ee(e,r),a=Z(e,r),Tr("invalid",e);break;case"option":a=ae(e,r);break;case"select":e._wrapperState={wasMultiple:!!r.multiple},a=o({},r,{value:void 0}),Tr("invalid",e);break;case"textarea":se(e,r),a=le(e,r),Tr("invalid",e);break;default:a=r}ke(n,a);var c=a;for(l in c)if(c.hasOwnProperty(l)){var d=c[l];"style"===l?we(e,d):"dangerouslySetInnerHTML"===l?null!=(d=d?d.__html:void 0)&&ve(e,d):"children"===l?"string"==typeof d?("textarea"!==n||""!==d)&&ge(e,d):"number"==typeof d&&ge(e,""+d):"suppressContentEditableWarning"!==l&&"suppressHydrationWarning"!==l&&"autoFocus"!==l&&(s.hasOwnProperty(l)?null!=d&&"onScroll"===l&&Tr("scroll",e):null!=d&&x(e,l,d,u))}switch(n){case"input":Y(e),re(e,r,!1);break;case"textarea":Y(e),ce(e);break;case"option":null!=r.value&&e.setAttribute("value",""+X(r.value));break;case"select":e.multiple=!!r.multiple,null!=(l=r.value)?ie(e,!!r.multiple,l,!1):null!=r.defaultValue&&ie(e,!!r.multiple,r.defaultValue,!0);break;default:"function"==typeof a.onClick&&(e.onclick=jr)}$r(n,r)&&(t.flags|=4)}null!==t.ref&&(t.flags|=128)}return null;case 6:if(e&&null!=t.stateNode)Yi(e,t,e.memoizedProps,r);else{if("string"!=typeof r&&null===t.stateNode)throw Error(i(166));n=Ma(Oa.current),Ma(Ta.current),qa(t)?(r=t.stateNode,n=t.memoizedProps,r[Gr]=t,r.nodeValue!==n&&(t.flags|=4)):((r=(9===n.nodeType?n:n.ownerDocument).createTextNode(r))[Gr]=t,t.stateNode=r)}return null;case 13:return uo(Da),r=t.memoizedState,64&t.flags?(t.lanes=n,t):(r=null!==r,n=!1,null===e?void 0!==t.memoizedProps.fallback&&qa(t):n=null!==e.memoizedState,r&&!n&&2&t.mode&&(null===e&&!0!==t.memoizedProps.unstable_avoidThisFallback||1&Da.current?0===Il&&(Il=3):(0!==Il&&3!==Il||(Il=4),null===Ol||!(134217727&jl)&&!(134217727&Bl)||vs(Ol,Ll))),(r||n)&&(t.flags|=4),null);case 4:return za(),Xi(t),null===e&&Or(t.stateNode.containerInfo),null;case 10:return ra(t),null;case 19:if(uo(Da),null===(r=t.memoizedState))return null;if(l=!!(64&t.flags),null===(u=r.rendering))if(l)ol(r,!1);else{if(0!==Il||null!==e&&64&e.flags)for(e=t.child;null!==e;){if(null!==(u=Fa(e))){for(t.flags|=64,ol(r,!1),null!==(l=u.updateQueue)&&(t.updateQueue=l,t.flags|=4),null===r.lastEffect&&(t.firstEffect=null),t.lastEffect=r.lastEffect,r=n,n=t.child;null!==n;)e=r,(l=n).flags&=2,l.nextEffect=null,l.firstEffect=null,l.lastEffect=null,null===(u=l.alternate)?(l.childLanes=0,l.lanes=e,l.child=null,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=u.childLanes,l.lanes=u.lanes,l.child=u.child,l.memoizedProps=u.memoizedProps,l.memoizedState=u.memoizedState,l.updateQueue=u.updateQueue,l.type=u.type,e=u.dependencies,l.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return co(Da,1&Da.current|2),t.child}e=e.sibling}null!==r.tail&&Vo()>Hl&&(t.flags|=64,l=!0,ol(r,!1),t.lanes=33554432)}else{if(!l)if(null!==(e=Fa(u))){if(t.flags|=64,l=!0,null!==(n=e.updateQueue)&&(t.updateQueue=n,t.flags|=4),ol(r,!0),null===r.tail&&"hidden"===r.tailMode&&!u.alternate&&!Wa)return null!==(t=t.lastEffect=r.lastEffect)&&(t.nextEffect=null),null}else 2*Vo()-r.renderingStartTime>Hl&&1073741824!==n&&(t.flags|=64,l=!0,ol(r,!1),t.lanes=33554432);r.isBackwards?(u.sibling=t.child,t.child=u):(null!==(n=r.last)?n.sibling=u:t.child=u,r.last=u)}return null!==r.tail?(n=r.tail,r.rendering=n,r.tail=n.sibling,r.lastEffect=t.lastEffect,r.renderingStartTime=Vo(),n.sibling=null,t=Da.current,co(Da,l?1&t|2:1&t),n):null;case 23:case 24:return ws(),null!==e&&null!==e.memoizedState!=(null!==t.memoizedState)&&"unstable-defer-without-hiding"!==r.mode&&(t.flags|=4),null}throw Error(i(156,t.tag))}function il(e){switch(e.tag){case 1:go(e.type)&&yo();var t=e.flags;return 4096&t?(e.flags=-4097&t|64,e):null;case 3:if(za(),uo(mo),uo(po),Qa(),64&(t=e.flags))throw Error(i(285));return e.flags=-4097&t|64,e;case 5:return Ia(e),null;case 13:return uo(Da),4096&(t=e.flags)?(e.flags=-4097&t|64,e):null;case 19:return uo(Da),null;case 4:return za(),null;case 10:return ra(e),null;case 23:case 24:return ws(),null;default:return null}}function ll(e,t){try{var n="",r=t;do{n+=q(r),r=r.return}while(r);var o=n}catch(e){o="\nError generating stack: "+e.message+"\n"+e.stack}return{value:e,source:t,stack:o}}function sl(e,t){try{console.error(t.value)}catch(e){setTimeout((function(){throw e}))}}Ki=function(e,t){for(var n=t.child;null!==n;){if(5===n.tag||6===n.tag)e.appendChild(n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===t)break;for(;null===n.sibling;){if(null===n.return||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},Xi=function(){},Qi=function(e,t,n,r){var a=e.memoizedProps;if(a!==r){e=t.stateNode,Ma(Ta.current);var i,l=null;switch(n){case"input":a=Z(e,a),r=Z(e,r),l=[];break;case"option":a=ae(e,a),r=ae(e,r),l=[];break;case"select":a=o({},a,{value:void 0}),r=o({},r,{value:void 0}),l=[];break;case"textarea":a=le(e,a),r=le(e,r),l=[];break;default:"function"!=typeof a.onClick&&"function"==typeof r.onClick&&(e.onclick=jr)}for(d in ke(n,r),n=null,a)if(!r.hasOwnProperty(d)&&a.hasOwnProperty(d)&&null!=a[d])if("style"===d){var u=a[d];for(i in u)u.hasOwnProperty(i)&&(n||(n={}),n[i]="")}else"dangerouslySetInnerHTML"!==d&&"children"!==d&&"suppressContentEditableWarning"!==d&&"suppressHydrationWarning"!==d&&"autoFocus"!==d&&(s.hasOwnProperty(d)?l||(l=[]):(l=l||[]).push(d,null));for(d in r){var c=r[d];if(u=null!=a?a[d]:void 0,r.hasOwnProperty(d)&&c!==u&&(null!=c||null!=u))if("style"===d)if(u){for(i in u)!u.hasOwnProperty(i)||c&&c.hasOwnProperty(i)||(n||(n={}),n[i]="");for(i in c)c.hasOwnProperty(i)&&u[i]!==c[i]&&(n||(n={}),n[i]=c[i])}else n||(l||(l=[]),l.push(d,n)),n=c;else"dangerouslySetInnerHTML"===d?(c=c?c.__html:void 0,u=u?u.__html:void 0,null!=c&&u!==c&&(l=l||[]).push(d,c)):"children"===d?"string"!=typeof c&&"number"!=typeof c||(l=l||[]).push(d,""+c):"suppressContentEditableWarning"!==d&&"suppressHydrationWarning"!==d&&(s.hasOwnProperty(d)?(null!=c&&"onScroll"===d&&Tr("scroll",e),l||u===c||(l=[])):"object"==typeof c&&null!==c&&c.$$typeof===_?c.toString():(l=l||[]).push(d,c))}n&&(l=l||[]).push("style",n);var d=l;(t.updateQueue=d)&&(t.flags|=4)}},Yi=function(e,t,n,r){n!==r&&(t.flags|=4)};var ul="function"==typeof WeakMap?WeakMap:Map;function cl(e,t,n){(n=ca(-1,n)).tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){Xl||(Xl=!0,Ql=r),sl(0,t)},n}function dl(e,t,n){(n=ca(-1,n)).tag=3;var r=e.type.getDerivedStateFromError;if("function"==typeof r){var o=t.value;n.payload=function(){return sl(0,t),r(o)}}var a=e.stateNode;return null!==a&&"function"==typeof a.componentDidCatch&&(n.callback=function(){"function"!=typeof r&&(null===Yl?Yl=new Set([this]):Yl.add(this),sl(0,t));var e=t.stack;this.componentDidCatch(t.value,{componentStack:null!==e?e:""})}),n}var fl="function"==typeof WeakSet?WeakSet:Set;function pl(e){var t=e.ref;if(null!==t)if("function"==typeof t)try{t(null)}catch(t){Fs(e,t)}else t.current=null}function ml(e,t){switch(t.tag){case 0:case 11:case 15:case 22:case 5:case 6:case 4:case 17:return;case 1:if(256&t.flags&&null!==e){var n=e.memoizedProps,r=e.memoizedState;t=(e=t.stateNode).getSnapshotBeforeUpdate(t.elementType===t.type?n:Go(t.type,n),r),e.__reactInternalSnapshotBeforeUpdate=t}return;case 3:return void(256&t.flags&&qr(t.stateNode.containerInfo))}throw Error(i(163))}function hl(e,t,n){switch(n.tag){case 0:case 11:case 15:case 22:if(null!==(t=null!==(t=n.updateQueue)?t.lastEffect:null)){e=t=t.next;do{if(!(3&~e.tag)){var r=e.create;e.destroy=r()}e=e.next}while(e!==t)}if(null!==(t=null!==(t=n.updateQueue)?t.lastEffect:null)){e=t=t.next;do{var o=e;r=o.next,4&(o=o.tag)&&1&o&&(_s(n,e),zs(n,e)),e=r}while(e!==t)}return;case 1:return e=n.stateNode,4&n.flags&&(null===t?e.componentDidMount():(r=n.elementType===n.type?t.memoizedProps:Go(n.type,t.memoizedProps),e.componentDidUpdate(r,t.memoizedState,e.__reactInternalSnapshotBeforeUpdate))),void(null!==(t=n.updateQueue)&&ma(n,t,e));case 3:if(null!==(t=n.updateQueue)){if(e=null,null!==n.child)switch(n.child.tag){case 5:case 1:e=n.child.stateNode}ma(n,t,e)}return;case 5:return e=n.stateNode,void(null===t&&4&n.flags&&$r(n.type,n.memoizedProps)&&e.focus());case 6:case 4:case 12:case 19:case 17:case 20:case 21:case 23:case 24:return;case 13:return void(null===n.memoizedState&&(n=n.alternate,null!==n&&(n=n.memoizedState,null!==n&&(n=n.dehydrated,null!==n&&wt(n)))))}throw Error(i(163))}function vl(e,t){for(var n=e;;){if(5===n.tag){var r=n.stateNode;if(t)"function"==typeof(r=r.style).setProperty?r.setProperty("display","none","important"):r.display="none";else{r=n.stateNode;var o=n.memoizedProps.style;o=null!=o&&o.hasOwnProperty("display")?o.display:null,r.style.display=xe("display",o)}}else if(6===n.tag)n.stateNode.nodeValue=t?"":n.memoizedProps;else if((23!==n.tag&&24!==n.tag||null===n.memoizedState||n===e)&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return;n=n.return}n.sibling.return=n.return,n=n.sibling}}function gl(e,t){if(So&&"function"==typeof So.onCommitFiberUnmount)try{So.onCommitFiberUnmount(ko,t)}catch(e){}switch(t.tag){case 0:case 11:case 14:case 15:case 22:if(null!==(e=t.updateQueue)&&null!==(e=e.lastEffect)){var n=e=e.next;do{var r=n,o=r.destroy;if(r=r.tag,void 0!==o)if(4&r)_s(t,n);else{r=t;try{o()}catch(e){Fs(r,e)}}n=n.next}while(n!==e)}break;case 1:if(pl(t),"function"==typeof(e=t.stateNode).componentWillUnmount)try{e.props=t.memoizedProps,e.state=t.memoizedState,e.componentWillUnmount()}catch(e){Fs(t,e)}break;case 5:pl(t);break;case 4:kl(e,t)}}function yl(e){e.alternate=null,e.child=null,e.dependencies=null,e.firstEffect=null,e.lastEffect=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.return=null,e.updateQueue=null}function bl(e){return 5===e.tag||3===e.tag||4===e.tag}function xl(e){e:{for(var t=e.return;null!==t;){if(bl(t))break e;t=t.return}throw Error(i(160))}var n=t;switch(t=n.stateNode,n.tag){case 5:var r=!1;break;case 3:case 4:t=t.containerInfo,r=!0;break;default:throw Error(i(161))}16&n.flags&&(ge(t,""),n.flags&=-17);e:t:for(n=e;;){for(;null===n.sibling;){if(null===n.return||bl(n.return)){n=null;break e}n=n.return}for(n.sibling.return=n.return,n=n.sibling;5!==n.tag&&6!==n.tag&&18!==n.tag;){if(2&n.flags)continue t;if(null===n.child||4===n.tag)continue t;n.child.return=n,n=n.child}if(!(2&n.flags)){n=n.stateNode;break e}}r?wl(e,n,t):El(e,n,t)}function wl(e,t,n){var r=e.tag,o=5===r||6===r;if(o)e=o?e.stateNode:e.stateNode.instance,t?8===n.nodeType?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(8===n.nodeType?(t=n.parentNode).insertBefore(e,n):(t=n).appendChild(e),null!=(n=n._reactRootContainer)||null!==t.onclick||(t.onclick=jr));else if(4!==r&&null!==(e=e.child))for(wl(e,t,n),e=e.sibling;null!==e;)wl(e,t,n),e=e.sibling}function El(e,t,n){var r=e.tag,o=5===r||6===r;if(o)e=o?e.stateNode:e.stateNode.instance,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&null!==(e=e.child))for(El(e,t,n),e=e.sibling;null!==e;)El(e,t,n),e=e.sibling}function kl(e,t){for(var n,r,o=t,a=!1;;){if(!a){a=o.return;e:for(;;){if(null===a)throw Error(i(160));switch(n=a.stateNode,a.tag){case 5:r=!1;break e;case 3:case 4:n=n.containerInfo,r=!0;break e}a=a.return}a=!0}if(5===o.tag||6===o.tag){e:for(var l=e,s=o,u=s;;)if(gl(l,u),null!==u.child&&4!==u.tag)u.child.return=u,u=u.child;else{if(u===s)break e;for(;null===u.sibling;){if(null===u.return||u.return===s)break e;u=u.return}u.sibling.return=u.return,u=u.sibling}r?(l=n,s=o.stateNode,8===l.nodeType?l.parentNode.removeChild(s):l.removeChild(s)):n.removeChild(o.stateNode)}else if(4===o.tag){if(null!==o.child){n=o.stateNode.containerInfo,r=!0,o.child.return=o,o=o.child;continue}}else if(gl(e,o),null!==o.child){o.child.return=o,o=o.child;continue}if(o===t)break;for(;null===o.sibling;){if(null===o.return||o.return===t)return;4===(o=o.return).tag&&(a=!1)}o.sibling.return=o.return,o=o.sibling}}function Sl(e,t){switch(t.tag){case 0:case 11:case 14:case 15:case 22:var n=t.updateQueue;if(null!==(n=null!==n?n.lastEffect:null)){var r=n=n.next;do{!(3&~r.tag)&&(e=r.destroy,r.destroy=void 0,void 0!==e&&e()),r=r.next}while(r!==n)}return;case 1:case 12:case 17:return;case 5:if(null!=(n=t.stateNode)){r=t.memoizedProps;var o=null!==e?e.memoizedProps:r;e=t.type;var a=t.updateQueue;if(t.updateQueue=null,null!==a){for(n[Jr]=r,"input"===e&&"radio"===r.type&&null!=r.name&&te(n,r),Se(e,o),t=Se(e,r),o=0;o<a.length;o+=2){var l=a[o],s=a[o+1];"style"===l?we(n,s):"dangerouslySetInnerHTML"===l?ve(n,s):"children"===l?ge(n,s):x(n,l,s,t)}switch(e){case"input":ne(n,r);break;case"textarea":ue(n,r);break;case"select":e=n._wrapperState.wasMultiple,n._wrapperState.wasMultiple=!!r.multiple,null!=(a=r.value)?ie(n,!!r.multiple,a,!1):e!==!!r.multiple&&(null!=r.defaultValue?ie(n,!!r.multiple,r.defaultValue,!0):ie(n,!!r.multiple,r.multiple?[]:"",!1))}}}return;case 6:if(null===t.stateNode)throw Error(i(162));return void(t.stateNode.nodeValue=t.memoizedProps);case 3:return void((n=t.stateNode).hydrate&&(n.hydrate=!1,wt(n.containerInfo)));case 13:return null!==t.memoizedState&&(Vl=Vo(),vl(t.child,!0)),void Al(t);case 19:return void Al(t);case 23:case 24:return void vl(t,null!==t.memoizedState)}throw Error(i(163))}function Al(e){var t=e.updateQueue;if(null!==t){e.updateQueue=null;var n=e.stateNode;null===n&&(n=e.stateNode=new fl),t.forEach((function(t){var r=Bs.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))}))}}function Cl(e,t){return null!==e&&(null===(e=e.memoizedState)||null!==e.dehydrated)&&null!==(t=t.memoizedState)&&null===t.dehydrated}var Rl=Math.ceil,Pl=w.ReactCurrentDispatcher,Tl=w.ReactCurrentOwner,Nl=0,Ol=null,Ml=null,Ll=0,zl=0,_l=so(0),Il=0,Dl=null,Fl=0,jl=0,Bl=0,Wl=0,$l=null,Vl=0,Hl=1/0;function Ul(){Hl=Vo()+500}var ql,Kl=null,Xl=!1,Ql=null,Yl=null,Gl=!1,Jl=null,Zl=90,es=[],ts=[],ns=null,rs=0,os=null,as=-1,is=0,ls=0,ss=null,us=!1;function cs(){return 48&Nl?Vo():-1!==as?as:as=Vo()}function ds(e){if(!(2&(e=e.mode)))return 1;if(!(4&e))return 99===Ho()?1:2;if(0===is&&(is=Fl),0!==Yo.transition){0!==ls&&(ls=null!==$l?$l.pendingLanes:0),e=is;var t=4186112&~ls;return 0==(t&=-t)&&0==(t=(e=4186112&~e)&-e)&&(t=8192),t}return e=Ho(),e=jt(4&Nl&&98===e?12:e=function(e){switch(e){case 99:return 15;case 98:return 10;case 97:case 96:return 8;case 95:return 2;default:return 0}}(e),is)}function fs(e,t,n){if(50<rs)throw rs=0,os=null,Error(i(185));if(null===(e=ps(e,t)))return null;$t(e,t,n),e===Ol&&(Bl|=t,4===Il&&vs(e,Ll));var r=Ho();1===t?8&Nl&&!(48&Nl)?gs(e):(ms(e,n),0===Nl&&(Ul(),Xo())):(!(4&Nl)||98!==r&&99!==r||(null===ns?ns=new Set([e]):ns.add(e)),ms(e,n)),$l=e}function ps(e,t){e.lanes|=t;var n=e.alternate;for(null!==n&&(n.lanes|=t),n=e,e=e.return;null!==e;)e.childLanes|=t,null!==(n=e.alternate)&&(n.childLanes|=t),n=e,e=e.return;return 3===n.tag?n.stateNode:null}function ms(e,t){for(var n=e.callbackNode,r=e.suspendedLanes,o=e.pingedLanes,a=e.expirationTimes,l=e.pendingLanes;0<l;){var s=31-Vt(l),u=1<<s,c=a[s];if(-1===c){if(!(u&r)||u&o){c=t,It(u);var d=_t;a[s]=10<=d?c+250:6<=d?c+5e3:-1}}else c<=t&&(e.expiredLanes|=u);l&=~u}if(r=Dt(e,e===Ol?Ll:0),t=_t,0===r)null!==n&&(n!==Do&&Ro(n),e.callbackNode=null,e.callbackPriority=0);else{if(null!==n){if(e.callbackPriority===t)return;n!==Do&&Ro(n)}15===t?(n=gs.bind(null,e),null===jo?(jo=[n],Bo=Co(Mo,Qo)):jo.push(n),n=Do):14===t?n=Ko(99,gs.bind(null,e)):(n=function(e){switch(e){case 15:case 14:return 99;case 13:case 12:case 11:case 10:return 98;case 9:case 8:case 7:case 6:case 4:case 5:return 97;case 3:case 2:case 1:return 95;case 0:return 90;default:throw Error(i(358,e))}}(t),n=Ko(n,hs.bind(null,e))),e.callbackPriority=t,e.callbackNode=n}}function hs(e){if(as=-1,ls=is=0,48&Nl)throw Error(i(327));var t=e.callbackNode;if(Ls()&&e.callbackNode!==t)return null;var n=Dt(e,e===Ol?Ll:0);if(0===n)return null;var r=n,o=Nl;Nl|=16;var a=Ss();for(Ol===e&&Ll===r||(Ul(),Es(e,r));;)try{Rs();break}catch(t){ks(e,t)}if(na(),Pl.current=a,Nl=o,null!==Ml?r=0:(Ol=null,Ll=0,r=Il),Fl&Bl)Es(e,0);else if(0!==r){if(2===r&&(Nl|=64,e.hydrate&&(e.hydrate=!1,qr(e.containerInfo)),0!==(n=Ft(e))&&(r=As(e,n))),1===r)throw t=Dl,Es(e,0),vs(e,n),ms(e,Vo()),t;switch(e.finishedWork=e.current.alternate,e.finishedLanes=n,r){case 0:case 1:throw Error(i(345));case 2:case 5:Ns(e);break;case 3:if(vs(e,n),(62914560&n)===n&&10<(r=Vl+500-Vo())){if(0!==Dt(e,0))break;if(((o=e.suspendedLanes)&n)!==n){cs(),e.pingedLanes|=e.suspendedLanes&o;break}e.timeoutHandle=Hr(Ns.bind(null,e),r);break}Ns(e);break;case 4:if(vs(e,n),(4186112&n)===n)break;for(r=e.eventTimes,o=-1;0<n;){var l=31-Vt(n);a=1<<l,(l=r[l])>o&&(o=l),n&=~a}if(n=o,10<(n=(120>(n=Vo()-n)?120:480>n?480:1080>n?1080:1920>n?1920:3e3>n?3e3:4320>n?4320:1960*Rl(n/1960))-n)){e.timeoutHandle=Hr(Ns.bind(null,e),n);break}Ns(e);break;default:throw Error(i(329))}}return ms(e,Vo()),e.callbackNode===t?hs.bind(null,e):null}function vs(e,t){for(t&=~Wl,t&=~Bl,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Vt(t),r=1<<n;e[n]=-1,t&=~r}}function gs(e){if(48&Nl)throw Error(i(327));if(Ls(),e===Ol&&e.expiredLanes&Ll){var t=Ll,n=As(e,t);Fl&Bl&&(n=As(e,t=Dt(e,t)))}else n=As(e,t=Dt(e,0));if(0!==e.tag&&2===n&&(Nl|=64,e.hydrate&&(e.hydrate=!1,qr(e.containerInfo)),0!==(t=Ft(e))&&(n=As(e,t))),1===n)throw n=Dl,Es(e,0),vs(e,t),ms(e,Vo()),n;return e.finishedWork=e.current.alternate,e.finishedLanes=t,Ns(e),ms(e,Vo()),null}function ys(e,t){var n=Nl;Nl|=1;try{return e(t)}finally{0===(Nl=n)&&(Ul(),Xo())}}function bs(e,t){var n=Nl;Nl&=-2,Nl|=8;try{return e(t)}finally{0===(Nl=n)&&(Ul(),Xo())}}function xs(e,t){co(_l,zl),zl|=t,Fl|=t}function ws(){zl=_l.current,uo(_l)}function Es(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(-1!==n&&(e.timeoutHandle=-1,Ur(n)),null!==Ml)for(n=Ml.return;null!==n;){var r=n;switch(r.tag){case 1:null!=(r=r.type.childContextTypes)&&yo();break;case 3:za(),uo(mo),uo(po),Qa();break;case 5:Ia(r);break;case 4:za();break;case 13:case 19:uo(Da);break;case 10:ra(r);break;case 23:case 24:ws()}n=n.return}Ol=e,Ml=Hs(e.current,null),Ll=zl=Fl=t,Il=0,Dl=null,Wl=Bl=jl=0}function ks(e,t){for(;;){var n=Ml;try{if(na(),Ya.current=Oi,ni){for(var r=Za.memoizedState;null!==r;){var o=r.queue;null!==o&&(o.pending=null),r=r.next}ni=!1}if(Ja=0,ti=ei=Za=null,ri=!1,Tl.current=null,null===n||null===n.return){Il=1,Dl=t,Ml=null;break}e:{var a=e,i=n.return,l=n,s=t;if(t=Ll,l.flags|=2048,l.firstEffect=l.lastEffect=null,null!==s&&"object"==typeof s&&"function"==typeof s.then){var u=s;if(!(2&l.mode)){var c=l.alternate;c?(l.updateQueue=c.updateQueue,l.memoizedState=c.memoizedState,l.lanes=c.lanes):(l.updateQueue=null,l.memoizedState=null)}var d=!!(1&Da.current),f=i;do{var p;if(p=13===f.tag){var m=f.memoizedState;if(null!==m)p=null!==m.dehydrated;else{var h=f.memoizedProps;p=void 0!==h.fallback&&(!0!==h.unstable_avoidThisFallback||!d)}}if(p){var v=f.updateQueue;if(null===v){var g=new Set;g.add(u),f.updateQueue=g}else v.add(u);if(!(2&f.mode)){if(f.flags|=64,l.flags|=16384,l.flags&=-2981,1===l.tag)if(null===l.alternate)l.tag=17;else{var y=ca(-1,1);y.tag=2,da(l,y)}l.lanes|=1;break e}s=void 0,l=t;var b=a.pingCache;if(null===b?(b=a.pingCache=new ul,s=new Set,b.set(u,s)):void 0===(s=b.get(u))&&(s=new Set,b.set(u,s)),!s.has(l)){s.add(l);var x=js.bind(null,a,u,l);u.then(x,x)}f.flags|=4096,f.lanes=t;break e}f=f.return}while(null!==f);s=Error((K(l.type)||"A React component")+" suspended while rendering, but no fallback UI was specified.\n\nAdd a <Suspense fallback=...> component higher in the tree to provide a loading indicator or placeholder to display.")}5!==Il&&(Il=2),s=ll(s,l),f=i;do{switch(f.tag){case 3:a=s,f.flags|=4096,t&=-t,f.lanes|=t,fa(f,cl(0,a,t));break e;case 1:a=s;var w=f.type,E=f.stateNode;if(!(64&f.flags||"function"!=typeof w.getDerivedStateFromError&&(null===E||"function"!=typeof E.componentDidCatch||null!==Yl&&Yl.has(E)))){f.flags|=4096,t&=-t,f.lanes|=t,fa(f,dl(f,a,t));break e}}f=f.return}while(null!==f)}Ts(n)}catch(e){t=e,Ml===n&&null!==n&&(Ml=n=n.return);continue}break}}function Ss(){var e=Pl.current;return Pl.current=Oi,null===e?Oi:e}function As(e,t){var n=Nl;Nl|=16;var r=Ss();for(Ol===e&&Ll===t||Es(e,t);;)try{Cs();break}catch(t){ks(e,t)}if(na(),Nl=n,Pl.current=r,null!==Ml)throw Error(i(261));return Ol=null,Ll=0,Il}function Cs(){for(;null!==Ml;)Ps(Ml)}function Rs(){for(;null!==Ml&&!Po();)Ps(Ml)}function Ps(e){var t=ql(e.alternate,e,zl);e.memoizedProps=e.pendingProps,null===t?Ts(e):Ml=t,Tl.current=null}function Ts(e){var t=e;do{var n=t.alternate;if(e=t.return,2048&t.flags){if(null!==(n=il(t)))return n.flags&=2047,void(Ml=n);null!==e&&(e.firstEffect=e.lastEffect=null,e.flags|=2048)}else{if(null!==(n=al(n,t,zl)))return void(Ml=n);if(24!==(n=t).tag&&23!==n.tag||null===n.memoizedState||1073741824&zl||!(4&n.mode)){for(var r=0,o=n.child;null!==o;)r|=o.lanes|o.childLanes,o=o.sibling;n.childLanes=r}null!==e&&!(2048&e.flags)&&(null===e.firstEffect&&(e.firstEffect=t.firstEffect),null!==t.lastEffect&&(null!==e.lastEffect&&(e.lastEffect.nextEffect=t.firstEffect),e.lastEffect=t.lastEffect),1<t.flags&&(null!==e.lastEffect?e.lastEffect.nextEffect=t:e.firstEffect=t,e.lastEffect=t))}if(null!==(t=t.sibling))return void(Ml=t);Ml=t=e}while(null!==t);0===Il&&(Il=5)}function Ns(e){var t=Ho();return qo(99,Os.bind(null,e,t)),null}function Os(e,t){do{Ls()}while(null!==Jl);if(48&Nl)throw Error(i(327));var n=e.finishedWork;if(null===n)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(i(177));e.callbackNode=null;var r=n.lanes|n.childLanes,o=r,a=e.pendingLanes&~o;e.pendingLanes=o,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=o,e.mutableReadLanes&=o,e.entangledLanes&=o,o=e.entanglements;for(var l=e.eventTimes,s=e.expirationTimes;0<a;){var u=31-Vt(a),c=1<<u;o[u]=0,l[u]=-1,s[u]=-1,a&=~c}if(null!==ns&&!(24&r)&&ns.has(e)&&ns.delete(e),e===Ol&&(Ml=Ol=null,Ll=0),1<n.flags?null!==n.lastEffect?(n.lastEffect.nextEffect=n,r=n.firstEffect):r=n:r=n.firstEffect,null!==r){if(o=Nl,Nl|=32,Tl.current=null,Br=Xt,vr(l=hr())){if("selectionStart"in l)s={start:l.selectionStart,end:l.selectionEnd};else e:if(s=(s=l.ownerDocument)&&s.defaultView||window,(c=s.getSelection&&s.getSelection())&&0!==c.rangeCount){s=c.anchorNode,a=c.anchorOffset,u=c.focusNode,c=c.focusOffset;try{s.nodeType,u.nodeType}catch(e){s=null;break e}var d=0,f=-1,p=-1,m=0,h=0,v=l,g=null;t:for(;;){for(var y;v!==s||0!==a&&3!==v.nodeType||(f=d+a),v!==u||0!==c&&3!==v.nodeType||(p=d+c),3===v.nodeType&&(d+=v.nodeValue.length),null!==(y=v.firstChild);)g=v,v=y;for(;;){if(v===l)break t;if(g===s&&++m===a&&(f=d),g===u&&++h===c&&(p=d),null!==(y=v.nextSibling))break;g=(v=g).parentNode}v=y}s=-1===f||-1===p?null:{start:f,end:p}}else s=null;s=s||{start:0,end:0}}else s=null;Wr={focusedElem:l,selectionRange:s},Xt=!1,ss=null,us=!1,Kl=r;do{try{Ms()}catch(e){if(null===Kl)throw Error(i(330));Fs(Kl,e),Kl=Kl.nextEffect}}while(null!==Kl);ss=null,Kl=r;do{try{for(l=e;null!==Kl;){var b=Kl.flags;if(16&b&&ge(Kl.stateNode,""),128&b){var x=Kl.alternate;if(null!==x){var w=x.ref;null!==w&&("function"==typeof w?w(null):w.current=null)}}switch(1038&b){case 2:xl(Kl),Kl.flags&=-3;break;case 6:xl(Kl),Kl.flags&=-3,Sl(Kl.alternate,Kl);break;case 1024:Kl.flags&=-1025;break;case 1028:Kl.flags&=-1025,Sl(Kl.alternate,Kl);break;case 4:Sl(Kl.alternate,Kl);break;case 8:kl(l,s=Kl);var E=s.alternate;yl(s),null!==E&&yl(E)}Kl=Kl.nextEffect}}catch(e){if(null===Kl)throw Error(i(330));Fs(Kl,e),Kl=Kl.nextEffect}}while(null!==Kl);if(w=Wr,x=hr(),b=w.focusedElem,l=w.selectionRange,x!==b&&b&&b.ownerDocument&&mr(b.ownerDocument.documentElement,b)){null!==l&&vr(b)&&(x=l.start,void 0===(w=l.end)&&(w=x),"selectionStart"in b?(b.selectionStart=x,b.selectionEnd=Math.min(w,b.value.length)):(w=(x=b.ownerDocument||document)&&x.defaultView||window).getSelection&&(w=w.getSelection(),s=b.textContent.length,E=Math.min(l.start,s),l=void 0===l.end?E:Math.min(l.end,s),!w.extend&&E>l&&(s=l,l=E,E=s),s=pr(b,E),a=pr(b,l),s&&a&&(1!==w.rangeCount||w.anchorNode!==s.node||w.anchorOffset!==s.offset||w.focusNode!==a.node||w.focusOffset!==a.offset)&&((x=x.createRange()).setStart(s.node,s.offset),w.removeAllRanges(),E>l?(w.addRange(x),w.extend(a.node,a.offset)):(x.setEnd(a.node,a.offset),w.addRange(x))))),x=[];for(w=b;w=w.parentNode;)1===w.nodeType&&x.push({element:w,left:w.scrollLeft,top:w.scrollTop});for("function"==typeof b.focus&&b.focus(),b=0;b<x.length;b++)(w=x[b]).element.scrollLeft=w.left,w.element.scrollTop=w.top}Xt=!!Br,Wr=Br=null,e.current=n,Kl=r;do{try{for(b=e;null!==Kl;){var k=Kl.flags;if(36&k&&hl(b,Kl.alternate,Kl),128&k){x=void 0;var S=Kl.ref;if(null!==S){var A=Kl.stateNode;Kl.tag,x=A,"function"==typeof S?S(x):S.current=x}}Kl=Kl.nextEffect}}catch(e){if(null===Kl)throw Error(i(330));Fs(Kl,e),Kl=Kl.nextEffect}}while(null!==Kl);Kl=null,Fo(),Nl=o}else e.current=n;if(Gl)Gl=!1,Jl=e,Zl=t;else for(Kl=r;null!==Kl;)t=Kl.nextEffect,Kl.nextEffect=null,8&Kl.flags&&((k=Kl).sibling=null,k.stateNode=null),Kl=t;if(0===(r=e.pendingLanes)&&(Yl=null),1===r?e===os?rs++:(rs=0,os=e):rs=0,n=n.stateNode,So&&"function"==typeof So.onCommitFiberRoot)try{So.onCommitFiberRoot(ko,n,void 0,!(64&~n.current.flags))}catch(e){}if(ms(e,Vo()),Xl)throw Xl=!1,e=Ql,Ql=null,e;return 8&Nl||Xo(),null}function Ms(){for(;null!==Kl;){var e=Kl.alternate;us||null===ss||(8&Kl.flags?Ze(Kl,ss)&&(us=!0):13===Kl.tag&&Cl(e,Kl)&&Ze(Kl,ss)&&(us=!0));var t=Kl.flags;256&t&&ml(e,Kl),!(512&t)||Gl||(Gl=!0,Ko(97,(function(){return Ls(),null}))),Kl=Kl.nextEffect}}function Ls(){if(90!==Zl){var e=97<Zl?97:Zl;return Zl=90,qo(e,Is)}return!1}function zs(e,t){es.push(t,e),Gl||(Gl=!0,Ko(97,(function(){return Ls(),null})))}function _s(e,t){ts.push(t,e),Gl||(Gl=!0,Ko(97,(function(){return Ls(),null})))}function Is(){if(null===Jl)return!1;var e=Jl;if(Jl=null,48&Nl)throw Error(i(331));var t=Nl;Nl|=32;var n=ts;ts=[];for(var r=0;r<n.length;r+=2){var o=n[r],a=n[r+1],l=o.destroy;if(o.destroy=void 0,"function"==typeof l)try{l()}catch(e){if(null===a)throw Error(i(330));Fs(a,e)}}for(n=es,es=[],r=0;r<n.length;r+=2){o=n[r],a=n[r+1];try{var s=o.create;o.destroy=s()}catch(e){if(null===a)throw Error(i(330));Fs(a,e)}}for(s=e.current.firstEffect;null!==s;)e=s.nextEffect,s.nextEffect=null,8&s.flags&&(s.sibling=null,s.stateNode=null),s=e;return Nl=t,Xo(),!0}function Ds(e,t,n){da(e,t=cl(0,t=ll(n,t),1)),t=cs(),null!==(e=ps(e,1))&&($t(e,1,t),ms(e,t))}function Fs(e,t){if(3===e.tag)Ds(e,e,t);else for(var n=e.return;null!==n;){if(3===n.tag){Ds(n,e,t);break}if(1===n.tag){var r=n.stateNode;if("function"==typeof n.type.getDerivedStateFromError||"function"==typeof r.componentDidCatch&&(null===Yl||!Yl.has(r))){var o=dl(n,e=ll(t,e),1);if(da(n,o),o=cs(),null!==(n=ps(n,1)))$t(n,1,o),ms(n,o);else if("function"==typeof r.componentDidCatch&&(null===Yl||!Yl.has(r)))try{r.componentDidCatch(t,e)}catch(e){}break}}n=n.return}}function js(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),t=cs(),e.pingedLanes|=e.suspendedLanes&n,Ol===e&&(Ll&n)===n&&(4===Il||3===Il&&(62914560&Ll)===Ll&&500>Vo()-Vl?Es(e,0):Wl|=n),ms(e,t)}function Bs(e,t){var n=e.stateNode;null!==n&&n.delete(t),0==(t=0)&&(2&(t=e.mode)?4&t?(0===is&&(is=Fl),0===(t=Bt(62914560&~is))&&(t=4194304)):t=99===Ho()?1:2:t=1),n=cs(),null!==(e=ps(e,t))&&($t(e,t,n),ms(e,n))}function Ws(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.flags=0,this.lastEffect=this.firstEffect=this.nextEffect=null,this.childLanes=this.lanes=0,this.alternate=null}function $s(e,t,n,r){return new Ws(e,t,n,r)}function Vs(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Hs(e,t){var n=e.alternate;return null===n?((n=$s(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.nextEffect=null,n.firstEffect=null,n.lastEffect=null),n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Us(e,t,n,r,o,a){var l=2;if(r=e,"function"==typeof e)Vs(e)&&(l=1);else if("string"==typeof e)l=5;else e:switch(e){case S:return qs(n.children,o,a,t);case I:l=8,o|=16;break;case A:l=8,o|=1;break;case C:return(e=$s(12,n,t,8|o)).elementType=C,e.type=C,e.lanes=a,e;case N:return(e=$s(13,n,t,o)).type=N,e.elementType=N,e.lanes=a,e;case O:return(e=$s(19,n,t,o)).elementType=O,e.lanes=a,e;case D:return Ks(n,o,a,t);case F:return(e=$s(24,n,t,o)).elementType=F,e.lanes=a,e;default:if("object"==typeof e&&null!==e)switch(e.$$typeof){case R:l=10;break e;case P:l=9;break e;case T:l=11;break e;case M:l=14;break e;case L:l=16,r=null;break e;case z:l=22;break e}throw Error(i(130,null==e?e:typeof e,""))}return(t=$s(l,n,t,o)).elementType=e,t.type=r,t.lanes=a,t}function qs(e,t,n,r){return(e=$s(7,e,r,t)).lanes=n,e}function Ks(e,t,n,r){return(e=$s(23,e,r,t)).elementType=D,e.lanes=n,e}function Xs(e,t,n){return(e=$s(6,e,null,t)).lanes=n,e}function Qs(e,t,n){return(t=$s(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Ys(e,t,n){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.pendingContext=this.context=null,this.hydrate=n,this.callbackNode=null,this.callbackPriority=0,this.eventTimes=Wt(0),this.expirationTimes=Wt(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Wt(0),this.mutableSourceEagerHydrationData=null}function Gs(e,t,n,r){var o=t.current,a=cs(),l=ds(o);e:if(n){t:{if(Qe(n=n._reactInternals)!==n||1!==n.tag)throw Error(i(170));var s=n;do{switch(s.tag){case 3:s=s.stateNode.context;break t;case 1:if(go(s.type)){s=s.stateNode.__reactInternalMemoizedMergedChildContext;break t}}s=s.return}while(null!==s);throw Error(i(171))}if(1===n.tag){var u=n.type;if(go(u)){n=xo(n,u,s);break e}}n=s}else n=fo;return null===t.context?t.context=n:t.pendingContext=n,(t=ca(a,l)).payload={element:e},null!==(r=void 0===r?null:r)&&(t.callback=r),da(o,t),fs(o,l,a),l}function Js(e){return(e=e.current).child?(e.child.tag,e.child.stateNode):null}function Zs(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function eu(e,t){Zs(e,t),(e=e.alternate)&&Zs(e,t)}function tu(e,t,n){var r=null!=n&&null!=n.hydrationOptions&&n.hydrationOptions.mutableSources||null;if(n=new Ys(e,t,null!=n&&!0===n.hydrate),t=$s(3,null,null,2===t?7:1===t?3:0),n.current=t,t.stateNode=n,sa(t),e[Zr]=n.current,Or(8===e.nodeType?e.parentNode:e),r)for(e=0;e<r.length;e++){var o=(t=r[e])._getVersion;o=o(t._source),null==n.mutableSourceEagerHydrationData?n.mutableSourceEagerHydrationData=[t,o]:n.mutableSourceEagerHydrationData.push(t,o)}this._internalRoot=n}function nu(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function ru(e,t,n,r,o){var a=n._reactRootContainer;if(a){var i=a._internalRoot;if("function"==typeof o){var l=o;o=function(){var e=Js(i);l.call(e)}}Gs(t,i,e,o)}else{if(a=n._reactRootContainer=function(e,t){if(t||(t=!(!(t=e?9===e.nodeType?e.documentElement:e.firstChild:null)||1!==t.nodeType||!t.hasAttribute("data-reactroot"))),!t)for(var n;n=e.lastChild;)e.removeChild(n);return new tu(e,0,t?{hydrate:!0}:void 0)}(n,r),i=a._internalRoot,"function"==typeof o){var s=o;o=function(){var e=Js(i);s.call(e)}}bs((function(){Gs(t,i,e,o)}))}return Js(i)}function ou(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!nu(t))throw Error(i(200));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:k,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)}ql=function(e,t,n){var r=t.lanes;if(null!==e)if(e.memoizedProps!==t.pendingProps||mo.current)Ii=!0;else{if(!(n&r)){switch(Ii=!1,t.tag){case 3:qi(t),Ka();break;case 5:_a(t);break;case 1:go(t.type)&&wo(t);break;case 4:La(t,t.stateNode.containerInfo);break;case 10:r=t.memoizedProps.value;var o=t.type._context;co(Jo,o._currentValue),o._currentValue=r;break;case 13:if(null!==t.memoizedState)return n&t.child.childLanes?Ji(e,t,n):(co(Da,1&Da.current),null!==(t=rl(e,t,n))?t.sibling:null);co(Da,1&Da.current);break;case 19:if(r=!!(n&t.childLanes),64&e.flags){if(r)return nl(e,t,n);t.flags|=64}if(null!==(o=t.memoizedState)&&(o.rendering=null,o.tail=null,o.lastEffect=null),co(Da,Da.current),r)break;return null;case 23:case 24:return t.lanes=0,Wi(e,t,n)}return rl(e,t,n)}Ii=!!(16384&e.flags)}else Ii=!1;switch(t.lanes=0,t.tag){case 2:if(r=t.type,null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2),e=t.pendingProps,o=vo(t,po.current),aa(t,n),o=ii(null,t,r,e,o,n),t.flags|=1,"object"==typeof o&&null!==o&&"function"==typeof o.render&&void 0===o.$$typeof){if(t.tag=1,t.memoizedState=null,t.updateQueue=null,go(r)){var a=!0;wo(t)}else a=!1;t.memoizedState=null!==o.state&&void 0!==o.state?o.state:null,sa(t);var l=r.getDerivedStateFromProps;"function"==typeof l&&va(t,r,l,e),o.updater=ga,t.stateNode=o,o._reactInternals=t,wa(t,r,e,n),t=Ui(null,t,r,!0,a,n)}else t.tag=0,Di(null,t,o,n),t=t.child;return t;case 16:o=t.elementType;e:{switch(null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2),e=t.pendingProps,o=(a=o._init)(o._payload),t.type=o,a=t.tag=function(e){if("function"==typeof e)return Vs(e)?1:0;if(null!=e){if((e=e.$$typeof)===T)return 11;if(e===M)return 14}return 2}(o),e=Go(o,e),a){case 0:t=Vi(null,t,o,e,n);break e;case 1:t=Hi(null,t,o,e,n);break e;case 11:t=Fi(null,t,o,e,n);break e;case 14:t=ji(null,t,o,Go(o.type,e),r,n);break e}throw Error(i(306,o,""))}return t;case 0:return r=t.type,o=t.pendingProps,Vi(e,t,r,o=t.elementType===r?o:Go(r,o),n);case 1:return r=t.type,o=t.pendingProps,Hi(e,t,r,o=t.elementType===r?o:Go(r,o),n);case 3:if(qi(t),r=t.updateQueue,null===e||null===r)throw Error(i(282));if(r=t.pendingProps,o=null!==(o=t.memoizedState)?o.element:null,ua(e,t),pa(t,r,null,n),(r=t.memoizedState.element)===o)Ka(),t=rl(e,t,n);else{if((a=(o=t.stateNode).hydrate)&&(Ba=Kr(t.stateNode.containerInfo.firstChild),ja=t,a=Wa=!0),a){if(null!=(e=o.mutableSourceEagerHydrationData))for(o=0;o<e.length;o+=2)(a=e[o])._workInProgressVersionPrimary=e[o+1],Xa.push(a);for(n=Ra(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|1024,n=n.sibling}else Di(e,t,r,n),Ka();t=t.child}return t;case 5:return _a(t),null===e&&Ha(t),r=t.type,o=t.pendingProps,a=null!==e?e.memoizedProps:null,l=o.children,Vr(r,o)?l=null:null!==a&&Vr(r,a)&&(t.flags|=16),$i(e,t),Di(e,t,l,n),t.child;case 6:return null===e&&Ha(t),null;case 13:return Ji(e,t,n);case 4:return La(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=Ca(t,null,r,n):Di(e,t,r,n),t.child;case 11:return r=t.type,o=t.pendingProps,Fi(e,t,r,o=t.elementType===r?o:Go(r,o),n);case 7:return Di(e,t,t.pendingProps,n),t.child;case 8:case 12:return Di(e,t,t.pendingProps.children,n),t.child;case 10:e:{r=t.type._context,o=t.pendingProps,l=t.memoizedProps,a=o.value;var s=t.type._context;if(co(Jo,s._currentValue),s._currentValue=a,null!==l)if(s=l.value,0==(a=ur(s,a)?0:0|("function"==typeof r._calculateChangedBits?r._calculateChangedBits(s,a):1073741823))){if(l.children===o.children&&!mo.current){t=rl(e,t,n);break e}}else for(null!==(s=t.child)&&(s.return=t);null!==s;){var u=s.dependencies;if(null!==u){l=s.child;for(var c=u.firstContext;null!==c;){if(c.context===r&&c.observedBits&a){1===s.tag&&((c=ca(-1,n&-n)).tag=2,da(s,c)),s.lanes|=n,null!==(c=s.alternate)&&(c.lanes|=n),oa(s.return,n),u.lanes|=n;break}c=c.next}}else l=10===s.tag&&s.type===t.type?null:s.child;if(null!==l)l.return=s;else for(l=s;null!==l;){if(l===t){l=null;break}if(null!==(s=l.sibling)){s.return=l.return,l=s;break}l=l.return}s=l}Di(e,t,o.children,n),t=t.child}return t;case 9:return o=t.type,r=(a=t.pendingProps).children,aa(t,n),r=r(o=ia(o,a.unstable_observedBits)),t.flags|=1,Di(e,t,r,n),t.child;case 14:return a=Go(o=t.type,t.pendingProps),ji(e,t,o,a=Go(o.type,a),r,n);case 15:return Bi(e,t,t.type,t.pendingProps,r,n);case 17:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:Go(r,o),null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2),t.tag=1,go(r)?(e=!0,wo(t)):e=!1,aa(t,n),ba(t,r,o),wa(t,r,o,n),Ui(null,t,r,!0,e,n);case 19:return nl(e,t,n);case 23:case 24:return Wi(e,t,n)}throw Error(i(156,t.tag))},tu.prototype.render=function(e){Gs(e,this._internalRoot,null,null)},tu.prototype.unmount=function(){var e=this._internalRoot,t=e.containerInfo;Gs(null,e,null,(function(){t[Zr]=null}))},et=function(e){13===e.tag&&(fs(e,4,cs()),eu(e,4))},tt=function(e){13===e.tag&&(fs(e,67108864,cs()),eu(e,67108864))},nt=function(e){if(13===e.tag){var t=cs(),n=ds(e);fs(e,n,t),eu(e,n)}},rt=function(e,t){return t()},Ce=function(e,t,n){switch(t){case"input":if(ne(e,n),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var o=oo(r);if(!o)throw Error(i(90));G(r),ne(r,o)}}}break;case"textarea":ue(e,n);break;case"select":null!=(t=n.value)&&ie(e,!!n.multiple,t,!1)}},Me=ys,Le=function(e,t,n,r,o){var a=Nl;Nl|=4;try{return qo(98,e.bind(null,t,n,r,o))}finally{0===(Nl=a)&&(Ul(),Xo())}},ze=function(){!(49&Nl)&&(function(){if(null!==ns){var e=ns;ns=null,e.forEach((function(e){e.expiredLanes|=24&e.pendingLanes,ms(e,Vo())}))}Xo()}(),Ls())},_e=function(e,t){var n=Nl;Nl|=2;try{return e(t)}finally{0===(Nl=n)&&(Ul(),Xo())}};var au={Events:[no,ro,oo,Ne,Oe,Ls,{current:!1}]},iu={findFiberByHostInstance:to,bundleType:0,version:"17.0.2",rendererPackageName:"react-dom"},lu={bundleType:iu.bundleType,version:iu.version,rendererPackageName:iu.rendererPackageName,rendererConfig:iu.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:w.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=Je(e))?null:e.stateNode},findFiberByHostInstance:iu.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null};if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var su=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!su.isDisabled&&su.supportsFiber)try{ko=su.inject(lu),So=su}catch(he){}}t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=au,t.createPortal=ou,t.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var t=e._reactInternals;if(void 0===t){if("function"==typeof e.render)throw Error(i(188));throw Error(i(268,Object.keys(e)))}return null===(e=Je(t))?null:e.stateNode},t.flushSync=function(e,t){var n=Nl;if(48&n)return e(t);Nl|=1;try{if(e)return qo(99,e.bind(null,t))}finally{Nl=n,Xo()}},t.hydrate=function(e,t,n){if(!nu(t))throw Error(i(200));return ru(null,e,t,!0,n)},t.render=function(e,t,n){if(!nu(t))throw Error(i(200));return ru(null,e,t,!1,n)},t.unmountComponentAtNode=function(e){if(!nu(e))throw Error(i(40));return!!e._reactRootContainer&&(bs((function(){ru(null,null,e,!1,(function(){e._reactRootContainer=null,e[Zr]=null}))})),!0)},t.unstable_batchedUpdates=ys,t.unstable_createPortal=function(e,t){return ou(e,t,2<arguments.length&&void 0!==arguments[2]?arguments[2]:null)},t.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!nu(n))throw Error(i(200));if(null==e||void 0===e._reactInternals)throw Error(i(38));return ru(e,t,n,!1,r)},t.version="17.0.2"},2611:(e,t,n)=>{"use strict";n.d(t,{A:()=>rn});var r=n(45),o=n(8168),a=n(6540),i="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e};const l="object"===("undefined"==typeof window?"undefined":i(window))&&"object"===("undefined"==typeof document?"undefined":i(document))&&9===document.nodeType;var s=n(2901),u=n(5540),c=n(9417),d=n(8587),f={}.constructor;function p(e){if(null==e||"object"!=typeof e)return e;if(Array.isArray(e))return e.map(p);if(e.constructor!==f)return e;var t={};for(var n in e)t[n]=p(e[n]);return t}function m(e,t,n){void 0===e&&(e="unnamed");var r=n.jss,o=p(t);return r.plugins.onCreateRule(e,o,n)||(e[0],null)}var h=function(e,t){for(var n="",r=0;r<e.length&&"!important"!==e[r];r++)n&&(n+=t),n+=e[r];return n},v=function(e){if(!Array.isArray(e))return e;var t="";if(Array.isArray(e[0]))for(var n=0;n<e.length&&"!important"!==e[n];n++)t&&(t+=", "),t+=h(e[n]," ");else t=h(e,", ");return"!important"===e[e.length-1]&&(t+=" !important"),t};function g(e){return e&&!1===e.format?{linebreak:"",space:""}:{linebreak:"\n",space:" "}}function y(e,t){for(var n="",r=0;r<t;r++)n+="  ";return n+e}function b(e,t,n){void 0===n&&(n={});var r="";if(!t)return r;var o=n.indent,a=void 0===o?0:o,i=t.fallbacks;!1===n.format&&(a=-1/0);var l=g(n),s=l.linebreak,u=l.space;if(e&&a++,i)if(Array.isArray(i))for(var c=0;c<i.length;c++){var d=i[c];for(var f in d){var p=d[f];null!=p&&(r&&(r+=s),r+=y(f+":"+u+v(p)+";",a))}}else for(var m in i){var h=i[m];null!=h&&(r&&(r+=s),r+=y(m+":"+u+v(h)+";",a))}for(var b in t){var x=t[b];null!=x&&"fallbacks"!==b&&(r&&(r+=s),r+=y(b+":"+u+v(x)+";",a))}return(r||n.allowEmpty)&&e?(r&&(r=""+s+r+s),y(""+e+u+"{"+r,--a)+y("}",a)):r}var x=/([[\].#*$><+~=|^:(),"'`\s])/g,w="undefined"!=typeof CSS&&CSS.escape,E=function(e){return w?w(e):e.replace(x,"\\$1")},k=function(){function e(e,t,n){this.type="style",this.isProcessed=!1;var r=n.sheet,o=n.Renderer;this.key=e,this.options=n,this.style=t,r?this.renderer=r.renderer:o&&(this.renderer=new o)}return e.prototype.prop=function(e,t,n){if(void 0===t)return this.style[e];var r=!!n&&n.force;if(!r&&this.style[e]===t)return this;var o=t;n&&!1===n.process||(o=this.options.jss.plugins.onChangeValue(t,e,this));var a=null==o||!1===o,i=e in this.style;if(a&&!i&&!r)return this;var l=a&&i;if(l?delete this.style[e]:this.style[e]=o,this.renderable&&this.renderer)return l?this.renderer.removeProperty(this.renderable,e):this.renderer.setProperty(this.renderable,e,o),this;var s=this.options.sheet;return s&&s.attached,this},e}(),S=function(e){function t(t,n,r){var o;o=e.call(this,t,n,r)||this;var a=r.selector,i=r.scoped,l=r.sheet,s=r.generateId;return a?o.selectorText=a:!1!==i&&(o.id=s((0,c.A)((0,c.A)(o)),l),o.selectorText="."+E(o.id)),o}(0,u.A)(t,e);var n=t.prototype;return n.applyTo=function(e){var t=this.renderer;if(t){var n=this.toJSON();for(var r in n)t.setProperty(e,r,n[r])}return this},n.toJSON=function(){var e={};for(var t in this.style){var n=this.style[t];"object"!=typeof n?e[t]=n:Array.isArray(n)&&(e[t]=v(n))}return e},n.toString=function(e){var t=this.options.sheet,n=t&&t.options.link?(0,o.A)({},e,{allowEmpty:!0}):e;return b(this.selectorText,this.style,n)},(0,s.A)(t,[{key:"selector",set:function(e){if(e!==this.selectorText){this.selectorText=e;var t=this.renderer,n=this.renderable;n&&t&&(t.setSelector(n,e)||t.replaceRule(n,this))}},get:function(){return this.selectorText}}]),t}(k),A={onCreateRule:function(e,t,n){return"@"===e[0]||n.parent&&"keyframes"===n.parent.type?null:new S(e,t,n)}},C={indent:1,children:!0},R=/@([\w-]+)/,P=function(){function e(e,t,n){this.type="conditional",this.isProcessed=!1,this.key=e;var r=e.match(R);for(var a in this.at=r?r[1]:"unknown",this.query=n.name||"@"+this.at,this.options=n,this.rules=new J((0,o.A)({},n,{parent:this})),t)this.rules.add(a,t[a]);this.rules.process()}var t=e.prototype;return t.getRule=function(e){return this.rules.get(e)},t.indexOf=function(e){return this.rules.indexOf(e)},t.addRule=function(e,t,n){var r=this.rules.add(e,t,n);return r?(this.options.jss.plugins.onProcessRule(r),r):null},t.replaceRule=function(e,t,n){var r=this.rules.replace(e,t,n);return r&&this.options.jss.plugins.onProcessRule(r),r},t.toString=function(e){void 0===e&&(e=C);var t=g(e).linebreak;if(null==e.indent&&(e.indent=C.indent),null==e.children&&(e.children=C.children),!1===e.children)return this.query+" {}";var n=this.rules.toString(e);return n?this.query+" {"+t+n+t+"}":""},e}(),T=/@container|@media|@supports\s+/,N={onCreateRule:function(e,t,n){return T.test(e)?new P(e,t,n):null}},O={indent:1,children:!0},M=/@keyframes\s+([\w-]+)/,L=function(){function e(e,t,n){this.type="keyframes",this.at="@keyframes",this.isProcessed=!1;var r=e.match(M);r&&r[1]?this.name=r[1]:this.name="noname",this.key=this.type+"-"+this.name,this.options=n;var a=n.scoped,i=n.sheet,l=n.generateId;for(var s in this.id=!1===a?this.name:E(l(this,i)),this.rules=new J((0,o.A)({},n,{parent:this})),t)this.rules.add(s,t[s],(0,o.A)({},n,{parent:this}));this.rules.process()}return e.prototype.toString=function(e){void 0===e&&(e=O);var t=g(e).linebreak;if(null==e.indent&&(e.indent=O.indent),null==e.children&&(e.children=O.children),!1===e.children)return this.at+" "+this.id+" {}";var n=this.rules.toString(e);return n&&(n=""+t+n+t),this.at+" "+this.id+" {"+n+"}"},e}(),z=/@keyframes\s+/,_=/\$([\w-]+)/g,I=function(e,t){return"string"==typeof e?e.replace(_,(function(e,n){return n in t?t[n]:e})):e},D=function(e,t,n){var r=e[t],o=I(r,n);o!==r&&(e[t]=o)},F={onCreateRule:function(e,t,n){return"string"==typeof e&&z.test(e)?new L(e,t,n):null},onProcessStyle:function(e,t,n){return"style"===t.type&&n?("animation-name"in e&&D(e,"animation-name",n.keyframes),"animation"in e&&D(e,"animation",n.keyframes),e):e},onChangeValue:function(e,t,n){var r=n.options.sheet;if(!r)return e;switch(t){case"animation":case"animation-name":return I(e,r.keyframes);default:return e}}},j=function(e){function t(){return e.apply(this,arguments)||this}return(0,u.A)(t,e),t.prototype.toString=function(e){var t=this.options.sheet,n=t&&t.options.link?(0,o.A)({},e,{allowEmpty:!0}):e;return b(this.key,this.style,n)},t}(k),B={onCreateRule:function(e,t,n){return n.parent&&"keyframes"===n.parent.type?new j(e,t,n):null}},W=function(){function e(e,t,n){this.type="font-face",this.at="@font-face",this.isProcessed=!1,this.key=e,this.style=t,this.options=n}return e.prototype.toString=function(e){var t=g(e).linebreak;if(Array.isArray(this.style)){for(var n="",r=0;r<this.style.length;r++)n+=b(this.at,this.style[r]),this.style[r+1]&&(n+=t);return n}return b(this.at,this.style,e)},e}(),$=/@font-face/,V={onCreateRule:function(e,t,n){return $.test(e)?new W(e,t,n):null}},H=function(){function e(e,t,n){this.type="viewport",this.at="@viewport",this.isProcessed=!1,this.key=e,this.style=t,this.options=n}return e.prototype.toString=function(e){return b(this.key,this.style,e)},e}(),U={onCreateRule:function(e,t,n){return"@viewport"===e||"@-ms-viewport"===e?new H(e,t,n):null}},q=function(){function e(e,t,n){this.type="simple",this.isProcessed=!1,this.key=e,this.value=t,this.options=n}return e.prototype.toString=function(e){if(Array.isArray(this.value)){for(var t="",n=0;n<this.value.length;n++)t+=this.key+" "+this.value[n]+";",this.value[n+1]&&(t+="\n");return t}return this.key+" "+this.value+";"},e}(),K={"@charset":!0,"@import":!0,"@namespace":!0},X={onCreateRule:function(e,t,n){return e in K?new q(e,t,n):null}},Q=[A,N,F,B,V,U,X],Y={process:!0},G={force:!0,process:!0},J=function(){function e(e){this.map={},this.raw={},this.index=[],this.counter=0,this.options=e,this.classes=e.classes,this.keyframes=e.keyframes}var t=e.prototype;return t.add=function(e,t,n){var r=this.options,a=r.parent,i=r.sheet,l=r.jss,s=r.Renderer,u=r.generateId,c=r.scoped,d=(0,o.A)({classes:this.classes,parent:a,sheet:i,jss:l,Renderer:s,generateId:u,scoped:c,name:e,keyframes:this.keyframes,selector:void 0},n),f=e;e in this.raw&&(f=e+"-d"+this.counter++),this.raw[f]=t,f in this.classes&&(d.selector="."+E(this.classes[f]));var p=m(f,t,d);if(!p)return null;this.register(p);var h=void 0===d.index?this.index.length:d.index;return this.index.splice(h,0,p),p},t.replace=function(e,t,n){var r=this.get(e),a=this.index.indexOf(r);r&&this.remove(r);var i=n;return-1!==a&&(i=(0,o.A)({},n,{index:a})),this.add(e,t,i)},t.get=function(e){return this.map[e]},t.remove=function(e){this.unregister(e),delete this.raw[e.key],this.index.splice(this.index.indexOf(e),1)},t.indexOf=function(e){return this.index.indexOf(e)},t.process=function(){var e=this.options.jss.plugins;this.index.slice(0).forEach(e.onProcessRule,e)},t.register=function(e){this.map[e.key]=e,e instanceof S?(this.map[e.selector]=e,e.id&&(this.classes[e.key]=e.id)):e instanceof L&&this.keyframes&&(this.keyframes[e.name]=e.id)},t.unregister=function(e){delete this.map[e.key],e instanceof S?(delete this.map[e.selector],delete this.classes[e.key]):e instanceof L&&delete this.keyframes[e.name]},t.update=function(){var e,t,n;if("string"==typeof(arguments.length<=0?void 0:arguments[0])?(e=arguments.length<=0?void 0:arguments[0],t=arguments.length<=1?void 0:arguments[1],n=arguments.length<=2?void 0:arguments[2]):(t=arguments.length<=0?void 0:arguments[0],n=arguments.length<=1?void 0:arguments[1],e=null),e)this.updateOne(this.get(e),t,n);else for(var r=0;r<this.index.length;r++)this.updateOne(this.index[r],t,n)},t.updateOne=function(t,n,r){void 0===r&&(r=Y);var o=this.options,a=o.jss.plugins,i=o.sheet;if(t.rules instanceof e)t.rules.update(n,r);else{var l=t.style;if(a.onUpdate(n,t,i,r),r.process&&l&&l!==t.style){for(var s in a.onProcessStyle(t.style,t,i),t.style){var u=t.style[s];u!==l[s]&&t.prop(s,u,G)}for(var c in l){var d=t.style[c],f=l[c];null==d&&d!==f&&t.prop(c,null,G)}}}},t.toString=function(e){for(var t="",n=this.options.sheet,r=!!n&&n.options.link,o=g(e).linebreak,a=0;a<this.index.length;a++){var i=this.index[a].toString(e);(i||r)&&(t&&(t+=o),t+=i)}return t},e}(),Z=function(){function e(e,t){for(var n in this.attached=!1,this.deployed=!1,this.classes={},this.keyframes={},this.options=(0,o.A)({},t,{sheet:this,parent:this,classes:this.classes,keyframes:this.keyframes}),t.Renderer&&(this.renderer=new t.Renderer(this)),this.rules=new J(this.options),e)this.rules.add(n,e[n]);this.rules.process()}var t=e.prototype;return t.attach=function(){return this.attached||(this.renderer&&this.renderer.attach(),this.attached=!0,this.deployed||this.deploy()),this},t.detach=function(){return this.attached?(this.renderer&&this.renderer.detach(),this.attached=!1,this):this},t.addRule=function(e,t,n){var r=this.queue;this.attached&&!r&&(this.queue=[]);var o=this.rules.add(e,t,n);return o?(this.options.jss.plugins.onProcessRule(o),this.attached?this.deployed?(r?r.push(o):(this.insertRule(o),this.queue&&(this.queue.forEach(this.insertRule,this),this.queue=void 0)),o):o:(this.deployed=!1,o)):null},t.replaceRule=function(e,t,n){var r=this.rules.get(e);if(!r)return this.addRule(e,t,n);var o=this.rules.replace(e,t,n);return o&&this.options.jss.plugins.onProcessRule(o),this.attached?this.deployed?(this.renderer&&(o?r.renderable&&this.renderer.replaceRule(r.renderable,o):this.renderer.deleteRule(r)),o):o:(this.deployed=!1,o)},t.insertRule=function(e){this.renderer&&this.renderer.insertRule(e)},t.addRules=function(e,t){var n=[];for(var r in e){var o=this.addRule(r,e[r],t);o&&n.push(o)}return n},t.getRule=function(e){return this.rules.get(e)},t.deleteRule=function(e){var t="object"==typeof e?e:this.rules.get(e);return!(!t||this.attached&&!t.renderable)&&(this.rules.remove(t),!(this.attached&&t.renderable&&this.renderer)||this.renderer.deleteRule(t.renderable))},t.indexOf=function(e){return this.rules.indexOf(e)},t.deploy=function(){return this.renderer&&this.renderer.deploy(),this.deployed=!0,this},t.update=function(){var e;return(e=this.rules).update.apply(e,arguments),this},t.updateOne=function(e,t,n){return this.rules.updateOne(e,t,n),this},t.toString=function(e){return this.rules.toString(e)},e}(),ee=function(){function e(){this.plugins={internal:[],external:[]},this.registry={}}var t=e.prototype;return t.onCreateRule=function(e,t,n){for(var r=0;r<this.registry.onCreateRule.length;r++){var o=this.registry.onCreateRule[r](e,t,n);if(o)return o}return null},t.onProcessRule=function(e){if(!e.isProcessed){for(var t=e.options.sheet,n=0;n<this.registry.onProcessRule.length;n++)this.registry.onProcessRule[n](e,t);e.style&&this.onProcessStyle(e.style,e,t),e.isProcessed=!0}},t.onProcessStyle=function(e,t,n){for(var r=0;r<this.registry.onProcessStyle.length;r++)t.style=this.registry.onProcessStyle[r](t.style,t,n)},t.onProcessSheet=function(e){for(var t=0;t<this.registry.onProcessSheet.length;t++)this.registry.onProcessSheet[t](e)},t.onUpdate=function(e,t,n,r){for(var o=0;o<this.registry.onUpdate.length;o++)this.registry.onUpdate[o](e,t,n,r)},t.onChangeValue=function(e,t,n){for(var r=e,o=0;o<this.registry.onChangeValue.length;o++)r=this.registry.onChangeValue[o](r,t,n);return r},t.use=function(e,t){void 0===t&&(t={queue:"external"});var n=this.plugins[t.queue];-1===n.indexOf(e)&&(n.push(e),this.registry=[].concat(this.plugins.external,this.plugins.internal).reduce((function(e,t){for(var n in t)n in e&&e[n].push(t[n]);return e}),{onCreateRule:[],onProcessRule:[],onProcessStyle:[],onProcessSheet:[],onChangeValue:[],onUpdate:[]}))},e}(),te=function(){function e(){this.registry=[]}var t=e.prototype;return t.add=function(e){var t=this.registry,n=e.options.index;if(-1===t.indexOf(e))if(0===t.length||n>=this.index)t.push(e);else for(var r=0;r<t.length;r++)if(t[r].options.index>n)return void t.splice(r,0,e)},t.reset=function(){this.registry=[]},t.remove=function(e){var t=this.registry.indexOf(e);this.registry.splice(t,1)},t.toString=function(e){for(var t=void 0===e?{}:e,n=t.attached,r=(0,d.A)(t,["attached"]),o=g(r).linebreak,a="",i=0;i<this.registry.length;i++){var l=this.registry[i];null!=n&&l.attached!==n||(a&&(a+=o),a+=l.toString(r))}return a},(0,s.A)(e,[{key:"index",get:function(){return 0===this.registry.length?0:this.registry[this.registry.length-1].options.index}}]),e}(),ne=new te,re="undefined"!=typeof globalThis?globalThis:"undefined"!=typeof window&&window.Math===Math?window:"undefined"!=typeof self&&self.Math===Math?self:Function("return this")(),oe="2f1acc6c3a606b082e5eef5e54414ffb";null==re[oe]&&(re[oe]=0);var ae=re[oe]++,ie=function(e){void 0===e&&(e={});var t=0;return function(n,r){t+=1;var o="",a="";return r&&(r.options.classNamePrefix&&(a=r.options.classNamePrefix),null!=r.options.jss.id&&(o=String(r.options.jss.id))),e.minify?""+(a||"c")+ae+o+t:a+n.key+"-"+ae+(o?"-"+o:"")+"-"+t}},le=function(e){var t;return function(){return t||(t=e()),t}},se=function(e,t){try{return e.attributeStyleMap?e.attributeStyleMap.get(t):e.style.getPropertyValue(t)}catch(e){return""}},ue=function(e,t,n){try{var r=n;if(Array.isArray(n)&&(r=v(n)),e.attributeStyleMap)e.attributeStyleMap.set(t,r);else{var o=r?r.indexOf("!important"):-1,a=o>-1?r.substr(0,o-1):r;e.style.setProperty(t,a,o>-1?"important":"")}}catch(e){return!1}return!0},ce=function(e,t){try{e.attributeStyleMap?e.attributeStyleMap.delete(t):e.style.removeProperty(t)}catch(e){}},de=function(e,t){return e.selectorText=t,e.selectorText===t},fe=le((function(){return document.querySelector("head")}));var pe=le((function(){var e=document.querySelector('meta[property="csp-nonce"]');return e?e.getAttribute("content"):null})),me=function(e,t,n){try{"insertRule"in e?e.insertRule(t,n):"appendRule"in e&&e.appendRule(t)}catch(e){return!1}return e.cssRules[n]},he=function(e,t){var n=e.cssRules.length;return void 0===t||t>n?n:t},ve=function(){function e(e){this.getPropertyValue=se,this.setProperty=ue,this.removeProperty=ce,this.setSelector=de,this.hasInsertedRules=!1,this.cssRules=[],e&&ne.add(e),this.sheet=e;var t=this.sheet?this.sheet.options:{},n=t.media,r=t.meta,o=t.element;this.element=o||function(){var e=document.createElement("style");return e.textContent="\n",e}(),this.element.setAttribute("data-jss",""),n&&this.element.setAttribute("media",n),r&&this.element.setAttribute("data-meta",r);var a=pe();a&&this.element.setAttribute("nonce",a)}var t=e.prototype;return t.attach=function(){if(!this.element.parentNode&&this.sheet){!function(e,t){var n=t.insertionPoint,r=function(e){var t=ne.registry;if(t.length>0){var n=function(e,t){for(var n=0;n<e.length;n++){var r=e[n];if(r.attached&&r.options.index>t.index&&r.options.insertionPoint===t.insertionPoint)return r}return null}(t,e);if(n&&n.renderer)return{parent:n.renderer.element.parentNode,node:n.renderer.element};if(n=function(e,t){for(var n=e.length-1;n>=0;n--){var r=e[n];if(r.attached&&r.options.insertionPoint===t.insertionPoint)return r}return null}(t,e),n&&n.renderer)return{parent:n.renderer.element.parentNode,node:n.renderer.element.nextSibling}}var r=e.insertionPoint;if(r&&"string"==typeof r){var o=function(e){for(var t=fe(),n=0;n<t.childNodes.length;n++){var r=t.childNodes[n];if(8===r.nodeType&&r.nodeValue.trim()===e)return r}return null}(r);if(o)return{parent:o.parentNode,node:o.nextSibling}}return!1}(t);if(!1!==r&&r.parent)r.parent.insertBefore(e,r.node);else if(n&&"number"==typeof n.nodeType){var o=n,a=o.parentNode;a&&a.insertBefore(e,o.nextSibling)}else fe().appendChild(e)}(this.element,this.sheet.options);var e=Boolean(this.sheet&&this.sheet.deployed);this.hasInsertedRules&&e&&(this.hasInsertedRules=!1,this.deploy())}},t.detach=function(){if(this.sheet){var e=this.element.parentNode;e&&e.removeChild(this.element),this.sheet.options.link&&(this.cssRules=[],this.element.textContent="\n")}},t.deploy=function(){var e=this.sheet;e&&(e.options.link?this.insertRules(e.rules):this.element.textContent="\n"+e.toString()+"\n")},t.insertRules=function(e,t){for(var n=0;n<e.index.length;n++)this.insertRule(e.index[n],n,t)},t.insertRule=function(e,t,n){if(void 0===n&&(n=this.element.sheet),e.rules){var r=e,o=n;if("conditional"===e.type||"keyframes"===e.type){var a=he(n,t);if(!1===(o=me(n,r.toString({children:!1}),a)))return!1;this.refCssRule(e,a,o)}return this.insertRules(r.rules,o),o}var i=e.toString();if(!i)return!1;var l=he(n,t),s=me(n,i,l);return!1!==s&&(this.hasInsertedRules=!0,this.refCssRule(e,l,s),s)},t.refCssRule=function(e,t,n){e.renderable=n,e.options.parent instanceof Z&&this.cssRules.splice(t,0,n)},t.deleteRule=function(e){var t=this.element.sheet,n=this.indexOf(e);return-1!==n&&(t.deleteRule(n),this.cssRules.splice(n,1),!0)},t.indexOf=function(e){return this.cssRules.indexOf(e)},t.replaceRule=function(e,t){var n=this.indexOf(e);return-1!==n&&(this.element.sheet.deleteRule(n),this.cssRules.splice(n,1),this.insertRule(t,n))},t.getRules=function(){return this.element.sheet.cssRules},e}(),ge=0,ye=function(){function e(e){this.id=ge++,this.version="10.10.0",this.plugins=new ee,this.options={id:{minify:!1},createGenerateId:ie,Renderer:l?ve:null,plugins:[]},this.generateId=ie({minify:!1});for(var t=0;t<Q.length;t++)this.plugins.use(Q[t],{queue:"internal"});this.setup(e)}var t=e.prototype;return t.setup=function(e){return void 0===e&&(e={}),e.createGenerateId&&(this.options.createGenerateId=e.createGenerateId),e.id&&(this.options.id=(0,o.A)({},this.options.id,e.id)),(e.createGenerateId||e.id)&&(this.generateId=this.options.createGenerateId(this.options.id)),null!=e.insertionPoint&&(this.options.insertionPoint=e.insertionPoint),"Renderer"in e&&(this.options.Renderer=e.Renderer),e.plugins&&this.use.apply(this,e.plugins),this},t.createStyleSheet=function(e,t){void 0===t&&(t={});var n=t.index;"number"!=typeof n&&(n=0===ne.index?0:ne.index+1);var r=new Z(e,(0,o.A)({},t,{jss:this,generateId:t.generateId||this.generateId,insertionPoint:this.options.insertionPoint,Renderer:this.options.Renderer,index:n}));return this.plugins.onProcessSheet(r),r},t.removeStyleSheet=function(e){return e.detach(),ne.remove(e),this},t.createRule=function(e,t,n){if(void 0===t&&(t={}),void 0===n&&(n={}),"object"==typeof e)return this.createRule(void 0,e,t);var r=(0,o.A)({},n,{name:e,jss:this,Renderer:this.options.Renderer});r.generateId||(r.generateId=this.generateId),r.classes||(r.classes={}),r.keyframes||(r.keyframes={});var a=m(e,t,r);return a&&this.plugins.onProcessRule(a),a},t.use=function(){for(var e=this,t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];return n.forEach((function(t){e.plugins.use(t)})),this},e}(),be=function(e){return new ye(e)},xe="object"==typeof CSS&&null!=CSS&&"number"in CSS;function we(e){var t=null;for(var n in e){var r=e[n],o=typeof r;if("function"===o)t||(t={}),t[n]=r;else if("object"===o&&null!==r&&!Array.isArray(r)){var a=we(r);a&&(t||(t={}),t[n]=a)}}return t}be();var Ee=n(3043),ke={set:function(e,t,n,r){var o=e.get(t);o||(o=new Map,e.set(t,o)),o.set(n,r)},get:function(e,t,n){var r=e.get(t);return r?r.get(n):void 0},delete:function(e,t,n){e.get(t).delete(n)}};const Se=ke;var Ae=n(6061);const Ce="function"==typeof Symbol&&Symbol.for?Symbol.for("mui.nested"):"__THEME_NESTED__";var Re=["checked","disabled","error","focused","focusVisible","required","expanded","selected"],Pe=Date.now(),Te="fnValues"+Pe,Ne="fnStyle"+ ++Pe;var Oe="@global",Me=function(){function e(e,t,n){for(var r in this.type="global",this.at=Oe,this.isProcessed=!1,this.key=e,this.options=n,this.rules=new J((0,o.A)({},n,{parent:this})),t)this.rules.add(r,t[r]);this.rules.process()}var t=e.prototype;return t.getRule=function(e){return this.rules.get(e)},t.addRule=function(e,t,n){var r=this.rules.add(e,t,n);return r&&this.options.jss.plugins.onProcessRule(r),r},t.replaceRule=function(e,t,n){var r=this.rules.replace(e,t,n);return r&&this.options.jss.plugins.onProcessRule(r),r},t.indexOf=function(e){return this.rules.indexOf(e)},t.toString=function(e){return this.rules.toString(e)},e}(),Le=function(){function e(e,t,n){this.type="global",this.at=Oe,this.isProcessed=!1,this.key=e,this.options=n;var r=e.substr(8);this.rule=n.jss.createRule(r,t,(0,o.A)({},n,{parent:this}))}return e.prototype.toString=function(e){return this.rule?this.rule.toString(e):""},e}(),ze=/\s*,\s*/g;function _e(e,t){for(var n=e.split(ze),r="",o=0;o<n.length;o++)r+=t+" "+n[o].trim(),n[o+1]&&(r+=", ");return r}var Ie=/\s*,\s*/g,De=/&/g,Fe=/\$([\w-]+)/g;var je=/[A-Z]/g,Be=/^ms-/,We={};function $e(e){return"-"+e.toLowerCase()}const Ve=function(e){if(We.hasOwnProperty(e))return We[e];var t=e.replace(je,$e);return We[e]=Be.test(t)?"-"+t:t};function He(e){var t={};for(var n in e)t[0===n.indexOf("--")?n:Ve(n)]=e[n];return e.fallbacks&&(Array.isArray(e.fallbacks)?t.fallbacks=e.fallbacks.map(He):t.fallbacks=He(e.fallbacks)),t}var Ue=xe&&CSS?CSS.px:"px",qe=xe&&CSS?CSS.ms:"ms",Ke=xe&&CSS?CSS.percent:"%";function Xe(e){var t=/(-[a-z])/g,n=function(e){return e[1].toUpperCase()},r={};for(var o in e)r[o]=e[o],r[o.replace(t,n)]=e[o];return r}var Qe=Xe({"animation-delay":qe,"animation-duration":qe,"background-position":Ue,"background-position-x":Ue,"background-position-y":Ue,"background-size":Ue,border:Ue,"border-bottom":Ue,"border-bottom-left-radius":Ue,"border-bottom-right-radius":Ue,"border-bottom-width":Ue,"border-left":Ue,"border-left-width":Ue,"border-radius":Ue,"border-right":Ue,"border-right-width":Ue,"border-top":Ue,"border-top-left-radius":Ue,"border-top-right-radius":Ue,"border-top-width":Ue,"border-width":Ue,"border-block":Ue,"border-block-end":Ue,"border-block-end-width":Ue,"border-block-start":Ue,"border-block-start-width":Ue,"border-block-width":Ue,"border-inline":Ue,"border-inline-end":Ue,"border-inline-end-width":Ue,"border-inline-start":Ue,"border-inline-start-width":Ue,"border-inline-width":Ue,"border-start-start-radius":Ue,"border-start-end-radius":Ue,"border-end-start-radius":Ue,"border-end-end-radius":Ue,margin:Ue,"margin-bottom":Ue,"margin-left":Ue,"margin-right":Ue,"margin-top":Ue,"margin-block":Ue,"margin-block-end":Ue,"margin-block-start":Ue,"margin-inline":Ue,"margin-inline-end":Ue,"margin-inline-start":Ue,padding:Ue,"padding-bottom":Ue,"padding-left":Ue,"padding-right":Ue,"padding-top":Ue,"padding-block":Ue,"padding-block-end":Ue,"padding-block-start":Ue,"padding-inline":Ue,"padding-inline-end":Ue,"padding-inline-start":Ue,"mask-position-x":Ue,"mask-position-y":Ue,"mask-size":Ue,height:Ue,width:Ue,"min-height":Ue,"max-height":Ue,"min-width":Ue,"max-width":Ue,bottom:Ue,left:Ue,top:Ue,right:Ue,inset:Ue,"inset-block":Ue,"inset-block-end":Ue,"inset-block-start":Ue,"inset-inline":Ue,"inset-inline-end":Ue,"inset-inline-start":Ue,"box-shadow":Ue,"text-shadow":Ue,"column-gap":Ue,"column-rule":Ue,"column-rule-width":Ue,"column-width":Ue,"font-size":Ue,"font-size-delta":Ue,"letter-spacing":Ue,"text-decoration-thickness":Ue,"text-indent":Ue,"text-stroke":Ue,"text-stroke-width":Ue,"word-spacing":Ue,motion:Ue,"motion-offset":Ue,outline:Ue,"outline-offset":Ue,"outline-width":Ue,perspective:Ue,"perspective-origin-x":Ke,"perspective-origin-y":Ke,"transform-origin":Ke,"transform-origin-x":Ke,"transform-origin-y":Ke,"transform-origin-z":Ke,"transition-delay":qe,"transition-duration":qe,"vertical-align":Ue,"flex-basis":Ue,"shape-margin":Ue,size:Ue,gap:Ue,grid:Ue,"grid-gap":Ue,"row-gap":Ue,"grid-row-gap":Ue,"grid-column-gap":Ue,"grid-template-rows":Ue,"grid-template-columns":Ue,"grid-auto-rows":Ue,"grid-auto-columns":Ue,"box-shadow-x":Ue,"box-shadow-y":Ue,"box-shadow-blur":Ue,"box-shadow-spread":Ue,"font-line-height":Ue,"text-shadow-x":Ue,"text-shadow-y":Ue,"text-shadow-blur":Ue});function Ye(e,t,n){if(null==t)return t;if(Array.isArray(t))for(var r=0;r<t.length;r++)t[r]=Ye(e,t[r],n);else if("object"==typeof t)if("fallbacks"===e)for(var o in t)t[o]=Ye(o,t[o],n);else for(var a in t)t[a]=Ye(e+"-"+a,t[a],n);else if("number"==typeof t&&!1===isNaN(t)){var i=n[e]||Qe[e];return!i||0===t&&i===Ue?t.toString():"function"==typeof i?i(t).toString():""+t+i}return t}var Ge=n(5458),Je="",Ze="",et="",tt="",nt=l&&"ontouchstart"in document.documentElement;if(l){var rt={Moz:"-moz-",ms:"-ms-",O:"-o-",Webkit:"-webkit-"},ot=document.createElement("p").style;for(var at in rt)if(at+"Transform"in ot){Je=at,Ze=rt[at];break}"Webkit"===Je&&"msHyphens"in ot&&(Je="ms",Ze=rt.ms,tt="edge"),"Webkit"===Je&&"-apple-trailing-word"in ot&&(et="apple")}var it=Je,lt=Ze,st=et,ut=tt,ct=nt,dt={noPrefill:["appearance"],supportedProperty:function(e){return"appearance"===e&&("ms"===it?"-webkit-"+e:lt+e)}},ft={noPrefill:["color-adjust"],supportedProperty:function(e){return"color-adjust"===e&&("Webkit"===it?lt+"print-"+e:e)}},pt=/[-\s]+(.)?/g;function mt(e,t){return t?t.toUpperCase():""}function ht(e){return e.replace(pt,mt)}function vt(e){return ht("-"+e)}var gt,yt={noPrefill:["mask"],supportedProperty:function(e,t){if(!/^mask/.test(e))return!1;if("Webkit"===it){var n="mask-image";if(ht(n)in t)return e;if(it+vt(n)in t)return lt+e}return e}},bt={noPrefill:["text-orientation"],supportedProperty:function(e){return"text-orientation"===e&&("apple"!==st||ct?e:lt+e)}},xt={noPrefill:["transform"],supportedProperty:function(e,t,n){return"transform"===e&&(n.transform?e:lt+e)}},wt={noPrefill:["transition"],supportedProperty:function(e,t,n){return"transition"===e&&(n.transition?e:lt+e)}},Et={noPrefill:["writing-mode"],supportedProperty:function(e){return"writing-mode"===e&&("Webkit"===it||"ms"===it&&"edge"!==ut?lt+e:e)}},kt={noPrefill:["user-select"],supportedProperty:function(e){return"user-select"===e&&("Moz"===it||"ms"===it||"apple"===st?lt+e:e)}},St={supportedProperty:function(e,t){return!!/^break-/.test(e)&&("Webkit"===it?"WebkitColumn"+vt(e)in t&&lt+"column-"+e:"Moz"===it&&"page"+vt(e)in t&&"page-"+e)}},At={supportedProperty:function(e,t){if(!/^(border|margin|padding)-inline/.test(e))return!1;if("Moz"===it)return e;var n=e.replace("-inline","");return it+vt(n)in t&&lt+n}},Ct={supportedProperty:function(e,t){return ht(e)in t&&e}},Rt={supportedProperty:function(e,t){var n=vt(e);return"-"===e[0]||"-"===e[0]&&"-"===e[1]?e:it+n in t?lt+e:"Webkit"!==it&&"Webkit"+n in t&&"-webkit-"+e}},Pt={supportedProperty:function(e){return"scroll-snap"===e.substring(0,11)&&("ms"===it?""+lt+e:e)}},Tt={supportedProperty:function(e){return"overscroll-behavior"===e&&("ms"===it?lt+"scroll-chaining":e)}},Nt={"flex-grow":"flex-positive","flex-shrink":"flex-negative","flex-basis":"flex-preferred-size","justify-content":"flex-pack",order:"flex-order","align-items":"flex-align","align-content":"flex-line-pack"},Ot={supportedProperty:function(e,t){var n=Nt[e];return!!n&&it+vt(n)in t&&lt+n}},Mt={flex:"box-flex","flex-grow":"box-flex","flex-direction":["box-orient","box-direction"],order:"box-ordinal-group","align-items":"box-align","flex-flow":["box-orient","box-direction"],"justify-content":"box-pack"},Lt=Object.keys(Mt),zt=function(e){return lt+e},_t={supportedProperty:function(e,t,n){var r=n.multiple;if(Lt.indexOf(e)>-1){var o=Mt[e];if(!Array.isArray(o))return it+vt(o)in t&&lt+o;if(!r)return!1;for(var a=0;a<o.length;a++)if(!(it+vt(o[0])in t))return!1;return o.map(zt)}return!1}},It=[dt,ft,yt,bt,xt,wt,Et,kt,St,At,Ct,Rt,Pt,Tt,Ot,_t],Dt=It.filter((function(e){return e.supportedProperty})).map((function(e){return e.supportedProperty})),Ft=It.filter((function(e){return e.noPrefill})).reduce((function(e,t){return e.push.apply(e,(0,Ge.A)(t.noPrefill)),e}),[]),jt={};if(l){gt=document.createElement("p");var Bt=window.getComputedStyle(document.documentElement,"");for(var Wt in Bt)isNaN(Wt)||(jt[Bt[Wt]]=Bt[Wt]);Ft.forEach((function(e){return delete jt[e]}))}function $t(e,t){if(void 0===t&&(t={}),!gt)return e;if(null!=jt[e])return jt[e];"transition"!==e&&"transform"!==e||(t[e]=e in gt.style);for(var n=0;n<Dt.length&&(jt[e]=Dt[n](e,gt.style,t),!jt[e]);n++);try{gt.style[e]=""}catch(e){return!1}return jt[e]}var Vt,Ht={},Ut={transition:1,"transition-property":1,"-webkit-transition":1,"-webkit-transition-property":1},qt=/(^\s*[\w-]+)|, (\s*[\w-]+)(?![^()]*\))/g;function Kt(e,t,n){return"var"===t?"var":"all"===t?"all":"all"===n?", all":(t?$t(t):", "+$t(n))||t||n}function Xt(e,t){var n=t;if(!Vt||"content"===e)return t;if("string"!=typeof n||!isNaN(parseInt(n,10)))return n;var r=e+n;if(null!=Ht[r])return Ht[r];try{Vt.style[e]=n}catch(e){return Ht[r]=!1,!1}if(Ut[e])n=n.replace(qt,Kt);else if(""===Vt.style[e]&&("-ms-flex"===(n=lt+n)&&(Vt.style[e]="-ms-flexbox"),Vt.style[e]=n,""===Vt.style[e]))return Ht[r]=!1,!1;return Vt.style[e]="",Ht[r]=n,Ht[r]}l&&(Vt=document.createElement("p"));var Qt,Yt=be({plugins:[{onCreateRule:function(e,t,n){if("function"!=typeof t)return null;var r=m(e,{},n);return r[Ne]=t,r},onProcessStyle:function(e,t){if(Te in t||Ne in t)return e;var n={};for(var r in e){var o=e[r];"function"==typeof o&&(delete e[r],n[r]=o)}return t[Te]=n,e},onUpdate:function(e,t,n,r){var o=t,a=o[Ne];a&&(o.style=a(e)||{});var i=o[Te];if(i)for(var l in i)o.prop(l,i[l](e),r)}},{onCreateRule:function(e,t,n){if(!e)return null;if(e===Oe)return new Me(e,t,n);if("@"===e[0]&&"@global "===e.substr(0,8))return new Le(e,t,n);var r=n.parent;return r&&("global"===r.type||r.options.parent&&"global"===r.options.parent.type)&&(n.scoped=!1),n.selector||!1!==n.scoped||(n.selector=e),null},onProcessRule:function(e,t){"style"===e.type&&t&&(function(e,t){var n=e.options,r=e.style,a=r?r[Oe]:null;if(a){for(var i in a)t.addRule(i,a[i],(0,o.A)({},n,{selector:_e(i,e.selector)}));delete r[Oe]}}(e,t),function(e,t){var n=e.options,r=e.style;for(var a in r)if("@"===a[0]&&a.substr(0,7)===Oe){var i=_e(a.substr(7),e.selector);t.addRule(i,r[a],(0,o.A)({},n,{selector:i})),delete r[a]}}(e,t))}},function(){function e(e,t){return function(n,r){var o=e.getRule(r)||t&&t.getRule(r);return o?o.selector:r}}function t(e,t){for(var n=t.split(Ie),r=e.split(Ie),o="",a=0;a<n.length;a++)for(var i=n[a],l=0;l<r.length;l++){var s=r[l];o&&(o+=", "),o+=-1!==s.indexOf("&")?s.replace(De,i):i+" "+s}return o}function n(e,t,n){if(n)return(0,o.A)({},n,{index:n.index+1});var r=e.options.nestingLevel;r=void 0===r?1:r+1;var a=(0,o.A)({},e.options,{nestingLevel:r,index:t.indexOf(e)+1});return delete a.name,a}return{onProcessStyle:function(r,a,i){if("style"!==a.type)return r;var l,s,u=a,c=u.options.parent;for(var d in r){var f=-1!==d.indexOf("&"),p="@"===d[0];if(f||p){if(l=n(u,c,l),f){var m=t(d,u.selector);s||(s=e(c,i)),m=m.replace(Fe,s);var h=u.key+"-"+d;"replaceRule"in c?c.replaceRule(h,r[d],(0,o.A)({},l,{selector:m})):c.addRule(h,r[d],(0,o.A)({},l,{selector:m}))}else p&&c.addRule(d,{},l).addRule(u.key,r[d],{selector:u.selector});delete r[d]}}return r}}}(),{onProcessStyle:function(e){if(Array.isArray(e)){for(var t=0;t<e.length;t++)e[t]=He(e[t]);return e}return He(e)},onChangeValue:function(e,t,n){if(0===t.indexOf("--"))return e;var r=Ve(t);return t===r?e:(n.prop(r,e),null)}},function(e){void 0===e&&(e={});var t=Xe(e);return{onProcessStyle:function(e,n){if("style"!==n.type)return e;for(var r in e)e[r]=Ye(r,e[r],t);return e},onChangeValue:function(e,n){return Ye(n,e,t)}}}(),"undefined"==typeof window?null:function(){function e(t){for(var n in t){var r=t[n];if("fallbacks"===n&&Array.isArray(r))t[n]=r.map(e);else{var o=!1,a=$t(n);a&&a!==n&&(o=!0);var i=!1,l=Xt(a,v(r));l&&l!==r&&(i=!0),(o||i)&&(o&&delete t[n],t[a||n]=l||r)}}return t}return{onProcessRule:function(e){if("keyframes"===e.type){var t=e;t.at=function(e){return"-"===e[1]||"ms"===it?e:"@"+lt+"keyframes"+e.substr(10)}(t.at)}},onProcessStyle:function(t,n){return"style"!==n.type?t:e(t)},onChangeValue:function(e,t){return Xt(t,v(e))||e}}}(),(Qt=function(e,t){return e.length===t.length?e>t?1:-1:e.length-t.length},{onProcessStyle:function(e,t){if("style"!==t.type)return e;for(var n={},r=Object.keys(e).sort(Qt),o=0;o<r.length;o++)n[r[o]]=e[r[o]];return n}})]}),Gt={disableGeneration:!1,generateClassName:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=e.disableGlobal,n=void 0!==t&&t,r=e.productionPrefix,o=void 0===r?"jss":r,a=e.seed,i=void 0===a?"":a,l=""===i?"":"".concat(i,"-"),s=0,u=function(){return s+=1};return function(e,t){var r=t.options.name;if(r&&0===r.indexOf("Mui")&&!t.options.link&&!n){if(-1!==Re.indexOf(e.key))return"Mui-".concat(e.key);var a="".concat(l).concat(r,"-").concat(e.key);return t.options.theme[Ce]&&""===i?"".concat(a,"-").concat(u()):a}return"".concat(l).concat(o).concat(u())}}(),jss:Yt,sheetsCache:null,sheetsManager:new Map,sheetsRegistry:null},Jt=a.createContext(Gt),Zt=-1e9,en=n(2851);const tn={};function nn(e,t){var n=e.state,r=e.theme,a=e.stylesOptions,i=e.stylesCreator,l=e.name;if(!a.disableGeneration){var s=Se.get(a.sheetsManager,i,r);s||(s={refs:0,staticSheet:null,dynamicStyles:null},Se.set(a.sheetsManager,i,r,s));var u=(0,o.A)({},i.options,a,{theme:r,flip:"boolean"==typeof a.flip?a.flip:"rtl"===r.direction});u.generateId=u.serverGenerateClassName||u.generateClassName;var c=a.sheetsRegistry;if(0===s.refs){var d;a.sheetsCache&&(d=Se.get(a.sheetsCache,i,r));var f=i.create(r,l);d||((d=a.jss.createStyleSheet(f,(0,o.A)({link:!1},u))).attach(),a.sheetsCache&&Se.set(a.sheetsCache,i,r,d)),c&&c.add(d),s.staticSheet=d,s.dynamicStyles=we(f)}if(s.dynamicStyles){var p=a.jss.createStyleSheet(s.dynamicStyles,(0,o.A)({link:!0},u));p.update(t),p.attach(),n.dynamicSheet=p,n.classes=(0,Ee.A)({baseClasses:s.staticSheet.classes,newClasses:p.classes}),c&&c.add(p)}else n.classes=s.staticSheet.classes;s.refs+=1}}function rn(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=t.name,i=t.classNamePrefix,l=t.Component,s=t.defaultTheme,u=void 0===s?tn:s,c=(0,r.A)(t,["name","classNamePrefix","Component","defaultTheme"]),d=function(e){var t="function"==typeof e;return{create:function(n,r){var a;try{a=t?e(n):e}catch(e){throw e}if(!r||!n.overrides||!n.overrides[r])return a;var i=n.overrides[r],l=(0,o.A)({},a);return Object.keys(i).forEach((function(e){l[e]=(0,en.A)(l[e],i[e])})),l},options:{}}}(e),f=n||i||"makeStyles";return d.options={index:Zt+=1,name:n,meta:f,classNamePrefix:f},function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=(0,Ae.A)()||u,r=(0,o.A)({},a.useContext(Jt),c),i=a.useRef(),s=a.useRef();!function(o,l){var u,c,f=a.useRef([]),p=a.useMemo((function(){return{}}),l);f.current!==p&&(f.current=p,nn(c={name:n,state:{},stylesCreator:d,stylesOptions:r,theme:t},e),s.current=!1,i.current=c,u=function(){!function(e){var t=e.state,n=e.theme,r=e.stylesOptions,o=e.stylesCreator;if(!r.disableGeneration){var a=Se.get(r.sheetsManager,o,n);a.refs-=1;var i=r.sheetsRegistry;0===a.refs&&(Se.delete(r.sheetsManager,o,n),r.jss.removeStyleSheet(a.staticSheet),i&&i.remove(a.staticSheet)),t.dynamicSheet&&(r.jss.removeStyleSheet(t.dynamicSheet),i&&i.remove(t.dynamicSheet))}}(c)}),a.useEffect((function(){return function(){u&&u()}}),[p])}(0,[t,d]),a.useEffect((function(){s.current&&function(e,t){var n=e.state;n.dynamicSheet&&n.dynamicSheet.update(t)}(i.current,e),s.current=!0}));var f=function(e,t,n){var r=e.state;if(e.stylesOptions.disableGeneration)return t||{};r.cacheClasses||(r.cacheClasses={value:null,lastProp:null,lastJSS:{}});var o=!1;return r.classes!==r.cacheClasses.lastJSS&&(r.cacheClasses.lastJSS=r.classes,o=!0),t!==r.cacheClasses.lastProp&&(r.cacheClasses.lastProp=t,o=!0),o&&(r.cacheClasses.value=(0,Ee.A)({baseClasses:r.cacheClasses.lastJSS,newClasses:t,Component:n})),r.cacheClasses.value}(i.current,e.classes,l);return f}}},2694:(e,t,n)=>{"use strict";var r=n(6925);function o(){}function a(){}a.resetWarningCache=o,e.exports=function(){function e(e,t,n,o,a,i){if(i!==r){var l=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw l.name="Invariant Violation",l}}function t(){return e}e.isRequired=e;var n={array:e,bigint:e,bool:e,func:e,number:e,object:e,string:e,symbol:e,any:e,arrayOf:t,element:e,elementType:e,instanceOf:t,node:e,objectOf:t,oneOf:t,oneOfType:t,shape:t,exact:t,checkPropTypes:a,resetWarningCache:o};return n.PropTypes=n,n}},2777:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(2851);const o=function(e,t){return t?(0,r.A)(e,t,{clone:!1}):e}},2799:(e,t)=>{"use strict";if("function"==typeof Symbol&&Symbol.for){var n=Symbol.for;n("react.element"),n("react.portal"),n("react.fragment"),n("react.strict_mode"),n("react.profiler"),n("react.provider"),n("react.context"),n("react.forward_ref"),n("react.suspense"),n("react.suspense_list"),n("react.memo"),n("react.lazy"),n("react.block"),n("react.server.block"),n("react.fundamental"),n("react.debug_trace_mode"),n("react.legacy_hidden")}},2851:(e,t,n)=>{"use strict";n.d(t,{A:()=>i});var r=n(8168),o=n(2284);function a(e){return e&&"object"===(0,o.A)(e)&&e.constructor===Object}function i(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{clone:!0},o=n.clone?(0,r.A)({},e):e;return a(e)&&a(t)&&Object.keys(t).forEach((function(r){"__proto__"!==r&&(a(t[r])&&r in e?o[r]=i(e[r],t[r],n):o[r]=t[r])})),o}},2901:(e,t,n)=>{"use strict";n.d(t,{A:()=>a});var r=n(816);function o(e,t){for(var n=0;n<t.length;n++){var o=t[n];o.enumerable=o.enumerable||!1,o.configurable=!0,"value"in o&&(o.writable=!0),Object.defineProperty(e,(0,r.A)(o.key),o)}}function a(e,t,n){return t&&o(e.prototype,t),n&&o(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e}},3043:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(8168);function o(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=e.baseClasses,n=e.newClasses;if(e.Component,!n)return t;var o=(0,r.A)({},t);return Object.keys(n).forEach((function(e){n[e]&&(o[e]="".concat(t[e]," ").concat(n[e]))})),o}},3072:(e,t)=>{"use strict";var n="function"==typeof Symbol&&Symbol.for,r=n?Symbol.for("react.element"):60103,o=n?Symbol.for("react.portal"):60106,a=n?Symbol.for("react.fragment"):60107,i=n?Symbol.for("react.strict_mode"):60108,l=n?Symbol.for("react.profiler"):60114,s=n?Symbol.for("react.provider"):60109,u=n?Symbol.for("react.context"):60110,c=n?Symbol.for("react.async_mode"):60111,d=n?Symbol.for("react.concurrent_mode"):60111,f=n?Symbol.for("react.forward_ref"):60112,p=n?Symbol.for("react.suspense"):60113,m=n?Symbol.for("react.suspense_list"):60120,h=n?Symbol.for("react.memo"):60115,v=n?Symbol.for("react.lazy"):60116,g=n?Symbol.for("react.block"):60121,y=n?Symbol.for("react.fundamental"):60117,b=n?Symbol.for("react.responder"):60118,x=n?Symbol.for("react.scope"):60119;function w(e){if("object"==typeof e&&null!==e){var t=e.$$typeof;switch(t){case r:switch(e=e.type){case c:case d:case a:case l:case i:case p:return e;default:switch(e=e&&e.$$typeof){case u:case f:case v:case h:case s:return e;default:return t}}case o:return t}}}function E(e){return w(e)===d}t.AsyncMode=c,t.ConcurrentMode=d,t.ContextConsumer=u,t.ContextProvider=s,t.Element=r,t.ForwardRef=f,t.Fragment=a,t.Lazy=v,t.Memo=h,t.Portal=o,t.Profiler=l,t.StrictMode=i,t.Suspense=p,t.isAsyncMode=function(e){return E(e)||w(e)===c},t.isConcurrentMode=E,t.isContextConsumer=function(e){return w(e)===u},t.isContextProvider=function(e){return w(e)===s},t.isElement=function(e){return"object"==typeof e&&null!==e&&e.$$typeof===r},t.isForwardRef=function(e){return w(e)===f},t.isFragment=function(e){return w(e)===a},t.isLazy=function(e){return w(e)===v},t.isMemo=function(e){return w(e)===h},t.isPortal=function(e){return w(e)===o},t.isProfiler=function(e){return w(e)===l},t.isStrictMode=function(e){return w(e)===i},t.isSuspense=function(e){return w(e)===p},t.isValidElementType=function(e){return"string"==typeof e||"function"==typeof e||e===a||e===d||e===l||e===i||e===p||e===m||"object"==typeof e&&null!==e&&(e.$$typeof===v||e.$$typeof===h||e.$$typeof===s||e.$$typeof===u||e.$$typeof===f||e.$$typeof===y||e.$$typeof===b||e.$$typeof===x||e.$$typeof===g)},t.typeOf=w},3145:(e,t,n)=>{"use strict";function r(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}n.d(t,{A:()=>r})},3404:(e,t,n)=>{"use strict";e.exports=n(3072)},3546:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M19 6.41L17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Close");t.A=i},3738:e=>{function t(n){return e.exports=t="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},e.exports.__esModule=!0,e.exports.default=e.exports,t(n)}e.exports=t,e.exports.__esModule=!0,e.exports.default=e.exports},3870:(e,t,n)=>{"use strict";n.d(t,{Ay:()=>l,p0:()=>a});var r=n(45),o={easeInOut:"cubic-bezier(0.4, 0, 0.2, 1)",easeOut:"cubic-bezier(0.0, 0, 0.2, 1)",easeIn:"cubic-bezier(0.4, 0, 1, 1)",sharp:"cubic-bezier(0.4, 0, 0.6, 1)"},a={shortest:150,shorter:200,short:250,standard:300,complex:375,enteringScreen:225,leavingScreen:195};function i(e){return"".concat(Math.round(e),"ms")}const l={easing:o,duration:a,create:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:["all"],t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=t.duration,l=void 0===n?a.standard:n,s=t.easing,u=void 0===s?o.easeInOut:s,c=t.delay,d=void 0===c?0:c;return(0,r.A)(t,["duration","easing","delay"]),(Array.isArray(e)?e:[e]).map((function(e){return"".concat(e," ").concat("string"==typeof l?l:i(l)," ").concat(u," ").concat("string"==typeof d?d:i(d))})).join(",")},getAutoHeightDuration:function(e){if(!e)return 0;var t=e/36;return Math.round(10*(4+15*Math.pow(t,.25)+t/5))}}},4146:(e,t,n)=>{"use strict";var r=n(3404),o={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},a={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},i={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},l={};function s(e){return r.isMemo(e)?i:l[e.$$typeof]||o}l[r.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},l[r.Memo]=i;var u=Object.defineProperty,c=Object.getOwnPropertyNames,d=Object.getOwnPropertySymbols,f=Object.getOwnPropertyDescriptor,p=Object.getPrototypeOf,m=Object.prototype;e.exports=function e(t,n,r){if("string"!=typeof n){if(m){var o=p(n);o&&o!==m&&e(t,o,r)}var i=c(n);d&&(i=i.concat(d(n)));for(var l=s(t),h=s(n),v=0;v<i.length;++v){var g=i[v];if(!(a[g]||r&&r[g]||h&&h[g]||l&&l[g])){var y=f(n,g);try{u(t,g,y)}catch(e){}}}}return t}},4232:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(6540);function o(e){var t=r.useState(e),n=t[0],o=t[1],a=e||n;return r.useEffect((function(){null==n&&o("mui-".concat(Math.round(1e5*Math.random())))}),[n]),a}},4363:(e,t,n)=>{"use strict";n(2799)},4467:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(816);function o(e,t,n){return(t=(0,r.A)(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}},4507:(e,t,n)=>{"use strict";n.d(t,{A:()=>d});var r=n(8168),o=n(6540),a=n(45),i=n(53),l=n(5192),s=n(7515),u=o.forwardRef((function(e,t){var n=e.children,l=e.classes,u=e.className,c=e.color,d=void 0===c?"inherit":c,f=e.component,p=void 0===f?"svg":f,m=e.fontSize,h=void 0===m?"medium":m,v=e.htmlColor,g=e.titleAccess,y=e.viewBox,b=void 0===y?"0 0 24 24":y,x=(0,a.A)(e,["children","classes","className","color","component","fontSize","htmlColor","titleAccess","viewBox"]);return o.createElement(p,(0,r.A)({className:(0,i.A)(l.root,u,"inherit"!==d&&l["color".concat((0,s.A)(d))],"default"!==h&&"medium"!==h&&l["fontSize".concat((0,s.A)(h))]),focusable:"false",viewBox:b,color:v,"aria-hidden":!g||void 0,role:g?"img":void 0,ref:t},x),n,g?o.createElement("title",null,g):null)}));u.muiName="SvgIcon";const c=(0,l.A)((function(e){return{root:{userSelect:"none",width:"1em",height:"1em",display:"inline-block",fill:"currentColor",flexShrink:0,fontSize:e.typography.pxToRem(24),transition:e.transitions.create("fill",{duration:e.transitions.duration.shorter})},colorPrimary:{color:e.palette.primary.main},colorSecondary:{color:e.palette.secondary.main},colorAction:{color:e.palette.action.active},colorError:{color:e.palette.error.main},colorDisabled:{color:e.palette.action.disabled},fontSizeInherit:{fontSize:"inherit"},fontSizeSmall:{fontSize:e.typography.pxToRem(20)},fontSizeLarge:{fontSize:e.typography.pxToRem(35)}}}),{name:"MuiSvgIcon"})(u);function d(e,t){var n=function(t,n){return o.createElement(c,(0,r.A)({ref:n},t),e)};return n.muiName=c.muiName,o.memo(o.forwardRef(n))}},4634:e=>{e.exports=Array.isArray||function(e){return"[object Array]"==Object.prototype.toString.call(e)}},4801:(e,t,n)=>{"use strict";n.d(t,{A:()=>a});var r=n(6540),o=n(4960);function a(e,t){return r.useMemo((function(){return null==e&&null==t?null:function(n){(0,o.A)(e,n),(0,o.A)(t,n)}}),[e,t])}},4820:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M14 6v15H3v-2h2V3h9v1h5v15h2v2h-4V6h-3zm-4 5v2h2v-2h-2z"}),"MeetingRoom");t.A=i},4912:(e,t)=>{"use strict";var n="function"==typeof Symbol&&Symbol.for;n&&Symbol.for("react.element"),n&&Symbol.for("react.portal"),n&&Symbol.for("react.fragment"),n&&Symbol.for("react.strict_mode"),n&&Symbol.for("react.profiler"),n&&Symbol.for("react.provider"),n&&Symbol.for("react.context"),n&&Symbol.for("react.async_mode"),n&&Symbol.for("react.concurrent_mode"),n&&Symbol.for("react.forward_ref"),n&&Symbol.for("react.suspense"),n&&Symbol.for("react.suspense_list"),n&&Symbol.for("react.memo"),n&&Symbol.for("react.lazy"),n&&Symbol.for("react.block"),n&&Symbol.for("react.fundamental"),n&&Symbol.for("react.responder"),n&&Symbol.for("react.scope")},4960:(e,t,n)=>{"use strict";function r(e,t){"function"==typeof e?e(t):e&&(e.current=t)}n.d(t,{A:()=>r})},4994:e=>{e.exports=function(e){return e&&e.__esModule?e:{default:e}},e.exports.__esModule=!0,e.exports.default=e.exports},5061:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M16 11c1.66 0 2.99-1.34 2.99-3S17.66 5 16 5c-1.66 0-3 1.34-3 3s1.34 3 3 3zm-8 0c1.66 0 2.99-1.34 2.99-3S9.66 5 8 5C6.34 5 5 6.34 5 8s1.34 3 3 3zm0 2c-2.33 0-7 1.17-7 3.5V19h14v-2.5c0-2.33-4.67-3.5-7-3.5zm8 0c-.29 0-.62.02-.97.05 1.16.84 1.97 1.97 1.97 3.45V19h6v-2.5c0-2.33-4.67-3.5-7-3.5z"}),"Group");t.A=i},5192:(e,t,n)=>{"use strict";n.d(t,{A:()=>f});var r=n(8168),o=n(45),a=n(6540),i=n(4146),l=n.n(i),s=n(2611),u=n(6081),c=n(6061);var d=n(8867);const f=function(e,t){return function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};return function(n){var i=t.defaultTheme,d=t.withTheme,f=void 0!==d&&d,p=t.name,m=(0,o.A)(t,["defaultTheme","withTheme","name"]),h=p,v=(0,s.A)(e,(0,r.A)({defaultTheme:i,Component:n,name:p||n.displayName,classNamePrefix:h},m)),g=a.forwardRef((function(e,t){e.classes;var l,s=e.innerRef,d=(0,o.A)(e,["classes","innerRef"]),m=v((0,r.A)({},n.defaultProps,e)),h=d;return("string"==typeof p||f)&&(l=(0,c.A)()||i,p&&(h=(0,u.A)({theme:l,name:p,props:d})),f&&!h.theme&&(h.theme=l)),a.createElement(n,(0,r.A)({ref:s||t,classes:m},h))}));return l()(g,n),g}}(e,(0,r.A)({defaultTheme:d.A},t))}},5228:e=>{"use strict";var t=Object.getOwnPropertySymbols,n=Object.prototype.hasOwnProperty,r=Object.prototype.propertyIsEnumerable;e.exports=function(){try{if(!Object.assign)return!1;var e=new String("abc");if(e[5]="de","5"===Object.getOwnPropertyNames(e)[0])return!1;for(var t={},n=0;n<10;n++)t["_"+String.fromCharCode(n)]=n;if("0123456789"!==Object.getOwnPropertyNames(t).map((function(e){return t[e]})).join(""))return!1;var r={};return"abcdefghijklmnopqrst".split("").forEach((function(e){r[e]=e})),"abcdefghijklmnopqrst"===Object.keys(Object.assign({},r)).join("")}catch(e){return!1}}()?Object.assign:function(e,o){for(var a,i,l=function(e){if(null==e)throw new TypeError("Object.assign cannot be called with null or undefined");return Object(e)}(e),s=1;s<arguments.length;s++){for(var u in a=Object(arguments[s]))n.call(a,u)&&(l[u]=a[u]);if(t){i=t(a);for(var c=0;c<i.length;c++)r.call(a,i[c])&&(l[i[c]]=a[i[c]])}}return l}},5287:(e,t,n)=>{"use strict";var r=n(5228),o=60103,a=60106;t.Fragment=60107,t.StrictMode=60108,t.Profiler=60114;var i=60109,l=60110,s=60112;t.Suspense=60113;var u=60115,c=60116;if("function"==typeof Symbol&&Symbol.for){var d=Symbol.for;o=d("react.element"),a=d("react.portal"),t.Fragment=d("react.fragment"),t.StrictMode=d("react.strict_mode"),t.Profiler=d("react.profiler"),i=d("react.provider"),l=d("react.context"),s=d("react.forward_ref"),t.Suspense=d("react.suspense"),u=d("react.memo"),c=d("react.lazy")}var f="function"==typeof Symbol&&Symbol.iterator;function p(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var m={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},h={};function v(e,t,n){this.props=e,this.context=t,this.refs=h,this.updater=n||m}function g(){}function y(e,t,n){this.props=e,this.context=t,this.refs=h,this.updater=n||m}v.prototype.isReactComponent={},v.prototype.setState=function(e,t){if("object"!=typeof e&&"function"!=typeof e&&null!=e)throw Error(p(85));this.updater.enqueueSetState(this,e,t,"setState")},v.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},g.prototype=v.prototype;var b=y.prototype=new g;b.constructor=y,r(b,v.prototype),b.isPureReactComponent=!0;var x={current:null},w=Object.prototype.hasOwnProperty,E={key:!0,ref:!0,__self:!0,__source:!0};function k(e,t,n){var r,a={},i=null,l=null;if(null!=t)for(r in void 0!==t.ref&&(l=t.ref),void 0!==t.key&&(i=""+t.key),t)w.call(t,r)&&!E.hasOwnProperty(r)&&(a[r]=t[r]);var s=arguments.length-2;if(1===s)a.children=n;else if(1<s){for(var u=Array(s),c=0;c<s;c++)u[c]=arguments[c+2];a.children=u}if(e&&e.defaultProps)for(r in s=e.defaultProps)void 0===a[r]&&(a[r]=s[r]);return{$$typeof:o,type:e,key:i,ref:l,props:a,_owner:x.current}}function S(e){return"object"==typeof e&&null!==e&&e.$$typeof===o}var A=/\/+/g;function C(e,t){return"object"==typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,(function(e){return t[e]}))}(""+e.key):t.toString(36)}function R(e,t,n,r,i){var l=typeof e;"undefined"!==l&&"boolean"!==l||(e=null);var s=!1;if(null===e)s=!0;else switch(l){case"string":case"number":s=!0;break;case"object":switch(e.$$typeof){case o:case a:s=!0}}if(s)return i=i(s=e),e=""===r?"."+C(s,0):r,Array.isArray(i)?(n="",null!=e&&(n=e.replace(A,"$&/")+"/"),R(i,t,n,"",(function(e){return e}))):null!=i&&(S(i)&&(i=function(e,t){return{$$typeof:o,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}(i,n+(!i.key||s&&s.key===i.key?"":(""+i.key).replace(A,"$&/")+"/")+e)),t.push(i)),1;if(s=0,r=""===r?".":r+":",Array.isArray(e))for(var u=0;u<e.length;u++){var c=r+C(l=e[u],u);s+=R(l,t,n,c,i)}else if(c=function(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=f&&e[f]||e["@@iterator"])?e:null}(e),"function"==typeof c)for(e=c.call(e),u=0;!(l=e.next()).done;)s+=R(l=l.value,t,n,c=r+C(l,u++),i);else if("object"===l)throw t=""+e,Error(p(31,"[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t));return s}function P(e,t,n){if(null==e)return e;var r=[],o=0;return R(e,r,"","",(function(e){return t.call(n,e,o++)})),r}function T(e){if(-1===e._status){var t=e._result;t=t(),e._status=0,e._result=t,t.then((function(t){0===e._status&&(t=t.default,e._status=1,e._result=t)}),(function(t){0===e._status&&(e._status=2,e._result=t)}))}if(1===e._status)return e._result;throw e._result}var N={current:null};function O(){var e=N.current;if(null===e)throw Error(p(321));return e}var M={ReactCurrentDispatcher:N,ReactCurrentBatchConfig:{transition:0},ReactCurrentOwner:x,IsSomeRendererActing:{current:!1},assign:r};t.Children={map:P,forEach:function(e,t,n){P(e,(function(){t.apply(this,arguments)}),n)},count:function(e){var t=0;return P(e,(function(){t++})),t},toArray:function(e){return P(e,(function(e){return e}))||[]},only:function(e){if(!S(e))throw Error(p(143));return e}},t.Component=v,t.PureComponent=y,t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=M,t.cloneElement=function(e,t,n){if(null==e)throw Error(p(267,e));var a=r({},e.props),i=e.key,l=e.ref,s=e._owner;if(null!=t){if(void 0!==t.ref&&(l=t.ref,s=x.current),void 0!==t.key&&(i=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(c in t)w.call(t,c)&&!E.hasOwnProperty(c)&&(a[c]=void 0===t[c]&&void 0!==u?u[c]:t[c])}var c=arguments.length-2;if(1===c)a.children=n;else if(1<c){u=Array(c);for(var d=0;d<c;d++)u[d]=arguments[d+2];a.children=u}return{$$typeof:o,type:e.type,key:i,ref:l,props:a,_owner:s}},t.createContext=function(e,t){return void 0===t&&(t=null),(e={$$typeof:l,_calculateChangedBits:t,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider={$$typeof:i,_context:e},e.Consumer=e},t.createElement=k,t.createFactory=function(e){var t=k.bind(null,e);return t.type=e,t},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:s,render:e}},t.isValidElement=S,t.lazy=function(e){return{$$typeof:c,_payload:{_status:-1,_result:e},_init:T}},t.memo=function(e,t){return{$$typeof:u,type:e,compare:void 0===t?null:t}},t.useCallback=function(e,t){return O().useCallback(e,t)},t.useContext=function(e,t){return O().useContext(e,t)},t.useDebugValue=function(){},t.useEffect=function(e,t){return O().useEffect(e,t)},t.useImperativeHandle=function(e,t,n){return O().useImperativeHandle(e,t,n)},t.useLayoutEffect=function(e,t){return O().useLayoutEffect(e,t)},t.useMemo=function(e,t){return O().useMemo(e,t)},t.useReducer=function(e,t,n){return O().useReducer(e,t,n)},t.useRef=function(e){return O().useRef(e)},t.useState=function(e){return O().useState(e)},t.version="17.0.2"},5302:(e,t,n)=>{var r=n(4634);e.exports=function e(t,n,o){return r(n)||(o=n||o,n=[]),o=o||{},t instanceof RegExp?function(e,t){var n=e.source.match(/\((?!\?)/g);if(n)for(var r=0;r<n.length;r++)t.push({name:r,prefix:null,delimiter:null,optional:!1,repeat:!1,partial:!1,asterisk:!1,pattern:null});return d(e,t)}(t,n):r(t)?function(t,n,r){for(var o=[],a=0;a<t.length;a++)o.push(e(t[a],n,r).source);return d(new RegExp("(?:"+o.join("|")+")",f(r)),n)}(t,n,o):function(e,t,n){return p(a(e,n),t,n)}(t,n,o)},e.exports.parse=a,e.exports.compile=function(e,t){return s(a(e,t),t)},e.exports.tokensToFunction=s,e.exports.tokensToRegExp=p;var o=new RegExp(["(\\\\.)","([\\/.])?(?:(?:\\:(\\w+)(?:\\(((?:\\\\.|[^\\\\()])+)\\))?|\\(((?:\\\\.|[^\\\\()])+)\\))([+*?])?|(\\*))"].join("|"),"g");function a(e,t){for(var n,r=[],a=0,l=0,s="",u=t&&t.delimiter||"/";null!=(n=o.exec(e));){var d=n[0],f=n[1],p=n.index;if(s+=e.slice(l,p),l=p+d.length,f)s+=f[1];else{var m=e[l],h=n[2],v=n[3],g=n[4],y=n[5],b=n[6],x=n[7];s&&(r.push(s),s="");var w=null!=h&&null!=m&&m!==h,E="+"===b||"*"===b,k="?"===b||"*"===b,S=h||u,A=g||y,C=h||("string"==typeof r[r.length-1]?r[r.length-1]:"");r.push({name:v||a++,prefix:h||"",delimiter:S,optional:k,repeat:E,partial:w,asterisk:!!x,pattern:A?c(A):x?".*":i(S,C)})}}return l<e.length&&(s+=e.substr(l)),s&&r.push(s),r}function i(e,t){return!t||t.indexOf(e)>-1?"[^"+u(e)+"]+?":u(t)+"|(?:(?!"+u(t)+")[^"+u(e)+"])+?"}function l(e){return encodeURI(e).replace(/[\/?#]/g,(function(e){return"%"+e.charCodeAt(0).toString(16).toUpperCase()}))}function s(e,t){for(var n=new Array(e.length),o=0;o<e.length;o++)"object"==typeof e[o]&&(n[o]=new RegExp("^(?:"+e[o].pattern+")$",f(t)));return function(t,o){for(var a="",i=t||{},s=(o||{}).pretty?l:encodeURIComponent,u=0;u<e.length;u++){var c=e[u];if("string"!=typeof c){var d,f=i[c.name];if(null==f){if(c.optional){c.partial&&(a+=c.prefix);continue}throw new TypeError('Expected "'+c.name+'" to be defined')}if(r(f)){if(!c.repeat)throw new TypeError('Expected "'+c.name+'" to not repeat, but received `'+JSON.stringify(f)+"`");if(0===f.length){if(c.optional)continue;throw new TypeError('Expected "'+c.name+'" to not be empty')}for(var p=0;p<f.length;p++){if(d=s(f[p]),!n[u].test(d))throw new TypeError('Expected all "'+c.name+'" to match "'+c.pattern+'", but received `'+JSON.stringify(d)+"`");a+=(0===p?c.prefix:c.delimiter)+d}}else{if(d=c.asterisk?encodeURI(f).replace(/[?#]/g,(function(e){return"%"+e.charCodeAt(0).toString(16).toUpperCase()})):s(f),!n[u].test(d))throw new TypeError('Expected "'+c.name+'" to match "'+c.pattern+'", but received "'+d+'"');a+=c.prefix+d}}else a+=c}return a}}function u(e){return e.replace(/([.+*?=^!:${}()[\]|\/\\])/g,"\\$1")}function c(e){return e.replace(/([=!:$\/()])/g,"\\$1")}function d(e,t){return e.keys=t,e}function f(e){return e&&e.sensitive?"":"i"}function p(e,t,n){r(t)||(n=t||n,t=[]);for(var o=(n=n||{}).strict,a=!1!==n.end,i="",l=0;l<e.length;l++){var s=e[l];if("string"==typeof s)i+=u(s);else{var c=u(s.prefix),p="(?:"+s.pattern+")";t.push(s),s.repeat&&(p+="(?:"+c+p+")*"),i+=p=s.optional?s.partial?c+"("+p+")?":"(?:"+c+"("+p+"))?":c+"("+p+")"}}var m=u(n.delimiter||"/"),h=i.slice(-m.length)===m;return o||(i=(h?i.slice(0,-m.length):i)+"(?:"+m+"(?=$))?"),i+=a?"$":o&&h?"":"(?="+m+"|$)",d(new RegExp("^"+i,f(n)),t)}},5458:(e,t,n)=>{"use strict";n.d(t,{A:()=>a});var r=n(3145),o=n(7800);function a(e){return function(e){if(Array.isArray(e))return(0,r.A)(e)}(e)||function(e){if("undefined"!=typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||(0,o.A)(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}},5540:(e,t,n)=>{"use strict";function r(e,t){return r=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},r(e,t)}function o(e,t){e.prototype=Object.create(t.prototype),e.prototype.constructor=e,r(e,t)}n.d(t,{A:()=>o})},5556:(e,t,n)=>{e.exports=n(2694)()},5632:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M6 19h4V5H6v14zm8-14v14h4V5h-4z"}),"Pause");t.A=i},6061:(e,t,n)=>{"use strict";n.d(t,{A:()=>a});var r=n(6540);const o=r.createContext(null);function a(){return r.useContext(o)}},6064:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm1 15h-2v-2h2v2zm0-4h-2V7h2v6z"}),"Error");t.A=i},6081:(e,t,n)=>{"use strict";function r(e){var t=e.theme,n=e.name,r=e.props;if(!t||!t.props||!t.props[n])return r;var o,a=t.props[n];for(o in a)void 0===r[o]&&(r[o]=a[o]);return r}n.d(t,{A:()=>r})},6182:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(1475);function o(e){return(0,r.A)(e).defaultView||window}},6305:(e,t,n)=>{var r=n(3738).default;function o(e){if("function"!=typeof WeakMap)return null;var t=new WeakMap,n=new WeakMap;return(o=function(e){return e?n:t})(e)}e.exports=function(e,t){if(!t&&e&&e.__esModule)return e;if(null===e||"object"!=r(e)&&"function"!=typeof e)return{default:e};var n=o(t);if(n&&n.has(e))return n.get(e);var a={__proto__:null},i=Object.defineProperty&&Object.getOwnPropertyDescriptor;for(var l in e)if("default"!==l&&{}.hasOwnProperty.call(e,l)){var s=i?Object.getOwnPropertyDescriptor(e,l):null;s&&(s.get||s.set)?Object.defineProperty(a,l,s):a[l]=e[l]}return a.default=e,n&&n.set(e,a),a},e.exports.__esModule=!0,e.exports.default=e.exports},6447:(e,t,n)=>{"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"default",{enumerable:!0,get:function(){return r.createSvgIcon}});var r=n(1305)},6535:(e,t,n)=>{"use strict";n.d(t,{L:()=>p,A:()=>h});var r,o,a=n(296),i=n(7969),l=n(2777),s={m:"margin",p:"padding"},u={t:"Top",r:"Right",b:"Bottom",l:"Left",x:["Left","Right"],y:["Top","Bottom"]},c={marginX:"mx",marginY:"my",paddingX:"px",paddingY:"py"},d=(r=function(e){if(e.length>2){if(!c[e])return[e];e=c[e]}var t=e.split(""),n=(0,a.A)(t,2),r=n[0],o=n[1],i=s[r],l=u[o]||"";return Array.isArray(l)?l.map((function(e){return i+e})):[i+l]},o={},function(e){return void 0===o[e]&&(o[e]=r(e)),o[e]}),f=["m","mt","mr","mb","ml","mx","my","p","pt","pr","pb","pl","px","py","margin","marginTop","marginRight","marginBottom","marginLeft","marginX","marginY","padding","paddingTop","paddingRight","paddingBottom","paddingLeft","paddingX","paddingY"];function p(e){var t=e.spacing||8;return"number"==typeof t?function(e){return t*e}:Array.isArray(t)?function(e){return t[e]}:"function"==typeof t?t:function(){}}function m(e){var t=p(e.theme);return Object.keys(e).map((function(n){if(-1===f.indexOf(n))return null;var r=function(e,t){return function(n){return e.reduce((function(e,r){return e[r]=function(e,t){if("string"==typeof t||null==t)return t;var n=e(Math.abs(t));return t>=0?n:"number"==typeof n?-n:"-".concat(n)}(t,n),e}),{})}}(d(n),t),o=e[n];return(0,i.N)(e,o,r)})).reduce(l.A,{})}m.propTypes={},m.filterProps=f;const h=m},6540:(e,t,n)=>{"use strict";e.exports=n(5287)},6925:e=>{"use strict";e.exports="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED"},7201:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M19 13h-6v6h-2v-6H5v-2h6V5h2v6h6v2z"}),"Add");t.A=i},7451:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M18 8h-1V6c0-2.76-2.24-5-5-5S7 3.24 7 6v2H6c-1.1 0-2 .9-2 2v10c0 1.1.9 2 2 2h12c1.1 0 2-.9 2-2V10c0-1.1-.9-2-2-2zm-6 9c-1.1 0-2-.9-2-2s.9-2 2-2 2 .9 2 2-.9 2-2 2zm3.1-9H8.9V6c0-1.71 1.39-3.1 3.1-3.1 1.71 0 3.1 1.39 3.1 3.1v2z"}),"Lock");t.A=i},7463:(e,t)=>{"use strict";var n,r,o,a;if("object"==typeof performance&&"function"==typeof performance.now){var i=performance;t.unstable_now=function(){return i.now()}}else{var l=Date,s=l.now();t.unstable_now=function(){return l.now()-s}}if("undefined"==typeof window||"function"!=typeof MessageChannel){var u=null,c=null,d=function(){if(null!==u)try{var e=t.unstable_now();u(!0,e),u=null}catch(e){throw setTimeout(d,0),e}};n=function(e){null!==u?setTimeout(n,0,e):(u=e,setTimeout(d,0))},r=function(e,t){c=setTimeout(e,t)},o=function(){clearTimeout(c)},t.unstable_shouldYield=function(){return!1},a=t.unstable_forceFrameRate=function(){}}else{var f=window.setTimeout,p=window.clearTimeout;if("undefined"!=typeof console){var m=window.cancelAnimationFrame;"function"!=typeof window.requestAnimationFrame&&console.error("This browser doesn't support requestAnimationFrame. Make sure that you load a polyfill in older browsers. https://reactjs.org/link/react-polyfills"),"function"!=typeof m&&console.error("This browser doesn't support cancelAnimationFrame. Make sure that you load a polyfill in older browsers. https://reactjs.org/link/react-polyfills")}var h=!1,v=null,g=-1,y=5,b=0;t.unstable_shouldYield=function(){return t.unstable_now()>=b},a=function(){},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):y=0<e?Math.floor(1e3/e):5};var x=new MessageChannel,w=x.port2;x.port1.onmessage=function(){if(null!==v){var e=t.unstable_now();b=e+y;try{v(!0,e)?w.postMessage(null):(h=!1,v=null)}catch(e){throw w.postMessage(null),e}}else h=!1},n=function(e){v=e,h||(h=!0,w.postMessage(null))},r=function(e,n){g=f((function(){e(t.unstable_now())}),n)},o=function(){p(g),g=-1}}function E(e,t){var n=e.length;e.push(t);e:for(;;){var r=n-1>>>1,o=e[r];if(!(void 0!==o&&0<A(o,t)))break e;e[r]=t,e[n]=o,n=r}}function k(e){return void 0===(e=e[0])?null:e}function S(e){var t=e[0];if(void 0!==t){var n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,o=e.length;r<o;){var a=2*(r+1)-1,i=e[a],l=a+1,s=e[l];if(void 0!==i&&0>A(i,n))void 0!==s&&0>A(s,i)?(e[r]=s,e[l]=n,r=l):(e[r]=i,e[a]=n,r=a);else{if(!(void 0!==s&&0>A(s,n)))break e;e[r]=s,e[l]=n,r=l}}}return t}return null}function A(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}var C=[],R=[],P=1,T=null,N=3,O=!1,M=!1,L=!1;function z(e){for(var t=k(R);null!==t;){if(null===t.callback)S(R);else{if(!(t.startTime<=e))break;S(R),t.sortIndex=t.expirationTime,E(C,t)}t=k(R)}}function _(e){if(L=!1,z(e),!M)if(null!==k(C))M=!0,n(I);else{var t=k(R);null!==t&&r(_,t.startTime-e)}}function I(e,n){M=!1,L&&(L=!1,o()),O=!0;var a=N;try{for(z(n),T=k(C);null!==T&&(!(T.expirationTime>n)||e&&!t.unstable_shouldYield());){var i=T.callback;if("function"==typeof i){T.callback=null,N=T.priorityLevel;var l=i(T.expirationTime<=n);n=t.unstable_now(),"function"==typeof l?T.callback=l:T===k(C)&&S(C),z(n)}else S(C);T=k(C)}if(null!==T)var s=!0;else{var u=k(R);null!==u&&r(_,u.startTime-n),s=!1}return s}finally{T=null,N=a,O=!1}}var D=a;t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_continueExecution=function(){M||O||(M=!0,n(I))},t.unstable_getCurrentPriorityLevel=function(){return N},t.unstable_getFirstCallbackNode=function(){return k(C)},t.unstable_next=function(e){switch(N){case 1:case 2:case 3:var t=3;break;default:t=N}var n=N;N=t;try{return e()}finally{N=n}},t.unstable_pauseExecution=function(){},t.unstable_requestPaint=D,t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=N;N=e;try{return t()}finally{N=n}},t.unstable_scheduleCallback=function(e,a,i){var l=t.unstable_now();switch(i="object"==typeof i&&null!==i&&"number"==typeof(i=i.delay)&&0<i?l+i:l,e){case 1:var s=-1;break;case 2:s=250;break;case 5:s=1073741823;break;case 4:s=1e4;break;default:s=5e3}return e={id:P++,callback:a,priorityLevel:e,startTime:i,expirationTime:s=i+s,sortIndex:-1},i>l?(e.sortIndex=i,E(R,e),null===k(C)&&e===k(R)&&(L?o():L=!0,r(_,i-l))):(e.sortIndex=s,E(C,e),M||O||(M=!0,n(I))),e},t.unstable_wrapCallback=function(e){var t=N;return function(){var n=N;N=t;try{return e.apply(this,arguments)}finally{N=n}}}},7515:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(7860);function o(e){if("string"!=typeof e)throw new Error((0,r.A)(7));return e.charAt(0).toUpperCase()+e.slice(1)}},7564:(e,t,n)=>{"use strict";n(4912)},7570:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(6540);function o(e,t){return r.isValidElement(e)&&-1!==t.indexOf(e.type.muiName)}},7690:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm-2 15l-5-5 1.41-1.41L10 14.17l7.59-7.59L19 8l-9 9z"}),"CheckCircle");t.A=i},7800:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(3145);function o(e,t){if(e){if("string"==typeof e)return(0,r.A)(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?(0,r.A)(e,t):void 0}}},7860:(e,t,n)=>{"use strict";function r(e){for(var t="https://mui.com/production-error/?code="+e,n=1;n<arguments.length;n+=1)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified Material-UI error #"+e+"; visit "+t+" for the full message."}n.d(t,{A:()=>r})},7969:(e,t,n)=>{"use strict";n.d(t,{N:()=>i});var r=n(2284),o={xs:0,sm:600,md:960,lg:1280,xl:1920},a={keys:["xs","sm","md","lg","xl"],up:function(e){return"@media (min-width:".concat(o[e],"px)")}};function i(e,t,n){if(Array.isArray(t)){var o=e.theme.breakpoints||a;return t.reduce((function(e,r,a){return e[o.up(o.keys[a])]=n(t[a]),e}),{})}if("object"===(0,r.A)(t)){var i=e.theme.breakpoints||a;return Object.keys(t).reduce((function(e,r){return e[i.up(r)]=n(t[r]),e}),{})}return n(t)}},8060:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(6540);function o(e){var t=e.controlled,n=e.default,o=(e.name,e.state,r.useRef(void 0!==t).current),a=r.useState(n),i=a[0],l=a[1];return[o?t:i,r.useCallback((function(e){o||l(e)}),[])]}},8168:(e,t,n)=>{"use strict";function r(){return r=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},r.apply(null,arguments)}n.d(t,{A:()=>r})},8521:(e,t,n)=>{"use strict";function r(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return t.reduce((function(e,t){return null==t?e:function(){for(var n=arguments.length,r=new Array(n),o=0;o<n;o++)r[o]=arguments[o];e.apply(this,r),t.apply(this,r)}}),(function(){}))}n.d(t,{A:()=>r})},8587:(e,t,n)=>{"use strict";function r(e,t){if(null==e)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(-1!==t.indexOf(r))continue;n[r]=e[r]}return n}n.d(t,{A:()=>r})},8630:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M18.5 12c0-1.77-1.02-3.29-2.5-4.03v8.05c1.48-.73 2.5-2.25 2.5-4.02zM5 9v6h4l5 5V4L9 9H5z"}),"VolumeDown");t.A=i},8721:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M11 18h2v-2h-2v2zm1-16C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm0 18c-4.41 0-8-3.59-8-8s3.59-8 8-8 8 3.59 8 8-3.59 8-8 8zm0-14c-2.21 0-4 1.79-4 4h2c0-1.1.9-2 2-2s2 .9 2 2c0 2-3 1.75-3 5h2c0-2.25 3-2.5 3-5 0-2.21-1.79-4-4-4z"}),"HelpOutline");t.A=i},8861:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M8 5v14l11-7z"}),"PlayArrow");t.A=i},8867:(e,t,n)=>{"use strict";n.d(t,{A:()=>U});var r=n(45),o=n(2851),a=n(8168),i=["xs","sm","md","lg","xl"],l=n(4467);function s(e,t,n){var r;return(0,a.A)({gutters:function(){var n=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};return console.warn(["Material-UI: theme.mixins.gutters() is deprecated.","You can use the source of the mixin directly:","\n      paddingLeft: theme.spacing(2),\n      paddingRight: theme.spacing(2),\n      [theme.breakpoints.up('sm')]: {\n        paddingLeft: theme.spacing(3),\n        paddingRight: theme.spacing(3),\n      },\n      "].join("\n")),(0,a.A)({paddingLeft:t(2),paddingRight:t(2)},n,(0,l.A)({},e.up("sm"),(0,a.A)({paddingLeft:t(3),paddingRight:t(3)},n[e.up("sm")])))},toolbar:(r={minHeight:56},(0,l.A)(r,"".concat(e.up("xs")," and (orientation: landscape)"),{minHeight:48}),(0,l.A)(r,e.up("sm"),{minHeight:64}),r)},n)}var u=n(7860);const c={black:"#000",white:"#fff"},d={50:"#fafafa",100:"#f5f5f5",200:"#eeeeee",300:"#e0e0e0",400:"#bdbdbd",500:"#9e9e9e",600:"#757575",700:"#616161",800:"#424242",900:"#212121",A100:"#d5d5d5",A200:"#aaaaaa",A400:"#303030",A700:"#616161"},f="#7986cb",p="#3f51b5",m="#303f9f",h="#ff4081",v="#f50057",g="#c51162",y="#e57373",b="#f44336",x="#d32f2f",w="#ffb74d",E="#ff9800",k="#f57c00",S="#64b5f6",A="#2196f3",C="#1976d2",R="#81c784",P="#4caf50",T="#388e3c";var N=n(9773),O={text:{primary:"rgba(0, 0, 0, 0.87)",secondary:"rgba(0, 0, 0, 0.54)",disabled:"rgba(0, 0, 0, 0.38)",hint:"rgba(0, 0, 0, 0.38)"},divider:"rgba(0, 0, 0, 0.12)",background:{paper:c.white,default:d[50]},action:{active:"rgba(0, 0, 0, 0.54)",hover:"rgba(0, 0, 0, 0.04)",hoverOpacity:.04,selected:"rgba(0, 0, 0, 0.08)",selectedOpacity:.08,disabled:"rgba(0, 0, 0, 0.26)",disabledBackground:"rgba(0, 0, 0, 0.12)",disabledOpacity:.38,focus:"rgba(0, 0, 0, 0.12)",focusOpacity:.12,activatedOpacity:.12}},M={text:{primary:c.white,secondary:"rgba(255, 255, 255, 0.7)",disabled:"rgba(255, 255, 255, 0.5)",hint:"rgba(255, 255, 255, 0.5)",icon:"rgba(255, 255, 255, 0.5)"},divider:"rgba(255, 255, 255, 0.12)",background:{paper:d[800],default:"#303030"},action:{active:c.white,hover:"rgba(255, 255, 255, 0.08)",hoverOpacity:.08,selected:"rgba(255, 255, 255, 0.16)",selectedOpacity:.16,disabled:"rgba(255, 255, 255, 0.3)",disabledBackground:"rgba(255, 255, 255, 0.12)",disabledOpacity:.38,focus:"rgba(255, 255, 255, 0.12)",focusOpacity:.12,activatedOpacity:.24}};function L(e,t,n,r){var o=r.light||r,a=r.dark||1.5*r;e[t]||(e.hasOwnProperty(n)?e[t]=e[n]:"light"===t?e.light=(0,N.a)(e.main,o):"dark"===t&&(e.dark=(0,N.e$)(e.main,a)))}function z(e){return Math.round(1e5*e)/1e5}function _(e){return z(e)}var I={textTransform:"uppercase"},D='"Roboto", "Helvetica", "Arial", sans-serif';function F(e,t){var n="function"==typeof t?t(e):t,i=n.fontFamily,l=void 0===i?D:i,s=n.fontSize,u=void 0===s?14:s,c=n.fontWeightLight,d=void 0===c?300:c,f=n.fontWeightRegular,p=void 0===f?400:f,m=n.fontWeightMedium,h=void 0===m?500:m,v=n.fontWeightBold,g=void 0===v?700:v,y=n.htmlFontSize,b=void 0===y?16:y,x=n.allVariants,w=n.pxToRem,E=(0,r.A)(n,["fontFamily","fontSize","fontWeightLight","fontWeightRegular","fontWeightMedium","fontWeightBold","htmlFontSize","allVariants","pxToRem"]),k=u/14,S=w||function(e){return"".concat(e/b*k,"rem")},A=function(e,t,n,r,o){return(0,a.A)({fontFamily:l,fontWeight:e,fontSize:S(t),lineHeight:n},l===D?{letterSpacing:"".concat(z(r/t),"em")}:{},o,x)},C={h1:A(d,96,1.167,-1.5),h2:A(d,60,1.2,-.5),h3:A(p,48,1.167,0),h4:A(p,34,1.235,.25),h5:A(p,24,1.334,0),h6:A(h,20,1.6,.15),subtitle1:A(p,16,1.75,.15),subtitle2:A(h,14,1.57,.1),body1:A(p,16,1.5,.15),body2:A(p,14,1.43,.15),button:A(h,14,1.75,.4,I),caption:A(p,12,1.66,.4),overline:A(p,12,2.66,1,I)};return(0,o.A)((0,a.A)({htmlFontSize:b,pxToRem:S,round:_,fontFamily:l,fontSize:u,fontWeightLight:d,fontWeightRegular:p,fontWeightMedium:h,fontWeightBold:g},C),E,{clone:!1})}function j(){return["".concat(arguments.length<=0?void 0:arguments[0],"px ").concat(arguments.length<=1?void 0:arguments[1],"px ").concat(arguments.length<=2?void 0:arguments[2],"px ").concat(arguments.length<=3?void 0:arguments[3],"px rgba(0,0,0,").concat(.2,")"),"".concat(arguments.length<=4?void 0:arguments[4],"px ").concat(arguments.length<=5?void 0:arguments[5],"px ").concat(arguments.length<=6?void 0:arguments[6],"px ").concat(arguments.length<=7?void 0:arguments[7],"px rgba(0,0,0,").concat(.14,")"),"".concat(arguments.length<=8?void 0:arguments[8],"px ").concat(arguments.length<=9?void 0:arguments[9],"px ").concat(arguments.length<=10?void 0:arguments[10],"px ").concat(arguments.length<=11?void 0:arguments[11],"px rgba(0,0,0,").concat(.12,")")].join(",")}const B=["none",j(0,2,1,-1,0,1,1,0,0,1,3,0),j(0,3,1,-2,0,2,2,0,0,1,5,0),j(0,3,3,-2,0,3,4,0,0,1,8,0),j(0,2,4,-1,0,4,5,0,0,1,10,0),j(0,3,5,-1,0,5,8,0,0,1,14,0),j(0,3,5,-1,0,6,10,0,0,1,18,0),j(0,4,5,-2,0,7,10,1,0,2,16,1),j(0,5,5,-3,0,8,10,1,0,3,14,2),j(0,5,6,-3,0,9,12,1,0,3,16,2),j(0,6,6,-3,0,10,14,1,0,4,18,3),j(0,6,7,-4,0,11,15,1,0,4,20,3),j(0,7,8,-4,0,12,17,2,0,5,22,4),j(0,7,8,-4,0,13,19,2,0,5,24,4),j(0,7,9,-4,0,14,21,2,0,5,26,4),j(0,8,9,-5,0,15,22,2,0,6,28,5),j(0,8,10,-5,0,16,24,2,0,6,30,5),j(0,8,11,-5,0,17,26,2,0,6,32,5),j(0,9,11,-5,0,18,28,2,0,7,34,6),j(0,9,12,-6,0,19,29,2,0,7,36,6),j(0,10,13,-6,0,20,31,3,0,8,38,7),j(0,10,13,-6,0,21,33,3,0,8,40,7),j(0,10,14,-6,0,22,35,3,0,8,42,7),j(0,11,14,-7,0,23,36,3,0,9,44,8),j(0,11,15,-7,0,24,38,3,0,9,46,8)],W={borderRadius:4};var $=n(6535),V=n(3870),H=n(9474);const U=function(){for(var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=e.breakpoints,n=void 0===t?{}:t,l=e.mixins,z=void 0===l?{}:l,_=e.palette,I=void 0===_?{}:_,D=e.spacing,j=e.typography,U=void 0===j?{}:j,q=(0,r.A)(e,["breakpoints","mixins","palette","spacing","typography"]),K=function(e){var t=e.primary,n=void 0===t?{light:f,main:p,dark:m}:t,i=e.secondary,l=void 0===i?{light:h,main:v,dark:g}:i,s=e.error,z=void 0===s?{light:y,main:b,dark:x}:s,_=e.warning,I=void 0===_?{light:w,main:E,dark:k}:_,D=e.info,F=void 0===D?{light:S,main:A,dark:C}:D,j=e.success,B=void 0===j?{light:R,main:P,dark:T}:j,W=e.type,$=void 0===W?"light":W,V=e.contrastThreshold,H=void 0===V?3:V,U=e.tonalOffset,q=void 0===U?.2:U,K=(0,r.A)(e,["primary","secondary","error","warning","info","success","type","contrastThreshold","tonalOffset"]);function X(e){return(0,N.eM)(e,M.text.primary)>=H?M.text.primary:O.text.primary}var Q=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:500,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:300,r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:700;if(!(e=(0,a.A)({},e)).main&&e[t]&&(e.main=e[t]),!e.main)throw new Error((0,u.A)(4,t));if("string"!=typeof e.main)throw new Error((0,u.A)(5,JSON.stringify(e.main)));return L(e,"light",n,q),L(e,"dark",r,q),e.contrastText||(e.contrastText=X(e.main)),e},Y={dark:M,light:O};return(0,o.A)((0,a.A)({common:c,type:$,primary:Q(n),secondary:Q(l,"A400","A200","A700"),error:Q(z),warning:Q(I),info:Q(F),success:Q(B),grey:d,contrastThreshold:H,getContrastText:X,augmentColor:Q,tonalOffset:q},Y[$]),K)}(I),X=function(e){var t=e.values,n=void 0===t?{xs:0,sm:600,md:960,lg:1280,xl:1920}:t,o=e.unit,l=void 0===o?"px":o,s=e.step,u=void 0===s?5:s,c=(0,r.A)(e,["values","unit","step"]);function d(e){var t="number"==typeof n[e]?n[e]:e;return"@media (min-width:".concat(t).concat(l,")")}function f(e,t){var r=i.indexOf(t);return r===i.length-1?d(e):"@media (min-width:".concat("number"==typeof n[e]?n[e]:e).concat(l,") and ")+"(max-width:".concat((-1!==r&&"number"==typeof n[i[r+1]]?n[i[r+1]]:t)-u/100).concat(l,")")}return(0,a.A)({keys:i,values:n,up:d,down:function(e){var t=i.indexOf(e)+1,r=n[i[t]];return t===i.length?d("xs"):"@media (max-width:".concat(("number"==typeof r&&t>0?r:e)-u/100).concat(l,")")},between:f,only:function(e){return f(e,e)},width:function(e){return n[e]}},c)}(n),Q=function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:8;if(e.mui)return e;var t=(0,$.L)({spacing:e}),n=function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];return 0===n.length?t(1):1===n.length?t(n[0]):n.map((function(e){if("string"==typeof e)return e;var n=t(e);return"number"==typeof n?"".concat(n,"px"):n})).join(" ")};return Object.defineProperty(n,"unit",{get:function(){return e}}),n.mui=!0,n}(D),Y=(0,o.A)({breakpoints:X,direction:"ltr",mixins:s(X,Q,z),overrides:{},palette:K,props:{},shadows:B,typography:F(K,U),spacing:Q,shape:W,transitions:V.Ay,zIndex:H.A},q),G=arguments.length,J=new Array(G>1?G-1:0),Z=1;Z<G;Z++)J[Z-1]=arguments[Z];return J.reduce((function(e,t){return(0,o.A)(e,t)}),Y)}()},9362:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M6 18l8.5-6L6 6v12zM16 6v12h2V6h-2z"}),"SkipNext");t.A=i},9417:(e,t,n)=>{"use strict";function r(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}n.d(t,{A:()=>r})},9474:(e,t,n)=>{"use strict";n.d(t,{A:()=>r});const r={mobileStepper:1e3,speedDial:1050,appBar:1100,drawer:1200,modal:1300,snackbar:1400,tooltip:1500}},9608:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M20 11H7.83l5.59-5.59L12 4l-8 8 8 8 1.41-1.41L7.83 13H20v-2z"}),"ArrowBack");t.A=i},9773:(e,t,n)=>{"use strict";n.d(t,{X4:()=>c,a:()=>f,e$:()=>d,eM:()=>l,tL:()=>u});var r=n(7860);function o(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:1;return Math.min(Math.max(t,e),n)}function a(e){if(e.type)return e;if("#"===e.charAt(0))return a(function(e){e=e.substr(1);var t=new RegExp(".{1,".concat(e.length>=6?2:1,"}"),"g"),n=e.match(t);return n&&1===n[0].length&&(n=n.map((function(e){return e+e}))),n?"rgb".concat(4===n.length?"a":"","(").concat(n.map((function(e,t){return t<3?parseInt(e,16):Math.round(parseInt(e,16)/255*1e3)/1e3})).join(", "),")"):""}(e));var t=e.indexOf("("),n=e.substring(0,t);if(-1===["rgb","rgba","hsl","hsla"].indexOf(n))throw new Error((0,r.A)(3,e));var o=e.substring(t+1,e.length-1).split(",");return{type:n,values:o=o.map((function(e){return parseFloat(e)}))}}function i(e){var t=e.type,n=e.values;return-1!==t.indexOf("rgb")?n=n.map((function(e,t){return t<3?parseInt(e,10):e})):-1!==t.indexOf("hsl")&&(n[1]="".concat(n[1],"%"),n[2]="".concat(n[2],"%")),"".concat(t,"(").concat(n.join(", "),")")}function l(e,t){var n=s(e),r=s(t);return(Math.max(n,r)+.05)/(Math.min(n,r)+.05)}function s(e){var t="hsl"===(e=a(e)).type?a(function(e){var t=(e=a(e)).values,n=t[0],r=t[1]/100,o=t[2]/100,l=r*Math.min(o,1-o),s=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:(e+n/30)%12;return o-l*Math.max(Math.min(t-3,9-t,1),-1)},u="rgb",c=[Math.round(255*s(0)),Math.round(255*s(8)),Math.round(255*s(4))];return"hsla"===e.type&&(u+="a",c.push(t[3])),i({type:u,values:c})}(e)).values:e.values;return t=t.map((function(e){return(e/=255)<=.03928?e/12.92:Math.pow((e+.055)/1.055,2.4)})),Number((.2126*t[0]+.7152*t[1]+.0722*t[2]).toFixed(3))}function u(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:.15;return s(e)>.5?d(e,t):f(e,t)}function c(e,t){return e=a(e),t=o(t),"rgb"!==e.type&&"hsl"!==e.type||(e.type+="a"),e.values[3]=t,i(e)}function d(e,t){if(e=a(e),t=o(t),-1!==e.type.indexOf("hsl"))e.values[2]*=1-t;else if(-1!==e.type.indexOf("rgb"))for(var n=0;n<3;n+=1)e.values[n]*=1-t;return i(e)}function f(e,t){if(e=a(e),t=o(t),-1!==e.type.indexOf("hsl"))e.values[2]+=(100-e.values[2])*t;else if(-1!==e.type.indexOf("rgb"))for(var n=0;n<3;n+=1)e.values[n]+=(255-e.values[n])*t;return i(e)}},9982:(e,t,n)=>{"use strict";e.exports=n(7463)}},t={};function n(r){var o=t[r];if(void 0!==o)return o.exports;var a=t[r]={exports:{}};return e[r](a,a.exports,n),a.exports}n.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return n.d(t,{a:t}),t},n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(e){if("object"==typeof window)return window}}(),n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),n.r=e=>{"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},(()=>{"use strict";var e=n(6540),t=n(961),r=n(8168),o=n(296),a=n(45),i=n(8587),l=n(5540);const s=e.createContext(null);var u="unmounted",c="exited",d="entering",f="entered",p="exiting",m=function(n){function r(e,t){var r;r=n.call(this,e,t)||this;var o,a=t&&!t.isMounting?e.enter:e.appear;return r.appearStatus=null,e.in?a?(o=c,r.appearStatus=d):o=f:o=e.unmountOnExit||e.mountOnEnter?u:c,r.state={status:o},r.nextCallback=null,r}(0,l.A)(r,n),r.getDerivedStateFromProps=function(e,t){return e.in&&t.status===u?{status:c}:null};var o=r.prototype;return o.componentDidMount=function(){this.updateStatus(!0,this.appearStatus)},o.componentDidUpdate=function(e){var t=null;if(e!==this.props){var n=this.state.status;this.props.in?n!==d&&n!==f&&(t=d):n!==d&&n!==f||(t=p)}this.updateStatus(!1,t)},o.componentWillUnmount=function(){this.cancelNextCallback()},o.getTimeouts=function(){var e,t,n,r=this.props.timeout;return e=t=n=r,null!=r&&"number"!=typeof r&&(e=r.exit,t=r.enter,n=void 0!==r.appear?r.appear:t),{exit:e,enter:t,appear:n}},o.updateStatus=function(e,n){if(void 0===e&&(e=!1),null!==n)if(this.cancelNextCallback(),n===d){if(this.props.unmountOnExit||this.props.mountOnEnter){var r=this.props.nodeRef?this.props.nodeRef.current:t.findDOMNode(this);r&&function(e){e.scrollTop}(r)}this.performEnter(e)}else this.performExit();else this.props.unmountOnExit&&this.state.status===c&&this.setState({status:u})},o.performEnter=function(e){var n=this,r=this.props.enter,o=this.context?this.context.isMounting:e,a=this.props.nodeRef?[o]:[t.findDOMNode(this),o],i=a[0],l=a[1],s=this.getTimeouts(),u=o?s.appear:s.enter;e||r?(this.props.onEnter(i,l),this.safeSetState({status:d},(function(){n.props.onEntering(i,l),n.onTransitionEnd(u,(function(){n.safeSetState({status:f},(function(){n.props.onEntered(i,l)}))}))}))):this.safeSetState({status:f},(function(){n.props.onEntered(i)}))},o.performExit=function(){var e=this,n=this.props.exit,r=this.getTimeouts(),o=this.props.nodeRef?void 0:t.findDOMNode(this);n?(this.props.onExit(o),this.safeSetState({status:p},(function(){e.props.onExiting(o),e.onTransitionEnd(r.exit,(function(){e.safeSetState({status:c},(function(){e.props.onExited(o)}))}))}))):this.safeSetState({status:c},(function(){e.props.onExited(o)}))},o.cancelNextCallback=function(){null!==this.nextCallback&&(this.nextCallback.cancel(),this.nextCallback=null)},o.safeSetState=function(e,t){t=this.setNextCallback(t),this.setState(e,t)},o.setNextCallback=function(e){var t=this,n=!0;return this.nextCallback=function(r){n&&(n=!1,t.nextCallback=null,e(r))},this.nextCallback.cancel=function(){n=!1},this.nextCallback},o.onTransitionEnd=function(e,n){this.setNextCallback(n);var r=this.props.nodeRef?this.props.nodeRef.current:t.findDOMNode(this),o=null==e&&!this.props.addEndListener;if(r&&!o){if(this.props.addEndListener){var a=this.props.nodeRef?[this.nextCallback]:[r,this.nextCallback],i=a[0],l=a[1];this.props.addEndListener(i,l)}null!=e&&setTimeout(this.nextCallback,e)}else setTimeout(this.nextCallback,0)},o.render=function(){var t=this.state.status;if(t===u)return null;var n=this.props,r=n.children,o=(n.in,n.mountOnEnter,n.unmountOnExit,n.appear,n.enter,n.exit,n.timeout,n.addEndListener,n.onEnter,n.onEntering,n.onEntered,n.onExit,n.onExiting,n.onExited,n.nodeRef,(0,i.A)(n,["children","in","mountOnEnter","unmountOnExit","appear","enter","exit","timeout","addEndListener","onEnter","onEntering","onEntered","onExit","onExiting","onExited","nodeRef"]));return e.createElement(s.Provider,{value:null},"function"==typeof r?r(t,o):e.cloneElement(e.Children.only(r),o))},r}(e.Component);function h(){}m.contextType=s,m.propTypes={},m.defaultProps={in:!1,mountOnEnter:!1,unmountOnExit:!1,appear:!1,enter:!0,exit:!0,onEnter:h,onEntering:h,onEntered:h,onExit:h,onExiting:h,onExited:h},m.UNMOUNTED=u,m.EXITED=c,m.ENTERING=d,m.ENTERED=f,m.EXITING=p;const v=m;var g=n(3870),y=n(6061),b=n(8867);function x(){return(0,y.A)()||b.A}var w=function(e){return e.scrollTop};function E(e,t){var n=e.timeout,r=e.style,o=void 0===r?{}:r;return{duration:o.transitionDuration||"number"==typeof n?n:n[t.mode]||0,delay:o.transitionDelay}}var k=n(4801),S={entering:{opacity:1},entered:{opacity:1}},A={enter:g.p0.enteringScreen,exit:g.p0.leavingScreen},C=e.forwardRef((function(t,n){var i=t.children,l=t.disableStrictModeCompat,s=void 0!==l&&l,u=t.in,c=t.onEnter,d=t.onEntered,f=t.onEntering,p=t.onExit,m=t.onExited,h=t.onExiting,g=t.style,y=t.TransitionComponent,b=void 0===y?v:y,C=t.timeout,R=void 0===C?A:C,P=(0,a.A)(t,["children","disableStrictModeCompat","in","onEnter","onEntered","onEntering","onExit","onExited","onExiting","style","TransitionComponent","timeout"]),T=x(),N=T.unstable_strictMode&&!s,O=e.useRef(null),M=(0,k.A)(i.ref,n),L=(0,k.A)(N?O:void 0,M),z=function(e){return function(t,n){if(e){var r=N?[O.current,t]:[t,n],a=(0,o.A)(r,2),i=a[0],l=a[1];void 0===l?e(i):e(i,l)}}},_=z(f),I=z((function(e,t){w(e);var n=E({style:g,timeout:R},{mode:"enter"});e.style.webkitTransition=T.transitions.create("opacity",n),e.style.transition=T.transitions.create("opacity",n),c&&c(e,t)})),D=z(d),F=z(h),j=z((function(e){var t=E({style:g,timeout:R},{mode:"exit"});e.style.webkitTransition=T.transitions.create("opacity",t),e.style.transition=T.transitions.create("opacity",t),p&&p(e)})),B=z(m);return e.createElement(b,(0,r.A)({appear:!0,in:u,nodeRef:N?O:void 0,onEnter:I,onEntered:D,onEntering:_,onExit:j,onExited:B,onExiting:F,timeout:R},P),(function(t,n){return e.cloneElement(i,(0,r.A)({style:(0,r.A)({opacity:0,visibility:"exited"!==t||u?void 0:"hidden"},S[t],g,i.props.style),ref:L},n))}))}));const R=C;var P=n(53),T=n(5192),N=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.component,s=void 0===l?"div":l,u=t.square,c=void 0!==u&&u,d=t.elevation,f=void 0===d?1:d,p=t.variant,m=void 0===p?"elevation":p,h=(0,a.A)(t,["classes","className","component","square","elevation","variant"]);return e.createElement(s,(0,r.A)({className:(0,P.A)(o.root,i,"outlined"===m?o.outlined:o["elevation".concat(f)],!c&&o.rounded),ref:n},h))}));const O=(0,T.A)((function(e){var t={};return e.shadows.forEach((function(e,n){t["elevation".concat(n)]={boxShadow:e}})),(0,r.A)({root:{backgroundColor:e.palette.background.paper,color:e.palette.text.primary,transition:e.transitions.create("box-shadow")},rounded:{borderRadius:e.shape.borderRadius},outlined:{border:"1px solid ".concat(e.palette.divider)}},t)}),{name:"MuiPaper"})(N);var M=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.raised,s=void 0!==l&&l,u=(0,a.A)(t,["classes","className","raised"]);return e.createElement(O,(0,r.A)({className:(0,P.A)(o.root,i),elevation:s?8:1,ref:n},u))}));const L=(0,T.A)({root:{overflow:"hidden"}},{name:"MuiCard"})(M);var z=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.component,s=void 0===l?"div":l,u=(0,a.A)(t,["classes","className","component"]);return e.createElement(s,(0,r.A)({className:(0,P.A)(o.root,i),ref:n},u))}));const _=(0,T.A)({root:{padding:16,"&:last-child":{paddingBottom:24}}},{name:"MuiCardContent"})(z);var I=[0,1,2,3,4,5,6,7,8,9,10],D=["auto",!0,1,2,3,4,5,6,7,8,9,10,11,12];function F(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:1,n=parseFloat(e);return"".concat(n/t).concat(String(e).replace(String(n),"")||"px")}var j=e.forwardRef((function(t,n){var o=t.alignContent,i=void 0===o?"stretch":o,l=t.alignItems,s=void 0===l?"stretch":l,u=t.classes,c=t.className,d=t.component,f=void 0===d?"div":d,p=t.container,m=void 0!==p&&p,h=t.direction,v=void 0===h?"row":h,g=t.item,y=void 0!==g&&g,b=t.justify,x=t.justifyContent,w=void 0===x?"flex-start":x,E=t.lg,k=void 0!==E&&E,S=t.md,A=void 0!==S&&S,C=t.sm,R=void 0!==C&&C,T=t.spacing,N=void 0===T?0:T,O=t.wrap,M=void 0===O?"wrap":O,L=t.xl,z=void 0!==L&&L,_=t.xs,I=void 0!==_&&_,D=t.zeroMinWidth,F=void 0!==D&&D,j=(0,a.A)(t,["alignContent","alignItems","classes","className","component","container","direction","item","justify","justifyContent","lg","md","sm","spacing","wrap","xl","xs","zeroMinWidth"]),B=(0,P.A)(u.root,c,m&&[u.container,0!==N&&u["spacing-xs-".concat(String(N))]],y&&u.item,F&&u.zeroMinWidth,"row"!==v&&u["direction-xs-".concat(String(v))],"wrap"!==M&&u["wrap-xs-".concat(String(M))],"stretch"!==s&&u["align-items-xs-".concat(String(s))],"stretch"!==i&&u["align-content-xs-".concat(String(i))],"flex-start"!==(b||w)&&u["justify-content-xs-".concat(String(b||w))],!1!==I&&u["grid-xs-".concat(String(I))],!1!==R&&u["grid-sm-".concat(String(R))],!1!==A&&u["grid-md-".concat(String(A))],!1!==k&&u["grid-lg-".concat(String(k))],!1!==z&&u["grid-xl-".concat(String(z))]);return e.createElement(f,(0,r.A)({className:B,ref:n},j))})),B=(0,T.A)((function(e){return(0,r.A)({root:{},container:{boxSizing:"border-box",display:"flex",flexWrap:"wrap",width:"100%"},item:{boxSizing:"border-box",margin:"0"},zeroMinWidth:{minWidth:0},"direction-xs-column":{flexDirection:"column"},"direction-xs-column-reverse":{flexDirection:"column-reverse"},"direction-xs-row-reverse":{flexDirection:"row-reverse"},"wrap-xs-nowrap":{flexWrap:"nowrap"},"wrap-xs-wrap-reverse":{flexWrap:"wrap-reverse"},"align-items-xs-center":{alignItems:"center"},"align-items-xs-flex-start":{alignItems:"flex-start"},"align-items-xs-flex-end":{alignItems:"flex-end"},"align-items-xs-baseline":{alignItems:"baseline"},"align-content-xs-center":{alignContent:"center"},"align-content-xs-flex-start":{alignContent:"flex-start"},"align-content-xs-flex-end":{alignContent:"flex-end"},"align-content-xs-space-between":{alignContent:"space-between"},"align-content-xs-space-around":{alignContent:"space-around"},"justify-content-xs-center":{justifyContent:"center"},"justify-content-xs-flex-end":{justifyContent:"flex-end"},"justify-content-xs-space-between":{justifyContent:"space-between"},"justify-content-xs-space-around":{justifyContent:"space-around"},"justify-content-xs-space-evenly":{justifyContent:"space-evenly"}},function(e){var t={};return I.forEach((function(n){var r=e.spacing(n);0!==r&&(t["spacing-".concat("xs","-").concat(n)]={margin:"-".concat(F(r,2)),width:"calc(100% + ".concat(F(r),")"),"& > $item":{padding:F(r,2)}})})),t}(e),e.breakpoints.keys.reduce((function(t,n){return function(e,t,n){var o={};D.forEach((function(e){var t="grid-".concat(n,"-").concat(e);if(!0!==e)if("auto"!==e){var r="".concat(Math.round(e/12*1e8)/1e6,"%");o[t]={flexBasis:r,flexGrow:0,maxWidth:r}}else o[t]={flexBasis:"auto",flexGrow:0,maxWidth:"none"};else o[t]={flexBasis:0,flexGrow:1,maxWidth:"100%"}})),"xs"===n?(0,r.A)(e,o):e[t.breakpoints.up(n)]=o}(t,e,n),t}),{}))}),{name:"MuiGrid"})(j);const W=B;var V=n(7515),H={h1:"h1",h2:"h2",h3:"h3",h4:"h4",h5:"h5",h6:"h6",subtitle1:"h6",subtitle2:"h6",body1:"p",body2:"p"},U=e.forwardRef((function(t,n){var o=t.align,i=void 0===o?"inherit":o,l=t.classes,s=t.className,u=t.color,c=void 0===u?"initial":u,d=t.component,f=t.display,p=void 0===f?"initial":f,m=t.gutterBottom,h=void 0!==m&&m,v=t.noWrap,g=void 0!==v&&v,y=t.paragraph,b=void 0!==y&&y,x=t.variant,w=void 0===x?"body1":x,E=t.variantMapping,k=void 0===E?H:E,S=(0,a.A)(t,["align","classes","className","color","component","display","gutterBottom","noWrap","paragraph","variant","variantMapping"]),A=d||(b?"p":k[w]||H[w])||"span";return e.createElement(A,(0,r.A)({className:(0,P.A)(l.root,s,"inherit"!==w&&l[w],"initial"!==c&&l["color".concat((0,V.A)(c))],g&&l.noWrap,h&&l.gutterBottom,b&&l.paragraph,"inherit"!==i&&l["align".concat((0,V.A)(i))],"initial"!==p&&l["display".concat((0,V.A)(p))]),ref:n},S))}));const q=(0,T.A)((function(e){return{root:{margin:0},body2:e.typography.body2,body1:e.typography.body1,caption:e.typography.caption,button:e.typography.button,h1:e.typography.h1,h2:e.typography.h2,h3:e.typography.h3,h4:e.typography.h4,h5:e.typography.h5,h6:e.typography.h6,subtitle1:e.typography.subtitle1,subtitle2:e.typography.subtitle2,overline:e.typography.overline,srOnly:{position:"absolute",height:1,width:1,overflow:"hidden"},alignLeft:{textAlign:"left"},alignCenter:{textAlign:"center"},alignRight:{textAlign:"right"},alignJustify:{textAlign:"justify"},noWrap:{overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap"},gutterBottom:{marginBottom:"0.35em"},paragraph:{marginBottom:16},colorInherit:{color:"inherit"},colorPrimary:{color:e.palette.primary.main},colorSecondary:{color:e.palette.secondary.main},colorTextPrimary:{color:e.palette.text.primary},colorTextSecondary:{color:e.palette.text.secondary},colorError:{color:e.palette.error.main},displayInline:{display:"inline"},displayBlock:{display:"block"}}}),{name:"MuiTypography"})(U);var K=n(7860);function X(e){var t=e.props,n=e.states,r=e.muiFormControl;return n.reduce((function(e,n){return e[n]=t[n],r&&void 0===t[n]&&(e[n]=r[n]),e}),{})}var Q=e.createContext();const Y=Q;var G=n(1198);function J(e,t){return parseInt(e[t],10)||0}var Z="undefined"!=typeof window?e.useLayoutEffect:e.useEffect,ee={visibility:"hidden",position:"absolute",overflow:"hidden",height:0,top:0,left:0,transform:"translateZ(0)"};const te=e.forwardRef((function(t,n){var o=t.onChange,i=t.rows,l=t.rowsMax,s=t.rowsMin,u=t.maxRows,c=t.minRows,d=void 0===c?1:c,f=t.style,p=t.value,m=(0,a.A)(t,["onChange","rows","rowsMax","rowsMin","maxRows","minRows","style","value"]),h=u||l,v=i||s||d,g=e.useRef(null!=p).current,y=e.useRef(null),b=(0,k.A)(n,y),x=e.useRef(null),w=e.useRef(0),E=e.useState({}),S=E[0],A=E[1],C=e.useCallback((function(){var e=y.current,n=window.getComputedStyle(e),r=x.current;r.style.width=n.width,r.value=e.value||t.placeholder||"x","\n"===r.value.slice(-1)&&(r.value+=" ");var o=n["box-sizing"],a=J(n,"padding-bottom")+J(n,"padding-top"),i=J(n,"border-bottom-width")+J(n,"border-top-width"),l=r.scrollHeight-a;r.value="x";var s=r.scrollHeight-a,u=l;v&&(u=Math.max(Number(v)*s,u)),h&&(u=Math.min(Number(h)*s,u));var c=(u=Math.max(u,s))+("border-box"===o?a+i:0),d=Math.abs(u-l)<=1;A((function(e){return w.current<20&&(c>0&&Math.abs((e.outerHeightStyle||0)-c)>1||e.overflow!==d)?(w.current+=1,{overflow:d,outerHeightStyle:c}):e}))}),[h,v,t.placeholder]);return e.useEffect((function(){var e=(0,G.A)((function(){w.current=0,C()}));return window.addEventListener("resize",e),function(){e.clear(),window.removeEventListener("resize",e)}}),[C]),Z((function(){C()})),e.useEffect((function(){w.current=0}),[p]),e.createElement(e.Fragment,null,e.createElement("textarea",(0,r.A)({value:p,onChange:function(e){w.current=0,g||C(),o&&o(e)},ref:b,rows:v,style:(0,r.A)({height:S.outerHeightStyle,overflow:S.overflow?"hidden":null},f)},m)),e.createElement("textarea",{"aria-hidden":!0,className:t.className,readOnly:!0,ref:x,tabIndex:-1,style:(0,r.A)({},ee,f)}))}));function ne(e){return null!=e&&!(Array.isArray(e)&&0===e.length)}function re(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1];return e&&(ne(e.value)&&""!==e.value||t&&ne(e.defaultValue)&&""!==e.defaultValue)}var oe="undefined"==typeof window?e.useEffect:e.useLayoutEffect,ae=e.forwardRef((function(t,n){var o=t["aria-describedby"],i=t.autoComplete,l=t.autoFocus,s=t.classes,u=t.className,c=(t.color,t.defaultValue),d=t.disabled,f=t.endAdornment,p=(t.error,t.fullWidth),m=void 0!==p&&p,h=t.id,v=t.inputComponent,g=void 0===v?"input":v,y=t.inputProps,b=void 0===y?{}:y,x=t.inputRef,w=(t.margin,t.multiline),E=void 0!==w&&w,S=t.name,A=t.onBlur,C=t.onChange,R=t.onClick,T=t.onFocus,N=t.onKeyDown,O=t.onKeyUp,M=t.placeholder,L=t.readOnly,z=t.renderSuffix,_=t.rows,I=t.rowsMax,D=t.rowsMin,F=t.maxRows,j=t.minRows,B=t.startAdornment,W=t.type,$=void 0===W?"text":W,H=t.value,U=(0,a.A)(t,["aria-describedby","autoComplete","autoFocus","classes","className","color","defaultValue","disabled","endAdornment","error","fullWidth","id","inputComponent","inputProps","inputRef","margin","multiline","name","onBlur","onChange","onClick","onFocus","onKeyDown","onKeyUp","placeholder","readOnly","renderSuffix","rows","rowsMax","rowsMin","maxRows","minRows","startAdornment","type","value"]),q=null!=b.value?b.value:H,G=e.useRef(null!=q).current,J=e.useRef(),Z=e.useCallback((function(e){}),[]),ee=(0,k.A)(b.ref,Z),ne=(0,k.A)(x,ee),ae=(0,k.A)(J,ne),ie=e.useState(!1),le=ie[0],se=ie[1],ue=e.useContext(Q),ce=X({props:t,muiFormControl:ue,states:["color","disabled","error","hiddenLabel","margin","required","filled"]});ce.focused=ue?ue.focused:le,e.useEffect((function(){!ue&&d&&le&&(se(!1),A&&A())}),[ue,d,le,A]);var de=ue&&ue.onFilled,fe=ue&&ue.onEmpty,pe=e.useCallback((function(e){re(e)?de&&de():fe&&fe()}),[de,fe]);oe((function(){G&&pe({value:q})}),[q,pe,G]),e.useEffect((function(){pe(J.current)}),[]);var me=g,he=(0,r.A)({},b,{ref:ae});return"string"!=typeof me?he=(0,r.A)({inputRef:ae,type:$},he,{ref:null}):E?!_||F||j||I||D?(he=(0,r.A)({minRows:_||j,rowsMax:I,maxRows:F},he),me=te):me="textarea":he=(0,r.A)({type:$},he),e.useEffect((function(){ue&&ue.setAdornedStart(Boolean(B))}),[ue,B]),e.createElement("div",(0,r.A)({className:(0,P.A)(s.root,s["color".concat((0,V.A)(ce.color||"primary"))],u,ce.disabled&&s.disabled,ce.error&&s.error,m&&s.fullWidth,ce.focused&&s.focused,ue&&s.formControl,E&&s.multiline,B&&s.adornedStart,f&&s.adornedEnd,"dense"===ce.margin&&s.marginDense),onClick:function(e){J.current&&e.currentTarget===e.target&&J.current.focus(),R&&R(e)},ref:n},U),B,e.createElement(Y.Provider,{value:null},e.createElement(me,(0,r.A)({"aria-invalid":ce.error,"aria-describedby":o,autoComplete:i,autoFocus:l,defaultValue:c,disabled:ce.disabled,id:h,onAnimationStart:function(e){pe("mui-auto-fill-cancel"===e.animationName?J.current:{value:"x"})},name:S,placeholder:M,readOnly:L,required:ce.required,rows:_,value:q,onKeyDown:N,onKeyUp:O},he,{className:(0,P.A)(s.input,b.className,ce.disabled&&s.disabled,E&&s.inputMultiline,ce.hiddenLabel&&s.inputHiddenLabel,B&&s.inputAdornedStart,f&&s.inputAdornedEnd,"search"===$&&s.inputTypeSearch,"dense"===ce.margin&&s.inputMarginDense),onBlur:function(e){A&&A(e),b.onBlur&&b.onBlur(e),ue&&ue.onBlur?ue.onBlur(e):se(!1)},onChange:function(e){if(!G){var t=e.target||J.current;if(null==t)throw new Error((0,K.A)(1));pe({value:t.value})}for(var n=arguments.length,r=new Array(n>1?n-1:0),o=1;o<n;o++)r[o-1]=arguments[o];b.onChange&&b.onChange.apply(b,[e].concat(r)),C&&C.apply(void 0,[e].concat(r))},onFocus:function(e){ce.disabled?e.stopPropagation():(T&&T(e),b.onFocus&&b.onFocus(e),ue&&ue.onFocus?ue.onFocus(e):se(!0))}}))),f,z?z((0,r.A)({},ce,{startAdornment:B})):null)}));const ie=(0,T.A)((function(e){var t="light"===e.palette.type,n={color:"currentColor",opacity:t?.42:.5,transition:e.transitions.create("opacity",{duration:e.transitions.duration.shorter})},o={opacity:"0 !important"},a={opacity:t?.42:.5};return{"@global":{"@keyframes mui-auto-fill":{},"@keyframes mui-auto-fill-cancel":{}},root:(0,r.A)({},e.typography.body1,{color:e.palette.text.primary,lineHeight:"1.1876em",boxSizing:"border-box",position:"relative",cursor:"text",display:"inline-flex",alignItems:"center","&$disabled":{color:e.palette.text.disabled,cursor:"default"}}),formControl:{},focused:{},disabled:{},adornedStart:{},adornedEnd:{},error:{},marginDense:{},multiline:{padding:"".concat(6,"px 0 ").concat(7,"px"),"&$marginDense":{paddingTop:3}},colorSecondary:{},fullWidth:{width:"100%"},input:{font:"inherit",letterSpacing:"inherit",color:"currentColor",padding:"".concat(6,"px 0 ").concat(7,"px"),border:0,boxSizing:"content-box",background:"none",height:"1.1876em",margin:0,WebkitTapHighlightColor:"transparent",display:"block",minWidth:0,width:"100%",animationName:"mui-auto-fill-cancel",animationDuration:"10ms","&::-webkit-input-placeholder":n,"&::-moz-placeholder":n,"&:-ms-input-placeholder":n,"&::-ms-input-placeholder":n,"&:focus":{outline:0},"&:invalid":{boxShadow:"none"},"&::-webkit-search-decoration":{"-webkit-appearance":"none"},"label[data-shrink=false] + $formControl &":{"&::-webkit-input-placeholder":o,"&::-moz-placeholder":o,"&:-ms-input-placeholder":o,"&::-ms-input-placeholder":o,"&:focus::-webkit-input-placeholder":a,"&:focus::-moz-placeholder":a,"&:focus:-ms-input-placeholder":a,"&:focus::-ms-input-placeholder":a},"&$disabled":{opacity:1},"&:-webkit-autofill":{animationDuration:"5000s",animationName:"mui-auto-fill"}},inputMarginDense:{paddingTop:3},inputMultiline:{height:"auto",resize:"none",padding:0},inputTypeSearch:{"-moz-appearance":"textfield","-webkit-appearance":"textfield"},inputAdornedStart:{},inputAdornedEnd:{},inputHiddenLabel:{}}}),{name:"MuiInputBase"})(ae);var le=e.forwardRef((function(t,n){var o=t.disableUnderline,i=t.classes,l=t.fullWidth,s=void 0!==l&&l,u=t.inputComponent,c=void 0===u?"input":u,d=t.multiline,f=void 0!==d&&d,p=t.type,m=void 0===p?"text":p,h=(0,a.A)(t,["disableUnderline","classes","fullWidth","inputComponent","multiline","type"]);return e.createElement(ie,(0,r.A)({classes:(0,r.A)({},i,{root:(0,P.A)(i.root,!o&&i.underline),underline:null}),fullWidth:s,inputComponent:c,multiline:f,ref:n,type:m},h))}));le.muiName="Input";const se=(0,T.A)((function(e){var t="light"===e.palette.type?"rgba(0, 0, 0, 0.42)":"rgba(255, 255, 255, 0.7)";return{root:{position:"relative"},formControl:{"label + &":{marginTop:16}},focused:{},disabled:{},colorSecondary:{"&$underline:after":{borderBottomColor:e.palette.secondary.main}},underline:{"&:after":{borderBottom:"2px solid ".concat(e.palette.primary.main),left:0,bottom:0,content:'""',position:"absolute",right:0,transform:"scaleX(0)",transition:e.transitions.create("transform",{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut}),pointerEvents:"none"},"&$focused:after":{transform:"scaleX(1)"},"&$error:after":{borderBottomColor:e.palette.error.main,transform:"scaleX(1)"},"&:before":{borderBottom:"1px solid ".concat(t),left:0,bottom:0,content:'"\\00a0"',position:"absolute",right:0,transition:e.transitions.create("border-bottom-color",{duration:e.transitions.duration.shorter}),pointerEvents:"none"},"&:hover:not($disabled):before":{borderBottom:"2px solid ".concat(e.palette.text.primary),"@media (hover: none)":{borderBottom:"1px solid ".concat(t)}},"&$disabled:before":{borderBottomStyle:"dotted"}},error:{},marginDense:{},multiline:{},fullWidth:{},input:{},inputMarginDense:{},inputMultiline:{},inputTypeSearch:{}}}),{name:"MuiInput"})(le);var ue=e.forwardRef((function(t,n){var o=t.disableUnderline,i=t.classes,l=t.fullWidth,s=void 0!==l&&l,u=t.inputComponent,c=void 0===u?"input":u,d=t.multiline,f=void 0!==d&&d,p=t.type,m=void 0===p?"text":p,h=(0,a.A)(t,["disableUnderline","classes","fullWidth","inputComponent","multiline","type"]);return e.createElement(ie,(0,r.A)({classes:(0,r.A)({},i,{root:(0,P.A)(i.root,!o&&i.underline),underline:null}),fullWidth:s,inputComponent:c,multiline:f,ref:n,type:m},h))}));ue.muiName="Input";const ce=(0,T.A)((function(e){var t="light"===e.palette.type,n=t?"rgba(0, 0, 0, 0.42)":"rgba(255, 255, 255, 0.7)",r=t?"rgba(0, 0, 0, 0.09)":"rgba(255, 255, 255, 0.09)";return{root:{position:"relative",backgroundColor:r,borderTopLeftRadius:e.shape.borderRadius,borderTopRightRadius:e.shape.borderRadius,transition:e.transitions.create("background-color",{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut}),"&:hover":{backgroundColor:t?"rgba(0, 0, 0, 0.13)":"rgba(255, 255, 255, 0.13)","@media (hover: none)":{backgroundColor:r}},"&$focused":{backgroundColor:t?"rgba(0, 0, 0, 0.09)":"rgba(255, 255, 255, 0.09)"},"&$disabled":{backgroundColor:t?"rgba(0, 0, 0, 0.12)":"rgba(255, 255, 255, 0.12)"}},colorSecondary:{"&$underline:after":{borderBottomColor:e.palette.secondary.main}},underline:{"&:after":{borderBottom:"2px solid ".concat(e.palette.primary.main),left:0,bottom:0,content:'""',position:"absolute",right:0,transform:"scaleX(0)",transition:e.transitions.create("transform",{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut}),pointerEvents:"none"},"&$focused:after":{transform:"scaleX(1)"},"&$error:after":{borderBottomColor:e.palette.error.main,transform:"scaleX(1)"},"&:before":{borderBottom:"1px solid ".concat(n),left:0,bottom:0,content:'"\\00a0"',position:"absolute",right:0,transition:e.transitions.create("border-bottom-color",{duration:e.transitions.duration.shorter}),pointerEvents:"none"},"&:hover:before":{borderBottom:"1px solid ".concat(e.palette.text.primary)},"&$disabled:before":{borderBottomStyle:"dotted"}},focused:{},disabled:{},adornedStart:{paddingLeft:12},adornedEnd:{paddingRight:12},error:{},marginDense:{},multiline:{padding:"27px 12px 10px","&$marginDense":{paddingTop:23,paddingBottom:6}},input:{padding:"27px 12px 10px","&:-webkit-autofill":{WebkitBoxShadow:"light"===e.palette.type?null:"0 0 0 100px #266798 inset",WebkitTextFillColor:"light"===e.palette.type?null:"#fff",caretColor:"light"===e.palette.type?null:"#fff",borderTopLeftRadius:"inherit",borderTopRightRadius:"inherit"}},inputMarginDense:{paddingTop:23,paddingBottom:6},inputHiddenLabel:{paddingTop:18,paddingBottom:19,"&$inputMarginDense":{paddingTop:10,paddingBottom:11}},inputMultiline:{padding:0},inputAdornedStart:{paddingLeft:0},inputAdornedEnd:{paddingRight:0}}}),{name:"MuiFilledInput"})(ue);var de=n(4467),fe=e.forwardRef((function(t,n){t.children;var o=t.classes,i=t.className,l=t.label,s=t.labelWidth,u=t.notched,c=t.style,d=(0,a.A)(t,["children","classes","className","label","labelWidth","notched","style"]),f="rtl"===x().direction?"right":"left";if(void 0!==l)return e.createElement("fieldset",(0,r.A)({"aria-hidden":!0,className:(0,P.A)(o.root,i),ref:n,style:c},d),e.createElement("legend",{className:(0,P.A)(o.legendLabelled,u&&o.legendNotched)},l?e.createElement("span",null,l):e.createElement("span",{dangerouslySetInnerHTML:{__html:"&#8203;"}})));var p=s>0?.75*s+8:.01;return e.createElement("fieldset",(0,r.A)({"aria-hidden":!0,style:(0,r.A)((0,de.A)({},"padding".concat((0,V.A)(f)),8),c),className:(0,P.A)(o.root,i),ref:n},d),e.createElement("legend",{className:o.legend,style:{width:u?p:.01}},e.createElement("span",{dangerouslySetInnerHTML:{__html:"&#8203;"}})))}));const pe=(0,T.A)((function(e){return{root:{position:"absolute",bottom:0,right:0,top:-5,left:0,margin:0,padding:"0 8px",pointerEvents:"none",borderRadius:"inherit",borderStyle:"solid",borderWidth:1,overflow:"hidden"},legend:{textAlign:"left",padding:0,lineHeight:"11px",transition:e.transitions.create("width",{duration:150,easing:e.transitions.easing.easeOut})},legendLabelled:{display:"block",width:"auto",textAlign:"left",padding:0,height:11,fontSize:"0.75em",visibility:"hidden",maxWidth:.01,transition:e.transitions.create("max-width",{duration:50,easing:e.transitions.easing.easeOut}),"& > span":{paddingLeft:5,paddingRight:5,display:"inline-block"}},legendNotched:{maxWidth:1e3,transition:e.transitions.create("max-width",{duration:100,easing:e.transitions.easing.easeOut,delay:50})}}}),{name:"PrivateNotchedOutline"})(fe);var me=e.forwardRef((function(t,n){var o=t.classes,i=t.fullWidth,l=void 0!==i&&i,s=t.inputComponent,u=void 0===s?"input":s,c=t.label,d=t.labelWidth,f=void 0===d?0:d,p=t.multiline,m=void 0!==p&&p,h=t.notched,v=t.type,g=void 0===v?"text":v,y=(0,a.A)(t,["classes","fullWidth","inputComponent","label","labelWidth","multiline","notched","type"]);return e.createElement(ie,(0,r.A)({renderSuffix:function(t){return e.createElement(pe,{className:o.notchedOutline,label:c,labelWidth:f,notched:void 0!==h?h:Boolean(t.startAdornment||t.filled||t.focused)})},classes:(0,r.A)({},o,{root:(0,P.A)(o.root,o.underline),notchedOutline:null}),fullWidth:l,inputComponent:u,multiline:m,ref:n,type:g},y))}));me.muiName="Input";const he=(0,T.A)((function(e){var t="light"===e.palette.type?"rgba(0, 0, 0, 0.23)":"rgba(255, 255, 255, 0.23)";return{root:{position:"relative",borderRadius:e.shape.borderRadius,"&:hover $notchedOutline":{borderColor:e.palette.text.primary},"@media (hover: none)":{"&:hover $notchedOutline":{borderColor:t}},"&$focused $notchedOutline":{borderColor:e.palette.primary.main,borderWidth:2},"&$error $notchedOutline":{borderColor:e.palette.error.main},"&$disabled $notchedOutline":{borderColor:e.palette.action.disabled}},colorSecondary:{"&$focused $notchedOutline":{borderColor:e.palette.secondary.main}},focused:{},disabled:{},adornedStart:{paddingLeft:14},adornedEnd:{paddingRight:14},error:{},marginDense:{},multiline:{padding:"18.5px 14px","&$marginDense":{paddingTop:10.5,paddingBottom:10.5}},notchedOutline:{borderColor:t},input:{padding:"18.5px 14px","&:-webkit-autofill":{WebkitBoxShadow:"light"===e.palette.type?null:"0 0 0 100px #266798 inset",WebkitTextFillColor:"light"===e.palette.type?null:"#fff",caretColor:"light"===e.palette.type?null:"#fff",borderRadius:"inherit"}},inputMarginDense:{paddingTop:10.5,paddingBottom:10.5},inputMultiline:{padding:0},inputAdornedStart:{paddingLeft:0},inputAdornedEnd:{paddingRight:0}}}),{name:"MuiOutlinedInput"})(me);function ve(){return e.useContext(Y)}var ge=e.forwardRef((function(t,n){var o=t.children,i=t.classes,l=t.className,s=(t.color,t.component),u=void 0===s?"label":s,c=(t.disabled,t.error,t.filled,t.focused,t.required,(0,a.A)(t,["children","classes","className","color","component","disabled","error","filled","focused","required"])),d=X({props:t,muiFormControl:ve(),states:["color","required","focused","disabled","error","filled"]});return e.createElement(u,(0,r.A)({className:(0,P.A)(i.root,i["color".concat((0,V.A)(d.color||"primary"))],l,d.disabled&&i.disabled,d.error&&i.error,d.filled&&i.filled,d.focused&&i.focused,d.required&&i.required),ref:n},c),o,d.required&&e.createElement("span",{"aria-hidden":!0,className:(0,P.A)(i.asterisk,d.error&&i.error)}," ","*"))}));const ye=(0,T.A)((function(e){return{root:(0,r.A)({color:e.palette.text.secondary},e.typography.body1,{lineHeight:1,padding:0,"&$focused":{color:e.palette.primary.main},"&$disabled":{color:e.palette.text.disabled},"&$error":{color:e.palette.error.main}}),colorSecondary:{"&$focused":{color:e.palette.secondary.main}},focused:{},disabled:{},error:{},filled:{},required:{},asterisk:{"&$error":{color:e.palette.error.main}}}}),{name:"MuiFormLabel"})(ge);var be=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.disableAnimation,s=void 0!==l&&l,u=(t.margin,t.shrink),c=(t.variant,(0,a.A)(t,["classes","className","disableAnimation","margin","shrink","variant"])),d=ve(),f=u;void 0===f&&d&&(f=d.filled||d.focused||d.adornedStart);var p=X({props:t,muiFormControl:d,states:["margin","variant"]});return e.createElement(ye,(0,r.A)({"data-shrink":f,className:(0,P.A)(o.root,i,d&&o.formControl,!s&&o.animated,f&&o.shrink,"dense"===p.margin&&o.marginDense,{filled:o.filled,outlined:o.outlined}[p.variant]),classes:{focused:o.focused,disabled:o.disabled,error:o.error,required:o.required,asterisk:o.asterisk},ref:n},c))}));const xe=(0,T.A)((function(e){return{root:{display:"block",transformOrigin:"top left"},focused:{},disabled:{},error:{},required:{},asterisk:{},formControl:{position:"absolute",left:0,top:0,transform:"translate(0, 24px) scale(1)"},marginDense:{transform:"translate(0, 21px) scale(1)"},shrink:{transform:"translate(0, 1.5px) scale(0.75)",transformOrigin:"top left"},animated:{transition:e.transitions.create(["color","transform"],{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut})},filled:{zIndex:1,pointerEvents:"none",transform:"translate(12px, 20px) scale(1)","&$marginDense":{transform:"translate(12px, 17px) scale(1)"},"&$shrink":{transform:"translate(12px, 10px) scale(0.75)","&$marginDense":{transform:"translate(12px, 7px) scale(0.75)"}}},outlined:{zIndex:1,pointerEvents:"none",transform:"translate(14px, 20px) scale(1)","&$marginDense":{transform:"translate(14px, 12px) scale(1)"},"&$shrink":{transform:"translate(14px, -6px) scale(0.75)"}}}}),{name:"MuiInputLabel"})(be);var we=n(7570),Ee=e.forwardRef((function(t,n){var o=t.children,i=t.classes,l=t.className,s=t.color,u=void 0===s?"primary":s,c=t.component,d=void 0===c?"div":c,f=t.disabled,p=void 0!==f&&f,m=t.error,h=void 0!==m&&m,v=t.fullWidth,g=void 0!==v&&v,y=t.focused,b=t.hiddenLabel,x=void 0!==b&&b,w=t.margin,E=void 0===w?"none":w,k=t.required,S=void 0!==k&&k,A=t.size,C=t.variant,R=void 0===C?"standard":C,T=(0,a.A)(t,["children","classes","className","color","component","disabled","error","fullWidth","focused","hiddenLabel","margin","required","size","variant"]),N=e.useState((function(){var t=!1;return o&&e.Children.forEach(o,(function(e){if((0,we.A)(e,["Input","Select"])){var n=(0,we.A)(e,["Select"])?e.props.input:e;n&&n.props.startAdornment&&(t=!0)}})),t})),O=N[0],M=N[1],L=e.useState((function(){var t=!1;return o&&e.Children.forEach(o,(function(e){(0,we.A)(e,["Input","Select"])&&re(e.props,!0)&&(t=!0)})),t})),z=L[0],_=L[1],I=e.useState(!1),D=I[0],F=I[1],j=void 0!==y?y:D;p&&j&&F(!1);var B=e.useCallback((function(){_(!0)}),[]),W={adornedStart:O,setAdornedStart:M,color:u,disabled:p,error:h,filled:z,focused:j,fullWidth:g,hiddenLabel:x,margin:("small"===A?"dense":void 0)||E,onBlur:function(){F(!1)},onEmpty:e.useCallback((function(){_(!1)}),[]),onFilled:B,onFocus:function(){F(!0)},registerEffect:void 0,required:S,variant:R};return e.createElement(Y.Provider,{value:W},e.createElement(d,(0,r.A)({className:(0,P.A)(i.root,l,"none"!==E&&i["margin".concat((0,V.A)(E))],g&&i.fullWidth),ref:n},T),o))}));const ke=(0,T.A)({root:{display:"inline-flex",flexDirection:"column",position:"relative",minWidth:0,padding:0,margin:0,border:0,verticalAlign:"top"},marginNormal:{marginTop:16,marginBottom:8},marginDense:{marginTop:8,marginBottom:4},fullWidth:{width:"100%"}},{name:"MuiFormControl"})(Ee);var Se=e.forwardRef((function(t,n){var o=t.children,i=t.classes,l=t.className,s=t.component,u=void 0===s?"p":s,c=(t.disabled,t.error,t.filled,t.focused,t.margin,t.required,t.variant,(0,a.A)(t,["children","classes","className","component","disabled","error","filled","focused","margin","required","variant"])),d=X({props:t,muiFormControl:ve(),states:["variant","margin","disabled","error","filled","focused","required"]});return e.createElement(u,(0,r.A)({className:(0,P.A)(i.root,("filled"===d.variant||"outlined"===d.variant)&&i.contained,l,d.disabled&&i.disabled,d.error&&i.error,d.filled&&i.filled,d.focused&&i.focused,d.required&&i.required,"dense"===d.margin&&i.marginDense),ref:n},c)," "===o?e.createElement("span",{dangerouslySetInnerHTML:{__html:"&#8203;"}}):o)}));const Ae=(0,T.A)((function(e){return{root:(0,r.A)({color:e.palette.text.secondary},e.typography.caption,{textAlign:"left",marginTop:3,margin:0,"&$disabled":{color:e.palette.text.disabled},"&$error":{color:e.palette.error.main}}),error:{},disabled:{},marginDense:{marginTop:4},contained:{marginLeft:14,marginRight:14},focused:{},filled:{},required:{}}}),{name:"MuiFormHelperText"})(Se);var Ce=n(3043),Re=n(2284),Pe=(n(4363),n(1475)),Te=n(6182),Ne=n(8521),Oe=n(6081),Me=n(4960),Le="undefined"!=typeof window?e.useLayoutEffect:e.useEffect;const ze=e.forwardRef((function(n,r){var o=n.children,a=n.container,i=n.disablePortal,l=void 0!==i&&i,s=n.onRendered,u=e.useState(null),c=u[0],d=u[1],f=(0,k.A)(e.isValidElement(o)?o.ref:null,r);return Le((function(){l||d(function(e){return e="function"==typeof e?e():e,t.findDOMNode(e)}(a)||document.body)}),[a,l]),Le((function(){if(c&&!l)return(0,Me.A)(r,c),function(){(0,Me.A)(r,null)}}),[r,c,l]),Le((function(){s&&(c||l)&&s()}),[s,c,l]),l?e.isValidElement(o)?e.cloneElement(o,{ref:f}):o:c?t.createPortal(o,c):c}));var _e=n(2319),Ie=n(9474),De=n(2901),Fe=n(5458);function je(){var e=document.createElement("div");e.style.width="99px",e.style.height="99px",e.style.position="absolute",e.style.top="-9999px",e.style.overflow="scroll",document.body.appendChild(e);var t=e.offsetWidth-e.clientWidth;return document.body.removeChild(e),t}function Be(e,t){t?e.setAttribute("aria-hidden","true"):e.removeAttribute("aria-hidden")}function We(e){return parseInt(window.getComputedStyle(e)["padding-right"],10)||0}function $e(e,t,n){var r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:[],o=arguments.length>4?arguments[4]:void 0,a=[t,n].concat((0,Fe.A)(r)),i=["TEMPLATE","SCRIPT","STYLE"];[].forEach.call(e.children,(function(e){1===e.nodeType&&-1===a.indexOf(e)&&-1===i.indexOf(e.tagName)&&Be(e,o)}))}function Ve(e,t){var n=-1;return e.some((function(e,r){return!!t(e)&&(n=r,!0)})),n}var He=function(){function e(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.modals=[],this.containers=[]}return(0,De.A)(e,[{key:"add",value:function(e,t){var n=this.modals.indexOf(e);if(-1!==n)return n;n=this.modals.length,this.modals.push(e),e.modalRef&&Be(e.modalRef,!1);var r=function(e){var t=[];return[].forEach.call(e.children,(function(e){e.getAttribute&&"true"===e.getAttribute("aria-hidden")&&t.push(e)})),t}(t);$e(t,e.mountNode,e.modalRef,r,!0);var o=Ve(this.containers,(function(e){return e.container===t}));return-1!==o?(this.containers[o].modals.push(e),n):(this.containers.push({modals:[e],container:t,restore:null,hiddenSiblingNodes:r}),n)}},{key:"mount",value:function(e,t){var n=Ve(this.containers,(function(t){return-1!==t.modals.indexOf(e)})),r=this.containers[n];r.restore||(r.restore=function(e,t){var n,r=[],o=[],a=e.container;if(!t.disableScrollLock){if(function(e){var t=(0,Pe.A)(e);return t.body===e?(0,Te.A)(t).innerWidth>t.documentElement.clientWidth:e.scrollHeight>e.clientHeight}(a)){var i=je();r.push({value:a.style.paddingRight,key:"padding-right",el:a}),a.style["padding-right"]="".concat(We(a)+i,"px"),n=(0,Pe.A)(a).querySelectorAll(".mui-fixed"),[].forEach.call(n,(function(e){o.push(e.style.paddingRight),e.style.paddingRight="".concat(We(e)+i,"px")}))}var l=a.parentElement,s="HTML"===l.nodeName&&"scroll"===window.getComputedStyle(l)["overflow-y"]?l:a;r.push({value:s.style.overflow,key:"overflow",el:s}),s.style.overflow="hidden"}return function(){n&&[].forEach.call(n,(function(e,t){o[t]?e.style.paddingRight=o[t]:e.style.removeProperty("padding-right")})),r.forEach((function(e){var t=e.value,n=e.el,r=e.key;t?n.style.setProperty(r,t):n.style.removeProperty(r)}))}}(r,t))}},{key:"remove",value:function(e){var t=this.modals.indexOf(e);if(-1===t)return t;var n=Ve(this.containers,(function(t){return-1!==t.modals.indexOf(e)})),r=this.containers[n];if(r.modals.splice(r.modals.indexOf(e),1),this.modals.splice(t,1),0===r.modals.length)r.restore&&r.restore(),e.modalRef&&Be(e.modalRef,!0),$e(r.container,e.mountNode,e.modalRef,r.hiddenSiblingNodes,!1),this.containers.splice(n,1);else{var o=r.modals[r.modals.length-1];o.modalRef&&Be(o.modalRef,!1)}return t}},{key:"isTopModal",value:function(e){return this.modals.length>0&&this.modals[this.modals.length-1]===e}}]),e}();const Ue=function(n){var r=n.children,o=n.disableAutoFocus,a=void 0!==o&&o,i=n.disableEnforceFocus,l=void 0!==i&&i,s=n.disableRestoreFocus,u=void 0!==s&&s,c=n.getDoc,d=n.isEnabled,f=n.open,p=e.useRef(),m=e.useRef(null),h=e.useRef(null),v=e.useRef(),g=e.useRef(null),y=e.useCallback((function(e){g.current=t.findDOMNode(e)}),[]),b=(0,k.A)(r.ref,y),x=e.useRef();return e.useEffect((function(){x.current=f}),[f]),!x.current&&f&&"undefined"!=typeof window&&(v.current=c().activeElement),e.useEffect((function(){if(f){var e=(0,Pe.A)(g.current);a||!g.current||g.current.contains(e.activeElement)||(g.current.hasAttribute("tabIndex")||g.current.setAttribute("tabIndex",-1),g.current.focus());var t=function(){null!==g.current&&(e.hasFocus()&&!l&&d()&&!p.current?g.current&&!g.current.contains(e.activeElement)&&g.current.focus():p.current=!1)},n=function(t){!l&&d()&&9===t.keyCode&&e.activeElement===g.current&&(p.current=!0,t.shiftKey?h.current.focus():m.current.focus())};e.addEventListener("focus",t,!0),e.addEventListener("keydown",n,!0);var r=setInterval((function(){t()}),50);return function(){clearInterval(r),e.removeEventListener("focus",t,!0),e.removeEventListener("keydown",n,!0),u||(v.current&&v.current.focus&&v.current.focus(),v.current=null)}}}),[a,l,u,d,f]),e.createElement(e.Fragment,null,e.createElement("div",{tabIndex:0,ref:m,"data-test":"sentinelStart"}),e.cloneElement(r,{ref:b}),e.createElement("div",{tabIndex:0,ref:h,"data-test":"sentinelEnd"}))};var qe={root:{zIndex:-1,position:"fixed",right:0,bottom:0,top:0,left:0,backgroundColor:"rgba(0, 0, 0, 0.5)",WebkitTapHighlightColor:"transparent"},invisible:{backgroundColor:"transparent"}};const Ke=e.forwardRef((function(t,n){var o=t.invisible,i=void 0!==o&&o,l=t.open,s=(0,a.A)(t,["invisible","open"]);return l?e.createElement("div",(0,r.A)({"aria-hidden":!0,ref:n},s,{style:(0,r.A)({},qe.root,i?qe.invisible:{},s.style)})):null}));var Xe=new He;const Qe=e.forwardRef((function(n,o){var i=(0,y.A)(),l=(0,Oe.A)({name:"MuiModal",props:(0,r.A)({},n),theme:i}),s=l.BackdropComponent,u=void 0===s?Ke:s,c=l.BackdropProps,d=l.children,f=l.closeAfterTransition,p=void 0!==f&&f,m=l.container,h=l.disableAutoFocus,v=void 0!==h&&h,g=l.disableBackdropClick,b=void 0!==g&&g,x=l.disableEnforceFocus,w=void 0!==x&&x,E=l.disableEscapeKeyDown,S=void 0!==E&&E,A=l.disablePortal,C=void 0!==A&&A,R=l.disableRestoreFocus,P=void 0!==R&&R,T=l.disableScrollLock,N=void 0!==T&&T,O=l.hideBackdrop,M=void 0!==O&&O,L=l.keepMounted,z=void 0!==L&&L,_=l.manager,I=void 0===_?Xe:_,D=l.onBackdropClick,F=l.onClose,j=l.onEscapeKeyDown,B=l.onRendered,W=l.open,$=(0,a.A)(l,["BackdropComponent","BackdropProps","children","closeAfterTransition","container","disableAutoFocus","disableBackdropClick","disableEnforceFocus","disableEscapeKeyDown","disablePortal","disableRestoreFocus","disableScrollLock","hideBackdrop","keepMounted","manager","onBackdropClick","onClose","onEscapeKeyDown","onRendered","open"]),V=e.useState(!0),H=V[0],U=V[1],q=e.useRef({}),K=e.useRef(null),X=e.useRef(null),Q=(0,k.A)(X,o),Y=function(e){return!!e.children&&e.children.props.hasOwnProperty("in")}(l),G=function(){return(0,Pe.A)(K.current)},J=function(){return q.current.modalRef=X.current,q.current.mountNode=K.current,q.current},Z=function(){I.mount(J(),{disableScrollLock:N}),X.current.scrollTop=0},ee=(0,_e.A)((function(){var e=function(e){return e="function"==typeof e?e():e,t.findDOMNode(e)}(m)||G().body;I.add(J(),e),X.current&&Z()})),te=e.useCallback((function(){return I.isTopModal(J())}),[I]),ne=(0,_e.A)((function(e){K.current=e,e&&(B&&B(),W&&te()?Z():Be(X.current,!0))})),re=e.useCallback((function(){I.remove(J())}),[I]);if(e.useEffect((function(){return function(){re()}}),[re]),e.useEffect((function(){W?ee():Y&&p||re()}),[W,re,Y,p,ee]),!z&&!W&&(!Y||H))return null;var oe=function(e){return{root:{position:"fixed",zIndex:e.zIndex.modal,right:0,bottom:0,top:0,left:0},hidden:{visibility:"hidden"}}}(i||{zIndex:Ie.A}),ae={};return void 0===d.props.tabIndex&&(ae.tabIndex=d.props.tabIndex||"-1"),Y&&(ae.onEnter=(0,Ne.A)((function(){U(!1)}),d.props.onEnter),ae.onExited=(0,Ne.A)((function(){U(!0),p&&re()}),d.props.onExited)),e.createElement(ze,{ref:ne,container:m,disablePortal:C},e.createElement("div",(0,r.A)({ref:Q,onKeyDown:function(e){"Escape"===e.key&&te()&&(j&&j(e),S||(e.stopPropagation(),F&&F(e,"escapeKeyDown")))},role:"presentation"},$,{style:(0,r.A)({},oe.root,!W&&H?oe.hidden:{},$.style)}),M?null:e.createElement(u,(0,r.A)({open:W,onClick:function(e){e.target===e.currentTarget&&(D&&D(e),!b&&F&&F(e,"backdropClick"))}},c)),e.createElement(Ue,{disableEnforceFocus:w,disableAutoFocus:v,disableRestoreFocus:P,getDoc:G,isEnabled:te,open:W},e.cloneElement(d,ae))))}));function Ye(e){return"scale(".concat(e,", ").concat(Math.pow(e,2),")")}var Ge={entering:{opacity:1,transform:Ye(1)},entered:{opacity:1,transform:"none"}},Je=e.forwardRef((function(t,n){var i=t.children,l=t.disableStrictModeCompat,s=void 0!==l&&l,u=t.in,c=t.onEnter,d=t.onEntered,f=t.onEntering,p=t.onExit,m=t.onExited,h=t.onExiting,g=t.style,y=t.timeout,b=void 0===y?"auto":y,S=t.TransitionComponent,A=void 0===S?v:S,C=(0,a.A)(t,["children","disableStrictModeCompat","in","onEnter","onEntered","onEntering","onExit","onExited","onExiting","style","timeout","TransitionComponent"]),R=e.useRef(),P=e.useRef(),T=x(),N=T.unstable_strictMode&&!s,O=e.useRef(null),M=(0,k.A)(i.ref,n),L=(0,k.A)(N?O:void 0,M),z=function(e){return function(t,n){if(e){var r=N?[O.current,t]:[t,n],a=(0,o.A)(r,2),i=a[0],l=a[1];void 0===l?e(i):e(i,l)}}},_=z(f),I=z((function(e,t){w(e);var n,r=E({style:g,timeout:b},{mode:"enter"}),o=r.duration,a=r.delay;"auto"===b?(n=T.transitions.getAutoHeightDuration(e.clientHeight),P.current=n):n=o,e.style.transition=[T.transitions.create("opacity",{duration:n,delay:a}),T.transitions.create("transform",{duration:.666*n,delay:a})].join(","),c&&c(e,t)})),D=z(d),F=z(h),j=z((function(e){var t,n=E({style:g,timeout:b},{mode:"exit"}),r=n.duration,o=n.delay;"auto"===b?(t=T.transitions.getAutoHeightDuration(e.clientHeight),P.current=t):t=r,e.style.transition=[T.transitions.create("opacity",{duration:t,delay:o}),T.transitions.create("transform",{duration:.666*t,delay:o||.333*t})].join(","),e.style.opacity="0",e.style.transform=Ye(.75),p&&p(e)})),B=z(m);return e.useEffect((function(){return function(){clearTimeout(R.current)}}),[]),e.createElement(A,(0,r.A)({appear:!0,in:u,nodeRef:N?O:void 0,onEnter:I,onEntered:D,onEntering:_,onExit:j,onExited:B,onExiting:F,addEndListener:function(e,t){var n=N?e:t;"auto"===b&&(R.current=setTimeout(n,P.current||0))},timeout:"auto"===b?null:b},C),(function(t,n){return e.cloneElement(i,(0,r.A)({style:(0,r.A)({opacity:0,transform:Ye(.75),visibility:"exited"!==t||u?void 0:"hidden"},Ge[t],g,i.props.style),ref:L},n))}))}));Je.muiSupportAuto=!0;const Ze=Je;function et(e,t){var n=0;return"number"==typeof t?n=t:"center"===t?n=e.height/2:"bottom"===t&&(n=e.height),n}function tt(e,t){var n=0;return"number"==typeof t?n=t:"center"===t?n=e.width/2:"right"===t&&(n=e.width),n}function nt(e){return[e.horizontal,e.vertical].map((function(e){return"number"==typeof e?"".concat(e,"px"):e})).join(" ")}function rt(e){return"function"==typeof e?e():e}var ot=e.forwardRef((function(n,o){var i=n.action,l=n.anchorEl,s=n.anchorOrigin,u=void 0===s?{vertical:"top",horizontal:"left"}:s,c=n.anchorPosition,d=n.anchorReference,f=void 0===d?"anchorEl":d,p=n.children,m=n.classes,h=n.className,v=n.container,g=n.elevation,y=void 0===g?8:g,b=n.getContentAnchorEl,x=n.marginThreshold,w=void 0===x?16:x,E=n.onEnter,k=n.onEntered,S=n.onEntering,A=n.onExit,C=n.onExited,R=n.onExiting,T=n.open,N=n.PaperProps,M=void 0===N?{}:N,L=n.transformOrigin,z=void 0===L?{vertical:"top",horizontal:"left"}:L,_=n.TransitionComponent,I=void 0===_?Ze:_,D=n.transitionDuration,F=void 0===D?"auto":D,j=n.TransitionProps,B=void 0===j?{}:j,W=(0,a.A)(n,["action","anchorEl","anchorOrigin","anchorPosition","anchorReference","children","classes","className","container","elevation","getContentAnchorEl","marginThreshold","onEnter","onEntered","onEntering","onExit","onExited","onExiting","open","PaperProps","transformOrigin","TransitionComponent","transitionDuration","TransitionProps"]),$=e.useRef(),V=e.useCallback((function(e){if("anchorPosition"===f)return c;var t=rt(l),n=(t&&1===t.nodeType?t:(0,Pe.A)($.current).body).getBoundingClientRect(),r=0===e?u.vertical:"center";return{top:n.top+et(n,r),left:n.left+tt(n,u.horizontal)}}),[l,u.horizontal,u.vertical,c,f]),H=e.useCallback((function(e){var t=0;if(b&&"anchorEl"===f){var n=b(e);if(n&&e.contains(n)){var r=function(e,t){for(var n=t,r=0;n&&n!==e;)r+=(n=n.parentElement).scrollTop;return r}(e,n);t=n.offsetTop+n.clientHeight/2-r||0}}return t}),[u.vertical,f,b]),U=e.useCallback((function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;return{vertical:et(e,z.vertical)+t,horizontal:tt(e,z.horizontal)}}),[z.horizontal,z.vertical]),q=e.useCallback((function(e){var t=H(e),n={width:e.offsetWidth,height:e.offsetHeight},r=U(n,t);if("none"===f)return{top:null,left:null,transformOrigin:nt(r)};var o=V(t),a=o.top-r.vertical,i=o.left-r.horizontal,s=a+n.height,u=i+n.width,c=(0,Te.A)(rt(l)),d=c.innerHeight-w,p=c.innerWidth-w;if(a<w){var m=a-w;a-=m,r.vertical+=m}else if(s>d){var h=s-d;a-=h,r.vertical+=h}if(i<w){var v=i-w;i-=v,r.horizontal+=v}else if(u>p){var g=u-p;i-=g,r.horizontal+=g}return{top:"".concat(Math.round(a),"px"),left:"".concat(Math.round(i),"px"),transformOrigin:nt(r)}}),[l,f,V,H,U,w]),K=e.useCallback((function(){var e=$.current;if(e){var t=q(e);null!==t.top&&(e.style.top=t.top),null!==t.left&&(e.style.left=t.left),e.style.transformOrigin=t.transformOrigin}}),[q]),X=e.useCallback((function(e){$.current=t.findDOMNode(e)}),[]);e.useEffect((function(){T&&K()})),e.useImperativeHandle(i,(function(){return T?{updatePosition:function(){K()}}:null}),[T,K]),e.useEffect((function(){if(T){var e=(0,G.A)((function(){K()}));return window.addEventListener("resize",e),function(){e.clear(),window.removeEventListener("resize",e)}}}),[T,K]);var Q=F;"auto"!==F||I.muiSupportAuto||(Q=void 0);var Y=v||(l?(0,Pe.A)(rt(l)).body:void 0);return e.createElement(Qe,(0,r.A)({container:Y,open:T,ref:o,BackdropProps:{invisible:!0},className:(0,P.A)(m.root,h)},W),e.createElement(I,(0,r.A)({appear:!0,in:T,onEnter:E,onEntered:k,onExit:A,onExited:C,onExiting:R,timeout:Q},B,{onEntering:(0,Ne.A)((function(e,t){S&&S(e,t),K()}),B.onEntering)}),e.createElement(O,(0,r.A)({elevation:y,ref:X},M,{className:(0,P.A)(m.paper,M.className)}),p)))}));const at=(0,T.A)({root:{},paper:{position:"absolute",overflowY:"auto",overflowX:"hidden",minWidth:16,minHeight:16,maxWidth:"calc(100% - 32px)",maxHeight:"calc(100% - 32px)",outline:0}},{name:"MuiPopover"})(ot),it=e.createContext({});var lt=e.forwardRef((function(t,n){var o=t.children,i=t.classes,l=t.className,s=t.component,u=void 0===s?"ul":s,c=t.dense,d=void 0!==c&&c,f=t.disablePadding,p=void 0!==f&&f,m=t.subheader,h=(0,a.A)(t,["children","classes","className","component","dense","disablePadding","subheader"]),v=e.useMemo((function(){return{dense:d}}),[d]);return e.createElement(it.Provider,{value:v},e.createElement(u,(0,r.A)({className:(0,P.A)(i.root,l,d&&i.dense,!p&&i.padding,m&&i.subheader),ref:n},h),m,o))}));const st=(0,T.A)({root:{listStyle:"none",margin:0,padding:0,position:"relative"},padding:{paddingTop:8,paddingBottom:8},dense:{},subheader:{paddingTop:0}},{name:"MuiList"})(lt);function ut(e,t,n){return e===t?e.firstChild:t&&t.nextElementSibling?t.nextElementSibling:n?null:e.firstChild}function ct(e,t,n){return e===t?n?e.firstChild:e.lastChild:t&&t.previousElementSibling?t.previousElementSibling:n?null:e.lastChild}function dt(e,t){if(void 0===t)return!0;var n=e.innerText;return void 0===n&&(n=e.textContent),0!==(n=n.trim().toLowerCase()).length&&(t.repeating?n[0]===t.keys[0]:0===n.indexOf(t.keys.join("")))}function ft(e,t,n,r,o,a){for(var i=!1,l=o(e,t,!!t&&n);l;){if(l===e.firstChild){if(i)return;i=!0}var s=!r&&(l.disabled||"true"===l.getAttribute("aria-disabled"));if(l.hasAttribute("tabindex")&&dt(l,a)&&!s)return void l.focus();l=o(e,l,n)}}var pt="undefined"==typeof window?e.useEffect:e.useLayoutEffect;const mt=e.forwardRef((function(n,o){var i=n.actions,l=n.autoFocus,s=void 0!==l&&l,u=n.autoFocusItem,c=void 0!==u&&u,d=n.children,f=n.className,p=n.disabledItemsFocusable,m=void 0!==p&&p,h=n.disableListWrap,v=void 0!==h&&h,g=n.onKeyDown,y=n.variant,b=void 0===y?"selectedMenu":y,x=(0,a.A)(n,["actions","autoFocus","autoFocusItem","children","className","disabledItemsFocusable","disableListWrap","onKeyDown","variant"]),w=e.useRef(null),E=e.useRef({keys:[],repeating:!0,previousKeyMatched:!0,lastTime:null});pt((function(){s&&w.current.focus()}),[s]),e.useImperativeHandle(i,(function(){return{adjustStyleForScrollbar:function(e,t){var n=!w.current.style.width;if(e.clientHeight<w.current.clientHeight&&n){var r="".concat(je(),"px");w.current.style["rtl"===t.direction?"paddingLeft":"paddingRight"]=r,w.current.style.width="calc(100% + ".concat(r,")")}return w.current}}}),[]);var S=e.useCallback((function(e){w.current=t.findDOMNode(e)}),[]),A=(0,k.A)(S,o),C=-1;e.Children.forEach(d,(function(t,n){e.isValidElement(t)&&(t.props.disabled||("selectedMenu"===b&&t.props.selected||-1===C)&&(C=n))}));var R=e.Children.map(d,(function(t,n){if(n===C){var r={};return c&&(r.autoFocus=!0),void 0===t.props.tabIndex&&"selectedMenu"===b&&(r.tabIndex=0),e.cloneElement(t,r)}return t}));return e.createElement(st,(0,r.A)({role:"menu",ref:A,className:f,onKeyDown:function(e){var t=w.current,n=e.key,r=(0,Pe.A)(t).activeElement;if("ArrowDown"===n)e.preventDefault(),ft(t,r,v,m,ut);else if("ArrowUp"===n)e.preventDefault(),ft(t,r,v,m,ct);else if("Home"===n)e.preventDefault(),ft(t,null,v,m,ut);else if("End"===n)e.preventDefault(),ft(t,null,v,m,ct);else if(1===n.length){var o=E.current,a=n.toLowerCase(),i=performance.now();o.keys.length>0&&(i-o.lastTime>500?(o.keys=[],o.repeating=!0,o.previousKeyMatched=!0):o.repeating&&a!==o.keys[0]&&(o.repeating=!1)),o.lastTime=i,o.keys.push(a);var l=r&&!o.repeating&&dt(r,o);o.previousKeyMatched&&(l||ft(t,r,!1,m,ut,o))?e.preventDefault():o.previousKeyMatched=!1}g&&g(e)},tabIndex:s?0:-1},x),R)}));var ht={vertical:"top",horizontal:"right"},vt={vertical:"top",horizontal:"left"},gt=e.forwardRef((function(n,o){var i=n.autoFocus,l=void 0===i||i,s=n.children,u=n.classes,c=n.disableAutoFocusItem,d=void 0!==c&&c,f=n.MenuListProps,p=void 0===f?{}:f,m=n.onClose,h=n.onEntering,v=n.open,g=n.PaperProps,y=void 0===g?{}:g,b=n.PopoverClasses,w=n.transitionDuration,E=void 0===w?"auto":w,k=n.TransitionProps,S=(k=void 0===k?{}:k).onEntering,A=(0,a.A)(k,["onEntering"]),C=n.variant,R=void 0===C?"selectedMenu":C,T=(0,a.A)(n,["autoFocus","children","classes","disableAutoFocusItem","MenuListProps","onClose","onEntering","open","PaperProps","PopoverClasses","transitionDuration","TransitionProps","variant"]),N=x(),O=l&&!d&&v,M=e.useRef(null),L=e.useRef(null),z=-1;e.Children.map(s,(function(t,n){e.isValidElement(t)&&(t.props.disabled||("menu"!==R&&t.props.selected||-1===z)&&(z=n))}));var _=e.Children.map(s,(function(n,r){return r===z?e.cloneElement(n,{ref:function(e){L.current=t.findDOMNode(e),(0,Me.A)(n.ref,e)}}):n}));return e.createElement(at,(0,r.A)({getContentAnchorEl:function(){return L.current},classes:b,onClose:m,TransitionProps:(0,r.A)({onEntering:function(e,t){M.current&&M.current.adjustStyleForScrollbar(e,N),h&&h(e,t),S&&S(e,t)}},A),anchorOrigin:"rtl"===N.direction?ht:vt,transformOrigin:"rtl"===N.direction?ht:vt,PaperProps:(0,r.A)({},y,{classes:(0,r.A)({},y.classes,{root:u.paper})}),open:v,ref:o,transitionDuration:E},T),e.createElement(mt,(0,r.A)({onKeyDown:function(e){"Tab"===e.key&&(e.preventDefault(),m&&m(e,"tabKeyDown"))},actions:M,autoFocus:l&&(-1===z||d),autoFocusItem:O,variant:R},p,{className:(0,P.A)(u.list,p.className)}),_))}));const yt=(0,T.A)({paper:{maxHeight:"calc(100% - 96px)",WebkitOverflowScrolling:"touch"},list:{outline:0}},{name:"MuiMenu"})(gt);var bt=n(8060);function xt(e,t){return"object"===(0,Re.A)(t)&&null!==t?e===t:String(e)===String(t)}var wt=e.forwardRef((function(t,n){var i=t["aria-label"],l=t.autoFocus,s=t.autoWidth,u=t.children,c=t.classes,d=t.className,f=t.defaultValue,p=t.disabled,m=t.displayEmpty,h=t.IconComponent,v=t.inputRef,g=t.labelId,y=t.MenuProps,b=void 0===y?{}:y,x=t.multiple,w=t.name,E=t.onBlur,S=t.onChange,A=t.onClose,C=t.onFocus,R=t.onOpen,T=t.open,N=t.readOnly,O=t.renderValue,M=t.SelectDisplayProps,L=void 0===M?{}:M,z=t.tabIndex,_=(t.type,t.value),I=t.variant,D=void 0===I?"standard":I,F=(0,a.A)(t,["aria-label","autoFocus","autoWidth","children","classes","className","defaultValue","disabled","displayEmpty","IconComponent","inputRef","labelId","MenuProps","multiple","name","onBlur","onChange","onClose","onFocus","onOpen","open","readOnly","renderValue","SelectDisplayProps","tabIndex","type","value","variant"]),j=(0,bt.A)({controlled:_,default:f,name:"Select"}),B=(0,o.A)(j,2),W=B[0],$=B[1],H=e.useRef(null),U=e.useState(null),q=U[0],X=U[1],Q=e.useRef(null!=T).current,Y=e.useState(),G=Y[0],J=Y[1],Z=e.useState(!1),ee=Z[0],te=Z[1],ne=(0,k.A)(n,v);e.useImperativeHandle(ne,(function(){return{focus:function(){q.focus()},node:H.current,value:W}}),[q,W]),e.useEffect((function(){l&&q&&q.focus()}),[l,q]),e.useEffect((function(){if(q){var e=(0,Pe.A)(q).getElementById(g);if(e){var t=function(){getSelection().isCollapsed&&q.focus()};return e.addEventListener("click",t),function(){e.removeEventListener("click",t)}}}}),[g,q]);var oe,ae,ie=function(e,t){e?R&&R(t):A&&A(t),Q||(J(s?null:q.clientWidth),te(e))},le=e.Children.toArray(u),se=function(e){return function(t){var n;if(x||ie(!1,t),x){n=Array.isArray(W)?W.slice():[];var r=W.indexOf(e.props.value);-1===r?n.push(e.props.value):n.splice(r,1)}else n=e.props.value;e.props.onClick&&e.props.onClick(t),W!==n&&($(n),S&&(t.persist(),Object.defineProperty(t,"target",{writable:!0,value:{value:n,name:w}}),S(t,e)))}},ue=null!==q&&(Q?T:ee);delete F["aria-invalid"];var ce=[],de=!1;(re({value:W})||m)&&(O?oe=O(W):de=!0);var fe=le.map((function(t){if(!e.isValidElement(t))return null;var n;if(x){if(!Array.isArray(W))throw new Error((0,K.A)(2));(n=W.some((function(e){return xt(e,t.props.value)})))&&de&&ce.push(t.props.children)}else(n=xt(W,t.props.value))&&de&&(ae=t.props.children);return e.cloneElement(t,{"aria-selected":n?"true":void 0,onClick:se(t),onKeyUp:function(e){" "===e.key&&e.preventDefault(),t.props.onKeyUp&&t.props.onKeyUp(e)},role:"option",selected:n,value:void 0,"data-value":t.props.value})}));de&&(oe=x?ce.join(", "):ae);var pe,me=G;!s&&Q&&q&&(me=q.clientWidth),pe=void 0!==z?z:p?null:0;var he=L.id||(w?"mui-component-select-".concat(w):void 0);return e.createElement(e.Fragment,null,e.createElement("div",(0,r.A)({className:(0,P.A)(c.root,c.select,c.selectMenu,c[D],d,p&&c.disabled),ref:X,tabIndex:pe,role:"button","aria-disabled":p?"true":void 0,"aria-expanded":ue?"true":void 0,"aria-haspopup":"listbox","aria-label":i,"aria-labelledby":[g,he].filter(Boolean).join(" ")||void 0,onKeyDown:function(e){N||-1!==[" ","ArrowUp","ArrowDown","Enter"].indexOf(e.key)&&(e.preventDefault(),ie(!0,e))},onMouseDown:p||N?null:function(e){0===e.button&&(e.preventDefault(),q.focus(),ie(!0,e))},onBlur:function(e){!ue&&E&&(e.persist(),Object.defineProperty(e,"target",{writable:!0,value:{value:W,name:w}}),E(e))},onFocus:C},L,{id:he}),function(e){return null==e||"string"==typeof e&&!e.trim()}(oe)?e.createElement("span",{dangerouslySetInnerHTML:{__html:"&#8203;"}}):oe),e.createElement("input",(0,r.A)({value:Array.isArray(W)?W.join(","):W,name:w,ref:H,"aria-hidden":!0,onChange:function(e){var t=le.map((function(e){return e.props.value})).indexOf(e.target.value);if(-1!==t){var n=le[t];$(n.props.value),S&&S(e,n)}},tabIndex:-1,className:c.nativeInput,autoFocus:l},F)),e.createElement(h,{className:(0,P.A)(c.icon,c["icon".concat((0,V.A)(D))],ue&&c.iconOpen,p&&c.disabled)}),e.createElement(yt,(0,r.A)({id:"menu-".concat(w||""),anchorEl:q,open:ue,onClose:function(e){ie(!1,e)}},b,{MenuListProps:(0,r.A)({"aria-labelledby":g,role:"listbox",disableListWrap:!0},b.MenuListProps),PaperProps:(0,r.A)({},b.PaperProps,{style:(0,r.A)({minWidth:me},null!=b.PaperProps?b.PaperProps.style:null)})}),fe))}));const Et=wt;var kt=n(4507);const St=(0,kt.A)(e.createElement("path",{d:"M7 10l5 5 5-5z"}),"ArrowDropDown"),At=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.disabled,s=t.IconComponent,u=t.inputRef,c=t.variant,d=void 0===c?"standard":c,f=(0,a.A)(t,["classes","className","disabled","IconComponent","inputRef","variant"]);return e.createElement(e.Fragment,null,e.createElement("select",(0,r.A)({className:(0,P.A)(o.root,o.select,o[d],i,l&&o.disabled),disabled:l,ref:u||n},f)),t.multiple?null:e.createElement(s,{className:(0,P.A)(o.icon,o["icon".concat((0,V.A)(d))],l&&o.disabled)}))}));var Ct=function(e){return{root:{},select:{"-moz-appearance":"none","-webkit-appearance":"none",userSelect:"none",borderRadius:0,minWidth:16,cursor:"pointer","&:focus":{backgroundColor:"light"===e.palette.type?"rgba(0, 0, 0, 0.05)":"rgba(255, 255, 255, 0.05)",borderRadius:0},"&::-ms-expand":{display:"none"},"&$disabled":{cursor:"default"},"&[multiple]":{height:"auto"},"&:not([multiple]) option, &:not([multiple]) optgroup":{backgroundColor:e.palette.background.paper},"&&":{paddingRight:24}},filled:{"&&":{paddingRight:32}},outlined:{borderRadius:e.shape.borderRadius,"&&":{paddingRight:32}},selectMenu:{height:"auto",minHeight:"1.1876em",textOverflow:"ellipsis",whiteSpace:"nowrap",overflow:"hidden"},disabled:{},icon:{position:"absolute",right:0,top:"calc(50% - 12px)",pointerEvents:"none",color:e.palette.action.active,"&$disabled":{color:e.palette.action.disabled}},iconOpen:{transform:"rotate(180deg)"},iconFilled:{right:7},iconOutlined:{right:7},nativeInput:{bottom:0,left:0,position:"absolute",opacity:0,pointerEvents:"none",width:"100%"}}},Rt=e.createElement(se,null),Pt=e.forwardRef((function(t,n){var o=t.children,i=t.classes,l=t.IconComponent,s=void 0===l?St:l,u=t.input,c=void 0===u?Rt:u,d=t.inputProps,f=(t.variant,(0,a.A)(t,["children","classes","IconComponent","input","inputProps","variant"])),p=X({props:t,muiFormControl:ve(),states:["variant"]});return e.cloneElement(c,(0,r.A)({inputComponent:At,inputProps:(0,r.A)({children:o,classes:i,IconComponent:s,variant:p.variant,type:void 0},d,c?c.props.inputProps:{}),ref:n},f))}));Pt.muiName="Select",(0,T.A)(Ct,{name:"MuiNativeSelect"})(Pt);var Tt=Ct,Nt=e.createElement(se,null),Ot=e.createElement(ce,null),Mt=e.forwardRef((function t(n,o){var i=n.autoWidth,l=void 0!==i&&i,s=n.children,u=n.classes,c=n.displayEmpty,d=void 0!==c&&c,f=n.IconComponent,p=void 0===f?St:f,m=n.id,h=n.input,v=n.inputProps,g=n.label,y=n.labelId,b=n.labelWidth,x=void 0===b?0:b,w=n.MenuProps,E=n.multiple,k=void 0!==E&&E,S=n.native,A=void 0!==S&&S,C=n.onClose,R=n.onOpen,P=n.open,T=n.renderValue,N=n.SelectDisplayProps,O=n.variant,M=void 0===O?"standard":O,L=(0,a.A)(n,["autoWidth","children","classes","displayEmpty","IconComponent","id","input","inputProps","label","labelId","labelWidth","MenuProps","multiple","native","onClose","onOpen","open","renderValue","SelectDisplayProps","variant"]),z=A?At:Et,_=X({props:n,muiFormControl:ve(),states:["variant"]}).variant||M,I=h||{standard:Nt,outlined:e.createElement(he,{label:g,labelWidth:x}),filled:Ot}[_];return e.cloneElement(I,(0,r.A)({inputComponent:z,inputProps:(0,r.A)({children:s,IconComponent:p,variant:_,type:void 0,multiple:k},A?{id:m}:{autoWidth:l,displayEmpty:d,labelId:y,MenuProps:w,onClose:C,onOpen:R,open:P,renderValue:T,SelectDisplayProps:(0,r.A)({id:m},N)},v,{classes:v?(0,Ce.A)({baseClasses:u,newClasses:v.classes,Component:t}):u},h?h.props.inputProps:{}),ref:o},L))}));Mt.muiName="Select";const Lt=(0,T.A)(Tt,{name:"MuiSelect"})(Mt);var zt={standard:se,filled:ce,outlined:he},_t=e.forwardRef((function(t,n){var o=t.autoComplete,i=t.autoFocus,l=void 0!==i&&i,s=t.children,u=t.classes,c=t.className,d=t.color,f=void 0===d?"primary":d,p=t.defaultValue,m=t.disabled,h=void 0!==m&&m,v=t.error,g=void 0!==v&&v,y=t.FormHelperTextProps,b=t.fullWidth,x=void 0!==b&&b,w=t.helperText,E=t.hiddenLabel,k=t.id,S=t.InputLabelProps,A=t.inputProps,C=t.InputProps,R=t.inputRef,T=t.label,N=t.multiline,O=void 0!==N&&N,M=t.name,L=t.onBlur,z=t.onChange,_=t.onFocus,I=t.placeholder,D=t.required,F=void 0!==D&&D,j=t.rows,B=t.rowsMax,W=t.maxRows,$=t.minRows,V=t.select,H=void 0!==V&&V,U=t.SelectProps,q=t.type,K=t.value,X=t.variant,Q=void 0===X?"standard":X,Y=(0,a.A)(t,["autoComplete","autoFocus","children","classes","className","color","defaultValue","disabled","error","FormHelperTextProps","fullWidth","helperText","hiddenLabel","id","InputLabelProps","inputProps","InputProps","inputRef","label","multiline","name","onBlur","onChange","onFocus","placeholder","required","rows","rowsMax","maxRows","minRows","select","SelectProps","type","value","variant"]),G={};if("outlined"===Q&&(S&&void 0!==S.shrink&&(G.notched=S.shrink),T)){var J,Z=null!==(J=null==S?void 0:S.required)&&void 0!==J?J:F;G.label=e.createElement(e.Fragment,null,T,Z&&" *")}H&&(U&&U.native||(G.id=void 0),G["aria-describedby"]=void 0);var ee=w&&k?"".concat(k,"-helper-text"):void 0,te=T&&k?"".concat(k,"-label"):void 0,ne=zt[Q],re=e.createElement(ne,(0,r.A)({"aria-describedby":ee,autoComplete:o,autoFocus:l,defaultValue:p,fullWidth:x,multiline:O,name:M,rows:j,rowsMax:B,maxRows:W,minRows:$,type:q,value:K,id:k,inputRef:R,onBlur:L,onChange:z,onFocus:_,placeholder:I,inputProps:A},G,C));return e.createElement(ke,(0,r.A)({className:(0,P.A)(u.root,c),disabled:h,error:g,fullWidth:x,hiddenLabel:E,ref:n,required:F,color:f,variant:Q},Y),T&&e.createElement(xe,(0,r.A)({htmlFor:k,id:te},S),T),H?e.createElement(Lt,(0,r.A)({"aria-describedby":ee,id:k,labelId:te,value:K,input:re},U),s):re,w&&e.createElement(Ae,(0,r.A)({id:ee},y),w))}));const It=(0,T.A)({root:{}},{name:"MuiTextField"})(_t);var Dt=n(9773),Ft=n(364),jt=n(9417);function Bt(t,n){var r=Object.create(null);return t&&e.Children.map(t,(function(e){return e})).forEach((function(t){r[t.key]=function(t){return n&&(0,e.isValidElement)(t)?n(t):t}(t)})),r}function Wt(e,t,n){return null!=n[t]?n[t]:e.props[t]}function $t(t,n,r){var o=Bt(t.children),a=function(e,t){function n(n){return n in t?t[n]:e[n]}e=e||{},t=t||{};var r,o=Object.create(null),a=[];for(var i in e)i in t?a.length&&(o[i]=a,a=[]):a.push(i);var l={};for(var s in t){if(o[s])for(r=0;r<o[s].length;r++){var u=o[s][r];l[o[s][r]]=n(u)}l[s]=n(s)}for(r=0;r<a.length;r++)l[a[r]]=n(a[r]);return l}(n,o);return Object.keys(a).forEach((function(i){var l=a[i];if((0,e.isValidElement)(l)){var s=i in n,u=i in o,c=n[i],d=(0,e.isValidElement)(c)&&!c.props.in;!u||s&&!d?u||!s||d?u&&s&&(0,e.isValidElement)(c)&&(a[i]=(0,e.cloneElement)(l,{onExited:r.bind(null,l),in:c.props.in,exit:Wt(l,"exit",t),enter:Wt(l,"enter",t)})):a[i]=(0,e.cloneElement)(l,{in:!1}):a[i]=(0,e.cloneElement)(l,{onExited:r.bind(null,l),in:!0,exit:Wt(l,"exit",t),enter:Wt(l,"enter",t)})}})),a}var Vt=Object.values||function(e){return Object.keys(e).map((function(t){return e[t]}))},Ht=function(t){function n(e,n){var r,o=(r=t.call(this,e,n)||this).handleExited.bind((0,jt.A)(r));return r.state={contextValue:{isMounting:!0},handleExited:o,firstRender:!0},r}(0,l.A)(n,t);var o=n.prototype;return o.componentDidMount=function(){this.mounted=!0,this.setState({contextValue:{isMounting:!1}})},o.componentWillUnmount=function(){this.mounted=!1},n.getDerivedStateFromProps=function(t,n){var r,o,a=n.children,i=n.handleExited;return{children:n.firstRender?(r=t,o=i,Bt(r.children,(function(t){return(0,e.cloneElement)(t,{onExited:o.bind(null,t),in:!0,appear:Wt(t,"appear",r),enter:Wt(t,"enter",r),exit:Wt(t,"exit",r)})}))):$t(t,a,i),firstRender:!1}},o.handleExited=function(e,t){var n=Bt(this.props.children);e.key in n||(e.props.onExited&&e.props.onExited(t),this.mounted&&this.setState((function(t){var n=(0,r.A)({},t.children);return delete n[e.key],{children:n}})))},o.render=function(){var t=this.props,n=t.component,r=t.childFactory,o=(0,i.A)(t,["component","childFactory"]),a=this.state.contextValue,l=Vt(this.state.children).map(r);return delete o.appear,delete o.enter,delete o.exit,null===n?e.createElement(s.Provider,{value:a},l):e.createElement(s.Provider,{value:a},e.createElement(n,o,l))},n}(e.Component);Ht.propTypes={},Ht.defaultProps={component:"div",childFactory:function(e){return e}};const Ut=Ht;var qt="undefined"==typeof window?e.useEffect:e.useLayoutEffect;const Kt=function(t){var n=t.classes,r=t.pulsate,o=void 0!==r&&r,a=t.rippleX,i=t.rippleY,l=t.rippleSize,s=t.in,u=t.onExited,c=void 0===u?function(){}:u,d=t.timeout,f=e.useState(!1),p=f[0],m=f[1],h=(0,P.A)(n.ripple,n.rippleVisible,o&&n.ripplePulsate),v={width:l,height:l,top:-l/2+i,left:-l/2+a},g=(0,P.A)(n.child,p&&n.childLeaving,o&&n.childPulsate),y=(0,_e.A)(c);return qt((function(){if(!s){m(!0);var e=setTimeout(y,d);return function(){clearTimeout(e)}}}),[y,s,d]),e.createElement("span",{className:h,style:v},e.createElement("span",{className:g}))};var Xt=e.forwardRef((function(t,n){var o=t.center,i=void 0!==o&&o,l=t.classes,s=t.className,u=(0,a.A)(t,["center","classes","className"]),c=e.useState([]),d=c[0],f=c[1],p=e.useRef(0),m=e.useRef(null);e.useEffect((function(){m.current&&(m.current(),m.current=null)}),[d]);var h=e.useRef(!1),v=e.useRef(null),g=e.useRef(null),y=e.useRef(null);e.useEffect((function(){return function(){clearTimeout(v.current)}}),[]);var b=e.useCallback((function(t){var n=t.pulsate,r=t.rippleX,o=t.rippleY,a=t.rippleSize,i=t.cb;f((function(t){return[].concat((0,Fe.A)(t),[e.createElement(Kt,{key:p.current,classes:l,timeout:550,pulsate:n,rippleX:r,rippleY:o,rippleSize:a})])})),p.current+=1,m.current=i}),[l]),x=e.useCallback((function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=arguments.length>2?arguments[2]:void 0,r=t.pulsate,o=void 0!==r&&r,a=t.center,l=void 0===a?i||t.pulsate:a,s=t.fakeElement,u=void 0!==s&&s;if("mousedown"===e.type&&h.current)h.current=!1;else{"touchstart"===e.type&&(h.current=!0);var c,d,f,p=u?null:y.current,m=p?p.getBoundingClientRect():{width:0,height:0,left:0,top:0};if(l||0===e.clientX&&0===e.clientY||!e.clientX&&!e.touches)c=Math.round(m.width/2),d=Math.round(m.height/2);else{var x=e.touches?e.touches[0]:e,w=x.clientX,E=x.clientY;c=Math.round(w-m.left),d=Math.round(E-m.top)}if(l)(f=Math.sqrt((2*Math.pow(m.width,2)+Math.pow(m.height,2))/3))%2==0&&(f+=1);else{var k=2*Math.max(Math.abs((p?p.clientWidth:0)-c),c)+2,S=2*Math.max(Math.abs((p?p.clientHeight:0)-d),d)+2;f=Math.sqrt(Math.pow(k,2)+Math.pow(S,2))}e.touches?null===g.current&&(g.current=function(){b({pulsate:o,rippleX:c,rippleY:d,rippleSize:f,cb:n})},v.current=setTimeout((function(){g.current&&(g.current(),g.current=null)}),80)):b({pulsate:o,rippleX:c,rippleY:d,rippleSize:f,cb:n})}}),[i,b]),w=e.useCallback((function(){x({},{pulsate:!0})}),[x]),E=e.useCallback((function(e,t){if(clearTimeout(v.current),"touchend"===e.type&&g.current)return e.persist(),g.current(),g.current=null,void(v.current=setTimeout((function(){E(e,t)})));g.current=null,f((function(e){return e.length>0?e.slice(1):e})),m.current=t}),[]);return e.useImperativeHandle(n,(function(){return{pulsate:w,start:x,stop:E}}),[w,x,E]),e.createElement("span",(0,r.A)({className:(0,P.A)(l.root,s),ref:y},u),e.createElement(Ut,{component:null,exit:!0},d))}));const Qt=(0,T.A)((function(e){return{root:{overflow:"hidden",pointerEvents:"none",position:"absolute",zIndex:0,top:0,right:0,bottom:0,left:0,borderRadius:"inherit"},ripple:{opacity:0,position:"absolute"},rippleVisible:{opacity:.3,transform:"scale(1)",animation:"$enter ".concat(550,"ms ").concat(e.transitions.easing.easeInOut)},ripplePulsate:{animationDuration:"".concat(e.transitions.duration.shorter,"ms")},child:{opacity:1,display:"block",width:"100%",height:"100%",borderRadius:"50%",backgroundColor:"currentColor"},childLeaving:{opacity:0,animation:"$exit ".concat(550,"ms ").concat(e.transitions.easing.easeInOut)},childPulsate:{position:"absolute",left:0,top:0,animation:"$pulsate 2500ms ".concat(e.transitions.easing.easeInOut," 200ms infinite")},"@keyframes enter":{"0%":{transform:"scale(0)",opacity:.1},"100%":{transform:"scale(1)",opacity:.3}},"@keyframes exit":{"0%":{opacity:1},"100%":{opacity:0}},"@keyframes pulsate":{"0%":{transform:"scale(1)"},"50%":{transform:"scale(0.92)"},"100%":{transform:"scale(1)"}}}}),{flip:!1,name:"MuiTouchRipple"})(e.memo(Xt));var Yt=e.forwardRef((function(n,o){var i=n.action,l=n.buttonRef,s=n.centerRipple,u=void 0!==s&&s,c=n.children,d=n.classes,f=n.className,p=n.component,m=void 0===p?"button":p,h=n.disabled,v=void 0!==h&&h,g=n.disableRipple,y=void 0!==g&&g,b=n.disableTouchRipple,x=void 0!==b&&b,w=n.focusRipple,E=void 0!==w&&w,S=n.focusVisibleClassName,A=n.onBlur,C=n.onClick,R=n.onFocus,T=n.onFocusVisible,N=n.onKeyDown,O=n.onKeyUp,M=n.onMouseDown,L=n.onMouseLeave,z=n.onMouseUp,_=n.onTouchEnd,I=n.onTouchMove,D=n.onTouchStart,F=n.onDragLeave,j=n.tabIndex,B=void 0===j?0:j,W=n.TouchRippleProps,$=n.type,V=void 0===$?"button":$,H=(0,a.A)(n,["action","buttonRef","centerRipple","children","classes","className","component","disabled","disableRipple","disableTouchRipple","focusRipple","focusVisibleClassName","onBlur","onClick","onFocus","onFocusVisible","onKeyDown","onKeyUp","onMouseDown","onMouseLeave","onMouseUp","onTouchEnd","onTouchMove","onTouchStart","onDragLeave","tabIndex","TouchRippleProps","type"]),U=e.useRef(null),q=e.useRef(null),K=e.useState(!1),X=K[0],Q=K[1];v&&X&&Q(!1);var Y=(0,Ft.A)(),G=Y.isFocusVisible,J=Y.onBlurVisible,Z=Y.ref;function ee(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:x;return(0,_e.A)((function(r){return t&&t(r),!n&&q.current&&q.current[e](r),!0}))}e.useImperativeHandle(i,(function(){return{focusVisible:function(){Q(!0),U.current.focus()}}}),[]),e.useEffect((function(){X&&E&&!y&&q.current.pulsate()}),[y,E,X]);var te=ee("start",M),ne=ee("stop",F),re=ee("stop",z),oe=ee("stop",(function(e){X&&e.preventDefault(),L&&L(e)})),ae=ee("start",D),ie=ee("stop",_),le=ee("stop",I),se=ee("stop",(function(e){X&&(J(e),Q(!1)),A&&A(e)}),!1),ue=(0,_e.A)((function(e){U.current||(U.current=e.currentTarget),G(e)&&(Q(!0),T&&T(e)),R&&R(e)})),ce=function(){var e=t.findDOMNode(U.current);return m&&"button"!==m&&!("A"===e.tagName&&e.href)},de=e.useRef(!1),fe=(0,_e.A)((function(e){E&&!de.current&&X&&q.current&&" "===e.key&&(de.current=!0,e.persist(),q.current.stop(e,(function(){q.current.start(e)}))),e.target===e.currentTarget&&ce()&&" "===e.key&&e.preventDefault(),N&&N(e),e.target===e.currentTarget&&ce()&&"Enter"===e.key&&!v&&(e.preventDefault(),C&&C(e))})),pe=(0,_e.A)((function(e){E&&" "===e.key&&q.current&&X&&!e.defaultPrevented&&(de.current=!1,e.persist(),q.current.stop(e,(function(){q.current.pulsate(e)}))),O&&O(e),C&&e.target===e.currentTarget&&ce()&&" "===e.key&&!e.defaultPrevented&&C(e)})),me=m;"button"===me&&H.href&&(me="a");var he={};"button"===me?(he.type=V,he.disabled=v):("a"===me&&H.href||(he.role="button"),he["aria-disabled"]=v);var ve=(0,k.A)(l,o),ge=(0,k.A)(Z,U),ye=(0,k.A)(ve,ge),be=e.useState(!1),xe=be[0],we=be[1];e.useEffect((function(){we(!0)}),[]);var Ee=xe&&!y&&!v;return e.createElement(me,(0,r.A)({className:(0,P.A)(d.root,f,X&&[d.focusVisible,S],v&&d.disabled),onBlur:se,onClick:C,onFocus:ue,onKeyDown:fe,onKeyUp:pe,onMouseDown:te,onMouseLeave:oe,onMouseUp:re,onDragLeave:ne,onTouchEnd:ie,onTouchMove:le,onTouchStart:ae,ref:ye,tabIndex:v?-1:B},he,H),c,Ee?e.createElement(Qt,(0,r.A)({ref:q,center:u},W)):null)}));const Gt=(0,T.A)({root:{display:"inline-flex",alignItems:"center",justifyContent:"center",position:"relative",WebkitTapHighlightColor:"transparent",backgroundColor:"transparent",outline:0,border:0,margin:0,borderRadius:0,padding:0,cursor:"pointer",userSelect:"none",verticalAlign:"middle","-moz-appearance":"none","-webkit-appearance":"none",textDecoration:"none",color:"inherit","&::-moz-focus-inner":{borderStyle:"none"},"&$disabled":{pointerEvents:"none",cursor:"default"},"@media print":{colorAdjust:"exact"}},disabled:{},focusVisible:{}},{name:"MuiButtonBase"})(Yt);var Jt=e.forwardRef((function(t,n){var o=t.children,i=t.classes,l=t.className,s=t.color,u=void 0===s?"default":s,c=t.component,d=void 0===c?"button":c,f=t.disabled,p=void 0!==f&&f,m=t.disableElevation,h=void 0!==m&&m,v=t.disableFocusRipple,g=void 0!==v&&v,y=t.endIcon,b=t.focusVisibleClassName,x=t.fullWidth,w=void 0!==x&&x,E=t.size,k=void 0===E?"medium":E,S=t.startIcon,A=t.type,C=void 0===A?"button":A,R=t.variant,T=void 0===R?"text":R,N=(0,a.A)(t,["children","classes","className","color","component","disabled","disableElevation","disableFocusRipple","endIcon","focusVisibleClassName","fullWidth","size","startIcon","type","variant"]),O=S&&e.createElement("span",{className:(0,P.A)(i.startIcon,i["iconSize".concat((0,V.A)(k))])},S),M=y&&e.createElement("span",{className:(0,P.A)(i.endIcon,i["iconSize".concat((0,V.A)(k))])},y);return e.createElement(Gt,(0,r.A)({className:(0,P.A)(i.root,i[T],l,"inherit"===u?i.colorInherit:"default"!==u&&i["".concat(T).concat((0,V.A)(u))],"medium"!==k&&[i["".concat(T,"Size").concat((0,V.A)(k))],i["size".concat((0,V.A)(k))]],h&&i.disableElevation,p&&i.disabled,w&&i.fullWidth),component:d,disabled:p,focusRipple:!g,focusVisibleClassName:(0,P.A)(i.focusVisible,b),ref:n,type:C},N),e.createElement("span",{className:i.label},O,o,M))}));const Zt=(0,T.A)((function(e){return{root:(0,r.A)({},e.typography.button,{boxSizing:"border-box",minWidth:64,padding:"6px 16px",borderRadius:e.shape.borderRadius,color:e.palette.text.primary,transition:e.transitions.create(["background-color","box-shadow","border"],{duration:e.transitions.duration.short}),"&:hover":{textDecoration:"none",backgroundColor:(0,Dt.X4)(e.palette.text.primary,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"},"&$disabled":{backgroundColor:"transparent"}},"&$disabled":{color:e.palette.action.disabled}}),label:{width:"100%",display:"inherit",alignItems:"inherit",justifyContent:"inherit"},text:{padding:"6px 8px"},textPrimary:{color:e.palette.primary.main,"&:hover":{backgroundColor:(0,Dt.X4)(e.palette.primary.main,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},textSecondary:{color:e.palette.secondary.main,"&:hover":{backgroundColor:(0,Dt.X4)(e.palette.secondary.main,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},outlined:{padding:"5px 15px",border:"1px solid ".concat("light"===e.palette.type?"rgba(0, 0, 0, 0.23)":"rgba(255, 255, 255, 0.23)"),"&$disabled":{border:"1px solid ".concat(e.palette.action.disabledBackground)}},outlinedPrimary:{color:e.palette.primary.main,border:"1px solid ".concat((0,Dt.X4)(e.palette.primary.main,.5)),"&:hover":{border:"1px solid ".concat(e.palette.primary.main),backgroundColor:(0,Dt.X4)(e.palette.primary.main,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},outlinedSecondary:{color:e.palette.secondary.main,border:"1px solid ".concat((0,Dt.X4)(e.palette.secondary.main,.5)),"&:hover":{border:"1px solid ".concat(e.palette.secondary.main),backgroundColor:(0,Dt.X4)(e.palette.secondary.main,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}},"&$disabled":{border:"1px solid ".concat(e.palette.action.disabled)}},contained:{color:e.palette.getContrastText(e.palette.grey[300]),backgroundColor:e.palette.grey[300],boxShadow:e.shadows[2],"&:hover":{backgroundColor:e.palette.grey.A100,boxShadow:e.shadows[4],"@media (hover: none)":{boxShadow:e.shadows[2],backgroundColor:e.palette.grey[300]},"&$disabled":{backgroundColor:e.palette.action.disabledBackground}},"&$focusVisible":{boxShadow:e.shadows[6]},"&:active":{boxShadow:e.shadows[8]},"&$disabled":{color:e.palette.action.disabled,boxShadow:e.shadows[0],backgroundColor:e.palette.action.disabledBackground}},containedPrimary:{color:e.palette.primary.contrastText,backgroundColor:e.palette.primary.main,"&:hover":{backgroundColor:e.palette.primary.dark,"@media (hover: none)":{backgroundColor:e.palette.primary.main}}},containedSecondary:{color:e.palette.secondary.contrastText,backgroundColor:e.palette.secondary.main,"&:hover":{backgroundColor:e.palette.secondary.dark,"@media (hover: none)":{backgroundColor:e.palette.secondary.main}}},disableElevation:{boxShadow:"none","&:hover":{boxShadow:"none"},"&$focusVisible":{boxShadow:"none"},"&:active":{boxShadow:"none"},"&$disabled":{boxShadow:"none"}},focusVisible:{},disabled:{},colorInherit:{color:"inherit",borderColor:"currentColor"},textSizeSmall:{padding:"4px 5px",fontSize:e.typography.pxToRem(13)},textSizeLarge:{padding:"8px 11px",fontSize:e.typography.pxToRem(15)},outlinedSizeSmall:{padding:"3px 9px",fontSize:e.typography.pxToRem(13)},outlinedSizeLarge:{padding:"7px 21px",fontSize:e.typography.pxToRem(15)},containedSizeSmall:{padding:"4px 10px",fontSize:e.typography.pxToRem(13)},containedSizeLarge:{padding:"8px 22px",fontSize:e.typography.pxToRem(15)},sizeSmall:{},sizeLarge:{},fullWidth:{width:"100%"},startIcon:{display:"inherit",marginRight:8,marginLeft:-4,"&$iconSizeSmall":{marginLeft:-2}},endIcon:{display:"inherit",marginRight:-4,marginLeft:8,"&$iconSizeSmall":{marginRight:-2}},iconSizeSmall:{"& > *:first-child":{fontSize:18}},iconSizeMedium:{"& > *:first-child":{fontSize:20}},iconSizeLarge:{"& > *:first-child":{fontSize:22}}}}),{name:"MuiButton"})(Jt);var en=44,tn=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.color,s=void 0===l?"primary":l,u=t.disableShrink,c=void 0!==u&&u,d=t.size,f=void 0===d?40:d,p=t.style,m=t.thickness,h=void 0===m?3.6:m,v=t.value,g=void 0===v?0:v,y=t.variant,b=void 0===y?"indeterminate":y,x=(0,a.A)(t,["classes","className","color","disableShrink","size","style","thickness","value","variant"]),w={},E={},k={};if("determinate"===b||"static"===b){var S=2*Math.PI*((en-h)/2);w.strokeDasharray=S.toFixed(3),k["aria-valuenow"]=Math.round(g),w.strokeDashoffset="".concat(((100-g)/100*S).toFixed(3),"px"),E.transform="rotate(-90deg)"}return e.createElement("div",(0,r.A)({className:(0,P.A)(o.root,i,"inherit"!==s&&o["color".concat((0,V.A)(s))],{determinate:o.determinate,indeterminate:o.indeterminate,static:o.static}[b]),style:(0,r.A)({width:f,height:f},E,p),ref:n,role:"progressbar"},k,x),e.createElement("svg",{className:o.svg,viewBox:"".concat(22," ").concat(22," ").concat(en," ").concat(en)},e.createElement("circle",{className:(0,P.A)(o.circle,c&&o.circleDisableShrink,{determinate:o.circleDeterminate,indeterminate:o.circleIndeterminate,static:o.circleStatic}[b]),style:w,cx:en,cy:en,r:(en-h)/2,fill:"none",strokeWidth:h})))}));const nn=(0,T.A)((function(e){return{root:{display:"inline-block"},static:{transition:e.transitions.create("transform")},indeterminate:{animation:"$circular-rotate 1.4s linear infinite"},determinate:{transition:e.transitions.create("transform")},colorPrimary:{color:e.palette.primary.main},colorSecondary:{color:e.palette.secondary.main},svg:{display:"block"},circle:{stroke:"currentColor"},circleStatic:{transition:e.transitions.create("stroke-dashoffset")},circleIndeterminate:{animation:"$circular-dash 1.4s ease-in-out infinite",strokeDasharray:"80px, 200px",strokeDashoffset:"0px"},circleDeterminate:{transition:e.transitions.create("stroke-dashoffset")},"@keyframes circular-rotate":{"0%":{transformOrigin:"50% 50%"},"100%":{transform:"rotate(360deg)"}},"@keyframes circular-dash":{"0%":{strokeDasharray:"1px, 200px",strokeDashoffset:"0px"},"50%":{strokeDasharray:"100px, 200px",strokeDashoffset:"-15px"},"100%":{strokeDasharray:"100px, 200px",strokeDashoffset:"-125px"}},circleDisableShrink:{animation:"none"}}}),{name:"MuiCircularProgress",flip:!1})(tn);function rn(e){return e.substring(2).toLowerCase()}const on=function(n){var r=n.children,o=n.disableReactTree,a=void 0!==o&&o,i=n.mouseEvent,l=void 0===i?"onClick":i,s=n.onClickAway,u=n.touchEvent,c=void 0===u?"onTouchEnd":u,d=e.useRef(!1),f=e.useRef(null),p=e.useRef(!1),m=e.useRef(!1);e.useEffect((function(){return setTimeout((function(){p.current=!0}),0),function(){p.current=!1}}),[]);var h=e.useCallback((function(e){f.current=t.findDOMNode(e)}),[]),v=(0,k.A)(r.ref,h),g=(0,_e.A)((function(e){var t=m.current;if(m.current=!1,p.current&&f.current&&!function(e){return document.documentElement.clientWidth<e.clientX||document.documentElement.clientHeight<e.clientY}(e))if(d.current)d.current=!1;else{(e.composedPath?e.composedPath().indexOf(f.current)>-1:!(0,Pe.A)(f.current).documentElement.contains(e.target)||f.current.contains(e.target))||!a&&t||s(e)}})),y=function(e){return function(t){m.current=!0;var n=r.props[e];n&&n(t)}},b={ref:v};return!1!==c&&(b[c]=y(c)),e.useEffect((function(){if(!1!==c){var e=rn(c),t=(0,Pe.A)(f.current),n=function(){d.current=!0};return t.addEventListener(e,g),t.addEventListener("touchmove",n),function(){t.removeEventListener(e,g),t.removeEventListener("touchmove",n)}}}),[g,c]),!1!==l&&(b[l]=y(l)),e.useEffect((function(){if(!1!==l){var e=rn(l),t=(0,Pe.A)(f.current);return t.addEventListener(e,g),function(){t.removeEventListener(e,g)}}}),[g,l]),e.createElement(e.Fragment,null,e.cloneElement(r,b))};var an=e.forwardRef((function(t,n){var o=t.action,i=t.classes,l=t.className,s=t.message,u=t.role,c=void 0===u?"alert":u,d=(0,a.A)(t,["action","classes","className","message","role"]);return e.createElement(O,(0,r.A)({role:c,square:!0,elevation:6,className:(0,P.A)(i.root,l),ref:n},d),e.createElement("div",{className:i.message},s),o?e.createElement("div",{className:i.action},o):null)}));const ln=(0,T.A)((function(e){var t="light"===e.palette.type?.8:.98,n=(0,Dt.tL)(e.palette.background.default,t);return{root:(0,r.A)({},e.typography.body2,(0,de.A)({color:e.palette.getContrastText(n),backgroundColor:n,display:"flex",alignItems:"center",flexWrap:"wrap",padding:"6px 16px",borderRadius:e.shape.borderRadius,flexGrow:1},e.breakpoints.up("sm"),{flexGrow:"initial",minWidth:288})),message:{padding:"8px 0"},action:{display:"flex",alignItems:"center",marginLeft:"auto",paddingLeft:16,marginRight:-8}}}),{name:"MuiSnackbarContent"})(an);var sn=e.forwardRef((function(t,n){var o=t.action,i=t.anchorOrigin,l=(i=void 0===i?{vertical:"bottom",horizontal:"center"}:i).vertical,s=i.horizontal,u=t.autoHideDuration,c=void 0===u?null:u,d=t.children,f=t.classes,p=t.className,m=t.ClickAwayListenerProps,h=t.ContentProps,v=t.disableWindowBlurListener,y=void 0!==v&&v,b=t.message,x=t.onClose,w=t.onEnter,E=t.onEntered,k=t.onEntering,S=t.onExit,A=t.onExited,C=t.onExiting,R=t.onMouseEnter,T=t.onMouseLeave,N=t.open,O=t.resumeHideDuration,M=t.TransitionComponent,L=void 0===M?Ze:M,z=t.transitionDuration,_=void 0===z?{enter:g.p0.enteringScreen,exit:g.p0.leavingScreen}:z,I=t.TransitionProps,D=(0,a.A)(t,["action","anchorOrigin","autoHideDuration","children","classes","className","ClickAwayListenerProps","ContentProps","disableWindowBlurListener","message","onClose","onEnter","onEntered","onEntering","onExit","onExited","onExiting","onMouseEnter","onMouseLeave","open","resumeHideDuration","TransitionComponent","transitionDuration","TransitionProps"]),F=e.useRef(),j=e.useState(!0),B=j[0],W=j[1],$=(0,_e.A)((function(){x&&x.apply(void 0,arguments)})),H=(0,_e.A)((function(e){x&&null!=e&&(clearTimeout(F.current),F.current=setTimeout((function(){$(null,"timeout")}),e))}));e.useEffect((function(){return N&&H(c),function(){clearTimeout(F.current)}}),[N,c,H]);var U=function(){clearTimeout(F.current)},q=e.useCallback((function(){null!=c&&H(null!=O?O:.5*c)}),[c,O,H]);return e.useEffect((function(){if(!y&&N)return window.addEventListener("focus",q),window.addEventListener("blur",U),function(){window.removeEventListener("focus",q),window.removeEventListener("blur",U)}}),[y,q,N]),!N&&B?null:e.createElement(on,(0,r.A)({onClickAway:function(e){x&&x(e,"clickaway")}},m),e.createElement("div",(0,r.A)({className:(0,P.A)(f.root,f["anchorOrigin".concat((0,V.A)(l)).concat((0,V.A)(s))],p),onMouseEnter:function(e){R&&R(e),U()},onMouseLeave:function(e){T&&T(e),q()},ref:n},D),e.createElement(L,(0,r.A)({appear:!0,in:N,onEnter:(0,Ne.A)((function(){W(!1)}),w),onEntered:E,onEntering:k,onExit:S,onExited:(0,Ne.A)((function(){W(!0)}),A),onExiting:C,timeout:_,direction:"top"===l?"down":"up"},I),d||e.createElement(ln,(0,r.A)({message:b,action:o},h)))))}));const un=(0,T.A)((function(e){var t={top:8},n={bottom:8},o={justifyContent:"flex-end"},a={justifyContent:"flex-start"},i={top:24},l={bottom:24},s={right:24},u={left:24},c={left:"50%",right:"auto",transform:"translateX(-50%)"};return{root:{zIndex:e.zIndex.snackbar,position:"fixed",display:"flex",left:8,right:8,justifyContent:"center",alignItems:"center"},anchorOriginTopCenter:(0,r.A)({},t,(0,de.A)({},e.breakpoints.up("sm"),(0,r.A)({},i,c))),anchorOriginBottomCenter:(0,r.A)({},n,(0,de.A)({},e.breakpoints.up("sm"),(0,r.A)({},l,c))),anchorOriginTopRight:(0,r.A)({},t,o,(0,de.A)({},e.breakpoints.up("sm"),(0,r.A)({left:"auto"},i,s))),anchorOriginBottomRight:(0,r.A)({},n,o,(0,de.A)({},e.breakpoints.up("sm"),(0,r.A)({left:"auto"},l,s))),anchorOriginTopLeft:(0,r.A)({},t,a,(0,de.A)({},e.breakpoints.up("sm"),(0,r.A)({right:"auto"},i,u))),anchorOriginBottomLeft:(0,r.A)({},n,a,(0,de.A)({},e.breakpoints.up("sm"),(0,r.A)({right:"auto"},l,u)))}}),{flip:!1,name:"MuiSnackbar"})(sn);var cn=e.forwardRef((function(t,n){var o=t.edge,i=void 0!==o&&o,l=t.children,s=t.classes,u=t.className,c=t.color,d=void 0===c?"default":c,f=t.disabled,p=void 0!==f&&f,m=t.disableFocusRipple,h=void 0!==m&&m,v=t.size,g=void 0===v?"medium":v,y=(0,a.A)(t,["edge","children","classes","className","color","disabled","disableFocusRipple","size"]);return e.createElement(Gt,(0,r.A)({className:(0,P.A)(s.root,u,"default"!==d&&s["color".concat((0,V.A)(d))],p&&s.disabled,"small"===g&&s["size".concat((0,V.A)(g))],{start:s.edgeStart,end:s.edgeEnd}[i]),centerRipple:!0,focusRipple:!h,disabled:p,ref:n},y),e.createElement("span",{className:s.label},l))}));const dn=(0,T.A)((function(e){return{root:{textAlign:"center",flex:"0 0 auto",fontSize:e.typography.pxToRem(24),padding:12,borderRadius:"50%",overflow:"visible",color:e.palette.action.active,transition:e.transitions.create("background-color",{duration:e.transitions.duration.shortest}),"&:hover":{backgroundColor:(0,Dt.X4)(e.palette.action.active,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}},"&$disabled":{backgroundColor:"transparent",color:e.palette.action.disabled}},edgeStart:{marginLeft:-12,"$sizeSmall&":{marginLeft:-3}},edgeEnd:{marginRight:-12,"$sizeSmall&":{marginRight:-3}},colorInherit:{color:"inherit"},colorPrimary:{color:e.palette.primary.main,"&:hover":{backgroundColor:(0,Dt.X4)(e.palette.primary.main,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},colorSecondary:{color:e.palette.secondary.main,"&:hover":{backgroundColor:(0,Dt.X4)(e.palette.secondary.main,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},disabled:{},sizeSmall:{padding:3,fontSize:e.typography.pxToRem(18)},label:{width:"100%",display:"flex",alignItems:"inherit",justifyContent:"inherit"}}}),{name:"MuiIconButton"})(cn),fn=(0,kt.A)(e.createElement("path",{d:"M20,12A8,8 0 0,1 12,20A8,8 0 0,1 4,12A8,8 0 0,1 12,4C12.76,4 13.5,4.11 14.2, 4.31L15.77,2.74C14.61,2.26 13.34,2 12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0, 0 22,12M7.91,10.08L6.5,11.5L11,16L21,6L19.59,4.58L11,13.17L7.91,10.08Z"}),"SuccessOutlined"),pn=(0,kt.A)(e.createElement("path",{d:"M12 5.99L19.53 19H4.47L12 5.99M12 2L1 21h22L12 2zm1 14h-2v2h2v-2zm0-6h-2v4h2v-4z"}),"ReportProblemOutlined"),mn=(0,kt.A)(e.createElement("path",{d:"M11 15h2v2h-2zm0-8h2v6h-2zm.99-5C6.47 2 2 6.48 2 12s4.47 10 9.99 10C17.52 22 22 17.52 22 12S17.52 2 11.99 2zM12 20c-4.42 0-8-3.58-8-8s3.58-8 8-8 8 3.58 8 8-3.58 8-8 8z"}),"ErrorOutline"),hn=(0,kt.A)(e.createElement("path",{d:"M11,9H13V7H11M12,20C7.59,20 4,16.41 4,12C4,7.59 7.59,4 12,4C16.41,4 20,7.59 20, 12C20,16.41 16.41,20 12,20M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10, 10 0 0,0 12,2M11,17H13V11H11V17Z"}),"InfoOutlined"),vn=(0,kt.A)(e.createElement("path",{d:"M19 6.41L17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Close");var gn={success:e.createElement(fn,{fontSize:"inherit"}),warning:e.createElement(pn,{fontSize:"inherit"}),error:e.createElement(mn,{fontSize:"inherit"}),info:e.createElement(hn,{fontSize:"inherit"})},yn=e.createElement(vn,{fontSize:"small"}),bn=e.forwardRef((function(t,n){var o=t.action,i=t.children,l=t.classes,s=t.className,u=t.closeText,c=void 0===u?"Close":u,d=t.color,f=t.icon,p=t.iconMapping,m=void 0===p?gn:p,h=t.onClose,v=t.role,g=void 0===v?"alert":v,y=t.severity,b=void 0===y?"success":y,x=t.variant,w=void 0===x?"standard":x,E=(0,a.A)(t,["action","children","classes","className","closeText","color","icon","iconMapping","onClose","role","severity","variant"]);return e.createElement(O,(0,r.A)({role:g,square:!0,elevation:0,className:(0,P.A)(l.root,l["".concat(w).concat((0,V.A)(d||b))],s),ref:n},E),!1!==f?e.createElement("div",{className:l.icon},f||m[b]||gn[b]):null,e.createElement("div",{className:l.message},i),null!=o?e.createElement("div",{className:l.action},o):null,null==o&&h?e.createElement("div",{className:l.action},e.createElement(dn,{size:"small","aria-label":c,title:c,color:"inherit",onClick:h},yn)):null)}));const xn=(0,T.A)((function(e){var t="light"===e.palette.type?Dt.e$:Dt.a,n="light"===e.palette.type?Dt.a:Dt.e$;return{root:(0,r.A)({},e.typography.body2,{borderRadius:e.shape.borderRadius,backgroundColor:"transparent",display:"flex",padding:"6px 16px"}),standardSuccess:{color:t(e.palette.success.main,.6),backgroundColor:n(e.palette.success.main,.9),"& $icon":{color:e.palette.success.main}},standardInfo:{color:t(e.palette.info.main,.6),backgroundColor:n(e.palette.info.main,.9),"& $icon":{color:e.palette.info.main}},standardWarning:{color:t(e.palette.warning.main,.6),backgroundColor:n(e.palette.warning.main,.9),"& $icon":{color:e.palette.warning.main}},standardError:{color:t(e.palette.error.main,.6),backgroundColor:n(e.palette.error.main,.9),"& $icon":{color:e.palette.error.main}},outlinedSuccess:{color:t(e.palette.success.main,.6),border:"1px solid ".concat(e.palette.success.main),"& $icon":{color:e.palette.success.main}},outlinedInfo:{color:t(e.palette.info.main,.6),border:"1px solid ".concat(e.palette.info.main),"& $icon":{color:e.palette.info.main}},outlinedWarning:{color:t(e.palette.warning.main,.6),border:"1px solid ".concat(e.palette.warning.main),"& $icon":{color:e.palette.warning.main}},outlinedError:{color:t(e.palette.error.main,.6),border:"1px solid ".concat(e.palette.error.main),"& $icon":{color:e.palette.error.main}},filledSuccess:{color:"#fff",fontWeight:e.typography.fontWeightMedium,backgroundColor:e.palette.success.main},filledInfo:{color:"#fff",fontWeight:e.typography.fontWeightMedium,backgroundColor:e.palette.info.main},filledWarning:{color:"#fff",fontWeight:e.typography.fontWeightMedium,backgroundColor:e.palette.warning.main},filledError:{color:"#fff",fontWeight:e.typography.fontWeightMedium,backgroundColor:e.palette.error.main},icon:{marginRight:12,padding:"7px 0",display:"flex",fontSize:22,opacity:.9},message:{padding:"8px 0"},action:{display:"flex",alignItems:"center",marginLeft:"auto",paddingLeft:16,marginRight:-8}}}),{name:"MuiAlert"})(bn);var wn=n(5556),En=n.n(wn);function kn(e){return"/"===e.charAt(0)}function Sn(e,t){for(var n=t,r=n+1,o=e.length;r<o;n+=1,r+=1)e[n]=e[r];e.pop()}function An(e){return e.valueOf?e.valueOf():Object.prototype.valueOf.call(e)}const Cn=function e(t,n){if(t===n)return!0;if(null==t||null==n)return!1;if(Array.isArray(t))return Array.isArray(n)&&t.length===n.length&&t.every((function(t,r){return e(t,n[r])}));if("object"==typeof t||"object"==typeof n){var r=An(t),o=An(n);return r!==t||o!==n?e(r,o):Object.keys(Object.assign({},t,n)).every((function(r){return e(t[r],n[r])}))}return!1};function Rn(e,t){if(!e)throw new Error("Invariant failed")}function Pn(e){return"/"===e.charAt(0)?e:"/"+e}function Tn(e,t){return function(e,t){return 0===e.toLowerCase().indexOf(t.toLowerCase())&&-1!=="/?#".indexOf(e.charAt(t.length))}(e,t)?e.substr(t.length):e}function Nn(e){return"/"===e.charAt(e.length-1)?e.slice(0,-1):e}function On(e){var t=e.pathname,n=e.search,r=e.hash,o=t||"/";return n&&"?"!==n&&(o+="?"===n.charAt(0)?n:"?"+n),r&&"#"!==r&&(o+="#"===r.charAt(0)?r:"#"+r),o}function Mn(e,t,n,o){var a;"string"==typeof e?(a=function(e){var t=e||"/",n="",r="",o=t.indexOf("#");-1!==o&&(r=t.substr(o),t=t.substr(0,o));var a=t.indexOf("?");return-1!==a&&(n=t.substr(a),t=t.substr(0,a)),{pathname:t,search:"?"===n?"":n,hash:"#"===r?"":r}}(e),a.state=t):(void 0===(a=(0,r.A)({},e)).pathname&&(a.pathname=""),a.search?"?"!==a.search.charAt(0)&&(a.search="?"+a.search):a.search="",a.hash?"#"!==a.hash.charAt(0)&&(a.hash="#"+a.hash):a.hash="",void 0!==t&&void 0===a.state&&(a.state=t));try{a.pathname=decodeURI(a.pathname)}catch(e){throw e instanceof URIError?new URIError('Pathname "'+a.pathname+'" could not be decoded. This is likely caused by an invalid percent-encoding.'):e}return n&&(a.key=n),o?a.pathname?"/"!==a.pathname.charAt(0)&&(a.pathname=function(e,t){void 0===t&&(t="");var n,r=e&&e.split("/")||[],o=t&&t.split("/")||[],a=e&&kn(e),i=t&&kn(t),l=a||i;if(e&&kn(e)?o=r:r.length&&(o.pop(),o=o.concat(r)),!o.length)return"/";if(o.length){var s=o[o.length-1];n="."===s||".."===s||""===s}else n=!1;for(var u=0,c=o.length;c>=0;c--){var d=o[c];"."===d?Sn(o,c):".."===d?(Sn(o,c),u++):u&&(Sn(o,c),u--)}if(!l)for(;u--;u)o.unshift("..");!l||""===o[0]||o[0]&&kn(o[0])||o.unshift("");var f=o.join("/");return n&&"/"!==f.substr(-1)&&(f+="/"),f}(a.pathname,o.pathname)):a.pathname=o.pathname:a.pathname||(a.pathname="/"),a}function Ln(){var e=null,t=[];return{setPrompt:function(t){return e=t,function(){e===t&&(e=null)}},confirmTransitionTo:function(t,n,r,o){if(null!=e){var a="function"==typeof e?e(t,n):e;"string"==typeof a?"function"==typeof r?r(a,o):o(!0):o(!1!==a)}else o(!0)},appendListener:function(e){var n=!0;function r(){n&&e.apply(void 0,arguments)}return t.push(r),function(){n=!1,t=t.filter((function(e){return e!==r}))}},notifyListeners:function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];t.forEach((function(e){return e.apply(void 0,n)}))}}}var zn=!("undefined"==typeof window||!window.document||!window.document.createElement);function _n(e,t){t(window.confirm(e))}var In="popstate",Dn="hashchange";function Fn(){try{return window.history.state||{}}catch(e){return{}}}var jn=n(5302),Bn=n.n(jn),Wn=(n(7564),n(4146)),$n=n.n(Wn),Vn=1073741823,Hn="undefined"!=typeof globalThis?globalThis:"undefined"!=typeof window?window:void 0!==n.g?n.g:{},Un=e.createContext||function(t,n){var r,o,a,i="__create-react-context-"+((Hn[a="__global_unique_id__"]=(Hn[a]||0)+1)+"__"),s=function(e){function t(){for(var t,n,r,o=arguments.length,a=new Array(o),i=0;i<o;i++)a[i]=arguments[i];return(t=e.call.apply(e,[this].concat(a))||this).emitter=(n=t.props.value,r=[],{on:function(e){r.push(e)},off:function(e){r=r.filter((function(t){return t!==e}))},get:function(){return n},set:function(e,t){n=e,r.forEach((function(e){return e(n,t)}))}}),t}(0,l.A)(t,e);var r=t.prototype;return r.getChildContext=function(){var e;return(e={})[i]=this.emitter,e},r.componentWillReceiveProps=function(e){if(this.props.value!==e.value){var t,r=this.props.value,o=e.value;((a=r)===(i=o)?0!==a||1/a==1/i:a!=a&&i!=i)?t=0:(t="function"==typeof n?n(r,o):Vn,0!=(t|=0)&&this.emitter.set(e.value,t))}var a,i},r.render=function(){return this.props.children},t}(e.Component);s.childContextTypes=((r={})[i]=En().object.isRequired,r);var u=function(e){function n(){for(var t,n=arguments.length,r=new Array(n),o=0;o<n;o++)r[o]=arguments[o];return(t=e.call.apply(e,[this].concat(r))||this).observedBits=void 0,t.state={value:t.getValue()},t.onUpdate=function(e,n){t.observedBits&n&&t.setState({value:t.getValue()})},t}(0,l.A)(n,e);var r=n.prototype;return r.componentWillReceiveProps=function(e){var t=e.observedBits;this.observedBits=null==t?Vn:t},r.componentDidMount=function(){this.context[i]&&this.context[i].on(this.onUpdate);var e=this.props.observedBits;this.observedBits=null==e?Vn:e},r.componentWillUnmount=function(){this.context[i]&&this.context[i].off(this.onUpdate)},r.getValue=function(){return this.context[i]?this.context[i].get():t},r.render=function(){return(e=this.props.children,Array.isArray(e)?e[0]:e)(this.state.value);var e},n}(e.Component);return u.contextTypes=((o={})[i]=En().object,o),{Provider:s,Consumer:u}},qn=function(e){var t=Un();return t.displayName=e,t},Kn=qn("Router-History"),Xn=qn("Router"),Qn=function(t){function n(e){var n;return(n=t.call(this,e)||this).state={location:e.history.location},n._isMounted=!1,n._pendingLocation=null,e.staticContext||(n.unlisten=e.history.listen((function(e){n._pendingLocation=e}))),n}(0,l.A)(n,t),n.computeRootMatch=function(e){return{path:"/",url:"/",params:{},isExact:"/"===e}};var r=n.prototype;return r.componentDidMount=function(){var e=this;this._isMounted=!0,this.unlisten&&this.unlisten(),this.props.staticContext||(this.unlisten=this.props.history.listen((function(t){e._isMounted&&e.setState({location:t})}))),this._pendingLocation&&this.setState({location:this._pendingLocation})},r.componentWillUnmount=function(){this.unlisten&&(this.unlisten(),this._isMounted=!1,this._pendingLocation=null)},r.render=function(){return e.createElement(Xn.Provider,{value:{history:this.props.history,location:this.state.location,match:n.computeRootMatch(this.state.location.pathname),staticContext:this.props.staticContext}},e.createElement(Kn.Provider,{children:this.props.children||null,value:this.props.history}))},n}(e.Component);e.Component;var Yn=function(e){function t(){return e.apply(this,arguments)||this}(0,l.A)(t,e);var n=t.prototype;return n.componentDidMount=function(){this.props.onMount&&this.props.onMount.call(this,this)},n.componentDidUpdate=function(e){this.props.onUpdate&&this.props.onUpdate.call(this,this,e)},n.componentWillUnmount=function(){this.props.onUnmount&&this.props.onUnmount.call(this,this)},n.render=function(){return null},t}(e.Component),Gn={},Jn=0;function Zn(e,t){return void 0===e&&(e="/"),void 0===t&&(t={}),"/"===e?e:function(e){if(Gn[e])return Gn[e];var t=Bn().compile(e);return Jn<1e4&&(Gn[e]=t,Jn++),t}(e)(t,{pretty:!0})}function er(t){var n=t.computedMatch,o=t.to,a=t.push,i=void 0!==a&&a;return e.createElement(Xn.Consumer,null,(function(t){t||Rn(!1);var a=t.history,l=t.staticContext,s=i?a.push:a.replace,u=Mn(n?"string"==typeof o?Zn(o,n.params):(0,r.A)({},o,{pathname:Zn(o.pathname,n.params)}):o);return l?(s(u),null):e.createElement(Yn,{onMount:function(){s(u)},onUpdate:function(e,t){var n,o,a=Mn(t.to);n=a,o=(0,r.A)({},u,{key:a.key}),n.pathname===o.pathname&&n.search===o.search&&n.hash===o.hash&&n.key===o.key&&Cn(n.state,o.state)||s(u)},to:o})}))}var tr={},nr=0;function rr(e,t){void 0===t&&(t={}),("string"==typeof t||Array.isArray(t))&&(t={path:t});var n=t,r=n.path,o=n.exact,a=void 0!==o&&o,i=n.strict,l=void 0!==i&&i,s=n.sensitive,u=void 0!==s&&s;return[].concat(r).reduce((function(t,n){if(!n&&""!==n)return null;if(t)return t;var r=function(e,t){var n=""+t.end+t.strict+t.sensitive,r=tr[n]||(tr[n]={});if(r[e])return r[e];var o=[],a={regexp:Bn()(e,o,t),keys:o};return nr<1e4&&(r[e]=a,nr++),a}(n,{end:a,strict:l,sensitive:u}),o=r.regexp,i=r.keys,s=o.exec(e);if(!s)return null;var c=s[0],d=s.slice(1),f=e===c;return a&&!f?null:{path:n,url:"/"===n&&""===c?"/":c,isExact:f,params:i.reduce((function(e,t,n){return e[t.name]=d[n],e}),{})}}),null)}var or=function(t){function n(){return t.apply(this,arguments)||this}return(0,l.A)(n,t),n.prototype.render=function(){var t=this;return e.createElement(Xn.Consumer,null,(function(n){n||Rn(!1);var o=t.props.location||n.location,a=t.props.computedMatch?t.props.computedMatch:t.props.path?rr(o.pathname,t.props):n.match,i=(0,r.A)({},n,{location:o,match:a}),l=t.props,s=l.children,u=l.component,c=l.render;return Array.isArray(s)&&function(t){return 0===e.Children.count(t)}(s)&&(s=null),e.createElement(Xn.Provider,{value:i},i.match?s?"function"==typeof s?s(i):s:u?e.createElement(u,i):c?c(i):null:"function"==typeof s?s(i):null)}))},n}(e.Component);e.Component;var ar=function(t){function n(){return t.apply(this,arguments)||this}return(0,l.A)(n,t),n.prototype.render=function(){var t=this;return e.createElement(Xn.Consumer,null,(function(n){n||Rn(!1);var o,a,i=t.props.location||n.location;return e.Children.forEach(t.props.children,(function(t){if(null==a&&e.isValidElement(t)){o=t;var l=t.props.path||t.props.from;a=l?rr(i.pathname,(0,r.A)({},t.props,{path:l})):n.match}})),a?e.cloneElement(o,{location:i,computedMatch:a}):null}))},n}(e.Component);e.useContext;var ir=function(t){function n(){for(var e,n=arguments.length,o=new Array(n),a=0;a<n;a++)o[a]=arguments[a];return(e=t.call.apply(t,[this].concat(o))||this).history=function(e){void 0===e&&(e={}),zn||Rn(!1);var t,n=window.history,o=(-1===(t=window.navigator.userAgent).indexOf("Android 2.")&&-1===t.indexOf("Android 4.0")||-1===t.indexOf("Mobile Safari")||-1!==t.indexOf("Chrome")||-1!==t.indexOf("Windows Phone"))&&window.history&&"pushState"in window.history,a=!(-1===window.navigator.userAgent.indexOf("Trident")),i=e,l=i.forceRefresh,s=void 0!==l&&l,u=i.getUserConfirmation,c=void 0===u?_n:u,d=i.keyLength,f=void 0===d?6:d,p=e.basename?Nn(Pn(e.basename)):"";function m(e){var t=e||{},n=t.key,r=t.state,o=window.location,a=o.pathname+o.search+o.hash;return p&&(a=Tn(a,p)),Mn(a,r,n)}function h(){return Math.random().toString(36).substr(2,f)}var v=Ln();function g(e){(0,r.A)(T,e),T.length=n.length,v.notifyListeners(T.location,T.action)}function y(e){(function(e){return void 0===e.state&&-1===navigator.userAgent.indexOf("CriOS")})(e)||w(m(e.state))}function b(){w(m(Fn()))}var x=!1;function w(e){x?(x=!1,g()):v.confirmTransitionTo(e,"POP",c,(function(t){t?g({action:"POP",location:e}):function(e){var t=T.location,n=k.indexOf(t.key);-1===n&&(n=0);var r=k.indexOf(e.key);-1===r&&(r=0);var o=n-r;o&&(x=!0,A(o))}(e)}))}var E=m(Fn()),k=[E.key];function S(e){return p+On(e)}function A(e){n.go(e)}var C=0;function R(e){1===(C+=e)&&1===e?(window.addEventListener(In,y),a&&window.addEventListener(Dn,b)):0===C&&(window.removeEventListener(In,y),a&&window.removeEventListener(Dn,b))}var P=!1,T={length:n.length,action:"POP",location:E,createHref:S,push:function(e,t){var r="PUSH",a=Mn(e,t,h(),T.location);v.confirmTransitionTo(a,r,c,(function(e){if(e){var t=S(a),i=a.key,l=a.state;if(o)if(n.pushState({key:i,state:l},null,t),s)window.location.href=t;else{var u=k.indexOf(T.location.key),c=k.slice(0,u+1);c.push(a.key),k=c,g({action:r,location:a})}else window.location.href=t}}))},replace:function(e,t){var r="REPLACE",a=Mn(e,t,h(),T.location);v.confirmTransitionTo(a,r,c,(function(e){if(e){var t=S(a),i=a.key,l=a.state;if(o)if(n.replaceState({key:i,state:l},null,t),s)window.location.replace(t);else{var u=k.indexOf(T.location.key);-1!==u&&(k[u]=a.key),g({action:r,location:a})}else window.location.replace(t)}}))},go:A,goBack:function(){A(-1)},goForward:function(){A(1)},block:function(e){void 0===e&&(e=!1);var t=v.setPrompt(e);return P||(R(1),P=!0),function(){return P&&(P=!1,R(-1)),t()}},listen:function(e){var t=v.appendListener(e);return R(1),function(){R(-1),t()}}};return T}(e.props),e}return(0,l.A)(n,t),n.prototype.render=function(){return e.createElement(Qn,{history:this.history,children:this.props.children})},n}(e.Component);e.Component;var lr=function(e,t){return"function"==typeof e?e(t):e},sr=function(e,t){return"string"==typeof e?Mn(e,null,null,t):e},ur=function(e){return e},cr=e.forwardRef;void 0===cr&&(cr=ur);var dr=cr((function(t,n){var o=t.innerRef,a=t.navigate,l=t.onClick,s=(0,i.A)(t,["innerRef","navigate","onClick"]),u=s.target,c=(0,r.A)({},s,{onClick:function(e){try{l&&l(e)}catch(t){throw e.preventDefault(),t}e.defaultPrevented||0!==e.button||u&&"_self"!==u||function(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}(e)||(e.preventDefault(),a())}});return c.ref=ur!==cr&&n||o,e.createElement("a",c)})),fr=cr((function(t,n){var o=t.component,a=void 0===o?dr:o,l=t.replace,s=t.to,u=t.innerRef,c=(0,i.A)(t,["component","replace","to","innerRef"]);return e.createElement(Xn.Consumer,null,(function(t){t||Rn(!1);var o=t.history,i=sr(lr(s,t.location),t.location),d=i?o.createHref(i):"",f=(0,r.A)({},c,{href:d,navigate:function(){var e=lr(s,t.location),n=On(t.location)===On(sr(e));(l||n?o.replace:o.push)(e)}});return ur!==cr?f.ref=n||u:f.innerRef=u,e.createElement(a,f)}))})),pr=function(e){return e},mr=e.forwardRef;void 0===mr&&(mr=pr),mr((function(t,n){var o=t["aria-current"],a=void 0===o?"page":o,l=t.activeClassName,s=void 0===l?"active":l,u=t.activeStyle,c=t.className,d=t.exact,f=t.isActive,p=t.location,m=t.sensitive,h=t.strict,v=t.style,g=t.to,y=t.innerRef,b=(0,i.A)(t,["aria-current","activeClassName","activeStyle","className","exact","isActive","location","sensitive","strict","style","to","innerRef"]);return e.createElement(Xn.Consumer,null,(function(t){t||Rn(!1);var o=p||t.location,i=sr(lr(g,o),o),l=i.pathname,x=l&&l.replace(/([.+*?=^!:${}()[\]|/\\])/g,"\\$1"),w=x?rr(o.pathname,{path:x,exact:d,sensitive:m,strict:h}):null,E=!!(f?f(w,o):w),k="function"==typeof c?c(E):c,S="function"==typeof v?v(E):v;E&&(k=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return t.filter((function(e){return e})).join(" ")}(k,s),S=(0,r.A)({},S,u));var A=(0,r.A)({"aria-current":E&&a||null,className:k,style:S,to:i},b);return pr!==mr?A.ref=n||y:A.innerRef=y,e.createElement(fr,A)}))}));var hr=n(9608),vr=n(4820),gr=n(7690),yr=n(3546);class br extends e.Component{constructor(e){super(e),this.state={roomCode:"",error:"",isLoading:!1,showSuccess:!1,validCode:!1},this.handleTextFieldChange=this.handleTextFieldChange.bind(this),this.roomButtonPressed=this.roomButtonPressed.bind(this),this.handleCloseSnackbar=this.handleCloseSnackbar.bind(this),this.validateRoomCode=this.validateRoomCode.bind(this)}validateRoomCode(e){return e.length>=4&&e.length<=8&&/^[A-Za-z0-9]+$/.test(e)}handleCloseSnackbar(){this.setState({error:"",showSuccess:!1})}render(){const{roomCode:t,error:n,isLoading:r,showSuccess:o,validCode:a}=this.state;return e.createElement(e.Fragment,null,e.createElement(R,{in:!0,timeout:800},e.createElement(L,{className:"music-card"},e.createElement(_,null,e.createElement(W,{container:!0,spacing:3},e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(q,{variant:"h4",component:"h1",className:"main-title"},"Join a Room")),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(It,{error:!!n,label:"Room Code",placeholder:"Enter a Room Code",value:t,helperText:n||"Enter the 4-8 character room code",variant:"outlined",onChange:this.handleTextFieldChange,fullWidth:!0,disabled:r,style:{maxWidth:"400px"},InputProps:{style:{color:"white"},endAdornment:a&&!n?e.createElement(gr.A,{style:{color:"#1DB954"}}):null},InputLabelProps:{style:{color:"rgba(255, 255, 255, 0.7)"}}})),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(Zt,{className:"action-button join-button",variant:"contained",startIcon:r?e.createElement(nn,{size:20,color:"inherit"}):e.createElement(vr.A,null),onClick:this.roomButtonPressed,size:"large",disabled:r||!t||!a},r?"Joining...":"Enter Room")),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(Zt,{className:"action-button",variant:"outlined",startIcon:e.createElement(hr.A,null),component:fr,to:"/",disabled:r,style:{background:"transparent",border:"1px solid rgba(255,255,255,0.2)",opacity:r?.6:1}},"Back")))))),e.createElement(un,{open:!!n||o,autoHideDuration:6e3,onClose:this.handleCloseSnackbar,anchorOrigin:{vertical:"bottom",horizontal:"center"}},n?e.createElement(xn,{severity:"error",variant:"filled",action:e.createElement(dn,{size:"small",color:"inherit",onClick:this.handleCloseSnackbar},e.createElement(yr.A,{fontSize:"small"}))},n):e.createElement(xn,{severity:"success",variant:"filled",action:e.createElement(dn,{size:"small",color:"inherit",onClick:this.handleCloseSnackbar},e.createElement(yr.A,{fontSize:"small"}))},"Room found! Joining now...")))}handleTextFieldChange(e){const t=e.target.value,n=this.validateRoomCode(t);this.setState({roomCode:t,validCode:n,error:""})}roomButtonPressed(){const{roomCode:e}=this.state;if(!e)return void this.setState({error:"Please enter a room code."});if(!this.validateRoomCode(e))return void this.setState({error:"Room code must be 4-8 alphanumeric characters."});this.setState({isLoading:!0,error:""});const t={method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({code:e})};fetch("/api/join-room",t).then((t=>{t.ok?(this.setState({showSuccess:!0,isLoading:!1}),setTimeout((()=>{this.props.history.push(`/room/${e}`)}),1500)):404===t.status?this.setState({error:"Room not found. Please check the code and try again.",isLoading:!1}):this.setState({error:"Failed to join the room. Please try again.",isLoading:!1})})).catch((e=>{console.error("Error joining room:",e),this.setState({error:"Network error. Please check your connection and try again.",isLoading:!1})}))}}const xr=(Er="withRouter("+((wr=br).displayName||wr.name)+")",kr=function(t){var n=t.wrappedComponentRef,o=(0,i.A)(t,["wrappedComponentRef"]);return e.createElement(Xn.Consumer,null,(function(t){return t||Rn(!1),e.createElement(wr,(0,r.A)({},o,t,{ref:n}))}))},kr.displayName=Er,kr.WrappedComponent=wr,$n()(kr,wr));var wr,Er,kr,Sr=e.forwardRef((function(t,n){var i=t.autoFocus,l=t.checked,s=t.checkedIcon,u=t.classes,c=t.className,d=t.defaultChecked,f=t.disabled,p=t.icon,m=t.id,h=t.inputProps,v=t.inputRef,g=t.name,y=t.onBlur,b=t.onChange,x=t.onFocus,w=t.readOnly,E=t.required,k=t.tabIndex,S=t.type,A=t.value,C=(0,a.A)(t,["autoFocus","checked","checkedIcon","classes","className","defaultChecked","disabled","icon","id","inputProps","inputRef","name","onBlur","onChange","onFocus","readOnly","required","tabIndex","type","value"]),R=(0,bt.A)({controlled:l,default:Boolean(d),name:"SwitchBase",state:"checked"}),T=(0,o.A)(R,2),N=T[0],O=T[1],M=ve(),L=f;M&&void 0===L&&(L=M.disabled);var z="checkbox"===S||"radio"===S;return e.createElement(dn,(0,r.A)({component:"span",className:(0,P.A)(u.root,c,N&&u.checked,L&&u.disabled),disabled:L,tabIndex:null,role:void 0,onFocus:function(e){x&&x(e),M&&M.onFocus&&M.onFocus(e)},onBlur:function(e){y&&y(e),M&&M.onBlur&&M.onBlur(e)},ref:n},C),e.createElement("input",(0,r.A)({autoFocus:i,checked:l,defaultChecked:d,className:u.input,disabled:L,id:z&&m,name:g,onChange:function(e){var t=e.target.checked;O(t),b&&b(e,t)},readOnly:w,ref:v,required:E,tabIndex:k,type:S,value:A},h)),N?s:p)}));const Ar=(0,T.A)({root:{padding:9},checked:{},disabled:{},input:{cursor:"inherit",position:"absolute",opacity:0,width:"100%",height:"100%",top:0,left:0,margin:0,padding:0,zIndex:1}},{name:"PrivateSwitchBase"})(Sr),Cr=(0,kt.A)(e.createElement("path",{d:"M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm0 18c-4.42 0-8-3.58-8-8s3.58-8 8-8 8 3.58 8 8-3.58 8-8 8z"}),"RadioButtonUnchecked"),Rr=(0,kt.A)(e.createElement("path",{d:"M8.465 8.465C9.37 7.56 10.62 7 12 7C14.76 7 17 9.24 17 12C17 13.38 16.44 14.63 15.535 15.535C14.63 16.44 13.38 17 12 17C9.24 17 7 14.76 7 12C7 10.62 7.56 9.37 8.465 8.465Z"}),"RadioButtonChecked"),Pr=(0,T.A)((function(e){return{root:{position:"relative",display:"flex","&$checked $layer":{transform:"scale(1)",transition:e.transitions.create("transform",{easing:e.transitions.easing.easeOut,duration:e.transitions.duration.shortest})}},layer:{left:0,position:"absolute",transform:"scale(0)",transition:e.transitions.create("transform",{easing:e.transitions.easing.easeIn,duration:e.transitions.duration.shortest})},checked:{}}}),{name:"PrivateRadioButtonIcon"})((function(t){var n=t.checked,r=t.classes,o=t.fontSize;return e.createElement("div",{className:(0,P.A)(r.root,n&&r.checked)},e.createElement(Cr,{fontSize:o}),e.createElement(Rr,{fontSize:o,className:r.layer}))})),Tr=e.createContext();var Nr=e.createElement(Pr,{checked:!0}),Or=e.createElement(Pr,null),Mr=e.forwardRef((function(t,n){var o=t.checked,i=t.classes,l=t.color,s=void 0===l?"secondary":l,u=t.name,c=t.onChange,d=t.size,f=void 0===d?"medium":d,p=(0,a.A)(t,["checked","classes","color","name","onChange","size"]),m=e.useContext(Tr),h=o,v=(0,Ne.A)(c,m&&m.onChange),g=u;return m&&(void 0===h&&(h=m.value===t.value),void 0===g&&(g=m.name)),e.createElement(Ar,(0,r.A)({color:s,type:"radio",icon:e.cloneElement(Or,{fontSize:"small"===f?"small":"medium"}),checkedIcon:e.cloneElement(Nr,{fontSize:"small"===f?"small":"medium"}),classes:{root:(0,P.A)(i.root,i["color".concat((0,V.A)(s))]),checked:i.checked,disabled:i.disabled},name:g,checked:h,onChange:v,ref:n},p))}));const Lr=(0,T.A)((function(e){return{root:{color:e.palette.text.secondary},checked:{},disabled:{},colorPrimary:{"&$checked":{color:e.palette.primary.main,"&:hover":{backgroundColor:(0,Dt.X4)(e.palette.primary.main,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},"&$disabled":{color:e.palette.action.disabled}},colorSecondary:{"&$checked":{color:e.palette.secondary.main,"&:hover":{backgroundColor:(0,Dt.X4)(e.palette.secondary.main,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},"&$disabled":{color:e.palette.action.disabled}}}}),{name:"MuiRadio"})(Mr);var zr=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.row,s=void 0!==l&&l,u=(0,a.A)(t,["classes","className","row"]);return e.createElement("div",(0,r.A)({className:(0,P.A)(o.root,i,s&&o.row),ref:n},u))}));const _r=(0,T.A)({root:{display:"flex",flexDirection:"column",flexWrap:"wrap"},row:{flexDirection:"row"}},{name:"MuiFormGroup"})(zr);var Ir=n(4232);const Dr=e.forwardRef((function(t,n){var i=t.actions,l=t.children,s=t.name,u=t.value,c=t.onChange,d=(0,a.A)(t,["actions","children","name","value","onChange"]),f=e.useRef(null),p=(0,bt.A)({controlled:u,default:t.defaultValue,name:"RadioGroup"}),m=(0,o.A)(p,2),h=m[0],v=m[1];e.useImperativeHandle(i,(function(){return{focus:function(){var e=f.current.querySelector("input:not(:disabled):checked");e||(e=f.current.querySelector("input:not(:disabled)")),e&&e.focus()}}}),[]);var g=(0,k.A)(n,f),y=(0,Ir.A)(s);return e.createElement(Tr.Provider,{value:{name:y,onChange:function(e){v(e.target.value),c&&c(e,e.target.value)},value:h}},e.createElement(_r,(0,r.A)({role:"radiogroup",ref:g},d),l))}));var Fr=e.forwardRef((function(t,n){t.checked;var o=t.classes,i=t.className,l=t.control,s=t.disabled,u=(t.inputRef,t.label),c=t.labelPlacement,d=void 0===c?"end":c,f=(t.name,t.onChange,t.value,(0,a.A)(t,["checked","classes","className","control","disabled","inputRef","label","labelPlacement","name","onChange","value"])),p=ve(),m=s;void 0===m&&void 0!==l.props.disabled&&(m=l.props.disabled),void 0===m&&p&&(m=p.disabled);var h={disabled:m};return["checked","name","onChange","value","inputRef"].forEach((function(e){void 0===l.props[e]&&void 0!==t[e]&&(h[e]=t[e])})),e.createElement("label",(0,r.A)({className:(0,P.A)(o.root,i,"end"!==d&&o["labelPlacement".concat((0,V.A)(d))],m&&o.disabled),ref:n},f),e.cloneElement(l,h),e.createElement(q,{component:"span",className:(0,P.A)(o.label,m&&o.disabled)},u))}));const jr=(0,T.A)((function(e){return{root:{display:"inline-flex",alignItems:"center",cursor:"pointer",verticalAlign:"middle",WebkitTapHighlightColor:"transparent",marginLeft:-11,marginRight:16,"&$disabled":{cursor:"default"}},labelPlacementStart:{flexDirection:"row-reverse",marginLeft:16,marginRight:-11},labelPlacementTop:{flexDirection:"column-reverse",marginLeft:16},labelPlacementBottom:{flexDirection:"column",marginLeft:16},disabled:{},label:{"&$disabled":{color:e.palette.text.disabled}}}}),{name:"MuiFormControlLabel"})(Fr);var Br=e.forwardRef((function(t,n){var i=t.children,l=t.classes,s=t.className,u=t.collapsedHeight,c=t.collapsedSize,d=void 0===c?"0px":c,f=t.component,p=void 0===f?"div":f,m=t.disableStrictModeCompat,h=void 0!==m&&m,y=t.in,b=t.onEnter,w=t.onEntered,S=t.onEntering,A=t.onExit,C=t.onExited,R=t.onExiting,T=t.style,N=t.timeout,O=void 0===N?g.p0.standard:N,M=t.TransitionComponent,L=void 0===M?v:M,z=(0,a.A)(t,["children","classes","className","collapsedHeight","collapsedSize","component","disableStrictModeCompat","in","onEnter","onEntered","onEntering","onExit","onExited","onExiting","style","timeout","TransitionComponent"]),_=x(),I=e.useRef(),D=e.useRef(null),F=e.useRef(),j="number"==typeof(u||d)?"".concat(u||d,"px"):u||d;e.useEffect((function(){return function(){clearTimeout(I.current)}}),[]);var B=_.unstable_strictMode&&!h,W=e.useRef(null),$=(0,k.A)(n,B?W:void 0),V=function(e){return function(t,n){if(e){var r=B?[W.current,t]:[t,n],a=(0,o.A)(r,2),i=a[0],l=a[1];void 0===l?e(i):e(i,l)}}},H=V((function(e,t){e.style.height=j,b&&b(e,t)})),U=V((function(e,t){var n=D.current?D.current.clientHeight:0,r=E({style:T,timeout:O},{mode:"enter"}).duration;if("auto"===O){var o=_.transitions.getAutoHeightDuration(n);e.style.transitionDuration="".concat(o,"ms"),F.current=o}else e.style.transitionDuration="string"==typeof r?r:"".concat(r,"ms");e.style.height="".concat(n,"px"),S&&S(e,t)})),q=V((function(e,t){e.style.height="auto",w&&w(e,t)})),K=V((function(e){var t=D.current?D.current.clientHeight:0;e.style.height="".concat(t,"px"),A&&A(e)})),X=V(C),Q=V((function(e){var t=D.current?D.current.clientHeight:0,n=E({style:T,timeout:O},{mode:"exit"}).duration;if("auto"===O){var r=_.transitions.getAutoHeightDuration(t);e.style.transitionDuration="".concat(r,"ms"),F.current=r}else e.style.transitionDuration="string"==typeof n?n:"".concat(n,"ms");e.style.height=j,R&&R(e)}));return e.createElement(L,(0,r.A)({in:y,onEnter:H,onEntered:q,onEntering:U,onExit:K,onExited:X,onExiting:Q,addEndListener:function(e,t){var n=B?e:t;"auto"===O&&(I.current=setTimeout(n,F.current||0))},nodeRef:B?W:void 0,timeout:"auto"===O?null:O},z),(function(t,n){return e.createElement(p,(0,r.A)({className:(0,P.A)(l.root,l.container,s,{entered:l.entered,exited:!y&&"0px"===j&&l.hidden}[t]),style:(0,r.A)({minHeight:j},T),ref:$},n),e.createElement("div",{className:l.wrapper,ref:D},e.createElement("div",{className:l.wrapperInner},i)))}))}));Br.muiSupportAuto=!0;const Wr=(0,T.A)((function(e){return{root:{height:0,overflow:"hidden",transition:e.transitions.create("height")},entered:{height:"auto",overflow:"visible"},hidden:{visibility:"hidden"},wrapper:{display:"flex"},wrapperInner:{width:"100%"}}}),{name:"MuiCollapse"})(Br);class $r extends e.Component{constructor(e){super(e),this.state={guestCanPause:this.props.guestCanPause,votesToSkip:this.props.votesToSkip,errorMsg:"",successMsg:""},this.handleRoomButtonPressed=this.handleRoomButtonPressed.bind(this),this.handleVotesChange=this.handleVotesChange.bind(this),this.handleGuestCanPauseChange=this.handleGuestCanPauseChange.bind(this),this.handleUpdateButtonPressed=this.handleUpdateButtonPressed.bind(this)}handleVotesChange(e){this.setState({votesToSkip:e.target.value})}handleGuestCanPauseChange(e){this.setState({guestCanPause:"true"===e.target.value})}handleRoomButtonPressed(){const e={method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({votes_to_skip:this.state.votesToSkip,guest_can_pause:this.state.guestCanPause})};fetch("/api/create-room",e).then((e=>e.json())).then((e=>this.props.history.push("/room/"+e.code)))}handleUpdateButtonPressed(){const e={method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({votes_to_skip:this.state.votesToSkip,guest_can_pause:this.state.guestCanPause,code:this.props.roomCode})};fetch("/api/update-room",e).then((e=>{e.ok?this.setState({successMsg:"Room updated successfully!"}):this.setState({errorMsg:"Error updating room..."}),this.props.updateCallback()}))}renderCreateButtons(){return e.createElement(W,{container:!0,spacing:1},e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(Zt,{color:"primary",variant:"contained",onClick:this.handleRoomButtonPressed},"Create A Room")),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(Zt,{color:"secondary",variant:"contained",to:"/",component:fr},"Back")))}renderUpdateButtons(){return e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(Zt,{color:"primary",variant:"contained",onClick:this.handleUpdateButtonPressed},"Update Room"))}render(){const t=this.props.update?"Update Room":"Create a Room";return e.createElement(W,{container:!0,spacing:1},e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(Wr,{in:""!=this.state.errorMsg||""!=this.state.successMsg},""!=this.state.successMsg?e.createElement(xn,{severity:"success",onClose:()=>{this.setState({successMsg:""})}},this.state.successMsg):e.createElement(xn,{severity:"error",onClose:()=>{this.setState({errorMsg:""})}},this.state.errorMsg))),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(q,{component:"h4",variant:"h4"},t)),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(ke,{component:"fieldset"},e.createElement(Ae,null,e.createElement("div",{align:"center"},"Guest Control of Playback State")),e.createElement(Dr,{row:!0,defaultValue:this.props.guestCanPause.toString(),onChange:this.handleGuestCanPauseChange},e.createElement(jr,{value:"true",control:e.createElement(Lr,{color:"primary"}),label:"Play/Pause",labelPlacement:"bottom"}),e.createElement(jr,{value:"false",control:e.createElement(Lr,{color:"secondary"}),label:"No Control",labelPlacement:"bottom"})))),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(ke,null,e.createElement(It,{required:!0,type:"number",onChange:this.handleVotesChange,defaultValue:this.state.votesToSkip,inputProps:{min:1,style:{textAlign:"center"}}}),e.createElement(Ae,null,e.createElement("div",{align:"center"},"Votes Required To Skip Song")))),this.props.update?this.renderUpdateButtons():this.renderCreateButtons())}}var Vr,Hr,Ur;Vr=$r,Ur={votesToSkip:2,guestCanPause:!0,update:!1,roomCode:null,updateCallback:()=>{}},(Hr=function(e){var t=function(e){if("object"!=typeof e||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=typeof n)return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==typeof t?t:t+""}(Hr="defaultProps"))in Vr?Object.defineProperty(Vr,Hr,{value:Ur,enumerable:!0,configurable:!0,writable:!0}):Vr[Hr]=Ur;var qr=n(2777);function Kr(e,t){var n={};return Object.keys(e).forEach((function(r){-1===t.indexOf(r)&&(n[r]=e[r])})),n}const Xr=function(e){var t=function(t){var n=e(t);return t.css?(0,r.A)({},(0,qr.A)(n,e((0,r.A)({theme:t.theme},t.css))),Kr(t.css,[e.filterProps])):t.sx?(0,r.A)({},(0,qr.A)(n,e((0,r.A)({theme:t.theme},t.sx))),Kr(t.sx,[e.filterProps])):n};return t.propTypes={},t.filterProps=["css","sx"].concat((0,Fe.A)(e.filterProps)),t},Qr=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];var r=function(e){return t.reduce((function(t,n){var r=n(e);return r?(0,qr.A)(t,r):t}),{})};return r.propTypes={},r.filterProps=t.reduce((function(e,t){return e.concat(t.filterProps)}),[]),r};var Yr=n(7969);function Gr(e,t){return t&&"string"==typeof t?t.split(".").reduce((function(e,t){return e&&e[t]?e[t]:null}),e):null}const Jr=function(e){var t=e.prop,n=e.cssProperty,r=void 0===n?e.prop:n,o=e.themeKey,a=e.transform,i=function(e){if(null==e[t])return null;var n=e[t],i=Gr(e.theme,o)||{};return(0,Yr.N)(e,n,(function(e){var t;return"function"==typeof i?t=i(e):Array.isArray(i)?t=i[e]||e:(t=Gr(i,e)||e,a&&(t=a(t))),!1===r?t:(0,de.A)({},r,t)}))};return i.propTypes={},i.filterProps=[t],i};function Zr(e){return"number"!=typeof e?e:"".concat(e,"px solid")}const eo=Qr(Jr({prop:"border",themeKey:"borders",transform:Zr}),Jr({prop:"borderTop",themeKey:"borders",transform:Zr}),Jr({prop:"borderRight",themeKey:"borders",transform:Zr}),Jr({prop:"borderBottom",themeKey:"borders",transform:Zr}),Jr({prop:"borderLeft",themeKey:"borders",transform:Zr}),Jr({prop:"borderColor",themeKey:"palette"}),Jr({prop:"borderRadius",themeKey:"shape"})),to=Qr(Jr({prop:"displayPrint",cssProperty:!1,transform:function(e){return{"@media print":{display:e}}}}),Jr({prop:"display"}),Jr({prop:"overflow"}),Jr({prop:"textOverflow"}),Jr({prop:"visibility"}),Jr({prop:"whiteSpace"})),no=Qr(Jr({prop:"flexBasis"}),Jr({prop:"flexDirection"}),Jr({prop:"flexWrap"}),Jr({prop:"justifyContent"}),Jr({prop:"alignItems"}),Jr({prop:"alignContent"}),Jr({prop:"order"}),Jr({prop:"flex"}),Jr({prop:"flexGrow"}),Jr({prop:"flexShrink"}),Jr({prop:"alignSelf"}),Jr({prop:"justifyItems"}),Jr({prop:"justifySelf"})),ro=Qr(Jr({prop:"gridGap"}),Jr({prop:"gridColumnGap"}),Jr({prop:"gridRowGap"}),Jr({prop:"gridColumn"}),Jr({prop:"gridRow"}),Jr({prop:"gridAutoFlow"}),Jr({prop:"gridAutoColumns"}),Jr({prop:"gridAutoRows"}),Jr({prop:"gridTemplateColumns"}),Jr({prop:"gridTemplateRows"}),Jr({prop:"gridTemplateAreas"}),Jr({prop:"gridArea"})),oo=Qr(Jr({prop:"position"}),Jr({prop:"zIndex",themeKey:"zIndex"}),Jr({prop:"top"}),Jr({prop:"right"}),Jr({prop:"bottom"}),Jr({prop:"left"})),ao=Qr(Jr({prop:"color",themeKey:"palette"}),Jr({prop:"bgcolor",cssProperty:"backgroundColor",themeKey:"palette"})),io=Jr({prop:"boxShadow",themeKey:"shadows"});function lo(e){return e<=1?"".concat(100*e,"%"):e}var so=Jr({prop:"width",transform:lo}),uo=Jr({prop:"maxWidth",transform:lo}),co=Jr({prop:"minWidth",transform:lo}),fo=Jr({prop:"height",transform:lo}),po=Jr({prop:"maxHeight",transform:lo}),mo=Jr({prop:"minHeight",transform:lo});Jr({prop:"size",cssProperty:"width",transform:lo}),Jr({prop:"size",cssProperty:"height",transform:lo});const ho=Qr(so,uo,co,fo,po,mo,Jr({prop:"boxSizing"}));var vo=n(6535);const go=Qr(Jr({prop:"fontFamily",themeKey:"typography"}),Jr({prop:"fontSize",themeKey:"typography"}),Jr({prop:"fontStyle",themeKey:"typography"}),Jr({prop:"fontWeight",themeKey:"typography"}),Jr({prop:"letterSpacing"}),Jr({prop:"lineHeight"}),Jr({prop:"textAlign"}));var yo=n(2611);var bo=Xr(Qr(eo,to,no,ro,oo,ao,io,ho,vo.A,go));const xo=function(t){var n=function(t){return function(n){var o,i=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},l=i.name,s=(0,a.A)(i,["name"]),u=l,c="function"==typeof n?function(e){return{root:function(t){return n((0,r.A)({theme:e},t))}}}:{root:n},d=(0,yo.A)(c,(0,r.A)({Component:t,name:l||t.displayName,classNamePrefix:u},s));n.filterProps&&(o=n.filterProps,delete n.filterProps),n.propTypes&&(n.propTypes,delete n.propTypes);var f=e.forwardRef((function(n,i){var l,s,u,c=n.children,f=n.className,p=n.clone,m=n.component,h=(0,a.A)(n,["children","className","clone","component"]),v=d(n),g=(0,P.A)(v.root,f),y=h;if(o&&(l=y,s=o,u={},Object.keys(l).forEach((function(e){-1===s.indexOf(e)&&(u[e]=l[e])})),y=u),p)return e.cloneElement(c,(0,r.A)({className:(0,P.A)(c.props.className,g)},y));if("function"==typeof c)return c((0,r.A)({className:g},y));var b=m||t;return e.createElement(b,(0,r.A)({ref:i,className:g},y),c)}));return $n()(f,t),f}}(t);return function(e,t){return n(e,(0,r.A)({defaultTheme:b.A},t))}}("div")(bo,{name:"MuiBox"});var wo=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.color,s=void 0===l?"primary":l,u=t.component,c=void 0===u?"a":u,d=t.onBlur,f=t.onFocus,p=t.TypographyClasses,m=t.underline,h=void 0===m?"hover":m,v=t.variant,g=void 0===v?"inherit":v,y=(0,a.A)(t,["classes","className","color","component","onBlur","onFocus","TypographyClasses","underline","variant"]),b=(0,Ft.A)(),x=b.isFocusVisible,w=b.onBlurVisible,E=b.ref,S=e.useState(!1),A=S[0],C=S[1],R=(0,k.A)(n,E);return e.createElement(q,(0,r.A)({className:(0,P.A)(o.root,o["underline".concat((0,V.A)(h))],i,A&&o.focusVisible,"button"===c&&o.button),classes:p,color:s,component:c,onBlur:function(e){A&&(w(),C(!1)),d&&d(e)},onFocus:function(e){x(e)&&C(!0),f&&f(e)},ref:R,variant:g},y))}));const Eo=(0,T.A)({root:{},underlineNone:{textDecoration:"none"},underlineHover:{textDecoration:"none","&:hover":{textDecoration:"underline"}},underlineAlways:{textDecoration:"underline"},button:{position:"relative",WebkitTapHighlightColor:"transparent",backgroundColor:"transparent",outline:0,border:0,margin:0,borderRadius:0,padding:0,cursor:"pointer",userSelect:"none",verticalAlign:"middle","-moz-appearance":"none","-webkit-appearance":"none","&::-moz-focus-inner":{borderStyle:"none"},"&$focusVisible":{outline:"auto"}},focusVisible:{}},{name:"MuiLink"})(wo);var ko=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.component,s=void 0===l?"div":l,u=t.disableGutters,c=void 0!==u&&u,d=t.fixed,f=void 0!==d&&d,p=t.maxWidth,m=void 0===p?"lg":p,h=(0,a.A)(t,["classes","className","component","disableGutters","fixed","maxWidth"]);return e.createElement(s,(0,r.A)({className:(0,P.A)(o.root,i,f&&o.fixed,c&&o.disableGutters,!1!==m&&o["maxWidth".concat((0,V.A)(String(m)))]),ref:n},h))}));const So=(0,T.A)((function(e){return{root:(0,de.A)({width:"100%",marginLeft:"auto",boxSizing:"border-box",marginRight:"auto",paddingLeft:e.spacing(2),paddingRight:e.spacing(2),display:"block"},e.breakpoints.up("sm"),{paddingLeft:e.spacing(3),paddingRight:e.spacing(3)}),disableGutters:{paddingLeft:0,paddingRight:0},fixed:Object.keys(e.breakpoints.values).reduce((function(t,n){var r=e.breakpoints.values[n];return 0!==r&&(t[e.breakpoints.up(n)]={maxWidth:r}),t}),{}),maxWidthXs:(0,de.A)({},e.breakpoints.up("xs"),{maxWidth:Math.max(e.breakpoints.values.xs,444)}),maxWidthSm:(0,de.A)({},e.breakpoints.up("sm"),{maxWidth:e.breakpoints.values.sm}),maxWidthMd:(0,de.A)({},e.breakpoints.up("md"),{maxWidth:e.breakpoints.values.md}),maxWidthLg:(0,de.A)({},e.breakpoints.up("lg"),{maxWidth:e.breakpoints.values.lg}),maxWidthXl:(0,de.A)({},e.breakpoints.up("xl"),{maxWidth:e.breakpoints.values.xl})}}),{name:"MuiContainer"})(ko);var Ao=n(2851),Co="undefined"!=typeof window&&"undefined"!=typeof document&&"undefined"!=typeof navigator,Ro=function(){for(var e=["Edge","Trident","Firefox"],t=0;t<e.length;t+=1)if(Co&&navigator.userAgent.indexOf(e[t])>=0)return 1;return 0}(),Po=Co&&window.Promise?function(e){var t=!1;return function(){t||(t=!0,window.Promise.resolve().then((function(){t=!1,e()})))}}:function(e){var t=!1;return function(){t||(t=!0,setTimeout((function(){t=!1,e()}),Ro))}};function To(e){return e&&"[object Function]"==={}.toString.call(e)}function No(e,t){if(1!==e.nodeType)return[];var n=e.ownerDocument.defaultView.getComputedStyle(e,null);return t?n[t]:n}function Oo(e){return"HTML"===e.nodeName?e:e.parentNode||e.host}function Mo(e){if(!e)return document.body;switch(e.nodeName){case"HTML":case"BODY":return e.ownerDocument.body;case"#document":return e.body}var t=No(e),n=t.overflow,r=t.overflowX,o=t.overflowY;return/(auto|scroll|overlay)/.test(n+o+r)?e:Mo(Oo(e))}function Lo(e){return e&&e.referenceNode?e.referenceNode:e}var zo=Co&&!(!window.MSInputMethodContext||!document.documentMode),_o=Co&&/MSIE 10/.test(navigator.userAgent);function Io(e){return 11===e?zo:10===e?_o:zo||_o}function Do(e){if(!e)return document.documentElement;for(var t=Io(10)?document.body:null,n=e.offsetParent||null;n===t&&e.nextElementSibling;)n=(e=e.nextElementSibling).offsetParent;var r=n&&n.nodeName;return r&&"BODY"!==r&&"HTML"!==r?-1!==["TH","TD","TABLE"].indexOf(n.nodeName)&&"static"===No(n,"position")?Do(n):n:e?e.ownerDocument.documentElement:document.documentElement}function Fo(e){return null!==e.parentNode?Fo(e.parentNode):e}function jo(e,t){if(!(e&&e.nodeType&&t&&t.nodeType))return document.documentElement;var n=e.compareDocumentPosition(t)&Node.DOCUMENT_POSITION_FOLLOWING,r=n?e:t,o=n?t:e,a=document.createRange();a.setStart(r,0),a.setEnd(o,0);var i,l,s=a.commonAncestorContainer;if(e!==s&&t!==s||r.contains(o))return"BODY"===(l=(i=s).nodeName)||"HTML"!==l&&Do(i.firstElementChild)!==i?Do(s):s;var u=Fo(e);return u.host?jo(u.host,t):jo(e,Fo(t).host)}function Bo(e){var t="top"===(arguments.length>1&&void 0!==arguments[1]?arguments[1]:"top")?"scrollTop":"scrollLeft",n=e.nodeName;if("BODY"===n||"HTML"===n){var r=e.ownerDocument.documentElement;return(e.ownerDocument.scrollingElement||r)[t]}return e[t]}function Wo(e,t){var n="x"===t?"Left":"Top",r="Left"===n?"Right":"Bottom";return parseFloat(e["border"+n+"Width"])+parseFloat(e["border"+r+"Width"])}function $o(e,t,n,r){return Math.max(t["offset"+e],t["scroll"+e],n["client"+e],n["offset"+e],n["scroll"+e],Io(10)?parseInt(n["offset"+e])+parseInt(r["margin"+("Height"===e?"Top":"Left")])+parseInt(r["margin"+("Height"===e?"Bottom":"Right")]):0)}function Vo(e){var t=e.body,n=e.documentElement,r=Io(10)&&getComputedStyle(n);return{height:$o("Height",t,n,r),width:$o("Width",t,n,r)}}var Ho=function(){function e(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}return function(t,n,r){return n&&e(t.prototype,n),r&&e(t,r),t}}(),Uo=function(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e},qo=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e};function Ko(e){return qo({},e,{right:e.left+e.width,bottom:e.top+e.height})}function Xo(e){var t={};try{if(Io(10)){t=e.getBoundingClientRect();var n=Bo(e,"top"),r=Bo(e,"left");t.top+=n,t.left+=r,t.bottom+=n,t.right+=r}else t=e.getBoundingClientRect()}catch(e){}var o={left:t.left,top:t.top,width:t.right-t.left,height:t.bottom-t.top},a="HTML"===e.nodeName?Vo(e.ownerDocument):{},i=a.width||e.clientWidth||o.width,l=a.height||e.clientHeight||o.height,s=e.offsetWidth-i,u=e.offsetHeight-l;if(s||u){var c=No(e);s-=Wo(c,"x"),u-=Wo(c,"y"),o.width-=s,o.height-=u}return Ko(o)}function Qo(e,t){var n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],r=Io(10),o="HTML"===t.nodeName,a=Xo(e),i=Xo(t),l=Mo(e),s=No(t),u=parseFloat(s.borderTopWidth),c=parseFloat(s.borderLeftWidth);n&&o&&(i.top=Math.max(i.top,0),i.left=Math.max(i.left,0));var d=Ko({top:a.top-i.top-u,left:a.left-i.left-c,width:a.width,height:a.height});if(d.marginTop=0,d.marginLeft=0,!r&&o){var f=parseFloat(s.marginTop),p=parseFloat(s.marginLeft);d.top-=u-f,d.bottom-=u-f,d.left-=c-p,d.right-=c-p,d.marginTop=f,d.marginLeft=p}return(r&&!n?t.contains(l):t===l&&"BODY"!==l.nodeName)&&(d=function(e,t){var n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],r=Bo(t,"top"),o=Bo(t,"left"),a=n?-1:1;return e.top+=r*a,e.bottom+=r*a,e.left+=o*a,e.right+=o*a,e}(d,t)),d}function Yo(e){var t=e.nodeName;if("BODY"===t||"HTML"===t)return!1;if("fixed"===No(e,"position"))return!0;var n=Oo(e);return!!n&&Yo(n)}function Go(e){if(!e||!e.parentElement||Io())return document.documentElement;for(var t=e.parentElement;t&&"none"===No(t,"transform");)t=t.parentElement;return t||document.documentElement}function Jo(e,t,n,r){var o=arguments.length>4&&void 0!==arguments[4]&&arguments[4],a={top:0,left:0},i=o?Go(e):jo(e,Lo(t));if("viewport"===r)a=function(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n=e.ownerDocument.documentElement,r=Qo(e,n),o=Math.max(n.clientWidth,window.innerWidth||0),a=Math.max(n.clientHeight,window.innerHeight||0),i=t?0:Bo(n),l=t?0:Bo(n,"left");return Ko({top:i-r.top+r.marginTop,left:l-r.left+r.marginLeft,width:o,height:a})}(i,o);else{var l=void 0;"scrollParent"===r?"BODY"===(l=Mo(Oo(t))).nodeName&&(l=e.ownerDocument.documentElement):l="window"===r?e.ownerDocument.documentElement:r;var s=Qo(l,i,o);if("HTML"!==l.nodeName||Yo(i))a=s;else{var u=Vo(e.ownerDocument),c=u.height,d=u.width;a.top+=s.top-s.marginTop,a.bottom=c+s.top,a.left+=s.left-s.marginLeft,a.right=d+s.left}}var f="number"==typeof(n=n||0);return a.left+=f?n:n.left||0,a.top+=f?n:n.top||0,a.right-=f?n:n.right||0,a.bottom-=f?n:n.bottom||0,a}function Zo(e){return e.width*e.height}function ea(e,t,n,r,o){var a=arguments.length>5&&void 0!==arguments[5]?arguments[5]:0;if(-1===e.indexOf("auto"))return e;var i=Jo(n,r,a,o),l={top:{width:i.width,height:t.top-i.top},right:{width:i.right-t.right,height:i.height},bottom:{width:i.width,height:i.bottom-t.bottom},left:{width:t.left-i.left,height:i.height}},s=Object.keys(l).map((function(e){return qo({key:e},l[e],{area:Zo(l[e])})})).sort((function(e,t){return t.area-e.area})),u=s.filter((function(e){var t=e.width,r=e.height;return t>=n.clientWidth&&r>=n.clientHeight})),c=u.length>0?u[0].key:s[0].key,d=e.split("-")[1];return c+(d?"-"+d:"")}function ta(e,t,n){var r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:null;return Qo(n,r?Go(t):jo(t,Lo(n)),r)}function na(e){var t=e.ownerDocument.defaultView.getComputedStyle(e),n=parseFloat(t.marginTop||0)+parseFloat(t.marginBottom||0),r=parseFloat(t.marginLeft||0)+parseFloat(t.marginRight||0);return{width:e.offsetWidth+r,height:e.offsetHeight+n}}function ra(e){var t={left:"right",right:"left",bottom:"top",top:"bottom"};return e.replace(/left|right|bottom|top/g,(function(e){return t[e]}))}function oa(e,t,n){n=n.split("-")[0];var r=na(e),o={width:r.width,height:r.height},a=-1!==["right","left"].indexOf(n),i=a?"top":"left",l=a?"left":"top",s=a?"height":"width",u=a?"width":"height";return o[i]=t[i]+t[s]/2-r[s]/2,o[l]=n===l?t[l]-r[u]:t[ra(l)],o}function aa(e,t){return Array.prototype.find?e.find(t):e.filter(t)[0]}function ia(e,t,n){return(void 0===n?e:e.slice(0,function(e,t,n){if(Array.prototype.findIndex)return e.findIndex((function(e){return e[t]===n}));var r=aa(e,(function(e){return e[t]===n}));return e.indexOf(r)}(e,"name",n))).forEach((function(e){e.function&&console.warn("`modifier.function` is deprecated, use `modifier.fn`!");var n=e.function||e.fn;e.enabled&&To(n)&&(t.offsets.popper=Ko(t.offsets.popper),t.offsets.reference=Ko(t.offsets.reference),t=n(t,e))})),t}function la(){if(!this.state.isDestroyed){var e={instance:this,styles:{},arrowStyles:{},attributes:{},flipped:!1,offsets:{}};e.offsets.reference=ta(this.state,this.popper,this.reference,this.options.positionFixed),e.placement=ea(this.options.placement,e.offsets.reference,this.popper,this.reference,this.options.modifiers.flip.boundariesElement,this.options.modifiers.flip.padding),e.originalPlacement=e.placement,e.positionFixed=this.options.positionFixed,e.offsets.popper=oa(this.popper,e.offsets.reference,e.placement),e.offsets.popper.position=this.options.positionFixed?"fixed":"absolute",e=ia(this.modifiers,e),this.state.isCreated?this.options.onUpdate(e):(this.state.isCreated=!0,this.options.onCreate(e))}}function sa(e,t){return e.some((function(e){var n=e.name;return e.enabled&&n===t}))}function ua(e){for(var t=[!1,"ms","Webkit","Moz","O"],n=e.charAt(0).toUpperCase()+e.slice(1),r=0;r<t.length;r++){var o=t[r],a=o?""+o+n:e;if(void 0!==document.body.style[a])return a}return null}function ca(){return this.state.isDestroyed=!0,sa(this.modifiers,"applyStyle")&&(this.popper.removeAttribute("x-placement"),this.popper.style.position="",this.popper.style.top="",this.popper.style.left="",this.popper.style.right="",this.popper.style.bottom="",this.popper.style.willChange="",this.popper.style[ua("transform")]=""),this.disableEventListeners(),this.options.removeOnDestroy&&this.popper.parentNode.removeChild(this.popper),this}function da(e){var t=e.ownerDocument;return t?t.defaultView:window}function fa(e,t,n,r){var o="BODY"===e.nodeName,a=o?e.ownerDocument.defaultView:e;a.addEventListener(t,n,{passive:!0}),o||fa(Mo(a.parentNode),t,n,r),r.push(a)}function pa(e,t,n,r){n.updateBound=r,da(e).addEventListener("resize",n.updateBound,{passive:!0});var o=Mo(e);return fa(o,"scroll",n.updateBound,n.scrollParents),n.scrollElement=o,n.eventsEnabled=!0,n}function ma(){this.state.eventsEnabled||(this.state=pa(this.reference,this.options,this.state,this.scheduleUpdate))}function ha(){var e,t;this.state.eventsEnabled&&(cancelAnimationFrame(this.scheduleUpdate),this.state=(e=this.reference,t=this.state,da(e).removeEventListener("resize",t.updateBound),t.scrollParents.forEach((function(e){e.removeEventListener("scroll",t.updateBound)})),t.updateBound=null,t.scrollParents=[],t.scrollElement=null,t.eventsEnabled=!1,t))}function va(e){return""!==e&&!isNaN(parseFloat(e))&&isFinite(e)}function ga(e,t){Object.keys(t).forEach((function(n){var r="";-1!==["width","height","top","right","bottom","left"].indexOf(n)&&va(t[n])&&(r="px"),e.style[n]=t[n]+r}))}var ya=Co&&/Firefox/i.test(navigator.userAgent);function ba(e,t,n){var r=aa(e,(function(e){return e.name===t})),o=!!r&&e.some((function(e){return e.name===n&&e.enabled&&e.order<r.order}));if(!o){var a="`"+t+"`",i="`"+n+"`";console.warn(i+" modifier is required by "+a+" modifier in order to work, be sure to include it before "+a+"!")}return o}var xa=["auto-start","auto","auto-end","top-start","top","top-end","right-start","right","right-end","bottom-end","bottom","bottom-start","left-end","left","left-start"],wa=xa.slice(3);function Ea(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n=wa.indexOf(e),r=wa.slice(n+1).concat(wa.slice(0,n));return t?r.reverse():r}var ka={shift:{order:100,enabled:!0,fn:function(e){var t=e.placement,n=t.split("-")[0],r=t.split("-")[1];if(r){var o=e.offsets,a=o.reference,i=o.popper,l=-1!==["bottom","top"].indexOf(n),s=l?"left":"top",u=l?"width":"height",c={start:Uo({},s,a[s]),end:Uo({},s,a[s]+a[u]-i[u])};e.offsets.popper=qo({},i,c[r])}return e}},offset:{order:200,enabled:!0,fn:function(e,t){var n,r=t.offset,o=e.placement,a=e.offsets,i=a.popper,l=a.reference,s=o.split("-")[0];return n=va(+r)?[+r,0]:function(e,t,n,r){var o=[0,0],a=-1!==["right","left"].indexOf(r),i=e.split(/(\+|\-)/).map((function(e){return e.trim()})),l=i.indexOf(aa(i,(function(e){return-1!==e.search(/,|\s/)})));i[l]&&-1===i[l].indexOf(",")&&console.warn("Offsets separated by white space(s) are deprecated, use a comma (,) instead.");var s=/\s*,\s*|\s+/,u=-1!==l?[i.slice(0,l).concat([i[l].split(s)[0]]),[i[l].split(s)[1]].concat(i.slice(l+1))]:[i];return(u=u.map((function(e,r){var o=(1===r?!a:a)?"height":"width",i=!1;return e.reduce((function(e,t){return""===e[e.length-1]&&-1!==["+","-"].indexOf(t)?(e[e.length-1]=t,i=!0,e):i?(e[e.length-1]+=t,i=!1,e):e.concat(t)}),[]).map((function(e){return function(e,t,n,r){var o=e.match(/((?:\-|\+)?\d*\.?\d*)(.*)/),a=+o[1],i=o[2];return a?0===i.indexOf("%")?Ko("%p"===i?n:r)[t]/100*a:"vh"===i||"vw"===i?("vh"===i?Math.max(document.documentElement.clientHeight,window.innerHeight||0):Math.max(document.documentElement.clientWidth,window.innerWidth||0))/100*a:a:e}(e,o,t,n)}))}))).forEach((function(e,t){e.forEach((function(n,r){va(n)&&(o[t]+=n*("-"===e[r-1]?-1:1))}))})),o}(r,i,l,s),"left"===s?(i.top+=n[0],i.left-=n[1]):"right"===s?(i.top+=n[0],i.left+=n[1]):"top"===s?(i.left+=n[0],i.top-=n[1]):"bottom"===s&&(i.left+=n[0],i.top+=n[1]),e.popper=i,e},offset:0},preventOverflow:{order:300,enabled:!0,fn:function(e,t){var n=t.boundariesElement||Do(e.instance.popper);e.instance.reference===n&&(n=Do(n));var r=ua("transform"),o=e.instance.popper.style,a=o.top,i=o.left,l=o[r];o.top="",o.left="",o[r]="";var s=Jo(e.instance.popper,e.instance.reference,t.padding,n,e.positionFixed);o.top=a,o.left=i,o[r]=l,t.boundaries=s;var u=t.priority,c=e.offsets.popper,d={primary:function(e){var n=c[e];return c[e]<s[e]&&!t.escapeWithReference&&(n=Math.max(c[e],s[e])),Uo({},e,n)},secondary:function(e){var n="right"===e?"left":"top",r=c[n];return c[e]>s[e]&&!t.escapeWithReference&&(r=Math.min(c[n],s[e]-("right"===e?c.width:c.height))),Uo({},n,r)}};return u.forEach((function(e){var t=-1!==["left","top"].indexOf(e)?"primary":"secondary";c=qo({},c,d[t](e))})),e.offsets.popper=c,e},priority:["left","right","top","bottom"],padding:5,boundariesElement:"scrollParent"},keepTogether:{order:400,enabled:!0,fn:function(e){var t=e.offsets,n=t.popper,r=t.reference,o=e.placement.split("-")[0],a=Math.floor,i=-1!==["top","bottom"].indexOf(o),l=i?"right":"bottom",s=i?"left":"top",u=i?"width":"height";return n[l]<a(r[s])&&(e.offsets.popper[s]=a(r[s])-n[u]),n[s]>a(r[l])&&(e.offsets.popper[s]=a(r[l])),e}},arrow:{order:500,enabled:!0,fn:function(e,t){var n;if(!ba(e.instance.modifiers,"arrow","keepTogether"))return e;var r=t.element;if("string"==typeof r){if(!(r=e.instance.popper.querySelector(r)))return e}else if(!e.instance.popper.contains(r))return console.warn("WARNING: `arrow.element` must be child of its popper element!"),e;var o=e.placement.split("-")[0],a=e.offsets,i=a.popper,l=a.reference,s=-1!==["left","right"].indexOf(o),u=s?"height":"width",c=s?"Top":"Left",d=c.toLowerCase(),f=s?"left":"top",p=s?"bottom":"right",m=na(r)[u];l[p]-m<i[d]&&(e.offsets.popper[d]-=i[d]-(l[p]-m)),l[d]+m>i[p]&&(e.offsets.popper[d]+=l[d]+m-i[p]),e.offsets.popper=Ko(e.offsets.popper);var h=l[d]+l[u]/2-m/2,v=No(e.instance.popper),g=parseFloat(v["margin"+c]),y=parseFloat(v["border"+c+"Width"]),b=h-e.offsets.popper[d]-g-y;return b=Math.max(Math.min(i[u]-m,b),0),e.arrowElement=r,e.offsets.arrow=(Uo(n={},d,Math.round(b)),Uo(n,f,""),n),e},element:"[x-arrow]"},flip:{order:600,enabled:!0,fn:function(e,t){if(sa(e.instance.modifiers,"inner"))return e;if(e.flipped&&e.placement===e.originalPlacement)return e;var n=Jo(e.instance.popper,e.instance.reference,t.padding,t.boundariesElement,e.positionFixed),r=e.placement.split("-")[0],o=ra(r),a=e.placement.split("-")[1]||"",i=[];switch(t.behavior){case"flip":i=[r,o];break;case"clockwise":i=Ea(r);break;case"counterclockwise":i=Ea(r,!0);break;default:i=t.behavior}return i.forEach((function(l,s){if(r!==l||i.length===s+1)return e;r=e.placement.split("-")[0],o=ra(r);var u=e.offsets.popper,c=e.offsets.reference,d=Math.floor,f="left"===r&&d(u.right)>d(c.left)||"right"===r&&d(u.left)<d(c.right)||"top"===r&&d(u.bottom)>d(c.top)||"bottom"===r&&d(u.top)<d(c.bottom),p=d(u.left)<d(n.left),m=d(u.right)>d(n.right),h=d(u.top)<d(n.top),v=d(u.bottom)>d(n.bottom),g="left"===r&&p||"right"===r&&m||"top"===r&&h||"bottom"===r&&v,y=-1!==["top","bottom"].indexOf(r),b=!!t.flipVariations&&(y&&"start"===a&&p||y&&"end"===a&&m||!y&&"start"===a&&h||!y&&"end"===a&&v),x=!!t.flipVariationsByContent&&(y&&"start"===a&&m||y&&"end"===a&&p||!y&&"start"===a&&v||!y&&"end"===a&&h),w=b||x;(f||g||w)&&(e.flipped=!0,(f||g)&&(r=i[s+1]),w&&(a=function(e){return"end"===e?"start":"start"===e?"end":e}(a)),e.placement=r+(a?"-"+a:""),e.offsets.popper=qo({},e.offsets.popper,oa(e.instance.popper,e.offsets.reference,e.placement)),e=ia(e.instance.modifiers,e,"flip"))})),e},behavior:"flip",padding:5,boundariesElement:"viewport",flipVariations:!1,flipVariationsByContent:!1},inner:{order:700,enabled:!1,fn:function(e){var t=e.placement,n=t.split("-")[0],r=e.offsets,o=r.popper,a=r.reference,i=-1!==["left","right"].indexOf(n),l=-1===["top","left"].indexOf(n);return o[i?"left":"top"]=a[n]-(l?o[i?"width":"height"]:0),e.placement=ra(t),e.offsets.popper=Ko(o),e}},hide:{order:800,enabled:!0,fn:function(e){if(!ba(e.instance.modifiers,"hide","preventOverflow"))return e;var t=e.offsets.reference,n=aa(e.instance.modifiers,(function(e){return"preventOverflow"===e.name})).boundaries;if(t.bottom<n.top||t.left>n.right||t.top>n.bottom||t.right<n.left){if(!0===e.hide)return e;e.hide=!0,e.attributes["x-out-of-boundaries"]=""}else{if(!1===e.hide)return e;e.hide=!1,e.attributes["x-out-of-boundaries"]=!1}return e}},computeStyle:{order:850,enabled:!0,fn:function(e,t){var n=t.x,r=t.y,o=e.offsets.popper,a=aa(e.instance.modifiers,(function(e){return"applyStyle"===e.name})).gpuAcceleration;void 0!==a&&console.warn("WARNING: `gpuAcceleration` option moved to `computeStyle` modifier and will not be supported in future versions of Popper.js!");var i,l,s=void 0!==a?a:t.gpuAcceleration,u=Do(e.instance.popper),c=Xo(u),d={position:o.position},f=function(e,t){var n=e.offsets,r=n.popper,o=n.reference,a=Math.round,i=Math.floor,l=function(e){return e},s=a(o.width),u=a(r.width),c=-1!==["left","right"].indexOf(e.placement),d=-1!==e.placement.indexOf("-"),f=t?c||d||s%2==u%2?a:i:l,p=t?a:l;return{left:f(s%2==1&&u%2==1&&!d&&t?r.left-1:r.left),top:p(r.top),bottom:p(r.bottom),right:f(r.right)}}(e,window.devicePixelRatio<2||!ya),p="bottom"===n?"top":"bottom",m="right"===r?"left":"right",h=ua("transform");if(l="bottom"===p?"HTML"===u.nodeName?-u.clientHeight+f.bottom:-c.height+f.bottom:f.top,i="right"===m?"HTML"===u.nodeName?-u.clientWidth+f.right:-c.width+f.right:f.left,s&&h)d[h]="translate3d("+i+"px, "+l+"px, 0)",d[p]=0,d[m]=0,d.willChange="transform";else{var v="bottom"===p?-1:1,g="right"===m?-1:1;d[p]=l*v,d[m]=i*g,d.willChange=p+", "+m}var y={"x-placement":e.placement};return e.attributes=qo({},y,e.attributes),e.styles=qo({},d,e.styles),e.arrowStyles=qo({},e.offsets.arrow,e.arrowStyles),e},gpuAcceleration:!0,x:"bottom",y:"right"},applyStyle:{order:900,enabled:!0,fn:function(e){var t,n;return ga(e.instance.popper,e.styles),t=e.instance.popper,n=e.attributes,Object.keys(n).forEach((function(e){!1!==n[e]?t.setAttribute(e,n[e]):t.removeAttribute(e)})),e.arrowElement&&Object.keys(e.arrowStyles).length&&ga(e.arrowElement,e.arrowStyles),e},onLoad:function(e,t,n,r,o){var a=ta(o,t,e,n.positionFixed),i=ea(n.placement,a,t,e,n.modifiers.flip.boundariesElement,n.modifiers.flip.padding);return t.setAttribute("x-placement",i),ga(t,{position:n.positionFixed?"fixed":"absolute"}),n},gpuAcceleration:void 0}},Sa={placement:"bottom",positionFixed:!1,eventsEnabled:!0,removeOnDestroy:!1,onCreate:function(){},onUpdate:function(){},modifiers:ka},Aa=function(){function e(t,n){var r=this,o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.scheduleUpdate=function(){return requestAnimationFrame(r.update)},this.update=Po(this.update.bind(this)),this.options=qo({},e.Defaults,o),this.state={isDestroyed:!1,isCreated:!1,scrollParents:[]},this.reference=t&&t.jquery?t[0]:t,this.popper=n&&n.jquery?n[0]:n,this.options.modifiers={},Object.keys(qo({},e.Defaults.modifiers,o.modifiers)).forEach((function(t){r.options.modifiers[t]=qo({},e.Defaults.modifiers[t]||{},o.modifiers?o.modifiers[t]:{})})),this.modifiers=Object.keys(this.options.modifiers).map((function(e){return qo({name:e},r.options.modifiers[e])})).sort((function(e,t){return e.order-t.order})),this.modifiers.forEach((function(e){e.enabled&&To(e.onLoad)&&e.onLoad(r.reference,r.popper,r.options,e,r.state)})),this.update();var a=this.options.eventsEnabled;a&&this.enableEventListeners(),this.state.eventsEnabled=a}return Ho(e,[{key:"update",value:function(){return la.call(this)}},{key:"destroy",value:function(){return ca.call(this)}},{key:"enableEventListeners",value:function(){return ma.call(this)}},{key:"disableEventListeners",value:function(){return ha.call(this)}}]),e}();Aa.Utils=("undefined"!=typeof window?window:n.g).PopperUtils,Aa.placements=xa,Aa.Defaults=Sa;const Ca=Aa;function Ra(e){return"function"==typeof e?e():e}var Pa="undefined"!=typeof window?e.useLayoutEffect:e.useEffect,Ta={},Na=e.forwardRef((function(t,n){var o=t.anchorEl,i=t.children,l=t.container,s=t.disablePortal,u=void 0!==s&&s,c=t.keepMounted,d=void 0!==c&&c,f=t.modifiers,p=t.open,m=t.placement,h=void 0===m?"bottom":m,v=t.popperOptions,g=void 0===v?Ta:v,b=t.popperRef,x=t.style,w=t.transition,E=void 0!==w&&w,S=(0,a.A)(t,["anchorEl","children","container","disablePortal","keepMounted","modifiers","open","placement","popperOptions","popperRef","style","transition"]),A=e.useRef(null),C=(0,k.A)(A,n),R=e.useRef(null),P=(0,k.A)(R,b),T=e.useRef(P);Pa((function(){T.current=P}),[P]),e.useImperativeHandle(b,(function(){return R.current}),[]);var N=e.useState(!0),O=N[0],M=N[1],L=function(e,t){if("ltr"===(t&&t.direction||"ltr"))return e;switch(e){case"bottom-end":return"bottom-start";case"bottom-start":return"bottom-end";case"top-end":return"top-start";case"top-start":return"top-end";default:return e}}(h,(0,y.A)()),z=e.useState(L),_=z[0],I=z[1];e.useEffect((function(){R.current&&R.current.update()}));var D=e.useCallback((function(){if(A.current&&o&&p){R.current&&(R.current.destroy(),T.current(null));var e=function(e){I(e.placement)},t=(Ra(o),new Ca(Ra(o),A.current,(0,r.A)({placement:L},g,{modifiers:(0,r.A)({},u?{}:{preventOverflow:{boundariesElement:"window"}},f,g.modifiers),onCreate:(0,Ne.A)(e,g.onCreate),onUpdate:(0,Ne.A)(e,g.onUpdate)})));T.current(t)}}),[o,u,f,p,L,g]),F=e.useCallback((function(e){(0,Me.A)(C,e),D()}),[C,D]),j=function(){R.current&&(R.current.destroy(),T.current(null))};if(e.useEffect((function(){return function(){j()}}),[]),e.useEffect((function(){p||E||j()}),[p,E]),!d&&!p&&(!E||O))return null;var B={placement:_};return E&&(B.TransitionProps={in:p,onEnter:function(){M(!1)},onExited:function(){M(!0),j()}}),e.createElement(ze,{disablePortal:u,container:l},e.createElement("div",(0,r.A)({ref:F,role:"tooltip"},S,{style:(0,r.A)({position:"fixed",top:0,left:0,display:p||!d||E?null:"none"},x)}),"function"==typeof i?i(B):i))}));const Oa=Na;function Ma(e){return Math.round(1e5*e)/1e5}var La=!1,za=null,_a=e.forwardRef((function(n,i){var l=n.arrow,s=void 0!==l&&l,u=n.children,c=n.classes,d=n.disableFocusListener,f=void 0!==d&&d,p=n.disableHoverListener,m=void 0!==p&&p,h=n.disableTouchListener,v=void 0!==h&&h,g=n.enterDelay,y=void 0===g?100:g,b=n.enterNextDelay,w=void 0===b?0:b,E=n.enterTouchDelay,S=void 0===E?700:E,A=n.id,C=n.interactive,R=void 0!==C&&C,T=n.leaveDelay,N=void 0===T?0:T,O=n.leaveTouchDelay,M=void 0===O?1500:O,L=n.onClose,z=n.onOpen,_=n.open,I=n.placement,D=void 0===I?"bottom":I,F=n.PopperComponent,j=void 0===F?Oa:F,B=n.PopperProps,W=n.title,$=n.TransitionComponent,H=void 0===$?Ze:$,U=n.TransitionProps,q=(0,a.A)(n,["arrow","children","classes","disableFocusListener","disableHoverListener","disableTouchListener","enterDelay","enterNextDelay","enterTouchDelay","id","interactive","leaveDelay","leaveTouchDelay","onClose","onOpen","open","placement","PopperComponent","PopperProps","title","TransitionComponent","TransitionProps"]),K=x(),X=e.useState(),Q=X[0],Y=X[1],G=e.useState(null),J=G[0],Z=G[1],ee=e.useRef(!1),te=e.useRef(),ne=e.useRef(),re=e.useRef(),oe=e.useRef(),ae=(0,bt.A)({controlled:_,default:!1,name:"Tooltip",state:"open"}),ie=(0,o.A)(ae,2),le=ie[0],se=ie[1],ue=le,ce=(0,Ir.A)(A);e.useEffect((function(){return function(){clearTimeout(te.current),clearTimeout(ne.current),clearTimeout(re.current),clearTimeout(oe.current)}}),[]);var de=function(e){clearTimeout(za),La=!0,se(!0),z&&z(e)},fe=function(){var e=!(arguments.length>0&&void 0!==arguments[0])||arguments[0];return function(t){var n=u.props;"mouseover"===t.type&&n.onMouseOver&&e&&n.onMouseOver(t),ee.current&&"touchstart"!==t.type||(Q&&Q.removeAttribute("title"),clearTimeout(ne.current),clearTimeout(re.current),y||La&&w?(t.persist(),ne.current=setTimeout((function(){de(t)}),La?w:y)):de(t))}},pe=(0,Ft.A)(),me=pe.isFocusVisible,he=pe.onBlurVisible,ve=pe.ref,ge=e.useState(!1),ye=ge[0],be=ge[1],xe=function(){var e=!(arguments.length>0&&void 0!==arguments[0])||arguments[0];return function(t){Q||Y(t.currentTarget),me(t)&&(be(!0),fe()(t));var n=u.props;n.onFocus&&e&&n.onFocus(t)}},we=function(e){clearTimeout(za),za=setTimeout((function(){La=!1}),800+N),se(!1),L&&L(e),clearTimeout(te.current),te.current=setTimeout((function(){ee.current=!1}),K.transitions.duration.shortest)},Ee=function(){var e=!(arguments.length>0&&void 0!==arguments[0])||arguments[0];return function(t){var n=u.props;"blur"===t.type&&(n.onBlur&&e&&n.onBlur(t),ye&&(be(!1),he())),"mouseleave"===t.type&&n.onMouseLeave&&t.currentTarget===Q&&n.onMouseLeave(t),clearTimeout(ne.current),clearTimeout(re.current),t.persist(),re.current=setTimeout((function(){we(t)}),N)}},ke=function(e){ee.current=!0;var t=u.props;t.onTouchStart&&t.onTouchStart(e)},Se=(0,k.A)(Y,i),Ae=(0,k.A)(ve,Se),Ce=e.useCallback((function(e){(0,Me.A)(Ae,t.findDOMNode(e))}),[Ae]),Re=(0,k.A)(u.ref,Ce);""===W&&(ue=!1);var Pe=!ue&&!m,Te=(0,r.A)({"aria-describedby":ue?ce:null,title:Pe&&"string"==typeof W?W:null},q,u.props,{className:(0,P.A)(q.className,u.props.className),onTouchStart:ke,ref:Re}),Ne={};v||(Te.onTouchStart=function(e){ke(e),clearTimeout(re.current),clearTimeout(te.current),clearTimeout(oe.current),e.persist(),oe.current=setTimeout((function(){fe()(e)}),S)},Te.onTouchEnd=function(e){u.props.onTouchEnd&&u.props.onTouchEnd(e),clearTimeout(oe.current),clearTimeout(re.current),e.persist(),re.current=setTimeout((function(){we(e)}),M)}),m||(Te.onMouseOver=fe(),Te.onMouseLeave=Ee(),R&&(Ne.onMouseOver=fe(!1),Ne.onMouseLeave=Ee(!1))),f||(Te.onFocus=xe(),Te.onBlur=Ee(),R&&(Ne.onFocus=xe(!1),Ne.onBlur=Ee(!1)));var Oe=e.useMemo((function(){return(0,Ao.A)({popperOptions:{modifiers:{arrow:{enabled:Boolean(J),element:J}}}},B)}),[J,B]);return e.createElement(e.Fragment,null,e.cloneElement(u,Te),e.createElement(j,(0,r.A)({className:(0,P.A)(c.popper,R&&c.popperInteractive,s&&c.popperArrow),placement:D,anchorEl:Q,open:!!Q&&ue,id:Te["aria-describedby"],transition:!0},Ne,Oe),(function(t){var n=t.placement,o=t.TransitionProps;return e.createElement(H,(0,r.A)({timeout:K.transitions.duration.shorter},o,U),e.createElement("div",{className:(0,P.A)(c.tooltip,c["tooltipPlacement".concat((0,V.A)(n.split("-")[0]))],ee.current&&c.touch,s&&c.tooltipArrow)},W,s?e.createElement("span",{className:c.arrow,ref:Z}):null))})))}));const Ia=(0,T.A)((function(e){return{popper:{zIndex:e.zIndex.tooltip,pointerEvents:"none"},popperInteractive:{pointerEvents:"auto"},popperArrow:{'&[x-placement*="bottom"] $arrow':{top:0,left:0,marginTop:"-0.71em",marginLeft:4,marginRight:4,"&::before":{transformOrigin:"0 100%"}},'&[x-placement*="top"] $arrow':{bottom:0,left:0,marginBottom:"-0.71em",marginLeft:4,marginRight:4,"&::before":{transformOrigin:"100% 0"}},'&[x-placement*="right"] $arrow':{left:0,marginLeft:"-0.71em",height:"1em",width:"0.71em",marginTop:4,marginBottom:4,"&::before":{transformOrigin:"100% 100%"}},'&[x-placement*="left"] $arrow':{right:0,marginRight:"-0.71em",height:"1em",width:"0.71em",marginTop:4,marginBottom:4,"&::before":{transformOrigin:"0 0"}}},tooltip:{backgroundColor:(0,Dt.X4)(e.palette.grey[700],.9),borderRadius:e.shape.borderRadius,color:e.palette.common.white,fontFamily:e.typography.fontFamily,padding:"4px 8px",fontSize:e.typography.pxToRem(10),lineHeight:"".concat(Ma(1.4),"em"),maxWidth:300,wordWrap:"break-word",fontWeight:e.typography.fontWeightMedium},tooltipArrow:{position:"relative",margin:"0"},arrow:{overflow:"hidden",position:"absolute",width:"1em",height:"0.71em",boxSizing:"border-box",color:(0,Dt.X4)(e.palette.grey[700],.9),"&::before":{content:'""',margin:"auto",display:"block",width:"100%",height:"100%",backgroundColor:"currentColor",transform:"rotate(45deg)"}},touch:{padding:"8px 16px",fontSize:e.typography.pxToRem(14),lineHeight:"".concat(Ma(16/14),"em"),fontWeight:e.typography.fontWeightRegular},tooltipPlacementLeft:(0,de.A)({transformOrigin:"right center",margin:"0 24px "},e.breakpoints.up("sm"),{margin:"0 14px"}),tooltipPlacementRight:(0,de.A)({transformOrigin:"left center",margin:"0 24px"},e.breakpoints.up("sm"),{margin:"0 14px"}),tooltipPlacementTop:(0,de.A)({transformOrigin:"center bottom",margin:"24px 0"},e.breakpoints.up("sm"),{margin:"14px 0"}),tooltipPlacementBottom:(0,de.A)({transformOrigin:"center top",margin:"24px 0"},e.breakpoints.up("sm"),{margin:"14px 0"})}}),{name:"MuiTooltip",flip:!1})(_a),Da=(0,kt.A)(e.createElement("path",{d:"M12 2C6.47 2 2 6.47 2 12s4.47 10 10 10 10-4.47 10-10S17.53 2 12 2zm5 13.59L15.59 17 12 13.41 8.41 17 7 15.59 10.59 12 7 8.41 8.41 7 12 10.59 15.59 7 17 8.41 13.41 12 17 15.59z"}),"Cancel");function Fa(e){return"Backspace"===e.key||"Delete"===e.key}var ja=e.forwardRef((function(t,n){var o=t.avatar,i=t.classes,l=t.className,s=t.clickable,u=t.color,c=void 0===u?"default":u,d=t.component,f=t.deleteIcon,p=t.disabled,m=void 0!==p&&p,h=t.icon,v=t.label,g=t.onClick,y=t.onDelete,b=t.onKeyDown,x=t.onKeyUp,w=t.size,E=void 0===w?"medium":w,S=t.variant,A=void 0===S?"default":S,C=(0,a.A)(t,["avatar","classes","className","clickable","color","component","deleteIcon","disabled","icon","label","onClick","onDelete","onKeyDown","onKeyUp","size","variant"]),R=e.useRef(null),T=(0,k.A)(R,n),N=function(e){e.stopPropagation(),y&&y(e)},O=!(!1===s||!g)||s,M="small"===E,L=d||(O?Gt:"div"),z=L===Gt?{component:"div"}:{},_=null;if(y){var I=(0,P.A)("default"!==c&&("default"===A?i["deleteIconColor".concat((0,V.A)(c))]:i["deleteIconOutlinedColor".concat((0,V.A)(c))]),M&&i.deleteIconSmall);_=f&&e.isValidElement(f)?e.cloneElement(f,{className:(0,P.A)(f.props.className,i.deleteIcon,I),onClick:N}):e.createElement(Da,{className:(0,P.A)(i.deleteIcon,I),onClick:N})}var D=null;o&&e.isValidElement(o)&&(D=e.cloneElement(o,{className:(0,P.A)(i.avatar,o.props.className,M&&i.avatarSmall,"default"!==c&&i["avatarColor".concat((0,V.A)(c))])}));var F=null;return h&&e.isValidElement(h)&&(F=e.cloneElement(h,{className:(0,P.A)(i.icon,h.props.className,M&&i.iconSmall,"default"!==c&&i["iconColor".concat((0,V.A)(c))])})),e.createElement(L,(0,r.A)({role:O||y?"button":void 0,className:(0,P.A)(i.root,l,"default"!==c&&[i["color".concat((0,V.A)(c))],O&&i["clickableColor".concat((0,V.A)(c))],y&&i["deletableColor".concat((0,V.A)(c))]],"default"!==A&&[i.outlined,{primary:i.outlinedPrimary,secondary:i.outlinedSecondary}[c]],m&&i.disabled,M&&i.sizeSmall,O&&i.clickable,y&&i.deletable),"aria-disabled":!!m||void 0,tabIndex:O||y?0:void 0,onClick:g,onKeyDown:function(e){e.currentTarget===e.target&&Fa(e)&&e.preventDefault(),b&&b(e)},onKeyUp:function(e){e.currentTarget===e.target&&(y&&Fa(e)?y(e):"Escape"===e.key&&R.current&&R.current.blur()),x&&x(e)},ref:T},z,C),D||F,e.createElement("span",{className:(0,P.A)(i.label,M&&i.labelSmall)},v),_)}));const Ba=(0,T.A)((function(e){var t="light"===e.palette.type?e.palette.grey[300]:e.palette.grey[700],n=(0,Dt.X4)(e.palette.text.primary,.26);return{root:{fontFamily:e.typography.fontFamily,fontSize:e.typography.pxToRem(13),display:"inline-flex",alignItems:"center",justifyContent:"center",height:32,color:e.palette.getContrastText(t),backgroundColor:t,borderRadius:16,whiteSpace:"nowrap",transition:e.transitions.create(["background-color","box-shadow"]),cursor:"default",outline:0,textDecoration:"none",border:"none",padding:0,verticalAlign:"middle",boxSizing:"border-box","&$disabled":{opacity:.5,pointerEvents:"none"},"& $avatar":{marginLeft:5,marginRight:-6,width:24,height:24,color:"light"===e.palette.type?e.palette.grey[700]:e.palette.grey[300],fontSize:e.typography.pxToRem(12)},"& $avatarColorPrimary":{color:e.palette.primary.contrastText,backgroundColor:e.palette.primary.dark},"& $avatarColorSecondary":{color:e.palette.secondary.contrastText,backgroundColor:e.palette.secondary.dark},"& $avatarSmall":{marginLeft:4,marginRight:-4,width:18,height:18,fontSize:e.typography.pxToRem(10)}},sizeSmall:{height:24},colorPrimary:{backgroundColor:e.palette.primary.main,color:e.palette.primary.contrastText},colorSecondary:{backgroundColor:e.palette.secondary.main,color:e.palette.secondary.contrastText},disabled:{},clickable:{userSelect:"none",WebkitTapHighlightColor:"transparent",cursor:"pointer","&:hover, &:focus":{backgroundColor:(0,Dt.tL)(t,.08)},"&:active":{boxShadow:e.shadows[1]}},clickableColorPrimary:{"&:hover, &:focus":{backgroundColor:(0,Dt.tL)(e.palette.primary.main,.08)}},clickableColorSecondary:{"&:hover, &:focus":{backgroundColor:(0,Dt.tL)(e.palette.secondary.main,.08)}},deletable:{"&:focus":{backgroundColor:(0,Dt.tL)(t,.08)}},deletableColorPrimary:{"&:focus":{backgroundColor:(0,Dt.tL)(e.palette.primary.main,.2)}},deletableColorSecondary:{"&:focus":{backgroundColor:(0,Dt.tL)(e.palette.secondary.main,.2)}},outlined:{backgroundColor:"transparent",border:"1px solid ".concat("light"===e.palette.type?"rgba(0, 0, 0, 0.23)":"rgba(255, 255, 255, 0.23)"),"$clickable&:hover, $clickable&:focus, $deletable&:focus":{backgroundColor:(0,Dt.X4)(e.palette.text.primary,e.palette.action.hoverOpacity)},"& $avatar":{marginLeft:4},"& $avatarSmall":{marginLeft:2},"& $icon":{marginLeft:4},"& $iconSmall":{marginLeft:2},"& $deleteIcon":{marginRight:5},"& $deleteIconSmall":{marginRight:3}},outlinedPrimary:{color:e.palette.primary.main,border:"1px solid ".concat(e.palette.primary.main),"$clickable&:hover, $clickable&:focus, $deletable&:focus":{backgroundColor:(0,Dt.X4)(e.palette.primary.main,e.palette.action.hoverOpacity)}},outlinedSecondary:{color:e.palette.secondary.main,border:"1px solid ".concat(e.palette.secondary.main),"$clickable&:hover, $clickable&:focus, $deletable&:focus":{backgroundColor:(0,Dt.X4)(e.palette.secondary.main,e.palette.action.hoverOpacity)}},avatar:{},avatarSmall:{},avatarColorPrimary:{},avatarColorSecondary:{},icon:{color:"light"===e.palette.type?e.palette.grey[700]:e.palette.grey[300],marginLeft:5,marginRight:-6},iconSmall:{width:18,height:18,marginLeft:4,marginRight:-4},iconColorPrimary:{color:"inherit"},iconColorSecondary:{color:"inherit"},label:{overflow:"hidden",textOverflow:"ellipsis",paddingLeft:12,paddingRight:12,whiteSpace:"nowrap"},labelSmall:{paddingLeft:8,paddingRight:8},deleteIcon:{WebkitTapHighlightColor:"transparent",color:n,height:22,width:22,cursor:"pointer",margin:"0 5px 0 -6px","&:hover":{color:(0,Dt.X4)(n,.4)}},deleteIconSmall:{height:16,width:16,marginRight:4,marginLeft:-4},deleteIconColorPrimary:{color:(0,Dt.X4)(e.palette.primary.contrastText,.7),"&:hover, &:active":{color:e.palette.primary.contrastText}},deleteIconColorSecondary:{color:(0,Dt.X4)(e.palette.secondary.contrastText,.7),"&:hover, &:active":{color:e.palette.secondary.contrastText}},deleteIconOutlinedColorPrimary:{color:(0,Dt.X4)(e.palette.primary.main,.7),"&:hover, &:active":{color:e.palette.primary.main}},deleteIconOutlinedColorSecondary:{color:(0,Dt.X4)(e.palette.secondary.main,.7),"&:hover, &:active":{color:e.palette.secondary.main}}}}),{name:"MuiChip"})(ja);var Wa=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.color,s=void 0===l?"primary":l,u=t.value,c=t.valueBuffer,d=t.variant,f=void 0===d?"indeterminate":d,p=(0,a.A)(t,["classes","className","color","value","valueBuffer","variant"]),m=x(),h={},v={bar1:{},bar2:{}};if(("determinate"===f||"buffer"===f)&&void 0!==u){h["aria-valuenow"]=Math.round(u),h["aria-valuemin"]=0,h["aria-valuemax"]=100;var g=u-100;"rtl"===m.direction&&(g=-g),v.bar1.transform="translateX(".concat(g,"%)")}if("buffer"===f&&void 0!==c){var y=(c||0)-100;"rtl"===m.direction&&(y=-y),v.bar2.transform="translateX(".concat(y,"%)")}return e.createElement("div",(0,r.A)({className:(0,P.A)(o.root,o["color".concat((0,V.A)(s))],i,{determinate:o.determinate,indeterminate:o.indeterminate,buffer:o.buffer,query:o.query}[f]),role:"progressbar"},h,{ref:n},p),"buffer"===f?e.createElement("div",{className:(0,P.A)(o.dashed,o["dashedColor".concat((0,V.A)(s))])}):null,e.createElement("div",{className:(0,P.A)(o.bar,o["barColor".concat((0,V.A)(s))],("indeterminate"===f||"query"===f)&&o.bar1Indeterminate,{determinate:o.bar1Determinate,buffer:o.bar1Buffer}[f]),style:v.bar1}),"determinate"===f?null:e.createElement("div",{className:(0,P.A)(o.bar,("indeterminate"===f||"query"===f)&&o.bar2Indeterminate,"buffer"===f?[o["color".concat((0,V.A)(s))],o.bar2Buffer]:o["barColor".concat((0,V.A)(s))]),style:v.bar2}))}));const $a=(0,T.A)((function(e){var t=function(t){return"light"===e.palette.type?(0,Dt.a)(t,.62):(0,Dt.e$)(t,.5)},n=t(e.palette.primary.main),r=t(e.palette.secondary.main);return{root:{position:"relative",overflow:"hidden",height:4,"@media print":{colorAdjust:"exact"}},colorPrimary:{backgroundColor:n},colorSecondary:{backgroundColor:r},determinate:{},indeterminate:{},buffer:{backgroundColor:"transparent"},query:{transform:"rotate(180deg)"},dashed:{position:"absolute",marginTop:0,height:"100%",width:"100%",animation:"$buffer 3s infinite linear"},dashedColorPrimary:{backgroundImage:"radial-gradient(".concat(n," 0%, ").concat(n," 16%, transparent 42%)"),backgroundSize:"10px 10px",backgroundPosition:"0 -23px"},dashedColorSecondary:{backgroundImage:"radial-gradient(".concat(r," 0%, ").concat(r," 16%, transparent 42%)"),backgroundSize:"10px 10px",backgroundPosition:"0 -23px"},bar:{width:"100%",position:"absolute",left:0,bottom:0,top:0,transition:"transform 0.2s linear",transformOrigin:"left"},barColorPrimary:{backgroundColor:e.palette.primary.main},barColorSecondary:{backgroundColor:e.palette.secondary.main},bar1Indeterminate:{width:"auto",animation:"$indeterminate1 2.1s cubic-bezier(0.65, 0.815, 0.735, 0.395) infinite"},bar1Determinate:{transition:"transform .".concat(4,"s linear")},bar1Buffer:{zIndex:1,transition:"transform .".concat(4,"s linear")},bar2Indeterminate:{width:"auto",animation:"$indeterminate2 2.1s cubic-bezier(0.165, 0.84, 0.44, 1) 1.15s infinite"},bar2Buffer:{transition:"transform .".concat(4,"s linear")},"@keyframes indeterminate1":{"0%":{left:"-35%",right:"100%"},"60%":{left:"100%",right:"-90%"},"100%":{left:"100%",right:"-90%"}},"@keyframes indeterminate2":{"0%":{left:"-200%",right:"100%"},"60%":{left:"107%",right:"-8%"},"100%":{left:"107%",right:"-8%"}},"@keyframes buffer":{"0%":{opacity:1,backgroundPosition:"0 -23px"},"50%":{opacity:0,backgroundPosition:"0 -23px"},"100%":{opacity:1,backgroundPosition:"-200px -23px"}}}}),{name:"MuiLinearProgress"})(Wa);var Va=e.forwardRef((function(t,n){var o=t.anchorOrigin,i=void 0===o?{vertical:"top",horizontal:"right"}:o,l=t.badgeContent,s=t.children,u=t.classes,c=t.className,d=t.color,f=void 0===d?"default":d,p=t.component,m=void 0===p?"span":p,h=t.invisible,v=t.max,g=void 0===v?99:v,y=t.overlap,b=void 0===y?"rectangle":y,x=t.showZero,w=void 0!==x&&x,E=t.variant,k=void 0===E?"standard":E,S=(0,a.A)(t,["anchorOrigin","badgeContent","children","classes","className","color","component","invisible","max","overlap","showZero","variant"]),A=h;null==h&&(0===l&&!w||null==l&&"dot"!==k)&&(A=!0);var C="";return"dot"!==k&&(C=l>g?"".concat(g,"+"):l),e.createElement(m,(0,r.A)({className:(0,P.A)(u.root,c),ref:n},S),s,e.createElement("span",{className:(0,P.A)(u.badge,u["".concat(i.horizontal).concat((0,V.A)(i.vertical),"}")],u["anchorOrigin".concat((0,V.A)(i.vertical)).concat((0,V.A)(i.horizontal)).concat((0,V.A)(b))],"default"!==f&&u["color".concat((0,V.A)(f))],A&&u.invisible,"dot"===k&&u.dot)},C))}));const Ha=(0,T.A)((function(e){return{root:{position:"relative",display:"inline-flex",verticalAlign:"middle",flexShrink:0},badge:{display:"flex",flexDirection:"row",flexWrap:"wrap",justifyContent:"center",alignContent:"center",alignItems:"center",position:"absolute",boxSizing:"border-box",fontFamily:e.typography.fontFamily,fontWeight:e.typography.fontWeightMedium,fontSize:e.typography.pxToRem(12),minWidth:20,lineHeight:1,padding:"0 6px",height:20,borderRadius:10,zIndex:1,transition:e.transitions.create("transform",{easing:e.transitions.easing.easeInOut,duration:e.transitions.duration.enteringScreen})},colorPrimary:{backgroundColor:e.palette.primary.main,color:e.palette.primary.contrastText},colorSecondary:{backgroundColor:e.palette.secondary.main,color:e.palette.secondary.contrastText},colorError:{backgroundColor:e.palette.error.main,color:e.palette.error.contrastText},dot:{borderRadius:4,height:8,minWidth:8,padding:0},anchorOriginTopRightRectangle:{top:0,right:0,transform:"scale(1) translate(50%, -50%)",transformOrigin:"100% 0%","&$invisible":{transform:"scale(0) translate(50%, -50%)"}},anchorOriginTopRightRectangular:{top:0,right:0,transform:"scale(1) translate(50%, -50%)",transformOrigin:"100% 0%","&$invisible":{transform:"scale(0) translate(50%, -50%)"}},anchorOriginBottomRightRectangle:{bottom:0,right:0,transform:"scale(1) translate(50%, 50%)",transformOrigin:"100% 100%","&$invisible":{transform:"scale(0) translate(50%, 50%)"}},anchorOriginBottomRightRectangular:{bottom:0,right:0,transform:"scale(1) translate(50%, 50%)",transformOrigin:"100% 100%","&$invisible":{transform:"scale(0) translate(50%, 50%)"}},anchorOriginTopLeftRectangle:{top:0,left:0,transform:"scale(1) translate(-50%, -50%)",transformOrigin:"0% 0%","&$invisible":{transform:"scale(0) translate(-50%, -50%)"}},anchorOriginTopLeftRectangular:{top:0,left:0,transform:"scale(1) translate(-50%, -50%)",transformOrigin:"0% 0%","&$invisible":{transform:"scale(0) translate(-50%, -50%)"}},anchorOriginBottomLeftRectangle:{bottom:0,left:0,transform:"scale(1) translate(-50%, 50%)",transformOrigin:"0% 100%","&$invisible":{transform:"scale(0) translate(-50%, 50%)"}},anchorOriginBottomLeftRectangular:{bottom:0,left:0,transform:"scale(1) translate(-50%, 50%)",transformOrigin:"0% 100%","&$invisible":{transform:"scale(0) translate(-50%, 50%)"}},anchorOriginTopRightCircle:{top:"14%",right:"14%",transform:"scale(1) translate(50%, -50%)",transformOrigin:"100% 0%","&$invisible":{transform:"scale(0) translate(50%, -50%)"}},anchorOriginTopRightCircular:{top:"14%",right:"14%",transform:"scale(1) translate(50%, -50%)",transformOrigin:"100% 0%","&$invisible":{transform:"scale(0) translate(50%, -50%)"}},anchorOriginBottomRightCircle:{bottom:"14%",right:"14%",transform:"scale(1) translate(50%, 50%)",transformOrigin:"100% 100%","&$invisible":{transform:"scale(0) translate(50%, 50%)"}},anchorOriginBottomRightCircular:{bottom:"14%",right:"14%",transform:"scale(1) translate(50%, 50%)",transformOrigin:"100% 100%","&$invisible":{transform:"scale(0) translate(50%, 50%)"}},anchorOriginTopLeftCircle:{top:"14%",left:"14%",transform:"scale(1) translate(-50%, -50%)",transformOrigin:"0% 0%","&$invisible":{transform:"scale(0) translate(-50%, -50%)"}},anchorOriginTopLeftCircular:{top:"14%",left:"14%",transform:"scale(1) translate(-50%, -50%)",transformOrigin:"0% 0%","&$invisible":{transform:"scale(0) translate(-50%, -50%)"}},anchorOriginBottomLeftCircle:{bottom:"14%",left:"14%",transform:"scale(1) translate(-50%, 50%)",transformOrigin:"0% 100%","&$invisible":{transform:"scale(0) translate(-50%, 50%)"}},anchorOriginBottomLeftCircular:{bottom:"14%",left:"14%",transform:"scale(1) translate(-50%, 50%)",transformOrigin:"0% 100%","&$invisible":{transform:"scale(0) translate(-50%, 50%)"}},invisible:{transition:e.transitions.create("transform",{easing:e.transitions.easing.easeInOut,duration:e.transitions.duration.leavingScreen})}}}),{name:"MuiBadge"})(Va),Ua=(0,T.A)((function(e){return{thumb:{"&$open":{"& $offset":{transform:"scale(1) translateY(-10px)"}}},open:{},offset:(0,r.A)({zIndex:1},e.typography.body2,{fontSize:e.typography.pxToRem(12),lineHeight:1.2,transition:e.transitions.create(["transform"],{duration:e.transitions.duration.shortest}),top:-34,transformOrigin:"bottom center",transform:"scale(0)",position:"absolute"}),circle:{display:"flex",alignItems:"center",justifyContent:"center",width:32,height:32,borderRadius:"50% 50% 50% 0",backgroundColor:"currentColor",transform:"rotate(-45deg)"},label:{color:e.palette.primary.contrastText,transform:"rotate(45deg)"}}}),{name:"PrivateValueLabel"})((function(t){var n=t.children,r=t.classes,o=t.className,a=t.open,i=t.value,l=t.valueLabelDisplay;return"off"===l?n:e.cloneElement(n,{className:(0,P.A)(n.props.className,(a||"on"===l)&&r.open,r.thumb)},e.createElement("span",{className:(0,P.A)(r.offset,o)},e.createElement("span",{className:r.circle},e.createElement("span",{className:r.label},i))))}));function qa(e,t){return e-t}function Ka(e,t,n){return Math.min(Math.max(t,e),n)}function Xa(e,t){return e.reduce((function(e,n,r){var o=Math.abs(t-n);return null===e||o<e.distance||o===e.distance?{distance:o,index:r}:e}),null).index}function Qa(e,t){if(void 0!==t.current&&e.changedTouches){for(var n=0;n<e.changedTouches.length;n+=1){var r=e.changedTouches[n];if(r.identifier===t.current)return{x:r.clientX,y:r.clientY}}return!1}return{x:e.clientX,y:e.clientY}}function Ya(e,t,n){return 100*(e-t)/(n-t)}function Ga(e,t,n){var r=Math.round((e-n)/t)*t+n;return Number(r.toFixed(function(e){if(Math.abs(e)<1){var t=e.toExponential().split("e-"),n=t[0].split(".")[1];return(n?n.length:0)+parseInt(t[1],10)}var r=e.toString().split(".")[1];return r?r.length:0}(t)))}function Ja(e){var t=e.values,n=e.source,r=e.newValue,o=e.index;if(t[o]===r)return n;var a=t.slice();return a[o]=r,a}function Za(e){var t=e.sliderRef,n=e.activeIndex,r=e.setActive;t.current.contains(document.activeElement)&&Number(document.activeElement.getAttribute("data-index"))===n||t.current.querySelector('[role="slider"][data-index="'.concat(n,'"]')).focus(),r&&r(n)}var ei={horizontal:{offset:function(e){return{left:"".concat(e,"%")}},leap:function(e){return{width:"".concat(e,"%")}}},"horizontal-reverse":{offset:function(e){return{right:"".concat(e,"%")}},leap:function(e){return{width:"".concat(e,"%")}}},vertical:{offset:function(e){return{bottom:"".concat(e,"%")}},leap:function(e){return{height:"".concat(e,"%")}}}},ti=function(e){return e},ni=e.forwardRef((function(t,n){var i=t["aria-label"],l=t["aria-labelledby"],s=t["aria-valuetext"],u=t.classes,c=t.className,d=t.color,f=void 0===d?"primary":d,p=t.component,m=void 0===p?"span":p,h=t.defaultValue,v=t.disabled,g=void 0!==v&&v,y=t.getAriaLabel,b=t.getAriaValueText,w=t.marks,E=void 0!==w&&w,S=t.max,A=void 0===S?100:S,C=t.min,R=void 0===C?0:C,T=t.name,N=t.onChange,O=t.onChangeCommitted,M=t.onMouseDown,L=t.orientation,z=void 0===L?"horizontal":L,_=t.scale,I=void 0===_?ti:_,D=t.step,F=void 0===D?1:D,j=t.ThumbComponent,B=void 0===j?"span":j,W=t.track,$=void 0===W?"normal":W,H=t.value,U=t.ValueLabelComponent,q=void 0===U?Ua:U,K=t.valueLabelDisplay,X=void 0===K?"off":K,Q=t.valueLabelFormat,Y=void 0===Q?ti:Q,G=(0,a.A)(t,["aria-label","aria-labelledby","aria-valuetext","classes","className","color","component","defaultValue","disabled","getAriaLabel","getAriaValueText","marks","max","min","name","onChange","onChangeCommitted","onMouseDown","orientation","scale","step","ThumbComponent","track","value","ValueLabelComponent","valueLabelDisplay","valueLabelFormat"]),J=x(),Z=e.useRef(),ee=e.useState(-1),te=ee[0],ne=ee[1],re=e.useState(-1),oe=re[0],ae=re[1],ie=(0,bt.A)({controlled:H,default:h,name:"Slider"}),le=(0,o.A)(ie,2),se=le[0],ue=le[1],ce=Array.isArray(se),de=ce?se.slice().sort(qa):[se];de=de.map((function(e){return Ka(e,R,A)}));var fe=!0===E&&null!==F?(0,Fe.A)(Array(Math.floor((A-R)/F)+1)).map((function(e,t){return{value:R+F*t}})):E||[],pe=(0,Ft.A)(),me=pe.isFocusVisible,he=pe.onBlurVisible,ve=pe.ref,ge=e.useState(-1),ye=ge[0],be=ge[1],xe=e.useRef(),we=(0,k.A)(ve,xe),Ee=(0,k.A)(n,we),ke=(0,_e.A)((function(e){var t=Number(e.currentTarget.getAttribute("data-index"));me(e)&&be(t),ae(t)})),Se=(0,_e.A)((function(){-1!==ye&&(be(-1),he()),ae(-1)})),Ae=(0,_e.A)((function(e){var t=Number(e.currentTarget.getAttribute("data-index"));ae(t)})),Ce=(0,_e.A)((function(){ae(-1)})),Re="rtl"===J.direction,Te=(0,_e.A)((function(e){var t,n=Number(e.currentTarget.getAttribute("data-index")),r=de[n],o=(A-R)/10,a=fe.map((function(e){return e.value})),i=a.indexOf(r),l=Re?"ArrowLeft":"ArrowRight",s=Re?"ArrowRight":"ArrowLeft";switch(e.key){case"Home":t=R;break;case"End":t=A;break;case"PageUp":F&&(t=r+o);break;case"PageDown":F&&(t=r-o);break;case l:case"ArrowUp":t=F?r+F:a[i+1]||a[a.length-1];break;case s:case"ArrowDown":t=F?r-F:a[i-1]||a[0];break;default:return}if(e.preventDefault(),F&&(t=Ga(t,F,R)),t=Ka(t,R,A),ce){var u=t;t=Ja({values:de,source:se,newValue:t,index:n}).sort(qa),Za({sliderRef:xe,activeIndex:t.indexOf(u)})}ue(t),be(n),N&&N(e,t),O&&O(e,t)})),Ne=e.useRef(),Oe=z;Re&&"vertical"!==z&&(Oe+="-reverse");var Me=function(e){var t,n,r=e.finger,o=e.move,a=void 0!==o&&o,i=e.values,l=e.source,s=xe.current.getBoundingClientRect(),u=s.width,c=s.height,d=s.bottom,f=s.left;if(t=0===Oe.indexOf("vertical")?(d-r.y)/c:(r.x-f)/u,-1!==Oe.indexOf("-reverse")&&(t=1-t),n=function(e,t,n){return(n-t)*e+t}(t,R,A),F)n=Ga(n,F,R);else{var p=fe.map((function(e){return e.value}));n=p[Xa(p,n)]}n=Ka(n,R,A);var m=0;if(ce){var h=n;m=(n=Ja({values:i,source:l,newValue:n,index:m=a?Ne.current:Xa(i,n)}).sort(qa)).indexOf(h),Ne.current=m}return{newValue:n,activeIndex:m}},Le=(0,_e.A)((function(e){var t=Qa(e,Z);if(t){var n=Me({finger:t,move:!0,values:de,source:se}),r=n.newValue,o=n.activeIndex;Za({sliderRef:xe,activeIndex:o,setActive:ne}),ue(r),N&&N(e,r)}})),ze=(0,_e.A)((function(e){var t=Qa(e,Z);if(t){var n=Me({finger:t,values:de,source:se}).newValue;ne(-1),"touchend"===e.type&&ae(-1),O&&O(e,n),Z.current=void 0;var r=(0,Pe.A)(xe.current);r.removeEventListener("mousemove",Le),r.removeEventListener("mouseup",ze),r.removeEventListener("touchmove",Le),r.removeEventListener("touchend",ze)}})),Ie=(0,_e.A)((function(e){e.preventDefault();var t=e.changedTouches[0];null!=t&&(Z.current=t.identifier);var n=Qa(e,Z),r=Me({finger:n,values:de,source:se}),o=r.newValue,a=r.activeIndex;Za({sliderRef:xe,activeIndex:a,setActive:ne}),ue(o),N&&N(e,o);var i=(0,Pe.A)(xe.current);i.addEventListener("touchmove",Le),i.addEventListener("touchend",ze)}));e.useEffect((function(){var e=xe.current;e.addEventListener("touchstart",Ie);var t=(0,Pe.A)(e);return function(){e.removeEventListener("touchstart",Ie),t.removeEventListener("mousemove",Le),t.removeEventListener("mouseup",ze),t.removeEventListener("touchmove",Le),t.removeEventListener("touchend",ze)}}),[ze,Le,Ie]);var De=(0,_e.A)((function(e){M&&M(e),e.preventDefault();var t=Qa(e,Z),n=Me({finger:t,values:de,source:se}),r=n.newValue,o=n.activeIndex;Za({sliderRef:xe,activeIndex:o,setActive:ne}),ue(r),N&&N(e,r);var a=(0,Pe.A)(xe.current);a.addEventListener("mousemove",Le),a.addEventListener("mouseup",ze)})),je=Ya(ce?de[0]:R,R,A),Be=Ya(de[de.length-1],R,A)-je,We=(0,r.A)({},ei[Oe].offset(je),ei[Oe].leap(Be));return e.createElement(m,(0,r.A)({ref:Ee,className:(0,P.A)(u.root,u["color".concat((0,V.A)(f))],c,g&&u.disabled,fe.length>0&&fe.some((function(e){return e.label}))&&u.marked,!1===$&&u.trackFalse,"vertical"===z&&u.vertical,"inverted"===$&&u.trackInverted),onMouseDown:De},G),e.createElement("span",{className:u.rail}),e.createElement("span",{className:u.track,style:We}),e.createElement("input",{value:de.join(","),name:T,type:"hidden"}),fe.map((function(t,n){var r,o=Ya(t.value,R,A),a=ei[Oe].offset(o);return r=!1===$?-1!==de.indexOf(t.value):"normal"===$&&(ce?t.value>=de[0]&&t.value<=de[de.length-1]:t.value<=de[0])||"inverted"===$&&(ce?t.value<=de[0]||t.value>=de[de.length-1]:t.value>=de[0]),e.createElement(e.Fragment,{key:t.value},e.createElement("span",{style:a,"data-index":n,className:(0,P.A)(u.mark,r&&u.markActive)}),null!=t.label?e.createElement("span",{"aria-hidden":!0,"data-index":n,style:a,className:(0,P.A)(u.markLabel,r&&u.markLabelActive)},t.label):null)})),de.map((function(t,n){var r=Ya(t,R,A),o=ei[Oe].offset(r);return e.createElement(q,{key:n,valueLabelFormat:Y,valueLabelDisplay:X,className:u.valueLabel,value:"function"==typeof Y?Y(I(t),n):Y,index:n,open:oe===n||te===n||"on"===X,disabled:g},e.createElement(B,{className:(0,P.A)(u.thumb,u["thumbColor".concat((0,V.A)(f))],te===n&&u.active,g&&u.disabled,ye===n&&u.focusVisible),tabIndex:g?null:0,role:"slider",style:o,"data-index":n,"aria-label":y?y(n):i,"aria-labelledby":l,"aria-orientation":z,"aria-valuemax":I(A),"aria-valuemin":I(R),"aria-valuenow":I(t),"aria-valuetext":b?b(I(t),n):s,onKeyDown:Te,onFocus:ke,onBlur:Se,onMouseOver:Ae,onMouseLeave:Ce}))})))}));const ri=(0,T.A)((function(e){return{root:{height:2,width:"100%",boxSizing:"content-box",padding:"13px 0",display:"inline-block",position:"relative",cursor:"pointer",touchAction:"none",color:e.palette.primary.main,WebkitTapHighlightColor:"transparent","&$disabled":{pointerEvents:"none",cursor:"default",color:e.palette.grey[400]},"&$vertical":{width:2,height:"100%",padding:"0 13px"},"@media (pointer: coarse)":{padding:"20px 0","&$vertical":{padding:"0 20px"}},"@media print":{colorAdjust:"exact"}},colorPrimary:{},colorSecondary:{color:e.palette.secondary.main},marked:{marginBottom:20,"&$vertical":{marginBottom:"auto",marginRight:20}},vertical:{},disabled:{},rail:{display:"block",position:"absolute",width:"100%",height:2,borderRadius:1,backgroundColor:"currentColor",opacity:.38,"$vertical &":{height:"100%",width:2}},track:{display:"block",position:"absolute",height:2,borderRadius:1,backgroundColor:"currentColor","$vertical &":{width:2}},trackFalse:{"& $track":{display:"none"}},trackInverted:{"& $track":{backgroundColor:"light"===e.palette.type?(0,Dt.a)(e.palette.primary.main,.62):(0,Dt.e$)(e.palette.primary.main,.5)},"& $rail":{opacity:1}},thumb:{position:"absolute",width:12,height:12,marginLeft:-6,marginTop:-5,boxSizing:"border-box",borderRadius:"50%",outline:0,backgroundColor:"currentColor",display:"flex",alignItems:"center",justifyContent:"center",transition:e.transitions.create(["box-shadow"],{duration:e.transitions.duration.shortest}),"&::after":{position:"absolute",content:'""',borderRadius:"50%",left:-15,top:-15,right:-15,bottom:-15},"&$focusVisible,&:hover":{boxShadow:"0px 0px 0px 8px ".concat((0,Dt.X4)(e.palette.primary.main,.16)),"@media (hover: none)":{boxShadow:"none"}},"&$active":{boxShadow:"0px 0px 0px 14px ".concat((0,Dt.X4)(e.palette.primary.main,.16))},"&$disabled":{width:8,height:8,marginLeft:-4,marginTop:-3,"&:hover":{boxShadow:"none"}},"$vertical &":{marginLeft:-5,marginBottom:-6},"$vertical &$disabled":{marginLeft:-3,marginBottom:-4}},thumbColorPrimary:{},thumbColorSecondary:{"&$focusVisible,&:hover":{boxShadow:"0px 0px 0px 8px ".concat((0,Dt.X4)(e.palette.secondary.main,.16))},"&$active":{boxShadow:"0px 0px 0px 14px ".concat((0,Dt.X4)(e.palette.secondary.main,.16))}},active:{},focusVisible:{},valueLabel:{left:"calc(-50% - 4px)"},mark:{position:"absolute",width:2,height:2,borderRadius:1,backgroundColor:"currentColor"},markActive:{backgroundColor:e.palette.background.paper,opacity:.8},markLabel:(0,r.A)({},e.typography.body2,{color:e.palette.text.secondary,position:"absolute",top:26,transform:"translateX(-50%)",whiteSpace:"nowrap","$vertical &":{top:"auto",left:26,transform:"translateY(50%)"},"@media (pointer: coarse)":{top:40,"$vertical &":{left:31}}}),markLabelActive:{color:e.palette.text.primary}}}),{name:"MuiSlider"})(ni);var oi=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=(0,a.A)(t,["classes","className"]);return e.createElement(q,(0,r.A)({gutterBottom:!0,component:"div",ref:n,className:(0,P.A)(o.root,i)},l))}));const ai=(0,T.A)((function(e){return{root:{fontWeight:e.typography.fontWeightMedium,marginTop:-2}}}),{name:"MuiAlertTitle"})(oi);var ii=n(8861),li=n(5632),si=n(9362),ui=n(345),ci=n(1991),di=n(8630),fi=n(5061),pi=n(6064),mi=n(2429),hi=n(7451),vi=n(8721);const gi=({open:t,onClose:n})=>e.createElement(un,{open:t,autoHideDuration:1e4,onClose:n,anchorOrigin:{vertical:"top",horizontal:"center"}},e.createElement(xn,{severity:"info",variant:"filled",onClose:n,style:{maxWidth:"600px"}},e.createElement(ai,null,"Spotify Premium Required"),e.createElement("p",null,"Playback controls like play, pause, and skip require a Spotify Premium account."),e.createElement(xo,{mt:1},e.createElement(Eo,{href:"https://www.spotify.com/premium/",target:"_blank",rel:"noopener",style:{color:"white",textDecoration:"underline"}},"Learn more about Spotify Premium"))));class yi extends e.Component{constructor(e){super(e),this.state={votesToSkip:2,guestCanPause:!1,isHost:!1,showSettings:!1,spotifyAuthenticated:!1,song:{},loading:!0,volume:50,actionLoading:{play:!1,pause:!1,skip:!1,leave:!1},notification:{show:!1,message:"",type:"info"},spotifyError:null,showPremiumNotice:!1},this.roomCode=this.props.match.params.roomCode,this.leaveButtonPressed=this.leaveButtonPressed.bind(this),this.updateShowSettings=this.updateShowSettings.bind(this),this.renderSettingsButton=this.renderSettingsButton.bind(this),this.renderSettings=this.renderSettings.bind(this),this.getRoomDetails=this.getRoomDetails.bind(this),this.getRoomDetails=this.getRoomDetails.bind(this),this.authenticateSpotify=this.authenticateSpotify.bind(this),this.getCurrentSong=this.getCurrentSong.bind(this),this.skipSong=this.skipSong.bind(this),this.pauseSong=this.pauseSong.bind(this),this.playSong=this.playSong.bind(this),this.formatTime=this.formatTime.bind(this),this.handleCloseNotification=this.handleCloseNotification.bind(this),this.handleApiError=this.handleApiError.bind(this),this.handlePremiumNoticeClose=this.handlePremiumNoticeClose.bind(this),this.getRoomDetails()}componentDidMount(){this.interval=setInterval(this.getCurrentSong,1e3)}componentWillUnmount(){clearInterval(this.interval)}getRoomDetails(){return fetch("/api/get-room?code="+this.roomCode).then((e=>(e.ok||(this.props.leaveRoomCallback(),this.props.history.push("/")),e.json()))).then((e=>{this.setState({votesToSkip:e.votes_to_skip,guestCanPause:e.guest_can_pause,isHost:e.is_host,loading:!1}),this.state.isHost&&this.authenticateSpotify()})).catch((e=>{console.error("Error fetching room details:",e),this.setState({loading:!1})}))}authenticateSpotify(){fetch("/spotify/is-authenticated").then((e=>e.json())).then((e=>{this.setState({spotifyAuthenticated:e.status,spotifyTokenInfo:e.token_info||{}}),(!e.status||e.token_info&&!e.token_info.has_valid_token)&&fetch("/spotify/get-auth-url").then((e=>e.json())).then((e=>{window.location.replace(e.url)}))})).catch((e=>{console.error("Error checking Spotify authentication:",e),this.showNotification("Spotify authentication error. Please try again.","error")}))}getCurrentSong(){fetch("/spotify/current-song").then((e=>401===e.status?e.json().then((e=>{throw e.auth_url?(this.showNotification("Spotify authentication required. Redirecting...","info"),setTimeout((()=>{window.location.replace(e.auth_url)}),2e3)):this.authenticateSpotify(),new Error("Authentication required")})):e.ok?e.json():{})).then((e=>{if(e.requires_authentication)return this.showNotification("Spotify authentication required. Redirecting...","info"),void setTimeout((()=>{e.auth_url?window.location.replace(e.auth_url):this.authenticateSpotify()}),2e3);this.setState({song:e})})).catch((e=>{"Authentication required"!==e.message&&console.error("Error fetching current song:",e)}))}skipSong(){this.setState((e=>({actionLoading:{...e.actionLoading,skip:!0}}))),fetch("/spotify/skip",{method:"POST",headers:{"Content-Type":"application/json"}}).then((e=>{if(!e.ok)return e.json().then((e=>{throw new Error(e.error||"Failed to skip track")}));this.showNotification("Skipped to next track","success")})).catch((e=>{this.handleApiError(e,"Failed to skip track")})).finally((()=>{setTimeout((()=>{this.setState((e=>({actionLoading:{...e.actionLoading,skip:!1}})))}),500)}))}pauseSong(){this.setState((e=>({actionLoading:{...e.actionLoading,pause:!0}}))),fetch("/spotify/pause",{method:"PUT",headers:{"Content-Type":"application/json"}}).then((e=>{if(!e.ok)return e.json().then((e=>{throw new Error(e.error||"Failed to pause playback")}));this.showNotification("Playback paused","info")})).catch((e=>{this.handleApiError(e,"Failed to pause playback")})).finally((()=>{setTimeout((()=>{this.setState((e=>({actionLoading:{...e.actionLoading,pause:!1}})))}),500)}))}playSong(){this.setState((e=>({actionLoading:{...e.actionLoading,play:!0}}))),fetch("/spotify/play",{method:"PUT",headers:{"Content-Type":"application/json"}}).then((e=>{if(!e.ok)return e.json().then((e=>{throw new Error(e.error||"Failed to start playback")}));this.showNotification("Playback started","success")})).catch((e=>{this.handleApiError(e,"Failed to start playback")})).finally((()=>{setTimeout((()=>{this.setState((e=>({actionLoading:{...e.actionLoading,play:!1}})))}),500)}))}handleVolumeChange(e,t){this.setState({volume:t})}showNotification(e,t="info"){this.setState({notification:{show:!0,message:e,type:t}})}handleCloseNotification(){this.setState({notification:{...this.state.notification,show:!1}})}handleApiError(e,t){console.error(e);const n=e.message||t;n.includes("premium")||n.toLowerCase().includes("forbidden")||n.includes("403")?this.setState({showPremiumNotice:!0,spotifyError:"Spotify Premium Required",notification:{show:!0,message:"This feature requires Spotify Premium",type:"info"}}):this.setState({spotifyError:n,notification:{show:!0,message:n,type:"error"}})}handlePremiumNoticeClose(){this.setState({showPremiumNotice:!1})}leaveButtonPressed(){this.setState((e=>({actionLoading:{...e.actionLoading,leave:!0}}))),fetch("/api/leave-room",{method:"POST",headers:{"Content-Type":"application/json"}}).then((e=>{if(!e.ok)throw new Error("Failed to leave room");this.showNotification("Leaving room...","info"),setTimeout((()=>{this.props.leaveRoomCallback(),this.props.history.push("/")}),1e3)})).catch((e=>{console.error("Error leaving room:",e),this.setState({notification:{show:!0,message:"Error leaving room. Please try again.",type:"error"},actionLoading:{...this.state.actionLoading,leave:!1}})}))}updateShowSettings(e){this.setState({showSettings:e})}formatTime(e){return e?`${Math.floor(e/6e4)}:${(e%6e4/1e3).toFixed(0).padStart(2,"0")}`:"0:00"}renderSettings(){return e.createElement(So,{maxWidth:"md"},e.createElement(R,{in:!0,timeout:500},e.createElement(L,{className:"music-card"},e.createElement(_,null,e.createElement(W,{container:!0,spacing:3},e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(q,{variant:"h4",className:"main-title"},"Room Settings")),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement($r,{update:!0,votesToSkip:this.state.votesToSkip,guestCanPause:this.state.guestCanPause,roomCode:this.roomCode,updateCallback:this.getRoomDetails})),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(Zt,{className:"action-button",variant:"contained",onClick:()=>this.updateShowSettings(!1)},"Back to Music")))))))}renderSettingsButton(){return e.createElement(Ia,{title:"Room Settings"},e.createElement(dn,{className:"control-button",onClick:()=>this.updateShowSettings(!0)},e.createElement(ui.A,null)))}render(){if(this.state.loading)return e.createElement(xo,{display:"flex",flexDirection:"column",justifyContent:"center",alignItems:"center",minHeight:"100vh"},e.createElement(nn,{className:"loading-pulse",size:60}),e.createElement(q,{variant:"h6",className:"loading-pulse",style:{marginTop:20}},"Loading Room..."));if(this.state.showSettings)return this.renderSettings();const{song:t,notification:n,actionLoading:r,showPremiumNotice:o}=this.state,a=t.time/t.duration*100||0;return e.createElement(So,{maxWidth:"md"},e.createElement(R,{in:!0,timeout:500},e.createElement("div",null,e.createElement(L,{className:"music-card",elevation:3},e.createElement(_,null,e.createElement(W,{container:!0,spacing:2,alignItems:"center"},e.createElement(W,{item:!0,xs:12,sm:6,align:"center"},e.createElement("div",{className:"room-code"},e.createElement(q,{variant:"h6",component:"span"},"Room Code: ",this.roomCode))),e.createElement(W,{item:!0,xs:12,sm:6,align:"center"},e.createElement(Ba,{icon:this.state.isHost?e.createElement(gr.A,null):e.createElement(fi.A,null),label:this.state.isHost?"Host":"Guest",color:this.state.isHost?"primary":"default",style:{marginRight:8}}),e.createElement(Ba,{icon:this.state.spotifyAuthenticated?e.createElement(gr.A,null):e.createElement(pi.A,null),label:"Spotify",color:this.state.spotifyAuthenticated?"primary":"secondary"}))))),e.createElement(L,{className:"music-card",style:{marginTop:20}},e.createElement(_,null,t.title?e.createElement(W,{container:!0,spacing:3},e.createElement(W,{item:!0,xs:12,md:4,align:"center"},e.createElement(xo,{className:"album-cover",mb:2},e.createElement("img",{src:t.image_url,alt:t.title,style:{width:"100%",height:"auto"}})),e.createElement(O,{elevation:2,style:{padding:"8px 15px",display:"inline-block",borderRadius:"20px"}},e.createElement(q,{variant:"body2"},"Votes to Skip: ",e.createElement("b",null,t.votes||0)," / ",e.createElement("b",null,t.votes_required||this.state.votesToSkip)))),e.createElement(W,{item:!0,xs:12,md:8,className:"song-info"},e.createElement(q,{variant:"h4",component:"h2",gutterBottom:!0},t.title),e.createElement(q,{variant:"h6",color:"textSecondary",gutterBottom:!0},t.artist),e.createElement(xo,{my:3},e.createElement(W,{container:!0,spacing:2,alignItems:"center"},e.createElement(W,{item:!0,xs:2},e.createElement(q,{variant:"body2"},this.formatTime(t.time))),e.createElement(W,{item:!0,xs:8},e.createElement($a,{variant:"determinate",value:a,className:"progress-bar"})),e.createElement(W,{item:!0,xs:2,align:"right"},e.createElement(q,{variant:"body2"},this.formatTime(t.duration))))),e.createElement(xo,{className:"music-controls",mb:3},this.state.guestCanPause||this.state.isHost?e.createElement(Ia,{title:t.is_playing?"Pause":"Play"},e.createElement("div",null,e.createElement(dn,{className:"control-button "+(t.is_playing?"pause-button":"play-button"),onClick:()=>t.is_playing?this.pauseSong():this.playSong(),size:"medium",disabled:r.play||r.pause},r.play||r.pause?e.createElement(nn,{size:24,color:"inherit"}):t.is_playing?e.createElement(li.A,{fontSize:"large"}):e.createElement(ii.A,{fontSize:"large"})))):null,e.createElement(Ia,{title:e.createElement("div",null,e.createElement(q,{variant:"body2"},"Skip"),e.createElement(q,{variant:"caption"},"Requires Spotify Premium"))},e.createElement("div",{style:{position:"relative"}},e.createElement(Ha,{badgeContent:`${t.votes}/${t.votes_required}`,color:"secondary"},e.createElement(dn,{className:"control-button skip-button",onClick:this.skipSong,size:"medium",disabled:r.skip},r.skip?e.createElement(nn,{size:24,color:"inherit"}):e.createElement(si.A,{fontSize:"large"}),e.createElement("div",{style:{position:"absolute",top:-5,right:-5,background:"rgba(0,0,0,0.5)",borderRadius:"50%",padding:3}},e.createElement(hi.A,{style:{fontSize:12,color:"#1DB954"}})))))),this.state.isHost&&this.renderSettingsButton()),e.createElement(xo,{mx:2,mb:2},e.createElement(W,{container:!0,spacing:2,alignItems:"center"},e.createElement(W,{item:!0},e.createElement(di.A,null)),e.createElement(W,{item:!0,xs:!0},e.createElement(ri,{value:this.state.volume,onChange:this.handleVolumeChange,"aria-labelledby":"volume-slider"})),e.createElement(W,{item:!0},e.createElement(ci.A,null)))))):e.createElement(xo,{display:"flex",flexDirection:"column",alignItems:"center",p:3},e.createElement(mi.A,{style:{fontSize:60,color:"#1e3c72",marginBottom:20}}),e.createElement(q,{variant:"h5",style:{color:"#666"}},"No song currently playing"),e.createElement(q,{variant:"body2",style:{color:"#888",marginTop:10}},"Play a song on Spotify to get started")))),e.createElement(xo,{mt:3,mb:5,display:"flex",justifyContent:"center"},e.createElement(Zt,{className:"action-button leave-button",variant:"contained",size:"large",startIcon:r.leave?e.createElement(nn,{size:24,color:"inherit"}):e.createElement(vr.A,null),onClick:this.leaveButtonPressed,disabled:r.leave},r.leave?"Leaving...":"Leave Room")),t.title&&e.createElement(L,{className:"music-card",style:{marginTop:20}},e.createElement(_,null,e.createElement(W,{container:!0,spacing:2,alignItems:"center"},e.createElement(W,{item:!0},e.createElement(vi.A,{style:{color:"#1DB954"}})),e.createElement(W,{item:!0,xs:!0},e.createElement(q,{variant:"body1"},e.createElement("strong",null,"Note:")," Playback controls require Spotify Premium. The display will update as songs play, but you'll need a premium account to control playback."))))))),e.createElement(gi,{open:o,onClose:this.handlePremiumNoticeClose}),e.createElement(un,{open:n.show,autoHideDuration:6e3,onClose:this.handleCloseNotification,anchorOrigin:{vertical:"bottom",horizontal:"center"}},e.createElement(xn,{onClose:this.handleCloseNotification,severity:n.type,variant:"filled"},n.message)))}}var bi=n(7201);function xi(){return xi=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},xi.apply(null,arguments)}class wi extends e.Component{constructor(e){super(e),this.state={roomCode:null,loading:!0},this.clearRoomCode=this.clearRoomCode.bind(this)}async componentDidMount(){fetch("/api/user-in-room").then((e=>e.json())).then((e=>{this.setState({roomCode:e.code,loading:!1})})).catch((e=>{console.error("Error fetching room:",e),this.setState({loading:!1})}))}renderHomePage(){return this.state.loading?e.createElement(xo,{display:"flex",justifyContent:"center",alignItems:"center",minHeight:"100vh"},e.createElement(nn,{className:"loading-pulse",size:60})):e.createElement(So,null,e.createElement(R,{in:!this.state.loading,timeout:1e3},e.createElement(L,{className:"music-card",elevation:6},e.createElement(_,null,e.createElement(W,{container:!0,spacing:4},e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(mi.A,{style:{fontSize:60,color:"#1e3c72",marginBottom:20}}),e.createElement(q,{variant:"h2",component:"h1",className:"main-title"},"House Party"),e.createElement(q,{variant:"h6",style:{marginBottom:30,color:"#666"}},"Join the ultimate music sharing experience")),e.createElement(W,{item:!0,xs:12,sm:6,align:"center"},e.createElement(Zt,{className:"action-button join-button",variant:"contained",size:"large",startIcon:e.createElement(fi.A,null),component:fr,to:"/join",fullWidth:!0},"Join a Room")),e.createElement(W,{item:!0,xs:12,sm:6,align:"center"},e.createElement(Zt,{className:"action-button create-button",variant:"contained",size:"large",startIcon:e.createElement(bi.A,null),component:fr,to:"/create",fullWidth:!0},"Create a Room")),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(q,{variant:"body2",style:{marginTop:20,color:"#666"}},"Control Spotify playback with friends in real-time")))))))}clearRoomCode(){this.setState({roomCode:null})}render(){return e.createElement(ir,null,e.createElement("div",{className:"app-container"},e.createElement(ar,null,e.createElement(or,{exact:!0,path:"/",render:()=>this.state.roomCode?e.createElement(er,{to:`/room/${this.state.roomCode}`}):this.renderHomePage()}),e.createElement(or,{path:"/join",component:xr}),e.createElement(or,{path:"/create",component:$r}),e.createElement(or,{path:"/room/:roomCode",render:t=>e.createElement(yi,xi({},t,{leaveRoomCallback:this.clearRoomCode}))}))))}}class Ei extends e.Component{constructor(e){super(e)}render(){return e.createElement("div",{className:"center"},e.createElement(wi,null))}}const ki=document.getElementById("app");(0,t.render)(e.createElement(Ei,null),ki);var Si=new Array([62,35,255],[60,255,60],[255,35,98],[45,175,230],[255,0,255],[255,128,0]),Ai=0,Ci=[0,1,2,3];setInterval((function(){if(void 0!==$){var e=Si[Ci[0]],t=Si[Ci[1]],n=Si[Ci[2]],r=Si[Ci[3]],o=1-Ai,a="rgb("+Math.round(o*e[0]+Ai*t[0])+","+Math.round(o*e[1]+Ai*t[1])+","+Math.round(o*e[2]+Ai*t[2])+")",i="rgb("+Math.round(o*n[0]+Ai*r[0])+","+Math.round(o*n[1]+Ai*r[1])+","+Math.round(o*n[2]+Ai*r[2])+")";$("#gradient").css({background:"-webkit-gradient(linear, left top, right top, from("+a+"), to("+i+"))"}).css({background:"-moz-linear-gradient(left, "+a+" 0%, "+i+" 100%)"}),(Ai+=.002)>=1&&(Ai%=1,Ci[0]=Ci[1],Ci[2]=Ci[3],Ci[1]=(Ci[1]+Math.floor(1+Math.random()*(Si.length-1)))%Si.length,Ci[3]=(Ci[3]+Math.floor(1+Math.random()*(Si.length-1)))%Si.length)}}),10)})()})();
\ No newline at end of file
+(()=>{var e={45:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(8587);function o(e,t){if(null==e)return{};var n,o,a=(0,r.A)(e,t);if(Object.getOwnPropertySymbols){var i=Object.getOwnPropertySymbols(e);for(o=0;o<i.length;o++)n=i[o],-1===t.indexOf(n)&&{}.propertyIsEnumerable.call(e,n)&&(a[n]=e[n])}return a}},53:(e,t,n)=>{"use strict";function r(e){var t,n,o="";if("string"==typeof e||"number"==typeof e)o+=e;else if("object"==typeof e)if(Array.isArray(e))for(t=0;t<e.length;t++)e[t]&&(n=r(e[t]))&&(o&&(o+=" "),o+=n);else for(t in e)e[t]&&(o&&(o+=" "),o+=t);return o}n.d(t,{A:()=>o});const o=function(){for(var e,t,n=0,o="";n<arguments.length;)(e=arguments[n++])&&(t=r(e))&&(o&&(o+=" "),o+=t);return o}},296:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(7800);function o(e,t){return function(e){if(Array.isArray(e))return e}(e)||function(e,t){var n=null==e?null:"undefined"!=typeof Symbol&&e[Symbol.iterator]||e["@@iterator"];if(null!=n){var r,o,a,i,l=[],s=!0,u=!1;try{if(a=(n=n.call(e)).next,0===t){if(Object(n)!==n)return;s=!1}else for(;!(s=(r=a.call(n)).done)&&(l.push(r.value),l.length!==t);s=!0);}catch(e){u=!0,o=e}finally{try{if(!s&&null!=n.return&&(i=n.return(),Object(i)!==i))return}finally{if(u)throw o}}return l}}(e,t)||(0,r.A)(e,t)||function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}},345:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M19.14 12.94c.04-.3.06-.61.06-.94 0-.32-.02-.64-.07-.94l2.03-1.58c.18-.14.23-.41.12-.61l-1.92-3.32c-.12-.22-.37-.29-.59-.22l-2.39.96c-.5-.38-1.03-.7-1.62-.94l-.36-2.54c-.04-.24-.24-.41-.48-.41h-3.84c-.24 0-.43.17-.47.41l-.36 2.54c-.59.24-1.13.57-1.62.94l-2.39-.96c-.22-.08-.47 0-.59.22L2.74 8.87c-.12.21-.08.47.12.61l2.03 1.58c-.05.3-.09.63-.09.94s.02.64.07.94l-2.03 1.58c-.18.14-.23.41-.12.61l1.92 3.32c.12.22.37.29.59.22l2.39-.96c.5.38 1.03.7 1.62.94l.36 2.54c.05.24.24.41.48.41h3.84c.24 0 .44-.17.47-.41l.36-2.54c.59-.24 1.13-.56 1.62-.94l2.39.96c.22.08.47 0 .59-.22l1.92-3.32c.12-.22.07-.47-.12-.61l-2.01-1.58zM12 15.6c-1.98 0-3.6-1.62-3.6-3.6s1.62-3.6 3.6-3.6 3.6 1.62 3.6 3.6-1.62 3.6-3.6 3.6z"}),"Settings");t.A=i},364:(e,t,n)=>{"use strict";n.d(t,{A:()=>m});var r=n(6540),o=n(961),a=!0,i=!1,l=null,s={text:!0,search:!0,url:!0,tel:!0,email:!0,password:!0,number:!0,date:!0,month:!0,week:!0,time:!0,datetime:!0,"datetime-local":!0};function u(e){e.metaKey||e.altKey||e.ctrlKey||(a=!0)}function c(){a=!1}function d(){"hidden"===this.visibilityState&&i&&(a=!0)}function f(e){var t,n,r,o=e.target;try{return o.matches(":focus-visible")}catch(e){}return a||(n=(t=o).type,!("INPUT"!==(r=t.tagName)||!s[n]||t.readOnly)||"TEXTAREA"===r&&!t.readOnly||!!t.isContentEditable)}function p(){i=!0,window.clearTimeout(l),l=window.setTimeout((function(){i=!1}),100)}function m(){return{isFocusVisible:f,onBlurVisible:p,ref:r.useCallback((function(e){var t,n=o.findDOMNode(e);null!=n&&((t=n.ownerDocument).addEventListener("keydown",u,!0),t.addEventListener("mousedown",c,!0),t.addEventListener("pointerdown",c,!0),t.addEventListener("touchstart",c,!0),t.addEventListener("visibilitychange",d,!0))}),[])}}},816:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(2284);function o(e){var t=function(e){if("object"!=(0,r.A)(e)||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=(0,r.A)(n))return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==(0,r.A)(t)?t:t+""}},961:(e,t,n)=>{"use strict";!function e(){if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(e){console.error(e)}}(),e.exports=n(2551)},1198:(e,t,n)=>{"use strict";function r(e){var t,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:166;function r(){for(var r=arguments.length,o=new Array(r),a=0;a<r;a++)o[a]=arguments[a];var i=this;clearTimeout(t),t=setTimeout((function(){e.apply(i,o)}),n)}return r.clear=function(){clearTimeout(t)},r}n.d(t,{A:()=>r})},1305:(e,t,n)=>{"use strict";n.r(t),n.d(t,{capitalize:()=>r.A,createChainedFunction:()=>o.A,createSvgIcon:()=>a.A,debounce:()=>i.A,deprecatedPropType:()=>l,isMuiElement:()=>s.A,ownerDocument:()=>u.A,ownerWindow:()=>c.A,requirePropFactory:()=>d,setRef:()=>f.A,unstable_useId:()=>g.A,unsupportedProp:()=>p,useControlled:()=>m.A,useEventCallback:()=>h.A,useForkRef:()=>v.A,useIsFocusVisible:()=>y.A});var r=n(7515),o=n(8521),a=n(4507),i=n(1198);function l(e,t){return function(){return null}}var s=n(7570),u=n(1475),c=n(6182);function d(e){return function(){return null}}var f=n(4960);function p(e,t,n,r,o){return null}var m=n(8060),h=n(2319),v=n(4801),g=n(4232),y=n(364)},1475:(e,t,n)=>{"use strict";function r(e){return e&&e.ownerDocument||document}n.d(t,{A:()=>r})},1991:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M3 9v6h4l5 5V4L7 9H3zm13.5 3c0-1.77-1.02-3.29-2.5-4.03v8.05c1.48-.73 2.5-2.25 2.5-4.02zM14 3.23v2.06c2.89.86 5 3.54 5 6.71s-2.11 5.85-5 6.71v2.06c4.01-.91 7-4.49 7-8.77s-2.99-7.86-7-8.77z"}),"VolumeUp");t.A=i},2284:(e,t,n)=>{"use strict";function r(e){return r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},r(e)}n.d(t,{A:()=>r})},2319:(e,t,n)=>{"use strict";n.d(t,{A:()=>a});var r=n(6540),o="undefined"!=typeof window?r.useLayoutEffect:r.useEffect;function a(e){var t=r.useRef(e);return o((function(){t.current=e})),r.useCallback((function(){return t.current.apply(void 0,arguments)}),[])}},2429:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M12 3v10.55c-.59-.34-1.27-.55-2-.55-2.21 0-4 1.79-4 4s1.79 4 4 4 4-1.79 4-4V7h4V3h-6z"}),"MusicNote");t.A=i},2551:(e,t,n)=>{"use strict";var r=n(6540),o=n(5228),a=n(9982);function i(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}if(!r)throw Error(i(227));var l=new Set,s={};function u(e,t){c(e,t),c(e+"Capture",t)}function c(e,t){for(s[e]=t,e=0;e<t.length;e++)l.add(t[e])}var d=!("undefined"==typeof window||void 0===window.document||void 0===window.document.createElement),f=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,p=Object.prototype.hasOwnProperty,m={},h={};function v(e,t,n,r,o,a,i){this.acceptsBooleans=2===t||3===t||4===t,this.attributeName=r,this.attributeNamespace=o,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=a,this.removeEmptyString=i}var g={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach((function(e){g[e]=new v(e,0,!1,e,null,!1,!1)})),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach((function(e){var t=e[0];g[t]=new v(t,1,!1,e[1],null,!1,!1)})),["contentEditable","draggable","spellCheck","value"].forEach((function(e){g[e]=new v(e,2,!1,e.toLowerCase(),null,!1,!1)})),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach((function(e){g[e]=new v(e,2,!1,e,null,!1,!1)})),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach((function(e){g[e]=new v(e,3,!1,e.toLowerCase(),null,!1,!1)})),["checked","multiple","muted","selected"].forEach((function(e){g[e]=new v(e,3,!0,e,null,!1,!1)})),["capture","download"].forEach((function(e){g[e]=new v(e,4,!1,e,null,!1,!1)})),["cols","rows","size","span"].forEach((function(e){g[e]=new v(e,6,!1,e,null,!1,!1)})),["rowSpan","start"].forEach((function(e){g[e]=new v(e,5,!1,e.toLowerCase(),null,!1,!1)}));var y=/[\-:]([a-z])/g;function b(e){return e[1].toUpperCase()}function x(e,t,n,r){var o=g.hasOwnProperty(t)?g[t]:null;(null!==o?0===o.type:!r&&2<t.length&&("o"===t[0]||"O"===t[0])&&("n"===t[1]||"N"===t[1]))||(function(e,t,n,r){if(null==t||function(e,t,n,r){if(null!==n&&0===n.type)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==n?!n.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,t,n,r))return!0;if(r)return!1;if(null!==n)switch(n.type){case 3:return!t;case 4:return!1===t;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}(t,n,o,r)&&(n=null),r||null===o?function(e){return!!p.call(h,e)||!p.call(m,e)&&(f.test(e)?h[e]=!0:(m[e]=!0,!1))}(t)&&(null===n?e.removeAttribute(t):e.setAttribute(t,""+n)):o.mustUseProperty?e[o.propertyName]=null===n?3!==o.type&&"":n:(t=o.attributeName,r=o.attributeNamespace,null===n?e.removeAttribute(t):(n=3===(o=o.type)||4===o&&!0===n?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach((function(e){var t=e.replace(y,b);g[t]=new v(t,1,!1,e,null,!1,!1)})),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach((function(e){var t=e.replace(y,b);g[t]=new v(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)})),["xml:base","xml:lang","xml:space"].forEach((function(e){var t=e.replace(y,b);g[t]=new v(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)})),["tabIndex","crossOrigin"].forEach((function(e){g[e]=new v(e,1,!1,e.toLowerCase(),null,!1,!1)})),g.xlinkHref=new v("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach((function(e){g[e]=new v(e,1,!1,e.toLowerCase(),null,!0,!0)}));var w=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,E=60103,k=60106,S=60107,A=60108,C=60114,R=60109,P=60110,T=60112,N=60113,O=60120,M=60115,L=60116,z=60121,_=60128,I=60129,D=60130,F=60131;if("function"==typeof Symbol&&Symbol.for){var j=Symbol.for;E=j("react.element"),k=j("react.portal"),S=j("react.fragment"),A=j("react.strict_mode"),C=j("react.profiler"),R=j("react.provider"),P=j("react.context"),T=j("react.forward_ref"),N=j("react.suspense"),O=j("react.suspense_list"),M=j("react.memo"),L=j("react.lazy"),z=j("react.block"),j("react.scope"),_=j("react.opaque.id"),I=j("react.debug_trace_mode"),D=j("react.offscreen"),F=j("react.legacy_hidden")}var B,W="function"==typeof Symbol&&Symbol.iterator;function $(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=W&&e[W]||e["@@iterator"])?e:null}function V(e){if(void 0===B)try{throw Error()}catch(e){var t=e.stack.trim().match(/\n( *(at )?)/);B=t&&t[1]||""}return"\n"+B+e}var H=!1;function U(e,t){if(!e||H)return"";H=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),"object"==typeof Reflect&&Reflect.construct){try{Reflect.construct(t,[])}catch(e){var r=e}Reflect.construct(e,[],t)}else{try{t.call()}catch(e){r=e}e.call(t.prototype)}else{try{throw Error()}catch(e){r=e}e()}}catch(e){if(e&&r&&"string"==typeof e.stack){for(var o=e.stack.split("\n"),a=r.stack.split("\n"),i=o.length-1,l=a.length-1;1<=i&&0<=l&&o[i]!==a[l];)l--;for(;1<=i&&0<=l;i--,l--)if(o[i]!==a[l]){if(1!==i||1!==l)do{if(i--,0>--l||o[i]!==a[l])return"\n"+o[i].replace(" at new "," at ")}while(1<=i&&0<=l);break}}}finally{H=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?V(e):""}function q(e){switch(e.tag){case 5:return V(e.type);case 16:return V("Lazy");case 13:return V("Suspense");case 19:return V("SuspenseList");case 0:case 2:case 15:return U(e.type,!1);case 11:return U(e.type.render,!1);case 22:return U(e.type._render,!1);case 1:return U(e.type,!0);default:return""}}function K(e){if(null==e)return null;if("function"==typeof e)return e.displayName||e.name||null;if("string"==typeof e)return e;switch(e){case S:return"Fragment";case k:return"Portal";case C:return"Profiler";case A:return"StrictMode";case N:return"Suspense";case O:return"SuspenseList"}if("object"==typeof e)switch(e.$$typeof){case P:return(e.displayName||"Context")+".Consumer";case R:return(e._context.displayName||"Context")+".Provider";case T:var t=e.render;return t=t.displayName||t.name||"",e.displayName||(""!==t?"ForwardRef("+t+")":"ForwardRef");case M:return K(e.type);case z:return K(e._render);case L:t=e._payload,e=e._init;try{return K(e(t))}catch(e){}}return null}function X(e){switch(typeof e){case"boolean":case"number":case"object":case"string":case"undefined":return e;default:return""}}function Q(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function Y(e){e._valueTracker||(e._valueTracker=function(e){var t=Q(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&void 0!==n&&"function"==typeof n.get&&"function"==typeof n.set){var o=n.get,a=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return o.call(this)},set:function(e){r=""+e,a.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function G(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=Q(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function J(e){if(void 0===(e=e||("undefined"!=typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}function Z(e,t){var n=t.checked;return o({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=n?n:e._wrapperState.initialChecked})}function ee(e,t){var n=null==t.defaultValue?"":t.defaultValue,r=null!=t.checked?t.checked:t.defaultChecked;n=X(null!=t.value?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:"checkbox"===t.type||"radio"===t.type?null!=t.checked:null!=t.value}}function te(e,t){null!=(t=t.checked)&&x(e,"checked",t,!1)}function ne(e,t){te(e,t);var n=X(t.value),r=t.type;if(null!=n)"number"===r?(0===n&&""===e.value||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");t.hasOwnProperty("value")?oe(e,t.type,n):t.hasOwnProperty("defaultValue")&&oe(e,t.type,X(t.defaultValue)),null==t.checked&&null!=t.defaultChecked&&(e.defaultChecked=!!t.defaultChecked)}function re(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!("submit"!==r&&"reset"!==r||void 0!==t.value&&null!==t.value))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}""!==(n=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==n&&(e.name=n)}function oe(e,t,n){"number"===t&&J(e.ownerDocument)===e||(null==n?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}function ae(e,t){return e=o({children:void 0},t),(t=function(e){var t="";return r.Children.forEach(e,(function(e){null!=e&&(t+=e)})),t}(t.children))&&(e.children=t),e}function ie(e,t,n,r){if(e=e.options,t){t={};for(var o=0;o<n.length;o++)t["$"+n[o]]=!0;for(n=0;n<e.length;n++)o=t.hasOwnProperty("$"+e[n].value),e[n].selected!==o&&(e[n].selected=o),o&&r&&(e[n].defaultSelected=!0)}else{for(n=""+X(n),t=null,o=0;o<e.length;o++){if(e[o].value===n)return e[o].selected=!0,void(r&&(e[o].defaultSelected=!0));null!==t||e[o].disabled||(t=e[o])}null!==t&&(t.selected=!0)}}function le(e,t){if(null!=t.dangerouslySetInnerHTML)throw Error(i(91));return o({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function se(e,t){var n=t.value;if(null==n){if(n=t.children,t=t.defaultValue,null!=n){if(null!=t)throw Error(i(92));if(Array.isArray(n)){if(!(1>=n.length))throw Error(i(93));n=n[0]}t=n}null==t&&(t=""),n=t}e._wrapperState={initialValue:X(n)}}function ue(e,t){var n=X(t.value),r=X(t.defaultValue);null!=n&&((n=""+n)!==e.value&&(e.value=n),null==t.defaultValue&&e.defaultValue!==n&&(e.defaultValue=n)),null!=r&&(e.defaultValue=""+r)}function ce(e){var t=e.textContent;t===e._wrapperState.initialValue&&""!==t&&null!==t&&(e.value=t)}var de="http://www.w3.org/1999/xhtml";function fe(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function pe(e,t){return null==e||"http://www.w3.org/1999/xhtml"===e?fe(t):"http://www.w3.org/2000/svg"===e&&"foreignObject"===t?"http://www.w3.org/1999/xhtml":e}var me,he,ve=(he=function(e,t){if("http://www.w3.org/2000/svg"!==e.namespaceURI||"innerHTML"in e)e.innerHTML=t;else{for((me=me||document.createElement("div")).innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=me.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}},"undefined"!=typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,t,n,r){MSApp.execUnsafeLocalFunction((function(){return he(e,t)}))}:he);function ge(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var ye={animationIterationCount:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},be=["Webkit","ms","Moz","O"];function xe(e,t,n){return null==t||"boolean"==typeof t||""===t?"":n||"number"!=typeof t||0===t||ye.hasOwnProperty(e)&&ye[e]?(""+t).trim():t+"px"}function we(e,t){for(var n in e=e.style,t)if(t.hasOwnProperty(n)){var r=0===n.indexOf("--"),o=xe(n,t[n],r);"float"===n&&(n="cssFloat"),r?e.setProperty(n,o):e[n]=o}}Object.keys(ye).forEach((function(e){be.forEach((function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),ye[t]=ye[e]}))}));var Ee=o({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function ke(e,t){if(t){if(Ee[e]&&(null!=t.children||null!=t.dangerouslySetInnerHTML))throw Error(i(137,e));if(null!=t.dangerouslySetInnerHTML){if(null!=t.children)throw Error(i(60));if("object"!=typeof t.dangerouslySetInnerHTML||!("__html"in t.dangerouslySetInnerHTML))throw Error(i(61))}if(null!=t.style&&"object"!=typeof t.style)throw Error(i(62))}}function Se(e,t){if(-1===e.indexOf("-"))return"string"==typeof t.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}function Ae(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Ce=null,Re=null,Pe=null;function Te(e){if(e=no(e)){if("function"!=typeof Ce)throw Error(i(280));var t=e.stateNode;t&&(t=oo(t),Ce(e.stateNode,e.type,t))}}function Ne(e){Re?Pe?Pe.push(e):Pe=[e]:Re=e}function Oe(){if(Re){var e=Re,t=Pe;if(Pe=Re=null,Te(e),t)for(e=0;e<t.length;e++)Te(t[e])}}function Me(e,t){return e(t)}function Le(e,t,n,r,o){return e(t,n,r,o)}function ze(){}var _e=Me,Ie=!1,De=!1;function Fe(){null===Re&&null===Pe||(ze(),Oe())}function je(e,t){var n=e.stateNode;if(null===n)return null;var r=oo(n);if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!=typeof n)throw Error(i(231,t,typeof n));return n}var Be=!1;if(d)try{var We={};Object.defineProperty(We,"passive",{get:function(){Be=!0}}),window.addEventListener("test",We,We),window.removeEventListener("test",We,We)}catch(he){Be=!1}function $e(e,t,n,r,o,a,i,l,s){var u=Array.prototype.slice.call(arguments,3);try{t.apply(n,u)}catch(e){this.onError(e)}}var Ve=!1,He=null,Ue=!1,qe=null,Ke={onError:function(e){Ve=!0,He=e}};function Xe(e,t,n,r,o,a,i,l,s){Ve=!1,He=null,$e.apply(Ke,arguments)}function Qe(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{!!(1026&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function Ye(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&null!==(e=e.alternate)&&(t=e.memoizedState),null!==t)return t.dehydrated}return null}function Ge(e){if(Qe(e)!==e)throw Error(i(188))}function Je(e){if(e=function(e){var t=e.alternate;if(!t){if(null===(t=Qe(e)))throw Error(i(188));return t!==e?null:e}for(var n=e,r=t;;){var o=n.return;if(null===o)break;var a=o.alternate;if(null===a){if(null!==(r=o.return)){n=r;continue}break}if(o.child===a.child){for(a=o.child;a;){if(a===n)return Ge(o),e;if(a===r)return Ge(o),t;a=a.sibling}throw Error(i(188))}if(n.return!==r.return)n=o,r=a;else{for(var l=!1,s=o.child;s;){if(s===n){l=!0,n=o,r=a;break}if(s===r){l=!0,r=o,n=a;break}s=s.sibling}if(!l){for(s=a.child;s;){if(s===n){l=!0,n=a,r=o;break}if(s===r){l=!0,r=a,n=o;break}s=s.sibling}if(!l)throw Error(i(189))}}if(n.alternate!==r)throw Error(i(190))}if(3!==n.tag)throw Error(i(188));return n.stateNode.current===n?e:t}(e),!e)return null;for(var t=e;;){if(5===t.tag||6===t.tag)return t;if(t.child)t.child.return=t,t=t.child;else{if(t===e)break;for(;!t.sibling;){if(!t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}}return null}function Ze(e,t){for(var n=e.alternate;null!==t;){if(t===e||t===n)return!0;t=t.return}return!1}var et,tt,nt,rt,ot=!1,at=[],it=null,lt=null,st=null,ut=new Map,ct=new Map,dt=[],ft="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function pt(e,t,n,r,o){return{blockedOn:e,domEventName:t,eventSystemFlags:16|n,nativeEvent:o,targetContainers:[r]}}function mt(e,t){switch(e){case"focusin":case"focusout":it=null;break;case"dragenter":case"dragleave":lt=null;break;case"mouseover":case"mouseout":st=null;break;case"pointerover":case"pointerout":ut.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":ct.delete(t.pointerId)}}function ht(e,t,n,r,o,a){return null===e||e.nativeEvent!==a?(e=pt(t,n,r,o,a),null!==t&&null!==(t=no(t))&&tt(t),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==o&&-1===t.indexOf(o)&&t.push(o),e)}function vt(e){var t=to(e.target);if(null!==t){var n=Qe(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=Ye(n)))return e.blockedOn=t,void rt(e.lanePriority,(function(){a.unstable_runWithPriority(e.priority,(function(){nt(n)}))}))}else if(3===t&&n.stateNode.hydrate)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function gt(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=Jt(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(null!==n)return null!==(t=no(n))&&tt(t),e.blockedOn=n,!1;t.shift()}return!0}function yt(e,t,n){gt(e)&&n.delete(t)}function bt(){for(ot=!1;0<at.length;){var e=at[0];if(null!==e.blockedOn){null!==(e=no(e.blockedOn))&&et(e);break}for(var t=e.targetContainers;0<t.length;){var n=Jt(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(null!==n){e.blockedOn=n;break}t.shift()}null===e.blockedOn&&at.shift()}null!==it&&gt(it)&&(it=null),null!==lt&&gt(lt)&&(lt=null),null!==st&&gt(st)&&(st=null),ut.forEach(yt),ct.forEach(yt)}function xt(e,t){e.blockedOn===t&&(e.blockedOn=null,ot||(ot=!0,a.unstable_scheduleCallback(a.unstable_NormalPriority,bt)))}function wt(e){function t(t){return xt(t,e)}if(0<at.length){xt(at[0],e);for(var n=1;n<at.length;n++){var r=at[n];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==it&&xt(it,e),null!==lt&&xt(lt,e),null!==st&&xt(st,e),ut.forEach(t),ct.forEach(t),n=0;n<dt.length;n++)(r=dt[n]).blockedOn===e&&(r.blockedOn=null);for(;0<dt.length&&null===(n=dt[0]).blockedOn;)vt(n),null===n.blockedOn&&dt.shift()}function Et(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var kt={animationend:Et("Animation","AnimationEnd"),animationiteration:Et("Animation","AnimationIteration"),animationstart:Et("Animation","AnimationStart"),transitionend:Et("Transition","TransitionEnd")},St={},At={};function Ct(e){if(St[e])return St[e];if(!kt[e])return e;var t,n=kt[e];for(t in n)if(n.hasOwnProperty(t)&&t in At)return St[e]=n[t];return e}d&&(At=document.createElement("div").style,"AnimationEvent"in window||(delete kt.animationend.animation,delete kt.animationiteration.animation,delete kt.animationstart.animation),"TransitionEvent"in window||delete kt.transitionend.transition);var Rt=Ct("animationend"),Pt=Ct("animationiteration"),Tt=Ct("animationstart"),Nt=Ct("transitionend"),Ot=new Map,Mt=new Map,Lt=["abort","abort",Rt,"animationEnd",Pt,"animationIteration",Tt,"animationStart","canplay","canPlay","canplaythrough","canPlayThrough","durationchange","durationChange","emptied","emptied","encrypted","encrypted","ended","ended","error","error","gotpointercapture","gotPointerCapture","load","load","loadeddata","loadedData","loadedmetadata","loadedMetadata","loadstart","loadStart","lostpointercapture","lostPointerCapture","playing","playing","progress","progress","seeking","seeking","stalled","stalled","suspend","suspend","timeupdate","timeUpdate",Nt,"transitionEnd","waiting","waiting"];function zt(e,t){for(var n=0;n<e.length;n+=2){var r=e[n],o=e[n+1];o="on"+(o[0].toUpperCase()+o.slice(1)),Mt.set(r,t),Ot.set(r,o),u(o,[r])}}(0,a.unstable_now)();var _t=8;function It(e){if(1&e)return _t=15,1;if(2&e)return _t=14,2;if(4&e)return _t=13,4;var t=24&e;return 0!==t?(_t=12,t):32&e?(_t=11,32):0!=(t=192&e)?(_t=10,t):256&e?(_t=9,256):0!=(t=3584&e)?(_t=8,t):4096&e?(_t=7,4096):0!=(t=4186112&e)?(_t=6,t):0!=(t=62914560&e)?(_t=5,t):67108864&e?(_t=4,67108864):134217728&e?(_t=3,134217728):0!=(t=805306368&e)?(_t=2,t):1073741824&e?(_t=1,1073741824):(_t=8,e)}function Dt(e,t){var n=e.pendingLanes;if(0===n)return _t=0;var r=0,o=0,a=e.expiredLanes,i=e.suspendedLanes,l=e.pingedLanes;if(0!==a)r=a,o=_t=15;else if(0!=(a=134217727&n)){var s=a&~i;0!==s?(r=It(s),o=_t):0!=(l&=a)&&(r=It(l),o=_t)}else 0!=(a=n&~i)?(r=It(a),o=_t):0!==l&&(r=It(l),o=_t);if(0===r)return 0;if(r=n&((0>(r=31-Vt(r))?0:1<<r)<<1)-1,0!==t&&t!==r&&!(t&i)){if(It(t),o<=_t)return t;_t=o}if(0!==(t=e.entangledLanes))for(e=e.entanglements,t&=r;0<t;)o=1<<(n=31-Vt(t)),r|=e[n],t&=~o;return r}function Ft(e){return 0!=(e=-1073741825&e.pendingLanes)?e:1073741824&e?1073741824:0}function jt(e,t){switch(e){case 15:return 1;case 14:return 2;case 12:return 0===(e=Bt(24&~t))?jt(10,t):e;case 10:return 0===(e=Bt(192&~t))?jt(8,t):e;case 8:return 0===(e=Bt(3584&~t))&&0===(e=Bt(4186112&~t))&&(e=512),e;case 2:return 0===(t=Bt(805306368&~t))&&(t=268435456),t}throw Error(i(358,e))}function Bt(e){return e&-e}function Wt(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function $t(e,t,n){e.pendingLanes|=t;var r=t-1;e.suspendedLanes&=r,e.pingedLanes&=r,(e=e.eventTimes)[t=31-Vt(t)]=n}var Vt=Math.clz32?Math.clz32:function(e){return 0===e?32:31-(Ht(e)/Ut|0)|0},Ht=Math.log,Ut=Math.LN2,qt=a.unstable_UserBlockingPriority,Kt=a.unstable_runWithPriority,Xt=!0;function Qt(e,t,n,r){Ie||ze();var o=Gt,a=Ie;Ie=!0;try{Le(o,e,t,n,r)}finally{(Ie=a)||Fe()}}function Yt(e,t,n,r){Kt(qt,Gt.bind(null,e,t,n,r))}function Gt(e,t,n,r){var o;if(Xt)if((o=!(4&t))&&0<at.length&&-1<ft.indexOf(e))e=pt(null,e,t,n,r),at.push(e);else{var a=Jt(e,t,n,r);if(null===a)o&&mt(e,r);else{if(o){if(-1<ft.indexOf(e))return e=pt(a,e,t,n,r),void at.push(e);if(function(e,t,n,r,o){switch(t){case"focusin":return it=ht(it,e,t,n,r,o),!0;case"dragenter":return lt=ht(lt,e,t,n,r,o),!0;case"mouseover":return st=ht(st,e,t,n,r,o),!0;case"pointerover":var a=o.pointerId;return ut.set(a,ht(ut.get(a)||null,e,t,n,r,o)),!0;case"gotpointercapture":return a=o.pointerId,ct.set(a,ht(ct.get(a)||null,e,t,n,r,o)),!0}return!1}(a,e,t,n,r))return;mt(e,r)}zr(e,t,r,null,n)}}}function Jt(e,t,n,r){var o=Ae(r);if(null!==(o=to(o))){var a=Qe(o);if(null===a)o=null;else{var i=a.tag;if(13===i){if(null!==(o=Ye(a)))return o;o=null}else if(3===i){if(a.stateNode.hydrate)return 3===a.tag?a.stateNode.containerInfo:null;o=null}else a!==o&&(o=null)}}return zr(e,t,r,o,n),null}var Zt=null,en=null,tn=null;function nn(){if(tn)return tn;var e,t,n=en,r=n.length,o="value"in Zt?Zt.value:Zt.textContent,a=o.length;for(e=0;e<r&&n[e]===o[e];e++);var i=r-e;for(t=1;t<=i&&n[r-t]===o[a-t];t++);return tn=o.slice(e,1<t?1-t:void 0)}function rn(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function on(){return!0}function an(){return!1}function ln(e){function t(t,n,r,o,a){for(var i in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=o,this.target=a,this.currentTarget=null,e)e.hasOwnProperty(i)&&(t=e[i],this[i]=t?t(o):o[i]);return this.isDefaultPrevented=(null!=o.defaultPrevented?o.defaultPrevented:!1===o.returnValue)?on:an,this.isPropagationStopped=an,this}return o(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!=typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=on)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!=typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=on)},persist:function(){},isPersistent:on}),t}var sn,un,cn,dn={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},fn=ln(dn),pn=o({},dn,{view:0,detail:0}),mn=ln(pn),hn=o({},pn,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Rn,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==cn&&(cn&&"mousemove"===e.type?(sn=e.screenX-cn.screenX,un=e.screenY-cn.screenY):un=sn=0,cn=e),sn)},movementY:function(e){return"movementY"in e?e.movementY:un}}),vn=ln(hn),gn=ln(o({},hn,{dataTransfer:0})),yn=ln(o({},pn,{relatedTarget:0})),bn=ln(o({},dn,{animationName:0,elapsedTime:0,pseudoElement:0})),xn=o({},dn,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),wn=ln(xn),En=ln(o({},dn,{data:0})),kn={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Sn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},An={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Cn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=An[e])&&!!t[e]}function Rn(){return Cn}var Pn=o({},pn,{key:function(e){if(e.key){var t=kn[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=rn(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?Sn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Rn,charCode:function(e){return"keypress"===e.type?rn(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?rn(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),Tn=ln(Pn),Nn=ln(o({},hn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),On=ln(o({},pn,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Rn})),Mn=ln(o({},dn,{propertyName:0,elapsedTime:0,pseudoElement:0})),Ln=o({},hn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),zn=ln(Ln),_n=[9,13,27,32],In=d&&"CompositionEvent"in window,Dn=null;d&&"documentMode"in document&&(Dn=document.documentMode);var Fn=d&&"TextEvent"in window&&!Dn,jn=d&&(!In||Dn&&8<Dn&&11>=Dn),Bn=String.fromCharCode(32),Wn=!1;function $n(e,t){switch(e){case"keyup":return-1!==_n.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Vn(e){return"object"==typeof(e=e.detail)&&"data"in e?e.data:null}var Hn=!1,Un={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function qn(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!Un[e.type]:"textarea"===t}function Kn(e,t,n,r){Ne(r),0<(t=Ir(t,"onChange")).length&&(n=new fn("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Xn=null,Qn=null;function Yn(e){Pr(e,0)}function Gn(e){if(G(ro(e)))return e}function Jn(e,t){if("change"===e)return t}var Zn=!1;if(d){var er;if(d){var tr="oninput"in document;if(!tr){var nr=document.createElement("div");nr.setAttribute("oninput","return;"),tr="function"==typeof nr.oninput}er=tr}else er=!1;Zn=er&&(!document.documentMode||9<document.documentMode)}function rr(){Xn&&(Xn.detachEvent("onpropertychange",or),Qn=Xn=null)}function or(e){if("value"===e.propertyName&&Gn(Qn)){var t=[];if(Kn(t,Qn,e,Ae(e)),e=Yn,Ie)e(t);else{Ie=!0;try{Me(e,t)}finally{Ie=!1,Fe()}}}}function ar(e,t,n){"focusin"===e?(rr(),Qn=n,(Xn=t).attachEvent("onpropertychange",or)):"focusout"===e&&rr()}function ir(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Gn(Qn)}function lr(e,t){if("click"===e)return Gn(t)}function sr(e,t){if("input"===e||"change"===e)return Gn(t)}var ur="function"==typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e==1/t)||e!=e&&t!=t},cr=Object.prototype.hasOwnProperty;function dr(e,t){if(ur(e,t))return!0;if("object"!=typeof e||null===e||"object"!=typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++)if(!cr.call(t,n[r])||!ur(e[n[r]],t[n[r]]))return!1;return!0}function fr(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function pr(e,t){var n,r=fr(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=fr(r)}}function mr(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?mr(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function hr(){for(var e=window,t=J();t instanceof e.HTMLIFrameElement;){try{var n="string"==typeof t.contentWindow.location.href}catch(e){n=!1}if(!n)break;t=J((e=t.contentWindow).document)}return t}function vr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}var gr=d&&"documentMode"in document&&11>=document.documentMode,yr=null,br=null,xr=null,wr=!1;function Er(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;wr||null==yr||yr!==J(r)||(r="selectionStart"in(r=yr)&&vr(r)?{start:r.selectionStart,end:r.selectionEnd}:{anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},xr&&dr(xr,r)||(xr=r,0<(r=Ir(br,"onSelect")).length&&(t=new fn("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=yr)))}zt("cancel cancel click click close close contextmenu contextMenu copy copy cut cut auxclick auxClick dblclick doubleClick dragend dragEnd dragstart dragStart drop drop focusin focus focusout blur input input invalid invalid keydown keyDown keypress keyPress keyup keyUp mousedown mouseDown mouseup mouseUp paste paste pause pause play play pointercancel pointerCancel pointerdown pointerDown pointerup pointerUp ratechange rateChange reset reset seeked seeked submit submit touchcancel touchCancel touchend touchEnd touchstart touchStart volumechange volumeChange".split(" "),0),zt("drag drag dragenter dragEnter dragexit dragExit dragleave dragLeave dragover dragOver mousemove mouseMove mouseout mouseOut mouseover mouseOver pointermove pointerMove pointerout pointerOut pointerover pointerOver scroll scroll toggle toggle touchmove touchMove wheel wheel".split(" "),1),zt(Lt,2);for(var kr="change selectionchange textInput compositionstart compositionend compositionupdate".split(" "),Sr=0;Sr<kr.length;Sr++)Mt.set(kr[Sr],0);c("onMouseEnter",["mouseout","mouseover"]),c("onMouseLeave",["mouseout","mouseover"]),c("onPointerEnter",["pointerout","pointerover"]),c("onPointerLeave",["pointerout","pointerover"]),u("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),u("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),u("onBeforeInput",["compositionend","keypress","textInput","paste"]),u("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),u("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Ar="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Cr=new Set("cancel close invalid load scroll toggle".split(" ").concat(Ar));function Rr(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,function(e,t,n,r,o,a,l,s,u){if(Xe.apply(this,arguments),Ve){if(!Ve)throw Error(i(198));var c=He;Ve=!1,He=null,Ue||(Ue=!0,qe=c)}}(r,t,void 0,e),e.currentTarget=null}function Pr(e,t){t=!!(4&t);for(var n=0;n<e.length;n++){var r=e[n],o=r.event;r=r.listeners;e:{var a=void 0;if(t)for(var i=r.length-1;0<=i;i--){var l=r[i],s=l.instance,u=l.currentTarget;if(l=l.listener,s!==a&&o.isPropagationStopped())break e;Rr(o,l,u),a=s}else for(i=0;i<r.length;i++){if(s=(l=r[i]).instance,u=l.currentTarget,l=l.listener,s!==a&&o.isPropagationStopped())break e;Rr(o,l,u),a=s}}}if(Ue)throw e=qe,Ue=!1,qe=null,e}function Tr(e,t){var n=ao(t),r=e+"__bubble";n.has(r)||(Lr(t,e,2,!1),n.add(r))}var Nr="_reactListening"+Math.random().toString(36).slice(2);function Or(e){e[Nr]||(e[Nr]=!0,l.forEach((function(t){Cr.has(t)||Mr(t,!1,e,null),Mr(t,!0,e,null)})))}function Mr(e,t,n,r){var o=4<arguments.length&&void 0!==arguments[4]?arguments[4]:0,a=n;if("selectionchange"===e&&9!==n.nodeType&&(a=n.ownerDocument),null!==r&&!t&&Cr.has(e)){if("scroll"!==e)return;o|=2,a=r}var i=ao(a),l=e+"__"+(t?"capture":"bubble");i.has(l)||(t&&(o|=4),Lr(a,e,o,t),i.add(l))}function Lr(e,t,n,r){var o=Mt.get(t);switch(void 0===o?2:o){case 0:o=Qt;break;case 1:o=Yt;break;default:o=Gt}n=o.bind(null,t,n,e),o=void 0,!Be||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(o=!0),r?void 0!==o?e.addEventListener(t,n,{capture:!0,passive:o}):e.addEventListener(t,n,!0):void 0!==o?e.addEventListener(t,n,{passive:o}):e.addEventListener(t,n,!1)}function zr(e,t,n,r,o){var a=r;if(!(1&t||2&t||null===r))e:for(;;){if(null===r)return;var i=r.tag;if(3===i||4===i){var l=r.stateNode.containerInfo;if(l===o||8===l.nodeType&&l.parentNode===o)break;if(4===i)for(i=r.return;null!==i;){var s=i.tag;if((3===s||4===s)&&((s=i.stateNode.containerInfo)===o||8===s.nodeType&&s.parentNode===o))return;i=i.return}for(;null!==l;){if(null===(i=to(l)))return;if(5===(s=i.tag)||6===s){r=a=i;continue e}l=l.parentNode}}r=r.return}!function(e,t,n){if(De)return e();De=!0;try{return _e(e,t,n)}finally{De=!1,Fe()}}((function(){var r=a,o=Ae(n),i=[];e:{var l=Ot.get(e);if(void 0!==l){var s=fn,u=e;switch(e){case"keypress":if(0===rn(n))break e;case"keydown":case"keyup":s=Tn;break;case"focusin":u="focus",s=yn;break;case"focusout":u="blur",s=yn;break;case"beforeblur":case"afterblur":s=yn;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":s=vn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":s=gn;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":s=On;break;case Rt:case Pt:case Tt:s=bn;break;case Nt:s=Mn;break;case"scroll":s=mn;break;case"wheel":s=zn;break;case"copy":case"cut":case"paste":s=wn;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":s=Nn}var c=!!(4&t),d=!c&&"scroll"===e,f=c?null!==l?l+"Capture":null:l;c=[];for(var p,m=r;null!==m;){var h=(p=m).stateNode;if(5===p.tag&&null!==h&&(p=h,null!==f&&null!=(h=je(m,f))&&c.push(_r(m,h,p))),d)break;m=m.return}0<c.length&&(l=new s(l,u,null,n,o),i.push({event:l,listeners:c}))}}if(!(7&t)){if(s="mouseout"===e||"pointerout"===e,(!(l="mouseover"===e||"pointerover"===e)||16&t||!(u=n.relatedTarget||n.fromElement)||!to(u)&&!u[Zr])&&(s||l)&&(l=o.window===o?o:(l=o.ownerDocument)?l.defaultView||l.parentWindow:window,s?(s=r,null!==(u=(u=n.relatedTarget||n.toElement)?to(u):null)&&(u!==(d=Qe(u))||5!==u.tag&&6!==u.tag)&&(u=null)):(s=null,u=r),s!==u)){if(c=vn,h="onMouseLeave",f="onMouseEnter",m="mouse","pointerout"!==e&&"pointerover"!==e||(c=Nn,h="onPointerLeave",f="onPointerEnter",m="pointer"),d=null==s?l:ro(s),p=null==u?l:ro(u),(l=new c(h,m+"leave",s,n,o)).target=d,l.relatedTarget=p,h=null,to(o)===r&&((c=new c(f,m+"enter",u,n,o)).target=p,c.relatedTarget=d,h=c),d=h,s&&u)e:{for(f=u,m=0,p=c=s;p;p=Dr(p))m++;for(p=0,h=f;h;h=Dr(h))p++;for(;0<m-p;)c=Dr(c),m--;for(;0<p-m;)f=Dr(f),p--;for(;m--;){if(c===f||null!==f&&c===f.alternate)break e;c=Dr(c),f=Dr(f)}c=null}else c=null;null!==s&&Fr(i,l,s,c,!1),null!==u&&null!==d&&Fr(i,d,u,c,!0)}if("select"===(s=(l=r?ro(r):window).nodeName&&l.nodeName.toLowerCase())||"input"===s&&"file"===l.type)var v=Jn;else if(qn(l))if(Zn)v=sr;else{v=ir;var g=ar}else(s=l.nodeName)&&"input"===s.toLowerCase()&&("checkbox"===l.type||"radio"===l.type)&&(v=lr);switch(v&&(v=v(e,r))?Kn(i,v,n,o):(g&&g(e,l,r),"focusout"===e&&(g=l._wrapperState)&&g.controlled&&"number"===l.type&&oe(l,"number",l.value)),g=r?ro(r):window,e){case"focusin":(qn(g)||"true"===g.contentEditable)&&(yr=g,br=r,xr=null);break;case"focusout":xr=br=yr=null;break;case"mousedown":wr=!0;break;case"contextmenu":case"mouseup":case"dragend":wr=!1,Er(i,n,o);break;case"selectionchange":if(gr)break;case"keydown":case"keyup":Er(i,n,o)}var y;if(In)e:{switch(e){case"compositionstart":var b="onCompositionStart";break e;case"compositionend":b="onCompositionEnd";break e;case"compositionupdate":b="onCompositionUpdate";break e}b=void 0}else Hn?$n(e,n)&&(b="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(b="onCompositionStart");b&&(jn&&"ko"!==n.locale&&(Hn||"onCompositionStart"!==b?"onCompositionEnd"===b&&Hn&&(y=nn()):(en="value"in(Zt=o)?Zt.value:Zt.textContent,Hn=!0)),0<(g=Ir(r,b)).length&&(b=new En(b,e,null,n,o),i.push({event:b,listeners:g}),(y||null!==(y=Vn(n)))&&(b.data=y))),(y=Fn?function(e,t){switch(e){case"compositionend":return Vn(t);case"keypress":return 32!==t.which?null:(Wn=!0,Bn);case"textInput":return(e=t.data)===Bn&&Wn?null:e;default:return null}}(e,n):function(e,t){if(Hn)return"compositionend"===e||!In&&$n(e,t)?(e=nn(),tn=en=Zt=null,Hn=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return jn&&"ko"!==t.locale?null:t.data}}(e,n))&&0<(r=Ir(r,"onBeforeInput")).length&&(o=new En("onBeforeInput","beforeinput",null,n,o),i.push({event:o,listeners:r}),o.data=y)}Pr(i,t)}))}function _r(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Ir(e,t){for(var n=t+"Capture",r=[];null!==e;){var o=e,a=o.stateNode;5===o.tag&&null!==a&&(o=a,null!=(a=je(e,n))&&r.unshift(_r(e,a,o)),null!=(a=je(e,t))&&r.push(_r(e,a,o))),e=e.return}return r}function Dr(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag);return e||null}function Fr(e,t,n,r,o){for(var a=t._reactName,i=[];null!==n&&n!==r;){var l=n,s=l.alternate,u=l.stateNode;if(null!==s&&s===r)break;5===l.tag&&null!==u&&(l=u,o?null!=(s=je(n,a))&&i.unshift(_r(n,s,l)):o||null!=(s=je(n,a))&&i.push(_r(n,s,l))),n=n.return}0!==i.length&&e.push({event:t,listeners:i})}function jr(){}var Br=null,Wr=null;function $r(e,t){switch(e){case"button":case"input":case"select":case"textarea":return!!t.autoFocus}return!1}function Vr(e,t){return"textarea"===e||"option"===e||"noscript"===e||"string"==typeof t.children||"number"==typeof t.children||"object"==typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var Hr="function"==typeof setTimeout?setTimeout:void 0,Ur="function"==typeof clearTimeout?clearTimeout:void 0;function qr(e){(1===e.nodeType||9===e.nodeType&&null!=(e=e.body))&&(e.textContent="")}function Kr(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break}return e}function Xr(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}var Qr=0,Yr=Math.random().toString(36).slice(2),Gr="__reactFiber$"+Yr,Jr="__reactProps$"+Yr,Zr="__reactContainer$"+Yr,eo="__reactEvents$"+Yr;function to(e){var t=e[Gr];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Zr]||n[Gr]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=Xr(e);null!==e;){if(n=e[Gr])return n;e=Xr(e)}return t}n=(e=n).parentNode}return null}function no(e){return!(e=e[Gr]||e[Zr])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function ro(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(i(33))}function oo(e){return e[Jr]||null}function ao(e){var t=e[eo];return void 0===t&&(t=e[eo]=new Set),t}var io=[],lo=-1;function so(e){return{current:e}}function uo(e){0>lo||(e.current=io[lo],io[lo]=null,lo--)}function co(e,t){lo++,io[lo]=e.current,e.current=t}var fo={},po=so(fo),mo=so(!1),ho=fo;function vo(e,t){var n=e.type.contextTypes;if(!n)return fo;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var o,a={};for(o in n)a[o]=t[o];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=a),a}function go(e){return null!=e.childContextTypes}function yo(){uo(mo),uo(po)}function bo(e,t,n){if(po.current!==fo)throw Error(i(168));co(po,t),co(mo,n)}function xo(e,t,n){var r=e.stateNode;if(e=t.childContextTypes,"function"!=typeof r.getChildContext)return n;for(var a in r=r.getChildContext())if(!(a in e))throw Error(i(108,K(t)||"Unknown",a));return o({},n,r)}function wo(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||fo,ho=po.current,co(po,e),co(mo,mo.current),!0}function Eo(e,t,n){var r=e.stateNode;if(!r)throw Error(i(169));n?(e=xo(e,t,ho),r.__reactInternalMemoizedMergedChildContext=e,uo(mo),uo(po),co(po,e)):uo(mo),co(mo,n)}var ko=null,So=null,Ao=a.unstable_runWithPriority,Co=a.unstable_scheduleCallback,Ro=a.unstable_cancelCallback,Po=a.unstable_shouldYield,To=a.unstable_requestPaint,No=a.unstable_now,Oo=a.unstable_getCurrentPriorityLevel,Mo=a.unstable_ImmediatePriority,Lo=a.unstable_UserBlockingPriority,zo=a.unstable_NormalPriority,_o=a.unstable_LowPriority,Io=a.unstable_IdlePriority,Do={},Fo=void 0!==To?To:function(){},jo=null,Bo=null,Wo=!1,$o=No(),Vo=1e4>$o?No:function(){return No()-$o};function Ho(){switch(Oo()){case Mo:return 99;case Lo:return 98;case zo:return 97;case _o:return 96;case Io:return 95;default:throw Error(i(332))}}function Uo(e){switch(e){case 99:return Mo;case 98:return Lo;case 97:return zo;case 96:return _o;case 95:return Io;default:throw Error(i(332))}}function qo(e,t){return e=Uo(e),Ao(e,t)}function Ko(e,t,n){return e=Uo(e),Co(e,t,n)}function Xo(){if(null!==Bo){var e=Bo;Bo=null,Ro(e)}Qo()}function Qo(){if(!Wo&&null!==jo){Wo=!0;var e=0;try{var t=jo;qo(99,(function(){for(;e<t.length;e++){var n=t[e];do{n=n(!0)}while(null!==n)}})),jo=null}catch(t){throw null!==jo&&(jo=jo.slice(e+1)),Co(Mo,Xo),t}finally{Wo=!1}}}var Yo=w.ReactCurrentBatchConfig;function Go(e,t){if(e&&e.defaultProps){for(var n in t=o({},t),e=e.defaultProps)void 0===t[n]&&(t[n]=e[n]);return t}return t}var Jo=so(null),Zo=null,ea=null,ta=null;function na(){ta=ea=Zo=null}function ra(e){var t=Jo.current;uo(Jo),e.type._context._currentValue=t}function oa(e,t){for(;null!==e;){var n=e.alternate;if((e.childLanes&t)===t){if(null===n||(n.childLanes&t)===t)break;n.childLanes|=t}else e.childLanes|=t,null!==n&&(n.childLanes|=t);e=e.return}}function aa(e,t){Zo=e,ta=ea=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(!!(e.lanes&t)&&(Ii=!0),e.firstContext=null)}function ia(e,t){if(ta!==e&&!1!==t&&0!==t)if("number"==typeof t&&1073741823!==t||(ta=e,t=1073741823),t={context:e,observedBits:t,next:null},null===ea){if(null===Zo)throw Error(i(308));ea=t,Zo.dependencies={lanes:0,firstContext:t,responders:null}}else ea=ea.next=t;return e._currentValue}var la=!1;function sa(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null},effects:null}}function ua(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function ca(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function da(e,t){if(null!==(e=e.updateQueue)){var n=(e=e.shared).pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}}function fa(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var o=null,a=null;if(null!==(n=n.firstBaseUpdate)){do{var i={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};null===a?o=a=i:a=a.next=i,n=n.next}while(null!==n);null===a?o=a=t:a=a.next=t}else o=a=t;return n={baseState:r.baseState,firstBaseUpdate:o,lastBaseUpdate:a,shared:r.shared,effects:r.effects},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function pa(e,t,n,r){var a=e.updateQueue;la=!1;var i=a.firstBaseUpdate,l=a.lastBaseUpdate,s=a.shared.pending;if(null!==s){a.shared.pending=null;var u=s,c=u.next;u.next=null,null===l?i=c:l.next=c,l=u;var d=e.alternate;if(null!==d){var f=(d=d.updateQueue).lastBaseUpdate;f!==l&&(null===f?d.firstBaseUpdate=c:f.next=c,d.lastBaseUpdate=u)}}if(null!==i){for(f=a.baseState,l=0,d=c=u=null;;){s=i.lane;var p=i.eventTime;if((r&s)===s){null!==d&&(d=d.next={eventTime:p,lane:0,tag:i.tag,payload:i.payload,callback:i.callback,next:null});e:{var m=e,h=i;switch(s=t,p=n,h.tag){case 1:if("function"==typeof(m=h.payload)){f=m.call(p,f,s);break e}f=m;break e;case 3:m.flags=-4097&m.flags|64;case 0:if(null==(s="function"==typeof(m=h.payload)?m.call(p,f,s):m))break e;f=o({},f,s);break e;case 2:la=!0}}null!==i.callback&&(e.flags|=32,null===(s=a.effects)?a.effects=[i]:s.push(i))}else p={eventTime:p,lane:s,tag:i.tag,payload:i.payload,callback:i.callback,next:null},null===d?(c=d=p,u=f):d=d.next=p,l|=s;if(null===(i=i.next)){if(null===(s=a.shared.pending))break;i=s.next,s.next=null,a.lastBaseUpdate=s,a.shared.pending=null}}null===d&&(u=f),a.baseState=u,a.firstBaseUpdate=c,a.lastBaseUpdate=d,jl|=l,e.lanes=l,e.memoizedState=f}}function ma(e,t,n){if(e=t.effects,t.effects=null,null!==e)for(t=0;t<e.length;t++){var r=e[t],o=r.callback;if(null!==o){if(r.callback=null,r=n,"function"!=typeof o)throw Error(i(191,o));o.call(r)}}}var ha=(new r.Component).refs;function va(e,t,n,r){n=null==(n=n(r,t=e.memoizedState))?t:o({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var ga={isMounted:function(e){return!!(e=e._reactInternals)&&Qe(e)===e},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=cs(),o=ds(e),a=ca(r,o);a.payload=t,null!=n&&(a.callback=n),da(e,a),fs(e,o,r)},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=cs(),o=ds(e),a=ca(r,o);a.tag=1,a.payload=t,null!=n&&(a.callback=n),da(e,a),fs(e,o,r)},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=cs(),r=ds(e),o=ca(n,r);o.tag=2,null!=t&&(o.callback=t),da(e,o),fs(e,r,n)}};function ya(e,t,n,r,o,a,i){return"function"==typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,a,i):!(t.prototype&&t.prototype.isPureReactComponent&&dr(n,r)&&dr(o,a))}function ba(e,t,n){var r=!1,o=fo,a=t.contextType;return"object"==typeof a&&null!==a?a=ia(a):(o=go(t)?ho:po.current,a=(r=null!=(r=t.contextTypes))?vo(e,o):fo),t=new t(n,a),e.memoizedState=null!==t.state&&void 0!==t.state?t.state:null,t.updater=ga,e.stateNode=t,t._reactInternals=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=o,e.__reactInternalMemoizedMaskedChildContext=a),t}function xa(e,t,n,r){e=t.state,"function"==typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"==typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&ga.enqueueReplaceState(t,t.state,null)}function wa(e,t,n,r){var o=e.stateNode;o.props=n,o.state=e.memoizedState,o.refs=ha,sa(e);var a=t.contextType;"object"==typeof a&&null!==a?o.context=ia(a):(a=go(t)?ho:po.current,o.context=vo(e,a)),pa(e,n,o,r),o.state=e.memoizedState,"function"==typeof(a=t.getDerivedStateFromProps)&&(va(e,t,a,n),o.state=e.memoizedState),"function"==typeof t.getDerivedStateFromProps||"function"==typeof o.getSnapshotBeforeUpdate||"function"!=typeof o.UNSAFE_componentWillMount&&"function"!=typeof o.componentWillMount||(t=o.state,"function"==typeof o.componentWillMount&&o.componentWillMount(),"function"==typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount(),t!==o.state&&ga.enqueueReplaceState(o,o.state,null),pa(e,n,o,r),o.state=e.memoizedState),"function"==typeof o.componentDidMount&&(e.flags|=4)}var Ea=Array.isArray;function ka(e,t,n){if(null!==(e=n.ref)&&"function"!=typeof e&&"object"!=typeof e){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(i(309));var r=n.stateNode}if(!r)throw Error(i(147,e));var o=""+e;return null!==t&&null!==t.ref&&"function"==typeof t.ref&&t.ref._stringRef===o?t.ref:(t=function(e){var t=r.refs;t===ha&&(t=r.refs={}),null===e?delete t[o]:t[o]=e},t._stringRef=o,t)}if("string"!=typeof e)throw Error(i(284));if(!n._owner)throw Error(i(290,e))}return e}function Sa(e,t){if("textarea"!==e.type)throw Error(i(31,"[object Object]"===Object.prototype.toString.call(t)?"object with keys {"+Object.keys(t).join(", ")+"}":t))}function Aa(e){function t(t,n){if(e){var r=t.lastEffect;null!==r?(r.nextEffect=n,t.lastEffect=n):t.firstEffect=t.lastEffect=n,n.nextEffect=null,n.flags=8}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e,t){for(e=new Map;null!==t;)null!==t.key?e.set(t.key,t):e.set(t.index,t),t=t.sibling;return e}function o(e,t){return(e=Hs(e,t)).index=0,e.sibling=null,e}function a(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags=2,n):r:(t.flags=2,n):n}function l(t){return e&&null===t.alternate&&(t.flags=2),t}function s(e,t,n,r){return null===t||6!==t.tag?((t=Xs(n,e.mode,r)).return=e,t):((t=o(t,n)).return=e,t)}function u(e,t,n,r){return null!==t&&t.elementType===n.type?((r=o(t,n.props)).ref=ka(e,t,n),r.return=e,r):((r=Us(n.type,n.key,n.props,null,e.mode,r)).ref=ka(e,t,n),r.return=e,r)}function c(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Qs(n,e.mode,r)).return=e,t):((t=o(t,n.children||[])).return=e,t)}function d(e,t,n,r,a){return null===t||7!==t.tag?((t=qs(n,e.mode,r,a)).return=e,t):((t=o(t,n)).return=e,t)}function f(e,t,n){if("string"==typeof t||"number"==typeof t)return(t=Xs(""+t,e.mode,n)).return=e,t;if("object"==typeof t&&null!==t){switch(t.$$typeof){case E:return(n=Us(t.type,t.key,t.props,null,e.mode,n)).ref=ka(e,null,t),n.return=e,n;case k:return(t=Qs(t,e.mode,n)).return=e,t}if(Ea(t)||$(t))return(t=qs(t,e.mode,n,null)).return=e,t;Sa(e,t)}return null}function p(e,t,n,r){var o=null!==t?t.key:null;if("string"==typeof n||"number"==typeof n)return null!==o?null:s(e,t,""+n,r);if("object"==typeof n&&null!==n){switch(n.$$typeof){case E:return n.key===o?n.type===S?d(e,t,n.props.children,r,o):u(e,t,n,r):null;case k:return n.key===o?c(e,t,n,r):null}if(Ea(n)||$(n))return null!==o?null:d(e,t,n,r,null);Sa(e,n)}return null}function m(e,t,n,r,o){if("string"==typeof r||"number"==typeof r)return s(t,e=e.get(n)||null,""+r,o);if("object"==typeof r&&null!==r){switch(r.$$typeof){case E:return e=e.get(null===r.key?n:r.key)||null,r.type===S?d(t,e,r.props.children,o,r.key):u(t,e,r,o);case k:return c(t,e=e.get(null===r.key?n:r.key)||null,r,o)}if(Ea(r)||$(r))return d(t,e=e.get(n)||null,r,o,null);Sa(t,r)}return null}function h(o,i,l,s){for(var u=null,c=null,d=i,h=i=0,v=null;null!==d&&h<l.length;h++){d.index>h?(v=d,d=null):v=d.sibling;var g=p(o,d,l[h],s);if(null===g){null===d&&(d=v);break}e&&d&&null===g.alternate&&t(o,d),i=a(g,i,h),null===c?u=g:c.sibling=g,c=g,d=v}if(h===l.length)return n(o,d),u;if(null===d){for(;h<l.length;h++)null!==(d=f(o,l[h],s))&&(i=a(d,i,h),null===c?u=d:c.sibling=d,c=d);return u}for(d=r(o,d);h<l.length;h++)null!==(v=m(d,o,h,l[h],s))&&(e&&null!==v.alternate&&d.delete(null===v.key?h:v.key),i=a(v,i,h),null===c?u=v:c.sibling=v,c=v);return e&&d.forEach((function(e){return t(o,e)})),u}function v(o,l,s,u){var c=$(s);if("function"!=typeof c)throw Error(i(150));if(null==(s=c.call(s)))throw Error(i(151));for(var d=c=null,h=l,v=l=0,g=null,y=s.next();null!==h&&!y.done;v++,y=s.next()){h.index>v?(g=h,h=null):g=h.sibling;var b=p(o,h,y.value,u);if(null===b){null===h&&(h=g);break}e&&h&&null===b.alternate&&t(o,h),l=a(b,l,v),null===d?c=b:d.sibling=b,d=b,h=g}if(y.done)return n(o,h),c;if(null===h){for(;!y.done;v++,y=s.next())null!==(y=f(o,y.value,u))&&(l=a(y,l,v),null===d?c=y:d.sibling=y,d=y);return c}for(h=r(o,h);!y.done;v++,y=s.next())null!==(y=m(h,o,v,y.value,u))&&(e&&null!==y.alternate&&h.delete(null===y.key?v:y.key),l=a(y,l,v),null===d?c=y:d.sibling=y,d=y);return e&&h.forEach((function(e){return t(o,e)})),c}return function(e,r,a,s){var u="object"==typeof a&&null!==a&&a.type===S&&null===a.key;u&&(a=a.props.children);var c="object"==typeof a&&null!==a;if(c)switch(a.$$typeof){case E:e:{for(c=a.key,u=r;null!==u;){if(u.key===c){if(7===u.tag){if(a.type===S){n(e,u.sibling),(r=o(u,a.props.children)).return=e,e=r;break e}}else if(u.elementType===a.type){n(e,u.sibling),(r=o(u,a.props)).ref=ka(e,u,a),r.return=e,e=r;break e}n(e,u);break}t(e,u),u=u.sibling}a.type===S?((r=qs(a.props.children,e.mode,s,a.key)).return=e,e=r):((s=Us(a.type,a.key,a.props,null,e.mode,s)).ref=ka(e,r,a),s.return=e,e=s)}return l(e);case k:e:{for(u=a.key;null!==r;){if(r.key===u){if(4===r.tag&&r.stateNode.containerInfo===a.containerInfo&&r.stateNode.implementation===a.implementation){n(e,r.sibling),(r=o(r,a.children||[])).return=e,e=r;break e}n(e,r);break}t(e,r),r=r.sibling}(r=Qs(a,e.mode,s)).return=e,e=r}return l(e)}if("string"==typeof a||"number"==typeof a)return a=""+a,null!==r&&6===r.tag?(n(e,r.sibling),(r=o(r,a)).return=e,e=r):(n(e,r),(r=Xs(a,e.mode,s)).return=e,e=r),l(e);if(Ea(a))return h(e,r,a,s);if($(a))return v(e,r,a,s);if(c&&Sa(e,a),void 0===a&&!u)switch(e.tag){case 1:case 22:case 0:case 11:case 15:throw Error(i(152,K(e.type)||"Component"))}return n(e,r)}}var Ca=Aa(!0),Ra=Aa(!1),Pa={},Ta=so(Pa),Na=so(Pa),Oa=so(Pa);function Ma(e){if(e===Pa)throw Error(i(174));return e}function La(e,t){switch(co(Oa,t),co(Na,e),co(Ta,Pa),e=t.nodeType){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:pe(null,"");break;default:t=pe(t=(e=8===e?t.parentNode:t).namespaceURI||null,e=e.tagName)}uo(Ta),co(Ta,t)}function za(){uo(Ta),uo(Na),uo(Oa)}function _a(e){Ma(Oa.current);var t=Ma(Ta.current),n=pe(t,e.type);t!==n&&(co(Na,e),co(Ta,n))}function Ia(e){Na.current===e&&(uo(Ta),uo(Na))}var Da=so(0);function Fa(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(64&t.flags)return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var ja=null,Ba=null,Wa=!1;function $a(e,t){var n=$s(5,null,null,0);n.elementType="DELETED",n.type="DELETED",n.stateNode=t,n.return=e,n.flags=8,null!==e.lastEffect?(e.lastEffect.nextEffect=n,e.lastEffect=n):e.firstEffect=e.lastEffect=n}function Va(e,t){switch(e.tag){case 5:var n=e.type;return null!==(t=1!==t.nodeType||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t)&&(e.stateNode=t,!0);case 6:return null!==(t=""===e.pendingProps||3!==t.nodeType?null:t)&&(e.stateNode=t,!0);default:return!1}}function Ha(e){if(Wa){var t=Ba;if(t){var n=t;if(!Va(e,t)){if(!(t=Kr(n.nextSibling))||!Va(e,t))return e.flags=-1025&e.flags|2,Wa=!1,void(ja=e);$a(ja,n)}ja=e,Ba=Kr(t.firstChild)}else e.flags=-1025&e.flags|2,Wa=!1,ja=e}}function Ua(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;ja=e}function qa(e){if(e!==ja)return!1;if(!Wa)return Ua(e),Wa=!0,!1;var t=e.type;if(5!==e.tag||"head"!==t&&"body"!==t&&!Vr(t,e.memoizedProps))for(t=Ba;t;)$a(e,t),t=Kr(t.nextSibling);if(Ua(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(i(317));e:{for(e=e.nextSibling,t=0;e;){if(8===e.nodeType){var n=e.data;if("/$"===n){if(0===t){Ba=Kr(e.nextSibling);break e}t--}else"$"!==n&&"$!"!==n&&"$?"!==n||t++}e=e.nextSibling}Ba=null}}else Ba=ja?Kr(e.stateNode.nextSibling):null;return!0}function Ka(){Ba=ja=null,Wa=!1}var Xa=[];function Qa(){for(var e=0;e<Xa.length;e++)Xa[e]._workInProgressVersionPrimary=null;Xa.length=0}var Ya=w.ReactCurrentDispatcher,Ga=w.ReactCurrentBatchConfig,Ja=0,Za=null,ei=null,ti=null,ni=!1,ri=!1;function oi(){throw Error(i(321))}function ai(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!ur(e[n],t[n]))return!1;return!0}function ii(e,t,n,r,o,a){if(Ja=a,Za=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,Ya.current=null===e||null===e.memoizedState?Mi:Li,e=n(r,o),ri){a=0;do{if(ri=!1,!(25>a))throw Error(i(301));a+=1,ti=ei=null,t.updateQueue=null,Ya.current=zi,e=n(r,o)}while(ri)}if(Ya.current=Oi,t=null!==ei&&null!==ei.next,Ja=0,ti=ei=Za=null,ni=!1,t)throw Error(i(300));return e}function li(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===ti?Za.memoizedState=ti=e:ti=ti.next=e,ti}function si(){if(null===ei){var e=Za.alternate;e=null!==e?e.memoizedState:null}else e=ei.next;var t=null===ti?Za.memoizedState:ti.next;if(null!==t)ti=t,ei=e;else{if(null===e)throw Error(i(310));e={memoizedState:(ei=e).memoizedState,baseState:ei.baseState,baseQueue:ei.baseQueue,queue:ei.queue,next:null},null===ti?Za.memoizedState=ti=e:ti=ti.next=e}return ti}function ui(e,t){return"function"==typeof t?t(e):t}function ci(e){var t=si(),n=t.queue;if(null===n)throw Error(i(311));n.lastRenderedReducer=e;var r=ei,o=r.baseQueue,a=n.pending;if(null!==a){if(null!==o){var l=o.next;o.next=a.next,a.next=l}r.baseQueue=o=a,n.pending=null}if(null!==o){o=o.next,r=r.baseState;var s=l=a=null,u=o;do{var c=u.lane;if((Ja&c)===c)null!==s&&(s=s.next={lane:0,action:u.action,eagerReducer:u.eagerReducer,eagerState:u.eagerState,next:null}),r=u.eagerReducer===e?u.eagerState:e(r,u.action);else{var d={lane:c,action:u.action,eagerReducer:u.eagerReducer,eagerState:u.eagerState,next:null};null===s?(l=s=d,a=r):s=s.next=d,Za.lanes|=c,jl|=c}u=u.next}while(null!==u&&u!==o);null===s?a=r:s.next=l,ur(r,t.memoizedState)||(Ii=!0),t.memoizedState=r,t.baseState=a,t.baseQueue=s,n.lastRenderedState=r}return[t.memoizedState,n.dispatch]}function di(e){var t=si(),n=t.queue;if(null===n)throw Error(i(311));n.lastRenderedReducer=e;var r=n.dispatch,o=n.pending,a=t.memoizedState;if(null!==o){n.pending=null;var l=o=o.next;do{a=e(a,l.action),l=l.next}while(l!==o);ur(a,t.memoizedState)||(Ii=!0),t.memoizedState=a,null===t.baseQueue&&(t.baseState=a),n.lastRenderedState=a}return[a,r]}function fi(e,t,n){var r=t._getVersion;r=r(t._source);var o=t._workInProgressVersionPrimary;if(null!==o?e=o===r:(e=e.mutableReadLanes,(e=(Ja&e)===e)&&(t._workInProgressVersionPrimary=r,Xa.push(t))),e)return n(t._source);throw Xa.push(t),Error(i(350))}function pi(e,t,n,r){var o=Ol;if(null===o)throw Error(i(349));var a=t._getVersion,l=a(t._source),s=Ya.current,u=s.useState((function(){return fi(o,t,n)})),c=u[1],d=u[0];u=ti;var f=e.memoizedState,p=f.refs,m=p.getSnapshot,h=f.source;f=f.subscribe;var v=Za;return e.memoizedState={refs:p,source:t,subscribe:r},s.useEffect((function(){p.getSnapshot=n,p.setSnapshot=c;var e=a(t._source);if(!ur(l,e)){e=n(t._source),ur(d,e)||(c(e),e=ds(v),o.mutableReadLanes|=e&o.pendingLanes),e=o.mutableReadLanes,o.entangledLanes|=e;for(var r=o.entanglements,i=e;0<i;){var s=31-Vt(i),u=1<<s;r[s]|=e,i&=~u}}}),[n,t,r]),s.useEffect((function(){return r(t._source,(function(){var e=p.getSnapshot,n=p.setSnapshot;try{n(e(t._source));var r=ds(v);o.mutableReadLanes|=r&o.pendingLanes}catch(e){n((function(){throw e}))}}))}),[t,r]),ur(m,n)&&ur(h,t)&&ur(f,r)||((e={pending:null,dispatch:null,lastRenderedReducer:ui,lastRenderedState:d}).dispatch=c=Ni.bind(null,Za,e),u.queue=e,u.baseQueue=null,d=fi(o,t,n),u.memoizedState=u.baseState=d),d}function mi(e,t,n){return pi(si(),e,t,n)}function hi(e){var t=li();return"function"==typeof e&&(e=e()),t.memoizedState=t.baseState=e,e=(e=t.queue={pending:null,dispatch:null,lastRenderedReducer:ui,lastRenderedState:e}).dispatch=Ni.bind(null,Za,e),[t.memoizedState,e]}function vi(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},null===(t=Za.updateQueue)?(t={lastEffect:null},Za.updateQueue=t,t.lastEffect=e.next=e):null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function gi(e){return e={current:e},li().memoizedState=e}function yi(){return si().memoizedState}function bi(e,t,n,r){var o=li();Za.flags|=e,o.memoizedState=vi(1|t,n,void 0,void 0===r?null:r)}function xi(e,t,n,r){var o=si();r=void 0===r?null:r;var a=void 0;if(null!==ei){var i=ei.memoizedState;if(a=i.destroy,null!==r&&ai(r,i.deps))return void vi(t,n,a,r)}Za.flags|=e,o.memoizedState=vi(1|t,n,a,r)}function wi(e,t){return bi(516,4,e,t)}function Ei(e,t){return xi(516,4,e,t)}function ki(e,t){return xi(4,2,e,t)}function Si(e,t){return"function"==typeof t?(e=e(),t(e),function(){t(null)}):null!=t?(e=e(),t.current=e,function(){t.current=null}):void 0}function Ai(e,t,n){return n=null!=n?n.concat([e]):null,xi(4,2,Si.bind(null,t,e),n)}function Ci(){}function Ri(e,t){var n=si();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&ai(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Pi(e,t){var n=si();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&ai(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Ti(e,t){var n=Ho();qo(98>n?98:n,(function(){e(!0)})),qo(97<n?97:n,(function(){var n=Ga.transition;Ga.transition=1;try{e(!1),t()}finally{Ga.transition=n}}))}function Ni(e,t,n){var r=cs(),o=ds(e),a={lane:o,action:n,eagerReducer:null,eagerState:null,next:null},i=t.pending;if(null===i?a.next=a:(a.next=i.next,i.next=a),t.pending=a,i=e.alternate,e===Za||null!==i&&i===Za)ri=ni=!0;else{if(0===e.lanes&&(null===i||0===i.lanes)&&null!==(i=t.lastRenderedReducer))try{var l=t.lastRenderedState,s=i(l,n);if(a.eagerReducer=i,a.eagerState=s,ur(s,l))return}catch(e){}fs(e,o,r)}}var Oi={readContext:ia,useCallback:oi,useContext:oi,useEffect:oi,useImperativeHandle:oi,useLayoutEffect:oi,useMemo:oi,useReducer:oi,useRef:oi,useState:oi,useDebugValue:oi,useDeferredValue:oi,useTransition:oi,useMutableSource:oi,useOpaqueIdentifier:oi,unstable_isNewReconciler:!1},Mi={readContext:ia,useCallback:function(e,t){return li().memoizedState=[e,void 0===t?null:t],e},useContext:ia,useEffect:wi,useImperativeHandle:function(e,t,n){return n=null!=n?n.concat([e]):null,bi(4,2,Si.bind(null,t,e),n)},useLayoutEffect:function(e,t){return bi(4,2,e,t)},useMemo:function(e,t){var n=li();return t=void 0===t?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=li();return t=void 0!==n?n(t):t,r.memoizedState=r.baseState=t,e=(e=r.queue={pending:null,dispatch:null,lastRenderedReducer:e,lastRenderedState:t}).dispatch=Ni.bind(null,Za,e),[r.memoizedState,e]},useRef:gi,useState:hi,useDebugValue:Ci,useDeferredValue:function(e){var t=hi(e),n=t[0],r=t[1];return wi((function(){var t=Ga.transition;Ga.transition=1;try{r(e)}finally{Ga.transition=t}}),[e]),n},useTransition:function(){var e=hi(!1),t=e[0];return gi(e=Ti.bind(null,e[1])),[e,t]},useMutableSource:function(e,t,n){var r=li();return r.memoizedState={refs:{getSnapshot:t,setSnapshot:null},source:e,subscribe:n},pi(r,e,t,n)},useOpaqueIdentifier:function(){if(Wa){var e=!1,t=function(e){return{$$typeof:_,toString:e,valueOf:e}}((function(){throw e||(e=!0,n("r:"+(Qr++).toString(36))),Error(i(355))})),n=hi(t)[1];return!(2&Za.mode)&&(Za.flags|=516,vi(5,(function(){n("r:"+(Qr++).toString(36))}),void 0,null)),t}return hi(t="r:"+(Qr++).toString(36)),t},unstable_isNewReconciler:!1},Li={readContext:ia,useCallback:Ri,useContext:ia,useEffect:Ei,useImperativeHandle:Ai,useLayoutEffect:ki,useMemo:Pi,useReducer:ci,useRef:yi,useState:function(){return ci(ui)},useDebugValue:Ci,useDeferredValue:function(e){var t=ci(ui),n=t[0],r=t[1];return Ei((function(){var t=Ga.transition;Ga.transition=1;try{r(e)}finally{Ga.transition=t}}),[e]),n},useTransition:function(){var e=ci(ui)[0];return[yi().current,e]},useMutableSource:mi,useOpaqueIdentifier:function(){return ci(ui)[0]},unstable_isNewReconciler:!1},zi={readContext:ia,useCallback:Ri,useContext:ia,useEffect:Ei,useImperativeHandle:Ai,useLayoutEffect:ki,useMemo:Pi,useReducer:di,useRef:yi,useState:function(){return di(ui)},useDebugValue:Ci,useDeferredValue:function(e){var t=di(ui),n=t[0],r=t[1];return Ei((function(){var t=Ga.transition;Ga.transition=1;try{r(e)}finally{Ga.transition=t}}),[e]),n},useTransition:function(){var e=di(ui)[0];return[yi().current,e]},useMutableSource:mi,useOpaqueIdentifier:function(){return di(ui)[0]},unstable_isNewReconciler:!1},_i=w.ReactCurrentOwner,Ii=!1;function Di(e,t,n,r){t.child=null===e?Ra(t,null,n,r):Ca(t,e.child,n,r)}function Fi(e,t,n,r,o){n=n.render;var a=t.ref;return aa(t,o),r=ii(e,t,n,r,a,o),null===e||Ii?(t.flags|=1,Di(e,t,r,o),t.child):(t.updateQueue=e.updateQueue,t.flags&=-517,e.lanes&=~o,rl(e,t,o))}function ji(e,t,n,r,o,a){if(null===e){var i=n.type;return"function"!=typeof i||Vs(i)||void 0!==i.defaultProps||null!==n.compare||void 0!==n.defaultProps?((e=Us(n.type,null,r,t,t.mode,a)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=i,Bi(e,t,i,r,o,a))}return i=e.child,o&a||(o=i.memoizedProps,!(n=null!==(n=n.compare)?n:dr)(o,r)||e.ref!==t.ref)?(t.flags|=1,(e=Hs(i,r)).ref=t.ref,e.return=t,t.child=e):rl(e,t,a)}function Bi(e,t,n,r,o,a){if(null!==e&&dr(e.memoizedProps,r)&&e.ref===t.ref){if(Ii=!1,!(a&o))return t.lanes=e.lanes,rl(e,t,a);16384&e.flags&&(Ii=!0)}return Vi(e,t,n,r,a)}function Wi(e,t,n){var r=t.pendingProps,o=r.children,a=null!==e?e.memoizedState:null;if("hidden"===r.mode||"unstable-defer-without-hiding"===r.mode)if(4&t.mode){if(!(1073741824&n))return e=null!==a?a.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e},xs(0,e),null;t.memoizedState={baseLanes:0},xs(0,null!==a?a.baseLanes:n)}else t.memoizedState={baseLanes:0},xs(0,n);else null!==a?(r=a.baseLanes|n,t.memoizedState=null):r=n,xs(0,r);return Di(e,t,o,n),t.child}function $i(e,t){var n=t.ref;(null===e&&null!==n||null!==e&&e.ref!==n)&&(t.flags|=128)}function Vi(e,t,n,r,o){var a=go(n)?ho:po.current;return a=vo(t,a),aa(t,o),n=ii(e,t,n,r,a,o),null===e||Ii?(t.flags|=1,Di(e,t,n,o),t.child):(t.updateQueue=e.updateQueue,t.flags&=-517,e.lanes&=~o,rl(e,t,o))}function Hi(e,t,n,r,o){if(go(n)){var a=!0;wo(t)}else a=!1;if(aa(t,o),null===t.stateNode)null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2),ba(t,n,r),wa(t,n,r,o),r=!0;else if(null===e){var i=t.stateNode,l=t.memoizedProps;i.props=l;var s=i.context,u=n.contextType;u="object"==typeof u&&null!==u?ia(u):vo(t,u=go(n)?ho:po.current);var c=n.getDerivedStateFromProps,d="function"==typeof c||"function"==typeof i.getSnapshotBeforeUpdate;d||"function"!=typeof i.UNSAFE_componentWillReceiveProps&&"function"!=typeof i.componentWillReceiveProps||(l!==r||s!==u)&&xa(t,i,r,u),la=!1;var f=t.memoizedState;i.state=f,pa(t,r,i,o),s=t.memoizedState,l!==r||f!==s||mo.current||la?("function"==typeof c&&(va(t,n,c,r),s=t.memoizedState),(l=la||ya(t,n,l,r,f,s,u))?(d||"function"!=typeof i.UNSAFE_componentWillMount&&"function"!=typeof i.componentWillMount||("function"==typeof i.componentWillMount&&i.componentWillMount(),"function"==typeof i.UNSAFE_componentWillMount&&i.UNSAFE_componentWillMount()),"function"==typeof i.componentDidMount&&(t.flags|=4)):("function"==typeof i.componentDidMount&&(t.flags|=4),t.memoizedProps=r,t.memoizedState=s),i.props=r,i.state=s,i.context=u,r=l):("function"==typeof i.componentDidMount&&(t.flags|=4),r=!1)}else{i=t.stateNode,ua(e,t),l=t.memoizedProps,u=t.type===t.elementType?l:Go(t.type,l),i.props=u,d=t.pendingProps,f=i.context,s="object"==typeof(s=n.contextType)&&null!==s?ia(s):vo(t,s=go(n)?ho:po.current);var p=n.getDerivedStateFromProps;(c="function"==typeof p||"function"==typeof i.getSnapshotBeforeUpdate)||"function"!=typeof i.UNSAFE_componentWillReceiveProps&&"function"!=typeof i.componentWillReceiveProps||(l!==d||f!==s)&&xa(t,i,r,s),la=!1,f=t.memoizedState,i.state=f,pa(t,r,i,o);var m=t.memoizedState;l!==d||f!==m||mo.current||la?("function"==typeof p&&(va(t,n,p,r),m=t.memoizedState),(u=la||ya(t,n,u,r,f,m,s))?(c||"function"!=typeof i.UNSAFE_componentWillUpdate&&"function"!=typeof i.componentWillUpdate||("function"==typeof i.componentWillUpdate&&i.componentWillUpdate(r,m,s),"function"==typeof i.UNSAFE_componentWillUpdate&&i.UNSAFE_componentWillUpdate(r,m,s)),"function"==typeof i.componentDidUpdate&&(t.flags|=4),"function"==typeof i.getSnapshotBeforeUpdate&&(t.flags|=256)):("function"!=typeof i.componentDidUpdate||l===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!=typeof i.getSnapshotBeforeUpdate||l===e.memoizedProps&&f===e.memoizedState||(t.flags|=256),t.memoizedProps=r,t.memoizedState=m),i.props=r,i.state=m,i.context=s,r=u):("function"!=typeof i.componentDidUpdate||l===e.memoizedProps&&f===e.memoizedState||(t.flags|=4),"function"!=typeof i.getSnapshotBeforeUpdate||l===e.memoizedProps&&f===e.memoizedState||(t.flags|=256),r=!1)}return Ui(e,t,n,r,a,o)}function Ui(e,t,n,r,o,a){$i(e,t);var i=!!(64&t.flags);if(!r&&!i)return o&&Eo(t,n,!1),rl(e,t,a);r=t.stateNode,_i.current=t;var l=i&&"function"!=typeof n.getDerivedStateFromError?null:r.render();return t.flags|=1,null!==e&&i?(t.child=Ca(t,e.child,null,a),t.child=Ca(t,null,l,a)):Di(e,t,l,a),t.memoizedState=r.state,o&&Eo(t,n,!0),t.child}function qi(e){var t=e.stateNode;t.pendingContext?bo(0,t.pendingContext,t.pendingContext!==t.context):t.context&&bo(0,t.context,!1),La(e,t.containerInfo)}var Ki,Xi,Qi,Yi,Gi={dehydrated:null,retryLane:0};function Ji(e,t,n){var r,o=t.pendingProps,a=Da.current,i=!1;return(r=!!(64&t.flags))||(r=(null===e||null!==e.memoizedState)&&!!(2&a)),r?(i=!0,t.flags&=-65):null!==e&&null===e.memoizedState||void 0===o.fallback||!0===o.unstable_avoidThisFallback||(a|=1),co(Da,1&a),null===e?(void 0!==o.fallback&&Ha(t),e=o.children,a=o.fallback,i?(e=Zi(t,e,a,n),t.child.memoizedState={baseLanes:n},t.memoizedState=Gi,e):"number"==typeof o.unstable_expectedLoadTime?(e=Zi(t,e,a,n),t.child.memoizedState={baseLanes:n},t.memoizedState=Gi,t.lanes=33554432,e):((n=Ks({mode:"visible",children:e},t.mode,n,null)).return=t,t.child=n)):(e.memoizedState,i?(o=function(e,t,n,r,o){var a=t.mode,i=e.child;e=i.sibling;var l={mode:"hidden",children:n};return 2&a||t.child===i?n=Hs(i,l):((n=t.child).childLanes=0,n.pendingProps=l,null!==(i=n.lastEffect)?(t.firstEffect=n.firstEffect,t.lastEffect=i,i.nextEffect=null):t.firstEffect=t.lastEffect=null),null!==e?r=Hs(e,r):(r=qs(r,a,o,null)).flags|=2,r.return=t,n.return=t,n.sibling=r,t.child=n,r}(e,t,o.children,o.fallback,n),i=t.child,a=e.child.memoizedState,i.memoizedState=null===a?{baseLanes:n}:{baseLanes:a.baseLanes|n},i.childLanes=e.childLanes&~n,t.memoizedState=Gi,o):(n=function(e,t,n,r){var o=e.child;return e=o.sibling,n=Hs(o,{mode:"visible",children:n}),!(2&t.mode)&&(n.lanes=r),n.return=t,n.sibling=null,null!==e&&(e.nextEffect=null,e.flags=8,t.firstEffect=t.lastEffect=e),t.child=n}(e,t,o.children,n),t.memoizedState=null,n))}function Zi(e,t,n,r){var o=e.mode,a=e.child;return t={mode:"hidden",children:t},2&o||null===a?a=Ks(t,o,0,null):(a.childLanes=0,a.pendingProps=t),n=qs(n,o,r,null),a.return=e,n.return=e,a.sibling=n,e.child=a,n}function el(e,t){e.lanes|=t;var n=e.alternate;null!==n&&(n.lanes|=t),oa(e.return,t)}function tl(e,t,n,r,o,a){var i=e.memoizedState;null===i?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:o,lastEffect:a}:(i.isBackwards=t,i.rendering=null,i.renderingStartTime=0,i.last=r,i.tail=n,i.tailMode=o,i.lastEffect=a)}function nl(e,t,n){var r=t.pendingProps,o=r.revealOrder,a=r.tail;if(Di(e,t,r.children,n),2&(r=Da.current))r=1&r|2,t.flags|=64;else{if(null!==e&&64&e.flags)e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&el(e,n);else if(19===e.tag)el(e,n);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(co(Da,r),2&t.mode)switch(o){case"forwards":for(n=t.child,o=null;null!==n;)null!==(e=n.alternate)&&null===Fa(e)&&(o=n),n=n.sibling;null===(n=o)?(o=t.child,t.child=null):(o=n.sibling,n.sibling=null),tl(t,!1,o,n,a,t.lastEffect);break;case"backwards":for(n=null,o=t.child,t.child=null;null!==o;){if(null!==(e=o.alternate)&&null===Fa(e)){t.child=o;break}e=o.sibling,o.sibling=n,n=o,o=e}tl(t,!0,n,null,a,t.lastEffect);break;case"together":tl(t,!1,null,null,void 0,t.lastEffect);break;default:t.memoizedState=null}else t.memoizedState=null;return t.child}function rl(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),jl|=t.lanes,n&t.childLanes){if(null!==e&&t.child!==e.child)throw Error(i(153));if(null!==t.child){for(n=Hs(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Hs(e,e.pendingProps)).return=t;n.sibling=null}return t.child}return null}function ol(e,t){if(!Wa)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function al(e,t,n){var r=t.pendingProps;switch(t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return null;case 1:case 17:return go(t.type)&&yo(),null;case 3:return za(),uo(mo),uo(po),Qa(),(r=t.stateNode).pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==e&&null!==e.child||(qa(t)?t.flags|=4:r.hydrate||(t.flags|=256)),Xi(t),null;case 5:Ia(t);var a=Ma(Oa.current);if(n=t.type,null!==e&&null!=t.stateNode)Qi(e,t,n,r,a),e.ref!==t.ref&&(t.flags|=128);else{if(!r){if(null===t.stateNode)throw Error(i(166));return null}if(e=Ma(Ta.current),qa(t)){r=t.stateNode,n=t.type;var l=t.memoizedProps;switch(r[Gr]=t,r[Jr]=l,n){case"dialog":Tr("cancel",r),Tr("close",r);break;case"iframe":case"object":case"embed":Tr("load",r);break;case"video":case"audio":for(e=0;e<Ar.length;e++)Tr(Ar[e],r);break;case"source":Tr("error",r);break;case"img":case"image":case"link":Tr("error",r),Tr("load",r);break;case"details":Tr("toggle",r);break;case"input":ee(r,l),Tr("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!l.multiple},Tr("invalid",r);break;case"textarea":se(r,l),Tr("invalid",r)}for(var u in ke(n,l),e=null,l)l.hasOwnProperty(u)&&(a=l[u],"children"===u?"string"==typeof a?r.textContent!==a&&(e=["children",a]):"number"==typeof a&&r.textContent!==""+a&&(e=["children",""+a]):s.hasOwnProperty(u)&&null!=a&&"onScroll"===u&&Tr("scroll",r));switch(n){case"input":Y(r),re(r,l,!0);break;case"textarea":Y(r),ce(r);break;case"select":case"option":break;default:"function"==typeof l.onClick&&(r.onclick=jr)}r=e,t.updateQueue=r,null!==r&&(t.flags|=4)}else{switch(u=9===a.nodeType?a:a.ownerDocument,e===de&&(e=fe(n)),e===de?"script"===n?((e=u.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"==typeof r.is?e=u.createElement(n,{is:r.is}):(e=u.createElement(n),"select"===n&&(u=e,r.multiple?u.multiple=!0:r.size&&(u.size=r.size))):e=u.createElementNS(e,n),e[Gr]=t,e[Jr]=r,Ki(e,t,!1,!1),t.stateNode=e,u=Se(n,r),n){case"dialog":Tr("cancel",e),Tr("close",e),a=r;break;case"iframe":case"object":case"embed":Tr("load",e),a=r;break;case"video":case"audio":for(a=0;a<Ar.length;a++)Tr(Ar[a],e);a=r;break;case"source":Tr("error",e),a=r;break;case"img":case"image":case"link":Tr("error",e),Tr("load",e),a=r;break;case"details":Tr("toggle",e),a=r;break;case"input":ee(e,r),a=Z(e,r),Tr("invalid",e);break;case"option":a=ae(e,r);break;case"select":e._wrapperState={wasMultiple:!!r.multiple},a=o({},r,{value:void 0}),Tr("invalid",e);break;case"textarea":se(e,r),a=le(e,r),Tr("invalid",e);break;default:a=r}ke(n,a);var c=a;for(l in c)if(c.hasOwnProperty(l)){var d=c[l];"style"===l?we(e,d):"dangerouslySetInnerHTML"===l?null!=(d=d?d.__html:void 0)&&ve(e,d):"children"===l?"string"==typeof d?("textarea"!==n||""!==d)&&ge(e,d):"number"==typeof d&&ge(e,""+d):"suppressContentEditableWarning"!==l&&"suppressHydrationWarning"!==l&&"autoFocus"!==l&&(s.hasOwnProperty(l)?null!=d&&"onScroll"===l&&Tr("scroll",e):null!=d&&x(e,l,d,u))}switch(n){case"input":Y(e),re(e,r,!1);break;case"textarea":Y(e),ce(e);break;case"option":null!=r.value&&e.setAttribute("value",""+X(r.value));break;case"select":e.multiple=!!r.multiple,null!=(l=r.value)?ie(e,!!r.multiple,l,!1):null!=r.defaultValue&&ie(e,!!r.multiple,r.defaultValue,!0);break;default:"function"==typeof a.onClick&&(e.onclick=jr)}$r(n,r)&&(t.flags|=4)}null!==t.ref&&(t.flags|=128)}return null;case 6:if(e&&null!=t.stateNode)Yi(e,t,e.memoizedProps,r);else{if("string"!=typeof r&&null===t.stateNode)throw Error(i(166));n=Ma(Oa.current),Ma(Ta.current),qa(t)?(r=t.stateNode,n=t.memoizedProps,r[Gr]=t,r.nodeValue!==n&&(t.flags|=4)):((r=(9===n.nodeType?n:n.ownerDocument).createTextNode(r))[Gr]=t,t.stateNode=r)}return null;case 13:return uo(Da),r=t.memoizedState,64&t.flags?(t.lanes=n,t):(r=null!==r,n=!1,null===e?void 0!==t.memoizedProps.fallback&&qa(t):n=null!==e.memoizedState,r&&!n&&2&t.mode&&(null===e&&!0!==t.memoizedProps.unstable_avoidThisFallback||1&Da.current?0===Il&&(Il=3):(0!==Il&&3!==Il||(Il=4),null===Ol||!(134217727&jl)&&!(134217727&Bl)||vs(Ol,Ll))),(r||n)&&(t.flags|=4),null);case 4:return za(),Xi(t),null===e&&Or(t.stateNode.containerInfo),null;case 10:return ra(t),null;case 19:if(uo(Da),null===(r=t.memoizedState))return null;if(l=!!(64&t.flags),null===(u=r.rendering))if(l)ol(r,!1);else{if(0!==Il||null!==e&&64&e.flags)for(e=t.child;null!==e;){if(null!==(u=Fa(e))){for(t.flags|=64,ol(r,!1),null!==(l=u.updateQueue)&&(t.updateQueue=l,t.flags|=4),null===r.lastEffect&&(t.firstEffect=null),t.lastEffect=r.lastEffect,r=n,n=t.child;null!==n;)e=r,(l=n).flags&=2,l.nextEffect=null,l.firstEffect=null,l.lastEffect=null,null===(u=l.alternate)?(l.childLanes=0,l.lanes=e,l.child=null,l.memoizedProps=null,l.memoizedState=null,l.updateQueue=null,l.dependencies=null,l.stateNode=null):(l.childLanes=u.childLanes,l.lanes=u.lanes,l.child=u.child,l.memoizedProps=u.memoizedProps,l.memoizedState=u.memoizedState,l.updateQueue=u.updateQueue,l.type=u.type,e=u.dependencies,l.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return co(Da,1&Da.current|2),t.child}e=e.sibling}null!==r.tail&&Vo()>Hl&&(t.flags|=64,l=!0,ol(r,!1),t.lanes=33554432)}else{if(!l)if(null!==(e=Fa(u))){if(t.flags|=64,l=!0,null!==(n=e.updateQueue)&&(t.updateQueue=n,t.flags|=4),ol(r,!0),null===r.tail&&"hidden"===r.tailMode&&!u.alternate&&!Wa)return null!==(t=t.lastEffect=r.lastEffect)&&(t.nextEffect=null),null}else 2*Vo()-r.renderingStartTime>Hl&&1073741824!==n&&(t.flags|=64,l=!0,ol(r,!1),t.lanes=33554432);r.isBackwards?(u.sibling=t.child,t.child=u):(null!==(n=r.last)?n.sibling=u:t.child=u,r.last=u)}return null!==r.tail?(n=r.tail,r.rendering=n,r.tail=n.sibling,r.lastEffect=t.lastEffect,r.renderingStartTime=Vo(),n.sibling=null,t=Da.current,co(Da,l?1&t|2:1&t),n):null;case 23:case 24:return ws(),null!==e&&null!==e.memoizedState!=(null!==t.memoizedState)&&"unstable-defer-without-hiding"!==r.mode&&(t.flags|=4),null}throw Error(i(156,t.tag))}function il(e){switch(e.tag){case 1:go(e.type)&&yo();var t=e.flags;return 4096&t?(e.flags=-4097&t|64,e):null;case 3:if(za(),uo(mo),uo(po),Qa(),64&(t=e.flags))throw Error(i(285));return e.flags=-4097&t|64,e;case 5:return Ia(e),null;case 13:return uo(Da),4096&(t=e.flags)?(e.flags=-4097&t|64,e):null;case 19:return uo(Da),null;case 4:return za(),null;case 10:return ra(e),null;case 23:case 24:return ws(),null;default:return null}}function ll(e,t){try{var n="",r=t;do{n+=q(r),r=r.return}while(r);var o=n}catch(e){o="\nError generating stack: "+e.message+"\n"+e.stack}return{value:e,source:t,stack:o}}function sl(e,t){try{console.error(t.value)}catch(e){setTimeout((function(){throw e}))}}Ki=function(e,t){for(var n=t.child;null!==n;){if(5===n.tag||6===n.tag)e.appendChild(n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===t)break;for(;null===n.sibling;){if(null===n.return||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},Xi=function(){},Qi=function(e,t,n,r){var a=e.memoizedProps;if(a!==r){e=t.stateNode,Ma(Ta.current);var i,l=null;switch(n){case"input":a=Z(e,a),r=Z(e,r),l=[];break;case"option":a=ae(e,a),r=ae(e,r),l=[];break;case"select":a=o({},a,{value:void 0}),r=o({},r,{value:void 0}),l=[];break;case"textarea":a=le(e,a),r=le(e,r),l=[];break;default:"function"!=typeof a.onClick&&"function"==typeof r.onClick&&(e.onclick=jr)}for(d in ke(n,r),n=null,a)if(!r.hasOwnProperty(d)&&a.hasOwnProperty(d)&&null!=a[d])if("style"===d){var u=a[d];for(i in u)u.hasOwnProperty(i)&&(n||(n={}),n[i]="")}else"dangerouslySetInnerHTML"!==d&&"children"!==d&&"suppressContentEditableWarning"!==d&&"suppressHydrationWarning"!==d&&"autoFocus"!==d&&(s.hasOwnProperty(d)?l||(l=[]):(l=l||[]).push(d,null));for(d in r){var c=r[d];if(u=null!=a?a[d]:void 0,r.hasOwnProperty(d)&&c!==u&&(null!=c||null!=u))if("style"===d)if(u){for(i in u)!u.hasOwnProperty(i)||c&&c.hasOwnProperty(i)||(n||(n={}),n[i]="");for(i in c)c.hasOwnProperty(i)&&u[i]!==c[i]&&(n||(n={}),n[i]=c[i])}else n||(l||(l=[]),l.push(d,n)),n=c;else"dangerouslySetInnerHTML"===d?(c=c?c.__html:void 0,u=u?u.__html:void 0,null!=c&&u!==c&&(l=l||[]).push(d,c)):"children"===d?"string"!=typeof c&&"number"!=typeof c||(l=l||[]).push(d,""+c):"suppressContentEditableWarning"!==d&&"suppressHydrationWarning"!==d&&(s.hasOwnProperty(d)?(null!=c&&"onScroll"===d&&Tr("scroll",e),l||u===c||(l=[])):"object"==typeof c&&null!==c&&c.$$typeof===_?c.toString():(l=l||[]).push(d,c))}n&&(l=l||[]).push("style",n);var d=l;(t.updateQueue=d)&&(t.flags|=4)}},Yi=function(e,t,n,r){n!==r&&(t.flags|=4)};var ul="function"==typeof WeakMap?WeakMap:Map;function cl(e,t,n){(n=ca(-1,n)).tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){Xl||(Xl=!0,Ql=r),sl(0,t)},n}function dl(e,t,n){(n=ca(-1,n)).tag=3;var r=e.type.getDerivedStateFromError;if("function"==typeof r){var o=t.value;n.payload=function(){return sl(0,t),r(o)}}var a=e.stateNode;return null!==a&&"function"==typeof a.componentDidCatch&&(n.callback=function(){"function"!=typeof r&&(null===Yl?Yl=new Set([this]):Yl.add(this),sl(0,t));var e=t.stack;this.componentDidCatch(t.value,{componentStack:null!==e?e:""})}),n}var fl="function"==typeof WeakSet?WeakSet:Set;function pl(e){var t=e.ref;if(null!==t)if("function"==typeof t)try{t(null)}catch(t){Fs(e,t)}else t.current=null}function ml(e,t){switch(t.tag){case 0:case 11:case 15:case 22:case 5:case 6:case 4:case 17:return;case 1:if(256&t.flags&&null!==e){var n=e.memoizedProps,r=e.memoizedState;t=(e=t.stateNode).getSnapshotBeforeUpdate(t.elementType===t.type?n:Go(t.type,n),r),e.__reactInternalSnapshotBeforeUpdate=t}return;case 3:return void(256&t.flags&&qr(t.stateNode.containerInfo))}throw Error(i(163))}function hl(e,t,n){switch(n.tag){case 0:case 11:case 15:case 22:if(null!==(t=null!==(t=n.updateQueue)?t.lastEffect:null)){e=t=t.next;do{if(!(3&~e.tag)){var r=e.create;e.destroy=r()}e=e.next}while(e!==t)}if(null!==(t=null!==(t=n.updateQueue)?t.lastEffect:null)){e=t=t.next;do{var o=e;r=o.next,4&(o=o.tag)&&1&o&&(_s(n,e),zs(n,e)),e=r}while(e!==t)}return;case 1:return e=n.stateNode,4&n.flags&&(null===t?e.componentDidMount():(r=n.elementType===n.type?t.memoizedProps:Go(n.type,t.memoizedProps),e.componentDidUpdate(r,t.memoizedState,e.__reactInternalSnapshotBeforeUpdate))),void(null!==(t=n.updateQueue)&&ma(n,t,e));case 3:if(null!==(t=n.updateQueue)){if(e=null,null!==n.child)switch(n.child.tag){case 5:case 1:e=n.child.stateNode}ma(n,t,e)}return;case 5:return e=n.stateNode,void(null===t&&4&n.flags&&$r(n.type,n.memoizedProps)&&e.focus());case 6:case 4:case 12:case 19:case 17:case 20:case 21:case 23:case 24:return;case 13:return void(null===n.memoizedState&&(n=n.alternate,null!==n&&(n=n.memoizedState,null!==n&&(n=n.dehydrated,null!==n&&wt(n)))))}throw Error(i(163))}function vl(e,t){for(var n=e;;){if(5===n.tag){var r=n.stateNode;if(t)"function"==typeof(r=r.style).setProperty?r.setProperty("display","none","important"):r.display="none";else{r=n.stateNode;var o=n.memoizedProps.style;o=null!=o&&o.hasOwnProperty("display")?o.display:null,r.style.display=xe("display",o)}}else if(6===n.tag)n.stateNode.nodeValue=t?"":n.memoizedProps;else if((23!==n.tag&&24!==n.tag||null===n.memoizedState||n===e)&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===e)break;for(;null===n.sibling;){if(null===n.return||n.return===e)return;n=n.return}n.sibling.return=n.return,n=n.sibling}}function gl(e,t){if(So&&"function"==typeof So.onCommitFiberUnmount)try{So.onCommitFiberUnmount(ko,t)}catch(e){}switch(t.tag){case 0:case 11:case 14:case 15:case 22:if(null!==(e=t.updateQueue)&&null!==(e=e.lastEffect)){var n=e=e.next;do{var r=n,o=r.destroy;if(r=r.tag,void 0!==o)if(4&r)_s(t,n);else{r=t;try{o()}catch(e){Fs(r,e)}}n=n.next}while(n!==e)}break;case 1:if(pl(t),"function"==typeof(e=t.stateNode).componentWillUnmount)try{e.props=t.memoizedProps,e.state=t.memoizedState,e.componentWillUnmount()}catch(e){Fs(t,e)}break;case 5:pl(t);break;case 4:kl(e,t)}}function yl(e){e.alternate=null,e.child=null,e.dependencies=null,e.firstEffect=null,e.lastEffect=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.return=null,e.updateQueue=null}function bl(e){return 5===e.tag||3===e.tag||4===e.tag}function xl(e){e:{for(var t=e.return;null!==t;){if(bl(t))break e;t=t.return}throw Error(i(160))}var n=t;switch(t=n.stateNode,n.tag){case 5:var r=!1;break;case 3:case 4:t=t.containerInfo,r=!0;break;default:throw Error(i(161))}16&n.flags&&(ge(t,""),n.flags&=-17);e:t:for(n=e;;){for(;null===n.sibling;){if(null===n.return||bl(n.return)){n=null;break e}n=n.return}for(n.sibling.return=n.return,n=n.sibling;5!==n.tag&&6!==n.tag&&18!==n.tag;){if(2&n.flags)continue t;if(null===n.child||4===n.tag)continue t;n.child.return=n,n=n.child}if(!(2&n.flags)){n=n.stateNode;break e}}r?wl(e,n,t):El(e,n,t)}function wl(e,t,n){var r=e.tag,o=5===r||6===r;if(o)e=o?e.stateNode:e.stateNode.instance,t?8===n.nodeType?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(8===n.nodeType?(t=n.parentNode).insertBefore(e,n):(t=n).appendChild(e),null!=(n=n._reactRootContainer)||null!==t.onclick||(t.onclick=jr));else if(4!==r&&null!==(e=e.child))for(wl(e,t,n),e=e.sibling;null!==e;)wl(e,t,n),e=e.sibling}function El(e,t,n){var r=e.tag,o=5===r||6===r;if(o)e=o?e.stateNode:e.stateNode.instance,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&null!==(e=e.child))for(El(e,t,n),e=e.sibling;null!==e;)El(e,t,n),e=e.sibling}function kl(e,t){for(var n,r,o=t,a=!1;;){if(!a){a=o.return;e:for(;;){if(null===a)throw Error(i(160));switch(n=a.stateNode,a.tag){case 5:r=!1;break e;case 3:case 4:n=n.containerInfo,r=!0;break e}a=a.return}a=!0}if(5===o.tag||6===o.tag){e:for(var l=e,s=o,u=s;;)if(gl(l,u),null!==u.child&&4!==u.tag)u.child.return=u,u=u.child;else{if(u===s)break e;for(;null===u.sibling;){if(null===u.return||u.return===s)break e;u=u.return}u.sibling.return=u.return,u=u.sibling}r?(l=n,s=o.stateNode,8===l.nodeType?l.parentNode.removeChild(s):l.removeChild(s)):n.removeChild(o.stateNode)}else if(4===o.tag){if(null!==o.child){n=o.stateNode.containerInfo,r=!0,o.child.return=o,o=o.child;continue}}else if(gl(e,o),null!==o.child){o.child.return=o,o=o.child;continue}if(o===t)break;for(;null===o.sibling;){if(null===o.return||o.return===t)return;4===(o=o.return).tag&&(a=!1)}o.sibling.return=o.return,o=o.sibling}}function Sl(e,t){switch(t.tag){case 0:case 11:case 14:case 15:case 22:var n=t.updateQueue;if(null!==(n=null!==n?n.lastEffect:null)){var r=n=n.next;do{!(3&~r.tag)&&(e=r.destroy,r.destroy=void 0,void 0!==e&&e()),r=r.next}while(r!==n)}return;case 1:case 12:case 17:return;case 5:if(null!=(n=t.stateNode)){r=t.memoizedProps;var o=null!==e?e.memoizedProps:r;e=t.type;var a=t.updateQueue;if(t.updateQueue=null,null!==a){for(n[Jr]=r,"input"===e&&"radio"===r.type&&null!=r.name&&te(n,r),Se(e,o),t=Se(e,r),o=0;o<a.length;o+=2){var l=a[o],s=a[o+1];"style"===l?we(n,s):"dangerouslySetInnerHTML"===l?ve(n,s):"children"===l?ge(n,s):x(n,l,s,t)}switch(e){case"input":ne(n,r);break;case"textarea":ue(n,r);break;case"select":e=n._wrapperState.wasMultiple,n._wrapperState.wasMultiple=!!r.multiple,null!=(a=r.value)?ie(n,!!r.multiple,a,!1):e!==!!r.multiple&&(null!=r.defaultValue?ie(n,!!r.multiple,r.defaultValue,!0):ie(n,!!r.multiple,r.multiple?[]:"",!1))}}}return;case 6:if(null===t.stateNode)throw Error(i(162));return void(t.stateNode.nodeValue=t.memoizedProps);case 3:return void((n=t.stateNode).hydrate&&(n.hydrate=!1,wt(n.containerInfo)));case 13:return null!==t.memoizedState&&(Vl=Vo(),vl(t.child,!0)),void Al(t);case 19:return void Al(t);case 23:case 24:return void vl(t,null!==t.memoizedState)}throw Error(i(163))}function Al(e){var t=e.updateQueue;if(null!==t){e.updateQueue=null;var n=e.stateNode;null===n&&(n=e.stateNode=new fl),t.forEach((function(t){var r=Bs.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))}))}}function Cl(e,t){return null!==e&&(null===(e=e.memoizedState)||null!==e.dehydrated)&&null!==(t=t.memoizedState)&&null===t.dehydrated}var Rl=Math.ceil,Pl=w.ReactCurrentDispatcher,Tl=w.ReactCurrentOwner,Nl=0,Ol=null,Ml=null,Ll=0,zl=0,_l=so(0),Il=0,Dl=null,Fl=0,jl=0,Bl=0,Wl=0,$l=null,Vl=0,Hl=1/0;function Ul(){Hl=Vo()+500}var ql,Kl=null,Xl=!1,Ql=null,Yl=null,Gl=!1,Jl=null,Zl=90,es=[],ts=[],ns=null,rs=0,os=null,as=-1,is=0,ls=0,ss=null,us=!1;function cs(){return 48&Nl?Vo():-1!==as?as:as=Vo()}function ds(e){if(!(2&(e=e.mode)))return 1;if(!(4&e))return 99===Ho()?1:2;if(0===is&&(is=Fl),0!==Yo.transition){0!==ls&&(ls=null!==$l?$l.pendingLanes:0),e=is;var t=4186112&~ls;return 0==(t&=-t)&&0==(t=(e=4186112&~e)&-e)&&(t=8192),t}return e=Ho(),e=jt(4&Nl&&98===e?12:e=function(e){switch(e){case 99:return 15;case 98:return 10;case 97:case 96:return 8;case 95:return 2;default:return 0}}(e),is)}function fs(e,t,n){if(50<rs)throw rs=0,os=null,Error(i(185));if(null===(e=ps(e,t)))return null;$t(e,t,n),e===Ol&&(Bl|=t,4===Il&&vs(e,Ll));var r=Ho();1===t?8&Nl&&!(48&Nl)?gs(e):(ms(e,n),0===Nl&&(Ul(),Xo())):(!(4&Nl)||98!==r&&99!==r||(null===ns?ns=new Set([e]):ns.add(e)),ms(e,n)),$l=e}function ps(e,t){e.lanes|=t;var n=e.alternate;for(null!==n&&(n.lanes|=t),n=e,e=e.return;null!==e;)e.childLanes|=t,null!==(n=e.alternate)&&(n.childLanes|=t),n=e,e=e.return;return 3===n.tag?n.stateNode:null}function ms(e,t){for(var n=e.callbackNode,r=e.suspendedLanes,o=e.pingedLanes,a=e.expirationTimes,l=e.pendingLanes;0<l;){var s=31-Vt(l),u=1<<s,c=a[s];if(-1===c){if(!(u&r)||u&o){c=t,It(u);var d=_t;a[s]=10<=d?c+250:6<=d?c+5e3:-1}}else c<=t&&(e.expiredLanes|=u);l&=~u}if(r=Dt(e,e===Ol?Ll:0),t=_t,0===r)null!==n&&(n!==Do&&Ro(n),e.callbackNode=null,e.callbackPriority=0);else{if(null!==n){if(e.callbackPriority===t)return;n!==Do&&Ro(n)}15===t?(n=gs.bind(null,e),null===jo?(jo=[n],Bo=Co(Mo,Qo)):jo.push(n),n=Do):14===t?n=Ko(99,gs.bind(null,e)):(n=function(e){switch(e){case 15:case 14:return 99;case 13:case 12:case 11:case 10:return 98;case 9:case 8:case 7:case 6:case 4:case 5:return 97;case 3:case 2:case 1:return 95;case 0:return 90;default:throw Error(i(358,e))}}(t),n=Ko(n,hs.bind(null,e))),e.callbackPriority=t,e.callbackNode=n}}function hs(e){if(as=-1,ls=is=0,48&Nl)throw Error(i(327));var t=e.callbackNode;if(Ls()&&e.callbackNode!==t)return null;var n=Dt(e,e===Ol?Ll:0);if(0===n)return null;var r=n,o=Nl;Nl|=16;var a=Ss();for(Ol===e&&Ll===r||(Ul(),Es(e,r));;)try{Rs();break}catch(t){ks(e,t)}if(na(),Pl.current=a,Nl=o,null!==Ml?r=0:(Ol=null,Ll=0,r=Il),Fl&Bl)Es(e,0);else if(0!==r){if(2===r&&(Nl|=64,e.hydrate&&(e.hydrate=!1,qr(e.containerInfo)),0!==(n=Ft(e))&&(r=As(e,n))),1===r)throw t=Dl,Es(e,0),vs(e,n),ms(e,Vo()),t;switch(e.finishedWork=e.current.alternate,e.finishedLanes=n,r){case 0:case 1:throw Error(i(345));case 2:case 5:Ns(e);break;case 3:if(vs(e,n),(62914560&n)===n&&10<(r=Vl+500-Vo())){if(0!==Dt(e,0))break;if(((o=e.suspendedLanes)&n)!==n){cs(),e.pingedLanes|=e.suspendedLanes&o;break}e.timeoutHandle=Hr(Ns.bind(null,e),r);break}Ns(e);break;case 4:if(vs(e,n),(4186112&n)===n)break;for(r=e.eventTimes,o=-1;0<n;){var l=31-Vt(n);a=1<<l,(l=r[l])>o&&(o=l),n&=~a}if(n=o,10<(n=(120>(n=Vo()-n)?120:480>n?480:1080>n?1080:1920>n?1920:3e3>n?3e3:4320>n?4320:1960*Rl(n/1960))-n)){e.timeoutHandle=Hr(Ns.bind(null,e),n);break}Ns(e);break;default:throw Error(i(329))}}return ms(e,Vo()),e.callbackNode===t?hs.bind(null,e):null}function vs(e,t){for(t&=~Wl,t&=~Bl,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-Vt(t),r=1<<n;e[n]=-1,t&=~r}}function gs(e){if(48&Nl)throw Error(i(327));if(Ls(),e===Ol&&e.expiredLanes&Ll){var t=Ll,n=As(e,t);Fl&Bl&&(n=As(e,t=Dt(e,t)))}else n=As(e,t=Dt(e,0));if(0!==e.tag&&2===n&&(Nl|=64,e.hydrate&&(e.hydrate=!1,qr(e.containerInfo)),0!==(t=Ft(e))&&(n=As(e,t))),1===n)throw n=Dl,Es(e,0),vs(e,t),ms(e,Vo()),n;return e.finishedWork=e.current.alternate,e.finishedLanes=t,Ns(e),ms(e,Vo()),null}function ys(e,t){var n=Nl;Nl|=1;try{return e(t)}finally{0===(Nl=n)&&(Ul(),Xo())}}function bs(e,t){var n=Nl;Nl&=-2,Nl|=8;try{return e(t)}finally{0===(Nl=n)&&(Ul(),Xo())}}function xs(e,t){co(_l,zl),zl|=t,Fl|=t}function ws(){zl=_l.current,uo(_l)}function Es(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(-1!==n&&(e.timeoutHandle=-1,Ur(n)),null!==Ml)for(n=Ml.return;null!==n;){var r=n;switch(r.tag){case 1:null!=(r=r.type.childContextTypes)&&yo();break;case 3:za(),uo(mo),uo(po),Qa();break;case 5:Ia(r);break;case 4:za();break;case 13:case 19:uo(Da);break;case 10:ra(r);break;case 23:case 24:ws()}n=n.return}Ol=e,Ml=Hs(e.current,null),Ll=zl=Fl=t,Il=0,Dl=null,Wl=Bl=jl=0}function ks(e,t){for(;;){var n=Ml;try{if(na(),Ya.current=Oi,ni){for(var r=Za.memoizedState;null!==r;){var o=r.queue;null!==o&&(o.pending=null),r=r.next}ni=!1}if(Ja=0,ti=ei=Za=null,ri=!1,Tl.current=null,null===n||null===n.return){Il=1,Dl=t,Ml=null;break}e:{var a=e,i=n.return,l=n,s=t;if(t=Ll,l.flags|=2048,l.firstEffect=l.lastEffect=null,null!==s&&"object"==typeof s&&"function"==typeof s.then){var u=s;if(!(2&l.mode)){var c=l.alternate;c?(l.updateQueue=c.updateQueue,l.memoizedState=c.memoizedState,l.lanes=c.lanes):(l.updateQueue=null,l.memoizedState=null)}var d=!!(1&Da.current),f=i;do{var p;if(p=13===f.tag){var m=f.memoizedState;if(null!==m)p=null!==m.dehydrated;else{var h=f.memoizedProps;p=void 0!==h.fallback&&(!0!==h.unstable_avoidThisFallback||!d)}}if(p){var v=f.updateQueue;if(null===v){var g=new Set;g.add(u),f.updateQueue=g}else v.add(u);if(!(2&f.mode)){if(f.flags|=64,l.flags|=16384,l.flags&=-2981,1===l.tag)if(null===l.alternate)l.tag=17;else{var y=ca(-1,1);y.tag=2,da(l,y)}l.lanes|=1;break e}s=void 0,l=t;var b=a.pingCache;if(null===b?(b=a.pingCache=new ul,s=new Set,b.set(u,s)):void 0===(s=b.get(u))&&(s=new Set,b.set(u,s)),!s.has(l)){s.add(l);var x=js.bind(null,a,u,l);u.then(x,x)}f.flags|=4096,f.lanes=t;break e}f=f.return}while(null!==f);s=Error((K(l.type)||"A React component")+" suspended while rendering, but no fallback UI was specified.\n\nAdd a <Suspense fallback=...> component higher in the tree to provide a loading indicator or placeholder to display.")}5!==Il&&(Il=2),s=ll(s,l),f=i;do{switch(f.tag){case 3:a=s,f.flags|=4096,t&=-t,f.lanes|=t,fa(f,cl(0,a,t));break e;case 1:a=s;var w=f.type,E=f.stateNode;if(!(64&f.flags||"function"!=typeof w.getDerivedStateFromError&&(null===E||"function"!=typeof E.componentDidCatch||null!==Yl&&Yl.has(E)))){f.flags|=4096,t&=-t,f.lanes|=t,fa(f,dl(f,a,t));break e}}f=f.return}while(null!==f)}Ts(n)}catch(e){t=e,Ml===n&&null!==n&&(Ml=n=n.return);continue}break}}function Ss(){var e=Pl.current;return Pl.current=Oi,null===e?Oi:e}function As(e,t){var n=Nl;Nl|=16;var r=Ss();for(Ol===e&&Ll===t||Es(e,t);;)try{Cs();break}catch(t){ks(e,t)}if(na(),Nl=n,Pl.current=r,null!==Ml)throw Error(i(261));return Ol=null,Ll=0,Il}function Cs(){for(;null!==Ml;)Ps(Ml)}function Rs(){for(;null!==Ml&&!Po();)Ps(Ml)}function Ps(e){var t=ql(e.alternate,e,zl);e.memoizedProps=e.pendingProps,null===t?Ts(e):Ml=t,Tl.current=null}function Ts(e){var t=e;do{var n=t.alternate;if(e=t.return,2048&t.flags){if(null!==(n=il(t)))return n.flags&=2047,void(Ml=n);null!==e&&(e.firstEffect=e.lastEffect=null,e.flags|=2048)}else{if(null!==(n=al(n,t,zl)))return void(Ml=n);if(24!==(n=t).tag&&23!==n.tag||null===n.memoizedState||1073741824&zl||!(4&n.mode)){for(var r=0,o=n.child;null!==o;)r|=o.lanes|o.childLanes,o=o.sibling;n.childLanes=r}null!==e&&!(2048&e.flags)&&(null===e.firstEffect&&(e.firstEffect=t.firstEffect),null!==t.lastEffect&&(null!==e.lastEffect&&(e.lastEffect.nextEffect=t.firstEffect),e.lastEffect=t.lastEffect),1<t.flags&&(null!==e.lastEffect?e.lastEffect.nextEffect=t:e.firstEffect=t,e.lastEffect=t))}if(null!==(t=t.sibling))return void(Ml=t);Ml=t=e}while(null!==t);0===Il&&(Il=5)}function Ns(e){var t=Ho();return qo(99,Os.bind(null,e,t)),null}function Os(e,t){do{Ls()}while(null!==Jl);if(48&Nl)throw Error(i(327));var n=e.finishedWork;if(null===n)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(i(177));e.callbackNode=null;var r=n.lanes|n.childLanes,o=r,a=e.pendingLanes&~o;e.pendingLanes=o,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=o,e.mutableReadLanes&=o,e.entangledLanes&=o,o=e.entanglements;for(var l=e.eventTimes,s=e.expirationTimes;0<a;){var u=31-Vt(a),c=1<<u;o[u]=0,l[u]=-1,s[u]=-1,a&=~c}if(null!==ns&&!(24&r)&&ns.has(e)&&ns.delete(e),e===Ol&&(Ml=Ol=null,Ll=0),1<n.flags?null!==n.lastEffect?(n.lastEffect.nextEffect=n,r=n.firstEffect):r=n:r=n.firstEffect,null!==r){if(o=Nl,Nl|=32,Tl.current=null,Br=Xt,vr(l=hr())){if("selectionStart"in l)s={start:l.selectionStart,end:l.selectionEnd};else e:if(s=(s=l.ownerDocument)&&s.defaultView||window,(c=s.getSelection&&s.getSelection())&&0!==c.rangeCount){s=c.anchorNode,a=c.anchorOffset,u=c.focusNode,c=c.focusOffset;try{s.nodeType,u.nodeType}catch(e){s=null;break e}var d=0,f=-1,p=-1,m=0,h=0,v=l,g=null;t:for(;;){for(var y;v!==s||0!==a&&3!==v.nodeType||(f=d+a),v!==u||0!==c&&3!==v.nodeType||(p=d+c),3===v.nodeType&&(d+=v.nodeValue.length),null!==(y=v.firstChild);)g=v,v=y;for(;;){if(v===l)break t;if(g===s&&++m===a&&(f=d),g===u&&++h===c&&(p=d),null!==(y=v.nextSibling))break;g=(v=g).parentNode}v=y}s=-1===f||-1===p?null:{start:f,end:p}}else s=null;s=s||{start:0,end:0}}else s=null;Wr={focusedElem:l,selectionRange:s},Xt=!1,ss=null,us=!1,Kl=r;do{try{Ms()}catch(e){if(null===Kl)throw Error(i(330));Fs(Kl,e),Kl=Kl.nextEffect}}while(null!==Kl);ss=null,Kl=r;do{try{for(l=e;null!==Kl;){var b=Kl.flags;if(16&b&&ge(Kl.stateNode,""),128&b){var x=Kl.alternate;if(null!==x){var w=x.ref;null!==w&&("function"==typeof w?w(null):w.current=null)}}switch(1038&b){case 2:xl(Kl),Kl.flags&=-3;break;case 6:xl(Kl),Kl.flags&=-3,Sl(Kl.alternate,Kl);break;case 1024:Kl.flags&=-1025;break;case 1028:Kl.flags&=-1025,Sl(Kl.alternate,Kl);break;case 4:Sl(Kl.alternate,Kl);break;case 8:kl(l,s=Kl);var E=s.alternate;yl(s),null!==E&&yl(E)}Kl=Kl.nextEffect}}catch(e){if(null===Kl)throw Error(i(330));Fs(Kl,e),Kl=Kl.nextEffect}}while(null!==Kl);if(w=Wr,x=hr(),b=w.focusedElem,l=w.selectionRange,x!==b&&b&&b.ownerDocument&&mr(b.ownerDocument.documentElement,b)){null!==l&&vr(b)&&(x=l.start,void 0===(w=l.end)&&(w=x),"selectionStart"in b?(b.selectionStart=x,b.selectionEnd=Math.min(w,b.value.length)):(w=(x=b.ownerDocument||document)&&x.defaultView||window).getSelection&&(w=w.getSelection(),s=b.textContent.length,E=Math.min(l.start,s),l=void 0===l.end?E:Math.min(l.end,s),!w.extend&&E>l&&(s=l,l=E,E=s),s=pr(b,E),a=pr(b,l),s&&a&&(1!==w.rangeCount||w.anchorNode!==s.node||w.anchorOffset!==s.offset||w.focusNode!==a.node||w.focusOffset!==a.offset)&&((x=x.createRange()).setStart(s.node,s.offset),w.removeAllRanges(),E>l?(w.addRange(x),w.extend(a.node,a.offset)):(x.setEnd(a.node,a.offset),w.addRange(x))))),x=[];for(w=b;w=w.parentNode;)1===w.nodeType&&x.push({element:w,left:w.scrollLeft,top:w.scrollTop});for("function"==typeof b.focus&&b.focus(),b=0;b<x.length;b++)(w=x[b]).element.scrollLeft=w.left,w.element.scrollTop=w.top}Xt=!!Br,Wr=Br=null,e.current=n,Kl=r;do{try{for(b=e;null!==Kl;){var k=Kl.flags;if(36&k&&hl(b,Kl.alternate,Kl),128&k){x=void 0;var S=Kl.ref;if(null!==S){var A=Kl.stateNode;Kl.tag,x=A,"function"==typeof S?S(x):S.current=x}}Kl=Kl.nextEffect}}catch(e){if(null===Kl)throw Error(i(330));Fs(Kl,e),Kl=Kl.nextEffect}}while(null!==Kl);Kl=null,Fo(),Nl=o}else e.current=n;if(Gl)Gl=!1,Jl=e,Zl=t;else for(Kl=r;null!==Kl;)t=Kl.nextEffect,Kl.nextEffect=null,8&Kl.flags&&((k=Kl).sibling=null,k.stateNode=null),Kl=t;if(0===(r=e.pendingLanes)&&(Yl=null),1===r?e===os?rs++:(rs=0,os=e):rs=0,n=n.stateNode,So&&"function"==typeof So.onCommitFiberRoot)try{So.onCommitFiberRoot(ko,n,void 0,!(64&~n.current.flags))}catch(e){}if(ms(e,Vo()),Xl)throw Xl=!1,e=Ql,Ql=null,e;return 8&Nl||Xo(),null}function Ms(){for(;null!==Kl;){var e=Kl.alternate;us||null===ss||(8&Kl.flags?Ze(Kl,ss)&&(us=!0):13===Kl.tag&&Cl(e,Kl)&&Ze(Kl,ss)&&(us=!0));var t=Kl.flags;256&t&&ml(e,Kl),!(512&t)||Gl||(Gl=!0,Ko(97,(function(){return Ls(),null}))),Kl=Kl.nextEffect}}function Ls(){if(90!==Zl){var e=97<Zl?97:Zl;return Zl=90,qo(e,Is)}return!1}function zs(e,t){es.push(t,e),Gl||(Gl=!0,Ko(97,(function(){return Ls(),null})))}function _s(e,t){ts.push(t,e),Gl||(Gl=!0,Ko(97,(function(){return Ls(),null})))}function Is(){if(null===Jl)return!1;var e=Jl;if(Jl=null,48&Nl)throw Error(i(331));var t=Nl;Nl|=32;var n=ts;ts=[];for(var r=0;r<n.length;r+=2){var o=n[r],a=n[r+1],l=o.destroy;if(o.destroy=void 0,"function"==typeof l)try{l()}catch(e){if(null===a)throw Error(i(330));Fs(a,e)}}for(n=es,es=[],r=0;r<n.length;r+=2){o=n[r],a=n[r+1];try{var s=o.create;o.destroy=s()}catch(e){if(null===a)throw Error(i(330));Fs(a,e)}}for(s=e.current.firstEffect;null!==s;)e=s.nextEffect,s.nextEffect=null,8&s.flags&&(s.sibling=null,s.stateNode=null),s=e;return Nl=t,Xo(),!0}function Ds(e,t,n){da(e,t=cl(0,t=ll(n,t),1)),t=cs(),null!==(e=ps(e,1))&&($t(e,1,t),ms(e,t))}function Fs(e,t){if(3===e.tag)Ds(e,e,t);else for(var n=e.return;null!==n;){if(3===n.tag){Ds(n,e,t);break}if(1===n.tag){var r=n.stateNode;if("function"==typeof n.type.getDerivedStateFromError||"function"==typeof r.componentDidCatch&&(null===Yl||!Yl.has(r))){var o=dl(n,e=ll(t,e),1);if(da(n,o),o=cs(),null!==(n=ps(n,1)))$t(n,1,o),ms(n,o);else if("function"==typeof r.componentDidCatch&&(null===Yl||!Yl.has(r)))try{r.componentDidCatch(t,e)}catch(e){}break}}n=n.return}}function js(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),t=cs(),e.pingedLanes|=e.suspendedLanes&n,Ol===e&&(Ll&n)===n&&(4===Il||3===Il&&(62914560&Ll)===Ll&&500>Vo()-Vl?Es(e,0):Wl|=n),ms(e,t)}function Bs(e,t){var n=e.stateNode;null!==n&&n.delete(t),0==(t=0)&&(2&(t=e.mode)?4&t?(0===is&&(is=Fl),0===(t=Bt(62914560&~is))&&(t=4194304)):t=99===Ho()?1:2:t=1),n=cs(),null!==(e=ps(e,t))&&($t(e,t,n),ms(e,n))}function Ws(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.flags=0,this.lastEffect=this.firstEffect=this.nextEffect=null,this.childLanes=this.lanes=0,this.alternate=null}function $s(e,t,n,r){return new Ws(e,t,n,r)}function Vs(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Hs(e,t){var n=e.alternate;return null===n?((n=$s(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.nextEffect=null,n.firstEffect=null,n.lastEffect=null),n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Us(e,t,n,r,o,a){var l=2;if(r=e,"function"==typeof e)Vs(e)&&(l=1);else if("string"==typeof e)l=5;else e:switch(e){case S:return qs(n.children,o,a,t);case I:l=8,o|=16;break;case A:l=8,o|=1;break;case C:return(e=$s(12,n,t,8|o)).elementType=C,e.type=C,e.lanes=a,e;case N:return(e=$s(13,n,t,o)).type=N,e.elementType=N,e.lanes=a,e;case O:return(e=$s(19,n,t,o)).elementType=O,e.lanes=a,e;case D:return Ks(n,o,a,t);case F:return(e=$s(24,n,t,o)).elementType=F,e.lanes=a,e;default:if("object"==typeof e&&null!==e)switch(e.$$typeof){case R:l=10;break e;case P:l=9;break e;case T:l=11;break e;case M:l=14;break e;case L:l=16,r=null;break e;case z:l=22;break e}throw Error(i(130,null==e?e:typeof e,""))}return(t=$s(l,n,t,o)).elementType=e,t.type=r,t.lanes=a,t}function qs(e,t,n,r){return(e=$s(7,e,r,t)).lanes=n,e}function Ks(e,t,n,r){return(e=$s(23,e,r,t)).elementType=D,e.lanes=n,e}function Xs(e,t,n){return(e=$s(6,e,null,t)).lanes=n,e}function Qs(e,t,n){return(t=$s(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Ys(e,t,n){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.pendingContext=this.context=null,this.hydrate=n,this.callbackNode=null,this.callbackPriority=0,this.eventTimes=Wt(0),this.expirationTimes=Wt(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=Wt(0),this.mutableSourceEagerHydrationData=null}function Gs(e,t,n,r){var o=t.current,a=cs(),l=ds(o);e:if(n){t:{if(Qe(n=n._reactInternals)!==n||1!==n.tag)throw Error(i(170));var s=n;do{switch(s.tag){case 3:s=s.stateNode.context;break t;case 1:if(go(s.type)){s=s.stateNode.__reactInternalMemoizedMergedChildContext;break t}}s=s.return}while(null!==s);throw Error(i(171))}if(1===n.tag){var u=n.type;if(go(u)){n=xo(n,u,s);break e}}n=s}else n=fo;return null===t.context?t.context=n:t.pendingContext=n,(t=ca(a,l)).payload={element:e},null!==(r=void 0===r?null:r)&&(t.callback=r),da(o,t),fs(o,l,a),l}function Js(e){return(e=e.current).child?(e.child.tag,e.child.stateNode):null}function Zs(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function eu(e,t){Zs(e,t),(e=e.alternate)&&Zs(e,t)}function tu(e,t,n){var r=null!=n&&null!=n.hydrationOptions&&n.hydrationOptions.mutableSources||null;if(n=new Ys(e,t,null!=n&&!0===n.hydrate),t=$s(3,null,null,2===t?7:1===t?3:0),n.current=t,t.stateNode=n,sa(t),e[Zr]=n.current,Or(8===e.nodeType?e.parentNode:e),r)for(e=0;e<r.length;e++){var o=(t=r[e])._getVersion;o=o(t._source),null==n.mutableSourceEagerHydrationData?n.mutableSourceEagerHydrationData=[t,o]:n.mutableSourceEagerHydrationData.push(t,o)}this._internalRoot=n}function nu(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function ru(e,t,n,r,o){var a=n._reactRootContainer;if(a){var i=a._internalRoot;if("function"==typeof o){var l=o;o=function(){var e=Js(i);l.call(e)}}Gs(t,i,e,o)}else{if(a=n._reactRootContainer=function(e,t){if(t||(t=!(!(t=e?9===e.nodeType?e.documentElement:e.firstChild:null)||1!==t.nodeType||!t.hasAttribute("data-reactroot"))),!t)for(var n;n=e.lastChild;)e.removeChild(n);return new tu(e,0,t?{hydrate:!0}:void 0)}(n,r),i=a._internalRoot,"function"==typeof o){var s=o;o=function(){var e=Js(i);s.call(e)}}bs((function(){Gs(t,i,e,o)}))}return Js(i)}function ou(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!nu(t))throw Error(i(200));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:k,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)}ql=function(e,t,n){var r=t.lanes;if(null!==e)if(e.memoizedProps!==t.pendingProps||mo.current)Ii=!0;else{if(!(n&r)){switch(Ii=!1,t.tag){case 3:qi(t),Ka();break;case 5:_a(t);break;case 1:go(t.type)&&wo(t);break;case 4:La(t,t.stateNode.containerInfo);break;case 10:r=t.memoizedProps.value;var o=t.type._context;co(Jo,o._currentValue),o._currentValue=r;break;case 13:if(null!==t.memoizedState)return n&t.child.childLanes?Ji(e,t,n):(co(Da,1&Da.current),null!==(t=rl(e,t,n))?t.sibling:null);co(Da,1&Da.current);break;case 19:if(r=!!(n&t.childLanes),64&e.flags){if(r)return nl(e,t,n);t.flags|=64}if(null!==(o=t.memoizedState)&&(o.rendering=null,o.tail=null,o.lastEffect=null),co(Da,Da.current),r)break;return null;case 23:case 24:return t.lanes=0,Wi(e,t,n)}return rl(e,t,n)}Ii=!!(16384&e.flags)}else Ii=!1;switch(t.lanes=0,t.tag){case 2:if(r=t.type,null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2),e=t.pendingProps,o=vo(t,po.current),aa(t,n),o=ii(null,t,r,e,o,n),t.flags|=1,"object"==typeof o&&null!==o&&"function"==typeof o.render&&void 0===o.$$typeof){if(t.tag=1,t.memoizedState=null,t.updateQueue=null,go(r)){var a=!0;wo(t)}else a=!1;t.memoizedState=null!==o.state&&void 0!==o.state?o.state:null,sa(t);var l=r.getDerivedStateFromProps;"function"==typeof l&&va(t,r,l,e),o.updater=ga,t.stateNode=o,o._reactInternals=t,wa(t,r,e,n),t=Ui(null,t,r,!0,a,n)}else t.tag=0,Di(null,t,o,n),t=t.child;return t;case 16:o=t.elementType;e:{switch(null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2),e=t.pendingProps,o=(a=o._init)(o._payload),t.type=o,a=t.tag=function(e){if("function"==typeof e)return Vs(e)?1:0;if(null!=e){if((e=e.$$typeof)===T)return 11;if(e===M)return 14}return 2}(o),e=Go(o,e),a){case 0:t=Vi(null,t,o,e,n);break e;case 1:t=Hi(null,t,o,e,n);break e;case 11:t=Fi(null,t,o,e,n);break e;case 14:t=ji(null,t,o,Go(o.type,e),r,n);break e}throw Error(i(306,o,""))}return t;case 0:return r=t.type,o=t.pendingProps,Vi(e,t,r,o=t.elementType===r?o:Go(r,o),n);case 1:return r=t.type,o=t.pendingProps,Hi(e,t,r,o=t.elementType===r?o:Go(r,o),n);case 3:if(qi(t),r=t.updateQueue,null===e||null===r)throw Error(i(282));if(r=t.pendingProps,o=null!==(o=t.memoizedState)?o.element:null,ua(e,t),pa(t,r,null,n),(r=t.memoizedState.element)===o)Ka(),t=rl(e,t,n);else{if((a=(o=t.stateNode).hydrate)&&(Ba=Kr(t.stateNode.containerInfo.firstChild),ja=t,a=Wa=!0),a){if(null!=(e=o.mutableSourceEagerHydrationData))for(o=0;o<e.length;o+=2)(a=e[o])._workInProgressVersionPrimary=e[o+1],Xa.push(a);for(n=Ra(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|1024,n=n.sibling}else Di(e,t,r,n),Ka();t=t.child}return t;case 5:return _a(t),null===e&&Ha(t),r=t.type,o=t.pendingProps,a=null!==e?e.memoizedProps:null,l=o.children,Vr(r,o)?l=null:null!==a&&Vr(r,a)&&(t.flags|=16),$i(e,t),Di(e,t,l,n),t.child;case 6:return null===e&&Ha(t),null;case 13:return Ji(e,t,n);case 4:return La(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=Ca(t,null,r,n):Di(e,t,r,n),t.child;case 11:return r=t.type,o=t.pendingProps,Fi(e,t,r,o=t.elementType===r?o:Go(r,o),n);case 7:return Di(e,t,t.pendingProps,n),t.child;case 8:case 12:return Di(e,t,t.pendingProps.children,n),t.child;case 10:e:{r=t.type._context,o=t.pendingProps,l=t.memoizedProps,a=o.value;var s=t.type._context;if(co(Jo,s._currentValue),s._currentValue=a,null!==l)if(s=l.value,0==(a=ur(s,a)?0:0|("function"==typeof r._calculateChangedBits?r._calculateChangedBits(s,a):1073741823))){if(l.children===o.children&&!mo.current){t=rl(e,t,n);break e}}else for(null!==(s=t.child)&&(s.return=t);null!==s;){var u=s.dependencies;if(null!==u){l=s.child;for(var c=u.firstContext;null!==c;){if(c.context===r&&c.observedBits&a){1===s.tag&&((c=ca(-1,n&-n)).tag=2,da(s,c)),s.lanes|=n,null!==(c=s.alternate)&&(c.lanes|=n),oa(s.return,n),u.lanes|=n;break}c=c.next}}else l=10===s.tag&&s.type===t.type?null:s.child;if(null!==l)l.return=s;else for(l=s;null!==l;){if(l===t){l=null;break}if(null!==(s=l.sibling)){s.return=l.return,l=s;break}l=l.return}s=l}Di(e,t,o.children,n),t=t.child}return t;case 9:return o=t.type,r=(a=t.pendingProps).children,aa(t,n),r=r(o=ia(o,a.unstable_observedBits)),t.flags|=1,Di(e,t,r,n),t.child;case 14:return a=Go(o=t.type,t.pendingProps),ji(e,t,o,a=Go(o.type,a),r,n);case 15:return Bi(e,t,t.type,t.pendingProps,r,n);case 17:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:Go(r,o),null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2),t.tag=1,go(r)?(e=!0,wo(t)):e=!1,aa(t,n),ba(t,r,o),wa(t,r,o,n),Ui(null,t,r,!0,e,n);case 19:return nl(e,t,n);case 23:case 24:return Wi(e,t,n)}throw Error(i(156,t.tag))},tu.prototype.render=function(e){Gs(e,this._internalRoot,null,null)},tu.prototype.unmount=function(){var e=this._internalRoot,t=e.containerInfo;Gs(null,e,null,(function(){t[Zr]=null}))},et=function(e){13===e.tag&&(fs(e,4,cs()),eu(e,4))},tt=function(e){13===e.tag&&(fs(e,67108864,cs()),eu(e,67108864))},nt=function(e){if(13===e.tag){var t=cs(),n=ds(e);fs(e,n,t),eu(e,n)}},rt=function(e,t){return t()},Ce=function(e,t,n){switch(t){case"input":if(ne(e,n),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var o=oo(r);if(!o)throw Error(i(90));G(r),ne(r,o)}}}break;case"textarea":ue(e,n);break;case"select":null!=(t=n.value)&&ie(e,!!n.multiple,t,!1)}},Me=ys,Le=function(e,t,n,r,o){var a=Nl;Nl|=4;try{return qo(98,e.bind(null,t,n,r,o))}finally{0===(Nl=a)&&(Ul(),Xo())}},ze=function(){!(49&Nl)&&(function(){if(null!==ns){var e=ns;ns=null,e.forEach((function(e){e.expiredLanes|=24&e.pendingLanes,ms(e,Vo())}))}Xo()}(),Ls())},_e=function(e,t){var n=Nl;Nl|=2;try{return e(t)}finally{0===(Nl=n)&&(Ul(),Xo())}};var au={Events:[no,ro,oo,Ne,Oe,Ls,{current:!1}]},iu={findFiberByHostInstance:to,bundleType:0,version:"17.0.2",rendererPackageName:"react-dom"},lu={bundleType:iu.bundleType,version:iu.version,rendererPackageName:iu.rendererPackageName,rendererConfig:iu.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:w.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=Je(e))?null:e.stateNode},findFiberByHostInstance:iu.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null};if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var su=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!su.isDisabled&&su.supportsFiber)try{ko=su.inject(lu),So=su}catch(he){}}t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=au,t.createPortal=ou,t.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var t=e._reactInternals;if(void 0===t){if("function"==typeof e.render)throw Error(i(188));throw Error(i(268,Object.keys(e)))}return null===(e=Je(t))?null:e.stateNode},t.flushSync=function(e,t){var n=Nl;if(48&n)return e(t);Nl|=1;try{if(e)return qo(99,e.bind(null,t))}finally{Nl=n,Xo()}},t.hydrate=function(e,t,n){if(!nu(t))throw Error(i(200));return ru(null,e,t,!0,n)},t.render=function(e,t,n){if(!nu(t))throw Error(i(200));return ru(null,e,t,!1,n)},t.unmountComponentAtNode=function(e){if(!nu(e))throw Error(i(40));return!!e._reactRootContainer&&(bs((function(){ru(null,null,e,!1,(function(){e._reactRootContainer=null,e[Zr]=null}))})),!0)},t.unstable_batchedUpdates=ys,t.unstable_createPortal=function(e,t){return ou(e,t,2<arguments.length&&void 0!==arguments[2]?arguments[2]:null)},t.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!nu(n))throw Error(i(200));if(null==e||void 0===e._reactInternals)throw Error(i(38));return ru(e,t,n,!1,r)},t.version="17.0.2"},2611:(e,t,n)=>{"use strict";n.d(t,{A:()=>rn});var r=n(45),o=n(8168),a=n(6540),i="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e};const l="object"===("undefined"==typeof window?"undefined":i(window))&&"object"===("undefined"==typeof document?"undefined":i(document))&&9===document.nodeType;var s=n(2901),u=n(5540),c=n(9417),d=n(8587),f={}.constructor;function p(e){if(null==e||"object"!=typeof e)return e;if(Array.isArray(e))return e.map(p);if(e.constructor!==f)return e;var t={};for(var n in e)t[n]=p(e[n]);return t}function m(e,t,n){void 0===e&&(e="unnamed");var r=n.jss,o=p(t);return r.plugins.onCreateRule(e,o,n)||(e[0],null)}var h=function(e,t){for(var n="",r=0;r<e.length&&"!important"!==e[r];r++)n&&(n+=t),n+=e[r];return n},v=function(e){if(!Array.isArray(e))return e;var t="";if(Array.isArray(e[0]))for(var n=0;n<e.length&&"!important"!==e[n];n++)t&&(t+=", "),t+=h(e[n]," ");else t=h(e,", ");return"!important"===e[e.length-1]&&(t+=" !important"),t};function g(e){return e&&!1===e.format?{linebreak:"",space:""}:{linebreak:"\n",space:" "}}function y(e,t){for(var n="",r=0;r<t;r++)n+="  ";return n+e}function b(e,t,n){void 0===n&&(n={});var r="";if(!t)return r;var o=n.indent,a=void 0===o?0:o,i=t.fallbacks;!1===n.format&&(a=-1/0);var l=g(n),s=l.linebreak,u=l.space;if(e&&a++,i)if(Array.isArray(i))for(var c=0;c<i.length;c++){var d=i[c];for(var f in d){var p=d[f];null!=p&&(r&&(r+=s),r+=y(f+":"+u+v(p)+";",a))}}else for(var m in i){var h=i[m];null!=h&&(r&&(r+=s),r+=y(m+":"+u+v(h)+";",a))}for(var b in t){var x=t[b];null!=x&&"fallbacks"!==b&&(r&&(r+=s),r+=y(b+":"+u+v(x)+";",a))}return(r||n.allowEmpty)&&e?(r&&(r=""+s+r+s),y(""+e+u+"{"+r,--a)+y("}",a)):r}var x=/([[\].#*$><+~=|^:(),"'`\s])/g,w="undefined"!=typeof CSS&&CSS.escape,E=function(e){return w?w(e):e.replace(x,"\\$1")},k=function(){function e(e,t,n){this.type="style",this.isProcessed=!1;var r=n.sheet,o=n.Renderer;this.key=e,this.options=n,this.style=t,r?this.renderer=r.renderer:o&&(this.renderer=new o)}return e.prototype.prop=function(e,t,n){if(void 0===t)return this.style[e];var r=!!n&&n.force;if(!r&&this.style[e]===t)return this;var o=t;n&&!1===n.process||(o=this.options.jss.plugins.onChangeValue(t,e,this));var a=null==o||!1===o,i=e in this.style;if(a&&!i&&!r)return this;var l=a&&i;if(l?delete this.style[e]:this.style[e]=o,this.renderable&&this.renderer)return l?this.renderer.removeProperty(this.renderable,e):this.renderer.setProperty(this.renderable,e,o),this;var s=this.options.sheet;return s&&s.attached,this},e}(),S=function(e){function t(t,n,r){var o;o=e.call(this,t,n,r)||this;var a=r.selector,i=r.scoped,l=r.sheet,s=r.generateId;return a?o.selectorText=a:!1!==i&&(o.id=s((0,c.A)((0,c.A)(o)),l),o.selectorText="."+E(o.id)),o}(0,u.A)(t,e);var n=t.prototype;return n.applyTo=function(e){var t=this.renderer;if(t){var n=this.toJSON();for(var r in n)t.setProperty(e,r,n[r])}return this},n.toJSON=function(){var e={};for(var t in this.style){var n=this.style[t];"object"!=typeof n?e[t]=n:Array.isArray(n)&&(e[t]=v(n))}return e},n.toString=function(e){var t=this.options.sheet,n=t&&t.options.link?(0,o.A)({},e,{allowEmpty:!0}):e;return b(this.selectorText,this.style,n)},(0,s.A)(t,[{key:"selector",set:function(e){if(e!==this.selectorText){this.selectorText=e;var t=this.renderer,n=this.renderable;n&&t&&(t.setSelector(n,e)||t.replaceRule(n,this))}},get:function(){return this.selectorText}}]),t}(k),A={onCreateRule:function(e,t,n){return"@"===e[0]||n.parent&&"keyframes"===n.parent.type?null:new S(e,t,n)}},C={indent:1,children:!0},R=/@([\w-]+)/,P=function(){function e(e,t,n){this.type="conditional",this.isProcessed=!1,this.key=e;var r=e.match(R);for(var a in this.at=r?r[1]:"unknown",this.query=n.name||"@"+this.at,this.options=n,this.rules=new J((0,o.A)({},n,{parent:this})),t)this.rules.add(a,t[a]);this.rules.process()}var t=e.prototype;return t.getRule=function(e){return this.rules.get(e)},t.indexOf=function(e){return this.rules.indexOf(e)},t.addRule=function(e,t,n){var r=this.rules.add(e,t,n);return r?(this.options.jss.plugins.onProcessRule(r),r):null},t.replaceRule=function(e,t,n){var r=this.rules.replace(e,t,n);return r&&this.options.jss.plugins.onProcessRule(r),r},t.toString=function(e){void 0===e&&(e=C);var t=g(e).linebreak;if(null==e.indent&&(e.indent=C.indent),null==e.children&&(e.children=C.children),!1===e.children)return this.query+" {}";var n=this.rules.toString(e);return n?this.query+" {"+t+n+t+"}":""},e}(),T=/@container|@media|@supports\s+/,N={onCreateRule:function(e,t,n){return T.test(e)?new P(e,t,n):null}},O={indent:1,children:!0},M=/@keyframes\s+([\w-]+)/,L=function(){function e(e,t,n){this.type="keyframes",this.at="@keyframes",this.isProcessed=!1;var r=e.match(M);r&&r[1]?this.name=r[1]:this.name="noname",this.key=this.type+"-"+this.name,this.options=n;var a=n.scoped,i=n.sheet,l=n.generateId;for(var s in this.id=!1===a?this.name:E(l(this,i)),this.rules=new J((0,o.A)({},n,{parent:this})),t)this.rules.add(s,t[s],(0,o.A)({},n,{parent:this}));this.rules.process()}return e.prototype.toString=function(e){void 0===e&&(e=O);var t=g(e).linebreak;if(null==e.indent&&(e.indent=O.indent),null==e.children&&(e.children=O.children),!1===e.children)return this.at+" "+this.id+" {}";var n=this.rules.toString(e);return n&&(n=""+t+n+t),this.at+" "+this.id+" {"+n+"}"},e}(),z=/@keyframes\s+/,_=/\$([\w-]+)/g,I=function(e,t){return"string"==typeof e?e.replace(_,(function(e,n){return n in t?t[n]:e})):e},D=function(e,t,n){var r=e[t],o=I(r,n);o!==r&&(e[t]=o)},F={onCreateRule:function(e,t,n){return"string"==typeof e&&z.test(e)?new L(e,t,n):null},onProcessStyle:function(e,t,n){return"style"===t.type&&n?("animation-name"in e&&D(e,"animation-name",n.keyframes),"animation"in e&&D(e,"animation",n.keyframes),e):e},onChangeValue:function(e,t,n){var r=n.options.sheet;if(!r)return e;switch(t){case"animation":case"animation-name":return I(e,r.keyframes);default:return e}}},j=function(e){function t(){return e.apply(this,arguments)||this}return(0,u.A)(t,e),t.prototype.toString=function(e){var t=this.options.sheet,n=t&&t.options.link?(0,o.A)({},e,{allowEmpty:!0}):e;return b(this.key,this.style,n)},t}(k),B={onCreateRule:function(e,t,n){return n.parent&&"keyframes"===n.parent.type?new j(e,t,n):null}},W=function(){function e(e,t,n){this.type="font-face",this.at="@font-face",this.isProcessed=!1,this.key=e,this.style=t,this.options=n}return e.prototype.toString=function(e){var t=g(e).linebreak;if(Array.isArray(this.style)){for(var n="",r=0;r<this.style.length;r++)n+=b(this.at,this.style[r]),this.style[r+1]&&(n+=t);return n}return b(this.at,this.style,e)},e}(),$=/@font-face/,V={onCreateRule:function(e,t,n){return $.test(e)?new W(e,t,n):null}},H=function(){function e(e,t,n){this.type="viewport",this.at="@viewport",this.isProcessed=!1,this.key=e,this.style=t,this.options=n}return e.prototype.toString=function(e){return b(this.key,this.style,e)},e}(),U={onCreateRule:function(e,t,n){return"@viewport"===e||"@-ms-viewport"===e?new H(e,t,n):null}},q=function(){function e(e,t,n){this.type="simple",this.isProcessed=!1,this.key=e,this.value=t,this.options=n}return e.prototype.toString=function(e){if(Array.isArray(this.value)){for(var t="",n=0;n<this.value.length;n++)t+=this.key+" "+this.value[n]+";",this.value[n+1]&&(t+="\n");return t}return this.key+" "+this.value+";"},e}(),K={"@charset":!0,"@import":!0,"@namespace":!0},X={onCreateRule:function(e,t,n){return e in K?new q(e,t,n):null}},Q=[A,N,F,B,V,U,X],Y={process:!0},G={force:!0,process:!0},J=function(){function e(e){this.map={},this.raw={},this.index=[],this.counter=0,this.options=e,this.classes=e.classes,this.keyframes=e.keyframes}var t=e.prototype;return t.add=function(e,t,n){var r=this.options,a=r.parent,i=r.sheet,l=r.jss,s=r.Renderer,u=r.generateId,c=r.scoped,d=(0,o.A)({classes:this.classes,parent:a,sheet:i,jss:l,Renderer:s,generateId:u,scoped:c,name:e,keyframes:this.keyframes,selector:void 0},n),f=e;e in this.raw&&(f=e+"-d"+this.counter++),this.raw[f]=t,f in this.classes&&(d.selector="."+E(this.classes[f]));var p=m(f,t,d);if(!p)return null;this.register(p);var h=void 0===d.index?this.index.length:d.index;return this.index.splice(h,0,p),p},t.replace=function(e,t,n){var r=this.get(e),a=this.index.indexOf(r);r&&this.remove(r);var i=n;return-1!==a&&(i=(0,o.A)({},n,{index:a})),this.add(e,t,i)},t.get=function(e){return this.map[e]},t.remove=function(e){this.unregister(e),delete this.raw[e.key],this.index.splice(this.index.indexOf(e),1)},t.indexOf=function(e){return this.index.indexOf(e)},t.process=function(){var e=this.options.jss.plugins;this.index.slice(0).forEach(e.onProcessRule,e)},t.register=function(e){this.map[e.key]=e,e instanceof S?(this.map[e.selector]=e,e.id&&(this.classes[e.key]=e.id)):e instanceof L&&this.keyframes&&(this.keyframes[e.name]=e.id)},t.unregister=function(e){delete this.map[e.key],e instanceof S?(delete this.map[e.selector],delete this.classes[e.key]):e instanceof L&&delete this.keyframes[e.name]},t.update=function(){var e,t,n;if("string"==typeof(arguments.length<=0?void 0:arguments[0])?(e=arguments.length<=0?void 0:arguments[0],t=arguments.length<=1?void 0:arguments[1],n=arguments.length<=2?void 0:arguments[2]):(t=arguments.length<=0?void 0:arguments[0],n=arguments.length<=1?void 0:arguments[1],e=null),e)this.updateOne(this.get(e),t,n);else for(var r=0;r<this.index.length;r++)this.updateOne(this.index[r],t,n)},t.updateOne=function(t,n,r){void 0===r&&(r=Y);var o=this.options,a=o.jss.plugins,i=o.sheet;if(t.rules instanceof e)t.rules.update(n,r);else{var l=t.style;if(a.onUpdate(n,t,i,r),r.process&&l&&l!==t.style){for(var s in a.onProcessStyle(t.style,t,i),t.style){var u=t.style[s];u!==l[s]&&t.prop(s,u,G)}for(var c in l){var d=t.style[c],f=l[c];null==d&&d!==f&&t.prop(c,null,G)}}}},t.toString=function(e){for(var t="",n=this.options.sheet,r=!!n&&n.options.link,o=g(e).linebreak,a=0;a<this.index.length;a++){var i=this.index[a].toString(e);(i||r)&&(t&&(t+=o),t+=i)}return t},e}(),Z=function(){function e(e,t){for(var n in this.attached=!1,this.deployed=!1,this.classes={},this.keyframes={},this.options=(0,o.A)({},t,{sheet:this,parent:this,classes:this.classes,keyframes:this.keyframes}),t.Renderer&&(this.renderer=new t.Renderer(this)),this.rules=new J(this.options),e)this.rules.add(n,e[n]);this.rules.process()}var t=e.prototype;return t.attach=function(){return this.attached||(this.renderer&&this.renderer.attach(),this.attached=!0,this.deployed||this.deploy()),this},t.detach=function(){return this.attached?(this.renderer&&this.renderer.detach(),this.attached=!1,this):this},t.addRule=function(e,t,n){var r=this.queue;this.attached&&!r&&(this.queue=[]);var o=this.rules.add(e,t,n);return o?(this.options.jss.plugins.onProcessRule(o),this.attached?this.deployed?(r?r.push(o):(this.insertRule(o),this.queue&&(this.queue.forEach(this.insertRule,this),this.queue=void 0)),o):o:(this.deployed=!1,o)):null},t.replaceRule=function(e,t,n){var r=this.rules.get(e);if(!r)return this.addRule(e,t,n);var o=this.rules.replace(e,t,n);return o&&this.options.jss.plugins.onProcessRule(o),this.attached?this.deployed?(this.renderer&&(o?r.renderable&&this.renderer.replaceRule(r.renderable,o):this.renderer.deleteRule(r)),o):o:(this.deployed=!1,o)},t.insertRule=function(e){this.renderer&&this.renderer.insertRule(e)},t.addRules=function(e,t){var n=[];for(var r in e){var o=this.addRule(r,e[r],t);o&&n.push(o)}return n},t.getRule=function(e){return this.rules.get(e)},t.deleteRule=function(e){var t="object"==typeof e?e:this.rules.get(e);return!(!t||this.attached&&!t.renderable)&&(this.rules.remove(t),!(this.attached&&t.renderable&&this.renderer)||this.renderer.deleteRule(t.renderable))},t.indexOf=function(e){return this.rules.indexOf(e)},t.deploy=function(){return this.renderer&&this.renderer.deploy(),this.deployed=!0,this},t.update=function(){var e;return(e=this.rules).update.apply(e,arguments),this},t.updateOne=function(e,t,n){return this.rules.updateOne(e,t,n),this},t.toString=function(e){return this.rules.toString(e)},e}(),ee=function(){function e(){this.plugins={internal:[],external:[]},this.registry={}}var t=e.prototype;return t.onCreateRule=function(e,t,n){for(var r=0;r<this.registry.onCreateRule.length;r++){var o=this.registry.onCreateRule[r](e,t,n);if(o)return o}return null},t.onProcessRule=function(e){if(!e.isProcessed){for(var t=e.options.sheet,n=0;n<this.registry.onProcessRule.length;n++)this.registry.onProcessRule[n](e,t);e.style&&this.onProcessStyle(e.style,e,t),e.isProcessed=!0}},t.onProcessStyle=function(e,t,n){for(var r=0;r<this.registry.onProcessStyle.length;r++)t.style=this.registry.onProcessStyle[r](t.style,t,n)},t.onProcessSheet=function(e){for(var t=0;t<this.registry.onProcessSheet.length;t++)this.registry.onProcessSheet[t](e)},t.onUpdate=function(e,t,n,r){for(var o=0;o<this.registry.onUpdate.length;o++)this.registry.onUpdate[o](e,t,n,r)},t.onChangeValue=function(e,t,n){for(var r=e,o=0;o<this.registry.onChangeValue.length;o++)r=this.registry.onChangeValue[o](r,t,n);return r},t.use=function(e,t){void 0===t&&(t={queue:"external"});var n=this.plugins[t.queue];-1===n.indexOf(e)&&(n.push(e),this.registry=[].concat(this.plugins.external,this.plugins.internal).reduce((function(e,t){for(var n in t)n in e&&e[n].push(t[n]);return e}),{onCreateRule:[],onProcessRule:[],onProcessStyle:[],onProcessSheet:[],onChangeValue:[],onUpdate:[]}))},e}(),te=function(){function e(){this.registry=[]}var t=e.prototype;return t.add=function(e){var t=this.registry,n=e.options.index;if(-1===t.indexOf(e))if(0===t.length||n>=this.index)t.push(e);else for(var r=0;r<t.length;r++)if(t[r].options.index>n)return void t.splice(r,0,e)},t.reset=function(){this.registry=[]},t.remove=function(e){var t=this.registry.indexOf(e);this.registry.splice(t,1)},t.toString=function(e){for(var t=void 0===e?{}:e,n=t.attached,r=(0,d.A)(t,["attached"]),o=g(r).linebreak,a="",i=0;i<this.registry.length;i++){var l=this.registry[i];null!=n&&l.attached!==n||(a&&(a+=o),a+=l.toString(r))}return a},(0,s.A)(e,[{key:"index",get:function(){return 0===this.registry.length?0:this.registry[this.registry.length-1].options.index}}]),e}(),ne=new te,re="undefined"!=typeof globalThis?globalThis:"undefined"!=typeof window&&window.Math===Math?window:"undefined"!=typeof self&&self.Math===Math?self:Function("return this")(),oe="2f1acc6c3a606b082e5eef5e54414ffb";null==re[oe]&&(re[oe]=0);var ae=re[oe]++,ie=function(e){void 0===e&&(e={});var t=0;return function(n,r){t+=1;var o="",a="";return r&&(r.options.classNamePrefix&&(a=r.options.classNamePrefix),null!=r.options.jss.id&&(o=String(r.options.jss.id))),e.minify?""+(a||"c")+ae+o+t:a+n.key+"-"+ae+(o?"-"+o:"")+"-"+t}},le=function(e){var t;return function(){return t||(t=e()),t}},se=function(e,t){try{return e.attributeStyleMap?e.attributeStyleMap.get(t):e.style.getPropertyValue(t)}catch(e){return""}},ue=function(e,t,n){try{var r=n;if(Array.isArray(n)&&(r=v(n)),e.attributeStyleMap)e.attributeStyleMap.set(t,r);else{var o=r?r.indexOf("!important"):-1,a=o>-1?r.substr(0,o-1):r;e.style.setProperty(t,a,o>-1?"important":"")}}catch(e){return!1}return!0},ce=function(e,t){try{e.attributeStyleMap?e.attributeStyleMap.delete(t):e.style.removeProperty(t)}catch(e){}},de=function(e,t){return e.selectorText=t,e.selectorText===t},fe=le((function(){return document.querySelector("head")}));var pe=le((function(){var e=document.querySelector('meta[property="csp-nonce"]');return e?e.getAttribute("content"):null})),me=function(e,t,n){try{"insertRule"in e?e.insertRule(t,n):"appendRule"in e&&e.appendRule(t)}catch(e){return!1}return e.cssRules[n]},he=function(e,t){var n=e.cssRules.length;return void 0===t||t>n?n:t},ve=function(){function e(e){this.getPropertyValue=se,this.setProperty=ue,this.removeProperty=ce,this.setSelector=de,this.hasInsertedRules=!1,this.cssRules=[],e&&ne.add(e),this.sheet=e;var t=this.sheet?this.sheet.options:{},n=t.media,r=t.meta,o=t.element;this.element=o||function(){var e=document.createElement("style");return e.textContent="\n",e}(),this.element.setAttribute("data-jss",""),n&&this.element.setAttribute("media",n),r&&this.element.setAttribute("data-meta",r);var a=pe();a&&this.element.setAttribute("nonce",a)}var t=e.prototype;return t.attach=function(){if(!this.element.parentNode&&this.sheet){!function(e,t){var n=t.insertionPoint,r=function(e){var t=ne.registry;if(t.length>0){var n=function(e,t){for(var n=0;n<e.length;n++){var r=e[n];if(r.attached&&r.options.index>t.index&&r.options.insertionPoint===t.insertionPoint)return r}return null}(t,e);if(n&&n.renderer)return{parent:n.renderer.element.parentNode,node:n.renderer.element};if(n=function(e,t){for(var n=e.length-1;n>=0;n--){var r=e[n];if(r.attached&&r.options.insertionPoint===t.insertionPoint)return r}return null}(t,e),n&&n.renderer)return{parent:n.renderer.element.parentNode,node:n.renderer.element.nextSibling}}var r=e.insertionPoint;if(r&&"string"==typeof r){var o=function(e){for(var t=fe(),n=0;n<t.childNodes.length;n++){var r=t.childNodes[n];if(8===r.nodeType&&r.nodeValue.trim()===e)return r}return null}(r);if(o)return{parent:o.parentNode,node:o.nextSibling}}return!1}(t);if(!1!==r&&r.parent)r.parent.insertBefore(e,r.node);else if(n&&"number"==typeof n.nodeType){var o=n,a=o.parentNode;a&&a.insertBefore(e,o.nextSibling)}else fe().appendChild(e)}(this.element,this.sheet.options);var e=Boolean(this.sheet&&this.sheet.deployed);this.hasInsertedRules&&e&&(this.hasInsertedRules=!1,this.deploy())}},t.detach=function(){if(this.sheet){var e=this.element.parentNode;e&&e.removeChild(this.element),this.sheet.options.link&&(this.cssRules=[],this.element.textContent="\n")}},t.deploy=function(){var e=this.sheet;e&&(e.options.link?this.insertRules(e.rules):this.element.textContent="\n"+e.toString()+"\n")},t.insertRules=function(e,t){for(var n=0;n<e.index.length;n++)this.insertRule(e.index[n],n,t)},t.insertRule=function(e,t,n){if(void 0===n&&(n=this.element.sheet),e.rules){var r=e,o=n;if("conditional"===e.type||"keyframes"===e.type){var a=he(n,t);if(!1===(o=me(n,r.toString({children:!1}),a)))return!1;this.refCssRule(e,a,o)}return this.insertRules(r.rules,o),o}var i=e.toString();if(!i)return!1;var l=he(n,t),s=me(n,i,l);return!1!==s&&(this.hasInsertedRules=!0,this.refCssRule(e,l,s),s)},t.refCssRule=function(e,t,n){e.renderable=n,e.options.parent instanceof Z&&this.cssRules.splice(t,0,n)},t.deleteRule=function(e){var t=this.element.sheet,n=this.indexOf(e);return-1!==n&&(t.deleteRule(n),this.cssRules.splice(n,1),!0)},t.indexOf=function(e){return this.cssRules.indexOf(e)},t.replaceRule=function(e,t){var n=this.indexOf(e);return-1!==n&&(this.element.sheet.deleteRule(n),this.cssRules.splice(n,1),this.insertRule(t,n))},t.getRules=function(){return this.element.sheet.cssRules},e}(),ge=0,ye=function(){function e(e){this.id=ge++,this.version="10.10.0",this.plugins=new ee,this.options={id:{minify:!1},createGenerateId:ie,Renderer:l?ve:null,plugins:[]},this.generateId=ie({minify:!1});for(var t=0;t<Q.length;t++)this.plugins.use(Q[t],{queue:"internal"});this.setup(e)}var t=e.prototype;return t.setup=function(e){return void 0===e&&(e={}),e.createGenerateId&&(this.options.createGenerateId=e.createGenerateId),e.id&&(this.options.id=(0,o.A)({},this.options.id,e.id)),(e.createGenerateId||e.id)&&(this.generateId=this.options.createGenerateId(this.options.id)),null!=e.insertionPoint&&(this.options.insertionPoint=e.insertionPoint),"Renderer"in e&&(this.options.Renderer=e.Renderer),e.plugins&&this.use.apply(this,e.plugins),this},t.createStyleSheet=function(e,t){void 0===t&&(t={});var n=t.index;"number"!=typeof n&&(n=0===ne.index?0:ne.index+1);var r=new Z(e,(0,o.A)({},t,{jss:this,generateId:t.generateId||this.generateId,insertionPoint:this.options.insertionPoint,Renderer:this.options.Renderer,index:n}));return this.plugins.onProcessSheet(r),r},t.removeStyleSheet=function(e){return e.detach(),ne.remove(e),this},t.createRule=function(e,t,n){if(void 0===t&&(t={}),void 0===n&&(n={}),"object"==typeof e)return this.createRule(void 0,e,t);var r=(0,o.A)({},n,{name:e,jss:this,Renderer:this.options.Renderer});r.generateId||(r.generateId=this.generateId),r.classes||(r.classes={}),r.keyframes||(r.keyframes={});var a=m(e,t,r);return a&&this.plugins.onProcessRule(a),a},t.use=function(){for(var e=this,t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];return n.forEach((function(t){e.plugins.use(t)})),this},e}(),be=function(e){return new ye(e)},xe="object"==typeof CSS&&null!=CSS&&"number"in CSS;function we(e){var t=null;for(var n in e){var r=e[n],o=typeof r;if("function"===o)t||(t={}),t[n]=r;else if("object"===o&&null!==r&&!Array.isArray(r)){var a=we(r);a&&(t||(t={}),t[n]=a)}}return t}be();var Ee=n(3043),ke={set:function(e,t,n,r){var o=e.get(t);o||(o=new Map,e.set(t,o)),o.set(n,r)},get:function(e,t,n){var r=e.get(t);return r?r.get(n):void 0},delete:function(e,t,n){e.get(t).delete(n)}};const Se=ke;var Ae=n(6061);const Ce="function"==typeof Symbol&&Symbol.for?Symbol.for("mui.nested"):"__THEME_NESTED__";var Re=["checked","disabled","error","focused","focusVisible","required","expanded","selected"],Pe=Date.now(),Te="fnValues"+Pe,Ne="fnStyle"+ ++Pe;var Oe="@global",Me=function(){function e(e,t,n){for(var r in this.type="global",this.at=Oe,this.isProcessed=!1,this.key=e,this.options=n,this.rules=new J((0,o.A)({},n,{parent:this})),t)this.rules.add(r,t[r]);this.rules.process()}var t=e.prototype;return t.getRule=function(e){return this.rules.get(e)},t.addRule=function(e,t,n){var r=this.rules.add(e,t,n);return r&&this.options.jss.plugins.onProcessRule(r),r},t.replaceRule=function(e,t,n){var r=this.rules.replace(e,t,n);return r&&this.options.jss.plugins.onProcessRule(r),r},t.indexOf=function(e){return this.rules.indexOf(e)},t.toString=function(e){return this.rules.toString(e)},e}(),Le=function(){function e(e,t,n){this.type="global",this.at=Oe,this.isProcessed=!1,this.key=e,this.options=n;var r=e.substr(8);this.rule=n.jss.createRule(r,t,(0,o.A)({},n,{parent:this}))}return e.prototype.toString=function(e){return this.rule?this.rule.toString(e):""},e}(),ze=/\s*,\s*/g;function _e(e,t){for(var n=e.split(ze),r="",o=0;o<n.length;o++)r+=t+" "+n[o].trim(),n[o+1]&&(r+=", ");return r}var Ie=/\s*,\s*/g,De=/&/g,Fe=/\$([\w-]+)/g;var je=/[A-Z]/g,Be=/^ms-/,We={};function $e(e){return"-"+e.toLowerCase()}const Ve=function(e){if(We.hasOwnProperty(e))return We[e];var t=e.replace(je,$e);return We[e]=Be.test(t)?"-"+t:t};function He(e){var t={};for(var n in e)t[0===n.indexOf("--")?n:Ve(n)]=e[n];return e.fallbacks&&(Array.isArray(e.fallbacks)?t.fallbacks=e.fallbacks.map(He):t.fallbacks=He(e.fallbacks)),t}var Ue=xe&&CSS?CSS.px:"px",qe=xe&&CSS?CSS.ms:"ms",Ke=xe&&CSS?CSS.percent:"%";function Xe(e){var t=/(-[a-z])/g,n=function(e){return e[1].toUpperCase()},r={};for(var o in e)r[o]=e[o],r[o.replace(t,n)]=e[o];return r}var Qe=Xe({"animation-delay":qe,"animation-duration":qe,"background-position":Ue,"background-position-x":Ue,"background-position-y":Ue,"background-size":Ue,border:Ue,"border-bottom":Ue,"border-bottom-left-radius":Ue,"border-bottom-right-radius":Ue,"border-bottom-width":Ue,"border-left":Ue,"border-left-width":Ue,"border-radius":Ue,"border-right":Ue,"border-right-width":Ue,"border-top":Ue,"border-top-left-radius":Ue,"border-top-right-radius":Ue,"border-top-width":Ue,"border-width":Ue,"border-block":Ue,"border-block-end":Ue,"border-block-end-width":Ue,"border-block-start":Ue,"border-block-start-width":Ue,"border-block-width":Ue,"border-inline":Ue,"border-inline-end":Ue,"border-inline-end-width":Ue,"border-inline-start":Ue,"border-inline-start-width":Ue,"border-inline-width":Ue,"border-start-start-radius":Ue,"border-start-end-radius":Ue,"border-end-start-radius":Ue,"border-end-end-radius":Ue,margin:Ue,"margin-bottom":Ue,"margin-left":Ue,"margin-right":Ue,"margin-top":Ue,"margin-block":Ue,"margin-block-end":Ue,"margin-block-start":Ue,"margin-inline":Ue,"margin-inline-end":Ue,"margin-inline-start":Ue,padding:Ue,"padding-bottom":Ue,"padding-left":Ue,"padding-right":Ue,"padding-top":Ue,"padding-block":Ue,"padding-block-end":Ue,"padding-block-start":Ue,"padding-inline":Ue,"padding-inline-end":Ue,"padding-inline-start":Ue,"mask-position-x":Ue,"mask-position-y":Ue,"mask-size":Ue,height:Ue,width:Ue,"min-height":Ue,"max-height":Ue,"min-width":Ue,"max-width":Ue,bottom:Ue,left:Ue,top:Ue,right:Ue,inset:Ue,"inset-block":Ue,"inset-block-end":Ue,"inset-block-start":Ue,"inset-inline":Ue,"inset-inline-end":Ue,"inset-inline-start":Ue,"box-shadow":Ue,"text-shadow":Ue,"column-gap":Ue,"column-rule":Ue,"column-rule-width":Ue,"column-width":Ue,"font-size":Ue,"font-size-delta":Ue,"letter-spacing":Ue,"text-decoration-thickness":Ue,"text-indent":Ue,"text-stroke":Ue,"text-stroke-width":Ue,"word-spacing":Ue,motion:Ue,"motion-offset":Ue,outline:Ue,"outline-offset":Ue,"outline-width":Ue,perspective:Ue,"perspective-origin-x":Ke,"perspective-origin-y":Ke,"transform-origin":Ke,"transform-origin-x":Ke,"transform-origin-y":Ke,"transform-origin-z":Ke,"transition-delay":qe,"transition-duration":qe,"vertical-align":Ue,"flex-basis":Ue,"shape-margin":Ue,size:Ue,gap:Ue,grid:Ue,"grid-gap":Ue,"row-gap":Ue,"grid-row-gap":Ue,"grid-column-gap":Ue,"grid-template-rows":Ue,"grid-template-columns":Ue,"grid-auto-rows":Ue,"grid-auto-columns":Ue,"box-shadow-x":Ue,"box-shadow-y":Ue,"box-shadow-blur":Ue,"box-shadow-spread":Ue,"font-line-height":Ue,"text-shadow-x":Ue,"text-shadow-y":Ue,"text-shadow-blur":Ue});function Ye(e,t,n){if(null==t)return t;if(Array.isArray(t))for(var r=0;r<t.length;r++)t[r]=Ye(e,t[r],n);else if("object"==typeof t)if("fallbacks"===e)for(var o in t)t[o]=Ye(o,t[o],n);else for(var a in t)t[a]=Ye(e+"-"+a,t[a],n);else if("number"==typeof t&&!1===isNaN(t)){var i=n[e]||Qe[e];return!i||0===t&&i===Ue?t.toString():"function"==typeof i?i(t).toString():""+t+i}return t}var Ge=n(5458),Je="",Ze="",et="",tt="",nt=l&&"ontouchstart"in document.documentElement;if(l){var rt={Moz:"-moz-",ms:"-ms-",O:"-o-",Webkit:"-webkit-"},ot=document.createElement("p").style;for(var at in rt)if(at+"Transform"in ot){Je=at,Ze=rt[at];break}"Webkit"===Je&&"msHyphens"in ot&&(Je="ms",Ze=rt.ms,tt="edge"),"Webkit"===Je&&"-apple-trailing-word"in ot&&(et="apple")}var it=Je,lt=Ze,st=et,ut=tt,ct=nt,dt={noPrefill:["appearance"],supportedProperty:function(e){return"appearance"===e&&("ms"===it?"-webkit-"+e:lt+e)}},ft={noPrefill:["color-adjust"],supportedProperty:function(e){return"color-adjust"===e&&("Webkit"===it?lt+"print-"+e:e)}},pt=/[-\s]+(.)?/g;function mt(e,t){return t?t.toUpperCase():""}function ht(e){return e.replace(pt,mt)}function vt(e){return ht("-"+e)}var gt,yt={noPrefill:["mask"],supportedProperty:function(e,t){if(!/^mask/.test(e))return!1;if("Webkit"===it){var n="mask-image";if(ht(n)in t)return e;if(it+vt(n)in t)return lt+e}return e}},bt={noPrefill:["text-orientation"],supportedProperty:function(e){return"text-orientation"===e&&("apple"!==st||ct?e:lt+e)}},xt={noPrefill:["transform"],supportedProperty:function(e,t,n){return"transform"===e&&(n.transform?e:lt+e)}},wt={noPrefill:["transition"],supportedProperty:function(e,t,n){return"transition"===e&&(n.transition?e:lt+e)}},Et={noPrefill:["writing-mode"],supportedProperty:function(e){return"writing-mode"===e&&("Webkit"===it||"ms"===it&&"edge"!==ut?lt+e:e)}},kt={noPrefill:["user-select"],supportedProperty:function(e){return"user-select"===e&&("Moz"===it||"ms"===it||"apple"===st?lt+e:e)}},St={supportedProperty:function(e,t){return!!/^break-/.test(e)&&("Webkit"===it?"WebkitColumn"+vt(e)in t&&lt+"column-"+e:"Moz"===it&&"page"+vt(e)in t&&"page-"+e)}},At={supportedProperty:function(e,t){if(!/^(border|margin|padding)-inline/.test(e))return!1;if("Moz"===it)return e;var n=e.replace("-inline","");return it+vt(n)in t&&lt+n}},Ct={supportedProperty:function(e,t){return ht(e)in t&&e}},Rt={supportedProperty:function(e,t){var n=vt(e);return"-"===e[0]||"-"===e[0]&&"-"===e[1]?e:it+n in t?lt+e:"Webkit"!==it&&"Webkit"+n in t&&"-webkit-"+e}},Pt={supportedProperty:function(e){return"scroll-snap"===e.substring(0,11)&&("ms"===it?""+lt+e:e)}},Tt={supportedProperty:function(e){return"overscroll-behavior"===e&&("ms"===it?lt+"scroll-chaining":e)}},Nt={"flex-grow":"flex-positive","flex-shrink":"flex-negative","flex-basis":"flex-preferred-size","justify-content":"flex-pack",order:"flex-order","align-items":"flex-align","align-content":"flex-line-pack"},Ot={supportedProperty:function(e,t){var n=Nt[e];return!!n&&it+vt(n)in t&&lt+n}},Mt={flex:"box-flex","flex-grow":"box-flex","flex-direction":["box-orient","box-direction"],order:"box-ordinal-group","align-items":"box-align","flex-flow":["box-orient","box-direction"],"justify-content":"box-pack"},Lt=Object.keys(Mt),zt=function(e){return lt+e},_t={supportedProperty:function(e,t,n){var r=n.multiple;if(Lt.indexOf(e)>-1){var o=Mt[e];if(!Array.isArray(o))return it+vt(o)in t&&lt+o;if(!r)return!1;for(var a=0;a<o.length;a++)if(!(it+vt(o[0])in t))return!1;return o.map(zt)}return!1}},It=[dt,ft,yt,bt,xt,wt,Et,kt,St,At,Ct,Rt,Pt,Tt,Ot,_t],Dt=It.filter((function(e){return e.supportedProperty})).map((function(e){return e.supportedProperty})),Ft=It.filter((function(e){return e.noPrefill})).reduce((function(e,t){return e.push.apply(e,(0,Ge.A)(t.noPrefill)),e}),[]),jt={};if(l){gt=document.createElement("p");var Bt=window.getComputedStyle(document.documentElement,"");for(var Wt in Bt)isNaN(Wt)||(jt[Bt[Wt]]=Bt[Wt]);Ft.forEach((function(e){return delete jt[e]}))}function $t(e,t){if(void 0===t&&(t={}),!gt)return e;if(null!=jt[e])return jt[e];"transition"!==e&&"transform"!==e||(t[e]=e in gt.style);for(var n=0;n<Dt.length&&(jt[e]=Dt[n](e,gt.style,t),!jt[e]);n++);try{gt.style[e]=""}catch(e){return!1}return jt[e]}var Vt,Ht={},Ut={transition:1,"transition-property":1,"-webkit-transition":1,"-webkit-transition-property":1},qt=/(^\s*[\w-]+)|, (\s*[\w-]+)(?![^()]*\))/g;function Kt(e,t,n){return"var"===t?"var":"all"===t?"all":"all"===n?", all":(t?$t(t):", "+$t(n))||t||n}function Xt(e,t){var n=t;if(!Vt||"content"===e)return t;if("string"!=typeof n||!isNaN(parseInt(n,10)))return n;var r=e+n;if(null!=Ht[r])return Ht[r];try{Vt.style[e]=n}catch(e){return Ht[r]=!1,!1}if(Ut[e])n=n.replace(qt,Kt);else if(""===Vt.style[e]&&("-ms-flex"===(n=lt+n)&&(Vt.style[e]="-ms-flexbox"),Vt.style[e]=n,""===Vt.style[e]))return Ht[r]=!1,!1;return Vt.style[e]="",Ht[r]=n,Ht[r]}l&&(Vt=document.createElement("p"));var Qt,Yt=be({plugins:[{onCreateRule:function(e,t,n){if("function"!=typeof t)return null;var r=m(e,{},n);return r[Ne]=t,r},onProcessStyle:function(e,t){if(Te in t||Ne in t)return e;var n={};for(var r in e){var o=e[r];"function"==typeof o&&(delete e[r],n[r]=o)}return t[Te]=n,e},onUpdate:function(e,t,n,r){var o=t,a=o[Ne];a&&(o.style=a(e)||{});var i=o[Te];if(i)for(var l in i)o.prop(l,i[l](e),r)}},{onCreateRule:function(e,t,n){if(!e)return null;if(e===Oe)return new Me(e,t,n);if("@"===e[0]&&"@global "===e.substr(0,8))return new Le(e,t,n);var r=n.parent;return r&&("global"===r.type||r.options.parent&&"global"===r.options.parent.type)&&(n.scoped=!1),n.selector||!1!==n.scoped||(n.selector=e),null},onProcessRule:function(e,t){"style"===e.type&&t&&(function(e,t){var n=e.options,r=e.style,a=r?r[Oe]:null;if(a){for(var i in a)t.addRule(i,a[i],(0,o.A)({},n,{selector:_e(i,e.selector)}));delete r[Oe]}}(e,t),function(e,t){var n=e.options,r=e.style;for(var a in r)if("@"===a[0]&&a.substr(0,7)===Oe){var i=_e(a.substr(7),e.selector);t.addRule(i,r[a],(0,o.A)({},n,{selector:i})),delete r[a]}}(e,t))}},function(){function e(e,t){return function(n,r){var o=e.getRule(r)||t&&t.getRule(r);return o?o.selector:r}}function t(e,t){for(var n=t.split(Ie),r=e.split(Ie),o="",a=0;a<n.length;a++)for(var i=n[a],l=0;l<r.length;l++){var s=r[l];o&&(o+=", "),o+=-1!==s.indexOf("&")?s.replace(De,i):i+" "+s}return o}function n(e,t,n){if(n)return(0,o.A)({},n,{index:n.index+1});var r=e.options.nestingLevel;r=void 0===r?1:r+1;var a=(0,o.A)({},e.options,{nestingLevel:r,index:t.indexOf(e)+1});return delete a.name,a}return{onProcessStyle:function(r,a,i){if("style"!==a.type)return r;var l,s,u=a,c=u.options.parent;for(var d in r){var f=-1!==d.indexOf("&"),p="@"===d[0];if(f||p){if(l=n(u,c,l),f){var m=t(d,u.selector);s||(s=e(c,i)),m=m.replace(Fe,s);var h=u.key+"-"+d;"replaceRule"in c?c.replaceRule(h,r[d],(0,o.A)({},l,{selector:m})):c.addRule(h,r[d],(0,o.A)({},l,{selector:m}))}else p&&c.addRule(d,{},l).addRule(u.key,r[d],{selector:u.selector});delete r[d]}}return r}}}(),{onProcessStyle:function(e){if(Array.isArray(e)){for(var t=0;t<e.length;t++)e[t]=He(e[t]);return e}return He(e)},onChangeValue:function(e,t,n){if(0===t.indexOf("--"))return e;var r=Ve(t);return t===r?e:(n.prop(r,e),null)}},function(e){void 0===e&&(e={});var t=Xe(e);return{onProcessStyle:function(e,n){if("style"!==n.type)return e;for(var r in e)e[r]=Ye(r,e[r],t);return e},onChangeValue:function(e,n){return Ye(n,e,t)}}}(),"undefined"==typeof window?null:function(){function e(t){for(var n in t){var r=t[n];if("fallbacks"===n&&Array.isArray(r))t[n]=r.map(e);else{var o=!1,a=$t(n);a&&a!==n&&(o=!0);var i=!1,l=Xt(a,v(r));l&&l!==r&&(i=!0),(o||i)&&(o&&delete t[n],t[a||n]=l||r)}}return t}return{onProcessRule:function(e){if("keyframes"===e.type){var t=e;t.at=function(e){return"-"===e[1]||"ms"===it?e:"@"+lt+"keyframes"+e.substr(10)}(t.at)}},onProcessStyle:function(t,n){return"style"!==n.type?t:e(t)},onChangeValue:function(e,t){return Xt(t,v(e))||e}}}(),(Qt=function(e,t){return e.length===t.length?e>t?1:-1:e.length-t.length},{onProcessStyle:function(e,t){if("style"!==t.type)return e;for(var n={},r=Object.keys(e).sort(Qt),o=0;o<r.length;o++)n[r[o]]=e[r[o]];return n}})]}),Gt={disableGeneration:!1,generateClassName:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=e.disableGlobal,n=void 0!==t&&t,r=e.productionPrefix,o=void 0===r?"jss":r,a=e.seed,i=void 0===a?"":a,l=""===i?"":"".concat(i,"-"),s=0,u=function(){return s+=1};return function(e,t){var r=t.options.name;if(r&&0===r.indexOf("Mui")&&!t.options.link&&!n){if(-1!==Re.indexOf(e.key))return"Mui-".concat(e.key);var a="".concat(l).concat(r,"-").concat(e.key);return t.options.theme[Ce]&&""===i?"".concat(a,"-").concat(u()):a}return"".concat(l).concat(o).concat(u())}}(),jss:Yt,sheetsCache:null,sheetsManager:new Map,sheetsRegistry:null},Jt=a.createContext(Gt),Zt=-1e9,en=n(2851);const tn={};function nn(e,t){var n=e.state,r=e.theme,a=e.stylesOptions,i=e.stylesCreator,l=e.name;if(!a.disableGeneration){var s=Se.get(a.sheetsManager,i,r);s||(s={refs:0,staticSheet:null,dynamicStyles:null},Se.set(a.sheetsManager,i,r,s));var u=(0,o.A)({},i.options,a,{theme:r,flip:"boolean"==typeof a.flip?a.flip:"rtl"===r.direction});u.generateId=u.serverGenerateClassName||u.generateClassName;var c=a.sheetsRegistry;if(0===s.refs){var d;a.sheetsCache&&(d=Se.get(a.sheetsCache,i,r));var f=i.create(r,l);d||((d=a.jss.createStyleSheet(f,(0,o.A)({link:!1},u))).attach(),a.sheetsCache&&Se.set(a.sheetsCache,i,r,d)),c&&c.add(d),s.staticSheet=d,s.dynamicStyles=we(f)}if(s.dynamicStyles){var p=a.jss.createStyleSheet(s.dynamicStyles,(0,o.A)({link:!0},u));p.update(t),p.attach(),n.dynamicSheet=p,n.classes=(0,Ee.A)({baseClasses:s.staticSheet.classes,newClasses:p.classes}),c&&c.add(p)}else n.classes=s.staticSheet.classes;s.refs+=1}}function rn(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=t.name,i=t.classNamePrefix,l=t.Component,s=t.defaultTheme,u=void 0===s?tn:s,c=(0,r.A)(t,["name","classNamePrefix","Component","defaultTheme"]),d=function(e){var t="function"==typeof e;return{create:function(n,r){var a;try{a=t?e(n):e}catch(e){throw e}if(!r||!n.overrides||!n.overrides[r])return a;var i=n.overrides[r],l=(0,o.A)({},a);return Object.keys(i).forEach((function(e){l[e]=(0,en.A)(l[e],i[e])})),l},options:{}}}(e),f=n||i||"makeStyles";return d.options={index:Zt+=1,name:n,meta:f,classNamePrefix:f},function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=(0,Ae.A)()||u,r=(0,o.A)({},a.useContext(Jt),c),i=a.useRef(),s=a.useRef();!function(o,l){var u,c,f=a.useRef([]),p=a.useMemo((function(){return{}}),l);f.current!==p&&(f.current=p,nn(c={name:n,state:{},stylesCreator:d,stylesOptions:r,theme:t},e),s.current=!1,i.current=c,u=function(){!function(e){var t=e.state,n=e.theme,r=e.stylesOptions,o=e.stylesCreator;if(!r.disableGeneration){var a=Se.get(r.sheetsManager,o,n);a.refs-=1;var i=r.sheetsRegistry;0===a.refs&&(Se.delete(r.sheetsManager,o,n),r.jss.removeStyleSheet(a.staticSheet),i&&i.remove(a.staticSheet)),t.dynamicSheet&&(r.jss.removeStyleSheet(t.dynamicSheet),i&&i.remove(t.dynamicSheet))}}(c)}),a.useEffect((function(){return function(){u&&u()}}),[p])}(0,[t,d]),a.useEffect((function(){s.current&&function(e,t){var n=e.state;n.dynamicSheet&&n.dynamicSheet.update(t)}(i.current,e),s.current=!0}));var f=function(e,t,n){var r=e.state;if(e.stylesOptions.disableGeneration)return t||{};r.cacheClasses||(r.cacheClasses={value:null,lastProp:null,lastJSS:{}});var o=!1;return r.classes!==r.cacheClasses.lastJSS&&(r.cacheClasses.lastJSS=r.classes,o=!0),t!==r.cacheClasses.lastProp&&(r.cacheClasses.lastProp=t,o=!0),o&&(r.cacheClasses.value=(0,Ee.A)({baseClasses:r.cacheClasses.lastJSS,newClasses:t,Component:n})),r.cacheClasses.value}(i.current,e.classes,l);return f}}},2694:(e,t,n)=>{"use strict";var r=n(6925);function o(){}function a(){}a.resetWarningCache=o,e.exports=function(){function e(e,t,n,o,a,i){if(i!==r){var l=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw l.name="Invariant Violation",l}}function t(){return e}e.isRequired=e;var n={array:e,bigint:e,bool:e,func:e,number:e,object:e,string:e,symbol:e,any:e,arrayOf:t,element:e,elementType:e,instanceOf:t,node:e,objectOf:t,oneOf:t,oneOfType:t,shape:t,exact:t,checkPropTypes:a,resetWarningCache:o};return n.PropTypes=n,n}},2777:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(2851);const o=function(e,t){return t?(0,r.A)(e,t,{clone:!1}):e}},2799:(e,t)=>{"use strict";if("function"==typeof Symbol&&Symbol.for){var n=Symbol.for;n("react.element"),n("react.portal"),n("react.fragment"),n("react.strict_mode"),n("react.profiler"),n("react.provider"),n("react.context"),n("react.forward_ref"),n("react.suspense"),n("react.suspense_list"),n("react.memo"),n("react.lazy"),n("react.block"),n("react.server.block"),n("react.fundamental"),n("react.debug_trace_mode"),n("react.legacy_hidden")}},2851:(e,t,n)=>{"use strict";n.d(t,{A:()=>i});var r=n(8168),o=n(2284);function a(e){return e&&"object"===(0,o.A)(e)&&e.constructor===Object}function i(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{clone:!0},o=n.clone?(0,r.A)({},e):e;return a(e)&&a(t)&&Object.keys(t).forEach((function(r){"__proto__"!==r&&(a(t[r])&&r in e?o[r]=i(e[r],t[r],n):o[r]=t[r])})),o}},2901:(e,t,n)=>{"use strict";n.d(t,{A:()=>a});var r=n(816);function o(e,t){for(var n=0;n<t.length;n++){var o=t[n];o.enumerable=o.enumerable||!1,o.configurable=!0,"value"in o&&(o.writable=!0),Object.defineProperty(e,(0,r.A)(o.key),o)}}function a(e,t,n){return t&&o(e.prototype,t),n&&o(e,n),Object.defineProperty(e,"prototype",{writable:!1}),e}},3043:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(8168);function o(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=e.baseClasses,n=e.newClasses;if(e.Component,!n)return t;var o=(0,r.A)({},t);return Object.keys(n).forEach((function(e){n[e]&&(o[e]="".concat(t[e]," ").concat(n[e]))})),o}},3072:(e,t)=>{"use strict";var n="function"==typeof Symbol&&Symbol.for,r=n?Symbol.for("react.element"):60103,o=n?Symbol.for("react.portal"):60106,a=n?Symbol.for("react.fragment"):60107,i=n?Symbol.for("react.strict_mode"):60108,l=n?Symbol.for("react.profiler"):60114,s=n?Symbol.for("react.provider"):60109,u=n?Symbol.for("react.context"):60110,c=n?Symbol.for("react.async_mode"):60111,d=n?Symbol.for("react.concurrent_mode"):60111,f=n?Symbol.for("react.forward_ref"):60112,p=n?Symbol.for("react.suspense"):60113,m=n?Symbol.for("react.suspense_list"):60120,h=n?Symbol.for("react.memo"):60115,v=n?Symbol.for("react.lazy"):60116,g=n?Symbol.for("react.block"):60121,y=n?Symbol.for("react.fundamental"):60117,b=n?Symbol.for("react.responder"):60118,x=n?Symbol.for("react.scope"):60119;function w(e){if("object"==typeof e&&null!==e){var t=e.$$typeof;switch(t){case r:switch(e=e.type){case c:case d:case a:case l:case i:case p:return e;default:switch(e=e&&e.$$typeof){case u:case f:case v:case h:case s:return e;default:return t}}case o:return t}}}function E(e){return w(e)===d}t.AsyncMode=c,t.ConcurrentMode=d,t.ContextConsumer=u,t.ContextProvider=s,t.Element=r,t.ForwardRef=f,t.Fragment=a,t.Lazy=v,t.Memo=h,t.Portal=o,t.Profiler=l,t.StrictMode=i,t.Suspense=p,t.isAsyncMode=function(e){return E(e)||w(e)===c},t.isConcurrentMode=E,t.isContextConsumer=function(e){return w(e)===u},t.isContextProvider=function(e){return w(e)===s},t.isElement=function(e){return"object"==typeof e&&null!==e&&e.$$typeof===r},t.isForwardRef=function(e){return w(e)===f},t.isFragment=function(e){return w(e)===a},t.isLazy=function(e){return w(e)===v},t.isMemo=function(e){return w(e)===h},t.isPortal=function(e){return w(e)===o},t.isProfiler=function(e){return w(e)===l},t.isStrictMode=function(e){return w(e)===i},t.isSuspense=function(e){return w(e)===p},t.isValidElementType=function(e){return"string"==typeof e||"function"==typeof e||e===a||e===d||e===l||e===i||e===p||e===m||"object"==typeof e&&null!==e&&(e.$$typeof===v||e.$$typeof===h||e.$$typeof===s||e.$$typeof===u||e.$$typeof===f||e.$$typeof===y||e.$$typeof===b||e.$$typeof===x||e.$$typeof===g)},t.typeOf=w},3145:(e,t,n)=>{"use strict";function r(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=Array(t);n<t;n++)r[n]=e[n];return r}n.d(t,{A:()=>r})},3404:(e,t,n)=>{"use strict";e.exports=n(3072)},3546:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M19 6.41L17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Close");t.A=i},3738:e=>{function t(n){return e.exports=t="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},e.exports.__esModule=!0,e.exports.default=e.exports,t(n)}e.exports=t,e.exports.__esModule=!0,e.exports.default=e.exports},3870:(e,t,n)=>{"use strict";n.d(t,{Ay:()=>l,p0:()=>a});var r=n(45),o={easeInOut:"cubic-bezier(0.4, 0, 0.2, 1)",easeOut:"cubic-bezier(0.0, 0, 0.2, 1)",easeIn:"cubic-bezier(0.4, 0, 1, 1)",sharp:"cubic-bezier(0.4, 0, 0.6, 1)"},a={shortest:150,shorter:200,short:250,standard:300,complex:375,enteringScreen:225,leavingScreen:195};function i(e){return"".concat(Math.round(e),"ms")}const l={easing:o,duration:a,create:function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:["all"],t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=t.duration,l=void 0===n?a.standard:n,s=t.easing,u=void 0===s?o.easeInOut:s,c=t.delay,d=void 0===c?0:c;return(0,r.A)(t,["duration","easing","delay"]),(Array.isArray(e)?e:[e]).map((function(e){return"".concat(e," ").concat("string"==typeof l?l:i(l)," ").concat(u," ").concat("string"==typeof d?d:i(d))})).join(",")},getAutoHeightDuration:function(e){if(!e)return 0;var t=e/36;return Math.round(10*(4+15*Math.pow(t,.25)+t/5))}}},4146:(e,t,n)=>{"use strict";var r=n(3404),o={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},a={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},i={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},l={};function s(e){return r.isMemo(e)?i:l[e.$$typeof]||o}l[r.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},l[r.Memo]=i;var u=Object.defineProperty,c=Object.getOwnPropertyNames,d=Object.getOwnPropertySymbols,f=Object.getOwnPropertyDescriptor,p=Object.getPrototypeOf,m=Object.prototype;e.exports=function e(t,n,r){if("string"!=typeof n){if(m){var o=p(n);o&&o!==m&&e(t,o,r)}var i=c(n);d&&(i=i.concat(d(n)));for(var l=s(t),h=s(n),v=0;v<i.length;++v){var g=i[v];if(!(a[g]||r&&r[g]||h&&h[g]||l&&l[g])){var y=f(n,g);try{u(t,g,y)}catch(e){}}}}return t}},4232:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(6540);function o(e){var t=r.useState(e),n=t[0],o=t[1],a=e||n;return r.useEffect((function(){null==n&&o("mui-".concat(Math.round(1e5*Math.random())))}),[n]),a}},4363:(e,t,n)=>{"use strict";n(2799)},4467:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(816);function o(e,t,n){return(t=(0,r.A)(t))in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}},4507:(e,t,n)=>{"use strict";n.d(t,{A:()=>d});var r=n(8168),o=n(6540),a=n(45),i=n(53),l=n(5192),s=n(7515),u=o.forwardRef((function(e,t){var n=e.children,l=e.classes,u=e.className,c=e.color,d=void 0===c?"inherit":c,f=e.component,p=void 0===f?"svg":f,m=e.fontSize,h=void 0===m?"medium":m,v=e.htmlColor,g=e.titleAccess,y=e.viewBox,b=void 0===y?"0 0 24 24":y,x=(0,a.A)(e,["children","classes","className","color","component","fontSize","htmlColor","titleAccess","viewBox"]);return o.createElement(p,(0,r.A)({className:(0,i.A)(l.root,u,"inherit"!==d&&l["color".concat((0,s.A)(d))],"default"!==h&&"medium"!==h&&l["fontSize".concat((0,s.A)(h))]),focusable:"false",viewBox:b,color:v,"aria-hidden":!g||void 0,role:g?"img":void 0,ref:t},x),n,g?o.createElement("title",null,g):null)}));u.muiName="SvgIcon";const c=(0,l.A)((function(e){return{root:{userSelect:"none",width:"1em",height:"1em",display:"inline-block",fill:"currentColor",flexShrink:0,fontSize:e.typography.pxToRem(24),transition:e.transitions.create("fill",{duration:e.transitions.duration.shorter})},colorPrimary:{color:e.palette.primary.main},colorSecondary:{color:e.palette.secondary.main},colorAction:{color:e.palette.action.active},colorError:{color:e.palette.error.main},colorDisabled:{color:e.palette.action.disabled},fontSizeInherit:{fontSize:"inherit"},fontSizeSmall:{fontSize:e.typography.pxToRem(20)},fontSizeLarge:{fontSize:e.typography.pxToRem(35)}}}),{name:"MuiSvgIcon"})(u);function d(e,t){var n=function(t,n){return o.createElement(c,(0,r.A)({ref:n},t),e)};return n.muiName=c.muiName,o.memo(o.forwardRef(n))}},4634:e=>{e.exports=Array.isArray||function(e){return"[object Array]"==Object.prototype.toString.call(e)}},4801:(e,t,n)=>{"use strict";n.d(t,{A:()=>a});var r=n(6540),o=n(4960);function a(e,t){return r.useMemo((function(){return null==e&&null==t?null:function(n){(0,o.A)(e,n),(0,o.A)(t,n)}}),[e,t])}},4820:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M14 6v15H3v-2h2V3h9v1h5v15h2v2h-4V6h-3zm-4 5v2h2v-2h-2z"}),"MeetingRoom");t.A=i},4912:(e,t)=>{"use strict";var n="function"==typeof Symbol&&Symbol.for;n&&Symbol.for("react.element"),n&&Symbol.for("react.portal"),n&&Symbol.for("react.fragment"),n&&Symbol.for("react.strict_mode"),n&&Symbol.for("react.profiler"),n&&Symbol.for("react.provider"),n&&Symbol.for("react.context"),n&&Symbol.for("react.async_mode"),n&&Symbol.for("react.concurrent_mode"),n&&Symbol.for("react.forward_ref"),n&&Symbol.for("react.suspense"),n&&Symbol.for("react.suspense_list"),n&&Symbol.for("react.memo"),n&&Symbol.for("react.lazy"),n&&Symbol.for("react.block"),n&&Symbol.for("react.fundamental"),n&&Symbol.for("react.responder"),n&&Symbol.for("react.scope")},4960:(e,t,n)=>{"use strict";function r(e,t){"function"==typeof e?e(t):e&&(e.current=t)}n.d(t,{A:()=>r})},4994:e=>{e.exports=function(e){return e&&e.__esModule?e:{default:e}},e.exports.__esModule=!0,e.exports.default=e.exports},5061:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M16 11c1.66 0 2.99-1.34 2.99-3S17.66 5 16 5c-1.66 0-3 1.34-3 3s1.34 3 3 3zm-8 0c1.66 0 2.99-1.34 2.99-3S9.66 5 8 5C6.34 5 5 6.34 5 8s1.34 3 3 3zm0 2c-2.33 0-7 1.17-7 3.5V19h14v-2.5c0-2.33-4.67-3.5-7-3.5zm8 0c-.29 0-.62.02-.97.05 1.16.84 1.97 1.97 1.97 3.45V19h6v-2.5c0-2.33-4.67-3.5-7-3.5z"}),"Group");t.A=i},5192:(e,t,n)=>{"use strict";n.d(t,{A:()=>f});var r=n(8168),o=n(45),a=n(6540),i=n(4146),l=n.n(i),s=n(2611),u=n(6081),c=n(6061);var d=n(8867);const f=function(e,t){return function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};return function(n){var i=t.defaultTheme,d=t.withTheme,f=void 0!==d&&d,p=t.name,m=(0,o.A)(t,["defaultTheme","withTheme","name"]),h=p,v=(0,s.A)(e,(0,r.A)({defaultTheme:i,Component:n,name:p||n.displayName,classNamePrefix:h},m)),g=a.forwardRef((function(e,t){e.classes;var l,s=e.innerRef,d=(0,o.A)(e,["classes","innerRef"]),m=v((0,r.A)({},n.defaultProps,e)),h=d;return("string"==typeof p||f)&&(l=(0,c.A)()||i,p&&(h=(0,u.A)({theme:l,name:p,props:d})),f&&!h.theme&&(h.theme=l)),a.createElement(n,(0,r.A)({ref:s||t,classes:m},h))}));return l()(g,n),g}}(e,(0,r.A)({defaultTheme:d.A},t))}},5228:e=>{"use strict";var t=Object.getOwnPropertySymbols,n=Object.prototype.hasOwnProperty,r=Object.prototype.propertyIsEnumerable;e.exports=function(){try{if(!Object.assign)return!1;var e=new String("abc");if(e[5]="de","5"===Object.getOwnPropertyNames(e)[0])return!1;for(var t={},n=0;n<10;n++)t["_"+String.fromCharCode(n)]=n;if("0123456789"!==Object.getOwnPropertyNames(t).map((function(e){return t[e]})).join(""))return!1;var r={};return"abcdefghijklmnopqrst".split("").forEach((function(e){r[e]=e})),"abcdefghijklmnopqrst"===Object.keys(Object.assign({},r)).join("")}catch(e){return!1}}()?Object.assign:function(e,o){for(var a,i,l=function(e){if(null==e)throw new TypeError("Object.assign cannot be called with null or undefined");return Object(e)}(e),s=1;s<arguments.length;s++){for(var u in a=Object(arguments[s]))n.call(a,u)&&(l[u]=a[u]);if(t){i=t(a);for(var c=0;c<i.length;c++)r.call(a,i[c])&&(l[i[c]]=a[i[c]])}}return l}},5287:(e,t,n)=>{"use strict";var r=n(5228),o=60103,a=60106;t.Fragment=60107,t.StrictMode=60108,t.Profiler=60114;var i=60109,l=60110,s=60112;t.Suspense=60113;var u=60115,c=60116;if("function"==typeof Symbol&&Symbol.for){var d=Symbol.for;o=d("react.element"),a=d("react.portal"),t.Fragment=d("react.fragment"),t.StrictMode=d("react.strict_mode"),t.Profiler=d("react.profiler"),i=d("react.provider"),l=d("react.context"),s=d("react.forward_ref"),t.Suspense=d("react.suspense"),u=d("react.memo"),c=d("react.lazy")}var f="function"==typeof Symbol&&Symbol.iterator;function p(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var m={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},h={};function v(e,t,n){this.props=e,this.context=t,this.refs=h,this.updater=n||m}function g(){}function y(e,t,n){this.props=e,this.context=t,this.refs=h,this.updater=n||m}v.prototype.isReactComponent={},v.prototype.setState=function(e,t){if("object"!=typeof e&&"function"!=typeof e&&null!=e)throw Error(p(85));this.updater.enqueueSetState(this,e,t,"setState")},v.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},g.prototype=v.prototype;var b=y.prototype=new g;b.constructor=y,r(b,v.prototype),b.isPureReactComponent=!0;var x={current:null},w=Object.prototype.hasOwnProperty,E={key:!0,ref:!0,__self:!0,__source:!0};function k(e,t,n){var r,a={},i=null,l=null;if(null!=t)for(r in void 0!==t.ref&&(l=t.ref),void 0!==t.key&&(i=""+t.key),t)w.call(t,r)&&!E.hasOwnProperty(r)&&(a[r]=t[r]);var s=arguments.length-2;if(1===s)a.children=n;else if(1<s){for(var u=Array(s),c=0;c<s;c++)u[c]=arguments[c+2];a.children=u}if(e&&e.defaultProps)for(r in s=e.defaultProps)void 0===a[r]&&(a[r]=s[r]);return{$$typeof:o,type:e,key:i,ref:l,props:a,_owner:x.current}}function S(e){return"object"==typeof e&&null!==e&&e.$$typeof===o}var A=/\/+/g;function C(e,t){return"object"==typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,(function(e){return t[e]}))}(""+e.key):t.toString(36)}function R(e,t,n,r,i){var l=typeof e;"undefined"!==l&&"boolean"!==l||(e=null);var s=!1;if(null===e)s=!0;else switch(l){case"string":case"number":s=!0;break;case"object":switch(e.$$typeof){case o:case a:s=!0}}if(s)return i=i(s=e),e=""===r?"."+C(s,0):r,Array.isArray(i)?(n="",null!=e&&(n=e.replace(A,"$&/")+"/"),R(i,t,n,"",(function(e){return e}))):null!=i&&(S(i)&&(i=function(e,t){return{$$typeof:o,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}(i,n+(!i.key||s&&s.key===i.key?"":(""+i.key).replace(A,"$&/")+"/")+e)),t.push(i)),1;if(s=0,r=""===r?".":r+":",Array.isArray(e))for(var u=0;u<e.length;u++){var c=r+C(l=e[u],u);s+=R(l,t,n,c,i)}else if(c=function(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=f&&e[f]||e["@@iterator"])?e:null}(e),"function"==typeof c)for(e=c.call(e),u=0;!(l=e.next()).done;)s+=R(l=l.value,t,n,c=r+C(l,u++),i);else if("object"===l)throw t=""+e,Error(p(31,"[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t));return s}function P(e,t,n){if(null==e)return e;var r=[],o=0;return R(e,r,"","",(function(e){return t.call(n,e,o++)})),r}function T(e){if(-1===e._status){var t=e._result;t=t(),e._status=0,e._result=t,t.then((function(t){0===e._status&&(t=t.default,e._status=1,e._result=t)}),(function(t){0===e._status&&(e._status=2,e._result=t)}))}if(1===e._status)return e._result;throw e._result}var N={current:null};function O(){var e=N.current;if(null===e)throw Error(p(321));return e}var M={ReactCurrentDispatcher:N,ReactCurrentBatchConfig:{transition:0},ReactCurrentOwner:x,IsSomeRendererActing:{current:!1},assign:r};t.Children={map:P,forEach:function(e,t,n){P(e,(function(){t.apply(this,arguments)}),n)},count:function(e){var t=0;return P(e,(function(){t++})),t},toArray:function(e){return P(e,(function(e){return e}))||[]},only:function(e){if(!S(e))throw Error(p(143));return e}},t.Component=v,t.PureComponent=y,t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=M,t.cloneElement=function(e,t,n){if(null==e)throw Error(p(267,e));var a=r({},e.props),i=e.key,l=e.ref,s=e._owner;if(null!=t){if(void 0!==t.ref&&(l=t.ref,s=x.current),void 0!==t.key&&(i=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(c in t)w.call(t,c)&&!E.hasOwnProperty(c)&&(a[c]=void 0===t[c]&&void 0!==u?u[c]:t[c])}var c=arguments.length-2;if(1===c)a.children=n;else if(1<c){u=Array(c);for(var d=0;d<c;d++)u[d]=arguments[d+2];a.children=u}return{$$typeof:o,type:e.type,key:i,ref:l,props:a,_owner:s}},t.createContext=function(e,t){return void 0===t&&(t=null),(e={$$typeof:l,_calculateChangedBits:t,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider={$$typeof:i,_context:e},e.Consumer=e},t.createElement=k,t.createFactory=function(e){var t=k.bind(null,e);return t.type=e,t},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:s,render:e}},t.isValidElement=S,t.lazy=function(e){return{$$typeof:c,_payload:{_status:-1,_result:e},_init:T}},t.memo=function(e,t){return{$$typeof:u,type:e,compare:void 0===t?null:t}},t.useCallback=function(e,t){return O().useCallback(e,t)},t.useContext=function(e,t){return O().useContext(e,t)},t.useDebugValue=function(){},t.useEffect=function(e,t){return O().useEffect(e,t)},t.useImperativeHandle=function(e,t,n){return O().useImperativeHandle(e,t,n)},t.useLayoutEffect=function(e,t){return O().useLayoutEffect(e,t)},t.useMemo=function(e,t){return O().useMemo(e,t)},t.useReducer=function(e,t,n){return O().useReducer(e,t,n)},t.useRef=function(e){return O().useRef(e)},t.useState=function(e){return O().useState(e)},t.version="17.0.2"},5302:(e,t,n)=>{var r=n(4634);e.exports=function e(t,n,o){return r(n)||(o=n||o,n=[]),o=o||{},t instanceof RegExp?function(e,t){var n=e.source.match(/\((?!\?)/g);if(n)for(var r=0;r<n.length;r++)t.push({name:r,prefix:null,delimiter:null,optional:!1,repeat:!1,partial:!1,asterisk:!1,pattern:null});return d(e,t)}(t,n):r(t)?function(t,n,r){for(var o=[],a=0;a<t.length;a++)o.push(e(t[a],n,r).source);return d(new RegExp("(?:"+o.join("|")+")",f(r)),n)}(t,n,o):function(e,t,n){return p(a(e,n),t,n)}(t,n,o)},e.exports.parse=a,e.exports.compile=function(e,t){return s(a(e,t),t)},e.exports.tokensToFunction=s,e.exports.tokensToRegExp=p;var o=new RegExp(["(\\\\.)","([\\/.])?(?:(?:\\:(\\w+)(?:\\(((?:\\\\.|[^\\\\()])+)\\))?|\\(((?:\\\\.|[^\\\\()])+)\\))([+*?])?|(\\*))"].join("|"),"g");function a(e,t){for(var n,r=[],a=0,l=0,s="",u=t&&t.delimiter||"/";null!=(n=o.exec(e));){var d=n[0],f=n[1],p=n.index;if(s+=e.slice(l,p),l=p+d.length,f)s+=f[1];else{var m=e[l],h=n[2],v=n[3],g=n[4],y=n[5],b=n[6],x=n[7];s&&(r.push(s),s="");var w=null!=h&&null!=m&&m!==h,E="+"===b||"*"===b,k="?"===b||"*"===b,S=h||u,A=g||y,C=h||("string"==typeof r[r.length-1]?r[r.length-1]:"");r.push({name:v||a++,prefix:h||"",delimiter:S,optional:k,repeat:E,partial:w,asterisk:!!x,pattern:A?c(A):x?".*":i(S,C)})}}return l<e.length&&(s+=e.substr(l)),s&&r.push(s),r}function i(e,t){return!t||t.indexOf(e)>-1?"[^"+u(e)+"]+?":u(t)+"|(?:(?!"+u(t)+")[^"+u(e)+"])+?"}function l(e){return encodeURI(e).replace(/[\/?#]/g,(function(e){return"%"+e.charCodeAt(0).toString(16).toUpperCase()}))}function s(e,t){for(var n=new Array(e.length),o=0;o<e.length;o++)"object"==typeof e[o]&&(n[o]=new RegExp("^(?:"+e[o].pattern+")$",f(t)));return function(t,o){for(var a="",i=t||{},s=(o||{}).pretty?l:encodeURIComponent,u=0;u<e.length;u++){var c=e[u];if("string"!=typeof c){var d,f=i[c.name];if(null==f){if(c.optional){c.partial&&(a+=c.prefix);continue}throw new TypeError('Expected "'+c.name+'" to be defined')}if(r(f)){if(!c.repeat)throw new TypeError('Expected "'+c.name+'" to not repeat, but received `'+JSON.stringify(f)+"`");if(0===f.length){if(c.optional)continue;throw new TypeError('Expected "'+c.name+'" to not be empty')}for(var p=0;p<f.length;p++){if(d=s(f[p]),!n[u].test(d))throw new TypeError('Expected all "'+c.name+'" to match "'+c.pattern+'", but received `'+JSON.stringify(d)+"`");a+=(0===p?c.prefix:c.delimiter)+d}}else{if(d=c.asterisk?encodeURI(f).replace(/[?#]/g,(function(e){return"%"+e.charCodeAt(0).toString(16).toUpperCase()})):s(f),!n[u].test(d))throw new TypeError('Expected "'+c.name+'" to match "'+c.pattern+'", but received "'+d+'"');a+=c.prefix+d}}else a+=c}return a}}function u(e){return e.replace(/([.+*?=^!:${}()[\]|\/\\])/g,"\\$1")}function c(e){return e.replace(/([=!:$\/()])/g,"\\$1")}function d(e,t){return e.keys=t,e}function f(e){return e&&e.sensitive?"":"i"}function p(e,t,n){r(t)||(n=t||n,t=[]);for(var o=(n=n||{}).strict,a=!1!==n.end,i="",l=0;l<e.length;l++){var s=e[l];if("string"==typeof s)i+=u(s);else{var c=u(s.prefix),p="(?:"+s.pattern+")";t.push(s),s.repeat&&(p+="(?:"+c+p+")*"),i+=p=s.optional?s.partial?c+"("+p+")?":"(?:"+c+"("+p+"))?":c+"("+p+")"}}var m=u(n.delimiter||"/"),h=i.slice(-m.length)===m;return o||(i=(h?i.slice(0,-m.length):i)+"(?:"+m+"(?=$))?"),i+=a?"$":o&&h?"":"(?="+m+"|$)",d(new RegExp("^"+i,f(n)),t)}},5458:(e,t,n)=>{"use strict";n.d(t,{A:()=>a});var r=n(3145),o=n(7800);function a(e){return function(e){if(Array.isArray(e))return(0,r.A)(e)}(e)||function(e){if("undefined"!=typeof Symbol&&null!=e[Symbol.iterator]||null!=e["@@iterator"])return Array.from(e)}(e)||(0,o.A)(e)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}()}},5540:(e,t,n)=>{"use strict";function r(e,t){return r=Object.setPrototypeOf?Object.setPrototypeOf.bind():function(e,t){return e.__proto__=t,e},r(e,t)}function o(e,t){e.prototype=Object.create(t.prototype),e.prototype.constructor=e,r(e,t)}n.d(t,{A:()=>o})},5556:(e,t,n)=>{e.exports=n(2694)()},5632:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M6 19h4V5H6v14zm8-14v14h4V5h-4z"}),"Pause");t.A=i},6061:(e,t,n)=>{"use strict";n.d(t,{A:()=>a});var r=n(6540);const o=r.createContext(null);function a(){return r.useContext(o)}},6064:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm1 15h-2v-2h2v2zm0-4h-2V7h2v6z"}),"Error");t.A=i},6081:(e,t,n)=>{"use strict";function r(e){var t=e.theme,n=e.name,r=e.props;if(!t||!t.props||!t.props[n])return r;var o,a=t.props[n];for(o in a)void 0===r[o]&&(r[o]=a[o]);return r}n.d(t,{A:()=>r})},6182:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(1475);function o(e){return(0,r.A)(e).defaultView||window}},6305:(e,t,n)=>{var r=n(3738).default;function o(e){if("function"!=typeof WeakMap)return null;var t=new WeakMap,n=new WeakMap;return(o=function(e){return e?n:t})(e)}e.exports=function(e,t){if(!t&&e&&e.__esModule)return e;if(null===e||"object"!=r(e)&&"function"!=typeof e)return{default:e};var n=o(t);if(n&&n.has(e))return n.get(e);var a={__proto__:null},i=Object.defineProperty&&Object.getOwnPropertyDescriptor;for(var l in e)if("default"!==l&&{}.hasOwnProperty.call(e,l)){var s=i?Object.getOwnPropertyDescriptor(e,l):null;s&&(s.get||s.set)?Object.defineProperty(a,l,s):a[l]=e[l]}return a.default=e,n&&n.set(e,a),a},e.exports.__esModule=!0,e.exports.default=e.exports},6447:(e,t,n)=>{"use strict";Object.defineProperty(t,"__esModule",{value:!0}),Object.defineProperty(t,"default",{enumerable:!0,get:function(){return r.createSvgIcon}});var r=n(1305)},6535:(e,t,n)=>{"use strict";n.d(t,{L:()=>p,A:()=>h});var r,o,a=n(296),i=n(7969),l=n(2777),s={m:"margin",p:"padding"},u={t:"Top",r:"Right",b:"Bottom",l:"Left",x:["Left","Right"],y:["Top","Bottom"]},c={marginX:"mx",marginY:"my",paddingX:"px",paddingY:"py"},d=(r=function(e){if(e.length>2){if(!c[e])return[e];e=c[e]}var t=e.split(""),n=(0,a.A)(t,2),r=n[0],o=n[1],i=s[r],l=u[o]||"";return Array.isArray(l)?l.map((function(e){return i+e})):[i+l]},o={},function(e){return void 0===o[e]&&(o[e]=r(e)),o[e]}),f=["m","mt","mr","mb","ml","mx","my","p","pt","pr","pb","pl","px","py","margin","marginTop","marginRight","marginBottom","marginLeft","marginX","marginY","padding","paddingTop","paddingRight","paddingBottom","paddingLeft","paddingX","paddingY"];function p(e){var t=e.spacing||8;return"number"==typeof t?function(e){return t*e}:Array.isArray(t)?function(e){return t[e]}:"function"==typeof t?t:function(){}}function m(e){var t=p(e.theme);return Object.keys(e).map((function(n){if(-1===f.indexOf(n))return null;var r=function(e,t){return function(n){return e.reduce((function(e,r){return e[r]=function(e,t){if("string"==typeof t||null==t)return t;var n=e(Math.abs(t));return t>=0?n:"number"==typeof n?-n:"-".concat(n)}(t,n),e}),{})}}(d(n),t),o=e[n];return(0,i.N)(e,o,r)})).reduce(l.A,{})}m.propTypes={},m.filterProps=f;const h=m},6540:(e,t,n)=>{"use strict";e.exports=n(5287)},6925:e=>{"use strict";e.exports="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED"},7201:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M19 13h-6v6h-2v-6H5v-2h6V5h2v6h6v2z"}),"Add");t.A=i},7451:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M18 8h-1V6c0-2.76-2.24-5-5-5S7 3.24 7 6v2H6c-1.1 0-2 .9-2 2v10c0 1.1.9 2 2 2h12c1.1 0 2-.9 2-2V10c0-1.1-.9-2-2-2zm-6 9c-1.1 0-2-.9-2-2s.9-2 2-2 2 .9 2 2-.9 2-2 2zm3.1-9H8.9V6c0-1.71 1.39-3.1 3.1-3.1 1.71 0 3.1 1.39 3.1 3.1v2z"}),"Lock");t.A=i},7463:(e,t)=>{"use strict";var n,r,o,a;if("object"==typeof performance&&"function"==typeof performance.now){var i=performance;t.unstable_now=function(){return i.now()}}else{var l=Date,s=l.now();t.unstable_now=function(){return l.now()-s}}if("undefined"==typeof window||"function"!=typeof MessageChannel){var u=null,c=null,d=function(){if(null!==u)try{var e=t.unstable_now();u(!0,e),u=null}catch(e){throw setTimeout(d,0),e}};n=function(e){null!==u?setTimeout(n,0,e):(u=e,setTimeout(d,0))},r=function(e,t){c=setTimeout(e,t)},o=function(){clearTimeout(c)},t.unstable_shouldYield=function(){return!1},a=t.unstable_forceFrameRate=function(){}}else{var f=window.setTimeout,p=window.clearTimeout;if("undefined"!=typeof console){var m=window.cancelAnimationFrame;"function"!=typeof window.requestAnimationFrame&&console.error("This browser doesn't support requestAnimationFrame. Make sure that you load a polyfill in older browsers. https://reactjs.org/link/react-polyfills"),"function"!=typeof m&&console.error("This browser doesn't support cancelAnimationFrame. Make sure that you load a polyfill in older browsers. https://reactjs.org/link/react-polyfills")}var h=!1,v=null,g=-1,y=5,b=0;t.unstable_shouldYield=function(){return t.unstable_now()>=b},a=function(){},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):y=0<e?Math.floor(1e3/e):5};var x=new MessageChannel,w=x.port2;x.port1.onmessage=function(){if(null!==v){var e=t.unstable_now();b=e+y;try{v(!0,e)?w.postMessage(null):(h=!1,v=null)}catch(e){throw w.postMessage(null),e}}else h=!1},n=function(e){v=e,h||(h=!0,w.postMessage(null))},r=function(e,n){g=f((function(){e(t.unstable_now())}),n)},o=function(){p(g),g=-1}}function E(e,t){var n=e.length;e.push(t);e:for(;;){var r=n-1>>>1,o=e[r];if(!(void 0!==o&&0<A(o,t)))break e;e[r]=t,e[n]=o,n=r}}function k(e){return void 0===(e=e[0])?null:e}function S(e){var t=e[0];if(void 0!==t){var n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,o=e.length;r<o;){var a=2*(r+1)-1,i=e[a],l=a+1,s=e[l];if(void 0!==i&&0>A(i,n))void 0!==s&&0>A(s,i)?(e[r]=s,e[l]=n,r=l):(e[r]=i,e[a]=n,r=a);else{if(!(void 0!==s&&0>A(s,n)))break e;e[r]=s,e[l]=n,r=l}}}return t}return null}function A(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}var C=[],R=[],P=1,T=null,N=3,O=!1,M=!1,L=!1;function z(e){for(var t=k(R);null!==t;){if(null===t.callback)S(R);else{if(!(t.startTime<=e))break;S(R),t.sortIndex=t.expirationTime,E(C,t)}t=k(R)}}function _(e){if(L=!1,z(e),!M)if(null!==k(C))M=!0,n(I);else{var t=k(R);null!==t&&r(_,t.startTime-e)}}function I(e,n){M=!1,L&&(L=!1,o()),O=!0;var a=N;try{for(z(n),T=k(C);null!==T&&(!(T.expirationTime>n)||e&&!t.unstable_shouldYield());){var i=T.callback;if("function"==typeof i){T.callback=null,N=T.priorityLevel;var l=i(T.expirationTime<=n);n=t.unstable_now(),"function"==typeof l?T.callback=l:T===k(C)&&S(C),z(n)}else S(C);T=k(C)}if(null!==T)var s=!0;else{var u=k(R);null!==u&&r(_,u.startTime-n),s=!1}return s}finally{T=null,N=a,O=!1}}var D=a;t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_continueExecution=function(){M||O||(M=!0,n(I))},t.unstable_getCurrentPriorityLevel=function(){return N},t.unstable_getFirstCallbackNode=function(){return k(C)},t.unstable_next=function(e){switch(N){case 1:case 2:case 3:var t=3;break;default:t=N}var n=N;N=t;try{return e()}finally{N=n}},t.unstable_pauseExecution=function(){},t.unstable_requestPaint=D,t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=N;N=e;try{return t()}finally{N=n}},t.unstable_scheduleCallback=function(e,a,i){var l=t.unstable_now();switch(i="object"==typeof i&&null!==i&&"number"==typeof(i=i.delay)&&0<i?l+i:l,e){case 1:var s=-1;break;case 2:s=250;break;case 5:s=1073741823;break;case 4:s=1e4;break;default:s=5e3}return e={id:P++,callback:a,priorityLevel:e,startTime:i,expirationTime:s=i+s,sortIndex:-1},i>l?(e.sortIndex=i,E(R,e),null===k(C)&&e===k(R)&&(L?o():L=!0,r(_,i-l))):(e.sortIndex=s,E(C,e),M||O||(M=!0,n(I))),e},t.unstable_wrapCallback=function(e){var t=N;return function(){var n=N;N=t;try{return e.apply(this,arguments)}finally{N=n}}}},7515:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(7860);function o(e){if("string"!=typeof e)throw new Error((0,r.A)(7));return e.charAt(0).toUpperCase()+e.slice(1)}},7564:(e,t,n)=>{"use strict";n(4912)},7570:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(6540);function o(e,t){return r.isValidElement(e)&&-1!==t.indexOf(e.type.muiName)}},7690:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm-2 15l-5-5 1.41-1.41L10 14.17l7.59-7.59L19 8l-9 9z"}),"CheckCircle");t.A=i},7800:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(3145);function o(e,t){if(e){if("string"==typeof e)return(0,r.A)(e,t);var n={}.toString.call(e).slice(8,-1);return"Object"===n&&e.constructor&&(n=e.constructor.name),"Map"===n||"Set"===n?Array.from(e):"Arguments"===n||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(n)?(0,r.A)(e,t):void 0}}},7860:(e,t,n)=>{"use strict";function r(e){for(var t="https://mui.com/production-error/?code="+e,n=1;n<arguments.length;n+=1)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified Material-UI error #"+e+"; visit "+t+" for the full message."}n.d(t,{A:()=>r})},7969:(e,t,n)=>{"use strict";n.d(t,{N:()=>i});var r=n(2284),o={xs:0,sm:600,md:960,lg:1280,xl:1920},a={keys:["xs","sm","md","lg","xl"],up:function(e){return"@media (min-width:".concat(o[e],"px)")}};function i(e,t,n){if(Array.isArray(t)){var o=e.theme.breakpoints||a;return t.reduce((function(e,r,a){return e[o.up(o.keys[a])]=n(t[a]),e}),{})}if("object"===(0,r.A)(t)){var i=e.theme.breakpoints||a;return Object.keys(t).reduce((function(e,r){return e[i.up(r)]=n(t[r]),e}),{})}return n(t)}},8060:(e,t,n)=>{"use strict";n.d(t,{A:()=>o});var r=n(6540);function o(e){var t=e.controlled,n=e.default,o=(e.name,e.state,r.useRef(void 0!==t).current),a=r.useState(n),i=a[0],l=a[1];return[o?t:i,r.useCallback((function(e){o||l(e)}),[])]}},8168:(e,t,n)=>{"use strict";function r(){return r=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},r.apply(null,arguments)}n.d(t,{A:()=>r})},8521:(e,t,n)=>{"use strict";function r(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return t.reduce((function(e,t){return null==t?e:function(){for(var n=arguments.length,r=new Array(n),o=0;o<n;o++)r[o]=arguments[o];e.apply(this,r),t.apply(this,r)}}),(function(){}))}n.d(t,{A:()=>r})},8587:(e,t,n)=>{"use strict";function r(e,t){if(null==e)return{};var n={};for(var r in e)if({}.hasOwnProperty.call(e,r)){if(-1!==t.indexOf(r))continue;n[r]=e[r]}return n}n.d(t,{A:()=>r})},8630:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M18.5 12c0-1.77-1.02-3.29-2.5-4.03v8.05c1.48-.73 2.5-2.25 2.5-4.02zM5 9v6h4l5 5V4L9 9H5z"}),"VolumeDown");t.A=i},8721:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M11 18h2v-2h-2v2zm1-16C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm0 18c-4.41 0-8-3.59-8-8s3.59-8 8-8 8 3.59 8 8-3.59 8-8 8zm0-14c-2.21 0-4 1.79-4 4h2c0-1.1.9-2 2-2s2 .9 2 2c0 2-3 1.75-3 5h2c0-2.25 3-2.5 3-5 0-2.21-1.79-4-4-4z"}),"HelpOutline");t.A=i},8861:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M8 5v14l11-7z"}),"PlayArrow");t.A=i},8867:(e,t,n)=>{"use strict";n.d(t,{A:()=>U});var r=n(45),o=n(2851),a=n(8168),i=["xs","sm","md","lg","xl"],l=n(4467);function s(e,t,n){var r;return(0,a.A)({gutters:function(){var n=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};return console.warn(["Material-UI: theme.mixins.gutters() is deprecated.","You can use the source of the mixin directly:","\n      paddingLeft: theme.spacing(2),\n      paddingRight: theme.spacing(2),\n      [theme.breakpoints.up('sm')]: {\n        paddingLeft: theme.spacing(3),\n        paddingRight: theme.spacing(3),\n      },\n      "].join("\n")),(0,a.A)({paddingLeft:t(2),paddingRight:t(2)},n,(0,l.A)({},e.up("sm"),(0,a.A)({paddingLeft:t(3),paddingRight:t(3)},n[e.up("sm")])))},toolbar:(r={minHeight:56},(0,l.A)(r,"".concat(e.up("xs")," and (orientation: landscape)"),{minHeight:48}),(0,l.A)(r,e.up("sm"),{minHeight:64}),r)},n)}var u=n(7860);const c={black:"#000",white:"#fff"},d={50:"#fafafa",100:"#f5f5f5",200:"#eeeeee",300:"#e0e0e0",400:"#bdbdbd",500:"#9e9e9e",600:"#757575",700:"#616161",800:"#424242",900:"#212121",A100:"#d5d5d5",A200:"#aaaaaa",A400:"#303030",A700:"#616161"},f="#7986cb",p="#3f51b5",m="#303f9f",h="#ff4081",v="#f50057",g="#c51162",y="#e57373",b="#f44336",x="#d32f2f",w="#ffb74d",E="#ff9800",k="#f57c00",S="#64b5f6",A="#2196f3",C="#1976d2",R="#81c784",P="#4caf50",T="#388e3c";var N=n(9773),O={text:{primary:"rgba(0, 0, 0, 0.87)",secondary:"rgba(0, 0, 0, 0.54)",disabled:"rgba(0, 0, 0, 0.38)",hint:"rgba(0, 0, 0, 0.38)"},divider:"rgba(0, 0, 0, 0.12)",background:{paper:c.white,default:d[50]},action:{active:"rgba(0, 0, 0, 0.54)",hover:"rgba(0, 0, 0, 0.04)",hoverOpacity:.04,selected:"rgba(0, 0, 0, 0.08)",selectedOpacity:.08,disabled:"rgba(0, 0, 0, 0.26)",disabledBackground:"rgba(0, 0, 0, 0.12)",disabledOpacity:.38,focus:"rgba(0, 0, 0, 0.12)",focusOpacity:.12,activatedOpacity:.12}},M={text:{primary:c.white,secondary:"rgba(255, 255, 255, 0.7)",disabled:"rgba(255, 255, 255, 0.5)",hint:"rgba(255, 255, 255, 0.5)",icon:"rgba(255, 255, 255, 0.5)"},divider:"rgba(255, 255, 255, 0.12)",background:{paper:d[800],default:"#303030"},action:{active:c.white,hover:"rgba(255, 255, 255, 0.08)",hoverOpacity:.08,selected:"rgba(255, 255, 255, 0.16)",selectedOpacity:.16,disabled:"rgba(255, 255, 255, 0.3)",disabledBackground:"rgba(255, 255, 255, 0.12)",disabledOpacity:.38,focus:"rgba(255, 255, 255, 0.12)",focusOpacity:.12,activatedOpacity:.24}};function L(e,t,n,r){var o=r.light||r,a=r.dark||1.5*r;e[t]||(e.hasOwnProperty(n)?e[t]=e[n]:"light"===t?e.light=(0,N.a)(e.main,o):"dark"===t&&(e.dark=(0,N.e$)(e.main,a)))}function z(e){return Math.round(1e5*e)/1e5}function _(e){return z(e)}var I={textTransform:"uppercase"},D='"Roboto", "Helvetica", "Arial", sans-serif';function F(e,t){var n="function"==typeof t?t(e):t,i=n.fontFamily,l=void 0===i?D:i,s=n.fontSize,u=void 0===s?14:s,c=n.fontWeightLight,d=void 0===c?300:c,f=n.fontWeightRegular,p=void 0===f?400:f,m=n.fontWeightMedium,h=void 0===m?500:m,v=n.fontWeightBold,g=void 0===v?700:v,y=n.htmlFontSize,b=void 0===y?16:y,x=n.allVariants,w=n.pxToRem,E=(0,r.A)(n,["fontFamily","fontSize","fontWeightLight","fontWeightRegular","fontWeightMedium","fontWeightBold","htmlFontSize","allVariants","pxToRem"]),k=u/14,S=w||function(e){return"".concat(e/b*k,"rem")},A=function(e,t,n,r,o){return(0,a.A)({fontFamily:l,fontWeight:e,fontSize:S(t),lineHeight:n},l===D?{letterSpacing:"".concat(z(r/t),"em")}:{},o,x)},C={h1:A(d,96,1.167,-1.5),h2:A(d,60,1.2,-.5),h3:A(p,48,1.167,0),h4:A(p,34,1.235,.25),h5:A(p,24,1.334,0),h6:A(h,20,1.6,.15),subtitle1:A(p,16,1.75,.15),subtitle2:A(h,14,1.57,.1),body1:A(p,16,1.5,.15),body2:A(p,14,1.43,.15),button:A(h,14,1.75,.4,I),caption:A(p,12,1.66,.4),overline:A(p,12,2.66,1,I)};return(0,o.A)((0,a.A)({htmlFontSize:b,pxToRem:S,round:_,fontFamily:l,fontSize:u,fontWeightLight:d,fontWeightRegular:p,fontWeightMedium:h,fontWeightBold:g},C),E,{clone:!1})}function j(){return["".concat(arguments.length<=0?void 0:arguments[0],"px ").concat(arguments.length<=1?void 0:arguments[1],"px ").concat(arguments.length<=2?void 0:arguments[2],"px ").concat(arguments.length<=3?void 0:arguments[3],"px rgba(0,0,0,").concat(.2,")"),"".concat(arguments.length<=4?void 0:arguments[4],"px ").concat(arguments.length<=5?void 0:arguments[5],"px ").concat(arguments.length<=6?void 0:arguments[6],"px ").concat(arguments.length<=7?void 0:arguments[7],"px rgba(0,0,0,").concat(.14,")"),"".concat(arguments.length<=8?void 0:arguments[8],"px ").concat(arguments.length<=9?void 0:arguments[9],"px ").concat(arguments.length<=10?void 0:arguments[10],"px ").concat(arguments.length<=11?void 0:arguments[11],"px rgba(0,0,0,").concat(.12,")")].join(",")}const B=["none",j(0,2,1,-1,0,1,1,0,0,1,3,0),j(0,3,1,-2,0,2,2,0,0,1,5,0),j(0,3,3,-2,0,3,4,0,0,1,8,0),j(0,2,4,-1,0,4,5,0,0,1,10,0),j(0,3,5,-1,0,5,8,0,0,1,14,0),j(0,3,5,-1,0,6,10,0,0,1,18,0),j(0,4,5,-2,0,7,10,1,0,2,16,1),j(0,5,5,-3,0,8,10,1,0,3,14,2),j(0,5,6,-3,0,9,12,1,0,3,16,2),j(0,6,6,-3,0,10,14,1,0,4,18,3),j(0,6,7,-4,0,11,15,1,0,4,20,3),j(0,7,8,-4,0,12,17,2,0,5,22,4),j(0,7,8,-4,0,13,19,2,0,5,24,4),j(0,7,9,-4,0,14,21,2,0,5,26,4),j(0,8,9,-5,0,15,22,2,0,6,28,5),j(0,8,10,-5,0,16,24,2,0,6,30,5),j(0,8,11,-5,0,17,26,2,0,6,32,5),j(0,9,11,-5,0,18,28,2,0,7,34,6),j(0,9,12,-6,0,19,29,2,0,7,36,6),j(0,10,13,-6,0,20,31,3,0,8,38,7),j(0,10,13,-6,0,21,33,3,0,8,40,7),j(0,10,14,-6,0,22,35,3,0,8,42,7),j(0,11,14,-7,0,23,36,3,0,9,44,8),j(0,11,15,-7,0,24,38,3,0,9,46,8)],W={borderRadius:4};var $=n(6535),V=n(3870),H=n(9474);const U=function(){for(var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=e.breakpoints,n=void 0===t?{}:t,l=e.mixins,z=void 0===l?{}:l,_=e.palette,I=void 0===_?{}:_,D=e.spacing,j=e.typography,U=void 0===j?{}:j,q=(0,r.A)(e,["breakpoints","mixins","palette","spacing","typography"]),K=function(e){var t=e.primary,n=void 0===t?{light:f,main:p,dark:m}:t,i=e.secondary,l=void 0===i?{light:h,main:v,dark:g}:i,s=e.error,z=void 0===s?{light:y,main:b,dark:x}:s,_=e.warning,I=void 0===_?{light:w,main:E,dark:k}:_,D=e.info,F=void 0===D?{light:S,main:A,dark:C}:D,j=e.success,B=void 0===j?{light:R,main:P,dark:T}:j,W=e.type,$=void 0===W?"light":W,V=e.contrastThreshold,H=void 0===V?3:V,U=e.tonalOffset,q=void 0===U?.2:U,K=(0,r.A)(e,["primary","secondary","error","warning","info","success","type","contrastThreshold","tonalOffset"]);function X(e){return(0,N.eM)(e,M.text.primary)>=H?M.text.primary:O.text.primary}var Q=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:500,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:300,r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:700;if(!(e=(0,a.A)({},e)).main&&e[t]&&(e.main=e[t]),!e.main)throw new Error((0,u.A)(4,t));if("string"!=typeof e.main)throw new Error((0,u.A)(5,JSON.stringify(e.main)));return L(e,"light",n,q),L(e,"dark",r,q),e.contrastText||(e.contrastText=X(e.main)),e},Y={dark:M,light:O};return(0,o.A)((0,a.A)({common:c,type:$,primary:Q(n),secondary:Q(l,"A400","A200","A700"),error:Q(z),warning:Q(I),info:Q(F),success:Q(B),grey:d,contrastThreshold:H,getContrastText:X,augmentColor:Q,tonalOffset:q},Y[$]),K)}(I),X=function(e){var t=e.values,n=void 0===t?{xs:0,sm:600,md:960,lg:1280,xl:1920}:t,o=e.unit,l=void 0===o?"px":o,s=e.step,u=void 0===s?5:s,c=(0,r.A)(e,["values","unit","step"]);function d(e){var t="number"==typeof n[e]?n[e]:e;return"@media (min-width:".concat(t).concat(l,")")}function f(e,t){var r=i.indexOf(t);return r===i.length-1?d(e):"@media (min-width:".concat("number"==typeof n[e]?n[e]:e).concat(l,") and ")+"(max-width:".concat((-1!==r&&"number"==typeof n[i[r+1]]?n[i[r+1]]:t)-u/100).concat(l,")")}return(0,a.A)({keys:i,values:n,up:d,down:function(e){var t=i.indexOf(e)+1,r=n[i[t]];return t===i.length?d("xs"):"@media (max-width:".concat(("number"==typeof r&&t>0?r:e)-u/100).concat(l,")")},between:f,only:function(e){return f(e,e)},width:function(e){return n[e]}},c)}(n),Q=function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:8;if(e.mui)return e;var t=(0,$.L)({spacing:e}),n=function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];return 0===n.length?t(1):1===n.length?t(n[0]):n.map((function(e){if("string"==typeof e)return e;var n=t(e);return"number"==typeof n?"".concat(n,"px"):n})).join(" ")};return Object.defineProperty(n,"unit",{get:function(){return e}}),n.mui=!0,n}(D),Y=(0,o.A)({breakpoints:X,direction:"ltr",mixins:s(X,Q,z),overrides:{},palette:K,props:{},shadows:B,typography:F(K,U),spacing:Q,shape:W,transitions:V.Ay,zIndex:H.A},q),G=arguments.length,J=new Array(G>1?G-1:0),Z=1;Z<G;Z++)J[Z-1]=arguments[Z];return J.reduce((function(e,t){return(0,o.A)(e,t)}),Y)}()},9362:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M6 18l8.5-6L6 6v12zM16 6v12h2V6h-2z"}),"SkipNext");t.A=i},9417:(e,t,n)=>{"use strict";function r(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}n.d(t,{A:()=>r})},9474:(e,t,n)=>{"use strict";n.d(t,{A:()=>r});const r={mobileStepper:1e3,speedDial:1050,appBar:1100,drawer:1200,modal:1300,snackbar:1400,tooltip:1500}},9608:(e,t,n)=>{"use strict";var r=n(4994),o=n(6305);t.A=void 0;var a=o(n(6540)),i=(0,r(n(6447)).default)(a.createElement("path",{d:"M20 11H7.83l5.59-5.59L12 4l-8 8 8 8 1.41-1.41L7.83 13H20v-2z"}),"ArrowBack");t.A=i},9773:(e,t,n)=>{"use strict";n.d(t,{X4:()=>c,a:()=>f,e$:()=>d,eM:()=>l,tL:()=>u});var r=n(7860);function o(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:1;return Math.min(Math.max(t,e),n)}function a(e){if(e.type)return e;if("#"===e.charAt(0))return a(function(e){e=e.substr(1);var t=new RegExp(".{1,".concat(e.length>=6?2:1,"}"),"g"),n=e.match(t);return n&&1===n[0].length&&(n=n.map((function(e){return e+e}))),n?"rgb".concat(4===n.length?"a":"","(").concat(n.map((function(e,t){return t<3?parseInt(e,16):Math.round(parseInt(e,16)/255*1e3)/1e3})).join(", "),")"):""}(e));var t=e.indexOf("("),n=e.substring(0,t);if(-1===["rgb","rgba","hsl","hsla"].indexOf(n))throw new Error((0,r.A)(3,e));var o=e.substring(t+1,e.length-1).split(",");return{type:n,values:o=o.map((function(e){return parseFloat(e)}))}}function i(e){var t=e.type,n=e.values;return-1!==t.indexOf("rgb")?n=n.map((function(e,t){return t<3?parseInt(e,10):e})):-1!==t.indexOf("hsl")&&(n[1]="".concat(n[1],"%"),n[2]="".concat(n[2],"%")),"".concat(t,"(").concat(n.join(", "),")")}function l(e,t){var n=s(e),r=s(t);return(Math.max(n,r)+.05)/(Math.min(n,r)+.05)}function s(e){var t="hsl"===(e=a(e)).type?a(function(e){var t=(e=a(e)).values,n=t[0],r=t[1]/100,o=t[2]/100,l=r*Math.min(o,1-o),s=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:(e+n/30)%12;return o-l*Math.max(Math.min(t-3,9-t,1),-1)},u="rgb",c=[Math.round(255*s(0)),Math.round(255*s(8)),Math.round(255*s(4))];return"hsla"===e.type&&(u+="a",c.push(t[3])),i({type:u,values:c})}(e)).values:e.values;return t=t.map((function(e){return(e/=255)<=.03928?e/12.92:Math.pow((e+.055)/1.055,2.4)})),Number((.2126*t[0]+.7152*t[1]+.0722*t[2]).toFixed(3))}function u(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:.15;return s(e)>.5?d(e,t):f(e,t)}function c(e,t){return e=a(e),t=o(t),"rgb"!==e.type&&"hsl"!==e.type||(e.type+="a"),e.values[3]=t,i(e)}function d(e,t){if(e=a(e),t=o(t),-1!==e.type.indexOf("hsl"))e.values[2]*=1-t;else if(-1!==e.type.indexOf("rgb"))for(var n=0;n<3;n+=1)e.values[n]*=1-t;return i(e)}function f(e,t){if(e=a(e),t=o(t),-1!==e.type.indexOf("hsl"))e.values[2]+=(100-e.values[2])*t;else if(-1!==e.type.indexOf("rgb"))for(var n=0;n<3;n+=1)e.values[n]+=(255-e.values[n])*t;return i(e)}},9982:(e,t,n)=>{"use strict";e.exports=n(7463)}},t={};function n(r){var o=t[r];if(void 0!==o)return o.exports;var a=t[r]={exports:{}};return e[r](a,a.exports,n),a.exports}n.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return n.d(t,{a:t}),t},n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.g=function(){if("object"==typeof globalThis)return globalThis;try{return this||new Function("return this")()}catch(e){if("object"==typeof window)return window}}(),n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t),n.r=e=>{"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},(()=>{"use strict";var e=n(6540),t=n(961),r=n(8168),o=n(296),a=n(45),i=n(8587),l=n(5540);const s=e.createContext(null);var u="unmounted",c="exited",d="entering",f="entered",p="exiting",m=function(n){function r(e,t){var r;r=n.call(this,e,t)||this;var o,a=t&&!t.isMounting?e.enter:e.appear;return r.appearStatus=null,e.in?a?(o=c,r.appearStatus=d):o=f:o=e.unmountOnExit||e.mountOnEnter?u:c,r.state={status:o},r.nextCallback=null,r}(0,l.A)(r,n),r.getDerivedStateFromProps=function(e,t){return e.in&&t.status===u?{status:c}:null};var o=r.prototype;return o.componentDidMount=function(){this.updateStatus(!0,this.appearStatus)},o.componentDidUpdate=function(e){var t=null;if(e!==this.props){var n=this.state.status;this.props.in?n!==d&&n!==f&&(t=d):n!==d&&n!==f||(t=p)}this.updateStatus(!1,t)},o.componentWillUnmount=function(){this.cancelNextCallback()},o.getTimeouts=function(){var e,t,n,r=this.props.timeout;return e=t=n=r,null!=r&&"number"!=typeof r&&(e=r.exit,t=r.enter,n=void 0!==r.appear?r.appear:t),{exit:e,enter:t,appear:n}},o.updateStatus=function(e,n){if(void 0===e&&(e=!1),null!==n)if(this.cancelNextCallback(),n===d){if(this.props.unmountOnExit||this.props.mountOnEnter){var r=this.props.nodeRef?this.props.nodeRef.current:t.findDOMNode(this);r&&function(e){e.scrollTop}(r)}this.performEnter(e)}else this.performExit();else this.props.unmountOnExit&&this.state.status===c&&this.setState({status:u})},o.performEnter=function(e){var n=this,r=this.props.enter,o=this.context?this.context.isMounting:e,a=this.props.nodeRef?[o]:[t.findDOMNode(this),o],i=a[0],l=a[1],s=this.getTimeouts(),u=o?s.appear:s.enter;e||r?(this.props.onEnter(i,l),this.safeSetState({status:d},(function(){n.props.onEntering(i,l),n.onTransitionEnd(u,(function(){n.safeSetState({status:f},(function(){n.props.onEntered(i,l)}))}))}))):this.safeSetState({status:f},(function(){n.props.onEntered(i)}))},o.performExit=function(){var e=this,n=this.props.exit,r=this.getTimeouts(),o=this.props.nodeRef?void 0:t.findDOMNode(this);n?(this.props.onExit(o),this.safeSetState({status:p},(function(){e.props.onExiting(o),e.onTransitionEnd(r.exit,(function(){e.safeSetState({status:c},(function(){e.props.onExited(o)}))}))}))):this.safeSetState({status:c},(function(){e.props.onExited(o)}))},o.cancelNextCallback=function(){null!==this.nextCallback&&(this.nextCallback.cancel(),this.nextCallback=null)},o.safeSetState=function(e,t){t=this.setNextCallback(t),this.setState(e,t)},o.setNextCallback=function(e){var t=this,n=!0;return this.nextCallback=function(r){n&&(n=!1,t.nextCallback=null,e(r))},this.nextCallback.cancel=function(){n=!1},this.nextCallback},o.onTransitionEnd=function(e,n){this.setNextCallback(n);var r=this.props.nodeRef?this.props.nodeRef.current:t.findDOMNode(this),o=null==e&&!this.props.addEndListener;if(r&&!o){if(this.props.addEndListener){var a=this.props.nodeRef?[this.nextCallback]:[r,this.nextCallback],i=a[0],l=a[1];this.props.addEndListener(i,l)}null!=e&&setTimeout(this.nextCallback,e)}else setTimeout(this.nextCallback,0)},o.render=function(){var t=this.state.status;if(t===u)return null;var n=this.props,r=n.children,o=(n.in,n.mountOnEnter,n.unmountOnExit,n.appear,n.enter,n.exit,n.timeout,n.addEndListener,n.onEnter,n.onEntering,n.onEntered,n.onExit,n.onExiting,n.onExited,n.nodeRef,(0,i.A)(n,["children","in","mountOnEnter","unmountOnExit","appear","enter","exit","timeout","addEndListener","onEnter","onEntering","onEntered","onExit","onExiting","onExited","nodeRef"]));return e.createElement(s.Provider,{value:null},"function"==typeof r?r(t,o):e.cloneElement(e.Children.only(r),o))},r}(e.Component);function h(){}m.contextType=s,m.propTypes={},m.defaultProps={in:!1,mountOnEnter:!1,unmountOnExit:!1,appear:!1,enter:!0,exit:!0,onEnter:h,onEntering:h,onEntered:h,onExit:h,onExiting:h,onExited:h},m.UNMOUNTED=u,m.EXITED=c,m.ENTERING=d,m.ENTERED=f,m.EXITING=p;const v=m;var g=n(3870),y=n(6061),b=n(8867);function x(){return(0,y.A)()||b.A}var w=function(e){return e.scrollTop};function E(e,t){var n=e.timeout,r=e.style,o=void 0===r?{}:r;return{duration:o.transitionDuration||"number"==typeof n?n:n[t.mode]||0,delay:o.transitionDelay}}var k=n(4801),S={entering:{opacity:1},entered:{opacity:1}},A={enter:g.p0.enteringScreen,exit:g.p0.leavingScreen},C=e.forwardRef((function(t,n){var i=t.children,l=t.disableStrictModeCompat,s=void 0!==l&&l,u=t.in,c=t.onEnter,d=t.onEntered,f=t.onEntering,p=t.onExit,m=t.onExited,h=t.onExiting,g=t.style,y=t.TransitionComponent,b=void 0===y?v:y,C=t.timeout,R=void 0===C?A:C,P=(0,a.A)(t,["children","disableStrictModeCompat","in","onEnter","onEntered","onEntering","onExit","onExited","onExiting","style","TransitionComponent","timeout"]),T=x(),N=T.unstable_strictMode&&!s,O=e.useRef(null),M=(0,k.A)(i.ref,n),L=(0,k.A)(N?O:void 0,M),z=function(e){return function(t,n){if(e){var r=N?[O.current,t]:[t,n],a=(0,o.A)(r,2),i=a[0],l=a[1];void 0===l?e(i):e(i,l)}}},_=z(f),I=z((function(e,t){w(e);var n=E({style:g,timeout:R},{mode:"enter"});e.style.webkitTransition=T.transitions.create("opacity",n),e.style.transition=T.transitions.create("opacity",n),c&&c(e,t)})),D=z(d),F=z(h),j=z((function(e){var t=E({style:g,timeout:R},{mode:"exit"});e.style.webkitTransition=T.transitions.create("opacity",t),e.style.transition=T.transitions.create("opacity",t),p&&p(e)})),B=z(m);return e.createElement(b,(0,r.A)({appear:!0,in:u,nodeRef:N?O:void 0,onEnter:I,onEntered:D,onEntering:_,onExit:j,onExited:B,onExiting:F,timeout:R},P),(function(t,n){return e.cloneElement(i,(0,r.A)({style:(0,r.A)({opacity:0,visibility:"exited"!==t||u?void 0:"hidden"},S[t],g,i.props.style),ref:L},n))}))}));const R=C;var P=n(53),T=n(5192),N=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.component,s=void 0===l?"div":l,u=t.square,c=void 0!==u&&u,d=t.elevation,f=void 0===d?1:d,p=t.variant,m=void 0===p?"elevation":p,h=(0,a.A)(t,["classes","className","component","square","elevation","variant"]);return e.createElement(s,(0,r.A)({className:(0,P.A)(o.root,i,"outlined"===m?o.outlined:o["elevation".concat(f)],!c&&o.rounded),ref:n},h))}));const O=(0,T.A)((function(e){var t={};return e.shadows.forEach((function(e,n){t["elevation".concat(n)]={boxShadow:e}})),(0,r.A)({root:{backgroundColor:e.palette.background.paper,color:e.palette.text.primary,transition:e.transitions.create("box-shadow")},rounded:{borderRadius:e.shape.borderRadius},outlined:{border:"1px solid ".concat(e.palette.divider)}},t)}),{name:"MuiPaper"})(N);var M=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.raised,s=void 0!==l&&l,u=(0,a.A)(t,["classes","className","raised"]);return e.createElement(O,(0,r.A)({className:(0,P.A)(o.root,i),elevation:s?8:1,ref:n},u))}));const L=(0,T.A)({root:{overflow:"hidden"}},{name:"MuiCard"})(M);var z=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.component,s=void 0===l?"div":l,u=(0,a.A)(t,["classes","className","component"]);return e.createElement(s,(0,r.A)({className:(0,P.A)(o.root,i),ref:n},u))}));const _=(0,T.A)({root:{padding:16,"&:last-child":{paddingBottom:24}}},{name:"MuiCardContent"})(z);var I=[0,1,2,3,4,5,6,7,8,9,10],D=["auto",!0,1,2,3,4,5,6,7,8,9,10,11,12];function F(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:1,n=parseFloat(e);return"".concat(n/t).concat(String(e).replace(String(n),"")||"px")}var j=e.forwardRef((function(t,n){var o=t.alignContent,i=void 0===o?"stretch":o,l=t.alignItems,s=void 0===l?"stretch":l,u=t.classes,c=t.className,d=t.component,f=void 0===d?"div":d,p=t.container,m=void 0!==p&&p,h=t.direction,v=void 0===h?"row":h,g=t.item,y=void 0!==g&&g,b=t.justify,x=t.justifyContent,w=void 0===x?"flex-start":x,E=t.lg,k=void 0!==E&&E,S=t.md,A=void 0!==S&&S,C=t.sm,R=void 0!==C&&C,T=t.spacing,N=void 0===T?0:T,O=t.wrap,M=void 0===O?"wrap":O,L=t.xl,z=void 0!==L&&L,_=t.xs,I=void 0!==_&&_,D=t.zeroMinWidth,F=void 0!==D&&D,j=(0,a.A)(t,["alignContent","alignItems","classes","className","component","container","direction","item","justify","justifyContent","lg","md","sm","spacing","wrap","xl","xs","zeroMinWidth"]),B=(0,P.A)(u.root,c,m&&[u.container,0!==N&&u["spacing-xs-".concat(String(N))]],y&&u.item,F&&u.zeroMinWidth,"row"!==v&&u["direction-xs-".concat(String(v))],"wrap"!==M&&u["wrap-xs-".concat(String(M))],"stretch"!==s&&u["align-items-xs-".concat(String(s))],"stretch"!==i&&u["align-content-xs-".concat(String(i))],"flex-start"!==(b||w)&&u["justify-content-xs-".concat(String(b||w))],!1!==I&&u["grid-xs-".concat(String(I))],!1!==R&&u["grid-sm-".concat(String(R))],!1!==A&&u["grid-md-".concat(String(A))],!1!==k&&u["grid-lg-".concat(String(k))],!1!==z&&u["grid-xl-".concat(String(z))]);return e.createElement(f,(0,r.A)({className:B,ref:n},j))})),B=(0,T.A)((function(e){return(0,r.A)({root:{},container:{boxSizing:"border-box",display:"flex",flexWrap:"wrap",width:"100%"},item:{boxSizing:"border-box",margin:"0"},zeroMinWidth:{minWidth:0},"direction-xs-column":{flexDirection:"column"},"direction-xs-column-reverse":{flexDirection:"column-reverse"},"direction-xs-row-reverse":{flexDirection:"row-reverse"},"wrap-xs-nowrap":{flexWrap:"nowrap"},"wrap-xs-wrap-reverse":{flexWrap:"wrap-reverse"},"align-items-xs-center":{alignItems:"center"},"align-items-xs-flex-start":{alignItems:"flex-start"},"align-items-xs-flex-end":{alignItems:"flex-end"},"align-items-xs-baseline":{alignItems:"baseline"},"align-content-xs-center":{alignContent:"center"},"align-content-xs-flex-start":{alignContent:"flex-start"},"align-content-xs-flex-end":{alignContent:"flex-end"},"align-content-xs-space-between":{alignContent:"space-between"},"align-content-xs-space-around":{alignContent:"space-around"},"justify-content-xs-center":{justifyContent:"center"},"justify-content-xs-flex-end":{justifyContent:"flex-end"},"justify-content-xs-space-between":{justifyContent:"space-between"},"justify-content-xs-space-around":{justifyContent:"space-around"},"justify-content-xs-space-evenly":{justifyContent:"space-evenly"}},function(e){var t={};return I.forEach((function(n){var r=e.spacing(n);0!==r&&(t["spacing-".concat("xs","-").concat(n)]={margin:"-".concat(F(r,2)),width:"calc(100% + ".concat(F(r),")"),"& > $item":{padding:F(r,2)}})})),t}(e),e.breakpoints.keys.reduce((function(t,n){return function(e,t,n){var o={};D.forEach((function(e){var t="grid-".concat(n,"-").concat(e);if(!0!==e)if("auto"!==e){var r="".concat(Math.round(e/12*1e8)/1e6,"%");o[t]={flexBasis:r,flexGrow:0,maxWidth:r}}else o[t]={flexBasis:"auto",flexGrow:0,maxWidth:"none"};else o[t]={flexBasis:0,flexGrow:1,maxWidth:"100%"}})),"xs"===n?(0,r.A)(e,o):e[t.breakpoints.up(n)]=o}(t,e,n),t}),{}))}),{name:"MuiGrid"})(j);const W=B;var V=n(7515),H={h1:"h1",h2:"h2",h3:"h3",h4:"h4",h5:"h5",h6:"h6",subtitle1:"h6",subtitle2:"h6",body1:"p",body2:"p"},U=e.forwardRef((function(t,n){var o=t.align,i=void 0===o?"inherit":o,l=t.classes,s=t.className,u=t.color,c=void 0===u?"initial":u,d=t.component,f=t.display,p=void 0===f?"initial":f,m=t.gutterBottom,h=void 0!==m&&m,v=t.noWrap,g=void 0!==v&&v,y=t.paragraph,b=void 0!==y&&y,x=t.variant,w=void 0===x?"body1":x,E=t.variantMapping,k=void 0===E?H:E,S=(0,a.A)(t,["align","classes","className","color","component","display","gutterBottom","noWrap","paragraph","variant","variantMapping"]),A=d||(b?"p":k[w]||H[w])||"span";return e.createElement(A,(0,r.A)({className:(0,P.A)(l.root,s,"inherit"!==w&&l[w],"initial"!==c&&l["color".concat((0,V.A)(c))],g&&l.noWrap,h&&l.gutterBottom,b&&l.paragraph,"inherit"!==i&&l["align".concat((0,V.A)(i))],"initial"!==p&&l["display".concat((0,V.A)(p))]),ref:n},S))}));const q=(0,T.A)((function(e){return{root:{margin:0},body2:e.typography.body2,body1:e.typography.body1,caption:e.typography.caption,button:e.typography.button,h1:e.typography.h1,h2:e.typography.h2,h3:e.typography.h3,h4:e.typography.h4,h5:e.typography.h5,h6:e.typography.h6,subtitle1:e.typography.subtitle1,subtitle2:e.typography.subtitle2,overline:e.typography.overline,srOnly:{position:"absolute",height:1,width:1,overflow:"hidden"},alignLeft:{textAlign:"left"},alignCenter:{textAlign:"center"},alignRight:{textAlign:"right"},alignJustify:{textAlign:"justify"},noWrap:{overflow:"hidden",textOverflow:"ellipsis",whiteSpace:"nowrap"},gutterBottom:{marginBottom:"0.35em"},paragraph:{marginBottom:16},colorInherit:{color:"inherit"},colorPrimary:{color:e.palette.primary.main},colorSecondary:{color:e.palette.secondary.main},colorTextPrimary:{color:e.palette.text.primary},colorTextSecondary:{color:e.palette.text.secondary},colorError:{color:e.palette.error.main},displayInline:{display:"inline"},displayBlock:{display:"block"}}}),{name:"MuiTypography"})(U);var K=n(7860);function X(e){var t=e.props,n=e.states,r=e.muiFormControl;return n.reduce((function(e,n){return e[n]=t[n],r&&void 0===t[n]&&(e[n]=r[n]),e}),{})}var Q=e.createContext();const Y=Q;var G=n(1198);function J(e,t){return parseInt(e[t],10)||0}var Z="undefined"!=typeof window?e.useLayoutEffect:e.useEffect,ee={visibility:"hidden",position:"absolute",overflow:"hidden",height:0,top:0,left:0,transform:"translateZ(0)"};const te=e.forwardRef((function(t,n){var o=t.onChange,i=t.rows,l=t.rowsMax,s=t.rowsMin,u=t.maxRows,c=t.minRows,d=void 0===c?1:c,f=t.style,p=t.value,m=(0,a.A)(t,["onChange","rows","rowsMax","rowsMin","maxRows","minRows","style","value"]),h=u||l,v=i||s||d,g=e.useRef(null!=p).current,y=e.useRef(null),b=(0,k.A)(n,y),x=e.useRef(null),w=e.useRef(0),E=e.useState({}),S=E[0],A=E[1],C=e.useCallback((function(){var e=y.current,n=window.getComputedStyle(e),r=x.current;r.style.width=n.width,r.value=e.value||t.placeholder||"x","\n"===r.value.slice(-1)&&(r.value+=" ");var o=n["box-sizing"],a=J(n,"padding-bottom")+J(n,"padding-top"),i=J(n,"border-bottom-width")+J(n,"border-top-width"),l=r.scrollHeight-a;r.value="x";var s=r.scrollHeight-a,u=l;v&&(u=Math.max(Number(v)*s,u)),h&&(u=Math.min(Number(h)*s,u));var c=(u=Math.max(u,s))+("border-box"===o?a+i:0),d=Math.abs(u-l)<=1;A((function(e){return w.current<20&&(c>0&&Math.abs((e.outerHeightStyle||0)-c)>1||e.overflow!==d)?(w.current+=1,{overflow:d,outerHeightStyle:c}):e}))}),[h,v,t.placeholder]);return e.useEffect((function(){var e=(0,G.A)((function(){w.current=0,C()}));return window.addEventListener("resize",e),function(){e.clear(),window.removeEventListener("resize",e)}}),[C]),Z((function(){C()})),e.useEffect((function(){w.current=0}),[p]),e.createElement(e.Fragment,null,e.createElement("textarea",(0,r.A)({value:p,onChange:function(e){w.current=0,g||C(),o&&o(e)},ref:b,rows:v,style:(0,r.A)({height:S.outerHeightStyle,overflow:S.overflow?"hidden":null},f)},m)),e.createElement("textarea",{"aria-hidden":!0,className:t.className,readOnly:!0,ref:x,tabIndex:-1,style:(0,r.A)({},ee,f)}))}));function ne(e){return null!=e&&!(Array.isArray(e)&&0===e.length)}function re(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1];return e&&(ne(e.value)&&""!==e.value||t&&ne(e.defaultValue)&&""!==e.defaultValue)}var oe="undefined"==typeof window?e.useEffect:e.useLayoutEffect,ae=e.forwardRef((function(t,n){var o=t["aria-describedby"],i=t.autoComplete,l=t.autoFocus,s=t.classes,u=t.className,c=(t.color,t.defaultValue),d=t.disabled,f=t.endAdornment,p=(t.error,t.fullWidth),m=void 0!==p&&p,h=t.id,v=t.inputComponent,g=void 0===v?"input":v,y=t.inputProps,b=void 0===y?{}:y,x=t.inputRef,w=(t.margin,t.multiline),E=void 0!==w&&w,S=t.name,A=t.onBlur,C=t.onChange,R=t.onClick,T=t.onFocus,N=t.onKeyDown,O=t.onKeyUp,M=t.placeholder,L=t.readOnly,z=t.renderSuffix,_=t.rows,I=t.rowsMax,D=t.rowsMin,F=t.maxRows,j=t.minRows,B=t.startAdornment,W=t.type,$=void 0===W?"text":W,H=t.value,U=(0,a.A)(t,["aria-describedby","autoComplete","autoFocus","classes","className","color","defaultValue","disabled","endAdornment","error","fullWidth","id","inputComponent","inputProps","inputRef","margin","multiline","name","onBlur","onChange","onClick","onFocus","onKeyDown","onKeyUp","placeholder","readOnly","renderSuffix","rows","rowsMax","rowsMin","maxRows","minRows","startAdornment","type","value"]),q=null!=b.value?b.value:H,G=e.useRef(null!=q).current,J=e.useRef(),Z=e.useCallback((function(e){}),[]),ee=(0,k.A)(b.ref,Z),ne=(0,k.A)(x,ee),ae=(0,k.A)(J,ne),ie=e.useState(!1),le=ie[0],se=ie[1],ue=e.useContext(Q),ce=X({props:t,muiFormControl:ue,states:["color","disabled","error","hiddenLabel","margin","required","filled"]});ce.focused=ue?ue.focused:le,e.useEffect((function(){!ue&&d&&le&&(se(!1),A&&A())}),[ue,d,le,A]);var de=ue&&ue.onFilled,fe=ue&&ue.onEmpty,pe=e.useCallback((function(e){re(e)?de&&de():fe&&fe()}),[de,fe]);oe((function(){G&&pe({value:q})}),[q,pe,G]),e.useEffect((function(){pe(J.current)}),[]);var me=g,he=(0,r.A)({},b,{ref:ae});return"string"!=typeof me?he=(0,r.A)({inputRef:ae,type:$},he,{ref:null}):E?!_||F||j||I||D?(he=(0,r.A)({minRows:_||j,rowsMax:I,maxRows:F},he),me=te):me="textarea":he=(0,r.A)({type:$},he),e.useEffect((function(){ue&&ue.setAdornedStart(Boolean(B))}),[ue,B]),e.createElement("div",(0,r.A)({className:(0,P.A)(s.root,s["color".concat((0,V.A)(ce.color||"primary"))],u,ce.disabled&&s.disabled,ce.error&&s.error,m&&s.fullWidth,ce.focused&&s.focused,ue&&s.formControl,E&&s.multiline,B&&s.adornedStart,f&&s.adornedEnd,"dense"===ce.margin&&s.marginDense),onClick:function(e){J.current&&e.currentTarget===e.target&&J.current.focus(),R&&R(e)},ref:n},U),B,e.createElement(Y.Provider,{value:null},e.createElement(me,(0,r.A)({"aria-invalid":ce.error,"aria-describedby":o,autoComplete:i,autoFocus:l,defaultValue:c,disabled:ce.disabled,id:h,onAnimationStart:function(e){pe("mui-auto-fill-cancel"===e.animationName?J.current:{value:"x"})},name:S,placeholder:M,readOnly:L,required:ce.required,rows:_,value:q,onKeyDown:N,onKeyUp:O},he,{className:(0,P.A)(s.input,b.className,ce.disabled&&s.disabled,E&&s.inputMultiline,ce.hiddenLabel&&s.inputHiddenLabel,B&&s.inputAdornedStart,f&&s.inputAdornedEnd,"search"===$&&s.inputTypeSearch,"dense"===ce.margin&&s.inputMarginDense),onBlur:function(e){A&&A(e),b.onBlur&&b.onBlur(e),ue&&ue.onBlur?ue.onBlur(e):se(!1)},onChange:function(e){if(!G){var t=e.target||J.current;if(null==t)throw new Error((0,K.A)(1));pe({value:t.value})}for(var n=arguments.length,r=new Array(n>1?n-1:0),o=1;o<n;o++)r[o-1]=arguments[o];b.onChange&&b.onChange.apply(b,[e].concat(r)),C&&C.apply(void 0,[e].concat(r))},onFocus:function(e){ce.disabled?e.stopPropagation():(T&&T(e),b.onFocus&&b.onFocus(e),ue&&ue.onFocus?ue.onFocus(e):se(!0))}}))),f,z?z((0,r.A)({},ce,{startAdornment:B})):null)}));const ie=(0,T.A)((function(e){var t="light"===e.palette.type,n={color:"currentColor",opacity:t?.42:.5,transition:e.transitions.create("opacity",{duration:e.transitions.duration.shorter})},o={opacity:"0 !important"},a={opacity:t?.42:.5};return{"@global":{"@keyframes mui-auto-fill":{},"@keyframes mui-auto-fill-cancel":{}},root:(0,r.A)({},e.typography.body1,{color:e.palette.text.primary,lineHeight:"1.1876em",boxSizing:"border-box",position:"relative",cursor:"text",display:"inline-flex",alignItems:"center","&$disabled":{color:e.palette.text.disabled,cursor:"default"}}),formControl:{},focused:{},disabled:{},adornedStart:{},adornedEnd:{},error:{},marginDense:{},multiline:{padding:"".concat(6,"px 0 ").concat(7,"px"),"&$marginDense":{paddingTop:3}},colorSecondary:{},fullWidth:{width:"100%"},input:{font:"inherit",letterSpacing:"inherit",color:"currentColor",padding:"".concat(6,"px 0 ").concat(7,"px"),border:0,boxSizing:"content-box",background:"none",height:"1.1876em",margin:0,WebkitTapHighlightColor:"transparent",display:"block",minWidth:0,width:"100%",animationName:"mui-auto-fill-cancel",animationDuration:"10ms","&::-webkit-input-placeholder":n,"&::-moz-placeholder":n,"&:-ms-input-placeholder":n,"&::-ms-input-placeholder":n,"&:focus":{outline:0},"&:invalid":{boxShadow:"none"},"&::-webkit-search-decoration":{"-webkit-appearance":"none"},"label[data-shrink=false] + $formControl &":{"&::-webkit-input-placeholder":o,"&::-moz-placeholder":o,"&:-ms-input-placeholder":o,"&::-ms-input-placeholder":o,"&:focus::-webkit-input-placeholder":a,"&:focus::-moz-placeholder":a,"&:focus:-ms-input-placeholder":a,"&:focus::-ms-input-placeholder":a},"&$disabled":{opacity:1},"&:-webkit-autofill":{animationDuration:"5000s",animationName:"mui-auto-fill"}},inputMarginDense:{paddingTop:3},inputMultiline:{height:"auto",resize:"none",padding:0},inputTypeSearch:{"-moz-appearance":"textfield","-webkit-appearance":"textfield"},inputAdornedStart:{},inputAdornedEnd:{},inputHiddenLabel:{}}}),{name:"MuiInputBase"})(ae);var le=e.forwardRef((function(t,n){var o=t.disableUnderline,i=t.classes,l=t.fullWidth,s=void 0!==l&&l,u=t.inputComponent,c=void 0===u?"input":u,d=t.multiline,f=void 0!==d&&d,p=t.type,m=void 0===p?"text":p,h=(0,a.A)(t,["disableUnderline","classes","fullWidth","inputComponent","multiline","type"]);return e.createElement(ie,(0,r.A)({classes:(0,r.A)({},i,{root:(0,P.A)(i.root,!o&&i.underline),underline:null}),fullWidth:s,inputComponent:c,multiline:f,ref:n,type:m},h))}));le.muiName="Input";const se=(0,T.A)((function(e){var t="light"===e.palette.type?"rgba(0, 0, 0, 0.42)":"rgba(255, 255, 255, 0.7)";return{root:{position:"relative"},formControl:{"label + &":{marginTop:16}},focused:{},disabled:{},colorSecondary:{"&$underline:after":{borderBottomColor:e.palette.secondary.main}},underline:{"&:after":{borderBottom:"2px solid ".concat(e.palette.primary.main),left:0,bottom:0,content:'""',position:"absolute",right:0,transform:"scaleX(0)",transition:e.transitions.create("transform",{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut}),pointerEvents:"none"},"&$focused:after":{transform:"scaleX(1)"},"&$error:after":{borderBottomColor:e.palette.error.main,transform:"scaleX(1)"},"&:before":{borderBottom:"1px solid ".concat(t),left:0,bottom:0,content:'"\\00a0"',position:"absolute",right:0,transition:e.transitions.create("border-bottom-color",{duration:e.transitions.duration.shorter}),pointerEvents:"none"},"&:hover:not($disabled):before":{borderBottom:"2px solid ".concat(e.palette.text.primary),"@media (hover: none)":{borderBottom:"1px solid ".concat(t)}},"&$disabled:before":{borderBottomStyle:"dotted"}},error:{},marginDense:{},multiline:{},fullWidth:{},input:{},inputMarginDense:{},inputMultiline:{},inputTypeSearch:{}}}),{name:"MuiInput"})(le);var ue=e.forwardRef((function(t,n){var o=t.disableUnderline,i=t.classes,l=t.fullWidth,s=void 0!==l&&l,u=t.inputComponent,c=void 0===u?"input":u,d=t.multiline,f=void 0!==d&&d,p=t.type,m=void 0===p?"text":p,h=(0,a.A)(t,["disableUnderline","classes","fullWidth","inputComponent","multiline","type"]);return e.createElement(ie,(0,r.A)({classes:(0,r.A)({},i,{root:(0,P.A)(i.root,!o&&i.underline),underline:null}),fullWidth:s,inputComponent:c,multiline:f,ref:n,type:m},h))}));ue.muiName="Input";const ce=(0,T.A)((function(e){var t="light"===e.palette.type,n=t?"rgba(0, 0, 0, 0.42)":"rgba(255, 255, 255, 0.7)",r=t?"rgba(0, 0, 0, 0.09)":"rgba(255, 255, 255, 0.09)";return{root:{position:"relative",backgroundColor:r,borderTopLeftRadius:e.shape.borderRadius,borderTopRightRadius:e.shape.borderRadius,transition:e.transitions.create("background-color",{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut}),"&:hover":{backgroundColor:t?"rgba(0, 0, 0, 0.13)":"rgba(255, 255, 255, 0.13)","@media (hover: none)":{backgroundColor:r}},"&$focused":{backgroundColor:t?"rgba(0, 0, 0, 0.09)":"rgba(255, 255, 255, 0.09)"},"&$disabled":{backgroundColor:t?"rgba(0, 0, 0, 0.12)":"rgba(255, 255, 255, 0.12)"}},colorSecondary:{"&$underline:after":{borderBottomColor:e.palette.secondary.main}},underline:{"&:after":{borderBottom:"2px solid ".concat(e.palette.primary.main),left:0,bottom:0,content:'""',position:"absolute",right:0,transform:"scaleX(0)",transition:e.transitions.create("transform",{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut}),pointerEvents:"none"},"&$focused:after":{transform:"scaleX(1)"},"&$error:after":{borderBottomColor:e.palette.error.main,transform:"scaleX(1)"},"&:before":{borderBottom:"1px solid ".concat(n),left:0,bottom:0,content:'"\\00a0"',position:"absolute",right:0,transition:e.transitions.create("border-bottom-color",{duration:e.transitions.duration.shorter}),pointerEvents:"none"},"&:hover:before":{borderBottom:"1px solid ".concat(e.palette.text.primary)},"&$disabled:before":{borderBottomStyle:"dotted"}},focused:{},disabled:{},adornedStart:{paddingLeft:12},adornedEnd:{paddingRight:12},error:{},marginDense:{},multiline:{padding:"27px 12px 10px","&$marginDense":{paddingTop:23,paddingBottom:6}},input:{padding:"27px 12px 10px","&:-webkit-autofill":{WebkitBoxShadow:"light"===e.palette.type?null:"0 0 0 100px #266798 inset",WebkitTextFillColor:"light"===e.palette.type?null:"#fff",caretColor:"light"===e.palette.type?null:"#fff",borderTopLeftRadius:"inherit",borderTopRightRadius:"inherit"}},inputMarginDense:{paddingTop:23,paddingBottom:6},inputHiddenLabel:{paddingTop:18,paddingBottom:19,"&$inputMarginDense":{paddingTop:10,paddingBottom:11}},inputMultiline:{padding:0},inputAdornedStart:{paddingLeft:0},inputAdornedEnd:{paddingRight:0}}}),{name:"MuiFilledInput"})(ue);var de=n(4467),fe=e.forwardRef((function(t,n){t.children;var o=t.classes,i=t.className,l=t.label,s=t.labelWidth,u=t.notched,c=t.style,d=(0,a.A)(t,["children","classes","className","label","labelWidth","notched","style"]),f="rtl"===x().direction?"right":"left";if(void 0!==l)return e.createElement("fieldset",(0,r.A)({"aria-hidden":!0,className:(0,P.A)(o.root,i),ref:n,style:c},d),e.createElement("legend",{className:(0,P.A)(o.legendLabelled,u&&o.legendNotched)},l?e.createElement("span",null,l):e.createElement("span",{dangerouslySetInnerHTML:{__html:"&#8203;"}})));var p=s>0?.75*s+8:.01;return e.createElement("fieldset",(0,r.A)({"aria-hidden":!0,style:(0,r.A)((0,de.A)({},"padding".concat((0,V.A)(f)),8),c),className:(0,P.A)(o.root,i),ref:n},d),e.createElement("legend",{className:o.legend,style:{width:u?p:.01}},e.createElement("span",{dangerouslySetInnerHTML:{__html:"&#8203;"}})))}));const pe=(0,T.A)((function(e){return{root:{position:"absolute",bottom:0,right:0,top:-5,left:0,margin:0,padding:"0 8px",pointerEvents:"none",borderRadius:"inherit",borderStyle:"solid",borderWidth:1,overflow:"hidden"},legend:{textAlign:"left",padding:0,lineHeight:"11px",transition:e.transitions.create("width",{duration:150,easing:e.transitions.easing.easeOut})},legendLabelled:{display:"block",width:"auto",textAlign:"left",padding:0,height:11,fontSize:"0.75em",visibility:"hidden",maxWidth:.01,transition:e.transitions.create("max-width",{duration:50,easing:e.transitions.easing.easeOut}),"& > span":{paddingLeft:5,paddingRight:5,display:"inline-block"}},legendNotched:{maxWidth:1e3,transition:e.transitions.create("max-width",{duration:100,easing:e.transitions.easing.easeOut,delay:50})}}}),{name:"PrivateNotchedOutline"})(fe);var me=e.forwardRef((function(t,n){var o=t.classes,i=t.fullWidth,l=void 0!==i&&i,s=t.inputComponent,u=void 0===s?"input":s,c=t.label,d=t.labelWidth,f=void 0===d?0:d,p=t.multiline,m=void 0!==p&&p,h=t.notched,v=t.type,g=void 0===v?"text":v,y=(0,a.A)(t,["classes","fullWidth","inputComponent","label","labelWidth","multiline","notched","type"]);return e.createElement(ie,(0,r.A)({renderSuffix:function(t){return e.createElement(pe,{className:o.notchedOutline,label:c,labelWidth:f,notched:void 0!==h?h:Boolean(t.startAdornment||t.filled||t.focused)})},classes:(0,r.A)({},o,{root:(0,P.A)(o.root,o.underline),notchedOutline:null}),fullWidth:l,inputComponent:u,multiline:m,ref:n,type:g},y))}));me.muiName="Input";const he=(0,T.A)((function(e){var t="light"===e.palette.type?"rgba(0, 0, 0, 0.23)":"rgba(255, 255, 255, 0.23)";return{root:{position:"relative",borderRadius:e.shape.borderRadius,"&:hover $notchedOutline":{borderColor:e.palette.text.primary},"@media (hover: none)":{"&:hover $notchedOutline":{borderColor:t}},"&$focused $notchedOutline":{borderColor:e.palette.primary.main,borderWidth:2},"&$error $notchedOutline":{borderColor:e.palette.error.main},"&$disabled $notchedOutline":{borderColor:e.palette.action.disabled}},colorSecondary:{"&$focused $notchedOutline":{borderColor:e.palette.secondary.main}},focused:{},disabled:{},adornedStart:{paddingLeft:14},adornedEnd:{paddingRight:14},error:{},marginDense:{},multiline:{padding:"18.5px 14px","&$marginDense":{paddingTop:10.5,paddingBottom:10.5}},notchedOutline:{borderColor:t},input:{padding:"18.5px 14px","&:-webkit-autofill":{WebkitBoxShadow:"light"===e.palette.type?null:"0 0 0 100px #266798 inset",WebkitTextFillColor:"light"===e.palette.type?null:"#fff",caretColor:"light"===e.palette.type?null:"#fff",borderRadius:"inherit"}},inputMarginDense:{paddingTop:10.5,paddingBottom:10.5},inputMultiline:{padding:0},inputAdornedStart:{paddingLeft:0},inputAdornedEnd:{paddingRight:0}}}),{name:"MuiOutlinedInput"})(me);function ve(){return e.useContext(Y)}var ge=e.forwardRef((function(t,n){var o=t.children,i=t.classes,l=t.className,s=(t.color,t.component),u=void 0===s?"label":s,c=(t.disabled,t.error,t.filled,t.focused,t.required,(0,a.A)(t,["children","classes","className","color","component","disabled","error","filled","focused","required"])),d=X({props:t,muiFormControl:ve(),states:["color","required","focused","disabled","error","filled"]});return e.createElement(u,(0,r.A)({className:(0,P.A)(i.root,i["color".concat((0,V.A)(d.color||"primary"))],l,d.disabled&&i.disabled,d.error&&i.error,d.filled&&i.filled,d.focused&&i.focused,d.required&&i.required),ref:n},c),o,d.required&&e.createElement("span",{"aria-hidden":!0,className:(0,P.A)(i.asterisk,d.error&&i.error)}," ","*"))}));const ye=(0,T.A)((function(e){return{root:(0,r.A)({color:e.palette.text.secondary},e.typography.body1,{lineHeight:1,padding:0,"&$focused":{color:e.palette.primary.main},"&$disabled":{color:e.palette.text.disabled},"&$error":{color:e.palette.error.main}}),colorSecondary:{"&$focused":{color:e.palette.secondary.main}},focused:{},disabled:{},error:{},filled:{},required:{},asterisk:{"&$error":{color:e.palette.error.main}}}}),{name:"MuiFormLabel"})(ge);var be=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.disableAnimation,s=void 0!==l&&l,u=(t.margin,t.shrink),c=(t.variant,(0,a.A)(t,["classes","className","disableAnimation","margin","shrink","variant"])),d=ve(),f=u;void 0===f&&d&&(f=d.filled||d.focused||d.adornedStart);var p=X({props:t,muiFormControl:d,states:["margin","variant"]});return e.createElement(ye,(0,r.A)({"data-shrink":f,className:(0,P.A)(o.root,i,d&&o.formControl,!s&&o.animated,f&&o.shrink,"dense"===p.margin&&o.marginDense,{filled:o.filled,outlined:o.outlined}[p.variant]),classes:{focused:o.focused,disabled:o.disabled,error:o.error,required:o.required,asterisk:o.asterisk},ref:n},c))}));const xe=(0,T.A)((function(e){return{root:{display:"block",transformOrigin:"top left"},focused:{},disabled:{},error:{},required:{},asterisk:{},formControl:{position:"absolute",left:0,top:0,transform:"translate(0, 24px) scale(1)"},marginDense:{transform:"translate(0, 21px) scale(1)"},shrink:{transform:"translate(0, 1.5px) scale(0.75)",transformOrigin:"top left"},animated:{transition:e.transitions.create(["color","transform"],{duration:e.transitions.duration.shorter,easing:e.transitions.easing.easeOut})},filled:{zIndex:1,pointerEvents:"none",transform:"translate(12px, 20px) scale(1)","&$marginDense":{transform:"translate(12px, 17px) scale(1)"},"&$shrink":{transform:"translate(12px, 10px) scale(0.75)","&$marginDense":{transform:"translate(12px, 7px) scale(0.75)"}}},outlined:{zIndex:1,pointerEvents:"none",transform:"translate(14px, 20px) scale(1)","&$marginDense":{transform:"translate(14px, 12px) scale(1)"},"&$shrink":{transform:"translate(14px, -6px) scale(0.75)"}}}}),{name:"MuiInputLabel"})(be);var we=n(7570),Ee=e.forwardRef((function(t,n){var o=t.children,i=t.classes,l=t.className,s=t.color,u=void 0===s?"primary":s,c=t.component,d=void 0===c?"div":c,f=t.disabled,p=void 0!==f&&f,m=t.error,h=void 0!==m&&m,v=t.fullWidth,g=void 0!==v&&v,y=t.focused,b=t.hiddenLabel,x=void 0!==b&&b,w=t.margin,E=void 0===w?"none":w,k=t.required,S=void 0!==k&&k,A=t.size,C=t.variant,R=void 0===C?"standard":C,T=(0,a.A)(t,["children","classes","className","color","component","disabled","error","fullWidth","focused","hiddenLabel","margin","required","size","variant"]),N=e.useState((function(){var t=!1;return o&&e.Children.forEach(o,(function(e){if((0,we.A)(e,["Input","Select"])){var n=(0,we.A)(e,["Select"])?e.props.input:e;n&&n.props.startAdornment&&(t=!0)}})),t})),O=N[0],M=N[1],L=e.useState((function(){var t=!1;return o&&e.Children.forEach(o,(function(e){(0,we.A)(e,["Input","Select"])&&re(e.props,!0)&&(t=!0)})),t})),z=L[0],_=L[1],I=e.useState(!1),D=I[0],F=I[1],j=void 0!==y?y:D;p&&j&&F(!1);var B=e.useCallback((function(){_(!0)}),[]),W={adornedStart:O,setAdornedStart:M,color:u,disabled:p,error:h,filled:z,focused:j,fullWidth:g,hiddenLabel:x,margin:("small"===A?"dense":void 0)||E,onBlur:function(){F(!1)},onEmpty:e.useCallback((function(){_(!1)}),[]),onFilled:B,onFocus:function(){F(!0)},registerEffect:void 0,required:S,variant:R};return e.createElement(Y.Provider,{value:W},e.createElement(d,(0,r.A)({className:(0,P.A)(i.root,l,"none"!==E&&i["margin".concat((0,V.A)(E))],g&&i.fullWidth),ref:n},T),o))}));const ke=(0,T.A)({root:{display:"inline-flex",flexDirection:"column",position:"relative",minWidth:0,padding:0,margin:0,border:0,verticalAlign:"top"},marginNormal:{marginTop:16,marginBottom:8},marginDense:{marginTop:8,marginBottom:4},fullWidth:{width:"100%"}},{name:"MuiFormControl"})(Ee);var Se=e.forwardRef((function(t,n){var o=t.children,i=t.classes,l=t.className,s=t.component,u=void 0===s?"p":s,c=(t.disabled,t.error,t.filled,t.focused,t.margin,t.required,t.variant,(0,a.A)(t,["children","classes","className","component","disabled","error","filled","focused","margin","required","variant"])),d=X({props:t,muiFormControl:ve(),states:["variant","margin","disabled","error","filled","focused","required"]});return e.createElement(u,(0,r.A)({className:(0,P.A)(i.root,("filled"===d.variant||"outlined"===d.variant)&&i.contained,l,d.disabled&&i.disabled,d.error&&i.error,d.filled&&i.filled,d.focused&&i.focused,d.required&&i.required,"dense"===d.margin&&i.marginDense),ref:n},c)," "===o?e.createElement("span",{dangerouslySetInnerHTML:{__html:"&#8203;"}}):o)}));const Ae=(0,T.A)((function(e){return{root:(0,r.A)({color:e.palette.text.secondary},e.typography.caption,{textAlign:"left",marginTop:3,margin:0,"&$disabled":{color:e.palette.text.disabled},"&$error":{color:e.palette.error.main}}),error:{},disabled:{},marginDense:{marginTop:4},contained:{marginLeft:14,marginRight:14},focused:{},filled:{},required:{}}}),{name:"MuiFormHelperText"})(Se);var Ce=n(3043),Re=n(2284),Pe=(n(4363),n(1475)),Te=n(6182),Ne=n(8521),Oe=n(6081),Me=n(4960),Le="undefined"!=typeof window?e.useLayoutEffect:e.useEffect;const ze=e.forwardRef((function(n,r){var o=n.children,a=n.container,i=n.disablePortal,l=void 0!==i&&i,s=n.onRendered,u=e.useState(null),c=u[0],d=u[1],f=(0,k.A)(e.isValidElement(o)?o.ref:null,r);return Le((function(){l||d(function(e){return e="function"==typeof e?e():e,t.findDOMNode(e)}(a)||document.body)}),[a,l]),Le((function(){if(c&&!l)return(0,Me.A)(r,c),function(){(0,Me.A)(r,null)}}),[r,c,l]),Le((function(){s&&(c||l)&&s()}),[s,c,l]),l?e.isValidElement(o)?e.cloneElement(o,{ref:f}):o:c?t.createPortal(o,c):c}));var _e=n(2319),Ie=n(9474),De=n(2901),Fe=n(5458);function je(){var e=document.createElement("div");e.style.width="99px",e.style.height="99px",e.style.position="absolute",e.style.top="-9999px",e.style.overflow="scroll",document.body.appendChild(e);var t=e.offsetWidth-e.clientWidth;return document.body.removeChild(e),t}function Be(e,t){t?e.setAttribute("aria-hidden","true"):e.removeAttribute("aria-hidden")}function We(e){return parseInt(window.getComputedStyle(e)["padding-right"],10)||0}function $e(e,t,n){var r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:[],o=arguments.length>4?arguments[4]:void 0,a=[t,n].concat((0,Fe.A)(r)),i=["TEMPLATE","SCRIPT","STYLE"];[].forEach.call(e.children,(function(e){1===e.nodeType&&-1===a.indexOf(e)&&-1===i.indexOf(e.tagName)&&Be(e,o)}))}function Ve(e,t){var n=-1;return e.some((function(e,r){return!!t(e)&&(n=r,!0)})),n}var He=function(){function e(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.modals=[],this.containers=[]}return(0,De.A)(e,[{key:"add",value:function(e,t){var n=this.modals.indexOf(e);if(-1!==n)return n;n=this.modals.length,this.modals.push(e),e.modalRef&&Be(e.modalRef,!1);var r=function(e){var t=[];return[].forEach.call(e.children,(function(e){e.getAttribute&&"true"===e.getAttribute("aria-hidden")&&t.push(e)})),t}(t);$e(t,e.mountNode,e.modalRef,r,!0);var o=Ve(this.containers,(function(e){return e.container===t}));return-1!==o?(this.containers[o].modals.push(e),n):(this.containers.push({modals:[e],container:t,restore:null,hiddenSiblingNodes:r}),n)}},{key:"mount",value:function(e,t){var n=Ve(this.containers,(function(t){return-1!==t.modals.indexOf(e)})),r=this.containers[n];r.restore||(r.restore=function(e,t){var n,r=[],o=[],a=e.container;if(!t.disableScrollLock){if(function(e){var t=(0,Pe.A)(e);return t.body===e?(0,Te.A)(t).innerWidth>t.documentElement.clientWidth:e.scrollHeight>e.clientHeight}(a)){var i=je();r.push({value:a.style.paddingRight,key:"padding-right",el:a}),a.style["padding-right"]="".concat(We(a)+i,"px"),n=(0,Pe.A)(a).querySelectorAll(".mui-fixed"),[].forEach.call(n,(function(e){o.push(e.style.paddingRight),e.style.paddingRight="".concat(We(e)+i,"px")}))}var l=a.parentElement,s="HTML"===l.nodeName&&"scroll"===window.getComputedStyle(l)["overflow-y"]?l:a;r.push({value:s.style.overflow,key:"overflow",el:s}),s.style.overflow="hidden"}return function(){n&&[].forEach.call(n,(function(e,t){o[t]?e.style.paddingRight=o[t]:e.style.removeProperty("padding-right")})),r.forEach((function(e){var t=e.value,n=e.el,r=e.key;t?n.style.setProperty(r,t):n.style.removeProperty(r)}))}}(r,t))}},{key:"remove",value:function(e){var t=this.modals.indexOf(e);if(-1===t)return t;var n=Ve(this.containers,(function(t){return-1!==t.modals.indexOf(e)})),r=this.containers[n];if(r.modals.splice(r.modals.indexOf(e),1),this.modals.splice(t,1),0===r.modals.length)r.restore&&r.restore(),e.modalRef&&Be(e.modalRef,!0),$e(r.container,e.mountNode,e.modalRef,r.hiddenSiblingNodes,!1),this.containers.splice(n,1);else{var o=r.modals[r.modals.length-1];o.modalRef&&Be(o.modalRef,!1)}return t}},{key:"isTopModal",value:function(e){return this.modals.length>0&&this.modals[this.modals.length-1]===e}}]),e}();const Ue=function(n){var r=n.children,o=n.disableAutoFocus,a=void 0!==o&&o,i=n.disableEnforceFocus,l=void 0!==i&&i,s=n.disableRestoreFocus,u=void 0!==s&&s,c=n.getDoc,d=n.isEnabled,f=n.open,p=e.useRef(),m=e.useRef(null),h=e.useRef(null),v=e.useRef(),g=e.useRef(null),y=e.useCallback((function(e){g.current=t.findDOMNode(e)}),[]),b=(0,k.A)(r.ref,y),x=e.useRef();return e.useEffect((function(){x.current=f}),[f]),!x.current&&f&&"undefined"!=typeof window&&(v.current=c().activeElement),e.useEffect((function(){if(f){var e=(0,Pe.A)(g.current);a||!g.current||g.current.contains(e.activeElement)||(g.current.hasAttribute("tabIndex")||g.current.setAttribute("tabIndex",-1),g.current.focus());var t=function(){null!==g.current&&(e.hasFocus()&&!l&&d()&&!p.current?g.current&&!g.current.contains(e.activeElement)&&g.current.focus():p.current=!1)},n=function(t){!l&&d()&&9===t.keyCode&&e.activeElement===g.current&&(p.current=!0,t.shiftKey?h.current.focus():m.current.focus())};e.addEventListener("focus",t,!0),e.addEventListener("keydown",n,!0);var r=setInterval((function(){t()}),50);return function(){clearInterval(r),e.removeEventListener("focus",t,!0),e.removeEventListener("keydown",n,!0),u||(v.current&&v.current.focus&&v.current.focus(),v.current=null)}}}),[a,l,u,d,f]),e.createElement(e.Fragment,null,e.createElement("div",{tabIndex:0,ref:m,"data-test":"sentinelStart"}),e.cloneElement(r,{ref:b}),e.createElement("div",{tabIndex:0,ref:h,"data-test":"sentinelEnd"}))};var qe={root:{zIndex:-1,position:"fixed",right:0,bottom:0,top:0,left:0,backgroundColor:"rgba(0, 0, 0, 0.5)",WebkitTapHighlightColor:"transparent"},invisible:{backgroundColor:"transparent"}};const Ke=e.forwardRef((function(t,n){var o=t.invisible,i=void 0!==o&&o,l=t.open,s=(0,a.A)(t,["invisible","open"]);return l?e.createElement("div",(0,r.A)({"aria-hidden":!0,ref:n},s,{style:(0,r.A)({},qe.root,i?qe.invisible:{},s.style)})):null}));var Xe=new He;const Qe=e.forwardRef((function(n,o){var i=(0,y.A)(),l=(0,Oe.A)({name:"MuiModal",props:(0,r.A)({},n),theme:i}),s=l.BackdropComponent,u=void 0===s?Ke:s,c=l.BackdropProps,d=l.children,f=l.closeAfterTransition,p=void 0!==f&&f,m=l.container,h=l.disableAutoFocus,v=void 0!==h&&h,g=l.disableBackdropClick,b=void 0!==g&&g,x=l.disableEnforceFocus,w=void 0!==x&&x,E=l.disableEscapeKeyDown,S=void 0!==E&&E,A=l.disablePortal,C=void 0!==A&&A,R=l.disableRestoreFocus,P=void 0!==R&&R,T=l.disableScrollLock,N=void 0!==T&&T,O=l.hideBackdrop,M=void 0!==O&&O,L=l.keepMounted,z=void 0!==L&&L,_=l.manager,I=void 0===_?Xe:_,D=l.onBackdropClick,F=l.onClose,j=l.onEscapeKeyDown,B=l.onRendered,W=l.open,$=(0,a.A)(l,["BackdropComponent","BackdropProps","children","closeAfterTransition","container","disableAutoFocus","disableBackdropClick","disableEnforceFocus","disableEscapeKeyDown","disablePortal","disableRestoreFocus","disableScrollLock","hideBackdrop","keepMounted","manager","onBackdropClick","onClose","onEscapeKeyDown","onRendered","open"]),V=e.useState(!0),H=V[0],U=V[1],q=e.useRef({}),K=e.useRef(null),X=e.useRef(null),Q=(0,k.A)(X,o),Y=function(e){return!!e.children&&e.children.props.hasOwnProperty("in")}(l),G=function(){return(0,Pe.A)(K.current)},J=function(){return q.current.modalRef=X.current,q.current.mountNode=K.current,q.current},Z=function(){I.mount(J(),{disableScrollLock:N}),X.current.scrollTop=0},ee=(0,_e.A)((function(){var e=function(e){return e="function"==typeof e?e():e,t.findDOMNode(e)}(m)||G().body;I.add(J(),e),X.current&&Z()})),te=e.useCallback((function(){return I.isTopModal(J())}),[I]),ne=(0,_e.A)((function(e){K.current=e,e&&(B&&B(),W&&te()?Z():Be(X.current,!0))})),re=e.useCallback((function(){I.remove(J())}),[I]);if(e.useEffect((function(){return function(){re()}}),[re]),e.useEffect((function(){W?ee():Y&&p||re()}),[W,re,Y,p,ee]),!z&&!W&&(!Y||H))return null;var oe=function(e){return{root:{position:"fixed",zIndex:e.zIndex.modal,right:0,bottom:0,top:0,left:0},hidden:{visibility:"hidden"}}}(i||{zIndex:Ie.A}),ae={};return void 0===d.props.tabIndex&&(ae.tabIndex=d.props.tabIndex||"-1"),Y&&(ae.onEnter=(0,Ne.A)((function(){U(!1)}),d.props.onEnter),ae.onExited=(0,Ne.A)((function(){U(!0),p&&re()}),d.props.onExited)),e.createElement(ze,{ref:ne,container:m,disablePortal:C},e.createElement("div",(0,r.A)({ref:Q,onKeyDown:function(e){"Escape"===e.key&&te()&&(j&&j(e),S||(e.stopPropagation(),F&&F(e,"escapeKeyDown")))},role:"presentation"},$,{style:(0,r.A)({},oe.root,!W&&H?oe.hidden:{},$.style)}),M?null:e.createElement(u,(0,r.A)({open:W,onClick:function(e){e.target===e.currentTarget&&(D&&D(e),!b&&F&&F(e,"backdropClick"))}},c)),e.createElement(Ue,{disableEnforceFocus:w,disableAutoFocus:v,disableRestoreFocus:P,getDoc:G,isEnabled:te,open:W},e.cloneElement(d,ae))))}));function Ye(e){return"scale(".concat(e,", ").concat(Math.pow(e,2),")")}var Ge={entering:{opacity:1,transform:Ye(1)},entered:{opacity:1,transform:"none"}},Je=e.forwardRef((function(t,n){var i=t.children,l=t.disableStrictModeCompat,s=void 0!==l&&l,u=t.in,c=t.onEnter,d=t.onEntered,f=t.onEntering,p=t.onExit,m=t.onExited,h=t.onExiting,g=t.style,y=t.timeout,b=void 0===y?"auto":y,S=t.TransitionComponent,A=void 0===S?v:S,C=(0,a.A)(t,["children","disableStrictModeCompat","in","onEnter","onEntered","onEntering","onExit","onExited","onExiting","style","timeout","TransitionComponent"]),R=e.useRef(),P=e.useRef(),T=x(),N=T.unstable_strictMode&&!s,O=e.useRef(null),M=(0,k.A)(i.ref,n),L=(0,k.A)(N?O:void 0,M),z=function(e){return function(t,n){if(e){var r=N?[O.current,t]:[t,n],a=(0,o.A)(r,2),i=a[0],l=a[1];void 0===l?e(i):e(i,l)}}},_=z(f),I=z((function(e,t){w(e);var n,r=E({style:g,timeout:b},{mode:"enter"}),o=r.duration,a=r.delay;"auto"===b?(n=T.transitions.getAutoHeightDuration(e.clientHeight),P.current=n):n=o,e.style.transition=[T.transitions.create("opacity",{duration:n,delay:a}),T.transitions.create("transform",{duration:.666*n,delay:a})].join(","),c&&c(e,t)})),D=z(d),F=z(h),j=z((function(e){var t,n=E({style:g,timeout:b},{mode:"exit"}),r=n.duration,o=n.delay;"auto"===b?(t=T.transitions.getAutoHeightDuration(e.clientHeight),P.current=t):t=r,e.style.transition=[T.transitions.create("opacity",{duration:t,delay:o}),T.transitions.create("transform",{duration:.666*t,delay:o||.333*t})].join(","),e.style.opacity="0",e.style.transform=Ye(.75),p&&p(e)})),B=z(m);return e.useEffect((function(){return function(){clearTimeout(R.current)}}),[]),e.createElement(A,(0,r.A)({appear:!0,in:u,nodeRef:N?O:void 0,onEnter:I,onEntered:D,onEntering:_,onExit:j,onExited:B,onExiting:F,addEndListener:function(e,t){var n=N?e:t;"auto"===b&&(R.current=setTimeout(n,P.current||0))},timeout:"auto"===b?null:b},C),(function(t,n){return e.cloneElement(i,(0,r.A)({style:(0,r.A)({opacity:0,transform:Ye(.75),visibility:"exited"!==t||u?void 0:"hidden"},Ge[t],g,i.props.style),ref:L},n))}))}));Je.muiSupportAuto=!0;const Ze=Je;function et(e,t){var n=0;return"number"==typeof t?n=t:"center"===t?n=e.height/2:"bottom"===t&&(n=e.height),n}function tt(e,t){var n=0;return"number"==typeof t?n=t:"center"===t?n=e.width/2:"right"===t&&(n=e.width),n}function nt(e){return[e.horizontal,e.vertical].map((function(e){return"number"==typeof e?"".concat(e,"px"):e})).join(" ")}function rt(e){return"function"==typeof e?e():e}var ot=e.forwardRef((function(n,o){var i=n.action,l=n.anchorEl,s=n.anchorOrigin,u=void 0===s?{vertical:"top",horizontal:"left"}:s,c=n.anchorPosition,d=n.anchorReference,f=void 0===d?"anchorEl":d,p=n.children,m=n.classes,h=n.className,v=n.container,g=n.elevation,y=void 0===g?8:g,b=n.getContentAnchorEl,x=n.marginThreshold,w=void 0===x?16:x,E=n.onEnter,k=n.onEntered,S=n.onEntering,A=n.onExit,C=n.onExited,R=n.onExiting,T=n.open,N=n.PaperProps,M=void 0===N?{}:N,L=n.transformOrigin,z=void 0===L?{vertical:"top",horizontal:"left"}:L,_=n.TransitionComponent,I=void 0===_?Ze:_,D=n.transitionDuration,F=void 0===D?"auto":D,j=n.TransitionProps,B=void 0===j?{}:j,W=(0,a.A)(n,["action","anchorEl","anchorOrigin","anchorPosition","anchorReference","children","classes","className","container","elevation","getContentAnchorEl","marginThreshold","onEnter","onEntered","onEntering","onExit","onExited","onExiting","open","PaperProps","transformOrigin","TransitionComponent","transitionDuration","TransitionProps"]),$=e.useRef(),V=e.useCallback((function(e){if("anchorPosition"===f)return c;var t=rt(l),n=(t&&1===t.nodeType?t:(0,Pe.A)($.current).body).getBoundingClientRect(),r=0===e?u.vertical:"center";return{top:n.top+et(n,r),left:n.left+tt(n,u.horizontal)}}),[l,u.horizontal,u.vertical,c,f]),H=e.useCallback((function(e){var t=0;if(b&&"anchorEl"===f){var n=b(e);if(n&&e.contains(n)){var r=function(e,t){for(var n=t,r=0;n&&n!==e;)r+=(n=n.parentElement).scrollTop;return r}(e,n);t=n.offsetTop+n.clientHeight/2-r||0}}return t}),[u.vertical,f,b]),U=e.useCallback((function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;return{vertical:et(e,z.vertical)+t,horizontal:tt(e,z.horizontal)}}),[z.horizontal,z.vertical]),q=e.useCallback((function(e){var t=H(e),n={width:e.offsetWidth,height:e.offsetHeight},r=U(n,t);if("none"===f)return{top:null,left:null,transformOrigin:nt(r)};var o=V(t),a=o.top-r.vertical,i=o.left-r.horizontal,s=a+n.height,u=i+n.width,c=(0,Te.A)(rt(l)),d=c.innerHeight-w,p=c.innerWidth-w;if(a<w){var m=a-w;a-=m,r.vertical+=m}else if(s>d){var h=s-d;a-=h,r.vertical+=h}if(i<w){var v=i-w;i-=v,r.horizontal+=v}else if(u>p){var g=u-p;i-=g,r.horizontal+=g}return{top:"".concat(Math.round(a),"px"),left:"".concat(Math.round(i),"px"),transformOrigin:nt(r)}}),[l,f,V,H,U,w]),K=e.useCallback((function(){var e=$.current;if(e){var t=q(e);null!==t.top&&(e.style.top=t.top),null!==t.left&&(e.style.left=t.left),e.style.transformOrigin=t.transformOrigin}}),[q]),X=e.useCallback((function(e){$.current=t.findDOMNode(e)}),[]);e.useEffect((function(){T&&K()})),e.useImperativeHandle(i,(function(){return T?{updatePosition:function(){K()}}:null}),[T,K]),e.useEffect((function(){if(T){var e=(0,G.A)((function(){K()}));return window.addEventListener("resize",e),function(){e.clear(),window.removeEventListener("resize",e)}}}),[T,K]);var Q=F;"auto"!==F||I.muiSupportAuto||(Q=void 0);var Y=v||(l?(0,Pe.A)(rt(l)).body:void 0);return e.createElement(Qe,(0,r.A)({container:Y,open:T,ref:o,BackdropProps:{invisible:!0},className:(0,P.A)(m.root,h)},W),e.createElement(I,(0,r.A)({appear:!0,in:T,onEnter:E,onEntered:k,onExit:A,onExited:C,onExiting:R,timeout:Q},B,{onEntering:(0,Ne.A)((function(e,t){S&&S(e,t),K()}),B.onEntering)}),e.createElement(O,(0,r.A)({elevation:y,ref:X},M,{className:(0,P.A)(m.paper,M.className)}),p)))}));const at=(0,T.A)({root:{},paper:{position:"absolute",overflowY:"auto",overflowX:"hidden",minWidth:16,minHeight:16,maxWidth:"calc(100% - 32px)",maxHeight:"calc(100% - 32px)",outline:0}},{name:"MuiPopover"})(ot),it=e.createContext({});var lt=e.forwardRef((function(t,n){var o=t.children,i=t.classes,l=t.className,s=t.component,u=void 0===s?"ul":s,c=t.dense,d=void 0!==c&&c,f=t.disablePadding,p=void 0!==f&&f,m=t.subheader,h=(0,a.A)(t,["children","classes","className","component","dense","disablePadding","subheader"]),v=e.useMemo((function(){return{dense:d}}),[d]);return e.createElement(it.Provider,{value:v},e.createElement(u,(0,r.A)({className:(0,P.A)(i.root,l,d&&i.dense,!p&&i.padding,m&&i.subheader),ref:n},h),m,o))}));const st=(0,T.A)({root:{listStyle:"none",margin:0,padding:0,position:"relative"},padding:{paddingTop:8,paddingBottom:8},dense:{},subheader:{paddingTop:0}},{name:"MuiList"})(lt);function ut(e,t,n){return e===t?e.firstChild:t&&t.nextElementSibling?t.nextElementSibling:n?null:e.firstChild}function ct(e,t,n){return e===t?n?e.firstChild:e.lastChild:t&&t.previousElementSibling?t.previousElementSibling:n?null:e.lastChild}function dt(e,t){if(void 0===t)return!0;var n=e.innerText;return void 0===n&&(n=e.textContent),0!==(n=n.trim().toLowerCase()).length&&(t.repeating?n[0]===t.keys[0]:0===n.indexOf(t.keys.join("")))}function ft(e,t,n,r,o,a){for(var i=!1,l=o(e,t,!!t&&n);l;){if(l===e.firstChild){if(i)return;i=!0}var s=!r&&(l.disabled||"true"===l.getAttribute("aria-disabled"));if(l.hasAttribute("tabindex")&&dt(l,a)&&!s)return void l.focus();l=o(e,l,n)}}var pt="undefined"==typeof window?e.useEffect:e.useLayoutEffect;const mt=e.forwardRef((function(n,o){var i=n.actions,l=n.autoFocus,s=void 0!==l&&l,u=n.autoFocusItem,c=void 0!==u&&u,d=n.children,f=n.className,p=n.disabledItemsFocusable,m=void 0!==p&&p,h=n.disableListWrap,v=void 0!==h&&h,g=n.onKeyDown,y=n.variant,b=void 0===y?"selectedMenu":y,x=(0,a.A)(n,["actions","autoFocus","autoFocusItem","children","className","disabledItemsFocusable","disableListWrap","onKeyDown","variant"]),w=e.useRef(null),E=e.useRef({keys:[],repeating:!0,previousKeyMatched:!0,lastTime:null});pt((function(){s&&w.current.focus()}),[s]),e.useImperativeHandle(i,(function(){return{adjustStyleForScrollbar:function(e,t){var n=!w.current.style.width;if(e.clientHeight<w.current.clientHeight&&n){var r="".concat(je(),"px");w.current.style["rtl"===t.direction?"paddingLeft":"paddingRight"]=r,w.current.style.width="calc(100% + ".concat(r,")")}return w.current}}}),[]);var S=e.useCallback((function(e){w.current=t.findDOMNode(e)}),[]),A=(0,k.A)(S,o),C=-1;e.Children.forEach(d,(function(t,n){e.isValidElement(t)&&(t.props.disabled||("selectedMenu"===b&&t.props.selected||-1===C)&&(C=n))}));var R=e.Children.map(d,(function(t,n){if(n===C){var r={};return c&&(r.autoFocus=!0),void 0===t.props.tabIndex&&"selectedMenu"===b&&(r.tabIndex=0),e.cloneElement(t,r)}return t}));return e.createElement(st,(0,r.A)({role:"menu",ref:A,className:f,onKeyDown:function(e){var t=w.current,n=e.key,r=(0,Pe.A)(t).activeElement;if("ArrowDown"===n)e.preventDefault(),ft(t,r,v,m,ut);else if("ArrowUp"===n)e.preventDefault(),ft(t,r,v,m,ct);else if("Home"===n)e.preventDefault(),ft(t,null,v,m,ut);else if("End"===n)e.preventDefault(),ft(t,null,v,m,ct);else if(1===n.length){var o=E.current,a=n.toLowerCase(),i=performance.now();o.keys.length>0&&(i-o.lastTime>500?(o.keys=[],o.repeating=!0,o.previousKeyMatched=!0):o.repeating&&a!==o.keys[0]&&(o.repeating=!1)),o.lastTime=i,o.keys.push(a);var l=r&&!o.repeating&&dt(r,o);o.previousKeyMatched&&(l||ft(t,r,!1,m,ut,o))?e.preventDefault():o.previousKeyMatched=!1}g&&g(e)},tabIndex:s?0:-1},x),R)}));var ht={vertical:"top",horizontal:"right"},vt={vertical:"top",horizontal:"left"},gt=e.forwardRef((function(n,o){var i=n.autoFocus,l=void 0===i||i,s=n.children,u=n.classes,c=n.disableAutoFocusItem,d=void 0!==c&&c,f=n.MenuListProps,p=void 0===f?{}:f,m=n.onClose,h=n.onEntering,v=n.open,g=n.PaperProps,y=void 0===g?{}:g,b=n.PopoverClasses,w=n.transitionDuration,E=void 0===w?"auto":w,k=n.TransitionProps,S=(k=void 0===k?{}:k).onEntering,A=(0,a.A)(k,["onEntering"]),C=n.variant,R=void 0===C?"selectedMenu":C,T=(0,a.A)(n,["autoFocus","children","classes","disableAutoFocusItem","MenuListProps","onClose","onEntering","open","PaperProps","PopoverClasses","transitionDuration","TransitionProps","variant"]),N=x(),O=l&&!d&&v,M=e.useRef(null),L=e.useRef(null),z=-1;e.Children.map(s,(function(t,n){e.isValidElement(t)&&(t.props.disabled||("menu"!==R&&t.props.selected||-1===z)&&(z=n))}));var _=e.Children.map(s,(function(n,r){return r===z?e.cloneElement(n,{ref:function(e){L.current=t.findDOMNode(e),(0,Me.A)(n.ref,e)}}):n}));return e.createElement(at,(0,r.A)({getContentAnchorEl:function(){return L.current},classes:b,onClose:m,TransitionProps:(0,r.A)({onEntering:function(e,t){M.current&&M.current.adjustStyleForScrollbar(e,N),h&&h(e,t),S&&S(e,t)}},A),anchorOrigin:"rtl"===N.direction?ht:vt,transformOrigin:"rtl"===N.direction?ht:vt,PaperProps:(0,r.A)({},y,{classes:(0,r.A)({},y.classes,{root:u.paper})}),open:v,ref:o,transitionDuration:E},T),e.createElement(mt,(0,r.A)({onKeyDown:function(e){"Tab"===e.key&&(e.preventDefault(),m&&m(e,"tabKeyDown"))},actions:M,autoFocus:l&&(-1===z||d),autoFocusItem:O,variant:R},p,{className:(0,P.A)(u.list,p.className)}),_))}));const yt=(0,T.A)({paper:{maxHeight:"calc(100% - 96px)",WebkitOverflowScrolling:"touch"},list:{outline:0}},{name:"MuiMenu"})(gt);var bt=n(8060);function xt(e,t){return"object"===(0,Re.A)(t)&&null!==t?e===t:String(e)===String(t)}var wt=e.forwardRef((function(t,n){var i=t["aria-label"],l=t.autoFocus,s=t.autoWidth,u=t.children,c=t.classes,d=t.className,f=t.defaultValue,p=t.disabled,m=t.displayEmpty,h=t.IconComponent,v=t.inputRef,g=t.labelId,y=t.MenuProps,b=void 0===y?{}:y,x=t.multiple,w=t.name,E=t.onBlur,S=t.onChange,A=t.onClose,C=t.onFocus,R=t.onOpen,T=t.open,N=t.readOnly,O=t.renderValue,M=t.SelectDisplayProps,L=void 0===M?{}:M,z=t.tabIndex,_=(t.type,t.value),I=t.variant,D=void 0===I?"standard":I,F=(0,a.A)(t,["aria-label","autoFocus","autoWidth","children","classes","className","defaultValue","disabled","displayEmpty","IconComponent","inputRef","labelId","MenuProps","multiple","name","onBlur","onChange","onClose","onFocus","onOpen","open","readOnly","renderValue","SelectDisplayProps","tabIndex","type","value","variant"]),j=(0,bt.A)({controlled:_,default:f,name:"Select"}),B=(0,o.A)(j,2),W=B[0],$=B[1],H=e.useRef(null),U=e.useState(null),q=U[0],X=U[1],Q=e.useRef(null!=T).current,Y=e.useState(),G=Y[0],J=Y[1],Z=e.useState(!1),ee=Z[0],te=Z[1],ne=(0,k.A)(n,v);e.useImperativeHandle(ne,(function(){return{focus:function(){q.focus()},node:H.current,value:W}}),[q,W]),e.useEffect((function(){l&&q&&q.focus()}),[l,q]),e.useEffect((function(){if(q){var e=(0,Pe.A)(q).getElementById(g);if(e){var t=function(){getSelection().isCollapsed&&q.focus()};return e.addEventListener("click",t),function(){e.removeEventListener("click",t)}}}}),[g,q]);var oe,ae,ie=function(e,t){e?R&&R(t):A&&A(t),Q||(J(s?null:q.clientWidth),te(e))},le=e.Children.toArray(u),se=function(e){return function(t){var n;if(x||ie(!1,t),x){n=Array.isArray(W)?W.slice():[];var r=W.indexOf(e.props.value);-1===r?n.push(e.props.value):n.splice(r,1)}else n=e.props.value;e.props.onClick&&e.props.onClick(t),W!==n&&($(n),S&&(t.persist(),Object.defineProperty(t,"target",{writable:!0,value:{value:n,name:w}}),S(t,e)))}},ue=null!==q&&(Q?T:ee);delete F["aria-invalid"];var ce=[],de=!1;(re({value:W})||m)&&(O?oe=O(W):de=!0);var fe=le.map((function(t){if(!e.isValidElement(t))return null;var n;if(x){if(!Array.isArray(W))throw new Error((0,K.A)(2));(n=W.some((function(e){return xt(e,t.props.value)})))&&de&&ce.push(t.props.children)}else(n=xt(W,t.props.value))&&de&&(ae=t.props.children);return e.cloneElement(t,{"aria-selected":n?"true":void 0,onClick:se(t),onKeyUp:function(e){" "===e.key&&e.preventDefault(),t.props.onKeyUp&&t.props.onKeyUp(e)},role:"option",selected:n,value:void 0,"data-value":t.props.value})}));de&&(oe=x?ce.join(", "):ae);var pe,me=G;!s&&Q&&q&&(me=q.clientWidth),pe=void 0!==z?z:p?null:0;var he=L.id||(w?"mui-component-select-".concat(w):void 0);return e.createElement(e.Fragment,null,e.createElement("div",(0,r.A)({className:(0,P.A)(c.root,c.select,c.selectMenu,c[D],d,p&&c.disabled),ref:X,tabIndex:pe,role:"button","aria-disabled":p?"true":void 0,"aria-expanded":ue?"true":void 0,"aria-haspopup":"listbox","aria-label":i,"aria-labelledby":[g,he].filter(Boolean).join(" ")||void 0,onKeyDown:function(e){N||-1!==[" ","ArrowUp","ArrowDown","Enter"].indexOf(e.key)&&(e.preventDefault(),ie(!0,e))},onMouseDown:p||N?null:function(e){0===e.button&&(e.preventDefault(),q.focus(),ie(!0,e))},onBlur:function(e){!ue&&E&&(e.persist(),Object.defineProperty(e,"target",{writable:!0,value:{value:W,name:w}}),E(e))},onFocus:C},L,{id:he}),function(e){return null==e||"string"==typeof e&&!e.trim()}(oe)?e.createElement("span",{dangerouslySetInnerHTML:{__html:"&#8203;"}}):oe),e.createElement("input",(0,r.A)({value:Array.isArray(W)?W.join(","):W,name:w,ref:H,"aria-hidden":!0,onChange:function(e){var t=le.map((function(e){return e.props.value})).indexOf(e.target.value);if(-1!==t){var n=le[t];$(n.props.value),S&&S(e,n)}},tabIndex:-1,className:c.nativeInput,autoFocus:l},F)),e.createElement(h,{className:(0,P.A)(c.icon,c["icon".concat((0,V.A)(D))],ue&&c.iconOpen,p&&c.disabled)}),e.createElement(yt,(0,r.A)({id:"menu-".concat(w||""),anchorEl:q,open:ue,onClose:function(e){ie(!1,e)}},b,{MenuListProps:(0,r.A)({"aria-labelledby":g,role:"listbox",disableListWrap:!0},b.MenuListProps),PaperProps:(0,r.A)({},b.PaperProps,{style:(0,r.A)({minWidth:me},null!=b.PaperProps?b.PaperProps.style:null)})}),fe))}));const Et=wt;var kt=n(4507);const St=(0,kt.A)(e.createElement("path",{d:"M7 10l5 5 5-5z"}),"ArrowDropDown"),At=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.disabled,s=t.IconComponent,u=t.inputRef,c=t.variant,d=void 0===c?"standard":c,f=(0,a.A)(t,["classes","className","disabled","IconComponent","inputRef","variant"]);return e.createElement(e.Fragment,null,e.createElement("select",(0,r.A)({className:(0,P.A)(o.root,o.select,o[d],i,l&&o.disabled),disabled:l,ref:u||n},f)),t.multiple?null:e.createElement(s,{className:(0,P.A)(o.icon,o["icon".concat((0,V.A)(d))],l&&o.disabled)}))}));var Ct=function(e){return{root:{},select:{"-moz-appearance":"none","-webkit-appearance":"none",userSelect:"none",borderRadius:0,minWidth:16,cursor:"pointer","&:focus":{backgroundColor:"light"===e.palette.type?"rgba(0, 0, 0, 0.05)":"rgba(255, 255, 255, 0.05)",borderRadius:0},"&::-ms-expand":{display:"none"},"&$disabled":{cursor:"default"},"&[multiple]":{height:"auto"},"&:not([multiple]) option, &:not([multiple]) optgroup":{backgroundColor:e.palette.background.paper},"&&":{paddingRight:24}},filled:{"&&":{paddingRight:32}},outlined:{borderRadius:e.shape.borderRadius,"&&":{paddingRight:32}},selectMenu:{height:"auto",minHeight:"1.1876em",textOverflow:"ellipsis",whiteSpace:"nowrap",overflow:"hidden"},disabled:{},icon:{position:"absolute",right:0,top:"calc(50% - 12px)",pointerEvents:"none",color:e.palette.action.active,"&$disabled":{color:e.palette.action.disabled}},iconOpen:{transform:"rotate(180deg)"},iconFilled:{right:7},iconOutlined:{right:7},nativeInput:{bottom:0,left:0,position:"absolute",opacity:0,pointerEvents:"none",width:"100%"}}},Rt=e.createElement(se,null),Pt=e.forwardRef((function(t,n){var o=t.children,i=t.classes,l=t.IconComponent,s=void 0===l?St:l,u=t.input,c=void 0===u?Rt:u,d=t.inputProps,f=(t.variant,(0,a.A)(t,["children","classes","IconComponent","input","inputProps","variant"])),p=X({props:t,muiFormControl:ve(),states:["variant"]});return e.cloneElement(c,(0,r.A)({inputComponent:At,inputProps:(0,r.A)({children:o,classes:i,IconComponent:s,variant:p.variant,type:void 0},d,c?c.props.inputProps:{}),ref:n},f))}));Pt.muiName="Select",(0,T.A)(Ct,{name:"MuiNativeSelect"})(Pt);var Tt=Ct,Nt=e.createElement(se,null),Ot=e.createElement(ce,null),Mt=e.forwardRef((function t(n,o){var i=n.autoWidth,l=void 0!==i&&i,s=n.children,u=n.classes,c=n.displayEmpty,d=void 0!==c&&c,f=n.IconComponent,p=void 0===f?St:f,m=n.id,h=n.input,v=n.inputProps,g=n.label,y=n.labelId,b=n.labelWidth,x=void 0===b?0:b,w=n.MenuProps,E=n.multiple,k=void 0!==E&&E,S=n.native,A=void 0!==S&&S,C=n.onClose,R=n.onOpen,P=n.open,T=n.renderValue,N=n.SelectDisplayProps,O=n.variant,M=void 0===O?"standard":O,L=(0,a.A)(n,["autoWidth","children","classes","displayEmpty","IconComponent","id","input","inputProps","label","labelId","labelWidth","MenuProps","multiple","native","onClose","onOpen","open","renderValue","SelectDisplayProps","variant"]),z=A?At:Et,_=X({props:n,muiFormControl:ve(),states:["variant"]}).variant||M,I=h||{standard:Nt,outlined:e.createElement(he,{label:g,labelWidth:x}),filled:Ot}[_];return e.cloneElement(I,(0,r.A)({inputComponent:z,inputProps:(0,r.A)({children:s,IconComponent:p,variant:_,type:void 0,multiple:k},A?{id:m}:{autoWidth:l,displayEmpty:d,labelId:y,MenuProps:w,onClose:C,onOpen:R,open:P,renderValue:T,SelectDisplayProps:(0,r.A)({id:m},N)},v,{classes:v?(0,Ce.A)({baseClasses:u,newClasses:v.classes,Component:t}):u},h?h.props.inputProps:{}),ref:o},L))}));Mt.muiName="Select";const Lt=(0,T.A)(Tt,{name:"MuiSelect"})(Mt);var zt={standard:se,filled:ce,outlined:he},_t=e.forwardRef((function(t,n){var o=t.autoComplete,i=t.autoFocus,l=void 0!==i&&i,s=t.children,u=t.classes,c=t.className,d=t.color,f=void 0===d?"primary":d,p=t.defaultValue,m=t.disabled,h=void 0!==m&&m,v=t.error,g=void 0!==v&&v,y=t.FormHelperTextProps,b=t.fullWidth,x=void 0!==b&&b,w=t.helperText,E=t.hiddenLabel,k=t.id,S=t.InputLabelProps,A=t.inputProps,C=t.InputProps,R=t.inputRef,T=t.label,N=t.multiline,O=void 0!==N&&N,M=t.name,L=t.onBlur,z=t.onChange,_=t.onFocus,I=t.placeholder,D=t.required,F=void 0!==D&&D,j=t.rows,B=t.rowsMax,W=t.maxRows,$=t.minRows,V=t.select,H=void 0!==V&&V,U=t.SelectProps,q=t.type,K=t.value,X=t.variant,Q=void 0===X?"standard":X,Y=(0,a.A)(t,["autoComplete","autoFocus","children","classes","className","color","defaultValue","disabled","error","FormHelperTextProps","fullWidth","helperText","hiddenLabel","id","InputLabelProps","inputProps","InputProps","inputRef","label","multiline","name","onBlur","onChange","onFocus","placeholder","required","rows","rowsMax","maxRows","minRows","select","SelectProps","type","value","variant"]),G={};if("outlined"===Q&&(S&&void 0!==S.shrink&&(G.notched=S.shrink),T)){var J,Z=null!==(J=null==S?void 0:S.required)&&void 0!==J?J:F;G.label=e.createElement(e.Fragment,null,T,Z&&" *")}H&&(U&&U.native||(G.id=void 0),G["aria-describedby"]=void 0);var ee=w&&k?"".concat(k,"-helper-text"):void 0,te=T&&k?"".concat(k,"-label"):void 0,ne=zt[Q],re=e.createElement(ne,(0,r.A)({"aria-describedby":ee,autoComplete:o,autoFocus:l,defaultValue:p,fullWidth:x,multiline:O,name:M,rows:j,rowsMax:B,maxRows:W,minRows:$,type:q,value:K,id:k,inputRef:R,onBlur:L,onChange:z,onFocus:_,placeholder:I,inputProps:A},G,C));return e.createElement(ke,(0,r.A)({className:(0,P.A)(u.root,c),disabled:h,error:g,fullWidth:x,hiddenLabel:E,ref:n,required:F,color:f,variant:Q},Y),T&&e.createElement(xe,(0,r.A)({htmlFor:k,id:te},S),T),H?e.createElement(Lt,(0,r.A)({"aria-describedby":ee,id:k,labelId:te,value:K,input:re},U),s):re,w&&e.createElement(Ae,(0,r.A)({id:ee},y),w))}));const It=(0,T.A)({root:{}},{name:"MuiTextField"})(_t);var Dt=n(9773),Ft=n(364),jt=n(9417);function Bt(t,n){var r=Object.create(null);return t&&e.Children.map(t,(function(e){return e})).forEach((function(t){r[t.key]=function(t){return n&&(0,e.isValidElement)(t)?n(t):t}(t)})),r}function Wt(e,t,n){return null!=n[t]?n[t]:e.props[t]}function $t(t,n,r){var o=Bt(t.children),a=function(e,t){function n(n){return n in t?t[n]:e[n]}e=e||{},t=t||{};var r,o=Object.create(null),a=[];for(var i in e)i in t?a.length&&(o[i]=a,a=[]):a.push(i);var l={};for(var s in t){if(o[s])for(r=0;r<o[s].length;r++){var u=o[s][r];l[o[s][r]]=n(u)}l[s]=n(s)}for(r=0;r<a.length;r++)l[a[r]]=n(a[r]);return l}(n,o);return Object.keys(a).forEach((function(i){var l=a[i];if((0,e.isValidElement)(l)){var s=i in n,u=i in o,c=n[i],d=(0,e.isValidElement)(c)&&!c.props.in;!u||s&&!d?u||!s||d?u&&s&&(0,e.isValidElement)(c)&&(a[i]=(0,e.cloneElement)(l,{onExited:r.bind(null,l),in:c.props.in,exit:Wt(l,"exit",t),enter:Wt(l,"enter",t)})):a[i]=(0,e.cloneElement)(l,{in:!1}):a[i]=(0,e.cloneElement)(l,{onExited:r.bind(null,l),in:!0,exit:Wt(l,"exit",t),enter:Wt(l,"enter",t)})}})),a}var Vt=Object.values||function(e){return Object.keys(e).map((function(t){return e[t]}))},Ht=function(t){function n(e,n){var r,o=(r=t.call(this,e,n)||this).handleExited.bind((0,jt.A)(r));return r.state={contextValue:{isMounting:!0},handleExited:o,firstRender:!0},r}(0,l.A)(n,t);var o=n.prototype;return o.componentDidMount=function(){this.mounted=!0,this.setState({contextValue:{isMounting:!1}})},o.componentWillUnmount=function(){this.mounted=!1},n.getDerivedStateFromProps=function(t,n){var r,o,a=n.children,i=n.handleExited;return{children:n.firstRender?(r=t,o=i,Bt(r.children,(function(t){return(0,e.cloneElement)(t,{onExited:o.bind(null,t),in:!0,appear:Wt(t,"appear",r),enter:Wt(t,"enter",r),exit:Wt(t,"exit",r)})}))):$t(t,a,i),firstRender:!1}},o.handleExited=function(e,t){var n=Bt(this.props.children);e.key in n||(e.props.onExited&&e.props.onExited(t),this.mounted&&this.setState((function(t){var n=(0,r.A)({},t.children);return delete n[e.key],{children:n}})))},o.render=function(){var t=this.props,n=t.component,r=t.childFactory,o=(0,i.A)(t,["component","childFactory"]),a=this.state.contextValue,l=Vt(this.state.children).map(r);return delete o.appear,delete o.enter,delete o.exit,null===n?e.createElement(s.Provider,{value:a},l):e.createElement(s.Provider,{value:a},e.createElement(n,o,l))},n}(e.Component);Ht.propTypes={},Ht.defaultProps={component:"div",childFactory:function(e){return e}};const Ut=Ht;var qt="undefined"==typeof window?e.useEffect:e.useLayoutEffect;const Kt=function(t){var n=t.classes,r=t.pulsate,o=void 0!==r&&r,a=t.rippleX,i=t.rippleY,l=t.rippleSize,s=t.in,u=t.onExited,c=void 0===u?function(){}:u,d=t.timeout,f=e.useState(!1),p=f[0],m=f[1],h=(0,P.A)(n.ripple,n.rippleVisible,o&&n.ripplePulsate),v={width:l,height:l,top:-l/2+i,left:-l/2+a},g=(0,P.A)(n.child,p&&n.childLeaving,o&&n.childPulsate),y=(0,_e.A)(c);return qt((function(){if(!s){m(!0);var e=setTimeout(y,d);return function(){clearTimeout(e)}}}),[y,s,d]),e.createElement("span",{className:h,style:v},e.createElement("span",{className:g}))};var Xt=e.forwardRef((function(t,n){var o=t.center,i=void 0!==o&&o,l=t.classes,s=t.className,u=(0,a.A)(t,["center","classes","className"]),c=e.useState([]),d=c[0],f=c[1],p=e.useRef(0),m=e.useRef(null);e.useEffect((function(){m.current&&(m.current(),m.current=null)}),[d]);var h=e.useRef(!1),v=e.useRef(null),g=e.useRef(null),y=e.useRef(null);e.useEffect((function(){return function(){clearTimeout(v.current)}}),[]);var b=e.useCallback((function(t){var n=t.pulsate,r=t.rippleX,o=t.rippleY,a=t.rippleSize,i=t.cb;f((function(t){return[].concat((0,Fe.A)(t),[e.createElement(Kt,{key:p.current,classes:l,timeout:550,pulsate:n,rippleX:r,rippleY:o,rippleSize:a})])})),p.current+=1,m.current=i}),[l]),x=e.useCallback((function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=arguments.length>2?arguments[2]:void 0,r=t.pulsate,o=void 0!==r&&r,a=t.center,l=void 0===a?i||t.pulsate:a,s=t.fakeElement,u=void 0!==s&&s;if("mousedown"===e.type&&h.current)h.current=!1;else{"touchstart"===e.type&&(h.current=!0);var c,d,f,p=u?null:y.current,m=p?p.getBoundingClientRect():{width:0,height:0,left:0,top:0};if(l||0===e.clientX&&0===e.clientY||!e.clientX&&!e.touches)c=Math.round(m.width/2),d=Math.round(m.height/2);else{var x=e.touches?e.touches[0]:e,w=x.clientX,E=x.clientY;c=Math.round(w-m.left),d=Math.round(E-m.top)}if(l)(f=Math.sqrt((2*Math.pow(m.width,2)+Math.pow(m.height,2))/3))%2==0&&(f+=1);else{var k=2*Math.max(Math.abs((p?p.clientWidth:0)-c),c)+2,S=2*Math.max(Math.abs((p?p.clientHeight:0)-d),d)+2;f=Math.sqrt(Math.pow(k,2)+Math.pow(S,2))}e.touches?null===g.current&&(g.current=function(){b({pulsate:o,rippleX:c,rippleY:d,rippleSize:f,cb:n})},v.current=setTimeout((function(){g.current&&(g.current(),g.current=null)}),80)):b({pulsate:o,rippleX:c,rippleY:d,rippleSize:f,cb:n})}}),[i,b]),w=e.useCallback((function(){x({},{pulsate:!0})}),[x]),E=e.useCallback((function(e,t){if(clearTimeout(v.current),"touchend"===e.type&&g.current)return e.persist(),g.current(),g.current=null,void(v.current=setTimeout((function(){E(e,t)})));g.current=null,f((function(e){return e.length>0?e.slice(1):e})),m.current=t}),[]);return e.useImperativeHandle(n,(function(){return{pulsate:w,start:x,stop:E}}),[w,x,E]),e.createElement("span",(0,r.A)({className:(0,P.A)(l.root,s),ref:y},u),e.createElement(Ut,{component:null,exit:!0},d))}));const Qt=(0,T.A)((function(e){return{root:{overflow:"hidden",pointerEvents:"none",position:"absolute",zIndex:0,top:0,right:0,bottom:0,left:0,borderRadius:"inherit"},ripple:{opacity:0,position:"absolute"},rippleVisible:{opacity:.3,transform:"scale(1)",animation:"$enter ".concat(550,"ms ").concat(e.transitions.easing.easeInOut)},ripplePulsate:{animationDuration:"".concat(e.transitions.duration.shorter,"ms")},child:{opacity:1,display:"block",width:"100%",height:"100%",borderRadius:"50%",backgroundColor:"currentColor"},childLeaving:{opacity:0,animation:"$exit ".concat(550,"ms ").concat(e.transitions.easing.easeInOut)},childPulsate:{position:"absolute",left:0,top:0,animation:"$pulsate 2500ms ".concat(e.transitions.easing.easeInOut," 200ms infinite")},"@keyframes enter":{"0%":{transform:"scale(0)",opacity:.1},"100%":{transform:"scale(1)",opacity:.3}},"@keyframes exit":{"0%":{opacity:1},"100%":{opacity:0}},"@keyframes pulsate":{"0%":{transform:"scale(1)"},"50%":{transform:"scale(0.92)"},"100%":{transform:"scale(1)"}}}}),{flip:!1,name:"MuiTouchRipple"})(e.memo(Xt));var Yt=e.forwardRef((function(n,o){var i=n.action,l=n.buttonRef,s=n.centerRipple,u=void 0!==s&&s,c=n.children,d=n.classes,f=n.className,p=n.component,m=void 0===p?"button":p,h=n.disabled,v=void 0!==h&&h,g=n.disableRipple,y=void 0!==g&&g,b=n.disableTouchRipple,x=void 0!==b&&b,w=n.focusRipple,E=void 0!==w&&w,S=n.focusVisibleClassName,A=n.onBlur,C=n.onClick,R=n.onFocus,T=n.onFocusVisible,N=n.onKeyDown,O=n.onKeyUp,M=n.onMouseDown,L=n.onMouseLeave,z=n.onMouseUp,_=n.onTouchEnd,I=n.onTouchMove,D=n.onTouchStart,F=n.onDragLeave,j=n.tabIndex,B=void 0===j?0:j,W=n.TouchRippleProps,$=n.type,V=void 0===$?"button":$,H=(0,a.A)(n,["action","buttonRef","centerRipple","children","classes","className","component","disabled","disableRipple","disableTouchRipple","focusRipple","focusVisibleClassName","onBlur","onClick","onFocus","onFocusVisible","onKeyDown","onKeyUp","onMouseDown","onMouseLeave","onMouseUp","onTouchEnd","onTouchMove","onTouchStart","onDragLeave","tabIndex","TouchRippleProps","type"]),U=e.useRef(null),q=e.useRef(null),K=e.useState(!1),X=K[0],Q=K[1];v&&X&&Q(!1);var Y=(0,Ft.A)(),G=Y.isFocusVisible,J=Y.onBlurVisible,Z=Y.ref;function ee(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:x;return(0,_e.A)((function(r){return t&&t(r),!n&&q.current&&q.current[e](r),!0}))}e.useImperativeHandle(i,(function(){return{focusVisible:function(){Q(!0),U.current.focus()}}}),[]),e.useEffect((function(){X&&E&&!y&&q.current.pulsate()}),[y,E,X]);var te=ee("start",M),ne=ee("stop",F),re=ee("stop",z),oe=ee("stop",(function(e){X&&e.preventDefault(),L&&L(e)})),ae=ee("start",D),ie=ee("stop",_),le=ee("stop",I),se=ee("stop",(function(e){X&&(J(e),Q(!1)),A&&A(e)}),!1),ue=(0,_e.A)((function(e){U.current||(U.current=e.currentTarget),G(e)&&(Q(!0),T&&T(e)),R&&R(e)})),ce=function(){var e=t.findDOMNode(U.current);return m&&"button"!==m&&!("A"===e.tagName&&e.href)},de=e.useRef(!1),fe=(0,_e.A)((function(e){E&&!de.current&&X&&q.current&&" "===e.key&&(de.current=!0,e.persist(),q.current.stop(e,(function(){q.current.start(e)}))),e.target===e.currentTarget&&ce()&&" "===e.key&&e.preventDefault(),N&&N(e),e.target===e.currentTarget&&ce()&&"Enter"===e.key&&!v&&(e.preventDefault(),C&&C(e))})),pe=(0,_e.A)((function(e){E&&" "===e.key&&q.current&&X&&!e.defaultPrevented&&(de.current=!1,e.persist(),q.current.stop(e,(function(){q.current.pulsate(e)}))),O&&O(e),C&&e.target===e.currentTarget&&ce()&&" "===e.key&&!e.defaultPrevented&&C(e)})),me=m;"button"===me&&H.href&&(me="a");var he={};"button"===me?(he.type=V,he.disabled=v):("a"===me&&H.href||(he.role="button"),he["aria-disabled"]=v);var ve=(0,k.A)(l,o),ge=(0,k.A)(Z,U),ye=(0,k.A)(ve,ge),be=e.useState(!1),xe=be[0],we=be[1];e.useEffect((function(){we(!0)}),[]);var Ee=xe&&!y&&!v;return e.createElement(me,(0,r.A)({className:(0,P.A)(d.root,f,X&&[d.focusVisible,S],v&&d.disabled),onBlur:se,onClick:C,onFocus:ue,onKeyDown:fe,onKeyUp:pe,onMouseDown:te,onMouseLeave:oe,onMouseUp:re,onDragLeave:ne,onTouchEnd:ie,onTouchMove:le,onTouchStart:ae,ref:ye,tabIndex:v?-1:B},he,H),c,Ee?e.createElement(Qt,(0,r.A)({ref:q,center:u},W)):null)}));const Gt=(0,T.A)({root:{display:"inline-flex",alignItems:"center",justifyContent:"center",position:"relative",WebkitTapHighlightColor:"transparent",backgroundColor:"transparent",outline:0,border:0,margin:0,borderRadius:0,padding:0,cursor:"pointer",userSelect:"none",verticalAlign:"middle","-moz-appearance":"none","-webkit-appearance":"none",textDecoration:"none",color:"inherit","&::-moz-focus-inner":{borderStyle:"none"},"&$disabled":{pointerEvents:"none",cursor:"default"},"@media print":{colorAdjust:"exact"}},disabled:{},focusVisible:{}},{name:"MuiButtonBase"})(Yt);var Jt=e.forwardRef((function(t,n){var o=t.children,i=t.classes,l=t.className,s=t.color,u=void 0===s?"default":s,c=t.component,d=void 0===c?"button":c,f=t.disabled,p=void 0!==f&&f,m=t.disableElevation,h=void 0!==m&&m,v=t.disableFocusRipple,g=void 0!==v&&v,y=t.endIcon,b=t.focusVisibleClassName,x=t.fullWidth,w=void 0!==x&&x,E=t.size,k=void 0===E?"medium":E,S=t.startIcon,A=t.type,C=void 0===A?"button":A,R=t.variant,T=void 0===R?"text":R,N=(0,a.A)(t,["children","classes","className","color","component","disabled","disableElevation","disableFocusRipple","endIcon","focusVisibleClassName","fullWidth","size","startIcon","type","variant"]),O=S&&e.createElement("span",{className:(0,P.A)(i.startIcon,i["iconSize".concat((0,V.A)(k))])},S),M=y&&e.createElement("span",{className:(0,P.A)(i.endIcon,i["iconSize".concat((0,V.A)(k))])},y);return e.createElement(Gt,(0,r.A)({className:(0,P.A)(i.root,i[T],l,"inherit"===u?i.colorInherit:"default"!==u&&i["".concat(T).concat((0,V.A)(u))],"medium"!==k&&[i["".concat(T,"Size").concat((0,V.A)(k))],i["size".concat((0,V.A)(k))]],h&&i.disableElevation,p&&i.disabled,w&&i.fullWidth),component:d,disabled:p,focusRipple:!g,focusVisibleClassName:(0,P.A)(i.focusVisible,b),ref:n,type:C},N),e.createElement("span",{className:i.label},O,o,M))}));const Zt=(0,T.A)((function(e){return{root:(0,r.A)({},e.typography.button,{boxSizing:"border-box",minWidth:64,padding:"6px 16px",borderRadius:e.shape.borderRadius,color:e.palette.text.primary,transition:e.transitions.create(["background-color","box-shadow","border"],{duration:e.transitions.duration.short}),"&:hover":{textDecoration:"none",backgroundColor:(0,Dt.X4)(e.palette.text.primary,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"},"&$disabled":{backgroundColor:"transparent"}},"&$disabled":{color:e.palette.action.disabled}}),label:{width:"100%",display:"inherit",alignItems:"inherit",justifyContent:"inherit"},text:{padding:"6px 8px"},textPrimary:{color:e.palette.primary.main,"&:hover":{backgroundColor:(0,Dt.X4)(e.palette.primary.main,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},textSecondary:{color:e.palette.secondary.main,"&:hover":{backgroundColor:(0,Dt.X4)(e.palette.secondary.main,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},outlined:{padding:"5px 15px",border:"1px solid ".concat("light"===e.palette.type?"rgba(0, 0, 0, 0.23)":"rgba(255, 255, 255, 0.23)"),"&$disabled":{border:"1px solid ".concat(e.palette.action.disabledBackground)}},outlinedPrimary:{color:e.palette.primary.main,border:"1px solid ".concat((0,Dt.X4)(e.palette.primary.main,.5)),"&:hover":{border:"1px solid ".concat(e.palette.primary.main),backgroundColor:(0,Dt.X4)(e.palette.primary.main,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},outlinedSecondary:{color:e.palette.secondary.main,border:"1px solid ".concat((0,Dt.X4)(e.palette.secondary.main,.5)),"&:hover":{border:"1px solid ".concat(e.palette.secondary.main),backgroundColor:(0,Dt.X4)(e.palette.secondary.main,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}},"&$disabled":{border:"1px solid ".concat(e.palette.action.disabled)}},contained:{color:e.palette.getContrastText(e.palette.grey[300]),backgroundColor:e.palette.grey[300],boxShadow:e.shadows[2],"&:hover":{backgroundColor:e.palette.grey.A100,boxShadow:e.shadows[4],"@media (hover: none)":{boxShadow:e.shadows[2],backgroundColor:e.palette.grey[300]},"&$disabled":{backgroundColor:e.palette.action.disabledBackground}},"&$focusVisible":{boxShadow:e.shadows[6]},"&:active":{boxShadow:e.shadows[8]},"&$disabled":{color:e.palette.action.disabled,boxShadow:e.shadows[0],backgroundColor:e.palette.action.disabledBackground}},containedPrimary:{color:e.palette.primary.contrastText,backgroundColor:e.palette.primary.main,"&:hover":{backgroundColor:e.palette.primary.dark,"@media (hover: none)":{backgroundColor:e.palette.primary.main}}},containedSecondary:{color:e.palette.secondary.contrastText,backgroundColor:e.palette.secondary.main,"&:hover":{backgroundColor:e.palette.secondary.dark,"@media (hover: none)":{backgroundColor:e.palette.secondary.main}}},disableElevation:{boxShadow:"none","&:hover":{boxShadow:"none"},"&$focusVisible":{boxShadow:"none"},"&:active":{boxShadow:"none"},"&$disabled":{boxShadow:"none"}},focusVisible:{},disabled:{},colorInherit:{color:"inherit",borderColor:"currentColor"},textSizeSmall:{padding:"4px 5px",fontSize:e.typography.pxToRem(13)},textSizeLarge:{padding:"8px 11px",fontSize:e.typography.pxToRem(15)},outlinedSizeSmall:{padding:"3px 9px",fontSize:e.typography.pxToRem(13)},outlinedSizeLarge:{padding:"7px 21px",fontSize:e.typography.pxToRem(15)},containedSizeSmall:{padding:"4px 10px",fontSize:e.typography.pxToRem(13)},containedSizeLarge:{padding:"8px 22px",fontSize:e.typography.pxToRem(15)},sizeSmall:{},sizeLarge:{},fullWidth:{width:"100%"},startIcon:{display:"inherit",marginRight:8,marginLeft:-4,"&$iconSizeSmall":{marginLeft:-2}},endIcon:{display:"inherit",marginRight:-4,marginLeft:8,"&$iconSizeSmall":{marginRight:-2}},iconSizeSmall:{"& > *:first-child":{fontSize:18}},iconSizeMedium:{"& > *:first-child":{fontSize:20}},iconSizeLarge:{"& > *:first-child":{fontSize:22}}}}),{name:"MuiButton"})(Jt);var en=44,tn=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.color,s=void 0===l?"primary":l,u=t.disableShrink,c=void 0!==u&&u,d=t.size,f=void 0===d?40:d,p=t.style,m=t.thickness,h=void 0===m?3.6:m,v=t.value,g=void 0===v?0:v,y=t.variant,b=void 0===y?"indeterminate":y,x=(0,a.A)(t,["classes","className","color","disableShrink","size","style","thickness","value","variant"]),w={},E={},k={};if("determinate"===b||"static"===b){var S=2*Math.PI*((en-h)/2);w.strokeDasharray=S.toFixed(3),k["aria-valuenow"]=Math.round(g),w.strokeDashoffset="".concat(((100-g)/100*S).toFixed(3),"px"),E.transform="rotate(-90deg)"}return e.createElement("div",(0,r.A)({className:(0,P.A)(o.root,i,"inherit"!==s&&o["color".concat((0,V.A)(s))],{determinate:o.determinate,indeterminate:o.indeterminate,static:o.static}[b]),style:(0,r.A)({width:f,height:f},E,p),ref:n,role:"progressbar"},k,x),e.createElement("svg",{className:o.svg,viewBox:"".concat(22," ").concat(22," ").concat(en," ").concat(en)},e.createElement("circle",{className:(0,P.A)(o.circle,c&&o.circleDisableShrink,{determinate:o.circleDeterminate,indeterminate:o.circleIndeterminate,static:o.circleStatic}[b]),style:w,cx:en,cy:en,r:(en-h)/2,fill:"none",strokeWidth:h})))}));const nn=(0,T.A)((function(e){return{root:{display:"inline-block"},static:{transition:e.transitions.create("transform")},indeterminate:{animation:"$circular-rotate 1.4s linear infinite"},determinate:{transition:e.transitions.create("transform")},colorPrimary:{color:e.palette.primary.main},colorSecondary:{color:e.palette.secondary.main},svg:{display:"block"},circle:{stroke:"currentColor"},circleStatic:{transition:e.transitions.create("stroke-dashoffset")},circleIndeterminate:{animation:"$circular-dash 1.4s ease-in-out infinite",strokeDasharray:"80px, 200px",strokeDashoffset:"0px"},circleDeterminate:{transition:e.transitions.create("stroke-dashoffset")},"@keyframes circular-rotate":{"0%":{transformOrigin:"50% 50%"},"100%":{transform:"rotate(360deg)"}},"@keyframes circular-dash":{"0%":{strokeDasharray:"1px, 200px",strokeDashoffset:"0px"},"50%":{strokeDasharray:"100px, 200px",strokeDashoffset:"-15px"},"100%":{strokeDasharray:"100px, 200px",strokeDashoffset:"-125px"}},circleDisableShrink:{animation:"none"}}}),{name:"MuiCircularProgress",flip:!1})(tn);function rn(e){return e.substring(2).toLowerCase()}const on=function(n){var r=n.children,o=n.disableReactTree,a=void 0!==o&&o,i=n.mouseEvent,l=void 0===i?"onClick":i,s=n.onClickAway,u=n.touchEvent,c=void 0===u?"onTouchEnd":u,d=e.useRef(!1),f=e.useRef(null),p=e.useRef(!1),m=e.useRef(!1);e.useEffect((function(){return setTimeout((function(){p.current=!0}),0),function(){p.current=!1}}),[]);var h=e.useCallback((function(e){f.current=t.findDOMNode(e)}),[]),v=(0,k.A)(r.ref,h),g=(0,_e.A)((function(e){var t=m.current;if(m.current=!1,p.current&&f.current&&!function(e){return document.documentElement.clientWidth<e.clientX||document.documentElement.clientHeight<e.clientY}(e))if(d.current)d.current=!1;else{(e.composedPath?e.composedPath().indexOf(f.current)>-1:!(0,Pe.A)(f.current).documentElement.contains(e.target)||f.current.contains(e.target))||!a&&t||s(e)}})),y=function(e){return function(t){m.current=!0;var n=r.props[e];n&&n(t)}},b={ref:v};return!1!==c&&(b[c]=y(c)),e.useEffect((function(){if(!1!==c){var e=rn(c),t=(0,Pe.A)(f.current),n=function(){d.current=!0};return t.addEventListener(e,g),t.addEventListener("touchmove",n),function(){t.removeEventListener(e,g),t.removeEventListener("touchmove",n)}}}),[g,c]),!1!==l&&(b[l]=y(l)),e.useEffect((function(){if(!1!==l){var e=rn(l),t=(0,Pe.A)(f.current);return t.addEventListener(e,g),function(){t.removeEventListener(e,g)}}}),[g,l]),e.createElement(e.Fragment,null,e.cloneElement(r,b))};var an=e.forwardRef((function(t,n){var o=t.action,i=t.classes,l=t.className,s=t.message,u=t.role,c=void 0===u?"alert":u,d=(0,a.A)(t,["action","classes","className","message","role"]);return e.createElement(O,(0,r.A)({role:c,square:!0,elevation:6,className:(0,P.A)(i.root,l),ref:n},d),e.createElement("div",{className:i.message},s),o?e.createElement("div",{className:i.action},o):null)}));const ln=(0,T.A)((function(e){var t="light"===e.palette.type?.8:.98,n=(0,Dt.tL)(e.palette.background.default,t);return{root:(0,r.A)({},e.typography.body2,(0,de.A)({color:e.palette.getContrastText(n),backgroundColor:n,display:"flex",alignItems:"center",flexWrap:"wrap",padding:"6px 16px",borderRadius:e.shape.borderRadius,flexGrow:1},e.breakpoints.up("sm"),{flexGrow:"initial",minWidth:288})),message:{padding:"8px 0"},action:{display:"flex",alignItems:"center",marginLeft:"auto",paddingLeft:16,marginRight:-8}}}),{name:"MuiSnackbarContent"})(an);var sn=e.forwardRef((function(t,n){var o=t.action,i=t.anchorOrigin,l=(i=void 0===i?{vertical:"bottom",horizontal:"center"}:i).vertical,s=i.horizontal,u=t.autoHideDuration,c=void 0===u?null:u,d=t.children,f=t.classes,p=t.className,m=t.ClickAwayListenerProps,h=t.ContentProps,v=t.disableWindowBlurListener,y=void 0!==v&&v,b=t.message,x=t.onClose,w=t.onEnter,E=t.onEntered,k=t.onEntering,S=t.onExit,A=t.onExited,C=t.onExiting,R=t.onMouseEnter,T=t.onMouseLeave,N=t.open,O=t.resumeHideDuration,M=t.TransitionComponent,L=void 0===M?Ze:M,z=t.transitionDuration,_=void 0===z?{enter:g.p0.enteringScreen,exit:g.p0.leavingScreen}:z,I=t.TransitionProps,D=(0,a.A)(t,["action","anchorOrigin","autoHideDuration","children","classes","className","ClickAwayListenerProps","ContentProps","disableWindowBlurListener","message","onClose","onEnter","onEntered","onEntering","onExit","onExited","onExiting","onMouseEnter","onMouseLeave","open","resumeHideDuration","TransitionComponent","transitionDuration","TransitionProps"]),F=e.useRef(),j=e.useState(!0),B=j[0],W=j[1],$=(0,_e.A)((function(){x&&x.apply(void 0,arguments)})),H=(0,_e.A)((function(e){x&&null!=e&&(clearTimeout(F.current),F.current=setTimeout((function(){$(null,"timeout")}),e))}));e.useEffect((function(){return N&&H(c),function(){clearTimeout(F.current)}}),[N,c,H]);var U=function(){clearTimeout(F.current)},q=e.useCallback((function(){null!=c&&H(null!=O?O:.5*c)}),[c,O,H]);return e.useEffect((function(){if(!y&&N)return window.addEventListener("focus",q),window.addEventListener("blur",U),function(){window.removeEventListener("focus",q),window.removeEventListener("blur",U)}}),[y,q,N]),!N&&B?null:e.createElement(on,(0,r.A)({onClickAway:function(e){x&&x(e,"clickaway")}},m),e.createElement("div",(0,r.A)({className:(0,P.A)(f.root,f["anchorOrigin".concat((0,V.A)(l)).concat((0,V.A)(s))],p),onMouseEnter:function(e){R&&R(e),U()},onMouseLeave:function(e){T&&T(e),q()},ref:n},D),e.createElement(L,(0,r.A)({appear:!0,in:N,onEnter:(0,Ne.A)((function(){W(!1)}),w),onEntered:E,onEntering:k,onExit:S,onExited:(0,Ne.A)((function(){W(!0)}),A),onExiting:C,timeout:_,direction:"top"===l?"down":"up"},I),d||e.createElement(ln,(0,r.A)({message:b,action:o},h)))))}));const un=(0,T.A)((function(e){var t={top:8},n={bottom:8},o={justifyContent:"flex-end"},a={justifyContent:"flex-start"},i={top:24},l={bottom:24},s={right:24},u={left:24},c={left:"50%",right:"auto",transform:"translateX(-50%)"};return{root:{zIndex:e.zIndex.snackbar,position:"fixed",display:"flex",left:8,right:8,justifyContent:"center",alignItems:"center"},anchorOriginTopCenter:(0,r.A)({},t,(0,de.A)({},e.breakpoints.up("sm"),(0,r.A)({},i,c))),anchorOriginBottomCenter:(0,r.A)({},n,(0,de.A)({},e.breakpoints.up("sm"),(0,r.A)({},l,c))),anchorOriginTopRight:(0,r.A)({},t,o,(0,de.A)({},e.breakpoints.up("sm"),(0,r.A)({left:"auto"},i,s))),anchorOriginBottomRight:(0,r.A)({},n,o,(0,de.A)({},e.breakpoints.up("sm"),(0,r.A)({left:"auto"},l,s))),anchorOriginTopLeft:(0,r.A)({},t,a,(0,de.A)({},e.breakpoints.up("sm"),(0,r.A)({right:"auto"},i,u))),anchorOriginBottomLeft:(0,r.A)({},n,a,(0,de.A)({},e.breakpoints.up("sm"),(0,r.A)({right:"auto"},l,u)))}}),{flip:!1,name:"MuiSnackbar"})(sn);var cn=e.forwardRef((function(t,n){var o=t.edge,i=void 0!==o&&o,l=t.children,s=t.classes,u=t.className,c=t.color,d=void 0===c?"default":c,f=t.disabled,p=void 0!==f&&f,m=t.disableFocusRipple,h=void 0!==m&&m,v=t.size,g=void 0===v?"medium":v,y=(0,a.A)(t,["edge","children","classes","className","color","disabled","disableFocusRipple","size"]);return e.createElement(Gt,(0,r.A)({className:(0,P.A)(s.root,u,"default"!==d&&s["color".concat((0,V.A)(d))],p&&s.disabled,"small"===g&&s["size".concat((0,V.A)(g))],{start:s.edgeStart,end:s.edgeEnd}[i]),centerRipple:!0,focusRipple:!h,disabled:p,ref:n},y),e.createElement("span",{className:s.label},l))}));const dn=(0,T.A)((function(e){return{root:{textAlign:"center",flex:"0 0 auto",fontSize:e.typography.pxToRem(24),padding:12,borderRadius:"50%",overflow:"visible",color:e.palette.action.active,transition:e.transitions.create("background-color",{duration:e.transitions.duration.shortest}),"&:hover":{backgroundColor:(0,Dt.X4)(e.palette.action.active,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}},"&$disabled":{backgroundColor:"transparent",color:e.palette.action.disabled}},edgeStart:{marginLeft:-12,"$sizeSmall&":{marginLeft:-3}},edgeEnd:{marginRight:-12,"$sizeSmall&":{marginRight:-3}},colorInherit:{color:"inherit"},colorPrimary:{color:e.palette.primary.main,"&:hover":{backgroundColor:(0,Dt.X4)(e.palette.primary.main,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},colorSecondary:{color:e.palette.secondary.main,"&:hover":{backgroundColor:(0,Dt.X4)(e.palette.secondary.main,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},disabled:{},sizeSmall:{padding:3,fontSize:e.typography.pxToRem(18)},label:{width:"100%",display:"flex",alignItems:"inherit",justifyContent:"inherit"}}}),{name:"MuiIconButton"})(cn),fn=(0,kt.A)(e.createElement("path",{d:"M20,12A8,8 0 0,1 12,20A8,8 0 0,1 4,12A8,8 0 0,1 12,4C12.76,4 13.5,4.11 14.2, 4.31L15.77,2.74C14.61,2.26 13.34,2 12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0, 0 22,12M7.91,10.08L6.5,11.5L11,16L21,6L19.59,4.58L11,13.17L7.91,10.08Z"}),"SuccessOutlined"),pn=(0,kt.A)(e.createElement("path",{d:"M12 5.99L19.53 19H4.47L12 5.99M12 2L1 21h22L12 2zm1 14h-2v2h2v-2zm0-6h-2v4h2v-4z"}),"ReportProblemOutlined"),mn=(0,kt.A)(e.createElement("path",{d:"M11 15h2v2h-2zm0-8h2v6h-2zm.99-5C6.47 2 2 6.48 2 12s4.47 10 9.99 10C17.52 22 22 17.52 22 12S17.52 2 11.99 2zM12 20c-4.42 0-8-3.58-8-8s3.58-8 8-8 8 3.58 8 8-3.58 8-8 8z"}),"ErrorOutline"),hn=(0,kt.A)(e.createElement("path",{d:"M11,9H13V7H11M12,20C7.59,20 4,16.41 4,12C4,7.59 7.59,4 12,4C16.41,4 20,7.59 20, 12C20,16.41 16.41,20 12,20M12,2A10,10 0 0,0 2,12A10,10 0 0,0 12,22A10,10 0 0,0 22,12A10, 10 0 0,0 12,2M11,17H13V11H11V17Z"}),"InfoOutlined"),vn=(0,kt.A)(e.createElement("path",{d:"M19 6.41L17.59 5 12 10.59 6.41 5 5 6.41 10.59 12 5 17.59 6.41 19 12 13.41 17.59 19 19 17.59 13.41 12z"}),"Close");var gn={success:e.createElement(fn,{fontSize:"inherit"}),warning:e.createElement(pn,{fontSize:"inherit"}),error:e.createElement(mn,{fontSize:"inherit"}),info:e.createElement(hn,{fontSize:"inherit"})},yn=e.createElement(vn,{fontSize:"small"}),bn=e.forwardRef((function(t,n){var o=t.action,i=t.children,l=t.classes,s=t.className,u=t.closeText,c=void 0===u?"Close":u,d=t.color,f=t.icon,p=t.iconMapping,m=void 0===p?gn:p,h=t.onClose,v=t.role,g=void 0===v?"alert":v,y=t.severity,b=void 0===y?"success":y,x=t.variant,w=void 0===x?"standard":x,E=(0,a.A)(t,["action","children","classes","className","closeText","color","icon","iconMapping","onClose","role","severity","variant"]);return e.createElement(O,(0,r.A)({role:g,square:!0,elevation:0,className:(0,P.A)(l.root,l["".concat(w).concat((0,V.A)(d||b))],s),ref:n},E),!1!==f?e.createElement("div",{className:l.icon},f||m[b]||gn[b]):null,e.createElement("div",{className:l.message},i),null!=o?e.createElement("div",{className:l.action},o):null,null==o&&h?e.createElement("div",{className:l.action},e.createElement(dn,{size:"small","aria-label":c,title:c,color:"inherit",onClick:h},yn)):null)}));const xn=(0,T.A)((function(e){var t="light"===e.palette.type?Dt.e$:Dt.a,n="light"===e.palette.type?Dt.a:Dt.e$;return{root:(0,r.A)({},e.typography.body2,{borderRadius:e.shape.borderRadius,backgroundColor:"transparent",display:"flex",padding:"6px 16px"}),standardSuccess:{color:t(e.palette.success.main,.6),backgroundColor:n(e.palette.success.main,.9),"& $icon":{color:e.palette.success.main}},standardInfo:{color:t(e.palette.info.main,.6),backgroundColor:n(e.palette.info.main,.9),"& $icon":{color:e.palette.info.main}},standardWarning:{color:t(e.palette.warning.main,.6),backgroundColor:n(e.palette.warning.main,.9),"& $icon":{color:e.palette.warning.main}},standardError:{color:t(e.palette.error.main,.6),backgroundColor:n(e.palette.error.main,.9),"& $icon":{color:e.palette.error.main}},outlinedSuccess:{color:t(e.palette.success.main,.6),border:"1px solid ".concat(e.palette.success.main),"& $icon":{color:e.palette.success.main}},outlinedInfo:{color:t(e.palette.info.main,.6),border:"1px solid ".concat(e.palette.info.main),"& $icon":{color:e.palette.info.main}},outlinedWarning:{color:t(e.palette.warning.main,.6),border:"1px solid ".concat(e.palette.warning.main),"& $icon":{color:e.palette.warning.main}},outlinedError:{color:t(e.palette.error.main,.6),border:"1px solid ".concat(e.palette.error.main),"& $icon":{color:e.palette.error.main}},filledSuccess:{color:"#fff",fontWeight:e.typography.fontWeightMedium,backgroundColor:e.palette.success.main},filledInfo:{color:"#fff",fontWeight:e.typography.fontWeightMedium,backgroundColor:e.palette.info.main},filledWarning:{color:"#fff",fontWeight:e.typography.fontWeightMedium,backgroundColor:e.palette.warning.main},filledError:{color:"#fff",fontWeight:e.typography.fontWeightMedium,backgroundColor:e.palette.error.main},icon:{marginRight:12,padding:"7px 0",display:"flex",fontSize:22,opacity:.9},message:{padding:"8px 0"},action:{display:"flex",alignItems:"center",marginLeft:"auto",paddingLeft:16,marginRight:-8}}}),{name:"MuiAlert"})(bn);var wn=n(5556),En=n.n(wn);function kn(e){return"/"===e.charAt(0)}function Sn(e,t){for(var n=t,r=n+1,o=e.length;r<o;n+=1,r+=1)e[n]=e[r];e.pop()}function An(e){return e.valueOf?e.valueOf():Object.prototype.valueOf.call(e)}const Cn=function e(t,n){if(t===n)return!0;if(null==t||null==n)return!1;if(Array.isArray(t))return Array.isArray(n)&&t.length===n.length&&t.every((function(t,r){return e(t,n[r])}));if("object"==typeof t||"object"==typeof n){var r=An(t),o=An(n);return r!==t||o!==n?e(r,o):Object.keys(Object.assign({},t,n)).every((function(r){return e(t[r],n[r])}))}return!1};function Rn(e,t){if(!e)throw new Error("Invariant failed")}function Pn(e){return"/"===e.charAt(0)?e:"/"+e}function Tn(e,t){return function(e,t){return 0===e.toLowerCase().indexOf(t.toLowerCase())&&-1!=="/?#".indexOf(e.charAt(t.length))}(e,t)?e.substr(t.length):e}function Nn(e){return"/"===e.charAt(e.length-1)?e.slice(0,-1):e}function On(e){var t=e.pathname,n=e.search,r=e.hash,o=t||"/";return n&&"?"!==n&&(o+="?"===n.charAt(0)?n:"?"+n),r&&"#"!==r&&(o+="#"===r.charAt(0)?r:"#"+r),o}function Mn(e,t,n,o){var a;"string"==typeof e?(a=function(e){var t=e||"/",n="",r="",o=t.indexOf("#");-1!==o&&(r=t.substr(o),t=t.substr(0,o));var a=t.indexOf("?");return-1!==a&&(n=t.substr(a),t=t.substr(0,a)),{pathname:t,search:"?"===n?"":n,hash:"#"===r?"":r}}(e),a.state=t):(void 0===(a=(0,r.A)({},e)).pathname&&(a.pathname=""),a.search?"?"!==a.search.charAt(0)&&(a.search="?"+a.search):a.search="",a.hash?"#"!==a.hash.charAt(0)&&(a.hash="#"+a.hash):a.hash="",void 0!==t&&void 0===a.state&&(a.state=t));try{a.pathname=decodeURI(a.pathname)}catch(e){throw e instanceof URIError?new URIError('Pathname "'+a.pathname+'" could not be decoded. This is likely caused by an invalid percent-encoding.'):e}return n&&(a.key=n),o?a.pathname?"/"!==a.pathname.charAt(0)&&(a.pathname=function(e,t){void 0===t&&(t="");var n,r=e&&e.split("/")||[],o=t&&t.split("/")||[],a=e&&kn(e),i=t&&kn(t),l=a||i;if(e&&kn(e)?o=r:r.length&&(o.pop(),o=o.concat(r)),!o.length)return"/";if(o.length){var s=o[o.length-1];n="."===s||".."===s||""===s}else n=!1;for(var u=0,c=o.length;c>=0;c--){var d=o[c];"."===d?Sn(o,c):".."===d?(Sn(o,c),u++):u&&(Sn(o,c),u--)}if(!l)for(;u--;u)o.unshift("..");!l||""===o[0]||o[0]&&kn(o[0])||o.unshift("");var f=o.join("/");return n&&"/"!==f.substr(-1)&&(f+="/"),f}(a.pathname,o.pathname)):a.pathname=o.pathname:a.pathname||(a.pathname="/"),a}function Ln(){var e=null,t=[];return{setPrompt:function(t){return e=t,function(){e===t&&(e=null)}},confirmTransitionTo:function(t,n,r,o){if(null!=e){var a="function"==typeof e?e(t,n):e;"string"==typeof a?"function"==typeof r?r(a,o):o(!0):o(!1!==a)}else o(!0)},appendListener:function(e){var n=!0;function r(){n&&e.apply(void 0,arguments)}return t.push(r),function(){n=!1,t=t.filter((function(e){return e!==r}))}},notifyListeners:function(){for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];t.forEach((function(e){return e.apply(void 0,n)}))}}}var zn=!("undefined"==typeof window||!window.document||!window.document.createElement);function _n(e,t){t(window.confirm(e))}var In="popstate",Dn="hashchange";function Fn(){try{return window.history.state||{}}catch(e){return{}}}var jn=n(5302),Bn=n.n(jn),Wn=(n(7564),n(4146)),$n=n.n(Wn),Vn=1073741823,Hn="undefined"!=typeof globalThis?globalThis:"undefined"!=typeof window?window:void 0!==n.g?n.g:{},Un=e.createContext||function(t,n){var r,o,a,i="__create-react-context-"+((Hn[a="__global_unique_id__"]=(Hn[a]||0)+1)+"__"),s=function(e){function t(){for(var t,n,r,o=arguments.length,a=new Array(o),i=0;i<o;i++)a[i]=arguments[i];return(t=e.call.apply(e,[this].concat(a))||this).emitter=(n=t.props.value,r=[],{on:function(e){r.push(e)},off:function(e){r=r.filter((function(t){return t!==e}))},get:function(){return n},set:function(e,t){n=e,r.forEach((function(e){return e(n,t)}))}}),t}(0,l.A)(t,e);var r=t.prototype;return r.getChildContext=function(){var e;return(e={})[i]=this.emitter,e},r.componentWillReceiveProps=function(e){if(this.props.value!==e.value){var t,r=this.props.value,o=e.value;((a=r)===(i=o)?0!==a||1/a==1/i:a!=a&&i!=i)?t=0:(t="function"==typeof n?n(r,o):Vn,0!=(t|=0)&&this.emitter.set(e.value,t))}var a,i},r.render=function(){return this.props.children},t}(e.Component);s.childContextTypes=((r={})[i]=En().object.isRequired,r);var u=function(e){function n(){for(var t,n=arguments.length,r=new Array(n),o=0;o<n;o++)r[o]=arguments[o];return(t=e.call.apply(e,[this].concat(r))||this).observedBits=void 0,t.state={value:t.getValue()},t.onUpdate=function(e,n){t.observedBits&n&&t.setState({value:t.getValue()})},t}(0,l.A)(n,e);var r=n.prototype;return r.componentWillReceiveProps=function(e){var t=e.observedBits;this.observedBits=null==t?Vn:t},r.componentDidMount=function(){this.context[i]&&this.context[i].on(this.onUpdate);var e=this.props.observedBits;this.observedBits=null==e?Vn:e},r.componentWillUnmount=function(){this.context[i]&&this.context[i].off(this.onUpdate)},r.getValue=function(){return this.context[i]?this.context[i].get():t},r.render=function(){return(e=this.props.children,Array.isArray(e)?e[0]:e)(this.state.value);var e},n}(e.Component);return u.contextTypes=((o={})[i]=En().object,o),{Provider:s,Consumer:u}},qn=function(e){var t=Un();return t.displayName=e,t},Kn=qn("Router-History"),Xn=qn("Router"),Qn=function(t){function n(e){var n;return(n=t.call(this,e)||this).state={location:e.history.location},n._isMounted=!1,n._pendingLocation=null,e.staticContext||(n.unlisten=e.history.listen((function(e){n._pendingLocation=e}))),n}(0,l.A)(n,t),n.computeRootMatch=function(e){return{path:"/",url:"/",params:{},isExact:"/"===e}};var r=n.prototype;return r.componentDidMount=function(){var e=this;this._isMounted=!0,this.unlisten&&this.unlisten(),this.props.staticContext||(this.unlisten=this.props.history.listen((function(t){e._isMounted&&e.setState({location:t})}))),this._pendingLocation&&this.setState({location:this._pendingLocation})},r.componentWillUnmount=function(){this.unlisten&&(this.unlisten(),this._isMounted=!1,this._pendingLocation=null)},r.render=function(){return e.createElement(Xn.Provider,{value:{history:this.props.history,location:this.state.location,match:n.computeRootMatch(this.state.location.pathname),staticContext:this.props.staticContext}},e.createElement(Kn.Provider,{children:this.props.children||null,value:this.props.history}))},n}(e.Component);e.Component;var Yn=function(e){function t(){return e.apply(this,arguments)||this}(0,l.A)(t,e);var n=t.prototype;return n.componentDidMount=function(){this.props.onMount&&this.props.onMount.call(this,this)},n.componentDidUpdate=function(e){this.props.onUpdate&&this.props.onUpdate.call(this,this,e)},n.componentWillUnmount=function(){this.props.onUnmount&&this.props.onUnmount.call(this,this)},n.render=function(){return null},t}(e.Component),Gn={},Jn=0;function Zn(e,t){return void 0===e&&(e="/"),void 0===t&&(t={}),"/"===e?e:function(e){if(Gn[e])return Gn[e];var t=Bn().compile(e);return Jn<1e4&&(Gn[e]=t,Jn++),t}(e)(t,{pretty:!0})}function er(t){var n=t.computedMatch,o=t.to,a=t.push,i=void 0!==a&&a;return e.createElement(Xn.Consumer,null,(function(t){t||Rn(!1);var a=t.history,l=t.staticContext,s=i?a.push:a.replace,u=Mn(n?"string"==typeof o?Zn(o,n.params):(0,r.A)({},o,{pathname:Zn(o.pathname,n.params)}):o);return l?(s(u),null):e.createElement(Yn,{onMount:function(){s(u)},onUpdate:function(e,t){var n,o,a=Mn(t.to);n=a,o=(0,r.A)({},u,{key:a.key}),n.pathname===o.pathname&&n.search===o.search&&n.hash===o.hash&&n.key===o.key&&Cn(n.state,o.state)||s(u)},to:o})}))}var tr={},nr=0;function rr(e,t){void 0===t&&(t={}),("string"==typeof t||Array.isArray(t))&&(t={path:t});var n=t,r=n.path,o=n.exact,a=void 0!==o&&o,i=n.strict,l=void 0!==i&&i,s=n.sensitive,u=void 0!==s&&s;return[].concat(r).reduce((function(t,n){if(!n&&""!==n)return null;if(t)return t;var r=function(e,t){var n=""+t.end+t.strict+t.sensitive,r=tr[n]||(tr[n]={});if(r[e])return r[e];var o=[],a={regexp:Bn()(e,o,t),keys:o};return nr<1e4&&(r[e]=a,nr++),a}(n,{end:a,strict:l,sensitive:u}),o=r.regexp,i=r.keys,s=o.exec(e);if(!s)return null;var c=s[0],d=s.slice(1),f=e===c;return a&&!f?null:{path:n,url:"/"===n&&""===c?"/":c,isExact:f,params:i.reduce((function(e,t,n){return e[t.name]=d[n],e}),{})}}),null)}var or=function(t){function n(){return t.apply(this,arguments)||this}return(0,l.A)(n,t),n.prototype.render=function(){var t=this;return e.createElement(Xn.Consumer,null,(function(n){n||Rn(!1);var o=t.props.location||n.location,a=t.props.computedMatch?t.props.computedMatch:t.props.path?rr(o.pathname,t.props):n.match,i=(0,r.A)({},n,{location:o,match:a}),l=t.props,s=l.children,u=l.component,c=l.render;return Array.isArray(s)&&function(t){return 0===e.Children.count(t)}(s)&&(s=null),e.createElement(Xn.Provider,{value:i},i.match?s?"function"==typeof s?s(i):s:u?e.createElement(u,i):c?c(i):null:"function"==typeof s?s(i):null)}))},n}(e.Component);e.Component;var ar=function(t){function n(){return t.apply(this,arguments)||this}return(0,l.A)(n,t),n.prototype.render=function(){var t=this;return e.createElement(Xn.Consumer,null,(function(n){n||Rn(!1);var o,a,i=t.props.location||n.location;return e.Children.forEach(t.props.children,(function(t){if(null==a&&e.isValidElement(t)){o=t;var l=t.props.path||t.props.from;a=l?rr(i.pathname,(0,r.A)({},t.props,{path:l})):n.match}})),a?e.cloneElement(o,{location:i,computedMatch:a}):null}))},n}(e.Component);e.useContext;var ir=function(t){function n(){for(var e,n=arguments.length,o=new Array(n),a=0;a<n;a++)o[a]=arguments[a];return(e=t.call.apply(t,[this].concat(o))||this).history=function(e){void 0===e&&(e={}),zn||Rn(!1);var t,n=window.history,o=(-1===(t=window.navigator.userAgent).indexOf("Android 2.")&&-1===t.indexOf("Android 4.0")||-1===t.indexOf("Mobile Safari")||-1!==t.indexOf("Chrome")||-1!==t.indexOf("Windows Phone"))&&window.history&&"pushState"in window.history,a=!(-1===window.navigator.userAgent.indexOf("Trident")),i=e,l=i.forceRefresh,s=void 0!==l&&l,u=i.getUserConfirmation,c=void 0===u?_n:u,d=i.keyLength,f=void 0===d?6:d,p=e.basename?Nn(Pn(e.basename)):"";function m(e){var t=e||{},n=t.key,r=t.state,o=window.location,a=o.pathname+o.search+o.hash;return p&&(a=Tn(a,p)),Mn(a,r,n)}function h(){return Math.random().toString(36).substr(2,f)}var v=Ln();function g(e){(0,r.A)(T,e),T.length=n.length,v.notifyListeners(T.location,T.action)}function y(e){(function(e){return void 0===e.state&&-1===navigator.userAgent.indexOf("CriOS")})(e)||w(m(e.state))}function b(){w(m(Fn()))}var x=!1;function w(e){x?(x=!1,g()):v.confirmTransitionTo(e,"POP",c,(function(t){t?g({action:"POP",location:e}):function(e){var t=T.location,n=k.indexOf(t.key);-1===n&&(n=0);var r=k.indexOf(e.key);-1===r&&(r=0);var o=n-r;o&&(x=!0,A(o))}(e)}))}var E=m(Fn()),k=[E.key];function S(e){return p+On(e)}function A(e){n.go(e)}var C=0;function R(e){1===(C+=e)&&1===e?(window.addEventListener(In,y),a&&window.addEventListener(Dn,b)):0===C&&(window.removeEventListener(In,y),a&&window.removeEventListener(Dn,b))}var P=!1,T={length:n.length,action:"POP",location:E,createHref:S,push:function(e,t){var r="PUSH",a=Mn(e,t,h(),T.location);v.confirmTransitionTo(a,r,c,(function(e){if(e){var t=S(a),i=a.key,l=a.state;if(o)if(n.pushState({key:i,state:l},null,t),s)window.location.href=t;else{var u=k.indexOf(T.location.key),c=k.slice(0,u+1);c.push(a.key),k=c,g({action:r,location:a})}else window.location.href=t}}))},replace:function(e,t){var r="REPLACE",a=Mn(e,t,h(),T.location);v.confirmTransitionTo(a,r,c,(function(e){if(e){var t=S(a),i=a.key,l=a.state;if(o)if(n.replaceState({key:i,state:l},null,t),s)window.location.replace(t);else{var u=k.indexOf(T.location.key);-1!==u&&(k[u]=a.key),g({action:r,location:a})}else window.location.replace(t)}}))},go:A,goBack:function(){A(-1)},goForward:function(){A(1)},block:function(e){void 0===e&&(e=!1);var t=v.setPrompt(e);return P||(R(1),P=!0),function(){return P&&(P=!1,R(-1)),t()}},listen:function(e){var t=v.appendListener(e);return R(1),function(){R(-1),t()}}};return T}(e.props),e}return(0,l.A)(n,t),n.prototype.render=function(){return e.createElement(Qn,{history:this.history,children:this.props.children})},n}(e.Component);e.Component;var lr=function(e,t){return"function"==typeof e?e(t):e},sr=function(e,t){return"string"==typeof e?Mn(e,null,null,t):e},ur=function(e){return e},cr=e.forwardRef;void 0===cr&&(cr=ur);var dr=cr((function(t,n){var o=t.innerRef,a=t.navigate,l=t.onClick,s=(0,i.A)(t,["innerRef","navigate","onClick"]),u=s.target,c=(0,r.A)({},s,{onClick:function(e){try{l&&l(e)}catch(t){throw e.preventDefault(),t}e.defaultPrevented||0!==e.button||u&&"_self"!==u||function(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)}(e)||(e.preventDefault(),a())}});return c.ref=ur!==cr&&n||o,e.createElement("a",c)})),fr=cr((function(t,n){var o=t.component,a=void 0===o?dr:o,l=t.replace,s=t.to,u=t.innerRef,c=(0,i.A)(t,["component","replace","to","innerRef"]);return e.createElement(Xn.Consumer,null,(function(t){t||Rn(!1);var o=t.history,i=sr(lr(s,t.location),t.location),d=i?o.createHref(i):"",f=(0,r.A)({},c,{href:d,navigate:function(){var e=lr(s,t.location),n=On(t.location)===On(sr(e));(l||n?o.replace:o.push)(e)}});return ur!==cr?f.ref=n||u:f.innerRef=u,e.createElement(a,f)}))})),pr=function(e){return e},mr=e.forwardRef;void 0===mr&&(mr=pr),mr((function(t,n){var o=t["aria-current"],a=void 0===o?"page":o,l=t.activeClassName,s=void 0===l?"active":l,u=t.activeStyle,c=t.className,d=t.exact,f=t.isActive,p=t.location,m=t.sensitive,h=t.strict,v=t.style,g=t.to,y=t.innerRef,b=(0,i.A)(t,["aria-current","activeClassName","activeStyle","className","exact","isActive","location","sensitive","strict","style","to","innerRef"]);return e.createElement(Xn.Consumer,null,(function(t){t||Rn(!1);var o=p||t.location,i=sr(lr(g,o),o),l=i.pathname,x=l&&l.replace(/([.+*?=^!:${}()[\]|/\\])/g,"\\$1"),w=x?rr(o.pathname,{path:x,exact:d,sensitive:m,strict:h}):null,E=!!(f?f(w,o):w),k="function"==typeof c?c(E):c,S="function"==typeof v?v(E):v;E&&(k=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return t.filter((function(e){return e})).join(" ")}(k,s),S=(0,r.A)({},S,u));var A=(0,r.A)({"aria-current":E&&a||null,className:k,style:S,to:i},b);return pr!==mr?A.ref=n||y:A.innerRef=y,e.createElement(fr,A)}))}));var hr=n(9608),vr=n(4820),gr=n(7690),yr=n(3546);class br extends e.Component{constructor(e){super(e),this.state={roomCode:"",error:"",isLoading:!1,showSuccess:!1,validCode:!1},this.handleTextFieldChange=this.handleTextFieldChange.bind(this),this.roomButtonPressed=this.roomButtonPressed.bind(this),this.handleCloseSnackbar=this.handleCloseSnackbar.bind(this),this.validateRoomCode=this.validateRoomCode.bind(this)}validateRoomCode(e){return e.length>=4&&e.length<=8&&/^[A-Za-z0-9]+$/.test(e)}handleCloseSnackbar(){this.setState({error:"",showSuccess:!1})}render(){const{roomCode:t,error:n,isLoading:r,showSuccess:o,validCode:a}=this.state;return e.createElement(e.Fragment,null,e.createElement(R,{in:!0,timeout:800},e.createElement(L,{className:"music-card"},e.createElement(_,null,e.createElement(W,{container:!0,spacing:3},e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(q,{variant:"h4",component:"h1",className:"main-title"},"Join a Room")),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(It,{error:!!n,label:"Room Code",placeholder:"Enter a Room Code",value:t,helperText:n||"Enter the 4-8 character room code",variant:"outlined",onChange:this.handleTextFieldChange,fullWidth:!0,disabled:r,style:{maxWidth:"400px"},InputProps:{style:{color:"white"},endAdornment:a&&!n?e.createElement(gr.A,{style:{color:"#1DB954"}}):null},InputLabelProps:{style:{color:"rgba(255, 255, 255, 0.7)"}}})),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(Zt,{className:"action-button join-button",variant:"contained",startIcon:r?e.createElement(nn,{size:20,color:"inherit"}):e.createElement(vr.A,null),onClick:this.roomButtonPressed,size:"large",disabled:r||!t||!a},r?"Joining...":"Enter Room")),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(Zt,{className:"action-button",variant:"outlined",startIcon:e.createElement(hr.A,null),component:fr,to:"/",disabled:r,style:{background:"transparent",border:"1px solid rgba(255,255,255,0.2)",opacity:r?.6:1}},"Back")))))),e.createElement(un,{open:!!n||o,autoHideDuration:6e3,onClose:this.handleCloseSnackbar,anchorOrigin:{vertical:"bottom",horizontal:"center"}},n?e.createElement(xn,{severity:"error",variant:"filled",action:e.createElement(dn,{size:"small",color:"inherit",onClick:this.handleCloseSnackbar},e.createElement(yr.A,{fontSize:"small"}))},n):e.createElement(xn,{severity:"success",variant:"filled",action:e.createElement(dn,{size:"small",color:"inherit",onClick:this.handleCloseSnackbar},e.createElement(yr.A,{fontSize:"small"}))},"Room found! Joining now...")))}handleTextFieldChange(e){const t=e.target.value,n=this.validateRoomCode(t);this.setState({roomCode:t,validCode:n,error:""})}roomButtonPressed(){const{roomCode:e}=this.state;if(!e)return void this.setState({error:"Please enter a room code."});if(!this.validateRoomCode(e))return void this.setState({error:"Room code must be 4-8 alphanumeric characters."});this.setState({isLoading:!0,error:""});const t={method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({code:e})};fetch("/api/join-room",t).then((t=>{t.ok?(this.setState({showSuccess:!0,isLoading:!1}),setTimeout((()=>{this.props.history.push(`/room/${e}`)}),1500)):404===t.status?this.setState({error:"Room not found. Please check the code and try again.",isLoading:!1}):this.setState({error:"Failed to join the room. Please try again.",isLoading:!1})})).catch((e=>{console.error("Error joining room:",e),this.setState({error:"Network error. Please check your connection and try again.",isLoading:!1})}))}}const xr=(Er="withRouter("+((wr=br).displayName||wr.name)+")",kr=function(t){var n=t.wrappedComponentRef,o=(0,i.A)(t,["wrappedComponentRef"]);return e.createElement(Xn.Consumer,null,(function(t){return t||Rn(!1),e.createElement(wr,(0,r.A)({},o,t,{ref:n}))}))},kr.displayName=Er,kr.WrappedComponent=wr,$n()(kr,wr));var wr,Er,kr,Sr=e.forwardRef((function(t,n){var i=t.autoFocus,l=t.checked,s=t.checkedIcon,u=t.classes,c=t.className,d=t.defaultChecked,f=t.disabled,p=t.icon,m=t.id,h=t.inputProps,v=t.inputRef,g=t.name,y=t.onBlur,b=t.onChange,x=t.onFocus,w=t.readOnly,E=t.required,k=t.tabIndex,S=t.type,A=t.value,C=(0,a.A)(t,["autoFocus","checked","checkedIcon","classes","className","defaultChecked","disabled","icon","id","inputProps","inputRef","name","onBlur","onChange","onFocus","readOnly","required","tabIndex","type","value"]),R=(0,bt.A)({controlled:l,default:Boolean(d),name:"SwitchBase",state:"checked"}),T=(0,o.A)(R,2),N=T[0],O=T[1],M=ve(),L=f;M&&void 0===L&&(L=M.disabled);var z="checkbox"===S||"radio"===S;return e.createElement(dn,(0,r.A)({component:"span",className:(0,P.A)(u.root,c,N&&u.checked,L&&u.disabled),disabled:L,tabIndex:null,role:void 0,onFocus:function(e){x&&x(e),M&&M.onFocus&&M.onFocus(e)},onBlur:function(e){y&&y(e),M&&M.onBlur&&M.onBlur(e)},ref:n},C),e.createElement("input",(0,r.A)({autoFocus:i,checked:l,defaultChecked:d,className:u.input,disabled:L,id:z&&m,name:g,onChange:function(e){var t=e.target.checked;O(t),b&&b(e,t)},readOnly:w,ref:v,required:E,tabIndex:k,type:S,value:A},h)),N?s:p)}));const Ar=(0,T.A)({root:{padding:9},checked:{},disabled:{},input:{cursor:"inherit",position:"absolute",opacity:0,width:"100%",height:"100%",top:0,left:0,margin:0,padding:0,zIndex:1}},{name:"PrivateSwitchBase"})(Sr),Cr=(0,kt.A)(e.createElement("path",{d:"M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm0 18c-4.42 0-8-3.58-8-8s3.58-8 8-8 8 3.58 8 8-3.58 8-8 8z"}),"RadioButtonUnchecked"),Rr=(0,kt.A)(e.createElement("path",{d:"M8.465 8.465C9.37 7.56 10.62 7 12 7C14.76 7 17 9.24 17 12C17 13.38 16.44 14.63 15.535 15.535C14.63 16.44 13.38 17 12 17C9.24 17 7 14.76 7 12C7 10.62 7.56 9.37 8.465 8.465Z"}),"RadioButtonChecked"),Pr=(0,T.A)((function(e){return{root:{position:"relative",display:"flex","&$checked $layer":{transform:"scale(1)",transition:e.transitions.create("transform",{easing:e.transitions.easing.easeOut,duration:e.transitions.duration.shortest})}},layer:{left:0,position:"absolute",transform:"scale(0)",transition:e.transitions.create("transform",{easing:e.transitions.easing.easeIn,duration:e.transitions.duration.shortest})},checked:{}}}),{name:"PrivateRadioButtonIcon"})((function(t){var n=t.checked,r=t.classes,o=t.fontSize;return e.createElement("div",{className:(0,P.A)(r.root,n&&r.checked)},e.createElement(Cr,{fontSize:o}),e.createElement(Rr,{fontSize:o,className:r.layer}))})),Tr=e.createContext();var Nr=e.createElement(Pr,{checked:!0}),Or=e.createElement(Pr,null),Mr=e.forwardRef((function(t,n){var o=t.checked,i=t.classes,l=t.color,s=void 0===l?"secondary":l,u=t.name,c=t.onChange,d=t.size,f=void 0===d?"medium":d,p=(0,a.A)(t,["checked","classes","color","name","onChange","size"]),m=e.useContext(Tr),h=o,v=(0,Ne.A)(c,m&&m.onChange),g=u;return m&&(void 0===h&&(h=m.value===t.value),void 0===g&&(g=m.name)),e.createElement(Ar,(0,r.A)({color:s,type:"radio",icon:e.cloneElement(Or,{fontSize:"small"===f?"small":"medium"}),checkedIcon:e.cloneElement(Nr,{fontSize:"small"===f?"small":"medium"}),classes:{root:(0,P.A)(i.root,i["color".concat((0,V.A)(s))]),checked:i.checked,disabled:i.disabled},name:g,checked:h,onChange:v,ref:n},p))}));const Lr=(0,T.A)((function(e){return{root:{color:e.palette.text.secondary},checked:{},disabled:{},colorPrimary:{"&$checked":{color:e.palette.primary.main,"&:hover":{backgroundColor:(0,Dt.X4)(e.palette.primary.main,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},"&$disabled":{color:e.palette.action.disabled}},colorSecondary:{"&$checked":{color:e.palette.secondary.main,"&:hover":{backgroundColor:(0,Dt.X4)(e.palette.secondary.main,e.palette.action.hoverOpacity),"@media (hover: none)":{backgroundColor:"transparent"}}},"&$disabled":{color:e.palette.action.disabled}}}}),{name:"MuiRadio"})(Mr);var zr=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.row,s=void 0!==l&&l,u=(0,a.A)(t,["classes","className","row"]);return e.createElement("div",(0,r.A)({className:(0,P.A)(o.root,i,s&&o.row),ref:n},u))}));const _r=(0,T.A)({root:{display:"flex",flexDirection:"column",flexWrap:"wrap"},row:{flexDirection:"row"}},{name:"MuiFormGroup"})(zr);var Ir=n(4232);const Dr=e.forwardRef((function(t,n){var i=t.actions,l=t.children,s=t.name,u=t.value,c=t.onChange,d=(0,a.A)(t,["actions","children","name","value","onChange"]),f=e.useRef(null),p=(0,bt.A)({controlled:u,default:t.defaultValue,name:"RadioGroup"}),m=(0,o.A)(p,2),h=m[0],v=m[1];e.useImperativeHandle(i,(function(){return{focus:function(){var e=f.current.querySelector("input:not(:disabled):checked");e||(e=f.current.querySelector("input:not(:disabled)")),e&&e.focus()}}}),[]);var g=(0,k.A)(n,f),y=(0,Ir.A)(s);return e.createElement(Tr.Provider,{value:{name:y,onChange:function(e){v(e.target.value),c&&c(e,e.target.value)},value:h}},e.createElement(_r,(0,r.A)({role:"radiogroup",ref:g},d),l))}));var Fr=e.forwardRef((function(t,n){t.checked;var o=t.classes,i=t.className,l=t.control,s=t.disabled,u=(t.inputRef,t.label),c=t.labelPlacement,d=void 0===c?"end":c,f=(t.name,t.onChange,t.value,(0,a.A)(t,["checked","classes","className","control","disabled","inputRef","label","labelPlacement","name","onChange","value"])),p=ve(),m=s;void 0===m&&void 0!==l.props.disabled&&(m=l.props.disabled),void 0===m&&p&&(m=p.disabled);var h={disabled:m};return["checked","name","onChange","value","inputRef"].forEach((function(e){void 0===l.props[e]&&void 0!==t[e]&&(h[e]=t[e])})),e.createElement("label",(0,r.A)({className:(0,P.A)(o.root,i,"end"!==d&&o["labelPlacement".concat((0,V.A)(d))],m&&o.disabled),ref:n},f),e.cloneElement(l,h),e.createElement(q,{component:"span",className:(0,P.A)(o.label,m&&o.disabled)},u))}));const jr=(0,T.A)((function(e){return{root:{display:"inline-flex",alignItems:"center",cursor:"pointer",verticalAlign:"middle",WebkitTapHighlightColor:"transparent",marginLeft:-11,marginRight:16,"&$disabled":{cursor:"default"}},labelPlacementStart:{flexDirection:"row-reverse",marginLeft:16,marginRight:-11},labelPlacementTop:{flexDirection:"column-reverse",marginLeft:16},labelPlacementBottom:{flexDirection:"column",marginLeft:16},disabled:{},label:{"&$disabled":{color:e.palette.text.disabled}}}}),{name:"MuiFormControlLabel"})(Fr);var Br=e.forwardRef((function(t,n){var i=t.children,l=t.classes,s=t.className,u=t.collapsedHeight,c=t.collapsedSize,d=void 0===c?"0px":c,f=t.component,p=void 0===f?"div":f,m=t.disableStrictModeCompat,h=void 0!==m&&m,y=t.in,b=t.onEnter,w=t.onEntered,S=t.onEntering,A=t.onExit,C=t.onExited,R=t.onExiting,T=t.style,N=t.timeout,O=void 0===N?g.p0.standard:N,M=t.TransitionComponent,L=void 0===M?v:M,z=(0,a.A)(t,["children","classes","className","collapsedHeight","collapsedSize","component","disableStrictModeCompat","in","onEnter","onEntered","onEntering","onExit","onExited","onExiting","style","timeout","TransitionComponent"]),_=x(),I=e.useRef(),D=e.useRef(null),F=e.useRef(),j="number"==typeof(u||d)?"".concat(u||d,"px"):u||d;e.useEffect((function(){return function(){clearTimeout(I.current)}}),[]);var B=_.unstable_strictMode&&!h,W=e.useRef(null),$=(0,k.A)(n,B?W:void 0),V=function(e){return function(t,n){if(e){var r=B?[W.current,t]:[t,n],a=(0,o.A)(r,2),i=a[0],l=a[1];void 0===l?e(i):e(i,l)}}},H=V((function(e,t){e.style.height=j,b&&b(e,t)})),U=V((function(e,t){var n=D.current?D.current.clientHeight:0,r=E({style:T,timeout:O},{mode:"enter"}).duration;if("auto"===O){var o=_.transitions.getAutoHeightDuration(n);e.style.transitionDuration="".concat(o,"ms"),F.current=o}else e.style.transitionDuration="string"==typeof r?r:"".concat(r,"ms");e.style.height="".concat(n,"px"),S&&S(e,t)})),q=V((function(e,t){e.style.height="auto",w&&w(e,t)})),K=V((function(e){var t=D.current?D.current.clientHeight:0;e.style.height="".concat(t,"px"),A&&A(e)})),X=V(C),Q=V((function(e){var t=D.current?D.current.clientHeight:0,n=E({style:T,timeout:O},{mode:"exit"}).duration;if("auto"===O){var r=_.transitions.getAutoHeightDuration(t);e.style.transitionDuration="".concat(r,"ms"),F.current=r}else e.style.transitionDuration="string"==typeof n?n:"".concat(n,"ms");e.style.height=j,R&&R(e)}));return e.createElement(L,(0,r.A)({in:y,onEnter:H,onEntered:q,onEntering:U,onExit:K,onExited:X,onExiting:Q,addEndListener:function(e,t){var n=B?e:t;"auto"===O&&(I.current=setTimeout(n,F.current||0))},nodeRef:B?W:void 0,timeout:"auto"===O?null:O},z),(function(t,n){return e.createElement(p,(0,r.A)({className:(0,P.A)(l.root,l.container,s,{entered:l.entered,exited:!y&&"0px"===j&&l.hidden}[t]),style:(0,r.A)({minHeight:j},T),ref:$},n),e.createElement("div",{className:l.wrapper,ref:D},e.createElement("div",{className:l.wrapperInner},i)))}))}));Br.muiSupportAuto=!0;const Wr=(0,T.A)((function(e){return{root:{height:0,overflow:"hidden",transition:e.transitions.create("height")},entered:{height:"auto",overflow:"visible"},hidden:{visibility:"hidden"},wrapper:{display:"flex"},wrapperInner:{width:"100%"}}}),{name:"MuiCollapse"})(Br);class $r extends e.Component{constructor(e){super(e),this.state={guestCanPause:this.props.guestCanPause,votesToSkip:this.props.votesToSkip,errorMsg:"",successMsg:""},this.handleRoomButtonPressed=this.handleRoomButtonPressed.bind(this),this.handleVotesChange=this.handleVotesChange.bind(this),this.handleGuestCanPauseChange=this.handleGuestCanPauseChange.bind(this),this.handleUpdateButtonPressed=this.handleUpdateButtonPressed.bind(this)}handleVotesChange(e){this.setState({votesToSkip:e.target.value})}handleGuestCanPauseChange(e){this.setState({guestCanPause:"true"===e.target.value})}handleRoomButtonPressed(){const e={method:"POST",headers:{"Content-Type":"application/json"},body:JSON.stringify({votes_to_skip:this.state.votesToSkip,guest_can_pause:this.state.guestCanPause})};fetch("/api/create-room",e).then((e=>e.json())).then((e=>this.props.history.push("/room/"+e.code)))}handleUpdateButtonPressed(){const e={method:"PATCH",headers:{"Content-Type":"application/json"},body:JSON.stringify({votes_to_skip:this.state.votesToSkip,guest_can_pause:this.state.guestCanPause,code:this.props.roomCode})};fetch("/api/update-room",e).then((e=>{e.ok?this.setState({successMsg:"Room updated successfully!"}):this.setState({errorMsg:"Error updating room..."}),this.props.updateCallback()}))}renderCreateButtons(){return e.createElement(W,{container:!0,spacing:1},e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(Zt,{color:"primary",variant:"contained",onClick:this.handleRoomButtonPressed},"Create A Room")),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(Zt,{color:"secondary",variant:"contained",to:"/",component:fr},"Back")))}renderUpdateButtons(){return e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(Zt,{color:"primary",variant:"contained",onClick:this.handleUpdateButtonPressed},"Update Room"))}render(){const t=this.props.update?"Update Room":"Create a Room";return e.createElement(W,{container:!0,spacing:1},e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(Wr,{in:""!=this.state.errorMsg||""!=this.state.successMsg},""!=this.state.successMsg?e.createElement(xn,{severity:"success",onClose:()=>{this.setState({successMsg:""})}},this.state.successMsg):e.createElement(xn,{severity:"error",onClose:()=>{this.setState({errorMsg:""})}},this.state.errorMsg))),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(q,{component:"h4",variant:"h4"},t)),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(ke,{component:"fieldset"},e.createElement(Ae,null,e.createElement("div",{align:"center"},"Guest Control of Playback State")),e.createElement(Dr,{row:!0,defaultValue:this.props.guestCanPause.toString(),onChange:this.handleGuestCanPauseChange},e.createElement(jr,{value:"true",control:e.createElement(Lr,{color:"primary"}),label:"Play/Pause",labelPlacement:"bottom"}),e.createElement(jr,{value:"false",control:e.createElement(Lr,{color:"secondary"}),label:"No Control",labelPlacement:"bottom"})))),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(ke,null,e.createElement(It,{required:!0,type:"number",onChange:this.handleVotesChange,defaultValue:this.state.votesToSkip,inputProps:{min:1,style:{textAlign:"center"}}}),e.createElement(Ae,null,e.createElement("div",{align:"center"},"Votes Required To Skip Song")))),this.props.update?this.renderUpdateButtons():this.renderCreateButtons())}}var Vr,Hr,Ur;Vr=$r,Ur={votesToSkip:2,guestCanPause:!0,update:!1,roomCode:null,updateCallback:()=>{}},(Hr=function(e){var t=function(e){if("object"!=typeof e||!e)return e;var t=e[Symbol.toPrimitive];if(void 0!==t){var n=t.call(e,"string");if("object"!=typeof n)return n;throw new TypeError("@@toPrimitive must return a primitive value.")}return String(e)}(e);return"symbol"==typeof t?t:t+""}(Hr="defaultProps"))in Vr?Object.defineProperty(Vr,Hr,{value:Ur,enumerable:!0,configurable:!0,writable:!0}):Vr[Hr]=Ur;var qr=n(2777);function Kr(e,t){var n={};return Object.keys(e).forEach((function(r){-1===t.indexOf(r)&&(n[r]=e[r])})),n}const Xr=function(e){var t=function(t){var n=e(t);return t.css?(0,r.A)({},(0,qr.A)(n,e((0,r.A)({theme:t.theme},t.css))),Kr(t.css,[e.filterProps])):t.sx?(0,r.A)({},(0,qr.A)(n,e((0,r.A)({theme:t.theme},t.sx))),Kr(t.sx,[e.filterProps])):n};return t.propTypes={},t.filterProps=["css","sx"].concat((0,Fe.A)(e.filterProps)),t},Qr=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];var r=function(e){return t.reduce((function(t,n){var r=n(e);return r?(0,qr.A)(t,r):t}),{})};return r.propTypes={},r.filterProps=t.reduce((function(e,t){return e.concat(t.filterProps)}),[]),r};var Yr=n(7969);function Gr(e,t){return t&&"string"==typeof t?t.split(".").reduce((function(e,t){return e&&e[t]?e[t]:null}),e):null}const Jr=function(e){var t=e.prop,n=e.cssProperty,r=void 0===n?e.prop:n,o=e.themeKey,a=e.transform,i=function(e){if(null==e[t])return null;var n=e[t],i=Gr(e.theme,o)||{};return(0,Yr.N)(e,n,(function(e){var t;return"function"==typeof i?t=i(e):Array.isArray(i)?t=i[e]||e:(t=Gr(i,e)||e,a&&(t=a(t))),!1===r?t:(0,de.A)({},r,t)}))};return i.propTypes={},i.filterProps=[t],i};function Zr(e){return"number"!=typeof e?e:"".concat(e,"px solid")}const eo=Qr(Jr({prop:"border",themeKey:"borders",transform:Zr}),Jr({prop:"borderTop",themeKey:"borders",transform:Zr}),Jr({prop:"borderRight",themeKey:"borders",transform:Zr}),Jr({prop:"borderBottom",themeKey:"borders",transform:Zr}),Jr({prop:"borderLeft",themeKey:"borders",transform:Zr}),Jr({prop:"borderColor",themeKey:"palette"}),Jr({prop:"borderRadius",themeKey:"shape"})),to=Qr(Jr({prop:"displayPrint",cssProperty:!1,transform:function(e){return{"@media print":{display:e}}}}),Jr({prop:"display"}),Jr({prop:"overflow"}),Jr({prop:"textOverflow"}),Jr({prop:"visibility"}),Jr({prop:"whiteSpace"})),no=Qr(Jr({prop:"flexBasis"}),Jr({prop:"flexDirection"}),Jr({prop:"flexWrap"}),Jr({prop:"justifyContent"}),Jr({prop:"alignItems"}),Jr({prop:"alignContent"}),Jr({prop:"order"}),Jr({prop:"flex"}),Jr({prop:"flexGrow"}),Jr({prop:"flexShrink"}),Jr({prop:"alignSelf"}),Jr({prop:"justifyItems"}),Jr({prop:"justifySelf"})),ro=Qr(Jr({prop:"gridGap"}),Jr({prop:"gridColumnGap"}),Jr({prop:"gridRowGap"}),Jr({prop:"gridColumn"}),Jr({prop:"gridRow"}),Jr({prop:"gridAutoFlow"}),Jr({prop:"gridAutoColumns"}),Jr({prop:"gridAutoRows"}),Jr({prop:"gridTemplateColumns"}),Jr({prop:"gridTemplateRows"}),Jr({prop:"gridTemplateAreas"}),Jr({prop:"gridArea"})),oo=Qr(Jr({prop:"position"}),Jr({prop:"zIndex",themeKey:"zIndex"}),Jr({prop:"top"}),Jr({prop:"right"}),Jr({prop:"bottom"}),Jr({prop:"left"})),ao=Qr(Jr({prop:"color",themeKey:"palette"}),Jr({prop:"bgcolor",cssProperty:"backgroundColor",themeKey:"palette"})),io=Jr({prop:"boxShadow",themeKey:"shadows"});function lo(e){return e<=1?"".concat(100*e,"%"):e}var so=Jr({prop:"width",transform:lo}),uo=Jr({prop:"maxWidth",transform:lo}),co=Jr({prop:"minWidth",transform:lo}),fo=Jr({prop:"height",transform:lo}),po=Jr({prop:"maxHeight",transform:lo}),mo=Jr({prop:"minHeight",transform:lo});Jr({prop:"size",cssProperty:"width",transform:lo}),Jr({prop:"size",cssProperty:"height",transform:lo});const ho=Qr(so,uo,co,fo,po,mo,Jr({prop:"boxSizing"}));var vo=n(6535);const go=Qr(Jr({prop:"fontFamily",themeKey:"typography"}),Jr({prop:"fontSize",themeKey:"typography"}),Jr({prop:"fontStyle",themeKey:"typography"}),Jr({prop:"fontWeight",themeKey:"typography"}),Jr({prop:"letterSpacing"}),Jr({prop:"lineHeight"}),Jr({prop:"textAlign"}));var yo=n(2611);var bo=Xr(Qr(eo,to,no,ro,oo,ao,io,ho,vo.A,go));const xo=function(t){var n=function(t){return function(n){var o,i=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},l=i.name,s=(0,a.A)(i,["name"]),u=l,c="function"==typeof n?function(e){return{root:function(t){return n((0,r.A)({theme:e},t))}}}:{root:n},d=(0,yo.A)(c,(0,r.A)({Component:t,name:l||t.displayName,classNamePrefix:u},s));n.filterProps&&(o=n.filterProps,delete n.filterProps),n.propTypes&&(n.propTypes,delete n.propTypes);var f=e.forwardRef((function(n,i){var l,s,u,c=n.children,f=n.className,p=n.clone,m=n.component,h=(0,a.A)(n,["children","className","clone","component"]),v=d(n),g=(0,P.A)(v.root,f),y=h;if(o&&(l=y,s=o,u={},Object.keys(l).forEach((function(e){-1===s.indexOf(e)&&(u[e]=l[e])})),y=u),p)return e.cloneElement(c,(0,r.A)({className:(0,P.A)(c.props.className,g)},y));if("function"==typeof c)return c((0,r.A)({className:g},y));var b=m||t;return e.createElement(b,(0,r.A)({ref:i,className:g},y),c)}));return $n()(f,t),f}}(t);return function(e,t){return n(e,(0,r.A)({defaultTheme:b.A},t))}}("div")(bo,{name:"MuiBox"});var wo=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.color,s=void 0===l?"primary":l,u=t.component,c=void 0===u?"a":u,d=t.onBlur,f=t.onFocus,p=t.TypographyClasses,m=t.underline,h=void 0===m?"hover":m,v=t.variant,g=void 0===v?"inherit":v,y=(0,a.A)(t,["classes","className","color","component","onBlur","onFocus","TypographyClasses","underline","variant"]),b=(0,Ft.A)(),x=b.isFocusVisible,w=b.onBlurVisible,E=b.ref,S=e.useState(!1),A=S[0],C=S[1],R=(0,k.A)(n,E);return e.createElement(q,(0,r.A)({className:(0,P.A)(o.root,o["underline".concat((0,V.A)(h))],i,A&&o.focusVisible,"button"===c&&o.button),classes:p,color:s,component:c,onBlur:function(e){A&&(w(),C(!1)),d&&d(e)},onFocus:function(e){x(e)&&C(!0),f&&f(e)},ref:R,variant:g},y))}));const Eo=(0,T.A)({root:{},underlineNone:{textDecoration:"none"},underlineHover:{textDecoration:"none","&:hover":{textDecoration:"underline"}},underlineAlways:{textDecoration:"underline"},button:{position:"relative",WebkitTapHighlightColor:"transparent",backgroundColor:"transparent",outline:0,border:0,margin:0,borderRadius:0,padding:0,cursor:"pointer",userSelect:"none",verticalAlign:"middle","-moz-appearance":"none","-webkit-appearance":"none","&::-moz-focus-inner":{borderStyle:"none"},"&$focusVisible":{outline:"auto"}},focusVisible:{}},{name:"MuiLink"})(wo);var ko=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.component,s=void 0===l?"div":l,u=t.disableGutters,c=void 0!==u&&u,d=t.fixed,f=void 0!==d&&d,p=t.maxWidth,m=void 0===p?"lg":p,h=(0,a.A)(t,["classes","className","component","disableGutters","fixed","maxWidth"]);return e.createElement(s,(0,r.A)({className:(0,P.A)(o.root,i,f&&o.fixed,c&&o.disableGutters,!1!==m&&o["maxWidth".concat((0,V.A)(String(m)))]),ref:n},h))}));const So=(0,T.A)((function(e){return{root:(0,de.A)({width:"100%",marginLeft:"auto",boxSizing:"border-box",marginRight:"auto",paddingLeft:e.spacing(2),paddingRight:e.spacing(2),display:"block"},e.breakpoints.up("sm"),{paddingLeft:e.spacing(3),paddingRight:e.spacing(3)}),disableGutters:{paddingLeft:0,paddingRight:0},fixed:Object.keys(e.breakpoints.values).reduce((function(t,n){var r=e.breakpoints.values[n];return 0!==r&&(t[e.breakpoints.up(n)]={maxWidth:r}),t}),{}),maxWidthXs:(0,de.A)({},e.breakpoints.up("xs"),{maxWidth:Math.max(e.breakpoints.values.xs,444)}),maxWidthSm:(0,de.A)({},e.breakpoints.up("sm"),{maxWidth:e.breakpoints.values.sm}),maxWidthMd:(0,de.A)({},e.breakpoints.up("md"),{maxWidth:e.breakpoints.values.md}),maxWidthLg:(0,de.A)({},e.breakpoints.up("lg"),{maxWidth:e.breakpoints.values.lg}),maxWidthXl:(0,de.A)({},e.breakpoints.up("xl"),{maxWidth:e.breakpoints.values.xl})}}),{name:"MuiContainer"})(ko);var Ao=n(2851),Co="undefined"!=typeof window&&"undefined"!=typeof document&&"undefined"!=typeof navigator,Ro=function(){for(var e=["Edge","Trident","Firefox"],t=0;t<e.length;t+=1)if(Co&&navigator.userAgent.indexOf(e[t])>=0)return 1;return 0}(),Po=Co&&window.Promise?function(e){var t=!1;return function(){t||(t=!0,window.Promise.resolve().then((function(){t=!1,e()})))}}:function(e){var t=!1;return function(){t||(t=!0,setTimeout((function(){t=!1,e()}),Ro))}};function To(e){return e&&"[object Function]"==={}.toString.call(e)}function No(e,t){if(1!==e.nodeType)return[];var n=e.ownerDocument.defaultView.getComputedStyle(e,null);return t?n[t]:n}function Oo(e){return"HTML"===e.nodeName?e:e.parentNode||e.host}function Mo(e){if(!e)return document.body;switch(e.nodeName){case"HTML":case"BODY":return e.ownerDocument.body;case"#document":return e.body}var t=No(e),n=t.overflow,r=t.overflowX,o=t.overflowY;return/(auto|scroll|overlay)/.test(n+o+r)?e:Mo(Oo(e))}function Lo(e){return e&&e.referenceNode?e.referenceNode:e}var zo=Co&&!(!window.MSInputMethodContext||!document.documentMode),_o=Co&&/MSIE 10/.test(navigator.userAgent);function Io(e){return 11===e?zo:10===e?_o:zo||_o}function Do(e){if(!e)return document.documentElement;for(var t=Io(10)?document.body:null,n=e.offsetParent||null;n===t&&e.nextElementSibling;)n=(e=e.nextElementSibling).offsetParent;var r=n&&n.nodeName;return r&&"BODY"!==r&&"HTML"!==r?-1!==["TH","TD","TABLE"].indexOf(n.nodeName)&&"static"===No(n,"position")?Do(n):n:e?e.ownerDocument.documentElement:document.documentElement}function Fo(e){return null!==e.parentNode?Fo(e.parentNode):e}function jo(e,t){if(!(e&&e.nodeType&&t&&t.nodeType))return document.documentElement;var n=e.compareDocumentPosition(t)&Node.DOCUMENT_POSITION_FOLLOWING,r=n?e:t,o=n?t:e,a=document.createRange();a.setStart(r,0),a.setEnd(o,0);var i,l,s=a.commonAncestorContainer;if(e!==s&&t!==s||r.contains(o))return"BODY"===(l=(i=s).nodeName)||"HTML"!==l&&Do(i.firstElementChild)!==i?Do(s):s;var u=Fo(e);return u.host?jo(u.host,t):jo(e,Fo(t).host)}function Bo(e){var t="top"===(arguments.length>1&&void 0!==arguments[1]?arguments[1]:"top")?"scrollTop":"scrollLeft",n=e.nodeName;if("BODY"===n||"HTML"===n){var r=e.ownerDocument.documentElement;return(e.ownerDocument.scrollingElement||r)[t]}return e[t]}function Wo(e,t){var n="x"===t?"Left":"Top",r="Left"===n?"Right":"Bottom";return parseFloat(e["border"+n+"Width"])+parseFloat(e["border"+r+"Width"])}function $o(e,t,n,r){return Math.max(t["offset"+e],t["scroll"+e],n["client"+e],n["offset"+e],n["scroll"+e],Io(10)?parseInt(n["offset"+e])+parseInt(r["margin"+("Height"===e?"Top":"Left")])+parseInt(r["margin"+("Height"===e?"Bottom":"Right")]):0)}function Vo(e){var t=e.body,n=e.documentElement,r=Io(10)&&getComputedStyle(n);return{height:$o("Height",t,n,r),width:$o("Width",t,n,r)}}var Ho=function(){function e(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}return function(t,n,r){return n&&e(t.prototype,n),r&&e(t,r),t}}(),Uo=function(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e},qo=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e};function Ko(e){return qo({},e,{right:e.left+e.width,bottom:e.top+e.height})}function Xo(e){var t={};try{if(Io(10)){t=e.getBoundingClientRect();var n=Bo(e,"top"),r=Bo(e,"left");t.top+=n,t.left+=r,t.bottom+=n,t.right+=r}else t=e.getBoundingClientRect()}catch(e){}var o={left:t.left,top:t.top,width:t.right-t.left,height:t.bottom-t.top},a="HTML"===e.nodeName?Vo(e.ownerDocument):{},i=a.width||e.clientWidth||o.width,l=a.height||e.clientHeight||o.height,s=e.offsetWidth-i,u=e.offsetHeight-l;if(s||u){var c=No(e);s-=Wo(c,"x"),u-=Wo(c,"y"),o.width-=s,o.height-=u}return Ko(o)}function Qo(e,t){var n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],r=Io(10),o="HTML"===t.nodeName,a=Xo(e),i=Xo(t),l=Mo(e),s=No(t),u=parseFloat(s.borderTopWidth),c=parseFloat(s.borderLeftWidth);n&&o&&(i.top=Math.max(i.top,0),i.left=Math.max(i.left,0));var d=Ko({top:a.top-i.top-u,left:a.left-i.left-c,width:a.width,height:a.height});if(d.marginTop=0,d.marginLeft=0,!r&&o){var f=parseFloat(s.marginTop),p=parseFloat(s.marginLeft);d.top-=u-f,d.bottom-=u-f,d.left-=c-p,d.right-=c-p,d.marginTop=f,d.marginLeft=p}return(r&&!n?t.contains(l):t===l&&"BODY"!==l.nodeName)&&(d=function(e,t){var n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],r=Bo(t,"top"),o=Bo(t,"left"),a=n?-1:1;return e.top+=r*a,e.bottom+=r*a,e.left+=o*a,e.right+=o*a,e}(d,t)),d}function Yo(e){var t=e.nodeName;if("BODY"===t||"HTML"===t)return!1;if("fixed"===No(e,"position"))return!0;var n=Oo(e);return!!n&&Yo(n)}function Go(e){if(!e||!e.parentElement||Io())return document.documentElement;for(var t=e.parentElement;t&&"none"===No(t,"transform");)t=t.parentElement;return t||document.documentElement}function Jo(e,t,n,r){var o=arguments.length>4&&void 0!==arguments[4]&&arguments[4],a={top:0,left:0},i=o?Go(e):jo(e,Lo(t));if("viewport"===r)a=function(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n=e.ownerDocument.documentElement,r=Qo(e,n),o=Math.max(n.clientWidth,window.innerWidth||0),a=Math.max(n.clientHeight,window.innerHeight||0),i=t?0:Bo(n),l=t?0:Bo(n,"left");return Ko({top:i-r.top+r.marginTop,left:l-r.left+r.marginLeft,width:o,height:a})}(i,o);else{var l=void 0;"scrollParent"===r?"BODY"===(l=Mo(Oo(t))).nodeName&&(l=e.ownerDocument.documentElement):l="window"===r?e.ownerDocument.documentElement:r;var s=Qo(l,i,o);if("HTML"!==l.nodeName||Yo(i))a=s;else{var u=Vo(e.ownerDocument),c=u.height,d=u.width;a.top+=s.top-s.marginTop,a.bottom=c+s.top,a.left+=s.left-s.marginLeft,a.right=d+s.left}}var f="number"==typeof(n=n||0);return a.left+=f?n:n.left||0,a.top+=f?n:n.top||0,a.right-=f?n:n.right||0,a.bottom-=f?n:n.bottom||0,a}function Zo(e){return e.width*e.height}function ea(e,t,n,r,o){var a=arguments.length>5&&void 0!==arguments[5]?arguments[5]:0;if(-1===e.indexOf("auto"))return e;var i=Jo(n,r,a,o),l={top:{width:i.width,height:t.top-i.top},right:{width:i.right-t.right,height:i.height},bottom:{width:i.width,height:i.bottom-t.bottom},left:{width:t.left-i.left,height:i.height}},s=Object.keys(l).map((function(e){return qo({key:e},l[e],{area:Zo(l[e])})})).sort((function(e,t){return t.area-e.area})),u=s.filter((function(e){var t=e.width,r=e.height;return t>=n.clientWidth&&r>=n.clientHeight})),c=u.length>0?u[0].key:s[0].key,d=e.split("-")[1];return c+(d?"-"+d:"")}function ta(e,t,n){var r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:null;return Qo(n,r?Go(t):jo(t,Lo(n)),r)}function na(e){var t=e.ownerDocument.defaultView.getComputedStyle(e),n=parseFloat(t.marginTop||0)+parseFloat(t.marginBottom||0),r=parseFloat(t.marginLeft||0)+parseFloat(t.marginRight||0);return{width:e.offsetWidth+r,height:e.offsetHeight+n}}function ra(e){var t={left:"right",right:"left",bottom:"top",top:"bottom"};return e.replace(/left|right|bottom|top/g,(function(e){return t[e]}))}function oa(e,t,n){n=n.split("-")[0];var r=na(e),o={width:r.width,height:r.height},a=-1!==["right","left"].indexOf(n),i=a?"top":"left",l=a?"left":"top",s=a?"height":"width",u=a?"width":"height";return o[i]=t[i]+t[s]/2-r[s]/2,o[l]=n===l?t[l]-r[u]:t[ra(l)],o}function aa(e,t){return Array.prototype.find?e.find(t):e.filter(t)[0]}function ia(e,t,n){return(void 0===n?e:e.slice(0,function(e,t,n){if(Array.prototype.findIndex)return e.findIndex((function(e){return e[t]===n}));var r=aa(e,(function(e){return e[t]===n}));return e.indexOf(r)}(e,"name",n))).forEach((function(e){e.function&&console.warn("`modifier.function` is deprecated, use `modifier.fn`!");var n=e.function||e.fn;e.enabled&&To(n)&&(t.offsets.popper=Ko(t.offsets.popper),t.offsets.reference=Ko(t.offsets.reference),t=n(t,e))})),t}function la(){if(!this.state.isDestroyed){var e={instance:this,styles:{},arrowStyles:{},attributes:{},flipped:!1,offsets:{}};e.offsets.reference=ta(this.state,this.popper,this.reference,this.options.positionFixed),e.placement=ea(this.options.placement,e.offsets.reference,this.popper,this.reference,this.options.modifiers.flip.boundariesElement,this.options.modifiers.flip.padding),e.originalPlacement=e.placement,e.positionFixed=this.options.positionFixed,e.offsets.popper=oa(this.popper,e.offsets.reference,e.placement),e.offsets.popper.position=this.options.positionFixed?"fixed":"absolute",e=ia(this.modifiers,e),this.state.isCreated?this.options.onUpdate(e):(this.state.isCreated=!0,this.options.onCreate(e))}}function sa(e,t){return e.some((function(e){var n=e.name;return e.enabled&&n===t}))}function ua(e){for(var t=[!1,"ms","Webkit","Moz","O"],n=e.charAt(0).toUpperCase()+e.slice(1),r=0;r<t.length;r++){var o=t[r],a=o?""+o+n:e;if(void 0!==document.body.style[a])return a}return null}function ca(){return this.state.isDestroyed=!0,sa(this.modifiers,"applyStyle")&&(this.popper.removeAttribute("x-placement"),this.popper.style.position="",this.popper.style.top="",this.popper.style.left="",this.popper.style.right="",this.popper.style.bottom="",this.popper.style.willChange="",this.popper.style[ua("transform")]=""),this.disableEventListeners(),this.options.removeOnDestroy&&this.popper.parentNode.removeChild(this.popper),this}function da(e){var t=e.ownerDocument;return t?t.defaultView:window}function fa(e,t,n,r){var o="BODY"===e.nodeName,a=o?e.ownerDocument.defaultView:e;a.addEventListener(t,n,{passive:!0}),o||fa(Mo(a.parentNode),t,n,r),r.push(a)}function pa(e,t,n,r){n.updateBound=r,da(e).addEventListener("resize",n.updateBound,{passive:!0});var o=Mo(e);return fa(o,"scroll",n.updateBound,n.scrollParents),n.scrollElement=o,n.eventsEnabled=!0,n}function ma(){this.state.eventsEnabled||(this.state=pa(this.reference,this.options,this.state,this.scheduleUpdate))}function ha(){var e,t;this.state.eventsEnabled&&(cancelAnimationFrame(this.scheduleUpdate),this.state=(e=this.reference,t=this.state,da(e).removeEventListener("resize",t.updateBound),t.scrollParents.forEach((function(e){e.removeEventListener("scroll",t.updateBound)})),t.updateBound=null,t.scrollParents=[],t.scrollElement=null,t.eventsEnabled=!1,t))}function va(e){return""!==e&&!isNaN(parseFloat(e))&&isFinite(e)}function ga(e,t){Object.keys(t).forEach((function(n){var r="";-1!==["width","height","top","right","bottom","left"].indexOf(n)&&va(t[n])&&(r="px"),e.style[n]=t[n]+r}))}var ya=Co&&/Firefox/i.test(navigator.userAgent);function ba(e,t,n){var r=aa(e,(function(e){return e.name===t})),o=!!r&&e.some((function(e){return e.name===n&&e.enabled&&e.order<r.order}));if(!o){var a="`"+t+"`",i="`"+n+"`";console.warn(i+" modifier is required by "+a+" modifier in order to work, be sure to include it before "+a+"!")}return o}var xa=["auto-start","auto","auto-end","top-start","top","top-end","right-start","right","right-end","bottom-end","bottom","bottom-start","left-end","left","left-start"],wa=xa.slice(3);function Ea(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n=wa.indexOf(e),r=wa.slice(n+1).concat(wa.slice(0,n));return t?r.reverse():r}var ka={shift:{order:100,enabled:!0,fn:function(e){var t=e.placement,n=t.split("-")[0],r=t.split("-")[1];if(r){var o=e.offsets,a=o.reference,i=o.popper,l=-1!==["bottom","top"].indexOf(n),s=l?"left":"top",u=l?"width":"height",c={start:Uo({},s,a[s]),end:Uo({},s,a[s]+a[u]-i[u])};e.offsets.popper=qo({},i,c[r])}return e}},offset:{order:200,enabled:!0,fn:function(e,t){var n,r=t.offset,o=e.placement,a=e.offsets,i=a.popper,l=a.reference,s=o.split("-")[0];return n=va(+r)?[+r,0]:function(e,t,n,r){var o=[0,0],a=-1!==["right","left"].indexOf(r),i=e.split(/(\+|\-)/).map((function(e){return e.trim()})),l=i.indexOf(aa(i,(function(e){return-1!==e.search(/,|\s/)})));i[l]&&-1===i[l].indexOf(",")&&console.warn("Offsets separated by white space(s) are deprecated, use a comma (,) instead.");var s=/\s*,\s*|\s+/,u=-1!==l?[i.slice(0,l).concat([i[l].split(s)[0]]),[i[l].split(s)[1]].concat(i.slice(l+1))]:[i];return(u=u.map((function(e,r){var o=(1===r?!a:a)?"height":"width",i=!1;return e.reduce((function(e,t){return""===e[e.length-1]&&-1!==["+","-"].indexOf(t)?(e[e.length-1]=t,i=!0,e):i?(e[e.length-1]+=t,i=!1,e):e.concat(t)}),[]).map((function(e){return function(e,t,n,r){var o=e.match(/((?:\-|\+)?\d*\.?\d*)(.*)/),a=+o[1],i=o[2];return a?0===i.indexOf("%")?Ko("%p"===i?n:r)[t]/100*a:"vh"===i||"vw"===i?("vh"===i?Math.max(document.documentElement.clientHeight,window.innerHeight||0):Math.max(document.documentElement.clientWidth,window.innerWidth||0))/100*a:a:e}(e,o,t,n)}))}))).forEach((function(e,t){e.forEach((function(n,r){va(n)&&(o[t]+=n*("-"===e[r-1]?-1:1))}))})),o}(r,i,l,s),"left"===s?(i.top+=n[0],i.left-=n[1]):"right"===s?(i.top+=n[0],i.left+=n[1]):"top"===s?(i.left+=n[0],i.top-=n[1]):"bottom"===s&&(i.left+=n[0],i.top+=n[1]),e.popper=i,e},offset:0},preventOverflow:{order:300,enabled:!0,fn:function(e,t){var n=t.boundariesElement||Do(e.instance.popper);e.instance.reference===n&&(n=Do(n));var r=ua("transform"),o=e.instance.popper.style,a=o.top,i=o.left,l=o[r];o.top="",o.left="",o[r]="";var s=Jo(e.instance.popper,e.instance.reference,t.padding,n,e.positionFixed);o.top=a,o.left=i,o[r]=l,t.boundaries=s;var u=t.priority,c=e.offsets.popper,d={primary:function(e){var n=c[e];return c[e]<s[e]&&!t.escapeWithReference&&(n=Math.max(c[e],s[e])),Uo({},e,n)},secondary:function(e){var n="right"===e?"left":"top",r=c[n];return c[e]>s[e]&&!t.escapeWithReference&&(r=Math.min(c[n],s[e]-("right"===e?c.width:c.height))),Uo({},n,r)}};return u.forEach((function(e){var t=-1!==["left","top"].indexOf(e)?"primary":"secondary";c=qo({},c,d[t](e))})),e.offsets.popper=c,e},priority:["left","right","top","bottom"],padding:5,boundariesElement:"scrollParent"},keepTogether:{order:400,enabled:!0,fn:function(e){var t=e.offsets,n=t.popper,r=t.reference,o=e.placement.split("-")[0],a=Math.floor,i=-1!==["top","bottom"].indexOf(o),l=i?"right":"bottom",s=i?"left":"top",u=i?"width":"height";return n[l]<a(r[s])&&(e.offsets.popper[s]=a(r[s])-n[u]),n[s]>a(r[l])&&(e.offsets.popper[s]=a(r[l])),e}},arrow:{order:500,enabled:!0,fn:function(e,t){var n;if(!ba(e.instance.modifiers,"arrow","keepTogether"))return e;var r=t.element;if("string"==typeof r){if(!(r=e.instance.popper.querySelector(r)))return e}else if(!e.instance.popper.contains(r))return console.warn("WARNING: `arrow.element` must be child of its popper element!"),e;var o=e.placement.split("-")[0],a=e.offsets,i=a.popper,l=a.reference,s=-1!==["left","right"].indexOf(o),u=s?"height":"width",c=s?"Top":"Left",d=c.toLowerCase(),f=s?"left":"top",p=s?"bottom":"right",m=na(r)[u];l[p]-m<i[d]&&(e.offsets.popper[d]-=i[d]-(l[p]-m)),l[d]+m>i[p]&&(e.offsets.popper[d]+=l[d]+m-i[p]),e.offsets.popper=Ko(e.offsets.popper);var h=l[d]+l[u]/2-m/2,v=No(e.instance.popper),g=parseFloat(v["margin"+c]),y=parseFloat(v["border"+c+"Width"]),b=h-e.offsets.popper[d]-g-y;return b=Math.max(Math.min(i[u]-m,b),0),e.arrowElement=r,e.offsets.arrow=(Uo(n={},d,Math.round(b)),Uo(n,f,""),n),e},element:"[x-arrow]"},flip:{order:600,enabled:!0,fn:function(e,t){if(sa(e.instance.modifiers,"inner"))return e;if(e.flipped&&e.placement===e.originalPlacement)return e;var n=Jo(e.instance.popper,e.instance.reference,t.padding,t.boundariesElement,e.positionFixed),r=e.placement.split("-")[0],o=ra(r),a=e.placement.split("-")[1]||"",i=[];switch(t.behavior){case"flip":i=[r,o];break;case"clockwise":i=Ea(r);break;case"counterclockwise":i=Ea(r,!0);break;default:i=t.behavior}return i.forEach((function(l,s){if(r!==l||i.length===s+1)return e;r=e.placement.split("-")[0],o=ra(r);var u=e.offsets.popper,c=e.offsets.reference,d=Math.floor,f="left"===r&&d(u.right)>d(c.left)||"right"===r&&d(u.left)<d(c.right)||"top"===r&&d(u.bottom)>d(c.top)||"bottom"===r&&d(u.top)<d(c.bottom),p=d(u.left)<d(n.left),m=d(u.right)>d(n.right),h=d(u.top)<d(n.top),v=d(u.bottom)>d(n.bottom),g="left"===r&&p||"right"===r&&m||"top"===r&&h||"bottom"===r&&v,y=-1!==["top","bottom"].indexOf(r),b=!!t.flipVariations&&(y&&"start"===a&&p||y&&"end"===a&&m||!y&&"start"===a&&h||!y&&"end"===a&&v),x=!!t.flipVariationsByContent&&(y&&"start"===a&&m||y&&"end"===a&&p||!y&&"start"===a&&v||!y&&"end"===a&&h),w=b||x;(f||g||w)&&(e.flipped=!0,(f||g)&&(r=i[s+1]),w&&(a=function(e){return"end"===e?"start":"start"===e?"end":e}(a)),e.placement=r+(a?"-"+a:""),e.offsets.popper=qo({},e.offsets.popper,oa(e.instance.popper,e.offsets.reference,e.placement)),e=ia(e.instance.modifiers,e,"flip"))})),e},behavior:"flip",padding:5,boundariesElement:"viewport",flipVariations:!1,flipVariationsByContent:!1},inner:{order:700,enabled:!1,fn:function(e){var t=e.placement,n=t.split("-")[0],r=e.offsets,o=r.popper,a=r.reference,i=-1!==["left","right"].indexOf(n),l=-1===["top","left"].indexOf(n);return o[i?"left":"top"]=a[n]-(l?o[i?"width":"height"]:0),e.placement=ra(t),e.offsets.popper=Ko(o),e}},hide:{order:800,enabled:!0,fn:function(e){if(!ba(e.instance.modifiers,"hide","preventOverflow"))return e;var t=e.offsets.reference,n=aa(e.instance.modifiers,(function(e){return"preventOverflow"===e.name})).boundaries;if(t.bottom<n.top||t.left>n.right||t.top>n.bottom||t.right<n.left){if(!0===e.hide)return e;e.hide=!0,e.attributes["x-out-of-boundaries"]=""}else{if(!1===e.hide)return e;e.hide=!1,e.attributes["x-out-of-boundaries"]=!1}return e}},computeStyle:{order:850,enabled:!0,fn:function(e,t){var n=t.x,r=t.y,o=e.offsets.popper,a=aa(e.instance.modifiers,(function(e){return"applyStyle"===e.name})).gpuAcceleration;void 0!==a&&console.warn("WARNING: `gpuAcceleration` option moved to `computeStyle` modifier and will not be supported in future versions of Popper.js!");var i,l,s=void 0!==a?a:t.gpuAcceleration,u=Do(e.instance.popper),c=Xo(u),d={position:o.position},f=function(e,t){var n=e.offsets,r=n.popper,o=n.reference,a=Math.round,i=Math.floor,l=function(e){return e},s=a(o.width),u=a(r.width),c=-1!==["left","right"].indexOf(e.placement),d=-1!==e.placement.indexOf("-"),f=t?c||d||s%2==u%2?a:i:l,p=t?a:l;return{left:f(s%2==1&&u%2==1&&!d&&t?r.left-1:r.left),top:p(r.top),bottom:p(r.bottom),right:f(r.right)}}(e,window.devicePixelRatio<2||!ya),p="bottom"===n?"top":"bottom",m="right"===r?"left":"right",h=ua("transform");if(l="bottom"===p?"HTML"===u.nodeName?-u.clientHeight+f.bottom:-c.height+f.bottom:f.top,i="right"===m?"HTML"===u.nodeName?-u.clientWidth+f.right:-c.width+f.right:f.left,s&&h)d[h]="translate3d("+i+"px, "+l+"px, 0)",d[p]=0,d[m]=0,d.willChange="transform";else{var v="bottom"===p?-1:1,g="right"===m?-1:1;d[p]=l*v,d[m]=i*g,d.willChange=p+", "+m}var y={"x-placement":e.placement};return e.attributes=qo({},y,e.attributes),e.styles=qo({},d,e.styles),e.arrowStyles=qo({},e.offsets.arrow,e.arrowStyles),e},gpuAcceleration:!0,x:"bottom",y:"right"},applyStyle:{order:900,enabled:!0,fn:function(e){var t,n;return ga(e.instance.popper,e.styles),t=e.instance.popper,n=e.attributes,Object.keys(n).forEach((function(e){!1!==n[e]?t.setAttribute(e,n[e]):t.removeAttribute(e)})),e.arrowElement&&Object.keys(e.arrowStyles).length&&ga(e.arrowElement,e.arrowStyles),e},onLoad:function(e,t,n,r,o){var a=ta(o,t,e,n.positionFixed),i=ea(n.placement,a,t,e,n.modifiers.flip.boundariesElement,n.modifiers.flip.padding);return t.setAttribute("x-placement",i),ga(t,{position:n.positionFixed?"fixed":"absolute"}),n},gpuAcceleration:void 0}},Sa={placement:"bottom",positionFixed:!1,eventsEnabled:!0,removeOnDestroy:!1,onCreate:function(){},onUpdate:function(){},modifiers:ka},Aa=function(){function e(t,n){var r=this,o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.scheduleUpdate=function(){return requestAnimationFrame(r.update)},this.update=Po(this.update.bind(this)),this.options=qo({},e.Defaults,o),this.state={isDestroyed:!1,isCreated:!1,scrollParents:[]},this.reference=t&&t.jquery?t[0]:t,this.popper=n&&n.jquery?n[0]:n,this.options.modifiers={},Object.keys(qo({},e.Defaults.modifiers,o.modifiers)).forEach((function(t){r.options.modifiers[t]=qo({},e.Defaults.modifiers[t]||{},o.modifiers?o.modifiers[t]:{})})),this.modifiers=Object.keys(this.options.modifiers).map((function(e){return qo({name:e},r.options.modifiers[e])})).sort((function(e,t){return e.order-t.order})),this.modifiers.forEach((function(e){e.enabled&&To(e.onLoad)&&e.onLoad(r.reference,r.popper,r.options,e,r.state)})),this.update();var a=this.options.eventsEnabled;a&&this.enableEventListeners(),this.state.eventsEnabled=a}return Ho(e,[{key:"update",value:function(){return la.call(this)}},{key:"destroy",value:function(){return ca.call(this)}},{key:"enableEventListeners",value:function(){return ma.call(this)}},{key:"disableEventListeners",value:function(){return ha.call(this)}}]),e}();Aa.Utils=("undefined"!=typeof window?window:n.g).PopperUtils,Aa.placements=xa,Aa.Defaults=Sa;const Ca=Aa;function Ra(e){return"function"==typeof e?e():e}var Pa="undefined"!=typeof window?e.useLayoutEffect:e.useEffect,Ta={},Na=e.forwardRef((function(t,n){var o=t.anchorEl,i=t.children,l=t.container,s=t.disablePortal,u=void 0!==s&&s,c=t.keepMounted,d=void 0!==c&&c,f=t.modifiers,p=t.open,m=t.placement,h=void 0===m?"bottom":m,v=t.popperOptions,g=void 0===v?Ta:v,b=t.popperRef,x=t.style,w=t.transition,E=void 0!==w&&w,S=(0,a.A)(t,["anchorEl","children","container","disablePortal","keepMounted","modifiers","open","placement","popperOptions","popperRef","style","transition"]),A=e.useRef(null),C=(0,k.A)(A,n),R=e.useRef(null),P=(0,k.A)(R,b),T=e.useRef(P);Pa((function(){T.current=P}),[P]),e.useImperativeHandle(b,(function(){return R.current}),[]);var N=e.useState(!0),O=N[0],M=N[1],L=function(e,t){if("ltr"===(t&&t.direction||"ltr"))return e;switch(e){case"bottom-end":return"bottom-start";case"bottom-start":return"bottom-end";case"top-end":return"top-start";case"top-start":return"top-end";default:return e}}(h,(0,y.A)()),z=e.useState(L),_=z[0],I=z[1];e.useEffect((function(){R.current&&R.current.update()}));var D=e.useCallback((function(){if(A.current&&o&&p){R.current&&(R.current.destroy(),T.current(null));var e=function(e){I(e.placement)},t=(Ra(o),new Ca(Ra(o),A.current,(0,r.A)({placement:L},g,{modifiers:(0,r.A)({},u?{}:{preventOverflow:{boundariesElement:"window"}},f,g.modifiers),onCreate:(0,Ne.A)(e,g.onCreate),onUpdate:(0,Ne.A)(e,g.onUpdate)})));T.current(t)}}),[o,u,f,p,L,g]),F=e.useCallback((function(e){(0,Me.A)(C,e),D()}),[C,D]),j=function(){R.current&&(R.current.destroy(),T.current(null))};if(e.useEffect((function(){return function(){j()}}),[]),e.useEffect((function(){p||E||j()}),[p,E]),!d&&!p&&(!E||O))return null;var B={placement:_};return E&&(B.TransitionProps={in:p,onEnter:function(){M(!1)},onExited:function(){M(!0),j()}}),e.createElement(ze,{disablePortal:u,container:l},e.createElement("div",(0,r.A)({ref:F,role:"tooltip"},S,{style:(0,r.A)({position:"fixed",top:0,left:0,display:p||!d||E?null:"none"},x)}),"function"==typeof i?i(B):i))}));const Oa=Na;function Ma(e){return Math.round(1e5*e)/1e5}var La=!1,za=null,_a=e.forwardRef((function(n,i){var l=n.arrow,s=void 0!==l&&l,u=n.children,c=n.classes,d=n.disableFocusListener,f=void 0!==d&&d,p=n.disableHoverListener,m=void 0!==p&&p,h=n.disableTouchListener,v=void 0!==h&&h,g=n.enterDelay,y=void 0===g?100:g,b=n.enterNextDelay,w=void 0===b?0:b,E=n.enterTouchDelay,S=void 0===E?700:E,A=n.id,C=n.interactive,R=void 0!==C&&C,T=n.leaveDelay,N=void 0===T?0:T,O=n.leaveTouchDelay,M=void 0===O?1500:O,L=n.onClose,z=n.onOpen,_=n.open,I=n.placement,D=void 0===I?"bottom":I,F=n.PopperComponent,j=void 0===F?Oa:F,B=n.PopperProps,W=n.title,$=n.TransitionComponent,H=void 0===$?Ze:$,U=n.TransitionProps,q=(0,a.A)(n,["arrow","children","classes","disableFocusListener","disableHoverListener","disableTouchListener","enterDelay","enterNextDelay","enterTouchDelay","id","interactive","leaveDelay","leaveTouchDelay","onClose","onOpen","open","placement","PopperComponent","PopperProps","title","TransitionComponent","TransitionProps"]),K=x(),X=e.useState(),Q=X[0],Y=X[1],G=e.useState(null),J=G[0],Z=G[1],ee=e.useRef(!1),te=e.useRef(),ne=e.useRef(),re=e.useRef(),oe=e.useRef(),ae=(0,bt.A)({controlled:_,default:!1,name:"Tooltip",state:"open"}),ie=(0,o.A)(ae,2),le=ie[0],se=ie[1],ue=le,ce=(0,Ir.A)(A);e.useEffect((function(){return function(){clearTimeout(te.current),clearTimeout(ne.current),clearTimeout(re.current),clearTimeout(oe.current)}}),[]);var de=function(e){clearTimeout(za),La=!0,se(!0),z&&z(e)},fe=function(){var e=!(arguments.length>0&&void 0!==arguments[0])||arguments[0];return function(t){var n=u.props;"mouseover"===t.type&&n.onMouseOver&&e&&n.onMouseOver(t),ee.current&&"touchstart"!==t.type||(Q&&Q.removeAttribute("title"),clearTimeout(ne.current),clearTimeout(re.current),y||La&&w?(t.persist(),ne.current=setTimeout((function(){de(t)}),La?w:y)):de(t))}},pe=(0,Ft.A)(),me=pe.isFocusVisible,he=pe.onBlurVisible,ve=pe.ref,ge=e.useState(!1),ye=ge[0],be=ge[1],xe=function(){var e=!(arguments.length>0&&void 0!==arguments[0])||arguments[0];return function(t){Q||Y(t.currentTarget),me(t)&&(be(!0),fe()(t));var n=u.props;n.onFocus&&e&&n.onFocus(t)}},we=function(e){clearTimeout(za),za=setTimeout((function(){La=!1}),800+N),se(!1),L&&L(e),clearTimeout(te.current),te.current=setTimeout((function(){ee.current=!1}),K.transitions.duration.shortest)},Ee=function(){var e=!(arguments.length>0&&void 0!==arguments[0])||arguments[0];return function(t){var n=u.props;"blur"===t.type&&(n.onBlur&&e&&n.onBlur(t),ye&&(be(!1),he())),"mouseleave"===t.type&&n.onMouseLeave&&t.currentTarget===Q&&n.onMouseLeave(t),clearTimeout(ne.current),clearTimeout(re.current),t.persist(),re.current=setTimeout((function(){we(t)}),N)}},ke=function(e){ee.current=!0;var t=u.props;t.onTouchStart&&t.onTouchStart(e)},Se=(0,k.A)(Y,i),Ae=(0,k.A)(ve,Se),Ce=e.useCallback((function(e){(0,Me.A)(Ae,t.findDOMNode(e))}),[Ae]),Re=(0,k.A)(u.ref,Ce);""===W&&(ue=!1);var Pe=!ue&&!m,Te=(0,r.A)({"aria-describedby":ue?ce:null,title:Pe&&"string"==typeof W?W:null},q,u.props,{className:(0,P.A)(q.className,u.props.className),onTouchStart:ke,ref:Re}),Ne={};v||(Te.onTouchStart=function(e){ke(e),clearTimeout(re.current),clearTimeout(te.current),clearTimeout(oe.current),e.persist(),oe.current=setTimeout((function(){fe()(e)}),S)},Te.onTouchEnd=function(e){u.props.onTouchEnd&&u.props.onTouchEnd(e),clearTimeout(oe.current),clearTimeout(re.current),e.persist(),re.current=setTimeout((function(){we(e)}),M)}),m||(Te.onMouseOver=fe(),Te.onMouseLeave=Ee(),R&&(Ne.onMouseOver=fe(!1),Ne.onMouseLeave=Ee(!1))),f||(Te.onFocus=xe(),Te.onBlur=Ee(),R&&(Ne.onFocus=xe(!1),Ne.onBlur=Ee(!1)));var Oe=e.useMemo((function(){return(0,Ao.A)({popperOptions:{modifiers:{arrow:{enabled:Boolean(J),element:J}}}},B)}),[J,B]);return e.createElement(e.Fragment,null,e.cloneElement(u,Te),e.createElement(j,(0,r.A)({className:(0,P.A)(c.popper,R&&c.popperInteractive,s&&c.popperArrow),placement:D,anchorEl:Q,open:!!Q&&ue,id:Te["aria-describedby"],transition:!0},Ne,Oe),(function(t){var n=t.placement,o=t.TransitionProps;return e.createElement(H,(0,r.A)({timeout:K.transitions.duration.shorter},o,U),e.createElement("div",{className:(0,P.A)(c.tooltip,c["tooltipPlacement".concat((0,V.A)(n.split("-")[0]))],ee.current&&c.touch,s&&c.tooltipArrow)},W,s?e.createElement("span",{className:c.arrow,ref:Z}):null))})))}));const Ia=(0,T.A)((function(e){return{popper:{zIndex:e.zIndex.tooltip,pointerEvents:"none"},popperInteractive:{pointerEvents:"auto"},popperArrow:{'&[x-placement*="bottom"] $arrow':{top:0,left:0,marginTop:"-0.71em",marginLeft:4,marginRight:4,"&::before":{transformOrigin:"0 100%"}},'&[x-placement*="top"] $arrow':{bottom:0,left:0,marginBottom:"-0.71em",marginLeft:4,marginRight:4,"&::before":{transformOrigin:"100% 0"}},'&[x-placement*="right"] $arrow':{left:0,marginLeft:"-0.71em",height:"1em",width:"0.71em",marginTop:4,marginBottom:4,"&::before":{transformOrigin:"100% 100%"}},'&[x-placement*="left"] $arrow':{right:0,marginRight:"-0.71em",height:"1em",width:"0.71em",marginTop:4,marginBottom:4,"&::before":{transformOrigin:"0 0"}}},tooltip:{backgroundColor:(0,Dt.X4)(e.palette.grey[700],.9),borderRadius:e.shape.borderRadius,color:e.palette.common.white,fontFamily:e.typography.fontFamily,padding:"4px 8px",fontSize:e.typography.pxToRem(10),lineHeight:"".concat(Ma(1.4),"em"),maxWidth:300,wordWrap:"break-word",fontWeight:e.typography.fontWeightMedium},tooltipArrow:{position:"relative",margin:"0"},arrow:{overflow:"hidden",position:"absolute",width:"1em",height:"0.71em",boxSizing:"border-box",color:(0,Dt.X4)(e.palette.grey[700],.9),"&::before":{content:'""',margin:"auto",display:"block",width:"100%",height:"100%",backgroundColor:"currentColor",transform:"rotate(45deg)"}},touch:{padding:"8px 16px",fontSize:e.typography.pxToRem(14),lineHeight:"".concat(Ma(16/14),"em"),fontWeight:e.typography.fontWeightRegular},tooltipPlacementLeft:(0,de.A)({transformOrigin:"right center",margin:"0 24px "},e.breakpoints.up("sm"),{margin:"0 14px"}),tooltipPlacementRight:(0,de.A)({transformOrigin:"left center",margin:"0 24px"},e.breakpoints.up("sm"),{margin:"0 14px"}),tooltipPlacementTop:(0,de.A)({transformOrigin:"center bottom",margin:"24px 0"},e.breakpoints.up("sm"),{margin:"14px 0"}),tooltipPlacementBottom:(0,de.A)({transformOrigin:"center top",margin:"24px 0"},e.breakpoints.up("sm"),{margin:"14px 0"})}}),{name:"MuiTooltip",flip:!1})(_a),Da=(0,kt.A)(e.createElement("path",{d:"M12 2C6.47 2 2 6.47 2 12s4.47 10 10 10 10-4.47 10-10S17.53 2 12 2zm5 13.59L15.59 17 12 13.41 8.41 17 7 15.59 10.59 12 7 8.41 8.41 7 12 10.59 15.59 7 17 8.41 13.41 12 17 15.59z"}),"Cancel");function Fa(e){return"Backspace"===e.key||"Delete"===e.key}var ja=e.forwardRef((function(t,n){var o=t.avatar,i=t.classes,l=t.className,s=t.clickable,u=t.color,c=void 0===u?"default":u,d=t.component,f=t.deleteIcon,p=t.disabled,m=void 0!==p&&p,h=t.icon,v=t.label,g=t.onClick,y=t.onDelete,b=t.onKeyDown,x=t.onKeyUp,w=t.size,E=void 0===w?"medium":w,S=t.variant,A=void 0===S?"default":S,C=(0,a.A)(t,["avatar","classes","className","clickable","color","component","deleteIcon","disabled","icon","label","onClick","onDelete","onKeyDown","onKeyUp","size","variant"]),R=e.useRef(null),T=(0,k.A)(R,n),N=function(e){e.stopPropagation(),y&&y(e)},O=!(!1===s||!g)||s,M="small"===E,L=d||(O?Gt:"div"),z=L===Gt?{component:"div"}:{},_=null;if(y){var I=(0,P.A)("default"!==c&&("default"===A?i["deleteIconColor".concat((0,V.A)(c))]:i["deleteIconOutlinedColor".concat((0,V.A)(c))]),M&&i.deleteIconSmall);_=f&&e.isValidElement(f)?e.cloneElement(f,{className:(0,P.A)(f.props.className,i.deleteIcon,I),onClick:N}):e.createElement(Da,{className:(0,P.A)(i.deleteIcon,I),onClick:N})}var D=null;o&&e.isValidElement(o)&&(D=e.cloneElement(o,{className:(0,P.A)(i.avatar,o.props.className,M&&i.avatarSmall,"default"!==c&&i["avatarColor".concat((0,V.A)(c))])}));var F=null;return h&&e.isValidElement(h)&&(F=e.cloneElement(h,{className:(0,P.A)(i.icon,h.props.className,M&&i.iconSmall,"default"!==c&&i["iconColor".concat((0,V.A)(c))])})),e.createElement(L,(0,r.A)({role:O||y?"button":void 0,className:(0,P.A)(i.root,l,"default"!==c&&[i["color".concat((0,V.A)(c))],O&&i["clickableColor".concat((0,V.A)(c))],y&&i["deletableColor".concat((0,V.A)(c))]],"default"!==A&&[i.outlined,{primary:i.outlinedPrimary,secondary:i.outlinedSecondary}[c]],m&&i.disabled,M&&i.sizeSmall,O&&i.clickable,y&&i.deletable),"aria-disabled":!!m||void 0,tabIndex:O||y?0:void 0,onClick:g,onKeyDown:function(e){e.currentTarget===e.target&&Fa(e)&&e.preventDefault(),b&&b(e)},onKeyUp:function(e){e.currentTarget===e.target&&(y&&Fa(e)?y(e):"Escape"===e.key&&R.current&&R.current.blur()),x&&x(e)},ref:T},z,C),D||F,e.createElement("span",{className:(0,P.A)(i.label,M&&i.labelSmall)},v),_)}));const Ba=(0,T.A)((function(e){var t="light"===e.palette.type?e.palette.grey[300]:e.palette.grey[700],n=(0,Dt.X4)(e.palette.text.primary,.26);return{root:{fontFamily:e.typography.fontFamily,fontSize:e.typography.pxToRem(13),display:"inline-flex",alignItems:"center",justifyContent:"center",height:32,color:e.palette.getContrastText(t),backgroundColor:t,borderRadius:16,whiteSpace:"nowrap",transition:e.transitions.create(["background-color","box-shadow"]),cursor:"default",outline:0,textDecoration:"none",border:"none",padding:0,verticalAlign:"middle",boxSizing:"border-box","&$disabled":{opacity:.5,pointerEvents:"none"},"& $avatar":{marginLeft:5,marginRight:-6,width:24,height:24,color:"light"===e.palette.type?e.palette.grey[700]:e.palette.grey[300],fontSize:e.typography.pxToRem(12)},"& $avatarColorPrimary":{color:e.palette.primary.contrastText,backgroundColor:e.palette.primary.dark},"& $avatarColorSecondary":{color:e.palette.secondary.contrastText,backgroundColor:e.palette.secondary.dark},"& $avatarSmall":{marginLeft:4,marginRight:-4,width:18,height:18,fontSize:e.typography.pxToRem(10)}},sizeSmall:{height:24},colorPrimary:{backgroundColor:e.palette.primary.main,color:e.palette.primary.contrastText},colorSecondary:{backgroundColor:e.palette.secondary.main,color:e.palette.secondary.contrastText},disabled:{},clickable:{userSelect:"none",WebkitTapHighlightColor:"transparent",cursor:"pointer","&:hover, &:focus":{backgroundColor:(0,Dt.tL)(t,.08)},"&:active":{boxShadow:e.shadows[1]}},clickableColorPrimary:{"&:hover, &:focus":{backgroundColor:(0,Dt.tL)(e.palette.primary.main,.08)}},clickableColorSecondary:{"&:hover, &:focus":{backgroundColor:(0,Dt.tL)(e.palette.secondary.main,.08)}},deletable:{"&:focus":{backgroundColor:(0,Dt.tL)(t,.08)}},deletableColorPrimary:{"&:focus":{backgroundColor:(0,Dt.tL)(e.palette.primary.main,.2)}},deletableColorSecondary:{"&:focus":{backgroundColor:(0,Dt.tL)(e.palette.secondary.main,.2)}},outlined:{backgroundColor:"transparent",border:"1px solid ".concat("light"===e.palette.type?"rgba(0, 0, 0, 0.23)":"rgba(255, 255, 255, 0.23)"),"$clickable&:hover, $clickable&:focus, $deletable&:focus":{backgroundColor:(0,Dt.X4)(e.palette.text.primary,e.palette.action.hoverOpacity)},"& $avatar":{marginLeft:4},"& $avatarSmall":{marginLeft:2},"& $icon":{marginLeft:4},"& $iconSmall":{marginLeft:2},"& $deleteIcon":{marginRight:5},"& $deleteIconSmall":{marginRight:3}},outlinedPrimary:{color:e.palette.primary.main,border:"1px solid ".concat(e.palette.primary.main),"$clickable&:hover, $clickable&:focus, $deletable&:focus":{backgroundColor:(0,Dt.X4)(e.palette.primary.main,e.palette.action.hoverOpacity)}},outlinedSecondary:{color:e.palette.secondary.main,border:"1px solid ".concat(e.palette.secondary.main),"$clickable&:hover, $clickable&:focus, $deletable&:focus":{backgroundColor:(0,Dt.X4)(e.palette.secondary.main,e.palette.action.hoverOpacity)}},avatar:{},avatarSmall:{},avatarColorPrimary:{},avatarColorSecondary:{},icon:{color:"light"===e.palette.type?e.palette.grey[700]:e.palette.grey[300],marginLeft:5,marginRight:-6},iconSmall:{width:18,height:18,marginLeft:4,marginRight:-4},iconColorPrimary:{color:"inherit"},iconColorSecondary:{color:"inherit"},label:{overflow:"hidden",textOverflow:"ellipsis",paddingLeft:12,paddingRight:12,whiteSpace:"nowrap"},labelSmall:{paddingLeft:8,paddingRight:8},deleteIcon:{WebkitTapHighlightColor:"transparent",color:n,height:22,width:22,cursor:"pointer",margin:"0 5px 0 -6px","&:hover":{color:(0,Dt.X4)(n,.4)}},deleteIconSmall:{height:16,width:16,marginRight:4,marginLeft:-4},deleteIconColorPrimary:{color:(0,Dt.X4)(e.palette.primary.contrastText,.7),"&:hover, &:active":{color:e.palette.primary.contrastText}},deleteIconColorSecondary:{color:(0,Dt.X4)(e.palette.secondary.contrastText,.7),"&:hover, &:active":{color:e.palette.secondary.contrastText}},deleteIconOutlinedColorPrimary:{color:(0,Dt.X4)(e.palette.primary.main,.7),"&:hover, &:active":{color:e.palette.primary.main}},deleteIconOutlinedColorSecondary:{color:(0,Dt.X4)(e.palette.secondary.main,.7),"&:hover, &:active":{color:e.palette.secondary.main}}}}),{name:"MuiChip"})(ja);var Wa=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=t.color,s=void 0===l?"primary":l,u=t.value,c=t.valueBuffer,d=t.variant,f=void 0===d?"indeterminate":d,p=(0,a.A)(t,["classes","className","color","value","valueBuffer","variant"]),m=x(),h={},v={bar1:{},bar2:{}};if(("determinate"===f||"buffer"===f)&&void 0!==u){h["aria-valuenow"]=Math.round(u),h["aria-valuemin"]=0,h["aria-valuemax"]=100;var g=u-100;"rtl"===m.direction&&(g=-g),v.bar1.transform="translateX(".concat(g,"%)")}if("buffer"===f&&void 0!==c){var y=(c||0)-100;"rtl"===m.direction&&(y=-y),v.bar2.transform="translateX(".concat(y,"%)")}return e.createElement("div",(0,r.A)({className:(0,P.A)(o.root,o["color".concat((0,V.A)(s))],i,{determinate:o.determinate,indeterminate:o.indeterminate,buffer:o.buffer,query:o.query}[f]),role:"progressbar"},h,{ref:n},p),"buffer"===f?e.createElement("div",{className:(0,P.A)(o.dashed,o["dashedColor".concat((0,V.A)(s))])}):null,e.createElement("div",{className:(0,P.A)(o.bar,o["barColor".concat((0,V.A)(s))],("indeterminate"===f||"query"===f)&&o.bar1Indeterminate,{determinate:o.bar1Determinate,buffer:o.bar1Buffer}[f]),style:v.bar1}),"determinate"===f?null:e.createElement("div",{className:(0,P.A)(o.bar,("indeterminate"===f||"query"===f)&&o.bar2Indeterminate,"buffer"===f?[o["color".concat((0,V.A)(s))],o.bar2Buffer]:o["barColor".concat((0,V.A)(s))]),style:v.bar2}))}));const $a=(0,T.A)((function(e){var t=function(t){return"light"===e.palette.type?(0,Dt.a)(t,.62):(0,Dt.e$)(t,.5)},n=t(e.palette.primary.main),r=t(e.palette.secondary.main);return{root:{position:"relative",overflow:"hidden",height:4,"@media print":{colorAdjust:"exact"}},colorPrimary:{backgroundColor:n},colorSecondary:{backgroundColor:r},determinate:{},indeterminate:{},buffer:{backgroundColor:"transparent"},query:{transform:"rotate(180deg)"},dashed:{position:"absolute",marginTop:0,height:"100%",width:"100%",animation:"$buffer 3s infinite linear"},dashedColorPrimary:{backgroundImage:"radial-gradient(".concat(n," 0%, ").concat(n," 16%, transparent 42%)"),backgroundSize:"10px 10px",backgroundPosition:"0 -23px"},dashedColorSecondary:{backgroundImage:"radial-gradient(".concat(r," 0%, ").concat(r," 16%, transparent 42%)"),backgroundSize:"10px 10px",backgroundPosition:"0 -23px"},bar:{width:"100%",position:"absolute",left:0,bottom:0,top:0,transition:"transform 0.2s linear",transformOrigin:"left"},barColorPrimary:{backgroundColor:e.palette.primary.main},barColorSecondary:{backgroundColor:e.palette.secondary.main},bar1Indeterminate:{width:"auto",animation:"$indeterminate1 2.1s cubic-bezier(0.65, 0.815, 0.735, 0.395) infinite"},bar1Determinate:{transition:"transform .".concat(4,"s linear")},bar1Buffer:{zIndex:1,transition:"transform .".concat(4,"s linear")},bar2Indeterminate:{width:"auto",animation:"$indeterminate2 2.1s cubic-bezier(0.165, 0.84, 0.44, 1) 1.15s infinite"},bar2Buffer:{transition:"transform .".concat(4,"s linear")},"@keyframes indeterminate1":{"0%":{left:"-35%",right:"100%"},"60%":{left:"100%",right:"-90%"},"100%":{left:"100%",right:"-90%"}},"@keyframes indeterminate2":{"0%":{left:"-200%",right:"100%"},"60%":{left:"107%",right:"-8%"},"100%":{left:"107%",right:"-8%"}},"@keyframes buffer":{"0%":{opacity:1,backgroundPosition:"0 -23px"},"50%":{opacity:0,backgroundPosition:"0 -23px"},"100%":{opacity:1,backgroundPosition:"-200px -23px"}}}}),{name:"MuiLinearProgress"})(Wa);var Va=e.forwardRef((function(t,n){var o=t.anchorOrigin,i=void 0===o?{vertical:"top",horizontal:"right"}:o,l=t.badgeContent,s=t.children,u=t.classes,c=t.className,d=t.color,f=void 0===d?"default":d,p=t.component,m=void 0===p?"span":p,h=t.invisible,v=t.max,g=void 0===v?99:v,y=t.overlap,b=void 0===y?"rectangle":y,x=t.showZero,w=void 0!==x&&x,E=t.variant,k=void 0===E?"standard":E,S=(0,a.A)(t,["anchorOrigin","badgeContent","children","classes","className","color","component","invisible","max","overlap","showZero","variant"]),A=h;null==h&&(0===l&&!w||null==l&&"dot"!==k)&&(A=!0);var C="";return"dot"!==k&&(C=l>g?"".concat(g,"+"):l),e.createElement(m,(0,r.A)({className:(0,P.A)(u.root,c),ref:n},S),s,e.createElement("span",{className:(0,P.A)(u.badge,u["".concat(i.horizontal).concat((0,V.A)(i.vertical),"}")],u["anchorOrigin".concat((0,V.A)(i.vertical)).concat((0,V.A)(i.horizontal)).concat((0,V.A)(b))],"default"!==f&&u["color".concat((0,V.A)(f))],A&&u.invisible,"dot"===k&&u.dot)},C))}));const Ha=(0,T.A)((function(e){return{root:{position:"relative",display:"inline-flex",verticalAlign:"middle",flexShrink:0},badge:{display:"flex",flexDirection:"row",flexWrap:"wrap",justifyContent:"center",alignContent:"center",alignItems:"center",position:"absolute",boxSizing:"border-box",fontFamily:e.typography.fontFamily,fontWeight:e.typography.fontWeightMedium,fontSize:e.typography.pxToRem(12),minWidth:20,lineHeight:1,padding:"0 6px",height:20,borderRadius:10,zIndex:1,transition:e.transitions.create("transform",{easing:e.transitions.easing.easeInOut,duration:e.transitions.duration.enteringScreen})},colorPrimary:{backgroundColor:e.palette.primary.main,color:e.palette.primary.contrastText},colorSecondary:{backgroundColor:e.palette.secondary.main,color:e.palette.secondary.contrastText},colorError:{backgroundColor:e.palette.error.main,color:e.palette.error.contrastText},dot:{borderRadius:4,height:8,minWidth:8,padding:0},anchorOriginTopRightRectangle:{top:0,right:0,transform:"scale(1) translate(50%, -50%)",transformOrigin:"100% 0%","&$invisible":{transform:"scale(0) translate(50%, -50%)"}},anchorOriginTopRightRectangular:{top:0,right:0,transform:"scale(1) translate(50%, -50%)",transformOrigin:"100% 0%","&$invisible":{transform:"scale(0) translate(50%, -50%)"}},anchorOriginBottomRightRectangle:{bottom:0,right:0,transform:"scale(1) translate(50%, 50%)",transformOrigin:"100% 100%","&$invisible":{transform:"scale(0) translate(50%, 50%)"}},anchorOriginBottomRightRectangular:{bottom:0,right:0,transform:"scale(1) translate(50%, 50%)",transformOrigin:"100% 100%","&$invisible":{transform:"scale(0) translate(50%, 50%)"}},anchorOriginTopLeftRectangle:{top:0,left:0,transform:"scale(1) translate(-50%, -50%)",transformOrigin:"0% 0%","&$invisible":{transform:"scale(0) translate(-50%, -50%)"}},anchorOriginTopLeftRectangular:{top:0,left:0,transform:"scale(1) translate(-50%, -50%)",transformOrigin:"0% 0%","&$invisible":{transform:"scale(0) translate(-50%, -50%)"}},anchorOriginBottomLeftRectangle:{bottom:0,left:0,transform:"scale(1) translate(-50%, 50%)",transformOrigin:"0% 100%","&$invisible":{transform:"scale(0) translate(-50%, 50%)"}},anchorOriginBottomLeftRectangular:{bottom:0,left:0,transform:"scale(1) translate(-50%, 50%)",transformOrigin:"0% 100%","&$invisible":{transform:"scale(0) translate(-50%, 50%)"}},anchorOriginTopRightCircle:{top:"14%",right:"14%",transform:"scale(1) translate(50%, -50%)",transformOrigin:"100% 0%","&$invisible":{transform:"scale(0) translate(50%, -50%)"}},anchorOriginTopRightCircular:{top:"14%",right:"14%",transform:"scale(1) translate(50%, -50%)",transformOrigin:"100% 0%","&$invisible":{transform:"scale(0) translate(50%, -50%)"}},anchorOriginBottomRightCircle:{bottom:"14%",right:"14%",transform:"scale(1) translate(50%, 50%)",transformOrigin:"100% 100%","&$invisible":{transform:"scale(0) translate(50%, 50%)"}},anchorOriginBottomRightCircular:{bottom:"14%",right:"14%",transform:"scale(1) translate(50%, 50%)",transformOrigin:"100% 100%","&$invisible":{transform:"scale(0) translate(50%, 50%)"}},anchorOriginTopLeftCircle:{top:"14%",left:"14%",transform:"scale(1) translate(-50%, -50%)",transformOrigin:"0% 0%","&$invisible":{transform:"scale(0) translate(-50%, -50%)"}},anchorOriginTopLeftCircular:{top:"14%",left:"14%",transform:"scale(1) translate(-50%, -50%)",transformOrigin:"0% 0%","&$invisible":{transform:"scale(0) translate(-50%, -50%)"}},anchorOriginBottomLeftCircle:{bottom:"14%",left:"14%",transform:"scale(1) translate(-50%, 50%)",transformOrigin:"0% 100%","&$invisible":{transform:"scale(0) translate(-50%, 50%)"}},anchorOriginBottomLeftCircular:{bottom:"14%",left:"14%",transform:"scale(1) translate(-50%, 50%)",transformOrigin:"0% 100%","&$invisible":{transform:"scale(0) translate(-50%, 50%)"}},invisible:{transition:e.transitions.create("transform",{easing:e.transitions.easing.easeInOut,duration:e.transitions.duration.leavingScreen})}}}),{name:"MuiBadge"})(Va),Ua=(0,T.A)((function(e){return{thumb:{"&$open":{"& $offset":{transform:"scale(1) translateY(-10px)"}}},open:{},offset:(0,r.A)({zIndex:1},e.typography.body2,{fontSize:e.typography.pxToRem(12),lineHeight:1.2,transition:e.transitions.create(["transform"],{duration:e.transitions.duration.shortest}),top:-34,transformOrigin:"bottom center",transform:"scale(0)",position:"absolute"}),circle:{display:"flex",alignItems:"center",justifyContent:"center",width:32,height:32,borderRadius:"50% 50% 50% 0",backgroundColor:"currentColor",transform:"rotate(-45deg)"},label:{color:e.palette.primary.contrastText,transform:"rotate(45deg)"}}}),{name:"PrivateValueLabel"})((function(t){var n=t.children,r=t.classes,o=t.className,a=t.open,i=t.value,l=t.valueLabelDisplay;return"off"===l?n:e.cloneElement(n,{className:(0,P.A)(n.props.className,(a||"on"===l)&&r.open,r.thumb)},e.createElement("span",{className:(0,P.A)(r.offset,o)},e.createElement("span",{className:r.circle},e.createElement("span",{className:r.label},i))))}));function qa(e,t){return e-t}function Ka(e,t,n){return Math.min(Math.max(t,e),n)}function Xa(e,t){return e.reduce((function(e,n,r){var o=Math.abs(t-n);return null===e||o<e.distance||o===e.distance?{distance:o,index:r}:e}),null).index}function Qa(e,t){if(void 0!==t.current&&e.changedTouches){for(var n=0;n<e.changedTouches.length;n+=1){var r=e.changedTouches[n];if(r.identifier===t.current)return{x:r.clientX,y:r.clientY}}return!1}return{x:e.clientX,y:e.clientY}}function Ya(e,t,n){return 100*(e-t)/(n-t)}function Ga(e,t,n){var r=Math.round((e-n)/t)*t+n;return Number(r.toFixed(function(e){if(Math.abs(e)<1){var t=e.toExponential().split("e-"),n=t[0].split(".")[1];return(n?n.length:0)+parseInt(t[1],10)}var r=e.toString().split(".")[1];return r?r.length:0}(t)))}function Ja(e){var t=e.values,n=e.source,r=e.newValue,o=e.index;if(t[o]===r)return n;var a=t.slice();return a[o]=r,a}function Za(e){var t=e.sliderRef,n=e.activeIndex,r=e.setActive;t.current.contains(document.activeElement)&&Number(document.activeElement.getAttribute("data-index"))===n||t.current.querySelector('[role="slider"][data-index="'.concat(n,'"]')).focus(),r&&r(n)}var ei={horizontal:{offset:function(e){return{left:"".concat(e,"%")}},leap:function(e){return{width:"".concat(e,"%")}}},"horizontal-reverse":{offset:function(e){return{right:"".concat(e,"%")}},leap:function(e){return{width:"".concat(e,"%")}}},vertical:{offset:function(e){return{bottom:"".concat(e,"%")}},leap:function(e){return{height:"".concat(e,"%")}}}},ti=function(e){return e},ni=e.forwardRef((function(t,n){var i=t["aria-label"],l=t["aria-labelledby"],s=t["aria-valuetext"],u=t.classes,c=t.className,d=t.color,f=void 0===d?"primary":d,p=t.component,m=void 0===p?"span":p,h=t.defaultValue,v=t.disabled,g=void 0!==v&&v,y=t.getAriaLabel,b=t.getAriaValueText,w=t.marks,E=void 0!==w&&w,S=t.max,A=void 0===S?100:S,C=t.min,R=void 0===C?0:C,T=t.name,N=t.onChange,O=t.onChangeCommitted,M=t.onMouseDown,L=t.orientation,z=void 0===L?"horizontal":L,_=t.scale,I=void 0===_?ti:_,D=t.step,F=void 0===D?1:D,j=t.ThumbComponent,B=void 0===j?"span":j,W=t.track,$=void 0===W?"normal":W,H=t.value,U=t.ValueLabelComponent,q=void 0===U?Ua:U,K=t.valueLabelDisplay,X=void 0===K?"off":K,Q=t.valueLabelFormat,Y=void 0===Q?ti:Q,G=(0,a.A)(t,["aria-label","aria-labelledby","aria-valuetext","classes","className","color","component","defaultValue","disabled","getAriaLabel","getAriaValueText","marks","max","min","name","onChange","onChangeCommitted","onMouseDown","orientation","scale","step","ThumbComponent","track","value","ValueLabelComponent","valueLabelDisplay","valueLabelFormat"]),J=x(),Z=e.useRef(),ee=e.useState(-1),te=ee[0],ne=ee[1],re=e.useState(-1),oe=re[0],ae=re[1],ie=(0,bt.A)({controlled:H,default:h,name:"Slider"}),le=(0,o.A)(ie,2),se=le[0],ue=le[1],ce=Array.isArray(se),de=ce?se.slice().sort(qa):[se];de=de.map((function(e){return Ka(e,R,A)}));var fe=!0===E&&null!==F?(0,Fe.A)(Array(Math.floor((A-R)/F)+1)).map((function(e,t){return{value:R+F*t}})):E||[],pe=(0,Ft.A)(),me=pe.isFocusVisible,he=pe.onBlurVisible,ve=pe.ref,ge=e.useState(-1),ye=ge[0],be=ge[1],xe=e.useRef(),we=(0,k.A)(ve,xe),Ee=(0,k.A)(n,we),ke=(0,_e.A)((function(e){var t=Number(e.currentTarget.getAttribute("data-index"));me(e)&&be(t),ae(t)})),Se=(0,_e.A)((function(){-1!==ye&&(be(-1),he()),ae(-1)})),Ae=(0,_e.A)((function(e){var t=Number(e.currentTarget.getAttribute("data-index"));ae(t)})),Ce=(0,_e.A)((function(){ae(-1)})),Re="rtl"===J.direction,Te=(0,_e.A)((function(e){var t,n=Number(e.currentTarget.getAttribute("data-index")),r=de[n],o=(A-R)/10,a=fe.map((function(e){return e.value})),i=a.indexOf(r),l=Re?"ArrowLeft":"ArrowRight",s=Re?"ArrowRight":"ArrowLeft";switch(e.key){case"Home":t=R;break;case"End":t=A;break;case"PageUp":F&&(t=r+o);break;case"PageDown":F&&(t=r-o);break;case l:case"ArrowUp":t=F?r+F:a[i+1]||a[a.length-1];break;case s:case"ArrowDown":t=F?r-F:a[i-1]||a[0];break;default:return}if(e.preventDefault(),F&&(t=Ga(t,F,R)),t=Ka(t,R,A),ce){var u=t;t=Ja({values:de,source:se,newValue:t,index:n}).sort(qa),Za({sliderRef:xe,activeIndex:t.indexOf(u)})}ue(t),be(n),N&&N(e,t),O&&O(e,t)})),Ne=e.useRef(),Oe=z;Re&&"vertical"!==z&&(Oe+="-reverse");var Me=function(e){var t,n,r=e.finger,o=e.move,a=void 0!==o&&o,i=e.values,l=e.source,s=xe.current.getBoundingClientRect(),u=s.width,c=s.height,d=s.bottom,f=s.left;if(t=0===Oe.indexOf("vertical")?(d-r.y)/c:(r.x-f)/u,-1!==Oe.indexOf("-reverse")&&(t=1-t),n=function(e,t,n){return(n-t)*e+t}(t,R,A),F)n=Ga(n,F,R);else{var p=fe.map((function(e){return e.value}));n=p[Xa(p,n)]}n=Ka(n,R,A);var m=0;if(ce){var h=n;m=(n=Ja({values:i,source:l,newValue:n,index:m=a?Ne.current:Xa(i,n)}).sort(qa)).indexOf(h),Ne.current=m}return{newValue:n,activeIndex:m}},Le=(0,_e.A)((function(e){var t=Qa(e,Z);if(t){var n=Me({finger:t,move:!0,values:de,source:se}),r=n.newValue,o=n.activeIndex;Za({sliderRef:xe,activeIndex:o,setActive:ne}),ue(r),N&&N(e,r)}})),ze=(0,_e.A)((function(e){var t=Qa(e,Z);if(t){var n=Me({finger:t,values:de,source:se}).newValue;ne(-1),"touchend"===e.type&&ae(-1),O&&O(e,n),Z.current=void 0;var r=(0,Pe.A)(xe.current);r.removeEventListener("mousemove",Le),r.removeEventListener("mouseup",ze),r.removeEventListener("touchmove",Le),r.removeEventListener("touchend",ze)}})),Ie=(0,_e.A)((function(e){e.preventDefault();var t=e.changedTouches[0];null!=t&&(Z.current=t.identifier);var n=Qa(e,Z),r=Me({finger:n,values:de,source:se}),o=r.newValue,a=r.activeIndex;Za({sliderRef:xe,activeIndex:a,setActive:ne}),ue(o),N&&N(e,o);var i=(0,Pe.A)(xe.current);i.addEventListener("touchmove",Le),i.addEventListener("touchend",ze)}));e.useEffect((function(){var e=xe.current;e.addEventListener("touchstart",Ie);var t=(0,Pe.A)(e);return function(){e.removeEventListener("touchstart",Ie),t.removeEventListener("mousemove",Le),t.removeEventListener("mouseup",ze),t.removeEventListener("touchmove",Le),t.removeEventListener("touchend",ze)}}),[ze,Le,Ie]);var De=(0,_e.A)((function(e){M&&M(e),e.preventDefault();var t=Qa(e,Z),n=Me({finger:t,values:de,source:se}),r=n.newValue,o=n.activeIndex;Za({sliderRef:xe,activeIndex:o,setActive:ne}),ue(r),N&&N(e,r);var a=(0,Pe.A)(xe.current);a.addEventListener("mousemove",Le),a.addEventListener("mouseup",ze)})),je=Ya(ce?de[0]:R,R,A),Be=Ya(de[de.length-1],R,A)-je,We=(0,r.A)({},ei[Oe].offset(je),ei[Oe].leap(Be));return e.createElement(m,(0,r.A)({ref:Ee,className:(0,P.A)(u.root,u["color".concat((0,V.A)(f))],c,g&&u.disabled,fe.length>0&&fe.some((function(e){return e.label}))&&u.marked,!1===$&&u.trackFalse,"vertical"===z&&u.vertical,"inverted"===$&&u.trackInverted),onMouseDown:De},G),e.createElement("span",{className:u.rail}),e.createElement("span",{className:u.track,style:We}),e.createElement("input",{value:de.join(","),name:T,type:"hidden"}),fe.map((function(t,n){var r,o=Ya(t.value,R,A),a=ei[Oe].offset(o);return r=!1===$?-1!==de.indexOf(t.value):"normal"===$&&(ce?t.value>=de[0]&&t.value<=de[de.length-1]:t.value<=de[0])||"inverted"===$&&(ce?t.value<=de[0]||t.value>=de[de.length-1]:t.value>=de[0]),e.createElement(e.Fragment,{key:t.value},e.createElement("span",{style:a,"data-index":n,className:(0,P.A)(u.mark,r&&u.markActive)}),null!=t.label?e.createElement("span",{"aria-hidden":!0,"data-index":n,style:a,className:(0,P.A)(u.markLabel,r&&u.markLabelActive)},t.label):null)})),de.map((function(t,n){var r=Ya(t,R,A),o=ei[Oe].offset(r);return e.createElement(q,{key:n,valueLabelFormat:Y,valueLabelDisplay:X,className:u.valueLabel,value:"function"==typeof Y?Y(I(t),n):Y,index:n,open:oe===n||te===n||"on"===X,disabled:g},e.createElement(B,{className:(0,P.A)(u.thumb,u["thumbColor".concat((0,V.A)(f))],te===n&&u.active,g&&u.disabled,ye===n&&u.focusVisible),tabIndex:g?null:0,role:"slider",style:o,"data-index":n,"aria-label":y?y(n):i,"aria-labelledby":l,"aria-orientation":z,"aria-valuemax":I(A),"aria-valuemin":I(R),"aria-valuenow":I(t),"aria-valuetext":b?b(I(t),n):s,onKeyDown:Te,onFocus:ke,onBlur:Se,onMouseOver:Ae,onMouseLeave:Ce}))})))}));const ri=(0,T.A)((function(e){return{root:{height:2,width:"100%",boxSizing:"content-box",padding:"13px 0",display:"inline-block",position:"relative",cursor:"pointer",touchAction:"none",color:e.palette.primary.main,WebkitTapHighlightColor:"transparent","&$disabled":{pointerEvents:"none",cursor:"default",color:e.palette.grey[400]},"&$vertical":{width:2,height:"100%",padding:"0 13px"},"@media (pointer: coarse)":{padding:"20px 0","&$vertical":{padding:"0 20px"}},"@media print":{colorAdjust:"exact"}},colorPrimary:{},colorSecondary:{color:e.palette.secondary.main},marked:{marginBottom:20,"&$vertical":{marginBottom:"auto",marginRight:20}},vertical:{},disabled:{},rail:{display:"block",position:"absolute",width:"100%",height:2,borderRadius:1,backgroundColor:"currentColor",opacity:.38,"$vertical &":{height:"100%",width:2}},track:{display:"block",position:"absolute",height:2,borderRadius:1,backgroundColor:"currentColor","$vertical &":{width:2}},trackFalse:{"& $track":{display:"none"}},trackInverted:{"& $track":{backgroundColor:"light"===e.palette.type?(0,Dt.a)(e.palette.primary.main,.62):(0,Dt.e$)(e.palette.primary.main,.5)},"& $rail":{opacity:1}},thumb:{position:"absolute",width:12,height:12,marginLeft:-6,marginTop:-5,boxSizing:"border-box",borderRadius:"50%",outline:0,backgroundColor:"currentColor",display:"flex",alignItems:"center",justifyContent:"center",transition:e.transitions.create(["box-shadow"],{duration:e.transitions.duration.shortest}),"&::after":{position:"absolute",content:'""',borderRadius:"50%",left:-15,top:-15,right:-15,bottom:-15},"&$focusVisible,&:hover":{boxShadow:"0px 0px 0px 8px ".concat((0,Dt.X4)(e.palette.primary.main,.16)),"@media (hover: none)":{boxShadow:"none"}},"&$active":{boxShadow:"0px 0px 0px 14px ".concat((0,Dt.X4)(e.palette.primary.main,.16))},"&$disabled":{width:8,height:8,marginLeft:-4,marginTop:-3,"&:hover":{boxShadow:"none"}},"$vertical &":{marginLeft:-5,marginBottom:-6},"$vertical &$disabled":{marginLeft:-3,marginBottom:-4}},thumbColorPrimary:{},thumbColorSecondary:{"&$focusVisible,&:hover":{boxShadow:"0px 0px 0px 8px ".concat((0,Dt.X4)(e.palette.secondary.main,.16))},"&$active":{boxShadow:"0px 0px 0px 14px ".concat((0,Dt.X4)(e.palette.secondary.main,.16))}},active:{},focusVisible:{},valueLabel:{left:"calc(-50% - 4px)"},mark:{position:"absolute",width:2,height:2,borderRadius:1,backgroundColor:"currentColor"},markActive:{backgroundColor:e.palette.background.paper,opacity:.8},markLabel:(0,r.A)({},e.typography.body2,{color:e.palette.text.secondary,position:"absolute",top:26,transform:"translateX(-50%)",whiteSpace:"nowrap","$vertical &":{top:"auto",left:26,transform:"translateY(50%)"},"@media (pointer: coarse)":{top:40,"$vertical &":{left:31}}}),markLabelActive:{color:e.palette.text.primary}}}),{name:"MuiSlider"})(ni);var oi=e.forwardRef((function(t,n){var o=t.classes,i=t.className,l=(0,a.A)(t,["classes","className"]);return e.createElement(q,(0,r.A)({gutterBottom:!0,component:"div",ref:n,className:(0,P.A)(o.root,i)},l))}));const ai=(0,T.A)((function(e){return{root:{fontWeight:e.typography.fontWeightMedium,marginTop:-2}}}),{name:"MuiAlertTitle"})(oi);var ii=n(8861),li=n(5632),si=n(9362),ui=n(345),ci=n(1991),di=n(8630),fi=n(5061),pi=n(6064),mi=n(2429),hi=n(7451),vi=n(8721);const gi=({open:t,onClose:n})=>e.createElement(un,{open:t,autoHideDuration:1e4,onClose:n,anchorOrigin:{vertical:"top",horizontal:"center"}},e.createElement(xn,{severity:"info",variant:"filled",onClose:n,style:{maxWidth:"600px"}},e.createElement(ai,null,"Spotify Premium Required"),e.createElement("p",null,"Playback controls like play, pause, and skip require a Spotify Premium account."),e.createElement(xo,{mt:1},e.createElement(Eo,{href:"https://www.spotify.com/premium/",target:"_blank",rel:"noopener",style:{color:"white",textDecoration:"underline"}},"Learn more about Spotify Premium"))));class yi extends e.Component{constructor(e){super(e),this.state={votesToSkip:2,guestCanPause:!1,isHost:!1,showSettings:!1,spotifyAuthenticated:!1,song:{},loading:!0,volume:50,actionLoading:{play:!1,pause:!1,skip:!1,leave:!1},notification:{show:!1,message:"",type:"info"},spotifyError:null,showPremiumNotice:!1},this.roomCode=this.props.match.params.roomCode,this.leaveButtonPressed=this.leaveButtonPressed.bind(this),this.updateShowSettings=this.updateShowSettings.bind(this),this.renderSettingsButton=this.renderSettingsButton.bind(this),this.renderSettings=this.renderSettings.bind(this),this.getRoomDetails=this.getRoomDetails.bind(this),this.getRoomDetails=this.getRoomDetails.bind(this),this.authenticateSpotify=this.authenticateSpotify.bind(this),this.getCurrentSong=this.getCurrentSong.bind(this),this.handleSongData=this.handleSongData.bind(this),this.handleSongDelta=this.handleSongDelta.bind(this),this.extrapolateProgress=this.extrapolateProgress.bind(this),this.openSongStream=this.openSongStream.bind(this),this.startPolling=this.startPolling.bind(this),this.skipSong=this.skipSong.bind(this),this.pauseSong=this.pauseSong.bind(this),this.playSong=this.playSong.bind(this),this.formatTime=this.formatTime.bind(this),this.handleCloseNotification=this.handleCloseNotification.bind(this),this.handleApiError=this.handleApiError.bind(this),this.handlePremiumNoticeClose=this.handlePremiumNoticeClose.bind(this),this.getRoomDetails()}componentDidMount(){const e=document.getElementById("app");window.EventSource&&"true"===e.dataset.eventStream?this.openSongStream():this.startPolling()}componentWillUnmount(){this.songStream&&this.songStream.close(),clearInterval(this.interval)}startPolling(){this.interval||(this.interval=setInterval(this.getCurrentSong,1e3))}openSongStream(){this.songStream=new EventSource("/spotify/current-song/stream"),this.songStream.addEventListener("state",(e=>{const t=JSON.parse(e.data);this.handleSongData(t);const n=t.device_info||{};this.state.isHost&&n.has_devices&&!n.has_active_device&&this.getCurrentSong()})),this.songStream.addEventListener("progress",(e=>{const t=JSON.parse(e.data);this.setState((e=>({song:{...e.song,time:t.time,is_playing:t.is_playing}})))})),this.songStream.addEventListener("closed",(()=>{this.songStream.close(),this.getRoomDetails()})),this.songStream.onerror=()=>{this.songStream.readyState===EventSource.CLOSED&&this.startPolling()}}getRoomDetails(){return fetch("/api/get-room?code="+this.roomCode).then((e=>(e.ok||(this.props.leaveRoomCallback(),this.props.history.push("/")),e.json()))).then((e=>{this.setState({votesToSkip:e.votes_to_skip,guestCanPause:e.guest_can_pause,isHost:e.is_host,loading:!1}),this.state.isHost&&this.authenticateSpotify()})).catch((e=>{console.error("Error fetching room details:",e),this.setState({loading:!1})}))}authenticateSpotify(){fetch("/spotify/is-authenticated").then((e=>e.json())).then((e=>{this.setState({spotifyAuthenticated:e.status,spotifyTokenInfo:e.token_info||{}}),(!e.status||e.token_info&&!e.token_info.has_valid_token)&&fetch("/spotify/get-auth-url").then((e=>e.json())).then((e=>{window.location.replace(e.url)}))})).catch((e=>{console.error("Error checking Spotify authentication:",e),this.showNotification("Spotify authentication error. Please try again.","error")}))}getCurrentSong(){const e=this.songEtag?{"If-None-Match":this.songEtag}:{};fetch("/spotify/current-song?delta=1",{headers:e}).then((e=>304===e.status?(this.extrapolateProgress(),null):401===e.status?e.json().then((e=>{throw e.auth_url?(this.showNotification("Spotify authentication required. Redirecting...","info"),setTimeout((()=>{window.location.replace(e.auth_url)}),2e3)):this.authenticateSpotify(),new Error("Authentication required")})):e.ok?(this.songEtag=e.headers.get("ETag"),e.json()):(this.songEtag=null,{}))).then((e=>{null!==e&&(e.delta?this.handleSongDelta(e):this.handleSongData(e))})).catch((e=>{"Authentication required"!==e.message&&console.error("Error fetching current song:",e)}))}handleSongData(e){if(e.requires_authentication)return this.showNotification("Spotify authentication required. Redirecting...","info"),void setTimeout((()=>{e.auth_url?window.location.replace(e.auth_url):this.authenticateSpotify()}),2e3);this.songReceivedAt=Date.now(),this.setState({song:e})}handleSongDelta(e){this.songReceivedAt=Date.now(),this.setState((t=>{const n={...t.song,...e.changed};return e.removed.forEach((e=>delete n[e])),{song:n}}))}extrapolateProgress(){const e=Date.now(),t=e-(this.songReceivedAt||e);this.songReceivedAt=e,this.setState((e=>{const n=e.song;if(!n.is_playing||null==n.time)return null;const a=n.duration?Math.min(n.time+t,n.duration):n.time+t;return{song:{...n,time:a}}}))}skipSong(){this.setState((e=>({actionLoading:{...e.actionLoading,skip:!0}}))),fetch("/spotify/skip",{method:"POST",headers:{"Content-Type":"application/json"}}).then((e=>{if(!e.ok)return e.json().then((e=>{throw new Error(e.error||"Failed to skip track")}));this.showNotification("Skipped to next track","success")})).catch((e=>{this.handleApiError(e,"Failed to skip track")})).finally((()=>{setTimeout((()=>{this.setState((e=>({actionLoading:{...e.actionLoading,skip:!1}})))}),500)}))}pauseSong(){this.setState((e=>({actionLoading:{...e.actionLoading,pause:!0}}))),fetch("/spotify/pause",{method:"PUT",headers:{"Content-Type":"application/json"}}).then((e=>{if(!e.ok)return e.json().then((e=>{throw new Error(e.error||"Failed to pause playback")}));this.showNotification("Playback paused","info")})).catch((e=>{this.handleApiError(e,"Failed to pause playback")})).finally((()=>{setTimeout((()=>{this.setState((e=>({actionLoading:{...e.actionLoading,pause:!1}})))}),500)}))}playSong(){this.setState((e=>({actionLoading:{...e.actionLoading,play:!0}}))),fetch("/spotify/play",{method:"PUT",headers:{"Content-Type":"application/json"}}).then((e=>{if(!e.ok)return e.json().then((e=>{throw new Error(e.error||"Failed to start playback")}));this.showNotification("Playback started","success")})).catch((e=>{this.handleApiError(e,"Failed to start playback")})).finally((()=>{setTimeout((()=>{this.setState((e=>({actionLoading:{...e.actionLoading,play:!1}})))}),500)}))}handleVolumeChange(e,t){this.setState({volume:t})}showNotification(e,t="info"){this.setState({notification:{show:!0,message:e,type:t}})}handleCloseNotification(){this.setState({notification:{...this.state.notification,show:!1}})}handleApiError(e,t){console.error(e);const n=e.message||t;n.includes("premium")||n.toLowerCase().includes("forbidden")||n.includes("403")?this.setState({showPremiumNotice:!0,spotifyError:"Spotify Premium Required",notification:{show:!0,message:"This feature requires Spotify Premium",type:"info"}}):this.setState({spotifyError:n,notification:{show:!0,message:n,type:"error"}})}handlePremiumNoticeClose(){this.setState({showPremiumNotice:!1})}leaveButtonPressed(){this.setState((e=>({actionLoading:{...e.actionLoading,leave:!0}}))),fetch("/api/leave-room",{method:"POST",headers:{"Content-Type":"application/json"}}).then((e=>{if(!e.ok)throw new Error("Failed to leave room");this.showNotification("Leaving room...","info"),setTimeout((()=>{this.props.leaveRoomCallback(),this.props.history.push("/")}),1e3)})).catch((e=>{console.error("Error leaving room:",e),this.setState({notification:{show:!0,message:"Error leaving room. Please try again.",type:"error"},actionLoading:{...this.state.actionLoading,leave:!1}})}))}updateShowSettings(e){this.setState({showSettings:e})}formatTime(e){return e?`${Math.floor(e/6e4)}:${(e%6e4/1e3).toFixed(0).padStart(2,"0")}`:"0:00"}renderSettings(){return e.createElement(So,{maxWidth:"md"},e.createElement(R,{in:!0,timeout:500},e.createElement(L,{className:"music-card"},e.createElement(_,null,e.createElement(W,{container:!0,spacing:3},e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(q,{variant:"h4",className:"main-title"},"Room Settings")),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement($r,{update:!0,votesToSkip:this.state.votesToSkip,guestCanPause:this.state.guestCanPause,roomCode:this.roomCode,updateCallback:this.getRoomDetails})),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(Zt,{className:"action-button",variant:"contained",onClick:()=>this.updateShowSettings(!1)},"Back to Music")))))))}renderSettingsButton(){return e.createElement(Ia,{title:"Room Settings"},e.createElement(dn,{className:"control-button",onClick:()=>this.updateShowSettings(!0)},e.createElement(ui.A,null)))}render(){if(this.state.loading)return e.createElement(xo,{display:"flex",flexDirection:"column",justifyContent:"center",alignItems:"center",minHeight:"100vh"},e.createElement(nn,{className:"loading-pulse",size:60}),e.createElement(q,{variant:"h6",className:"loading-pulse",style:{marginTop:20}},"Loading Room..."));if(this.state.showSettings)return this.renderSettings();const{song:t,notification:n,actionLoading:r,showPremiumNotice:o}=this.state,a=t.time/t.duration*100||0;return e.createElement(So,{maxWidth:"md"},e.createElement(R,{in:!0,timeout:500},e.createElement("div",null,e.createElement(L,{className:"music-card",elevation:3},e.createElement(_,null,e.createElement(W,{container:!0,spacing:2,alignItems:"center"},e.createElement(W,{item:!0,xs:12,sm:6,align:"center"},e.createElement("div",{className:"room-code"},e.createElement(q,{variant:"h6",component:"span"},"Room Code: ",this.roomCode))),e.createElement(W,{item:!0,xs:12,sm:6,align:"center"},e.createElement(Ba,{icon:this.state.isHost?e.createElement(gr.A,null):e.createElement(fi.A,null),label:this.state.isHost?"Host":"Guest",color:this.state.isHost?"primary":"default",style:{marginRight:8}}),e.createElement(Ba,{icon:this.state.spotifyAuthenticated?e.createElement(gr.A,null):e.createElement(pi.A,null),label:"Spotify",color:this.state.spotifyAuthenticated?"primary":"secondary"}))))),e.createElement(L,{className:"music-card",style:{marginTop:20}},e.createElement(_,null,t.title?e.createElement(W,{container:!0,spacing:3},e.createElement(W,{item:!0,xs:12,md:4,align:"center"},e.createElement(xo,{className:"album-cover",mb:2},e.createElement("img",{src:t.image_url,alt:t.title,style:{width:"100%",height:"auto"}})),e.createElement(O,{elevation:2,style:{padding:"8px 15px",display:"inline-block",borderRadius:"20px"}},e.createElement(q,{variant:"body2"},"Votes to Skip: ",e.createElement("b",null,t.votes||0)," / ",e.createElement("b",null,t.votes_required||this.state.votesToSkip)))),e.createElement(W,{item:!0,xs:12,md:8,className:"song-info"},e.createElement(q,{variant:"h4",component:"h2",gutterBottom:!0},t.title),e.createElement(q,{variant:"h6",color:"textSecondary",gutterBottom:!0},t.artist),t.stale&&e.createElement(q,{variant:"body2",color:"textSecondary"},"Spotify is not responding, showing the last known song"),e.createElement(xo,{my:3},e.createElement(W,{container:!0,spacing:2,alignItems:"center"},e.createElement(W,{item:!0,xs:2},e.createElement(q,{variant:"body2"},this.formatTime(t.time))),e.createElement(W,{item:!0,xs:8},e.createElement($a,{variant:"determinate",value:a,className:"progress-bar"})),e.createElement(W,{item:!0,xs:2,align:"right"},e.createElement(q,{variant:"body2"},this.formatTime(t.duration))))),e.createElement(xo,{className:"music-controls",mb:3},this.state.guestCanPause||this.state.isHost?e.createElement(Ia,{title:t.is_playing?"Pause":"Play"},e.createElement("div",null,e.createElement(dn,{className:"control-button "+(t.is_playing?"pause-button":"play-button"),onClick:()=>t.is_playing?this.pauseSong():this.playSong(),size:"medium",disabled:r.play||r.pause},r.play||r.pause?e.createElement(nn,{size:24,color:"inherit"}):t.is_playing?e.createElement(li.A,{fontSize:"large"}):e.createElement(ii.A,{fontSize:"large"})))):null,e.createElement(Ia,{title:e.createElement("div",null,e.createElement(q,{variant:"body2"},"Skip"),e.createElement(q,{variant:"caption"},"Requires Spotify Premium"))},e.createElement("div",{style:{position:"relative"}},e.createElement(Ha,{badgeContent:`${t.votes}/${t.votes_required}`,color:"secondary"},e.createElement(dn,{className:"control-button skip-button",onClick:this.skipSong,size:"medium",disabled:r.skip},r.skip?e.createElement(nn,{size:24,color:"inherit"}):e.createElement(si.A,{fontSize:"large"}),e.createElement("div",{style:{position:"absolute",top:-5,right:-5,background:"rgba(0,0,0,0.5)",borderRadius:"50%",padding:3}},e.createElement(hi.A,{style:{fontSize:12,color:"#1DB954"}})))))),this.state.isHost&&this.renderSettingsButton()),e.createElement(xo,{mx:2,mb:2},e.createElement(W,{container:!0,spacing:2,alignItems:"center"},e.createElement(W,{item:!0},e.createElement(di.A,null)),e.createElement(W,{item:!0,xs:!0},e.createElement(ri,{value:this.state.volume,onChange:this.handleVolumeChange,"aria-labelledby":"volume-slider"})),e.createElement(W,{item:!0},e.createElement(ci.A,null)))))):e.createElement(xo,{display:"flex",flexDirection:"column",alignItems:"center",p:3},e.createElement(mi.A,{style:{fontSize:60,color:"#1e3c72",marginBottom:20}}),e.createElement(q,{variant:"h5",style:{color:"#666"}},"No song currently playing"),e.createElement(q,{variant:"body2",style:{color:"#888",marginTop:10}},"Play a song on Spotify to get started")))),e.createElement(xo,{mt:3,mb:5,display:"flex",justifyContent:"center"},e.createElement(Zt,{className:"action-button leave-button",variant:"contained",size:"large",startIcon:r.leave?e.createElement(nn,{size:24,color:"inherit"}):e.createElement(vr.A,null),onClick:this.leaveButtonPressed,disabled:r.leave},r.leave?"Leaving...":"Leave Room")),t.title&&e.createElement(L,{className:"music-card",style:{marginTop:20}},e.createElement(_,null,e.createElement(W,{container:!0,spacing:2,alignItems:"center"},e.createElement(W,{item:!0},e.createElement(vi.A,{style:{color:"#1DB954"}})),e.createElement(W,{item:!0,xs:!0},e.createElement(q,{variant:"body1"},e.createElement("strong",null,"Note:")," Playback controls require Spotify Premium. The display will update as songs play, but you'll need a premium account to control playback."))))))),e.createElement(gi,{open:o,onClose:this.handlePremiumNoticeClose}),e.createElement(un,{open:n.show,autoHideDuration:6e3,onClose:this.handleCloseNotification,anchorOrigin:{vertical:"bottom",horizontal:"center"}},e.createElement(xn,{onClose:this.handleCloseNotification,severity:n.type,variant:"filled"},n.message)))}}var bi=n(7201);function xi(){return xi=Object.assign?Object.assign.bind():function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)({}).hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},xi.apply(null,arguments)}class wi extends e.Component{constructor(e){super(e),this.state={roomCode:null,loading:!0},this.clearRoomCode=this.clearRoomCode.bind(this)}async componentDidMount(){fetch("/api/user-in-room").then((e=>e.json())).then((e=>{this.setState({roomCode:e.code,loading:!1})})).catch((e=>{console.error("Error fetching room:",e),this.setState({loading:!1})}))}renderHomePage(){return this.state.loading?e.createElement(xo,{display:"flex",justifyContent:"center",alignItems:"center",minHeight:"100vh"},e.createElement(nn,{className:"loading-pulse",size:60})):e.createElement(So,null,e.createElement(R,{in:!this.state.loading,timeout:1e3},e.createElement(L,{className:"music-card",elevation:6},e.createElement(_,null,e.createElement(W,{container:!0,spacing:4},e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(mi.A,{style:{fontSize:60,color:"#1e3c72",marginBottom:20}}),e.createElement(q,{variant:"h2",component:"h1",className:"main-title"},"House Party"),e.createElement(q,{variant:"h6",style:{marginBottom:30,color:"#666"}},"Join the ultimate music sharing experience")),e.createElement(W,{item:!0,xs:12,sm:6,align:"center"},e.createElement(Zt,{className:"action-button join-button",variant:"contained",size:"large",startIcon:e.createElement(fi.A,null),component:fr,to:"/join",fullWidth:!0},"Join a Room")),e.createElement(W,{item:!0,xs:12,sm:6,align:"center"},e.createElement(Zt,{className:"action-button create-button",variant:"contained",size:"large",startIcon:e.createElement(bi.A,null),component:fr,to:"/create",fullWidth:!0},"Create a Room")),e.createElement(W,{item:!0,xs:12,align:"center"},e.createElement(q,{variant:"body2",style:{marginTop:20,color:"#666"}},"Control Spotify playback with friends in real-time")))))))}clearRoomCode(){this.setState({roomCode:null})}render(){return e.createElement(ir,null,e.createElement("div",{className:"app-container"},e.createElement(ar,null,e.createElement(or,{exact:!0,path:"/",render:()=>this.state.roomCode?e.createElement(er,{to:`/room/${this.state.roomCode}`}):this.renderHomePage()}),e.createElement(or,{path:"/join",component:xr}),e.createElement(or,{path:"/create",component:$r}),e.createElement(or,{path:"/room/:roomCode",render:t=>e.createElement(yi,xi({},t,{leaveRoomCallback:this.clearRoomCode}))}))))}}class Ei extends e.Component{constructor(e){super(e)}render(){return e.createElement("div",{className:"center"},e.createElement(wi,null))}}const ki=document.getElementById("app");(0,t.render)(e.createElement(Ei,null),ki);var Si=new Array([62,35,255],[60,255,60],[255,35,98],[45,175,230],[255,0,255],[255,128,0]),Ai=0,Ci=[0,1,2,3];setInterval((function(){if(void 0!==$){var e=Si[Ci[0]],t=Si[Ci[1]],n=Si[Ci[2]],r=Si[Ci[3]],o=1-Ai,a="rgb("+Math.round(o*e[0]+Ai*t[0])+","+Math.round(o*e[1]+Ai*t[1])+","+Math.round(o*e[2]+Ai*t[2])+")",i="rgb("+Math.round(o*n[0]+Ai*r[0])+","+Math.round(o*n[1]+Ai*r[1])+","+Math.round(o*n[2]+Ai*r[2])+")";$("#gradient").css({background:"-webkit-gradient(linear, left top, right top, from("+a+"), to("+i+"))"}).css({background:"-moz-linear-gradient(left, "+a+" 0%, "+i+" 100%)"}),(Ai+=.002)>=1&&(Ai%=1,Ci[0]=Ci[1],Ci[2]=Ci[3],Ci[1]=(Ci[1]+Math.floor(1+Math.random()*(Si.length-1)))%Si.length,Ci[3]=(Ci[3]+Math.floor(1+Math.random()*(Si.length-1)))%Si.length)}}),10)})()})();
\ No newline at end of file
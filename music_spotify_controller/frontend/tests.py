@@ -1,3 +1,11 @@
 from django.test import TestCase
 
-# Create your tests here.
+
+class IndexTests(TestCase):
+    def test_event_stream_is_off_under_wsgi(self):
+        response = self.client.get('/')
+        self.assertContains(response, 'data-event-stream="false"')
+
+    async def test_event_stream_is_on_under_asgi(self):
+        response = await self.async_client.get('/')
+        self.assertContains(response, 'data-event-stream="true"')
@@ -1,7 +1,9 @@
+from django.core.handlers.asgi import ASGIRequest
 from django.shortcuts import render
 
 # Create your views here.
 
 
 def index(request, *args, **kwargs):
-    return render(request, 'frontend/index.html')
+    # Rooms only use the now-playing stream when served over ASGI, see Room.js
+    return render(request, 'frontend/index.html', {'event_stream': isinstance(request, ASGIRequest)})
@@ -13,4 +13,9 @@ from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'music_controller.settings')
 
-application = get_asgi_application()
+django_application = get_asgi_application()
+
+# Imported once Django is set up
+from spotify.asgi import NowPlayingStreamRouter  # noqa: E402
+
+application = NowPlayingStreamRouter(django_application)
@@ -0,0 +1,37 @@
+"""
+Cache configuration from the environment.
+
+CACHE_URL selects the backend shared by the worker processes:
+
+    locmem://            per-process memory (the default, fine for tests)
+    file:///var/cache/music
+                         a directory shared by processes on one machine
+    redis://host:6379/0  Redis, shared by every machine (needs `pip install redis`)
+"""
+from urllib.parse import urlparse, unquote
+
+
+def cache_from_url(url, base_dir, key_prefix=''):
+    parsed = urlparse(url)
+
+    if parsed.scheme == 'locmem':
+        config = {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': parsed.netloc or 'music-controller',
+        }
+    elif parsed.scheme == 'file':
+        path = unquote(parsed.netloc + parsed.path)
+        config = {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': path if path.startswith('/') else str(base_dir / path),
+        }
+    elif parsed.scheme in ('redis', 'rediss'):
+        config = {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': url,
+        }
+    else:
+        raise ValueError(f"Unsupported CACHE_URL scheme: {parsed.scheme!r}")
+
+    config['KEY_PREFIX'] = key_prefix
+    return config
@@ -11,6 +11,10 @@ https://docs.djangoproject.com/en/3.1/ref/settings/
 """
 
 from pathlib import Path
+import os
+
+from .caches import cache_from_url
+from .db import database_from_url
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -44,13 +48,15 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'spotify.middleware.metrics_middleware',
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
+    'api.middleware.LazySessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'spotify.middleware.request_budget_middleware',
 ]
 
 ROOT_URLCONF = 'music_controller.urls'
@@ -77,14 +83,38 @@ WSGI_APPLICATION = 'music_controller.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/3.1/ref/settings/#databases
 
+# Set DATABASE_URL to use PostgreSQL, see music_controller/db.py
 DATABASES = {
-    'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
-    }
+    'default': database_from_url(os.environ.get('DATABASE_URL', 'sqlite:///db.sqlite3'), BASE_DIR)
+}
+
+
+# Set CACHE_URL to share caches between processes, see music_controller/caches.py
+CACHES = {
+    'default': cache_from_url(os.environ.get('CACHE_URL', 'locmem://'), BASE_DIR,
+                              key_prefix=os.environ.get('CACHE_KEY_PREFIX', 'music')),
 }
 
 
+# Sessions are read from the cache and written through to the database.
+# Set SESSION_ENGINE=django.contrib.sessions.backends.cache to keep them in
+# the cache only, which needs a persistent, shared CACHE_URL.
+SESSION_ENGINE = os.environ.get('SESSION_ENGINE', 'django.contrib.sessions.backends.cached_db')
+SESSION_CACHE_ALIAS = 'default'
+
+
+# /api/room lists rooms API_ROOM_PAGE_SIZE at a time, or up to
+# API_ROOM_MAX_PAGE_SIZE with ?page_size=. /api/room/export reads the table
+# API_ROOM_EXPORT_BATCH_SIZE rooms at a time.
+API_ROOM_PAGE_SIZE = 50
+API_ROOM_MAX_PAGE_SIZE = 500
+API_ROOM_EXPORT_BATCH_SIZE = 1000
+
+# Longest time (in seconds) a room looked up by code is served from the
+# cache. Entries are dropped whenever the app changes the room.
+API_ROOM_CACHE_TTL = 60
+
+
 # Password validation
 # https://docs.djangoproject.com/en/3.1/ref/settings/#auth-password-validators
 
@@ -123,13 +153,131 @@ USE_TZ = True
 
 STATIC_URL = '/static/'
 
+# Spotify
+# Where the Web API and the accounts service are. Point both at
+# `manage.py fake_spotify` to run and benchmark everything offline.
+SPOTIFY_API_BASE_URL = os.environ.get('SPOTIFY_API_BASE_URL', 'https://api.spotify.com/v1/')
+SPOTIFY_ACCOUNTS_URL = os.environ.get('SPOTIFY_ACCOUNTS_URL', 'https://accounts.spotify.com/')
+
+# Connection pooling for the shared Spotify HTTP session: number of hosts
+# to keep pools for, connections kept per host, and whether to keep them
+# alive between requests.
+SPOTIFY_HTTP_POOL_CONNECTIONS = 4
+SPOTIFY_HTTP_POOL_MAXSIZE = 20
+SPOTIFY_HTTP_KEEP_ALIVE = True
+
+# Latency budget for Spotify calls. All calls made while serving one request,
+# retries included, must finish within SPOTIFY_REQUEST_BUDGET seconds, and a
+# single attempt is bounded by the (connect, read) SPOTIFY_HTTP_TIMEOUT.
+# Retries never sleep in a sync worker thread: only immediate retries are
+# made there, anything that needs a backoff is left to the next poll.
+SPOTIFY_REQUEST_BUDGET = 5.0
+SPOTIFY_HTTP_TIMEOUT = (3.05, 5)
+SPOTIFY_RETRY = {
+    'MAX_ATTEMPTS': 3,
+    'BASE_DELAY': 0.25,
+    'MAX_DELAY': 2.0,
+    'JITTER': 0.5,
+}
+
+# Rate limits in front of the Spotify Web API: calls per second and burst
+# size app-wide and per host token, shared by all worker processes through
+# the shared cache. Polls must leave POLL_RESERVE of each bucket for
+# play/pause/skip. After a 429 without Retry-After, back off for
+# DEFAULT_RETRY_AFTER seconds.
+SPOTIFY_RATE_LIMIT = {
+    'APP_RATE': 20,
+    'APP_BURST': 40,
+    'HOST_RATE': 2,
+    'HOST_BURST': 10,
+    'POLL_RESERVE': 0.25,
+    'DEFAULT_RETRY_AFTER': 5,
+}
+
+# Circuit breaker per class of Spotify endpoint: open after FAILURE_THRESHOLD
+# consecutive failures and probe again after RESET_TIMEOUT seconds. While
+# Spotify is unavailable, rooms are served their last known snapshot, marked
+# stale, for up to SPOTIFY_NOW_PLAYING_STALE_TTL seconds.
+SPOTIFY_CIRCUIT_BREAKER = {
+    'FAILURE_THRESHOLD': 5,
+    'RESET_TIMEOUT': 15,
+}
+SPOTIFY_NOW_PLAYING_STALE_TTL = 300
+
+# Addresses allowed to read /spotify/metrics (Prometheus text format), or
+# None to allow everyone.
+SPOTIFY_METRICS_ALLOWED_IPS = ['127.0.0.1', '::1']
+
+# `manage.py housekeeping`: rooms older than ROOM_IDLE_AFTER seconds whose
+# host stopped polling are deleted, as are tokens that expired over
+# TOKEN_RETENTION seconds ago. Rows are deleted BATCH_SIZE at a time,
+# pausing BATCH_PAUSE seconds between batches.
+SPOTIFY_HOUSEKEEPING = {
+    'BATCH_SIZE': 500,
+    'BATCH_PAUSE': 0.05,
+    'ROOM_IDLE_AFTER': 6 * 60 * 60,
+    'TOKEN_RETENTION': 30 * 24 * 60 * 60,
+}
+
+# Serve current-song, play, pause and skip with async views that await
+# Spotify through httpx. Only useful when running the ASGI application, so
+# set SPOTIFY_ASYNC_VIEWS=1 in the environment of ASGI deployments.
+SPOTIFY_ASYNC_VIEWS = os.environ.get('SPOTIFY_ASYNC_VIEWS', '').lower() in ('1', 'true', 'yes')
+SPOTIFY_ASYNC_HTTP_MAX_CONNECTIONS = 100
+
+# Cache (from CACHES) holding state shared by all worker processes: tokens,
+# device lists, now-playing snapshots, vote counts and the refresh lock.
+SPOTIFY_CACHE_ALIAS = 'default'
+
+# How long (in seconds) a room's now-playing snapshot is shared between
+# listeners before the next poll goes upstream again.
+SPOTIFY_NOW_PLAYING_TTL = 1.0
+
+# Milliseconds a playing song's progress may drift from what its start time
+# predicts before its snapshot gets a new version (and ETag).
+SPOTIFY_NOW_PLAYING_PROGRESS_TOLERANCE = 1500
+
+# Longest time (in seconds) a token row is served from memory before it is
+# re-read from the database. Entries also expire with the access token.
+SPOTIFY_TOKEN_CACHE_TTL = 300
+
+# Access tokens expiring within this many seconds are refreshed in the
+# background. The cross-process refresh lock is held for at most
+# SPOTIFY_TOKEN_REFRESH_LOCK_TIMEOUT seconds.
+SPOTIFY_TOKEN_REFRESH_MARGIN = 60
+SPOTIFY_TOKEN_REFRESH_LOCK_TIMEOUT = 30
+
+# How long (in seconds) a host's player/devices list is reused.
+SPOTIFY_DEVICE_CACHE_TTL = 10
+
+# How long (in seconds) a song's skip-vote count is served from the cache.
+# Counts are dropped from the cache whenever a vote changes them.
+SPOTIFY_VOTE_CACHE_TTL = 5
+
+# /spotify/current-song/stream: seconds between messages, seconds before the
+# browser is asked to reconnect, and ticks between re-reads of the room row.
+SPOTIFY_STREAM_INTERVAL = 1.0
+SPOTIFY_STREAM_MAX_AGE = 300
+SPOTIFY_STREAM_ROOM_REFRESH = 10
+
+# Poll Spotify from a background thread for rooms that have listeners, so
+# that reads are served from memory. Up to SPOTIFY_POLLER_WORKERS rooms are
+# polled at once. Intervals are in seconds.
+SPOTIFY_BACKGROUND_POLLER = False
+SPOTIFY_POLLER_WORKERS = 8
+SPOTIFY_POLLER_INTERVAL = 2.0
+SPOTIFY_POLLER_FAST_INTERVAL = 0.5
+SPOTIFY_POLLER_PAUSED_INTERVAL = 5.0
+SPOTIFY_POLLER_NEAR_END = 5.0
+SPOTIFY_POLLER_IDLE_TIMEOUT = 15.0
+
 # Logging Configuration
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
     'formatters': {
         'verbose': {
-            'format': '{levelname} {asctime} {module} {message}',
+            'format': '{levelname} {asctime} {module} [{request_id}] {message}',
             'style': '{',
         },
         'simple': {
@@ -137,17 +285,25 @@ LOGGING = {
             'style': '{',
         },
     },
+    'filters': {
+        # Tags records with the id sent back in the X-Request-ID header
+        'request_id': {
+            '()': 'spotify.metrics.RequestIdFilter',
+        },
+    },
     'handlers': {
         'console': {
             'level': 'DEBUG',
             'class': 'logging.StreamHandler',
             'formatter': 'verbose',
+            'filters': ['request_id'],
         },
         'file': {
             'level': 'DEBUG',
             'class': 'logging.FileHandler',
             'filename': BASE_DIR / 'logs' / 'spotify.log',
             'formatter': 'verbose',
+            'filters': ['request_id'],
         },
     },
     'loggers': {
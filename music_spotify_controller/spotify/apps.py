@@ -1,5 +1,10 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class SpotifyConfig(AppConfig):
     name = 'spotify'
+
+    def ready(self):
+        from .metrics import instrument_connection
+        connection_created.connect(instrument_connection, dispatch_uid='instrument_connection')
@@ -0,0 +1,137 @@
+"""
+Serves the now-playing stream in front of Django's ASGI handler.
+
+Under ASGI, Django runs sync middleware on a thread of the request's own,
+and keeps that thread until the request ends. For an event stream that is
+its whole life, so every open stream would hold a thread. Stream requests
+are answered here instead: the session and the room are read from the
+shared cache, or from the database in the shared thread pool, and then
+RoomEventStream is iterated on the event loop. Every other request goes on
+to Django.
+
+As Django's middleware doesn't run for the stream, the router validates
+the Host header against ALLOWED_HOSTS itself, handing requests for other
+hosts to Django to refuse, and records the request's metrics the way
+metrics_middleware would. The stream reads Spotify through the
+now-playing cache, whose fetches get their own request budgets, as they
+would for any response streamed by Django.
+"""
+from http.cookies import SimpleCookie
+from importlib import import_module
+import asyncio
+import json
+
+from django.conf import settings
+from django.core.exceptions import DisallowedHost
+from django.http import HttpRequest
+
+from api.room_cache import room_cache, get_room
+from .async_util import database_sync_to_async
+from .metrics import collect_request_metrics, record_request
+from .now_playing import RoomEventStream
+
+STREAM_PATH = '/spotify/current-song/stream'
+STREAM_ROUTE = 'spotify/current-song/stream'
+
+
+def session_room_code(session_key):
+    """The room code stored in a session, or None."""
+    engine = import_module(settings.SESSION_ENGINE)
+    return engine.SessionStore(session_key).get('room_code')
+
+
+def session_key_from(scope):
+    cookies = SimpleCookie()
+    for name, value in scope.get('headers', []):
+        if name == b'cookie':
+            cookies.load(value.decode('latin-1'))
+    morsel = cookies.get(settings.SESSION_COOKIE_NAME)
+    return morsel.value if morsel is not None else None
+
+
+def request_path(scope):
+    """The request's path within the application, without the prefix it is mounted under."""
+    path, root_path = scope['path'], scope.get('root_path', '')
+    if root_path and path.startswith(root_path):
+        path = path[len(root_path):]
+    return path
+
+
+def host_allowed(scope):
+    """Whether Django would accept the request's Host header, see HttpRequest.get_host."""
+    request = HttpRequest()
+    for name, value in scope.get('headers', []):
+        if name in (b'host', b'x-forwarded-host'):
+            request.META['HTTP_' + name.decode('latin-1').upper().replace('-', '_')] = value.decode('latin-1')
+    server_name, server_port = scope.get('server') or ('unknown', 0)
+    request.META['SERVER_NAME'], request.META['SERVER_PORT'] = server_name, str(server_port)
+    try:
+        request.get_host()
+    except DisallowedHost:
+        return False
+    return True
+
+
+async def wait_for_disconnect(receive):
+    while (await receive())['type'] != 'http.disconnect':
+        pass
+
+
+class NowPlayingStreamRouter:
+    """ASGI application that answers STREAM_PATH itself and hands everything else to `application`."""
+
+    def __init__(self, application):
+        self.application = application
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or request_path(scope) != STREAM_PATH or not host_allowed(scope):
+            return await self.application(scope, receive, send)
+
+        with collect_request_metrics() as metrics:
+            room, error = await self.session_room(scope)
+        seconds = metrics.elapsed()
+        record_request(STREAM_ROUTE, scope['method'], 404 if error is not None else 200, metrics, seconds)
+        headers = [(b'server-timing', metrics.server_timing(seconds).encode()),
+                   (b'x-request-id', metrics.request_id.encode())]
+
+        if error is not None:
+            return await self.send_error(send, error, headers)
+
+        stream = asyncio.ensure_future(self.send_events(send, RoomEventStream(room), headers))
+        disconnect = asyncio.ensure_future(wait_for_disconnect(receive))
+        done, pending = await asyncio.wait({stream, disconnect}, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        for task in done:
+            task.result()
+
+    async def session_room(self, scope):
+        """(room, None) for the requesting session's room, or (None, error)."""
+        session_key = session_key_from(scope)
+        room_code = await database_sync_to_async(session_room_code)(session_key) if session_key else None
+        if not room_code:
+            return None, "No room code in session"
+
+        room = room_cache.get(room_code)
+        if room is None:
+            room = await database_sync_to_async(get_room)(room_code)
+        if room is None:
+            return None, "Room not found"
+        return room, None
+
+    async def send_error(self, send, message, headers):
+        await send({'type': 'http.response.start', 'status': 404,
+                    'headers': [(b'content-type', b'application/json'), *headers]})
+        await send({'type': 'http.response.body', 'body': json.dumps({'error': message}).encode()})
+
+    async def send_events(self, send, events, headers):
+        await send({'type': 'http.response.start', 'status': 200, 'headers': [
+            (b'content-type', b'text/event-stream'),
+            (b'cache-control', b'no-cache'),
+            (b'x-accel-buffering', b'no'),
+            *headers,
+        ]})
+        async for message in events:
+            await send({'type': 'http.response.body', 'body': message, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b''})
@@ -0,0 +1,269 @@
+"""
+Async counterparts of the helpers in spotify.util.
+
+They talk to Spotify through a pooled httpx.AsyncClient, so an ASGI worker
+can have many upstream calls in flight without holding a thread for each.
+Retry backoffs are awaited with asyncio.sleep, within the same time budget
+as the sync helpers. Database access and token refreshes go through the
+sync helpers in spotify.util, run by database_sync_to_async, so they share
+its caches and refresh coordination.
+"""
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+from asgiref.sync import sync_to_async
+import asyncio
+import weakref
+import logging
+
+import httpx
+
+from .util import (api_url, token_cache, token_refresher, device_cache, get_user_tokens,
+                   get_playback_error_message, pick_fallback_device, with_device_id,
+                   playback_error, rate_limited_result, circuit_open_result)
+from .retry import RetryPolicy, current_deadline, http_timeout, is_retryable_status, parse_retry_after
+from .ratelimit import rate_limiter, COMMAND, POLL
+from .breaker import circuit_breakers
+from .metrics import spotify_call, record_retry, record_shed, record_sleep
+
+logger = logging.getLogger(__name__)
+
+# AsyncClient connections belong to the event loop they were opened on
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def database_sync_to_async(func):
+    """
+    Wrap a sync helper that reads or writes the database to run in the
+    shared thread pool. sync_to_async's default, thread_sensitive=True,
+    would run it on a thread of the request's own, which a long-lived
+    request such as the event stream keeps for its whole life. Connections
+    are closed afterwards as at the end of a request, once past
+    CONN_MAX_AGE.
+    """
+    def run(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+    return sync_to_async(run, thread_sensitive=False)
+
+
+async def aget_user_tokens(session_id):
+    # Skip the thread hop when the tokens are already cached
+    tokens = token_cache.get(session_id)
+    if tokens is not None:
+        return tokens
+    return await database_sync_to_async(get_user_tokens)(session_id)
+
+
+def get_async_http_client():
+    """Return the pooled AsyncClient for the running event loop."""
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        keep_alive = getattr(settings, 'SPOTIFY_HTTP_KEEP_ALIVE', True)
+        pool_size = getattr(settings, 'SPOTIFY_HTTP_POOL_MAXSIZE', 20)
+        client = httpx.AsyncClient(
+            timeout=10,
+            limits=httpx.Limits(
+                max_connections=getattr(settings, 'SPOTIFY_ASYNC_HTTP_MAX_CONNECTIONS', 100),
+                max_keepalive_connections=pool_size if keep_alive else 0
+            )
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def aensure_fresh_tokens(session_id):
+    """Async version of token_refresher.ensure_fresh, without a thread hop when nothing is due."""
+    tokens = token_cache.get(session_id)
+    if tokens is not None and not token_refresher.needs_refresh(tokens):
+        return tokens
+    return await database_sync_to_async(token_refresher.ensure_fresh)(session_id)
+
+
+async def aexecute_spotify_api_request(session_id, endpoint, post_=False, put_=False, data=None, priority=None):
+    """Async version of execute_spotify_api_request, which awaits its retry backoffs."""
+    tokens = await aensure_fresh_tokens(session_id)
+    if not tokens:
+        logger.error(f"User {session_id} is not authenticated with Spotify")
+        return {'error': 'Authentication error', 'message': 'User not authenticated with Spotify'}
+
+    if tokens.expires_in <= timezone.now():
+        logger.error(f"Failed to refresh token for session {session_id}")
+        return {'error': 'Authentication error', 'message': 'Failed to refresh Spotify token'}
+
+    headers = {
+        'Content-Type': 'application/json',
+        'Authorization': f"Bearer {tokens.access_token}"
+    }
+
+    method = 'POST' if post_ else 'PUT' if put_ else 'GET'
+    if priority is None:
+        priority = POLL if method == 'GET' else COMMAND
+    url = api_url(endpoint)
+    breaker = circuit_breakers.for_endpoint(method, endpoint)
+    policy = RetryPolicy()
+    deadline = current_deadline()
+
+    for attempt in range(policy.max_attempts):
+        if deadline.expired():
+            break
+
+        wait = breaker.allow()
+        if wait:
+            logger.warning(f"Not calling {endpoint}, circuit {breaker.name} is open for {wait:.1f}s")
+            record_shed(endpoint, 'circuit_open')
+            return circuit_open_result(wait)
+
+        wait = rate_limiter.acquire(session_id, priority)
+        if wait:
+            breaker.release()
+            logger.warning(f"Holding back {method} to {endpoint} for session {session_id}, rate limited for {wait:.1f}s")
+            record_shed(endpoint, 'rate_limited')
+            return rate_limited_result(wait)
+
+        retry_after = None
+        connect_timeout, read_timeout = deadline.timeout(http_timeout())
+        try:
+            with spotify_call(method, endpoint) as call:
+                response = await get_async_http_client().request(
+                    method, url, headers=headers, json=data if method != 'GET' else None,
+                    timeout=httpx.Timeout(read_timeout, connect=connect_timeout))
+                call.status = response.status_code
+            breaker.record_response(response.status_code)
+            response.raise_for_status()
+
+            # Commands have no useful body, the request succeeding is enough
+            if method != 'GET':
+                return {}
+            if not response.content:
+                return {}
+            return response.json()
+
+        except (httpx.ConnectError, httpx.TimeoutException) as e:
+            breaker.record_failure()
+            logger.error(f"Connection error on {method} to {endpoint}: {str(e)}")
+            error = {'error': 'Connection error', 'message': f'Failed to connect to Spotify API: {str(e)}'}
+        except httpx.HTTPStatusError as e:
+            status_code = e.response.status_code
+            if status_code == 401 and attempt + 1 < policy.max_attempts:
+                refreshed = await database_sync_to_async(token_refresher.refresh)(
+                    session_id, stale_access_token=tokens.access_token)
+                if refreshed and refreshed.access_token != tokens.access_token:
+                    tokens = refreshed
+                    headers['Authorization'] = f"Bearer {tokens.access_token}"
+                    record_retry(endpoint)
+                    continue
+            logger.error(f"Request error on {method} to {endpoint}: {str(e)}")
+            error = {'error': 'API error', 'message': f'Spotify API error: {str(e)}', 'status': status_code}
+            if status_code == 429:
+                error['retry_after'] = rate_limiter.throttled(session_id, parse_retry_after(e.response))
+                return error
+            if not is_retryable_status(status_code):
+                return error
+            retry_after = parse_retry_after(e.response)
+        except httpx.HTTPError as e:
+            breaker.release()
+            logger.error(f"Request error on {method} to {endpoint}: {str(e)}")
+            return {'error': 'API error', 'message': f'Spotify API error: {str(e)}'}
+        except ValueError as e:
+            logger.error(f"JSON decode error for {endpoint}: {str(e)}")
+            return {'error': 'Parse error', 'message': 'Invalid response from Spotify API'}
+
+        delay = policy.next_delay(attempt, deadline, retry_after)
+        if delay is None:
+            if retry_after is not None:
+                error['retry_after'] = retry_after
+            return error
+        # Waiting here only suspends this coroutine, not the worker
+        record_retry(endpoint)
+        record_sleep(delay)
+        await asyncio.sleep(delay)
+
+    logger.error(f"{method} to {endpoint} ran out of time")
+    return {'error': 'Timeout', 'message': 'Spotify API request exceeded its time budget'}
+
+
+async def aget_available_devices(session_id, refresh=False, priority=POLL):
+    if not refresh:
+        devices = device_cache.get(session_id)
+        if devices is not None:
+            return devices
+
+    result = await aexecute_spotify_api_request(session_id, "player/devices", priority=priority)
+    if result and 'error' in result:
+        logger.error(f"Error getting devices for session {session_id}: {result.get('message', 'Unknown error')}")
+        return None
+
+    devices = result.get('devices', [])
+    device_cache.set(session_id, devices)
+    return devices
+
+
+async def acheck_for_active_spotify_device(session_id):
+    """Async version of check_for_active_spotify_device, same (success, message, device_name) result."""
+    devices = await aget_available_devices(session_id)
+    if devices is None:
+        return False, "Failed to retrieve Spotify devices", None
+
+    active_devices = [d for d in devices if d.get('is_active', True)]
+    if active_devices:
+        return True, "Active device found", active_devices[0].get('name', 'Unknown')
+
+    if not devices:
+        return False, "No Spotify devices found. Please open Spotify on any device and try again.", None
+
+    device = devices[0]
+    logger.info(f"No active device found. Attempting to activate device: {device.get('name', 'Unknown')}")
+    transfer_result = await aexecute_spotify_api_request(
+        session_id, "player", put_=True,
+        data={"device_ids": [device.get('id')], "play": False})
+
+    if transfer_result is None or 'error' not in transfer_result:
+        device_cache.invalidate(session_id)
+        return True, f"Activated Spotify on {device.get('name', 'Unknown')}", device.get('name', 'Unknown')
+
+    logger.warning(f"Failed to activate device: {transfer_result.get('message', 'Unknown error')}")
+    return False, "Failed to activate Spotify device. Please manually start playback on your device.", None
+
+
+async def asend_playback_command(session_id, endpoint, post_=False, put_=False, data=None):
+    """Async version of send_playback_command."""
+    result = await aexecute_spotify_api_request(session_id, endpoint, post_=post_, put_=put_, data=data)
+    if not (result and result.get('status') == 404):
+        return result
+
+    device = pick_fallback_device(session_id, await aget_available_devices(session_id, refresh=True, priority=COMMAND))
+    result = await aexecute_spotify_api_request(
+        session_id, with_device_id(endpoint, device.get('id')), post_=post_, put_=put_, data=data)
+    device_cache.invalidate(session_id)
+    return result
+
+
+async def _acontrol_playback(session_id, action, endpoint, post_=False, put_=False, **message_kwargs):
+    logger.info(f"Attempting to {action} song for session {session_id}")
+    result = await asend_playback_command(session_id, endpoint, post_=post_, put_=put_)
+
+    if result and 'error' in result:
+        error_message = get_playback_error_message(result, **message_kwargs)
+        logger.error(f"Error ({action}) for session {session_id}: {error_message}")
+        raise playback_error(result, error_message)
+
+    return result
+
+
+async def aplay_song(session_id):
+    return await _acontrol_playback(
+        session_id, 'play', "player/play", put_=True,
+        premium_message="Cannot control playback: No active device found or premium required. Please start Spotify on a device first.",
+        handle_auth=True)
+
+
+async def apause_song(session_id):
+    return await _acontrol_playback(session_id, 'pause', "player/pause", put_=True)
+
+
+async def askip_song(session_id):
+    return await _acontrol_playback(session_id, 'skip', "player/next", post_=True)
@@ -0,0 +1,122 @@
+from django.conf import settings
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+def endpoint_class(method, endpoint):
+    """
+    Group endpoints that fail together: playback commands share a class,
+    reads are classed by path, so a broken devices endpoint doesn't stop
+    currently-playing polls.
+    """
+    if method != 'GET':
+        return 'player-commands'
+    return endpoint.split('?', 1)[0]
+
+
+class CircuitBreaker:
+    """
+    Stops calling an endpoint class that keeps failing.
+
+    After FAILURE_THRESHOLD consecutive failures (connection errors,
+    timeouts and 5xx answers) the circuit opens and calls fail straight
+    away. After RESET_TIMEOUT seconds it half-opens and lets a single probe
+    call through: if it succeeds the circuit closes, otherwise it opens
+    again. A probe that never reports back is given up on after another
+    RESET_TIMEOUT, so the breaker can't get stuck half-open.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0
+        self.probe_started_at = None
+        self._lock = threading.Lock()
+
+    def _option(self, name, default):
+        return getattr(settings, 'SPOTIFY_CIRCUIT_BREAKER', {}).get(name, default)
+
+    def allow(self):
+        """Return 0 if a call may be made now, otherwise the seconds until the next probe."""
+        reset_timeout = self._option('RESET_TIMEOUT', 15)
+        with self._lock:
+            if self.state == CLOSED:
+                return 0
+
+            now = time.monotonic()
+            if self.state == OPEN:
+                wait = self.opened_at + reset_timeout - now
+                if wait > 0:
+                    return wait
+                logger.info(f"Circuit for {self.name} half-open, probing Spotify")
+                self.state = HALF_OPEN
+                self.probe_started_at = None
+
+            if self.probe_started_at is not None and now - self.probe_started_at < reset_timeout:
+                return self.probe_started_at + reset_timeout - now
+            self.probe_started_at = now
+            return 0
+
+    def release(self):
+        """Hand back a call that was allowed but never made."""
+        with self._lock:
+            self.probe_started_at = None
+
+    def record_success(self):
+        with self._lock:
+            if self.state != CLOSED:
+                logger.info(f"Circuit for {self.name} closed, Spotify has recovered")
+            self.state = CLOSED
+            self.failures = 0
+            self.probe_started_at = None
+
+    def record_response(self, status_code):
+        """Record that Spotify answered; only 5xx answers count as failures."""
+        if status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self._option('FAILURE_THRESHOLD', 5):
+                if self.state != OPEN:
+                    logger.warning(f"Circuit for {self.name} opened after {self.failures} failures")
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.probe_started_at = None
+
+
+class CircuitBreakers:
+    """One CircuitBreaker per endpoint class."""
+
+    def __init__(self):
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self._breakers[name] = CircuitBreaker(name)
+            return breaker
+
+    def for_endpoint(self, method, endpoint):
+        return self.get(endpoint_class(method, endpoint))
+
+    def reset(self):
+        """Forget every breaker, closing all circuits."""
+        with self._lock:
+            self._breakers.clear()
+
+
+circuit_breakers = CircuitBreakers()
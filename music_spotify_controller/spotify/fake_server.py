@@ -0,0 +1,403 @@
+"""
+A stand-in for the Spotify Web API and accounts service, for load tests
+and offline runs. Start it with `manage.py fake_spotify`, or in-process
+with FakeSpotifyServer, and point SPOTIFY_API_BASE_URL and
+SPOTIFY_ACCOUNTS_URL at it.
+
+It serves the endpoints this app uses from one in-memory player whose
+songs play in real time:
+
+    POST /api/token                      access tokens, for both grant types
+    GET  /authorize                      redirects straight back with a code
+    GET  /v1/me/player                   playback state
+    PUT  /v1/me/player                   transfer playback to a device
+    GET  /v1/me/player/devices
+    GET  /v1/me/player/currently-playing
+    PUT  /v1/me/player/play, /v1/me/player/pause
+    POST /v1/me/player/next
+
+Responses can be slowed down, fail at random (503, 429 with Retry-After,
+401 and 404 at configurable rates), or be forced to fail a number of
+times. Access tokens it issues expire after token_lifetime seconds; tokens
+it didn't issue are accepted unless strict_tokens is set, so tokens
+already in the database keep working.
+
+A few control endpoints, which are never slowed down or failed, let a
+test or benchmark drive it:
+
+    GET  /_fake/calls   calls received so far, e.g. {"GET player/devices": 3}
+    POST /_fake/fail    {"status": 429, "times": 2, "path": "player/next"}
+    POST /_fake/reset   forget calls, forced failures and player state
+"""
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs, urlencode
+import json
+import random
+import secrets
+import threading
+import time
+
+DEFAULT_TRACKS = [
+    {'id': 'fake-track-1', 'name': 'First Fake Song', 'duration_ms': 180000, 'artists': ['Fake Artist']},
+    {'id': 'fake-track-2', 'name': 'Second Fake Song', 'duration_ms': 210000, 'artists': ['Fake Artist', 'Guest']},
+    {'id': 'fake-track-3', 'name': 'Third Fake Song', 'duration_ms': 150000, 'artists': ['Another Artist']},
+]
+
+DEFAULT_DEVICES = [
+    {'id': 'fake-laptop', 'name': 'Fake Laptop', 'type': 'Computer', 'is_active': True},
+    {'id': 'fake-phone', 'name': 'Fake Phone', 'type': 'Smartphone', 'is_active': False},
+]
+
+
+def track_item(track):
+    return {
+        'id': track['id'],
+        'name': track['name'],
+        'duration_ms': track['duration_ms'],
+        'artists': [{'name': name} for name in track['artists']],
+        'album': {'images': [{'url': f"https://i.scdn.co/image/{track['id']}", 'height': 640, 'width': 640}]},
+    }
+
+
+class FakePlayer:
+    """Playback state of the fake account: a looping track list and its devices."""
+
+    def __init__(self, tracks=None, devices=None, is_playing=True):
+        self.tracks = list(tracks or DEFAULT_TRACKS)
+        self.devices = [dict(device) for device in (devices or DEFAULT_DEVICES)]
+        self.index = 0
+        self.is_playing = is_playing and self.active_device() is not None
+        self._progress_ms = 0
+        self._since = time.monotonic()
+
+    def active_device(self):
+        return next((device for device in self.devices if device['is_active']), None)
+
+    def progress_ms(self):
+        """Progress in the current track, moving on to the next track when it ends."""
+        if self.is_playing:
+            now = time.monotonic()
+            self._progress_ms += int((now - self._since) * 1000)
+            self._since = now
+            while self._progress_ms >= self.tracks[self.index]['duration_ms']:
+                self._progress_ms -= self.tracks[self.index]['duration_ms']
+                self.index = (self.index + 1) % len(self.tracks)
+        return self._progress_ms
+
+    def currently_playing(self):
+        progress_ms = self.progress_ms()
+        return {
+            'timestamp': int(time.time() * 1000),
+            'progress_ms': progress_ms,
+            'is_playing': self.is_playing,
+            'currently_playing_type': 'track',
+            'item': track_item(self.tracks[self.index]),
+        }
+
+    def state(self):
+        return dict(self.currently_playing(), device=dict(self.active_device(), volume_percent=50),
+                    shuffle_state=False, repeat_state='off')
+
+    def transfer(self, device_id, play=None):
+        """Make device_id the active device. Returns False if there is no such device."""
+        if not any(device['id'] == device_id for device in self.devices):
+            return False
+        self.progress_ms()
+        for device in self.devices:
+            device['is_active'] = device['id'] == device_id
+        if play is not None:
+            self.set_playing(play)
+        return True
+
+    def set_playing(self, is_playing):
+        self.progress_ms()
+        self._since = time.monotonic()
+        self.is_playing = is_playing
+
+    def next(self):
+        self.index = (self.index + 1) % len(self.tracks)
+        self._progress_ms = 0
+        self._since = time.monotonic()
+
+
+def error(status, message, reason=None):
+    body = {'error': {'status': status, 'message': message}}
+    if reason:
+        body['error']['reason'] = reason
+    return status, body, {}
+
+
+class FakeSpotify:
+    """What the fake server knows, and how it misbehaves."""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, rate_limit_rate=0.0, unauthorized_rate=0.0,
+                 not_found_rate=0.0, retry_after=1, token_lifetime=3600, strict_tokens=False, seed=None,
+                 tracks=None, devices=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.unauthorized_rate = unauthorized_rate
+        self.not_found_rate = not_found_rate
+        self.retry_after = retry_after
+        self.token_lifetime = token_lifetime
+        self.strict_tokens = strict_tokens
+        self._tracks = tracks
+        self._devices = devices
+        self.random = random.Random(seed)
+        self.player = FakePlayer(tracks, devices)
+        self.calls = Counter()
+        self.access_tokens = {}
+        self.revoked_refresh_tokens = set()
+        self._failures = []
+        self._lock = threading.Lock()
+
+    def fail_next(self, status, times=1, path=None):
+        """Answer the next `times` calls (to `path`, e.g. 'player/next' or 'api/token', if given) with status."""
+        with self._lock:
+            self._failures.append({'status': status, 'times': times, 'path': path})
+
+    def revoke(self, refresh_token):
+        with self._lock:
+            self.revoked_refresh_tokens.add(refresh_token)
+
+    def reset(self):
+        with self._lock:
+            self.calls.clear()
+            self._failures.clear()
+            self.player = FakePlayer(self._tracks, self._devices)
+
+    def call_count(self, method=None, path=None):
+        """Calls received, optionally only those with the given method and/or path."""
+        with self._lock:
+            return sum(count for call, count in self.calls.items()
+                       if (method is None or call.split(' ', 1)[0] == method)
+                       and (path is None or call.split(' ', 1)[1] == path))
+
+    def handle(self, method, path, query, headers, body):
+        """Answer one request. Returns (status, JSON body or None, extra headers)."""
+        if path.startswith('/_fake/'):
+            return self._control(method, path[len('/_fake/'):], body)
+
+        if path.startswith('/v1/me/'):
+            endpoint = path[len('/v1/me/'):]
+        elif path in ('/api/token', '/authorize'):
+            endpoint = path[1:]
+        else:
+            return error(404, 'Service not found')
+
+        with self._lock:
+            self.calls[f"{method} {endpoint}"] += 1
+
+        delay = self.latency + self.random.uniform(0, self.jitter) if self.jitter else self.latency
+        if delay:
+            time.sleep(delay)
+
+        failure = self._injected_failure(endpoint)
+        if failure is not None:
+            return failure
+
+        if endpoint == 'authorize':
+            return self._authorize(query)
+        if endpoint == 'api/token':
+            return self._token(body)
+
+        unauthorized = self._check_token(headers.get('Authorization', ''))
+        if unauthorized is not None:
+            return unauthorized
+
+        with self._lock:
+            return self._player_call(method, endpoint, query, body)
+
+    def _injected_failure(self, endpoint):
+        with self._lock:
+            for failure in self._failures:
+                if failure['path'] in (None, endpoint):
+                    failure['times'] -= 1
+                    if failure['times'] <= 0:
+                        self._failures.remove(failure)
+                    return self._failure(failure['status'])
+
+            rates = [(503, self.error_rate), (429, self.rate_limit_rate)]
+            if endpoint not in ('api/token', 'authorize'):
+                rates += [(401, self.unauthorized_rate), (404, self.not_found_rate)]
+            roll = self.random.random()
+            for status, rate in rates:
+                if roll < rate:
+                    return self._failure(status)
+                roll -= rate
+        return None
+
+    def _failure(self, status):
+        if status == 429:
+            return 429, {'error': {'status': 429, 'message': 'API rate limit exceeded'}}, \
+                {'Retry-After': str(self.retry_after)}
+        if status == 401:
+            return error(401, 'The access token expired')
+        if status == 404:
+            return error(404, 'Player command failed: No active device found', 'NO_ACTIVE_DEVICE')
+        return error(status, 'Service unavailable')
+
+    def _authorize(self, query):
+        redirect_uri = query.get('redirect_uri', [''])[0]
+        if not redirect_uri:
+            return error(400, 'Missing redirect_uri')
+        params = {'code': f"fake-code-{secrets.token_urlsafe(8)}"}
+        if 'state' in query:
+            params['state'] = query['state'][0]
+        separator = '&' if '?' in redirect_uri else '?'
+        return 302, None, {'Location': f"{redirect_uri}{separator}{urlencode(params)}"}
+
+    def _token(self, body):
+        form = {key: values[0] for key, values in parse_qs(body.decode()).items()}
+        grant_type = form.get('grant_type')
+        if grant_type not in ('authorization_code', 'refresh_token'):
+            return 400, {'error': 'unsupported_grant_type'}, {}
+        if grant_type == 'refresh_token' and form.get('refresh_token') in self.revoked_refresh_tokens:
+            return 400, {'error': 'invalid_grant', 'error_description': 'Invalid refresh token'}, {}
+
+        access_token = f"fake-access-{secrets.token_urlsafe(12)}"
+        with self._lock:
+            self.access_tokens[access_token] = time.monotonic() + self.token_lifetime
+        payload = {'access_token': access_token, 'token_type': 'Bearer',
+                   'expires_in': self.token_lifetime, 'scope': ''}
+        if grant_type == 'authorization_code':
+            payload['refresh_token'] = f"fake-refresh-{secrets.token_urlsafe(12)}"
+        return 200, payload, {}
+
+    def _check_token(self, authorization):
+        if not authorization.startswith('Bearer '):
+            return error(401, 'No token provided')
+        with self._lock:
+            expires_at = self.access_tokens.get(authorization[len('Bearer '):])
+        if expires_at is None:
+            return error(401, 'Invalid access token') if self.strict_tokens else None
+        if time.monotonic() >= expires_at:
+            return error(401, 'The access token expired')
+        return None
+
+    def _player_call(self, method, endpoint, query, body):
+        player = self.player
+        device_id = query.get('device_id', [None])[0]
+
+        if method == 'GET' and endpoint == 'player/devices':
+            return 200, {'devices': [dict(device, volume_percent=50) for device in player.devices]}, {}
+        if method == 'GET' and endpoint in ('player', 'player/currently-playing'):
+            if player.active_device() is None:
+                return 204, None, {}
+            return 200, player.state() if endpoint == 'player' else player.currently_playing(), {}
+        if method == 'PUT' and endpoint == 'player':
+            data = json.loads(body or b'{}')
+            device_ids = data.get('device_ids') or []
+            if not device_ids or not player.transfer(device_ids[0], data.get('play')):
+                return error(404, 'Device not found')
+            return 204, None, {}
+
+        if (method, endpoint) not in (('PUT', 'player/play'), ('PUT', 'player/pause'), ('POST', 'player/next')):
+            return error(404, 'Service not found')
+        if device_id is not None and not player.transfer(device_id):
+            return error(404, 'Device not found')
+        if player.active_device() is None:
+            return error(404, 'Player command failed: No active device found', 'NO_ACTIVE_DEVICE')
+
+        if endpoint == 'player/next':
+            player.next()
+        else:
+            player.set_playing(endpoint == 'player/play')
+        return 204, None, {}
+
+    def _control(self, method, action, body):
+        if method == 'GET' and action == 'calls':
+            with self._lock:
+                return 200, dict(self.calls), {}
+        if method == 'POST' and action == 'fail':
+            data = json.loads(body or b'{}')
+            self.fail_next(int(data['status']), int(data.get('times', 1)), data.get('path'))
+            return 204, None, {}
+        if method == 'POST' and action == 'reset':
+            self.reset()
+            return 204, None, {}
+        return error(404, 'Unknown control endpoint')
+
+
+class FakeSpotifyHandler(BaseHTTPRequestHandler):
+    # Keep connections open, as the app's connection pool expects
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def _dispatch(self, method):
+        parsed = urlparse(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        status, payload, headers = self.server.fake.handle(method, parsed.path, parse_qs(parsed.query),
+                                                           self.headers, body)
+
+        data = b'' if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if data:
+            self.send_header('Content-Type', 'application/json')
+        if status != 204:
+            self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class FakeSpotifyServer(ThreadingHTTPServer):
+    """
+    HTTP server for a FakeSpotify. Port 0 picks a free port. Use start()
+    and stop(), or a with block, to run it in a background thread.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, fake=None, host='127.0.0.1', port=0, verbose=False):
+        super().__init__((host, port), FakeSpotifyHandler)
+        self.fake = fake or FakeSpotify()
+        self.verbose = verbose
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    @property
+    def api_base_url(self):
+        return self.url + 'v1/'
+
+    @property
+    def accounts_url(self):
+        return self.url
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name='fake-spotify', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
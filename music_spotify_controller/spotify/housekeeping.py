@@ -0,0 +1,123 @@
+"""
+Periodic cleanup of rows nobody will read again.
+
+Rooms have no activity column, so a room counts as abandoned once it is
+older than ROOM_IDLE_AFTER seconds and its host can no longer be polling
+it: the host's Spotify token is missing or has not been refreshed within
+that window (tokens are refreshed whenever a room is polled), or the
+host's session has expired. Everything is deleted in batches of
+BATCH_SIZE rows, each in its own short transaction, so the job never
+holds a write lock for long.
+"""
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from datetime import timedelta
+import time
+import logging
+
+from api.models import Room
+from api.room_cache import forget_room
+from .models import SpotifyToken, Vote, VoteTally
+from .now_playing import now_playing_cache
+
+logger = logging.getLogger(__name__)
+
+
+def housekeeping_option(name, default):
+    return getattr(settings, 'SPOTIFY_HOUSEKEEPING', {}).get(name, default)
+
+
+def uses_db_sessions():
+    return settings.SESSION_ENGINE in ('django.contrib.sessions.backends.db',
+                                       'django.contrib.sessions.backends.cached_db')
+
+
+def delete_in_batches(queryset, batch_size=None, pause=None, on_batch=None):
+    """Delete everything the queryset matches, batch_size rows per transaction. Returns the row count."""
+    batch_size = batch_size or housekeeping_option('BATCH_SIZE', 500)
+    pause = housekeeping_option('BATCH_PAUSE', 0.05) if pause is None else pause
+
+    total = 0
+    while True:
+        pks = list(queryset.values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            return total
+
+        with transaction.atomic():
+            batch = queryset.model.objects.filter(pk__in=pks)
+            if on_batch is not None:
+                on_batch(batch)
+            batch.delete()
+        total += len(pks)
+
+        if len(pks) < batch_size:
+            return total
+        # Let other writers in between batches
+        time.sleep(pause)
+
+
+def abandoned_rooms(now=None):
+    now = now or timezone.now()
+    cutoff = now - timedelta(seconds=housekeeping_option('ROOM_IDLE_AFTER', 6 * 60 * 60))
+
+    recently_refreshed = SpotifyToken.objects.filter(expires_in__gte=cutoff).values('user')
+    host_gone = ~Q(host__in=recently_refreshed)
+    if uses_db_sessions():
+        host_gone |= ~Q(host__in=Session.objects.filter(expire_date__gt=now).values('session_key'))
+
+    return Room.objects.filter(Q(created_at__lt=cutoff) & host_gone)
+
+
+def stale_votes():
+    """Votes and tallies for songs their room is no longer playing."""
+    return (Vote.objects.exclude(song_id=F('room__current_song')),
+            VoteTally.objects.exclude(song_id=F('room__current_song')))
+
+
+def stale_tokens(now=None):
+    """Tokens that expired over TOKEN_RETENTION seconds ago, or whose session is gone."""
+    now = now or timezone.now()
+    retention = timedelta(seconds=housekeeping_option('TOKEN_RETENTION', 30 * 24 * 60 * 60))
+
+    stale = Q(expires_in__lt=now - retention)
+    if uses_db_sessions():
+        live_sessions = Session.objects.filter(expire_date__gt=now).values('session_key')
+        stale |= Q(expires_in__lt=now) & ~Q(user__in=live_sessions)
+    # Never strand a room that is still around
+    return SpotifyToken.objects.filter(stale).exclude(user__in=Room.objects.values('host'))
+
+
+def expired_sessions(now=None):
+    return Session.objects.filter(expire_date__lt=now or timezone.now())
+
+
+def forget_rooms(rooms):
+    for code in rooms.values_list('code', flat=True):
+        forget_room(code)
+        now_playing_cache.discard(code)
+
+
+def run_housekeeping(batch_size=None, dry_run=False):
+    """Run every cleanup step and return the number of rows each removed (or would remove)."""
+    votes, tallies = stale_votes()
+    steps = [
+        ('rooms', abandoned_rooms(), forget_rooms),
+        ('votes', votes, None),
+        ('vote_tallies', tallies, None),
+        ('tokens', stale_tokens(), None),
+    ]
+    if uses_db_sessions():
+        steps.append(('sessions', expired_sessions(), None))
+
+    results = {}
+    for name, queryset, on_batch in steps:
+        if dry_run:
+            results[name] = queryset.count()
+        else:
+            results[name] = delete_in_batches(queryset, batch_size, on_batch=on_batch)
+            if results[name]:
+                logger.info(f"Housekeeping removed {results[name]} {name}")
+    return results
@@ -0,0 +1,315 @@
+"""
+Room-scale load generator, see `manage.py loadtest`.
+
+Simulates rooms against a running server: a host creates each room and
+links Spotify, then guests join, poll /spotify/current-song, vote to skip
+and now and then leave and rejoin, each from its own session. Every
+request is timed, and the Server-Timing header sent by metrics_middleware
+tells how many Spotify calls and database queries the server made for it.
+
+Run the server against `manage.py fake_spotify` so that the host can link
+Spotify without a real account and no load reaches Spotify.
+"""
+from collections import defaultdict
+from datetime import datetime, timezone
+from urllib.parse import urlparse
+import json
+import math
+import random
+import threading
+import time
+
+import requests
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a sorted list."""
+    if not values:
+        return None
+    # Rounded first so that float noise (0.07 * 100 == 7.000000000000001) doesn't skip a rank
+    rank = math.ceil(round(fraction * len(values), 9))
+    index = min(len(values) - 1, max(0, rank - 1))
+    return values[index]
+
+
+def parse_server_timing(header):
+    """{name: {'dur': ..., 'desc': ...}} from a Server-Timing header."""
+    metrics = {}
+    for entry in (header or '').split(','):
+        name, *params = [part.strip() for part in entry.split(';')]
+        if not name:
+            continue
+        values = {}
+        for param in params:
+            key, _, value = param.partition('=')
+            values[key] = value.strip('"')
+        metrics[name] = values
+    return metrics
+
+
+def timing_count(metrics, name):
+    try:
+        return int(metrics[name]['desc'])
+    except (KeyError, ValueError):
+        return None
+
+
+def timing_duration(metrics, name):
+    try:
+        return float(metrics[name]['dur'])
+    except (KeyError, ValueError):
+        return None
+
+
+class LoadStats:
+    """Samples of every request made, grouped by endpoint."""
+
+    def __init__(self):
+        self._samples = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, status, latency_ms, server_timing=None):
+        metrics = parse_server_timing(server_timing)
+        sample = {
+            'status': status,
+            'latency_ms': latency_ms,
+            'server_ms': timing_duration(metrics, 'total'),
+            'spotify_calls': timing_count(metrics, 'spotify'),
+            'db_queries': timing_count(metrics, 'db'),
+        }
+        with self._lock:
+            self._samples[endpoint].append(sample)
+
+    def summary(self, duration):
+        with self._lock:
+            samples = {endpoint: list(values) for endpoint, values in self._samples.items()}
+
+        endpoints = {endpoint: summarize(values, duration) for endpoint, values in sorted(samples.items())}
+        everything = [sample for values in samples.values() for sample in values]
+        return {'endpoints': endpoints, 'total': summarize(everything, duration)}
+
+
+def summarize(samples, duration):
+    latencies = sorted(sample['latency_ms'] for sample in samples)
+    server_times = sorted(sample['server_ms'] for sample in samples if sample['server_ms'] is not None)
+    statuses = defaultdict(int)
+    for sample in samples:
+        statuses[str(sample['status'])] += 1
+
+    def per_request(key):
+        counts = [sample[key] for sample in samples if sample[key] is not None]
+        return round(sum(counts) / len(counts), 3) if counts else None
+
+    def distribution(values):
+        if not values:
+            return None
+        return {
+            'p50': round(percentile(values, 0.50), 2),
+            'p95': round(percentile(values, 0.95), 2),
+            'p99': round(percentile(values, 0.99), 2),
+            'mean': round(sum(values) / len(values), 2),
+            'max': round(values[-1], 2),
+        }
+
+    return {
+        'requests': len(samples),
+        'rps': round(len(samples) / duration, 2) if duration else None,
+        'errors': sum(count for status, count in statuses.items() if status == 'error' or status.startswith('5')),
+        'statuses': dict(sorted(statuses.items())),
+        'latency_ms': distribution(latencies),
+        'server_ms': distribution(server_times),
+        'spotify_calls_per_request': per_request('spotify_calls'),
+        'db_queries_per_request': per_request('db_queries'),
+    }
+
+
+class SimulatedUser:
+    """One browser: a session of its own, talking to the server."""
+
+    def __init__(self, base_url, stats, timeout=10, conditional=False):
+        self.base_url = base_url.rstrip('/')
+        self.stats = stats
+        self.timeout = timeout
+        self.conditional = conditional
+        self.session = requests.Session()
+        self.etag = None
+
+    def request(self, method, path, **kwargs):
+        endpoint = f"{method} {urlparse(path).path}"
+        started_at = time.perf_counter()
+        try:
+            response = self.session.request(method, self.base_url + path, timeout=self.timeout, **kwargs)
+        except requests.RequestException:
+            self.stats.record(endpoint, 'error', (time.perf_counter() - started_at) * 1000)
+            return None
+        self.stats.record(endpoint, response.status_code, (time.perf_counter() - started_at) * 1000,
+                          response.headers.get('Server-Timing'))
+        return response
+
+    def poll_current_song(self):
+        if not self.conditional:
+            return self.request('GET', '/spotify/current-song')
+        headers = {'If-None-Match': self.etag} if self.etag else {}
+        response = self.request('GET', '/spotify/current-song?delta=1', headers=headers)
+        if response is not None and response.status_code in (200, 304):
+            self.etag = response.headers.get('ETag', self.etag)
+        return response
+
+    def create_room(self, votes_to_skip, guest_can_pause=True):
+        response = self.request('POST', '/api/create-room',
+                                json={'votes_to_skip': votes_to_skip, 'guest_can_pause': guest_can_pause})
+        if response is None or response.status_code not in (200, 201):
+            return None
+        return response.json()['code']
+
+    def link_spotify(self):
+        """
+        Go through the Spotify login as the room's host would. Against
+        fake_spotify, its authorize page sends us straight back with a
+        code. Returns whether the session ended up authenticated.
+        """
+        response = self.request('GET', '/spotify/get-auth-url')
+        if response is None or response.status_code != 200:
+            return False
+        try:
+            authorize = self.session.get(response.json()['url'], allow_redirects=False, timeout=self.timeout)
+        except requests.RequestException:
+            return False
+        callback = urlparse(authorize.headers.get('Location', ''))
+        if 'code=' not in callback.query:
+            return False
+        self.request('GET', f"{callback.path}?{callback.query}", allow_redirects=False)
+        response = self.request('GET', '/spotify/is-authenticated')
+        return response is not None and response.status_code == 200 and response.json().get('status') is True
+
+    def join_room(self, code):
+        response = self.request('POST', '/api/join-room', json={'code': code})
+        return response is not None and response.status_code == 200
+
+    def leave_room(self):
+        self.etag = None
+        self.request('POST', '/api/leave-room')
+
+
+class LoadTest:
+    """
+    Runs `rooms` rooms of one host and `guests` guests for `duration`
+    seconds. Everyone polls every `poll_interval` seconds; on each poll a
+    guest votes to skip with probability `vote_rate`, and leaves and
+    rejoins with probability `churn_rate`.
+    """
+
+    def __init__(self, base_url, rooms=1, guests=10, duration=30, poll_interval=1.0, vote_rate=0.01,
+                 churn_rate=0.005, votes_to_skip=None, conditional=False, timeout=10, seed=None, log=print):
+        self.base_url = base_url
+        self.rooms = rooms
+        self.guests = guests
+        self.duration = duration
+        self.poll_interval = poll_interval
+        self.vote_rate = vote_rate
+        self.churn_rate = churn_rate
+        self.votes_to_skip = votes_to_skip or max(2, guests // 2)
+        self.conditional = conditional
+        self.timeout = timeout
+        self.random = random.Random(seed)
+        self.log = log
+        self.stats = LoadStats()
+        self._stop = threading.Event()
+
+    def config(self):
+        return {
+            'url': self.base_url, 'rooms': self.rooms, 'guests': self.guests, 'duration': self.duration,
+            'poll_interval': self.poll_interval, 'vote_rate': self.vote_rate, 'churn_rate': self.churn_rate,
+            'votes_to_skip': self.votes_to_skip, 'conditional': self.conditional,
+        }
+
+    def user(self):
+        return SimulatedUser(self.base_url, self.stats, timeout=self.timeout, conditional=self.conditional)
+
+    def run(self):
+        """Run the simulation and return its results, ready to be stored as JSON."""
+        started_at = datetime.now(timezone.utc)
+
+        hosts = []
+        for _ in range(self.rooms):
+            host = self.user()
+            code = host.create_room(self.votes_to_skip)
+            if code is None:
+                raise RuntimeError(f"Could not create a room on {self.base_url}")
+            if not host.link_spotify():
+                self.log(f"Host of room {code} could not link Spotify; is the server using fake_spotify?")
+            hosts.append((host, code))
+
+        threads = []
+        for host, code in hosts:
+            threads.append(threading.Thread(target=self._host_loop, args=(host,), daemon=True))
+            for _ in range(self.guests):
+                threads.append(threading.Thread(
+                    target=self._guest_loop, args=(self.user(), code, random.Random(self.random.random())),
+                    daemon=True))
+
+        began = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        self._stop.wait(self.duration)
+        self._stop.set()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - began
+
+        for host, _ in hosts:
+            host.leave_room()
+
+        return dict(started_at=started_at.isoformat(), elapsed=round(elapsed, 2), config=self.config(),
+                    **self.stats.summary(elapsed))
+
+    def _wait(self, rng):
+        # Spread users out instead of polling in lockstep
+        self._stop.wait(self.poll_interval * rng.uniform(0.9, 1.1))
+
+    def _host_loop(self, host):
+        rng = random.Random(self.random.random())
+        self._stop.wait(rng.uniform(0, self.poll_interval))
+        while not self._stop.is_set():
+            host.poll_current_song()
+            self._wait(rng)
+
+    def _guest_loop(self, guest, code, rng):
+        self._stop.wait(rng.uniform(0, self.poll_interval))
+        if not guest.join_room(code):
+            return
+        while not self._stop.is_set():
+            guest.poll_current_song()
+            if rng.random() < self.vote_rate:
+                guest.request('POST', '/spotify/skip')
+            if rng.random() < self.churn_rate:
+                guest.leave_room()
+                guest.join_room(code)
+            self._wait(rng)
+
+
+def compare(previous, current):
+    """Lines comparing each endpoint's results with a previous run."""
+    lines = []
+    for endpoint, now in current['endpoints'].items():
+        before = previous.get('endpoints', {}).get(endpoint)
+        if before is None or not before.get('latency_ms') or not now.get('latency_ms'):
+            continue
+        lines.append(
+            f"{endpoint}: p95 {before['latency_ms']['p95']} -> {now['latency_ms']['p95']} ms"
+            f" ({change(before['latency_ms']['p95'], now['latency_ms']['p95'])}),"
+            f" rps {before['rps']} -> {now['rps']},"
+            f" spotify/req {before['spotify_calls_per_request']} -> {now['spotify_calls_per_request']},"
+            f" db/req {before['db_queries_per_request']} -> {now['db_queries_per_request']}")
+    return lines
+
+
+def change(before, after):
+    if not before:
+        return 'n/a'
+    return f"{(after - before) / before * 100:+.0f}%"
+
+
+def load_results(path):
+    with open(path) as results:
+        return json.load(results)
@@ -0,0 +1,53 @@
+"""
+Locks keyed by room code or session id.
+
+A lock only exists while someone holds it or waits for it, so a
+long-running process doesn't keep one for every room and session it has
+ever served.
+"""
+from contextlib import asynccontextmanager, contextmanager
+import threading
+
+
+class KeyedLocks:
+    """One lock per key, made by `factory` (threading.Lock, or asyncio.Lock for ahold)."""
+
+    def __init__(self, factory=threading.Lock):
+        self._factory = factory
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def __len__(self):
+        return len(self._locks)
+
+    def _checkout(self, key):
+        with self._guard:
+            entry = self._locks.get(key)
+            if entry is None:
+                entry = self._locks[key] = [self._factory(), 0]
+            entry[1] += 1
+            return entry
+
+    def _checkin(self, key, entry):
+        with self._guard:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._locks[key]
+
+    @contextmanager
+    def hold(self, key):
+        entry = self._checkout(key)
+        try:
+            with entry[0]:
+                yield
+        finally:
+            self._checkin(key, entry)
+
+    @asynccontextmanager
+    async def ahold(self, key):
+        entry = self._checkout(key)
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            self._checkin(key, entry)
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+
+from spotify.fake_server import FakeSpotify, FakeSpotifyServer
+
+
+class Command(BaseCommand):
+    help = "Run a local stand-in for the Spotify Web API and accounts service, for offline runs and load tests."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8001)
+        parser.add_argument('--latency', type=float, default=0.0, metavar='SECONDS',
+                            help="Delay added to every response.")
+        parser.add_argument('--jitter', type=float, default=0.0, metavar='SECONDS',
+                            help="Up to this much more delay, picked at random per response.")
+        parser.add_argument('--error-rate', type=float, default=0.0, help="Share of calls answered 503.")
+        parser.add_argument('--rate-limit-rate', type=float, default=0.0, help="Share of calls answered 429.")
+        parser.add_argument('--unauthorized-rate', type=float, default=0.0, help="Share of API calls answered 401.")
+        parser.add_argument('--not-found-rate', type=float, default=0.0, help="Share of API calls answered 404.")
+        parser.add_argument('--retry-after', type=int, default=1, metavar='SECONDS',
+                            help="Retry-After sent with 429 answers.")
+        parser.add_argument('--token-lifetime', type=int, default=3600, metavar='SECONDS',
+                            help="How long issued access tokens stay valid.")
+        parser.add_argument('--strict-tokens', action='store_true',
+                            help="Reject access tokens this server didn't issue.")
+        parser.add_argument('--seed', type=int, help="Seed for the random latency and failures.")
+        parser.add_argument('--verbose', action='store_true', help="Log every request.")
+
+    def handle(self, *args, **options):
+        fake = FakeSpotify(
+            latency=options['latency'], jitter=options['jitter'], error_rate=options['error_rate'],
+            rate_limit_rate=options['rate_limit_rate'], unauthorized_rate=options['unauthorized_rate'],
+            not_found_rate=options['not_found_rate'], retry_after=options['retry_after'],
+            token_lifetime=options['token_lifetime'], strict_tokens=options['strict_tokens'], seed=options['seed'])
+        server = FakeSpotifyServer(fake, host=options['host'], port=options['port'], verbose=options['verbose'])
+
+        self.stdout.write(f"Fake Spotify listening on {server.url}. Run the app with:")
+        self.stdout.write(f"  export SPOTIFY_API_BASE_URL={server.api_base_url}")
+        self.stdout.write(f"  export SPOTIFY_ACCOUNTS_URL={server.accounts_url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
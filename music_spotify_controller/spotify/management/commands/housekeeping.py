@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+import time
+
+from spotify.housekeeping import run_housekeeping
+
+
+class Command(BaseCommand):
+    help = "Delete abandoned rooms, stale votes, stale Spotify tokens and expired sessions in small batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, help="Rows deleted per transaction (default: SPOTIFY_HOUSEKEEPING['BATCH_SIZE']).")
+        parser.add_argument('--every', type=float, metavar='SECONDS',
+                            help="Keep running, cleaning up every SECONDS seconds.")
+        parser.add_argument('--dry-run', action='store_true', help="Only report what would be deleted.")
+
+    def handle(self, *args, **options):
+        while True:
+            results = run_housekeeping(batch_size=options['batch_size'], dry_run=options['dry_run'])
+            verb = "Would delete" if options['dry_run'] else "Deleted"
+            self.stdout.write(f"{verb} " + ", ".join(f"{count} {name}" for name, count in results.items()))
+
+            if not options['every']:
+                break
+            close_old_connections()
+            time.sleep(options['every'])
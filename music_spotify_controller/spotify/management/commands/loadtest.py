@@ -0,0 +1,73 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from spotify.loadtest import LoadTest, compare, load_results
+
+
+class Command(BaseCommand):
+    help = "Simulate rooms of polling, voting and churning guests against a running server and report latency."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', default='http://127.0.0.1:8000', help="Server to load.")
+        parser.add_argument('--rooms', type=int, default=1)
+        parser.add_argument('--guests', type=int, default=10, help="Guests per room, besides the host.")
+        parser.add_argument('--duration', type=float, default=30, metavar='SECONDS')
+        parser.add_argument('--poll-interval', type=float, default=1.0, metavar='SECONDS',
+                            help="How often everyone polls /spotify/current-song.")
+        parser.add_argument('--vote-rate', type=float, default=0.01,
+                            help="Chance that a guest votes to skip after a poll.")
+        parser.add_argument('--churn-rate', type=float, default=0.005,
+                            help="Chance that a guest leaves and rejoins after a poll.")
+        parser.add_argument('--votes-to-skip', type=int, help="Votes needed to skip; half the guests by default.")
+        parser.add_argument('--conditional', action='store_true',
+                            help="Poll with If-None-Match and ?delta=1, as the frontend does.")
+        parser.add_argument('--timeout', type=float, default=10, metavar='SECONDS')
+        parser.add_argument('--seed', type=int)
+        parser.add_argument('--output', metavar='FILE', help="Write the results as JSON.")
+        parser.add_argument('--compare', metavar='FILE', help="Compare with the results of an earlier run.")
+
+    def handle(self, *args, **options):
+        previous = load_results(options['compare']) if options['compare'] else None
+        load_test = LoadTest(
+            options['url'], rooms=options['rooms'], guests=options['guests'], duration=options['duration'],
+            poll_interval=options['poll_interval'], vote_rate=options['vote_rate'],
+            churn_rate=options['churn_rate'], votes_to_skip=options['votes_to_skip'],
+            conditional=options['conditional'], timeout=options['timeout'], seed=options['seed'],
+            log=self.stderr.write)
+
+        self.stdout.write(f"Running {options['rooms']} room(s) of 1 host and {options['guests']} guests "
+                          f"against {options['url']} for {options['duration']}s...")
+        try:
+            results = load_test.run()
+        except RuntimeError as e:
+            raise CommandError(str(e))
+
+        self.report(results)
+        if previous is not None:
+            self.stdout.write(f"\nCompared with {options['compare']}:")
+            for line in compare(previous, results):
+                self.stdout.write(f"  {line}")
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump(results, output, indent=2)
+            self.stdout.write(f"\nResults written to {options['output']}")
+
+    def report(self, results):
+        header = (f"{'endpoint':<30} {'reqs':>6} {'rps':>7} {'err':>4} {'p50':>8} {'p95':>8} {'p99':>8}"
+                  f" {'spotify/req':>11} {'db/req':>7}")
+        self.stdout.write('\n' + header)
+        self.stdout.write('-' * len(header))
+        rows = list(results['endpoints'].items()) + [('total', results['total'])]
+        for endpoint, summary in rows:
+            latency = summary['latency_ms'] or {}
+            self.stdout.write(
+                f"{endpoint:<30} {summary['requests']:>6} {summary['rps']:>7} {summary['errors']:>4}"
+                f" {latency.get('p50', '-'):>8} {latency.get('p95', '-'):>8} {latency.get('p99', '-'):>8}"
+                f" {format_count(summary['spotify_calls_per_request']):>11}"
+                f" {format_count(summary['db_queries_per_request']):>7}")
+        self.stdout.write("(latencies in ms)")
+
+
+def format_count(value):
+    return '-' if value is None else value
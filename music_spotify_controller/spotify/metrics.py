@@ -0,0 +1,290 @@
+"""
+Instrumentation of the hot paths: Spotify calls, retries, token refreshes,
+database queries and shared cache lookups.
+
+While a request is being served, its counts are gathered in a
+RequestMetrics held in a context variable (see metrics_middleware), which
+reports them in the response's Server-Timing header and tags log records
+with the request's id. Everything is also added up in `registry`, which
+/spotify/metrics serves in the Prometheus text format. The registry is
+per process, so each worker is scraped separately.
+"""
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+import logging
+import threading
+import time
+import uuid
+
+_request_metrics = ContextVar('spotify_request_metrics', default=None)
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+METRICS = {
+    'music_requests_total': ('counter', "Requests served, by route, method and status."),
+    'music_request_duration_seconds': ('histogram', "Time taken to serve a request, by route."),
+    'music_request_spotify_calls': ('histogram', "Spotify calls made while serving a request, by route."),
+    'music_request_db_queries': ('histogram', "Database queries made while serving a request, by route."),
+    'music_spotify_calls_total': ('counter', "Calls to Spotify, by endpoint and response status."),
+    'music_spotify_call_duration_seconds': ('histogram', "Time taken by a call to Spotify, by endpoint."),
+    'music_spotify_retries_total': ('counter', "Calls to Spotify that were retried, by endpoint."),
+    'music_spotify_shed_total': ('counter', "Calls to Spotify not made, by endpoint and reason."),
+    'music_spotify_sleep_seconds_total': ('counter', "Time spent waiting between retries."),
+    'music_spotify_token_refreshes_total': ('counter', "Access token refreshes, by outcome."),
+    'music_db_queries_total': ('counter', "Database queries run."),
+    'music_db_query_duration_seconds_total': ('counter', "Time spent running database queries."),
+    'music_cache_requests_total': ('counter', "Shared cache lookups, by namespace and result."),
+}
+
+
+class MetricsRegistry:
+    """Counters and histograms of one process, keyed by metric name and labels."""
+
+    def __init__(self):
+        self._counters = defaultdict(float)
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name, labels=(), value=1):
+        with self._lock:
+            self._counters[name, labels] += value
+
+    def observe(self, name, labels, value, buckets=DURATION_BUCKETS):
+        with self._lock:
+            histogram = self._histograms.get((name, labels))
+            if histogram is None:
+                histogram = self._histograms[name, labels] = {
+                    'buckets': buckets, 'counts': [0] * len(buckets), 'sum': 0, 'count': 0}
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    histogram['counts'][i] += 1
+            histogram['sum'] += value
+            histogram['count'] += 1
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def render(self):
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: dict(value, counts=list(value['counts'])) for key, value in self._histograms.items()}
+
+        lines = []
+        for name, (kind, help_text) in METRICS.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            if kind == 'counter':
+                for (metric, labels), value in sorted(counters.items()):
+                    if metric == name:
+                        lines.append(f"{name}{format_labels(labels)} {format_value(value)}")
+                continue
+            for (metric, labels), histogram in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                for bound, count in zip(histogram['buckets'], histogram['counts']):
+                    le = format_value(bound)
+                    lines.append(f"{name}_bucket{format_labels(labels + (('le', le),))} {count}")
+                lines.append(f"{name}_bucket{format_labels(labels + (('le', '+Inf'),))} {histogram['count']}")
+                lines.append(f"{name}_sum{format_labels(labels)} {format_value(histogram['sum'])}")
+                lines.append(f"{name}_count{format_labels(labels)} {histogram['count']}")
+        return '\n'.join(lines) + '\n'
+
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    escaped = (str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in labels)
+    return '{' + ','.join(f'{key}="{value}"' for (key, _), value in zip(labels, escaped)) + '}'
+
+
+def format_value(value):
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+registry = MetricsRegistry()
+
+
+class RequestMetrics:
+    """What one request cost: Spotify calls, retries, refreshes, queries and cache lookups."""
+
+    def __init__(self):
+        self.request_id = uuid.uuid4().hex[:12]
+        self.started_at = time.perf_counter()
+        self.spotify_calls = defaultdict(lambda: [0, 0.0])
+        self.retries = 0
+        self.shed = 0
+        self.token_refreshes = 0
+        self.sleep_seconds = 0.0
+        self.db_queries = 0
+        self.db_seconds = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def spotify_call_count(self):
+        return sum(count for count, _ in self.spotify_calls.values())
+
+    @property
+    def spotify_seconds(self):
+        return sum(seconds for _, seconds in self.spotify_calls.values())
+
+    def elapsed(self):
+        return time.perf_counter() - self.started_at
+
+    def server_timing(self, total):
+        """Server-Timing header value; each entry's desc is a count."""
+        entries = [
+            ('total', total, None),
+            ('spotify', self.spotify_seconds, self.spotify_call_count),
+            ('spotify-retry', None, self.retries),
+            ('spotify-shed', None, self.shed),
+            ('token-refresh', None, self.token_refreshes),
+            ('sleep', self.sleep_seconds, None),
+            ('db', self.db_seconds, self.db_queries),
+            ('cache-hit', None, self.cache_hits),
+            ('cache-miss', None, self.cache_misses),
+        ]
+        parts = []
+        for name, seconds, count in entries:
+            part = name
+            if seconds is not None:
+                part += f";dur={seconds * 1000:.1f}"
+            if count is not None:
+                part += f';desc="{count}"'
+            parts.append(part)
+        return ', '.join(parts)
+
+    def summary(self):
+        calls = ' '.join(f"{endpoint}={count}/{seconds * 1000:.0f}ms"
+                         for endpoint, (count, seconds) in sorted(self.spotify_calls.items()))
+        return (f"spotify[{calls or 'none'}] retries={self.retries} shed={self.shed} "
+                f"refreshes={self.token_refreshes} db={self.db_queries}/{self.db_seconds * 1000:.0f}ms "
+                f"cache={self.cache_hits}hit/{self.cache_misses}miss")
+
+
+def current_metrics():
+    """The RequestMetrics of the request being served, or None outside requests."""
+    return _request_metrics.get()
+
+
+@contextmanager
+def collect_request_metrics():
+    """Gather the metrics of everything done inside the block into a new RequestMetrics."""
+    metrics = RequestMetrics()
+    token = _request_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _request_metrics.reset(token)
+
+
+def endpoint_label(endpoint):
+    return endpoint.split('?', 1)[0]
+
+
+class SpotifyCall:
+    status = None
+
+
+@contextmanager
+def spotify_call(method, endpoint):
+    """
+    Time one call to Spotify. Set .status on the yielded object once the
+    response is in; calls that raise before that are counted as 'error'.
+    """
+    call = SpotifyCall()
+    started_at = time.perf_counter()
+    try:
+        yield call
+    finally:
+        seconds = time.perf_counter() - started_at
+        endpoint = endpoint_label(endpoint)
+        outcome = str(call.status) if call.status is not None else 'error'
+        registry.inc('music_spotify_calls_total', (('endpoint', endpoint), ('method', method), ('status', outcome)))
+        registry.observe('music_spotify_call_duration_seconds', (('endpoint', endpoint),), seconds)
+        metrics = current_metrics()
+        if metrics is not None:
+            entry = metrics.spotify_calls[endpoint]
+            entry[0] += 1
+            entry[1] += seconds
+
+
+def record_retry(endpoint):
+    registry.inc('music_spotify_retries_total', (('endpoint', endpoint_label(endpoint)),))
+    metrics = current_metrics()
+    if metrics is not None:
+        metrics.retries += 1
+
+
+def record_shed(endpoint, reason):
+    """Count a call that the circuit breaker or rate limiter kept from being made."""
+    registry.inc('music_spotify_shed_total', (('endpoint', endpoint_label(endpoint)), ('reason', reason)))
+    metrics = current_metrics()
+    if metrics is not None:
+        metrics.shed += 1
+
+
+def record_sleep(seconds):
+    registry.inc('music_spotify_sleep_seconds_total', value=seconds)
+    metrics = current_metrics()
+    if metrics is not None:
+        metrics.sleep_seconds += seconds
+
+
+def record_token_refresh(succeeded):
+    registry.inc('music_spotify_token_refreshes_total', (('outcome', 'success' if succeeded else 'failure'),))
+    metrics = current_metrics()
+    if metrics is not None:
+        metrics.token_refreshes += 1
+
+
+def record_cache_lookup(namespace, hit):
+    registry.inc('music_cache_requests_total', (('namespace', namespace), ('result', 'hit' if hit else 'miss')))
+    metrics = current_metrics()
+    if metrics is not None:
+        if hit:
+            metrics.cache_hits += 1
+        else:
+            metrics.cache_misses += 1
+
+
+def count_query(execute, sql, params, many, context):
+    """Database execute wrapper that times every query."""
+    started_at = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        seconds = time.perf_counter() - started_at
+        registry.inc('music_db_queries_total')
+        registry.inc('music_db_query_duration_seconds_total', value=seconds)
+        metrics = current_metrics()
+        if metrics is not None:
+            metrics.db_queries += 1
+            metrics.db_seconds += seconds
+
+
+def instrument_connection(sender, connection, **kwargs):
+    """connection_created receiver that installs count_query on new connections."""
+    if count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_query)
+
+
+def record_request(route, method, status_code, metrics, seconds):
+    registry.inc('music_requests_total', (('route', route), ('method', method), ('status', str(status_code))))
+    registry.observe('music_request_duration_seconds', (('route', route),), seconds)
+    registry.observe('music_request_spotify_calls', (('route', route),), metrics.spotify_call_count, COUNT_BUCKETS)
+    registry.observe('music_request_db_queries', (('route', route),), metrics.db_queries, COUNT_BUCKETS)
+
+
+class RequestIdFilter(logging.Filter):
+    """Adds the id of the request being served (or '-') to log records as request_id."""
+
+    def filter(self, record):
+        metrics = current_metrics()
+        record.request_id = metrics.request_id if metrics is not None else '-'
+        return True
@@ -0,0 +1,59 @@
+from asgiref.sync import iscoroutinefunction
+from django.utils.decorators import sync_and_async_middleware
+
+from .metrics import collect_request_metrics, record_request
+from .retry import request_budget
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@sync_and_async_middleware
+def request_budget_middleware(get_response):
+    """
+    Give every request SPOTIFY_REQUEST_BUDGET seconds for all the Spotify
+    calls it makes, including their retries. Streamed responses are
+    produced after the view returns, so their calls get their own budgets.
+    """
+    if iscoroutinefunction(get_response):
+        async def middleware(request):
+            with request_budget():
+                return await get_response(request)
+    else:
+        def middleware(request):
+            with request_budget():
+                return get_response(request)
+    return middleware
+
+
+@sync_and_async_middleware
+def metrics_middleware(get_response):
+    """
+    Count what each request costs (see spotify.metrics), report it in a
+    Server-Timing header and add it to the process-wide metrics. The
+    request's id goes into the X-Request-ID header and its log records.
+    Work done while a streamed response is sent isn't counted.
+    """
+    def finish(request, response, metrics):
+        seconds = metrics.elapsed()
+        match = getattr(request, 'resolver_match', None)
+        route = match.route if match is not None else 'unmatched'
+        record_request(route, request.method, response.status_code, metrics, seconds)
+
+        response['Server-Timing'] = metrics.server_timing(seconds)
+        response['X-Request-ID'] = metrics.request_id
+        logger.debug(f"{request.method} {request.path} {response.status_code} "
+                     f"in {seconds * 1000:.0f}ms: {metrics.summary()}")
+        return response
+
+    if iscoroutinefunction(get_response):
+        async def middleware(request):
+            with collect_request_metrics() as metrics:
+                response = await get_response(request)
+                return finish(request, response, metrics)
+    else:
+        def middleware(request):
+            with collect_request_metrics() as metrics:
+                response = get_response(request)
+                return finish(request, response, metrics)
+    return middleware
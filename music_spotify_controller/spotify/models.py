@@ -16,3 +16,15 @@ class Vote(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     song_id = models.CharField(max_length=50)
     room = models.ForeignKey(Room, on_delete=models.CASCADE)
+
+    class Meta:
+        indexes = [models.Index(fields=['room', 'song_id'], name='vote_room_song_idx')]
+
+
+class VoteTally(models.Model):
+    room = models.ForeignKey(Room, on_delete=models.CASCADE)
+    song_id = models.CharField(max_length=50)
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [models.UniqueConstraint(fields=['room', 'song_id'], name='unique_vote_tally')]
@@ -0,0 +1,596 @@
+from django.conf import settings
+from django.db import transaction
+from rest_framework import status
+from requests import ConnectionError
+import asyncio
+import hashlib
+import json
+import time
+import logging
+
+from .util import (get_available_devices, get_user_tokens, execute_spotify_api_request,
+                   clear_spotify_tokens, get_spotify_auth_url, is_upstream_unavailable)
+from .async_util import (aget_available_devices, aget_user_tokens, aexecute_spotify_api_request,
+                         database_sync_to_async)
+from .votes import get_vote_count, cached_vote_count, clear_votes
+from .locks import KeyedLocks
+from .shared_cache import SharedCache
+from api.models import Room
+from api.room_cache import room_cache, get_room, forget_room
+
+logger = logging.getLogger(__name__)
+
+
+class NowPlayingCache:
+    """
+    Room-scoped now-playing snapshots, keyed by Room.code.
+
+    Every listener in a room polls the same host account, so one upstream
+    fetch per room per TTL is shared by all of them. Snapshots live in the
+    shared cache, so this holds across worker processes too. Concurrent
+    misses for the same room are collapsed into a single fetch
+    (single-flight): within a process by a lock, and across processes by
+    a fetch claim in the cache. A miss that finds another process fetching
+    the room is served the room's last snapshot instead of waiting.
+
+    While Spotify is unavailable (snapshots marked 'unavailable'), the last
+    known snapshot of the room is served instead, marked 'stale', for up to
+    SPOTIFY_NOW_PLAYING_STALE_TTL seconds.
+
+    Every snapshot carries a 'version' that only changes when what it shows
+    does. Playback progress alone doesn't change it: a playing song is
+    described by when it started, which stays put between fetches. The data
+    of each version is kept for as long as stale snapshots are, so a
+    listener's poll can be answered with what changed since its version.
+    """
+
+    def __init__(self, ttl=None, namespace='now-playing'):
+        self._ttl = ttl
+        self._store = SharedCache(namespace)
+        self._locks = KeyedLocks()
+        self._async_locks = KeyedLocks(asyncio.Lock)
+
+    @property
+    def ttl(self):
+        if self._ttl is not None:
+            return self._ttl
+        return getattr(settings, 'SPOTIFY_NOW_PLAYING_TTL', 1.0)
+
+    def _stale_ttl(self):
+        return getattr(settings, 'SPOTIFY_NOW_PLAYING_STALE_TTL', 300)
+
+    def get(self, room_code):
+        """Return the cached snapshot for a room, or None if missing or expired."""
+        return self._store.get(f"snapshot:{room_code}")
+
+    def last_known(self, room_code):
+        """The room's most recent snapshot that came from Spotify, however old."""
+        return self._store.get(f"last-known:{room_code}")
+
+    def generation(self, room_code):
+        return self._store.counter(f"generation:{room_code}")
+
+    def claim_fetch(self, room_code):
+        """Claim the next upstream fetch for a room, across processes. Returns False if taken."""
+        timeout = getattr(settings, 'SPOTIFY_REQUEST_BUDGET', 5.0)
+        return self._store.add(f"fetching:{room_code}", True, timeout)
+
+    def release_fetch(self, room_code):
+        self._store.delete(f"fetching:{room_code}")
+
+    def version_data(self, room_code, version):
+        """The snapshot data a room had at the given version, or None if it is gone."""
+        return self._store.get(f"version:{room_code}:{version}")
+
+    def _versioned(self, room_code, snapshot):
+        data = snapshot['data']
+        current = self._store.get(f"current:{room_code}")
+
+        # Keep the start time of a song that plays on as expected, so progress
+        # measured a little later or earlier doesn't make a new version
+        if (current is not None and current['started_at'] is not None
+                and data.get('started_at') is not None and current['id'] == data.get('id')
+                and abs(current['started_at'] - data['started_at']) <= self._progress_tolerance()):
+            data = dict(data, started_at=current['started_at'])
+
+        version = snapshot_version(data)
+        if current is None or current['version'] != version:
+            self._store.set(f"current:{room_code}", {
+                'version': version, 'id': data.get('id'), 'started_at': data.get('started_at'),
+            }, self._stale_ttl())
+            self._store.set(f"version:{room_code}:{version}", data, self._stale_ttl())
+        return dict(snapshot, data=data, version=version)
+
+    def _progress_tolerance(self):
+        return getattr(settings, 'SPOTIFY_NOW_PLAYING_PROGRESS_TOLERANCE', 1500)
+
+    def _with_fallback(self, room_code, snapshot):
+        if not snapshot.get('unavailable'):
+            self._store.set(f"last-known:{room_code}", snapshot, self._stale_ttl())
+            return snapshot
+
+        last_known = self.last_known(room_code)
+        if last_known is None or last_known.get('unavailable'):
+            return snapshot
+
+        data = dict(last_known['data'], stale=True)
+        if snapshot['data'].get('retry_after') is not None:
+            data['retry_after'] = snapshot['data']['retry_after']
+        return {'status': last_known['status'], 'data': data, 'unavailable': True}
+
+    def set(self, room_code, snapshot, generation=None, ttl=None):
+        """Store a room's snapshot and return it as it will be served."""
+        # Drop results of fetches that started before an invalidation, without
+        # touching the room's last known snapshot or versions
+        if generation is not None and generation != self.generation(room_code):
+            return dict(snapshot, version=snapshot_version(snapshot['data']))
+        snapshot = self._versioned(room_code, self._with_fallback(room_code, snapshot))
+        ttl = self.ttl if ttl is None else ttl
+        # Don't ask Spotify again before it is ready for another try
+        ttl = max(ttl, snapshot['data'].get('retry_after') or 0)
+        self._store.set(f"snapshot:{room_code}", snapshot, ttl)
+        return snapshot
+
+    def invalidate(self, room_code):
+        self._store.incr(f"generation:{room_code}")
+        self._store.delete(f"snapshot:{room_code}")
+
+    def discard(self, room_code):
+        """Forget everything about a room, e.g. once it has been deleted."""
+        self._store.delete_many([f"{name}:{room_code}" for name in
+                                 ('snapshot', 'last-known', 'generation', 'fetching', 'current')])
+
+    def get_or_fetch(self, room_code, fetch):
+        snapshot = self.get(room_code)
+        if snapshot is not None:
+            return snapshot
+
+        with self._locks.hold(room_code):
+            # Another thread may have refreshed the room while we waited
+            snapshot = self.get(room_code)
+            if snapshot is not None:
+                return snapshot
+
+            generation = self.generation(room_code)
+            claimed = self.claim_fetch(room_code)
+            if not claimed:
+                # Another process is fetching this room, serve its last snapshot meanwhile
+                snapshot = self.last_known(room_code)
+                if snapshot is not None:
+                    return snapshot
+            try:
+                return self.set(room_code, fetch(), generation=generation)
+            finally:
+                if claimed:
+                    self.release_fetch(room_code)
+
+    async def aget_or_fetch(self, room_code, afetch):
+        """Async single-flight: concurrent misses on one event loop share one fetch."""
+        snapshot = self.get(room_code)
+        if snapshot is not None:
+            return snapshot
+
+        async with self._async_locks.ahold(room_code):
+            snapshot = self.get(room_code)
+            if snapshot is not None:
+                return snapshot
+
+            generation = self.generation(room_code)
+            claimed = self.claim_fetch(room_code)
+            if not claimed:
+                # Another process is fetching this room, serve its last snapshot meanwhile
+                snapshot = self.last_known(room_code)
+                if snapshot is not None:
+                    return snapshot
+            try:
+                return self.set(room_code, await afetch(), generation=generation)
+            finally:
+                if claimed:
+                    self.release_fetch(room_code)
+
+
+now_playing_cache = NowPlayingCache()
+
+
+def now_ms():
+    return int(time.time() * 1000)
+
+
+def snapshot_version(data):
+    """A short hash of what a snapshot shows, leaving out the progress of a playing song."""
+    if data.get('started_at') is not None:
+        data = {key: value for key, value in data.items() if key != 'time'}
+    encoded = json.dumps(data, sort_keys=True, default=str).encode()
+    return hashlib.blake2s(encoded, digest_size=8).hexdigest()
+
+
+def build_device_info(devices):
+    has_devices = devices is not None and len(devices) > 0
+    has_active_device = False
+
+    if has_devices:
+        active_devices = [d for d in devices if d.get('is_active', False)]
+        has_active_device = len(active_devices) > 0
+        if has_active_device:
+            logger.info(f"Found active Spotify device: {active_devices[0].get('name', 'Unknown')}")
+
+    return {
+        'has_devices': has_devices,
+        'has_active_device': has_active_device,
+        'devices': [{'id': d.get('id'), 'name': d.get('name'), 'type': d.get('type'), 'is_active': d.get('is_active', False)}
+                    for d in (devices or [])]
+    }
+
+
+def fetch_now_playing(host):
+    """
+    Fetch the host's playback state from Spotify.
+
+    Returns a snapshot dict with the HTTP 'status' and the response 'data'
+    that CurrentSong serves. The data is shared between listeners, so it
+    never contains anything specific to the requesting session.
+    """
+    device_info = build_device_info(get_available_devices(host))
+
+    if not get_user_tokens(host):
+        return build_now_playing(host, device_info, None, has_token=False)
+
+    try:
+        response = execute_spotify_api_request(host, "player/currently-playing")
+    except Exception as e:
+        return build_now_playing(host, device_info, None, error=e)
+
+    return build_now_playing(host, device_info, response)
+
+
+async def afetch_now_playing(host):
+    """Async version of fetch_now_playing."""
+    # Building the snapshot may clear invalid tokens, which touches the database
+    abuild_now_playing = database_sync_to_async(build_now_playing)
+    device_info = build_device_info(await aget_available_devices(host))
+
+    if not await aget_user_tokens(host):
+        return await abuild_now_playing(host, device_info, None, has_token=False)
+
+    try:
+        response = await aexecute_spotify_api_request(host, "player/currently-playing")
+    except Exception as e:
+        return await abuild_now_playing(host, device_info, None, error=e)
+
+    return await abuild_now_playing(host, device_info, response)
+
+
+def build_now_playing(host, device_info, response, has_token=True, error=None):
+    """
+    Build a snapshot from what Spotify returned for the host. Snapshots of
+    calls that couldn't reach Spotify are marked 'unavailable', so the
+    cache can serve the room's last known snapshot in their place.
+    """
+    has_devices = device_info['has_devices']
+    has_active_device = device_info['has_active_device']
+
+    if not has_token:
+        return {'status': status.HTTP_401_UNAUTHORIZED, 'data': {
+            "error": "Authentication Required",
+            "message": "Spotify authentication required. Please re-authenticate with Spotify.",
+            "requires_authentication": True,
+            "auth_url": get_spotify_auth_url()
+        }}
+
+    if isinstance(error, ConnectionError):
+        error_msg = str(error)
+        # Check if the error indicates an authentication issue
+        if "authentication" in error_msg.lower() or "token" in error_msg.lower():
+            clear_spotify_tokens(host)
+            return {'status': status.HTTP_401_UNAUTHORIZED, 'data': {
+                "error": "Authentication Required",
+                "message": "Your Spotify session has expired. Please re-authenticate.",
+                "requires_authentication": True,
+                "auth_url": get_spotify_auth_url()
+            }}
+
+        return {'status': status.HTTP_503_SERVICE_UNAVAILABLE, 'data': {
+            "error": "Failed to connect to Spotify API",
+            "device_info": device_info,
+            "requires_premium": True,
+            "spotify_open": has_devices
+        }, 'unavailable': True}
+    if error is not None:
+        error_msg = str(error)
+        if "authentication" in error_msg.lower() or "token" in error_msg.lower():
+            clear_spotify_tokens(host)
+            return {'status': status.HTTP_401_UNAUTHORIZED, 'data': {
+                "error": "Authentication Required",
+                "message": "Your Spotify session has expired. Please re-authenticate.",
+                "requires_authentication": True
+            }}
+
+        return {'status': status.HTTP_500_INTERNAL_SERVER_ERROR, 'data': {
+            "error": str(error),
+            "device_info": device_info,
+            "requires_premium": True,
+            "spotify_open": has_devices
+        }}
+
+    # Return device status even when no song is playing
+    if 'error' in response or 'item' not in response:
+        error_info = {}
+        if 'error' in response:
+            error_info = response.get('error', {})
+            logger.warning(f"Spotify API error: {error_info}")
+
+        status_msg = 'ready' if has_active_device else 'no_active_device'
+        status_text = 'No song is currently playing'
+
+        if not has_devices:
+            status_msg = 'no_devices'
+            status_text = 'No Spotify devices found. Please open Spotify on any device.'
+        elif not has_active_device:
+            status_text = 'No active Spotify device found. Please start Spotify on a device.'
+
+        data = {
+            'is_playing': False,
+            'device_info': device_info,
+            'requires_premium': True,
+            'spotify_open': has_devices,
+            'message': status_text,
+            'status': status_msg,
+            'error_details': error_info,
+            'has_premium': 'premium' not in str(error_info).lower()
+        }
+        if response.get('retry_after') is not None:
+            data['retry_after'] = response['retry_after']
+        snapshot = {'status': status.HTTP_200_OK, 'data': data}
+        if 'error' in response and is_upstream_unavailable(response):
+            snapshot['unavailable'] = True
+        return snapshot
+
+    # Song is playing, extract details
+    item = response.get('item')
+    artist_string = ", ".join(artist.get('name') for artist in item.get('artists'))
+
+    data = {
+        'title': item.get('name'),
+        'artist': artist_string,
+        'duration': item.get('duration_ms'),
+        'time': response.get('progress_ms'),
+        'image_url': item.get('album').get('images')[0].get('url'),
+        'is_playing': response.get('is_playing'),
+        'id': item.get('id'),
+        'device_info': device_info
+    }
+    if data['is_playing'] and data['time'] is not None:
+        # When the song would have started, in ms since the epoch
+        data['started_at'] = now_ms() - data['time']
+    return {'status': status.HTTP_200_OK, 'data': data}
+
+
+def update_room_song(room, song_id):
+    """
+    Move the room on to song_id and clear its votes.
+
+    Every listener polling across a track change tries this at once, so
+    it is a compare-and-set on current_song: only the UPDATE that still
+    finds the old song changes the row and wipes the votes, the others
+    match no row and write nothing. Returns True for the one that won.
+    """
+    current_song = room.current_song
+    if current_song == song_id:
+        return False
+
+    with transaction.atomic():
+        changed = Room.objects.filter(pk=room.pk, current_song=current_song).update(current_song=song_id)
+        if changed:
+            clear_votes(room)
+            forget_room(room.code)
+
+    room.current_song = song_id
+    return bool(changed)
+
+
+def get_room_now_playing(room):
+    """
+    Return (status, payload) describing what the room is listening to:
+    the shared snapshot plus the room's vote tally for the current song.
+    """
+    if getattr(settings, 'SPOTIFY_BACKGROUND_POLLER', False):
+        # Imported here as the poller itself builds on this module
+        from .poller import room_poller
+        room_poller.touch(room)
+
+    snapshot = now_playing_cache.get_or_fetch(room.code, lambda: fetch_now_playing(room.host))
+    return compose_room_now_playing(room, snapshot)
+
+
+async def aget_room_now_playing(room):
+    """Async version of get_room_now_playing."""
+    if getattr(settings, 'SPOTIFY_BACKGROUND_POLLER', False):
+        from .poller import room_poller
+        room_poller.touch(room)
+
+    snapshot = await now_playing_cache.aget_or_fetch(room.code, lambda: afetch_now_playing(room.host))
+    return await acompose_room_now_playing(room, snapshot)
+
+
+def snapshot_song(snapshot):
+    # The snapshot is shared by the whole room, never mutate it in place
+    song = dict(snapshot['data'])
+    song['version'] = snapshot.get('version') or snapshot_version(snapshot['data'])
+    if song.get('started_at') is not None:
+        # Progress as of now rather than as of the fetch
+        song['time'] = max(now_ms() - song['started_at'], 0)
+        if song.get('duration'):
+            song['time'] = min(song['time'], song['duration'])
+    return song
+
+
+def compose_room_now_playing(room, snapshot):
+    song = snapshot_song(snapshot)
+    song_id = song.get('id')
+    if snapshot['status'] != status.HTTP_200_OK or not song_id:
+        return snapshot['status'], song
+
+    song['votes'] = get_vote_count(room, song_id)
+    song['votes_required'] = room.votes_to_skip
+    update_room_song(room, song_id)
+
+    return status.HTTP_200_OK, song
+
+
+async def acompose_room_now_playing(room, snapshot):
+    """
+    Async version of compose_room_now_playing. The vote count is read from
+    the shared cache on the event loop; only a cache miss or a song change
+    goes to the database.
+    """
+    song = snapshot_song(snapshot)
+    song_id = song.get('id')
+    if snapshot['status'] != status.HTTP_200_OK or not song_id:
+        return snapshot['status'], song
+
+    votes = cached_vote_count(room, song_id)
+    if votes is None:
+        votes = await database_sync_to_async(get_vote_count)(room, song_id)
+    song['votes'] = votes
+    song['votes_required'] = room.votes_to_skip
+    if room.current_song != song_id:
+        await database_sync_to_async(update_room_song)(room, song_id)
+
+    return status.HTTP_200_OK, song
+
+
+def now_playing_etag(song):
+    """ETag of a room's now-playing payload: the snapshot version plus the room's vote tally."""
+    return f'"{song["version"]}.{song.get("votes", "")}.{song.get("votes_required", "")}"'
+
+
+def parse_etag(etag):
+    """Split an ETag made by now_playing_etag into (version, votes, votes_required), or None."""
+    parts = etag.strip().removeprefix('W/').strip('"').split('.')
+    if len(parts) != 3:
+        return None
+    version, votes, votes_required = parts
+    try:
+        return version, int(votes) if votes else None, int(votes_required) if votes_required else None
+    except ValueError:
+        return None
+
+
+def now_playing_delta(room, song, etag):
+    """
+    What changed in song since the payload the client's ETag describes, or
+    None if that version is no longer known. Progress is always included.
+    """
+    parsed = parse_etag(etag)
+    if parsed is None:
+        return None
+    version, votes, votes_required = parsed
+    data = now_playing_cache.version_data(room.code, version)
+    if data is None:
+        return None
+
+    previous = dict(data, version=version)
+    if votes is not None:
+        previous['votes'] = votes
+    if votes_required is not None:
+        previous['votes_required'] = votes_required
+
+    changed = {key: value for key, value in song.items() if key not in previous or previous[key] != value}
+    changed['time'] = song.get('time')
+    removed = [key for key in previous if key not in song]
+    return {'delta': True, 'changed': changed, 'removed': removed}
+
+
+def conditional_now_playing(room, status_code, song, if_none_match=None, delta=False):
+    """
+    Answer a now-playing poll given the client's If-None-Match header.
+
+    Returns (status, body, etag). A client that already has the current
+    payload gets 304 and no body; one that asked for a delta gets just the
+    fields that changed since its version. Only successful payloads get an
+    ETag.
+    """
+    if status_code != status.HTTP_200_OK:
+        return status_code, song, None
+
+    etag = now_playing_etag(song)
+    if not if_none_match:
+        return status_code, song, etag
+
+    client_etags = [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+    if etag in client_etags or '*' in client_etags:
+        return status.HTTP_304_NOT_MODIFIED, None, etag
+
+    if delta:
+        changes = now_playing_delta(room, song, client_etags[0])
+        if changes is not None:
+            return status_code, changes, etag
+    return status_code, song, etag
+
+
+def format_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+class RoomEventStream:
+    """
+    Server-sent events for one listener of a room.
+
+    A full 'state' event is sent whenever the song, play state, device
+    state or vote count changes. In between, only a small 'progress' event
+    is sent. The stream is iterated on the event loop and reads the caches
+    there, and only hands database reads to the shared thread pool, so an
+    open stream holds no thread of its own.
+    """
+
+    def __init__(self, room, interval=None, max_age=None, room_refresh=None):
+        self.room = room
+        self.interval = interval or getattr(settings, 'SPOTIFY_STREAM_INTERVAL', 1.0)
+        self.max_age = max_age or getattr(settings, 'SPOTIFY_STREAM_MAX_AGE', 300)
+        self.room_refresh = room_refresh or getattr(settings, 'SPOTIFY_STREAM_ROOM_REFRESH', 10)
+        self._last_state = None
+        self._ticks = 0
+
+    async def anext_event(self):
+        """Return the next message to send, or None once the stream should close."""
+        self._ticks += 1
+        if self._ticks * self.interval > self.max_age:
+            return None
+
+        # Pick up settings changes and notice when the host closes the room
+        if self._ticks % self.room_refresh == 0:
+            room = room_cache.get(self.room.code)
+            if room is None:
+                room = await database_sync_to_async(get_room)(self.room.code)
+            if room is None:
+                return format_event('closed', {'message': 'Room has been closed'})
+            self.room = room
+
+        return self._event(*await aget_room_now_playing(self.room))
+
+    def _event(self, status_code, payload):
+        device_info = payload.get('device_info', {})
+        state = (status_code, payload.get('id'), payload.get('is_playing'), payload.get('votes'),
+                 payload.get('votes_required'), payload.get('status'), payload.get('stale', False),
+                 device_info.get('has_devices'), device_info.get('has_active_device'))
+
+        if state != self._last_state:
+            self._last_state = state
+            return format_event('state', payload)
+
+        if payload.get('id'):
+            return format_event('progress', {'time': payload.get('time'), 'is_playing': payload.get('is_playing')})
+
+        return b": keepalive\n\n"
+
+    async def __aiter__(self):
+        # Ask the browser to reconnect quickly when max_age closes the stream
+        yield b"retry: 1000\n\n"
+        while True:
+            message = await self.anext_event()
+            if message is None:
+                return
+            yield message
+            if message.startswith(b"event: closed"):
+                return
+            await asyncio.sleep(self.interval)
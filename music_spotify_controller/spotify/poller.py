@@ -0,0 +1,192 @@
+from django.conf import settings
+from django.db import close_old_connections
+from rest_framework import status
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import logging
+
+from .now_playing import now_playing_cache, fetch_now_playing
+
+logger = logging.getLogger(__name__)
+
+
+class RoomPoller:
+    """
+    Background poller that keeps now-playing snapshots warm for active rooms.
+
+    Views call touch() whenever a listener reads a room. Each active room is
+    polled once per interval, however many listeners it has, and the result
+    is published to the now-playing cache so that CurrentSong and the event
+    stream only read memory. Rooms that have not been read for
+    SPOTIFY_POLLER_IDLE_TIMEOUT seconds are no longer polled.
+
+    The scheduling thread hands due rooms to a pool of
+    SPOTIFY_POLLER_WORKERS threads and doesn't wait for them, so one slow
+    Spotify call only delays its own room.
+    """
+
+    def __init__(self, cache=now_playing_cache):
+        self.cache = cache
+        self._rooms = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._executor = None
+
+    def _setting(self, name, default):
+        return getattr(settings, name, default)
+
+    def touch(self, room):
+        """Record that someone is listening in this room and start polling it."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._rooms.get(room.code)
+            if entry is None:
+                # The listener that got here first fetches inline, so the
+                # first background poll can wait for that snapshot to expire
+                self._rooms[room.code] = {'host': room.host, 'last_seen': now,
+                                          'next_poll': now + self.cache.ttl}
+                self._wakeup.set()
+            else:
+                entry['host'] = room.host
+                entry['last_seen'] = now
+        self.ensure_started()
+
+    def forget(self, room_code):
+        with self._lock:
+            self._rooms.pop(room_code, None)
+
+    def active_rooms(self):
+        with self._lock:
+            return list(self._rooms)
+
+    def interval_for(self, snapshot):
+        """
+        Seconds until a room should be polled again.
+
+        Playing rooms are polled every SPOTIFY_POLLER_INTERVAL seconds, and
+        every SPOTIFY_POLLER_FAST_INTERVAL seconds once the track is within
+        SPOTIFY_POLLER_NEAR_END seconds of its end, so track changes show up
+        promptly. Paused or idle rooms back off to SPOTIFY_POLLER_PAUSED_INTERVAL.
+        Failed polls that Spotify asked to retry later wait that long instead.
+        """
+        interval = self._setting('SPOTIFY_POLLER_INTERVAL', 2.0)
+        fast_interval = self._setting('SPOTIFY_POLLER_FAST_INTERVAL', 0.5)
+        paused_interval = self._setting('SPOTIFY_POLLER_PAUSED_INTERVAL', 5.0)
+        near_end = self._setting('SPOTIFY_POLLER_NEAR_END', 5.0)
+
+        data = snapshot['data']
+        if data.get('retry_after') is not None:
+            return max(data['retry_after'], fast_interval)
+        if snapshot['status'] != status.HTTP_200_OK or not data.get('is_playing'):
+            return paused_interval
+
+        duration, progress = data.get('duration'), data.get('time')
+        if duration is None or progress is None:
+            return interval
+
+        remaining = max(duration - progress, 0) / 1000
+        if remaining <= near_end:
+            return fast_interval
+        # Don't sleep past the start of the near-end window
+        return max(min(interval, remaining - near_end), fast_interval)
+
+    def poll_room(self, room_code, host):
+        # Every worker process runs a poller; only one of them polls a room at a time
+        if not self.cache.claim_fetch(room_code):
+            return self._setting('SPOTIFY_POLLER_FAST_INTERVAL', 0.5)
+
+        generation = self.cache.generation(room_code)
+        try:
+            snapshot = fetch_now_playing(host)
+        except Exception as e:
+            logger.error(f"Background poll failed for room {room_code}: {str(e)}")
+            return self._setting('SPOTIFY_POLLER_PAUSED_INTERVAL', 5.0)
+        finally:
+            self.cache.release_fetch(room_code)
+
+        interval = self.interval_for(snapshot)
+        # Keep the snapshot readable until shortly after the next poll is due
+        self.cache.set(room_code, snapshot, generation=generation, ttl=interval + self.cache.ttl)
+        return interval
+
+    def _poll_and_reschedule(self, room_code, host):
+        interval = self._setting('SPOTIFY_POLLER_PAUSED_INTERVAL', 5.0)
+        try:
+            interval = self.poll_room(room_code, host)
+        except Exception as e:
+            logger.error(f"Background poll failed for room {room_code}: {str(e)}")
+        finally:
+            close_old_connections()
+            with self._lock:
+                entry = self._rooms.get(room_code)
+                if entry is not None:
+                    entry['next_poll'] = time.monotonic() + interval
+                    entry['polling'] = False
+            self._wakeup.set()
+
+    def _pool(self):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._setting('SPOTIFY_POLLER_WORKERS', 8),
+                                                thread_name_prefix='spotify-room-poll')
+        return self._executor
+
+    def poll_due_rooms(self):
+        """
+        Start polling every room that is due, and return the seconds until
+        the next one is, or None if no room is waiting for its next poll.
+        """
+        now = time.monotonic()
+        idle_timeout = self._setting('SPOTIFY_POLLER_IDLE_TIMEOUT', 15.0)
+
+        due = []
+        with self._lock:
+            for room_code, entry in list(self._rooms.items()):
+                if now - entry['last_seen'] > idle_timeout:
+                    logger.debug(f"No listeners left in room {room_code}, stopping its poll")
+                    del self._rooms[room_code]
+                elif entry['next_poll'] <= now and not entry.get('polling'):
+                    entry['polling'] = True
+                    due.append((room_code, entry['host']))
+
+        for room_code, host in due:
+            self._pool().submit(self._poll_and_reschedule, room_code, host)
+
+        with self._lock:
+            waiting = [entry['next_poll'] for entry in self._rooms.values() if not entry.get('polling')]
+            if not waiting:
+                return None
+            return max(min(waiting) - time.monotonic(), 0)
+
+    def run(self):
+        logger.info("Starting background Spotify poller")
+        while not self._stop.is_set():
+            close_old_connections()
+            timeout = self.poll_due_rooms()
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+        close_old_connections()
+
+    def ensure_started(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self.run, name='spotify-room-poller', daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+room_poller = RoomPoller()
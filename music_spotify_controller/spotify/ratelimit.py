@@ -0,0 +1,131 @@
+from django.conf import settings
+import time
+import logging
+
+from .shared_cache import SharedCache
+
+logger = logging.getLogger(__name__)
+
+# Request priorities. Commands are what a user just clicked, polls only
+# refresh what is already on screen, so polls are the first to be shed.
+COMMAND = 'command'
+POLL = 'poll'
+
+
+class SharedBucket:
+    """
+    Allows `capacity` calls per window of capacity / rate seconds, counted
+    in the shared cache so that every worker process draws on the same
+    budget. Over time that lets `rate` calls a second through, as a token
+    bucket of `capacity` refilled at `rate` would, though a burst can reach
+    twice `capacity` where two windows meet.
+    """
+
+    def __init__(self, store, name, rate, capacity):
+        self.store = store
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+
+    def _window(self, now):
+        """The counter name of the window `now` falls in, and the seconds left in it."""
+        length = self.capacity / self.rate
+        index = int(now // length)
+        return f"{self.name}:{index}", (index + 1) * length - now
+
+    def take(self, now, keep=0):
+        """
+        Take a call from the window, as long as `keep` calls are left in it
+        afterwards. Returns 0 when the call was taken, otherwise the seconds
+        until the next window starts.
+        """
+        counter, remaining = self._window(now)
+        if self.store.incr(counter, ttl=remaining) <= self.capacity - keep:
+            return 0
+        self.store.decr(counter)
+        return remaining
+
+    def give_back(self, now):
+        """Return a call taken with the same `now`."""
+        self.store.decr(self._window(now)[0])
+
+
+class RateLimiter:
+    """
+    Rate limits calls to the Spotify Web API, app-wide and per host token.
+
+    Every call takes from the app-wide bucket and from the bucket of the
+    session whose token it uses. Both are kept in the shared cache, so the
+    limits hold for all worker processes together. Polls must leave
+    POLL_RESERVE of each bucket untouched, which keeps that share free for
+    commands, so under load polls are shed while play, pause and skip still
+    go through.
+
+    When Spotify answers 429, the session is blocked for Retry-After
+    seconds, and polls from every session are held back for as long, as
+    Spotify's limit applies to the whole app. Calls that may not go ahead
+    are not queued: acquire() returns how long to wait instead, so no
+    thread is held while waiting.
+    """
+
+    def __init__(self, namespace='rate-limit'):
+        self._store = SharedCache(namespace)
+
+    def _option(self, name, default):
+        return getattr(settings, 'SPOTIFY_RATE_LIMIT', {}).get(name, default)
+
+    def _app(self):
+        return SharedBucket(self._store, 'app', self._option('APP_RATE', 20), self._option('APP_BURST', 40))
+
+    def _bucket_for(self, session_id):
+        return SharedBucket(self._store, f"host:{session_id}",
+                            self._option('HOST_RATE', 2), self._option('HOST_BURST', 10))
+
+    def _reserve(self, bucket, priority):
+        if priority == COMMAND:
+            return 0
+        return bucket.capacity * self._option('POLL_RESERVE', 0.25)
+
+    def blocked_for(self, session_id, priority=POLL):
+        """Seconds until Spotify will accept calls for this session again after a 429."""
+        blocked_until = self._store.get(f"blocked:{session_id}", 0)
+        if priority == POLL:
+            blocked_until = max(blocked_until, self._store.get('polls-blocked', 0))
+        return max(blocked_until - time.time(), 0)
+
+    def acquire(self, session_id, priority=POLL):
+        """Return 0 if the call may be made now, otherwise the seconds to wait before trying again."""
+        wait = self.blocked_for(session_id, priority)
+        if wait:
+            return wait
+
+        now = time.time()
+        app_bucket = self._app()
+        wait = app_bucket.take(now, keep=self._reserve(app_bucket, priority))
+        if wait:
+            return wait
+
+        bucket = self._bucket_for(session_id)
+        wait = bucket.take(now, keep=self._reserve(bucket, priority))
+        if wait:
+            app_bucket.give_back(now)
+        return wait
+
+    def _block(self, name, until):
+        # Concurrent 429s may race here; the later block is the one to keep
+        if until > self._store.get(name, 0):
+            self._store.set(name, until, until - time.time())
+
+    def throttled(self, session_id, retry_after=None):
+        """Record a 429 from Spotify and return the seconds to back off for."""
+        if retry_after is None:
+            retry_after = self._option('DEFAULT_RETRY_AFTER', 5)
+        logger.warning(f"Spotify rate limited session {session_id}, backing off for {retry_after:.1f}s")
+
+        until = time.time() + retry_after
+        self._block(f"blocked:{session_id}", until)
+        self._block('polls-blocked', until)
+        return retry_after
+
+
+rate_limiter = RateLimiter()
@@ -0,0 +1,120 @@
+from django.conf import settings
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone as dt_timezone
+import random
+import time
+
+# Deadline of the request currently being served, see request_budget_middleware
+_request_deadline = ContextVar('spotify_request_deadline', default=None)
+
+
+class Deadline:
+    """A point in time by which a piece of work has to be finished."""
+
+    def __init__(self, seconds):
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self):
+        return max(self.expires_at - time.monotonic(), 0)
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def timeout(self, default):
+        """Clamp a (connect, read) timeout to what is left of the deadline."""
+        remaining = self.remaining()
+        return tuple(min(part, remaining) for part in default)
+
+
+@contextmanager
+def request_budget(seconds=None):
+    """Limit all Spotify calls made inside the block to a shared time budget."""
+    if seconds is None:
+        seconds = getattr(settings, 'SPOTIFY_REQUEST_BUDGET', 5.0)
+    token = _request_deadline.set(Deadline(seconds))
+    try:
+        yield
+    finally:
+        _request_deadline.reset(token)
+
+
+def current_deadline():
+    """
+    Deadline for one Spotify call: the request's budget when serving a
+    request, otherwise a fresh SPOTIFY_REQUEST_BUDGET for background work.
+    """
+    deadline = _request_deadline.get()
+    if deadline is None:
+        deadline = Deadline(getattr(settings, 'SPOTIFY_REQUEST_BUDGET', 5.0))
+    return deadline
+
+
+def parse_retry_after(response):
+    """Seconds to wait according to a Retry-After header, or None."""
+    if response is None:
+        return None
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(dt_timezone.utc)).total_seconds(), 0)
+
+
+def is_retryable_status(status_code):
+    return status_code == 429 or (status_code is not None and status_code >= 500)
+
+
+class RetryPolicy:
+    """
+    When and how long to wait before retrying a failed Spotify call.
+
+    The first retry is immediate, which covers stale keep-alive connections.
+    Later retries back off exponentially with jitter, and Retry-After
+    overrides the backoff. next_delay() returns None once there are no
+    attempts left or the wait would not fit before the deadline.
+
+    Sync callers never wait. A retry that needs a delay is not made, and the
+    delay is reported to the caller as 'retry_after', so no worker thread
+    sleeps. Async callers await the delay with asyncio.sleep.
+    """
+
+    def __init__(self, max_attempts=None, base_delay=None, max_delay=None, jitter=None):
+        options = getattr(settings, 'SPOTIFY_RETRY', {})
+        self.max_attempts = max_attempts if max_attempts is not None else options.get('MAX_ATTEMPTS', 3)
+        self.base_delay = base_delay if base_delay is not None else options.get('BASE_DELAY', 0.25)
+        self.max_delay = max_delay if max_delay is not None else options.get('MAX_DELAY', 2.0)
+        self.jitter = jitter if jitter is not None else options.get('JITTER', 0.5)
+
+    def next_delay(self, attempt, deadline, retry_after=None):
+        """Seconds to wait after failed attempt number `attempt` (0-based), or None to give up."""
+        if attempt + 1 >= self.max_attempts:
+            return None
+
+        if retry_after is not None:
+            delay = retry_after
+        elif attempt == 0:
+            delay = 0
+        else:
+            delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+            delay *= 1 - self.jitter * random.random()
+
+        if delay >= deadline.remaining():
+            return None
+        return delay
+
+
+def http_timeout():
+    """The (connect, read) timeout for a single call to Spotify."""
+    timeout = getattr(settings, 'SPOTIFY_HTTP_TIMEOUT', (3.05, 5))
+    if not isinstance(timeout, tuple):
+        timeout = (timeout, timeout)
+    return timeout
@@ -0,0 +1,112 @@
+"""
+State shared by every worker process, kept in Django's cache.
+
+Which cache is used is set by SPOTIFY_CACHE_ALIAS (default 'default'), and
+the backend by CACHE_URL in the settings: local memory for a single
+process and tests, a directory for several processes on one machine, or
+Redis for several machines.
+"""
+from contextlib import contextmanager
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.filebased import FileBasedCache
+import math
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:
+    # Windows, where the file backend's counters are left unlocked
+    fcntl = None
+
+from .metrics import record_cache_lookup
+
+
+class SharedCache:
+    """
+    One namespace of the shared cache.
+
+    Values are stored along with their expiry time and checked against it
+    on read, so TTLs below a second work on backends such as Redis that
+    only expire keys by the whole second.
+
+    Counters are plain integers. Redis increments them atomically, and so
+    does local memory among the threads of its one process. The file
+    backend reads and rewrites the file instead, so counters kept there
+    are only changed under a lock file in the cache directory, which every
+    process on the machine takes.
+    """
+
+    def __init__(self, namespace):
+        self.namespace = namespace
+
+    @property
+    def backend(self):
+        return caches[getattr(settings, 'SPOTIFY_CACHE_ALIAS', 'default')]
+
+    def key(self, name):
+        return f"spotify:{self.namespace}:{name}"
+
+    def _backend_timeout(self, ttl):
+        return math.ceil(ttl) + 1
+
+    def get(self, name, default=None):
+        entry = self.backend.get(self.key(name))
+        if entry is None or time.time() >= entry[0]:
+            record_cache_lookup(self.namespace, hit=False)
+            return default
+        record_cache_lookup(self.namespace, hit=True)
+        return entry[1]
+
+    def set(self, name, value, ttl):
+        if ttl <= 0:
+            self.delete(name)
+            return
+        self.backend.set(self.key(name), (time.time() + ttl, value), self._backend_timeout(ttl))
+
+    def add(self, name, value, ttl):
+        """Store the value only if the key is free, and return whether it was stored."""
+        return self.backend.add(self.key(name), (time.time() + ttl, value), self._backend_timeout(ttl))
+
+    def delete(self, name):
+        self.backend.delete(self.key(name))
+
+    def delete_many(self, names):
+        self.backend.delete_many([self.key(name) for name in names])
+
+    @contextmanager
+    def _counter_lock(self):
+        backend = self.backend
+        if fcntl is None or not isinstance(backend, FileBasedCache):
+            yield
+            return
+        os.makedirs(backend._dir, exist_ok=True)
+        with open(os.path.join(backend._dir, 'counters.lock'), 'a') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def counter(self, name):
+        return self.backend.get(self.key(name), 0)
+
+    def incr(self, name, ttl=None):
+        """Increment a counter, creating it at 0 first, to expire after `ttl` seconds if given."""
+        key = self.key(name)
+        with self._counter_lock():
+            try:
+                return self.backend.incr(key)
+            except ValueError:
+                # Missing key; another worker may create it at the same time
+                self.backend.add(key, 0, None if ttl is None else self._backend_timeout(ttl))
+                return self.backend.incr(key)
+
+    def decr(self, name):
+        with self._counter_lock():
+            try:
+                return self.backend.decr(self.key(name))
+            except ValueError:
+                # Expired in the meantime, nothing left to take back
+                return 0
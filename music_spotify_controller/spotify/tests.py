@@ -1,3 +1,1020 @@
-from django.test import TestCase
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import timedelta
+from importlib import reload
+from io import StringIO
+from unittest import mock
+import asyncio
+import json
+import tempfile
+import threading
+import time
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, AsyncClient, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import clear_url_caches, resolve
+from django.utils import timezone
+
+from api.models import Room
+from api.room_cache import get_room
+from music_controller import urls as project_urls
+from . import urls as spotify_urls
+from .asgi import NowPlayingStreamRouter, STREAM_PATH
+from .breaker import CircuitBreaker, circuit_breakers, CLOSED, OPEN, HALF_OPEN
+from .fake_server import FakeSpotifyServer, FakePlayer
+from .housekeeping import delete_in_batches, run_housekeeping
+from .loadtest import parse_server_timing, percentile, timing_count, timing_duration
+from .metrics import registry
+from .models import SpotifyToken, Vote, VoteTally
+from .ratelimit import RateLimiter, COMMAND, POLL
+from .retry import Deadline, RetryPolicy, parse_retry_after, request_budget, current_deadline
+from .shared_cache import SharedCache
+from .votes import NoCurrentSongError, record_vote, claim_skip, get_vote_count
+from .now_playing import NowPlayingCache, now_playing_cache
+from .poller import RoomPoller
+from .util import token_refresher, update_or_create_user_tokens, execute_spotify_api_request
+from .views import AsyncCurrentSong
+
+
+def reload_urls():
+    """Load the URLconfs again, for settings that decide which views they route to."""
+    reload(spotify_urls)
+    reload(project_urls)
+    clear_url_caches()
+
+
+class FakeSpotifyMixin:
+    """Runs the app against an in-process FakeSpotifyServer."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.fake_server = FakeSpotifyServer().start()
+        cls.addClassCleanup(cls.fake_server.stop)
+        cls.fake = cls.fake_server.fake
+        cls.enterClassContext(override_settings(
+            SPOTIFY_API_BASE_URL=cls.fake_server.api_base_url, SPOTIFY_ACCOUNTS_URL=cls.fake_server.accounts_url))
+
+    def setUp(self):
+        self.fake.reset()
+        cache.clear()
+        circuit_breakers.reset()
+
+    def create_room(self, votes_to_skip=2, guest_can_pause=True):
+        """A host's client and the code of the room it created."""
+        host = Client()
+        response = host.post('/api/create-room', {'votes_to_skip': votes_to_skip, 'guest_can_pause': guest_can_pause},
+                             content_type='application/json')
+        self.assertEqual(response.status_code, 201)
+        return host, response.json()['code']
+
+    def join_room(self, code):
+        guest = Client()
+        response = guest.post('/api/join-room', {'code': code}, content_type='application/json')
+        self.assertEqual(response.status_code, 200)
+        return guest
+
+    def link_spotify(self, client, expires_in=3600):
+        """Store Spotify tokens for the client's session, as the login callback would."""
+        update_or_create_user_tokens(client.session.session_key, 'fake-access', 'Bearer', expires_in, 'fake-refresh')
+
+
+class FakeSpotifyTestCase(FakeSpotifyMixin, TestCase):
+    """
+    Checks what requests cost against the fake with assertBudget.
+
+    The budgets pin how many queries and Spotify calls a request makes
+    today. Lower them when a change makes a request cheaper; a change that
+    needs to raise one should say why.
+    """
+
+    @contextmanager
+    def assertBudget(self, queries, spotify_calls=0):
+        """Fail if the block runs more than `queries` queries or calls Spotify more than `spotify_calls` times."""
+        calls_before = self.fake.call_count()
+        with CaptureQueriesContext(connection) as captured, self.captureOnCommitCallbacks(execute=True):
+            yield
+        # Savepoints only come from running inside the test's transaction
+        statements = [query['sql'] for query in captured.captured_queries
+                      if not query['sql'].startswith(('SAVEPOINT', 'RELEASE SAVEPOINT', 'ROLLBACK TO SAVEPOINT'))]
+        self.assertLessEqual(len(statements), queries, "Over the query budget:\n" + '\n'.join(statements))
+        self.assertLessEqual(self.fake.call_count() - calls_before, spotify_calls,
+                             f"Over the Spotify call budget: {dict(self.fake.calls)}")
+
+
+class CurrentSongBudgetTests(FakeSpotifyTestCase):
+    def setUp(self):
+        super().setUp()
+        self.host, self.code = self.create_room()
+        self.link_spotify(self.host)
+        self.guest = self.join_room(self.code)
+
+    def test_first_poll_fetches_devices_and_playback(self):
+        with self.assertBudget(queries=5, spotify_calls=2):
+            response = self.host.get('/spotify/current-song')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['id'], 'fake-track-1')
+
+    def test_guests_are_served_the_hosts_snapshot(self):
+        self.host.get('/spotify/current-song')
+        with self.assertBudget(queries=1, spotify_calls=0):
+            response = self.guest.get('/spotify/current-song')
+        self.assertEqual(response.status_code, 200)
+
+    def test_unchanged_poll_is_not_modified(self):
+        etag = self.guest.get('/spotify/current-song')['ETag']
+        with self.assertBudget(queries=1, spotify_calls=0):
+            response = self.guest.get('/spotify/current-song', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+
+    def test_delta_since_an_old_version(self):
+        first = self.guest.get('/spotify/current-song')
+        self.fake.player.next()
+        now_playing_cache.invalidate(self.code)
+
+        response = self.guest.get('/spotify/current-song?delta=1', headers={'If-None-Match': first['ETag']})
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertTrue(body['delta'])
+        self.assertEqual(body['changed']['id'], 'fake-track-2')
+        self.assertIn('time', body['changed'])
+        # Unchanged fields are left out
+        self.assertNotIn('votes_required', body['changed'])
+        self.assertNotIn('is_playing', body['changed'])
+        self.assertEqual(body['removed'], [])
+        self.assertNotEqual(response['ETag'], first['ETag'])
+        self.assertEqual(response['ETag'], self.guest.get('/spotify/current-song')['ETag'])
+
+    def test_delta_from_an_unknown_version_is_the_full_payload(self):
+        first = self.guest.get('/spotify/current-song')
+        version = first.json()['version']
+        self.fake.player.next()
+        now_playing_cache.invalidate(self.code)
+        full = self.guest.get('/spotify/current-song').json()
+
+        for etag in ('"0123456789abcdef.0.2"', 'not-an-etag'):
+            response = self.guest.get('/spotify/current-song?delta=1', headers={'If-None-Match': etag})
+            self.assertEqual(response.json()['id'], 'fake-track-2')
+            self.assertNotIn('delta', response.json())
+
+        # Versions expire from the cache like any other entry
+        now_playing_cache._store.delete(f"version:{self.code}:{version}")
+        response = self.guest.get('/spotify/current-song?delta=1', headers={'If-None-Match': first['ETag']})
+        self.assertEqual(response.json().keys(), full.keys())
+        self.assertNotIn('delta', response.json())
+
+    def test_song_change_updates_the_room_once(self):
+        self.guest.get('/spotify/current-song')
+        self.fake.player.next()
+        now_playing_cache.invalidate(self.code)
+        with self.assertBudget(queries=6, spotify_calls=1):
+            response = self.guest.get('/spotify/current-song')
+        self.assertEqual(response.json()['id'], 'fake-track-2')
+        self.assertEqual(Room.objects.get(code=self.code).current_song, 'fake-track-2')
+
+        with self.assertBudget(queries=1, spotify_calls=0):
+            self.host.get('/spotify/current-song')
+
+    def test_expired_token_is_refreshed_once(self):
+        self.link_spotify(self.host, expires_in=-60)
+        with self.assertBudget(queries=10, spotify_calls=3):
+            response = self.guest.get('/spotify/current-song')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.fake.call_count('POST', 'api/token'), 1)
+        # The session's refresh lock goes once the refresh is done
+        self.assertEqual(len(token_refresher._locks), 0)
+
+    def test_no_active_device_is_activated_for_the_host(self):
+        self.fake.player = FakePlayer(devices=[dict(device, is_active=False) for device in self.fake.player.devices])
+        with self.assertBudget(queries=5, spotify_calls=5):
+            response = self.host.get('/spotify/current-song')
+        self.assertEqual(self.fake.call_count('PUT', 'player'), 1)
+        self.assertEqual(response.json()['device_info']['activated_device'], 'Fake Laptop')
+
+    def test_no_device_is_not_retried_for_guests(self):
+        self.fake.player = FakePlayer(devices=[dict(device, is_active=False) for device in self.fake.player.devices])
+        with self.assertBudget(queries=0, spotify_calls=2):
+            self.guest.get('/spotify/current-song')
+        with self.assertBudget(queries=0, spotify_calls=0):
+            self.guest.get('/spotify/current-song')
+
+    def test_host_without_spotify_costs_no_calls(self):
+        host, code = self.create_room()
+        with self.assertBudget(queries=3, spotify_calls=0):
+            response = host.get('/spotify/current-song')
+        self.assertEqual(response.status_code, 401)
+
+
+class SkipSongBudgetTests(FakeSpotifyTestCase):
+    def setUp(self):
+        super().setUp()
+        self.host, self.code = self.create_room(votes_to_skip=2)
+        self.link_spotify(self.host)
+        self.guests = [self.join_room(self.code) for _ in range(2)]
+        self.host.get('/spotify/current-song')
+
+    def test_host_skips_straight_away(self):
+        with self.assertBudget(queries=4, spotify_calls=1):
+            response = self.host.post('/spotify/skip')
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.fake.call_count('POST', 'player/next'), 1)
+
+    def test_vote_below_threshold_calls_nothing(self):
+        with self.assertBudget(queries=6, spotify_calls=0):
+            response = self.guests[0].post('/spotify/skip')
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(Vote.objects.filter(room__code=self.code).count(), 1)
+
+    def test_deciding_vote_skips_once(self):
+        self.guests[0].post('/spotify/skip')
+        with self.assertBudget(queries=5, spotify_calls=1):
+            response = self.guests[1].post('/spotify/skip')
+        self.assertEqual(response.status_code, 204)
+        self.assertEqual(self.fake.call_count('POST', 'player/next'), 1)
+        self.assertFalse(Vote.objects.filter(room__code=self.code).exists())
+
+    def test_vote_before_any_song_is_refused(self):
+        host, code = self.create_room()
+        response = self.join_room(code).post('/spotify/skip')
+        self.assertEqual(response.status_code, 409)
+
+    def test_skip_without_active_device_retries_on_a_device(self):
+        self.fake.player = FakePlayer(devices=[dict(device, is_active=False) for device in self.fake.player.devices])
+        with self.assertBudget(queries=4, spotify_calls=3):
+            response = self.host.post('/spotify/skip')
+        self.assertEqual(response.status_code, 204)
+
+
+class MetricsTests(FakeSpotifyTestCase):
+    def setUp(self):
+        super().setUp()
+        registry.reset()
+        self.host, self.code = self.create_room()
+        self.link_spotify(self.host)
+
+    def test_server_timing_reports_the_request_costs(self):
+        response = self.host.get('/spotify/current-song')
+        timing = parse_server_timing(response['Server-Timing'])
+
+        self.assertEqual(list(timing), ['total', 'spotify', 'spotify-retry', 'spotify-shed', 'token-refresh',
+                                        'sleep', 'db', 'cache-hit', 'cache-miss'])
+        self.assertGreater(timing_duration(timing, 'total'), 0)
+        self.assertEqual(timing_count(timing, 'spotify'), 2)
+        self.assertEqual(timing_count(timing, 'spotify-retry'), 0)
+        self.assertGreater(timing_count(timing, 'db'), 0)
+        self.assertRegex(response['X-Request-ID'], r'^[0-9a-f]{12}$')
+
+    def test_retries_and_refreshes_are_counted(self):
+        self.link_spotify(self.host, expires_in=-60)
+        self.fake.fail_next(503, path='player/currently-playing')
+        timing = parse_server_timing(self.host.get('/spotify/current-song')['Server-Timing'])
+        # The token refresh, the devices and currently-playing twice
+        self.assertEqual(timing_count(timing, 'spotify'), 4)
+        self.assertEqual(timing_count(timing, 'spotify-retry'), 1)
+        self.assertEqual(timing_count(timing, 'token-refresh'), 1)
+
+    def test_prometheus_output(self):
+        self.host.get('/spotify/current-song')
+        response = self.host.get('/spotify/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/plain; version=0.0.4; charset=utf-8')
+
+        lines = response.content.decode().splitlines()
+        self.assertIn('# TYPE music_requests_total counter', lines)
+        self.assertIn('music_requests_total{route="spotify/current-song",method="GET",status="200"} 1', lines)
+        self.assertIn('music_spotify_calls_total{endpoint="player/devices",method="GET",status="200"} 1', lines)
+        self.assertIn('music_request_spotify_calls_bucket{route="spotify/current-song",le="2"} 1', lines)
+        self.assertIn('music_request_spotify_calls_count{route="spotify/current-song"} 1', lines)
+
+    @override_settings(SPOTIFY_METRICS_ALLOWED_IPS=['10.0.0.1'])
+    def test_only_allowed_addresses_read_metrics(self):
+        self.assertEqual(self.host.get('/spotify/metrics').status_code, 403)
+        self.assertEqual(self.host.get('/spotify/metrics', REMOTE_ADDR='10.0.0.1').status_code, 200)
+
+    @override_settings(SPOTIFY_METRICS_ALLOWED_IPS=None)
+    def test_no_allow_list_lets_everyone_read_metrics(self):
+        self.assertEqual(self.host.get('/spotify/metrics', REMOTE_ADDR='192.0.2.7').status_code, 200)
+
+
+class AsyncViewTests(FakeSpotifyMixin, TransactionTestCase):
+    """
+    The views served with SPOTIFY_ASYNC_VIEWS. Their database work runs in
+    the shared thread pool, which only sees committed rows, hence
+    TransactionTestCase.
+    """
+
+    def setUp(self):
+        super().setUp()
+        # spotify.urls picks its views on import, so load it again either side of the override
+        self.addCleanup(reload_urls)
+        self.enterContext(override_settings(SPOTIFY_ASYNC_VIEWS=True))
+        reload_urls()
+
+        self.host, self.code = self.create_room(votes_to_skip=2, guest_can_pause=False)
+        self.link_spotify(self.host)
+        self.guests = [self.join_room(self.code) for _ in range(2)]
+
+    def async_client_for(self, client):
+        """An AsyncClient with the session of a sync Client."""
+        async_client = AsyncClient()
+        async_client.cookies = client.cookies
+        return async_client
+
+    def test_serves_the_async_views(self):
+        self.assertEqual(resolve('/spotify/current-song').func.view_class, AsyncCurrentSong)
+
+    async def test_current_song(self):
+        response = await self.async_client_for(self.host).get('/spotify/current-song')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['id'], 'fake-track-1')
+        self.assertEqual(response.json()['votes_required'], 2)
+        self.assertEqual(self.fake.call_count(), 2)
+
+    async def test_unchanged_poll_is_not_modified(self):
+        guest = self.async_client_for(self.guests[0])
+        etag = (await guest.get('/spotify/current-song'))['ETag']
+        calls = self.fake.call_count()
+        response = await guest.get('/spotify/current-song', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(self.fake.call_count(), calls)
+
+    async def test_delta_since_an_old_version(self):
+        guest = self.async_client_for(self.guests[0])
+        etag = (await guest.get('/spotify/current-song'))['ETag']
+        self.fake.player.next()
+        now_playing_cache.invalidate(self.code)
+
+        response = await guest.get('/spotify/current-song?delta=1', headers={'If-None-Match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['delta'])
+        self.assertEqual(response.json()['changed']['id'], 'fake-track-2')
+        self.assertNotEqual(response['ETag'], etag)
+
+    async def test_upstream_error_is_retried(self):
+        self.fake.fail_next(503, path='player/currently-playing')
+        response = await self.async_client_for(self.host).get('/spotify/current-song')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.fake.call_count('GET', 'player/currently-playing'), 2)
+
+    async def test_expired_token_is_refreshed_once(self):
+        await sync_to_async(self.link_spotify)(self.host, expires_in=-60)
+        response = await self.async_client_for(self.guests[0]).get('/spotify/current-song')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.fake.call_count('POST', 'api/token'), 1)
+
+    async def test_no_room_in_session(self):
+        response = await self.async_client.get('/spotify/current-song')
+        self.assertEqual(response.status_code, 404)
+
+    async def test_host_pauses_and_plays_with_one_call_each(self):
+        host = self.async_client_for(self.host)
+        self.assertEqual((await host.put('/spotify/pause')).status_code, 204)
+        self.assertEqual((await host.put('/spotify/play')).status_code, 204)
+        self.assertEqual(self.fake.call_count(), 2)
+        self.assertEqual(self.fake.call_count('PUT', 'player/pause'), 1)
+        self.assertEqual(self.fake.call_count('PUT', 'player/play'), 1)
+
+    async def test_guest_without_permission_cannot_pause(self):
+        response = await self.async_client_for(self.guests[0]).put('/spotify/pause')
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(self.fake.call_count(), 0)
+
+    async def test_premium_required(self):
+        self.fake.fail_next(403, path='player/play')
+        response = await self.async_client_for(self.host).put('/spotify/play')
+        self.assertEqual(response.status_code, 503)
+        self.assertIn("premium required", response.json()['message'])
+
+    async def test_no_device(self):
+        self.fake.player.devices = []
+        response = await self.async_client_for(self.host).put('/spotify/pause')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.json()['error'], "No active Spotify device")
+
+    async def test_votes_skip_once_the_room_agrees(self):
+        await self.async_client_for(self.host).get('/spotify/current-song')
+        guests = [self.async_client_for(guest) for guest in self.guests]
+
+        self.assertEqual((await guests[0].post('/spotify/skip')).status_code, 204)
+        self.assertEqual(await Vote.objects.filter(room__code=self.code).acount(), 1)
+        self.assertEqual(self.fake.call_count('POST', 'player/next'), 0)
+
+        self.assertEqual((await guests[1].post('/spotify/skip')).status_code, 204)
+        self.assertEqual(self.fake.call_count('POST', 'player/next'), 1)
+        self.assertFalse(await Vote.objects.filter(room__code=self.code).aexists())
+
+    async def test_vote_before_any_song_is_refused(self):
+        response = await self.async_client_for(self.guests[0]).post('/spotify/skip')
+        self.assertEqual(response.status_code, 409)
+
+
+class VoteTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.room = Room.objects.create(code='VOTING', host='host', votes_to_skip=2, current_song='song')
+
+    def test_duplicate_vote_is_not_counted(self):
+        self.assertEqual(record_vote(self.room, 'song', 'guest'), 1)
+        self.assertIsNone(record_vote(self.room, 'song', 'guest'))
+        self.assertEqual(get_vote_count(self.room, 'song'), 1)
+        self.assertEqual(Vote.objects.count(), 1)
+
+    def test_vote_without_a_current_song_is_refused(self):
+        with self.assertRaises(NoCurrentSongError):
+            record_vote(self.room, None, 'guest')
+        self.assertFalse(Vote.objects.exists())
+
+    def test_deciding_vote_claims_the_skip_once(self):
+        self.assertEqual(record_vote(self.room, 'song', 'guest-1'), 1)
+        self.assertFalse(claim_skip(self.room, 'song', 2))
+        self.assertEqual(record_vote(self.room, 'song', 'guest-2'), 2)
+
+        self.assertTrue(claim_skip(self.room, 'song', 2))
+        self.assertFalse(claim_skip(self.room, 'song', 2))
+        self.assertFalse(Vote.objects.exists())
+        self.assertEqual(get_vote_count(self.room, 'song'), 0)
+
+
+class Clock:
+    """Stands in for time.time, and only moves when told to."""
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class SharedCacheTests(SimpleTestCase):
+    def test_file_backend_counts_concurrent_increments(self):
+        directory = self.enterContext(tempfile.TemporaryDirectory())
+        self.enterContext(override_settings(SPOTIFY_CACHE_ALIAS='files', CACHES=dict(settings.CACHES, files={
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': directory})))
+        counters = SharedCache('counters')
+
+        def count():
+            for _ in range(50):
+                counters.incr('calls', ttl=60)
+
+        threads = [threading.Thread(target=count) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(counters.counter('calls'), 400)
+
+
+@override_settings(SPOTIFY_RATE_LIMIT={'APP_RATE': 4, 'APP_BURST': 4, 'HOST_RATE': 2, 'HOST_BURST': 4,
+                                       'POLL_RESERVE': 0.5, 'DEFAULT_RETRY_AFTER': 5})
+class RateLimiterTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.clock = Clock()
+        patcher = mock.patch('time.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # Two limiters stand in for two worker processes
+        self.limiter, self.other_process = RateLimiter(), RateLimiter()
+
+    def test_app_limit_is_shared_by_every_process(self):
+        for session in ('a', 'b'):
+            self.assertEqual(self.limiter.acquire(session, COMMAND), 0)
+            self.assertEqual(self.other_process.acquire(session, COMMAND), 0)
+        self.assertEqual(self.limiter.acquire('c', COMMAND), 1.0)
+
+        self.clock.advance(1)
+        self.assertEqual(self.other_process.acquire('c', COMMAND), 0)
+
+    def test_polls_leave_the_reserve_to_commands(self):
+        self.assertEqual(self.limiter.acquire('host', POLL), 0)
+        self.assertEqual(self.other_process.acquire('host', POLL), 0)
+        self.assertGreater(self.limiter.acquire('host', POLL), 0)
+        self.assertEqual(self.limiter.acquire('host', COMMAND), 0)
+        self.assertEqual(self.other_process.acquire('host', COMMAND), 0)
+        self.assertGreater(self.limiter.acquire('host', COMMAND), 0)
+
+    @override_settings(SPOTIFY_RATE_LIMIT={'APP_RATE': 8, 'APP_BURST': 8, 'HOST_RATE': 2, 'HOST_BURST': 2})
+    def test_refused_host_gives_back_the_app_call(self):
+        for _ in range(2):
+            self.assertEqual(self.limiter.acquire('busy-host', COMMAND), 0)
+        self.assertGreater(self.limiter.acquire('busy-host', COMMAND), 0)
+        # Only the two calls that went through count against the app
+        for i in range(6):
+            self.assertEqual(self.other_process.acquire(f'host-{i}', COMMAND), 0)
+        self.assertGreater(self.other_process.acquire('host-6', COMMAND), 0)
+
+    def test_429_blocks_the_session_and_everyones_polls(self):
+        self.assertEqual(self.limiter.throttled('host', retry_after=3), 3)
+
+        self.assertEqual(self.other_process.acquire('host', COMMAND), 3)
+        self.assertEqual(self.other_process.acquire('other-host', POLL), 3)
+        self.assertEqual(self.other_process.acquire('other-host', COMMAND), 0)
+
+        self.clock.advance(3)
+        self.assertEqual(self.other_process.acquire('host', POLL), 0)
+
+    def test_429_without_retry_after(self):
+        self.assertEqual(self.limiter.throttled('host'), 5)
+        self.assertEqual(self.limiter.blocked_for('host'), 5)
+
+
+class FakeResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class PercentileTests(SimpleTestCase):
+    def test_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.50), 50)
+        self.assertEqual(percentile(values, 0.95), 95)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile(values, 0.07), 7)
+
+    def test_bounds(self):
+        self.assertIsNone(percentile([], 0.5))
+        self.assertEqual(percentile([3], 0.99), 3)
+        self.assertEqual(percentile([1, 2, 3], 0.0), 1)
+        self.assertEqual(percentile([1, 2, 3], 1.0), 3)
+        self.assertEqual(percentile([1, 2, 3, 4], 0.5), 2)
+
+
+class RetryPolicyTests(SimpleTestCase):
+    def setUp(self):
+        self.clock = Clock()
+        patcher = mock.patch('time.monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.policy = RetryPolicy(max_attempts=4, base_delay=0.25, max_delay=1.0, jitter=0)
+
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after(FakeResponse({'Retry-After': '3'})), 3)
+        self.assertGreater(parse_retry_after(FakeResponse({'Retry-After': 'Thu, 01 Jan 2099 00:00:00 GMT'})), 0)
+        self.assertEqual(parse_retry_after(FakeResponse({'Retry-After': 'Thu, 01 Jan 1970 00:00:00 GMT'})), 0)
+        self.assertIsNone(parse_retry_after(FakeResponse({'Retry-After': 'soon'})))
+        self.assertIsNone(parse_retry_after(FakeResponse({})))
+        self.assertIsNone(parse_retry_after(None))
+
+    def test_backoff(self):
+        deadline = Deadline(10)
+        self.assertEqual([self.policy.next_delay(attempt, deadline) for attempt in range(4)], [0, 0.25, 0.5, None])
+
+    def test_backoff_is_capped(self):
+        policy = RetryPolicy(max_attempts=10, base_delay=0.25, max_delay=1.0, jitter=0)
+        self.assertEqual(policy.next_delay(8, Deadline(10)), 1.0)
+
+    def test_retry_after_overrides_the_backoff(self):
+        self.assertEqual(self.policy.next_delay(0, Deadline(10), retry_after=2), 2)
+
+    def test_gives_up_when_the_wait_would_outlast_the_deadline(self):
+        deadline = Deadline(3)
+        self.assertIsNone(self.policy.next_delay(0, deadline, retry_after=3))
+        self.clock.advance(2.9)
+        self.assertIsNone(self.policy.next_delay(1, deadline))
+        self.assertEqual(self.policy.next_delay(0, deadline), 0)
+
+    def test_deadline(self):
+        deadline = Deadline(2)
+        self.assertEqual(deadline.timeout((3.05, 5)), (2, 2))
+        self.clock.advance(1.5)
+        self.assertEqual(deadline.timeout((0.25, 5)), (0.25, 0.5))
+        self.assertFalse(deadline.expired())
+        self.clock.advance(0.5)
+        self.assertTrue(deadline.expired())
+        self.assertEqual(deadline.remaining(), 0)
+
+    def test_request_budget_is_shared_by_the_calls_in_it(self):
+        with request_budget(2):
+            self.assertIs(current_deadline(), current_deadline())
+            self.assertEqual(current_deadline().remaining(), 2)
+        self.assertIsNot(current_deadline(), current_deadline())
+
+
+class RetryTests(FakeSpotifyTestCase):
+    def setUp(self):
+        super().setUp()
+        self.session = 'host-session'
+        update_or_create_user_tokens(self.session, 'fake-access', 'Bearer', 3600, 'fake-refresh')
+
+    def test_first_retry_is_immediate(self):
+        self.fake.fail_next(503)
+        result = execute_spotify_api_request(self.session, 'player/currently-playing')
+        self.assertEqual(result['item']['id'], 'fake-track-1')
+        self.assertEqual(self.fake.call_count('GET', 'player/currently-playing'), 2)
+
+    def test_retry_that_needs_a_wait_is_left_to_the_caller(self):
+        self.fake.fail_next(503, times=2)
+        result = execute_spotify_api_request(self.session, 'player/currently-playing')
+        self.assertEqual(result['status'], 503)
+        self.assertGreater(result['retry_after'], 0)
+        self.assertEqual(self.fake.call_count('GET', 'player/currently-playing'), 2)
+
+    def test_429_reports_retry_after_and_holds_back_polls(self):
+        self.fake.retry_after = 4
+        self.addCleanup(setattr, self.fake, 'retry_after', 1)
+        self.fake.fail_next(429)
+        result = execute_spotify_api_request(self.session, 'player/currently-playing')
+        self.assertEqual(result['retry_after'], 4)
+
+        result = execute_spotify_api_request(self.session, 'player/currently-playing')
+        self.assertEqual(result['error'], 'Rate limited')
+        self.assertEqual(self.fake.call_count('GET', 'player/currently-playing'), 1)
+
+    def test_open_circuit_makes_no_calls(self):
+        breaker = circuit_breakers.for_endpoint('GET', 'player/currently-playing')
+        for _ in range(settings.SPOTIFY_CIRCUIT_BREAKER['FAILURE_THRESHOLD']):
+            breaker.record_failure()
+        result = execute_spotify_api_request(self.session, 'player/currently-playing')
+        self.assertEqual(result['error'], 'Circuit open')
+        self.assertEqual(self.fake.call_count(), 0)
+
+    def test_spent_budget_makes_no_calls(self):
+        with request_budget(0):
+            result = execute_spotify_api_request(self.session, 'player/currently-playing')
+        self.assertEqual(result['error'], 'Timeout')
+        self.assertEqual(self.fake.call_count(), 0)
+
+
+@override_settings(SPOTIFY_CIRCUIT_BREAKER={'FAILURE_THRESHOLD': 3, 'RESET_TIMEOUT': 10})
+class CircuitBreakerTests(SimpleTestCase):
+    def setUp(self):
+        self.clock = Clock()
+        patcher = mock.patch('time.monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker('test')
+
+    def open(self):
+        for _ in range(3):
+            self.assertEqual(self.breaker.allow(), 0)
+            self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, OPEN)
+
+    def test_opens_after_consecutive_failures(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.breaker.record_response(200)
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.breaker.record_response(503)
+        self.breaker.record_response(500)
+        self.assertEqual(self.breaker.state, OPEN)
+
+    def test_client_errors_are_not_failures(self):
+        for _ in range(5):
+            self.breaker.record_response(404)
+        self.assertEqual(self.breaker.state, CLOSED)
+
+    def test_open_half_open_closed(self):
+        self.open()
+        self.assertEqual(self.breaker.allow(), 10)
+        self.clock.advance(10)
+
+        # One probe at a time
+        self.assertEqual(self.breaker.allow(), 0)
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+        self.assertEqual(self.breaker.allow(), 10)
+
+        self.breaker.record_success()
+        self.assertEqual(self.breaker.state, CLOSED)
+        self.assertEqual(self.breaker.allow(), 0)
+
+    def test_failed_probe_opens_again(self):
+        self.open()
+        self.clock.advance(10)
+        self.assertEqual(self.breaker.allow(), 0)
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, OPEN)
+        self.assertEqual(self.breaker.allow(), 10)
+
+    def test_released_probe_lets_the_next_call_probe(self):
+        self.open()
+        self.clock.advance(10)
+        self.assertEqual(self.breaker.allow(), 0)
+        self.breaker.release()
+        self.assertEqual(self.breaker.allow(), 0)
+
+    def test_lost_probe_is_given_up_on(self):
+        self.open()
+        self.clock.advance(10)
+        self.assertEqual(self.breaker.allow(), 0)
+        self.clock.advance(10)
+        self.assertEqual(self.breaker.allow(), 0)
+        self.assertEqual(self.breaker.state, HALF_OPEN)
+
+    def test_endpoints_share_breakers_by_class(self):
+        circuit_breakers.reset()
+        self.addCleanup(circuit_breakers.reset)
+        breaker = circuit_breakers.for_endpoint('GET', 'player/devices?market=x')
+        self.assertIs(breaker, circuit_breakers.for_endpoint('GET', 'player/devices'))
+        self.assertIsNot(breaker, circuit_breakers.for_endpoint('GET', 'player/currently-playing'))
+        self.assertIs(circuit_breakers.for_endpoint('PUT', 'player/play'),
+                      circuit_breakers.for_endpoint('POST', 'player/next'))
+
+
+def playing(song_id):
+    return {'status': 200, 'data': {'id': song_id, 'is_playing': False}}
+
+
+class NowPlayingCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.cache = NowPlayingCache(namespace='test-now-playing')
+
+    def test_fetch_started_before_invalidation_is_dropped(self):
+        stored = self.cache.set('ROOM', playing('before'))
+        generation = self.cache.generation('ROOM')
+        self.cache.invalidate('ROOM')
+
+        served = self.cache.set('ROOM', playing('late'), generation=generation)
+        self.assertEqual(served['data']['id'], 'late')
+        self.assertIsNone(self.cache.get('ROOM'))
+        self.assertEqual(self.cache.last_known('ROOM')['data']['id'], 'before')
+        self.assertIsNone(self.cache.version_data('ROOM', served['version']))
+        self.assertEqual(self.cache.version_data('ROOM', stored['version'])['id'], 'before')
+
+    def test_fetch_after_invalidation_is_stored(self):
+        self.cache.set('ROOM', playing('before'))
+        self.cache.invalidate('ROOM')
+        generation = self.cache.generation('ROOM')
+
+        self.cache.set('ROOM', playing('after'), generation=generation)
+        self.assertEqual(self.cache.get('ROOM')['data']['id'], 'after')
+        self.assertEqual(self.cache.last_known('ROOM')['data']['id'], 'after')
+
+    def test_concurrent_misses_share_a_fetch_and_its_lock_is_dropped(self):
+        fetches = []
+
+        def fetch():
+            fetches.append(1)
+            time.sleep(0.05)
+            return playing('song')
+
+        threads = [threading.Thread(target=self.cache.get_or_fetch, args=('ROOM', fetch)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(fetches), 1)
+        for code in range(100):
+            self.cache.get_or_fetch(f'ROOM{code}', lambda: playing('song'))
+
+        self.assertEqual(len(self.cache._locks), 0)
+
+    def test_async_misses_share_a_fetch_and_its_lock_is_dropped(self):
+        fetches = []
+
+        async def afetch():
+            fetches.append(1)
+            await asyncio.sleep(0.05)
+            return playing('song')
+
+        async def listen():
+            await asyncio.gather(*(self.cache.aget_or_fetch('ROOM', afetch) for _ in range(5)))
+
+        asyncio.run(listen())
+        self.assertEqual(len(fetches), 1)
+        self.assertEqual(len(self.cache._async_locks), 0)
+
+
+@override_settings(SPOTIFY_POLLER_WORKERS=4)
+class RoomPollerTests(FakeSpotifyTestCase):
+    def setUp(self):
+        super().setUp()
+        self.poller = RoomPoller()
+        self.addCleanup(self.poller.stop)
+        self.rooms = [Room(code=f'POLL{i}', host=f'host-{i}') for i in range(4)]
+        for room in self.rooms:
+            update_or_create_user_tokens(room.host, 'fake-access', 'Bearer', 3600, 'fake-refresh')
+            self.poller.touch(room)
+        # Only poll from this test, and poll every room now
+        self.poller.stop()
+        for entry in self.poller._rooms.values():
+            entry['next_poll'] = 0
+
+    def wait_for_polls(self, timeout=5):
+        deadline = time.monotonic() + timeout
+        while any(entry.get('polling') for entry in self.poller._rooms.values()):
+            self.assertLess(time.monotonic(), deadline, "Polls did not finish")
+            time.sleep(0.01)
+
+    def test_due_rooms_are_polled_concurrently(self):
+        self.fake.latency = 0.2
+        self.addCleanup(setattr, self.fake, 'latency', 0.0)
+
+        started = time.monotonic()
+        self.assertIsNone(self.poller.poll_due_rooms())
+        self.wait_for_polls()
+        # Two calls per room (devices, then currently-playing), all rooms at once
+        self.assertLess(time.monotonic() - started, 2 * 0.2 * len(self.rooms))
+
+        for room in self.rooms:
+            self.assertEqual(now_playing_cache.get(room.code)['data']['id'], 'fake-track-1')
+        self.assertGreater(self.poller.poll_due_rooms(), 0)
+
+    def test_room_being_polled_is_not_polled_again(self):
+        self.fake.latency = 0.2
+        self.addCleanup(setattr, self.fake, 'latency', 0.0)
+
+        self.poller.poll_due_rooms()
+        self.poller.poll_due_rooms()
+        self.wait_for_polls()
+        self.assertEqual(self.fake.call_count('GET', 'player/currently-playing'), len(self.rooms))
+
+
+class RoomEventStreamTests(FakeSpotifyTestCase):
+    def setUp(self):
+        super().setUp()
+        self.host, self.code = self.create_room()
+        self.link_spotify(self.host)
+        self.guest = self.join_room(self.code)
+        # Cache the room, its snapshot and its vote count, as the other
+        # thread the stream reads the database from can't see this test's rows
+        self.guest.get('/spotify/current-song')
+        get_room(self.code)
+        self.cookie = f"{settings.SESSION_COOKIE_NAME}={self.guest.cookies[settings.SESSION_COOKIE_NAME].value}"
+
+    async def request_stream(self, cookie, messages=3, host='testserver', root_path=''):
+        """Request the stream from NowPlayingStreamRouter and disconnect after `messages` body messages."""
+        sent = []
+        enough = asyncio.Event()
+        requested = False
+
+        async def receive():
+            nonlocal requested
+            if not requested:
+                requested = True
+                return {'type': 'http.request', 'body': b''}
+            await enough.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            sent.append(message)
+            if len(sent) > messages:
+                enough.set()
+
+        async def django(scope, receive, send):
+            await send({'type': 'http.response.start', 'status': 400, 'headers': [(b'x-served-by', b'django')]})
+            await send({'type': 'http.response.body', 'body': b''})
+
+        headers = [(b'host', host.encode())]
+        if cookie:
+            headers.append((b'cookie', cookie.encode()))
+        scope = {'type': 'http', 'method': 'GET', 'path': root_path + STREAM_PATH, 'root_path': root_path,
+                 'headers': headers, 'server': ('127.0.0.1', 8000)}
+        await NowPlayingStreamRouter(django)(scope, receive, send)
+        return sent
+
+    @override_settings(SPOTIFY_STREAM_INTERVAL=0.01)
+    def test_streams_the_sessions_room(self):
+        start, *bodies = asyncio.run(self.request_stream(self.cookie))
+        self.assertEqual(start['status'], 200)
+        self.assertEqual(bodies[0]['body'], b"retry: 1000\n\n")
+        self.assertTrue(bodies[1]['body'].startswith(b"event: state"))
+        self.assertEqual(json.loads(bodies[1]['body'].split(b"data: ")[1])['id'], 'fake-track-1')
+        self.assertTrue(bodies[2]['body'].startswith(b"event: progress"))
+
+    def test_no_room_in_session(self):
+        start, body = asyncio.run(self.request_stream(None))
+        self.assertEqual(start['status'], 404)
+
+    @override_settings(SPOTIFY_STREAM_INTERVAL=0.01)
+    def test_mounted_under_a_prefix(self):
+        start, *bodies = asyncio.run(self.request_stream(self.cookie, root_path='/music'))
+        self.assertEqual(start['status'], 200)
+
+    def test_other_hosts_are_left_to_django(self):
+        start, body = asyncio.run(self.request_stream(self.cookie, host='attacker.example'))
+        self.assertIn((b'x-served-by', b'django'), start['headers'])
+
+    @override_settings(SPOTIFY_STREAM_INTERVAL=0.01)
+    def test_request_metrics_are_recorded(self):
+        registry.reset()
+        start, *bodies = asyncio.run(self.request_stream(self.cookie))
+        headers = dict(start['headers'])
+        self.assertTrue(headers[b'server-timing'].startswith(b'total;dur='))
+        self.assertIn(b'x-request-id', headers)
+        self.assertIn('music_requests_total{route="spotify/current-song/stream",method="GET",status="200"} 1',
+                      registry.render())
+
+    def test_wsgi_refuses_the_stream(self):
+        self.assertEqual(self.guest.get(STREAM_PATH).status_code, 404)
+
+    @override_settings(SPOTIFY_STREAM_INTERVAL=0.01)
+    def test_open_streams_hold_no_threads(self):
+        threads = threading.active_count()
+
+        async def listen():
+            # Database reads may use these, but the streams must not need more
+            asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=2))
+            responses = await asyncio.gather(*(self.request_stream(self.cookie) for _ in range(20)))
+            return responses, threading.active_count()
+
+        responses, listening_threads = asyncio.run(listen())
+        self.assertLessEqual(listening_threads, threads + 2)
+        self.assertTrue(all(response[0]['status'] == 200 for response in responses))
+
+
+@override_settings(SPOTIFY_HOUSEKEEPING={'ROOM_IDLE_AFTER': 3600, 'TOKEN_RETENTION': 86400, 'BATCH_PAUSE': 0})
+class HousekeepingTests(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+
+    def session(self, key, expires_in):
+        Session.objects.create(session_key=key, session_data='', expire_date=self.now + timedelta(seconds=expires_in))
+
+    def token(self, user, expires_in):
+        return SpotifyToken.objects.create(user=user, access_token='a', refresh_token='r', token_type='Bearer',
+                                           expires_in=self.now + timedelta(seconds=expires_in))
+
+    def room(self, code, host, age, current_song=None):
+        room = Room.objects.create(code=code, host=host, current_song=current_song)
+        Room.objects.filter(pk=room.pk).update(created_at=self.now - timedelta(seconds=age))
+        return room
+
+    def codes(self):
+        return set(Room.objects.values_list('code', flat=True))
+
+    def test_abandoned_rooms(self):
+        self.room('ACTIVE', 'active-host', age=7200)
+        self.session('active-host', 3600)
+        self.token('active-host', 3600)
+        self.room('NOTOKN', 'tokenless-host', age=7200)
+        self.session('tokenless-host', 3600)
+        self.room('OLDTKN', 'idle-host', age=7200)
+        self.session('idle-host', 3600)
+        self.token('idle-host', -7200)
+        self.room('NOSESS', 'gone-host', age=7200)
+        self.token('gone-host', 3600)
+        self.room('RECENT', 'new-host', age=60)
+
+        self.assertEqual(run_housekeeping()['rooms'], 3)
+        self.assertEqual(self.codes(), {'ACTIVE', 'RECENT'})
+
+    def test_stale_votes(self):
+        room = self.room('VOTING', 'host', age=60, current_song='now')
+        self.session('host', 3600)
+        self.token('host', 3600)
+        Vote.objects.create(user='guest-1', room=room, song_id='now')
+        Vote.objects.create(user='guest-2', room=room, song_id='before')
+        VoteTally.objects.create(room=room, song_id='now', count=1)
+        VoteTally.objects.create(room=room, song_id='before', count=1)
+
+        results = run_housekeeping()
+        self.assertEqual((results['votes'], results['vote_tallies']), (1, 1))
+        self.assertEqual(list(Vote.objects.values_list('song_id', flat=True)), ['now'])
+        self.assertEqual(list(VoteTally.objects.values_list('song_id', flat=True)), ['now'])
+
+    def test_stale_tokens(self):
+        self.token('valid', 3600)
+        self.token('long-expired', -2 * 86400)
+        self.session('expired-with-session', 3600)
+        self.token('expired-with-session', -60)
+        self.token('expired-without-session', -60)
+        self.room('HOSTED', 'expired-host', age=60)
+        self.session('expired-host', 3600)
+        self.token('expired-host', -2 * 86400)
+
+        self.assertEqual(run_housekeeping()['tokens'], 2)
+        self.assertEqual(set(SpotifyToken.objects.values_list('user', flat=True)),
+                         {'valid', 'expired-with-session', 'expired-host'})
+
+    def test_deletes_in_batches(self):
+        for i in range(5):
+            self.room(f'ROOM{i}', f'host-{i}', age=7200)
+        batches = []
+
+        deleted = delete_in_batches(Room.objects.all(), batch_size=2, pause=0,
+                                    on_batch=lambda batch: batches.append(batch.count()))
+        self.assertEqual(deleted, 5)
+        self.assertEqual(batches, [2, 2, 1])
+        self.assertFalse(Room.objects.exists())
+
+    def test_command_deletes_across_batches(self):
+        for i in range(5):
+            self.room(f'ROOM{i}', f'host-{i}', age=7200)
+        out = StringIO()
+        call_command('housekeeping', '--batch-size', '2', stdout=out)
+        self.assertIn("Deleted 5 rooms", out.getvalue())
+        self.assertFalse(Room.objects.exists())
+
+    def test_dry_run_deletes_nothing(self):
+        room = self.room('ABANDN', 'gone-host', age=7200)
+        Vote.objects.create(user='guest', room=room, song_id='before')
+        self.token('long-expired', -2 * 86400)
+        self.session('expired', -60)
+
+        out = StringIO()
+        call_command('housekeeping', '--dry-run', stdout=out)
+        self.assertIn("Would delete 1 rooms, 1 votes, 0 vote_tallies, 1 tokens, 1 sessions", out.getvalue())
+        self.assertEqual((Room.objects.count(), Vote.objects.count(), SpotifyToken.objects.count(),
+                          Session.objects.count()), (1, 1, 1, 1))
@@ -1,12 +1,19 @@
+from django.conf import settings
 from django.urls import path
 from .views import *
 
+# Under ASGI, the async views await Spotify instead of holding a thread
+if getattr(settings, 'SPOTIFY_ASYNC_VIEWS', False):
+    CurrentSong, PauseSong, PlaySong, SkipSong = AsyncCurrentSong, AsyncPauseSong, AsyncPlaySong, AsyncSkipSong
+
 urlpatterns = [
     path('get-auth-url', AuthURL.as_view()),
     path('redirect', spotify_callback),
     path('is-authenticated', IsAuthenticated.as_view()),
     path('current-song', CurrentSong.as_view()),
+    path('current-song/stream', current_song_stream),
     path('pause', PauseSong.as_view()),
     path('play', PlaySong.as_view()),
-    path('skip', SkipSong.as_view())
+    path('skip', SkipSong.as_view()),
+    path('metrics', metrics)
 ]
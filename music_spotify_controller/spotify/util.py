@@ -1,25 +1,120 @@
 from .models import SpotifyToken
 from django.utils import timezone
 from datetime import timedelta
-from .credentials import CLIENT_ID, CLIENT_SECRET
-from requests import post, put, get, ConnectionError, Timeout, RequestException
-import time
+from .credentials import CLIENT_ID, CLIENT_SECRET, REDIRECT_URI, SCOPE
+from django.conf import settings
+from django.db import connection
+from requests import Request, Session, ConnectionError, Timeout, RequestException
+from requests.adapters import HTTPAdapter
+from http.cookiejar import DefaultCookiePolicy
+from .retry import RetryPolicy, current_deadline, http_timeout, is_retryable_status, parse_retry_after
+from .ratelimit import rate_limiter, COMMAND, POLL
+from .breaker import circuit_breakers
+from .locks import KeyedLocks
+from .shared_cache import SharedCache
+from .metrics import spotify_call, record_retry, record_shed, record_token_refresh
+import threading
+import math
 import logging
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
 
-BASE_URL = "https://api.spotify.com/v1/me/"
+def api_url(endpoint):
+    """URL of a /me/ endpoint of the Web API at SPOTIFY_API_BASE_URL."""
+    base_url = getattr(settings, 'SPOTIFY_API_BASE_URL', 'https://api.spotify.com/v1/')
+    return base_url.rstrip('/') + '/me/' + endpoint
+
+
+def accounts_url(path):
+    """URL of an accounts service endpoint, e.g. 'api/token', at SPOTIFY_ACCOUNTS_URL."""
+    base_url = getattr(settings, 'SPOTIFY_ACCOUNTS_URL', 'https://accounts.spotify.com/')
+    return base_url.rstrip('/') + '/' + path
+
+
+_http_session = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session():
+    """
+    Return the shared, pooled HTTP session used for every call to Spotify.
+
+    Connections to api.spotify.com and accounts.spotify.com are kept alive
+    and reused, so only the first request per connection pays for the TCP
+    and TLS handshakes. Cookies are never stored, which keeps the session
+    free of per-request state and safe to share between threads.
+    """
+    global _http_session
+    if _http_session is None:
+        with _http_session_lock:
+            if _http_session is None:
+                _http_session = create_http_session()
+    return _http_session
+
+
+def create_http_session():
+    session = Session()
+    adapter = HTTPAdapter(
+        pool_connections=getattr(settings, 'SPOTIFY_HTTP_POOL_CONNECTIONS', 4),
+        pool_maxsize=getattr(settings, 'SPOTIFY_HTTP_POOL_MAXSIZE', 20),
+        pool_block=getattr(settings, 'SPOTIFY_HTTP_POOL_BLOCK', False)
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    if not getattr(settings, 'SPOTIFY_HTTP_KEEP_ALIVE', True):
+        session.headers['Connection'] = 'close'
+    return session
+
+
+def get_spotify_auth_url():
+    return Request('GET', accounts_url('authorize'), params={
+        'scope': SCOPE,
+        'response_type': 'code',
+        'redirect_uri': REDIRECT_URI,
+        'client_id': CLIENT_ID
+    }).prepare().url
+
+
+class TokenCache:
+    """
+    Cache of SpotifyToken rows in the shared cache, keyed by session id.
+
+    Entries are dropped when the access token expires, so expiry checks and
+    refreshes always start from the database row. They are also dropped
+    after SPOTIFY_TOKEN_CACHE_TTL seconds. Refreshed tokens are written
+    through, so every worker process sees them straight away.
+    """
+
+    def __init__(self):
+        self._store = SharedCache('tokens')
+
+    def get(self, session_id):
+        return self._store.get(session_id)
+
+    def set(self, session_id, tokens):
+        ttl = min(getattr(settings, 'SPOTIFY_TOKEN_CACHE_TTL', 300),
+                  (tokens.expires_in - timezone.now()).total_seconds())
+        self._store.set(session_id, tokens, ttl)
+
+    def invalidate(self, session_id):
+        self._store.delete(session_id)
+
+
+token_cache = TokenCache()
 
 
 def get_user_tokens(session_id):
-    user_tokens = SpotifyToken.objects.filter(user=session_id)
+    tokens = token_cache.get(session_id)
+    if tokens is not None:
+        return tokens
 
-    if user_tokens.exists():
-        return user_tokens[0]
-    else:
-        return None
+    tokens = SpotifyToken.objects.filter(user=session_id).first()
+    if tokens is not None:
+        token_cache.set(session_id, tokens)
+    return tokens
 
 
 def update_or_create_user_tokens(session_id, access_token, token_type, expires_in, refresh_token):
@@ -27,10 +122,10 @@ def update_or_create_user_tokens(session_id, access_token, token_type, expires_i
     expires_in = timezone.now() + timedelta(seconds=expires_in)
 
     if tokens:
-        tokens.access_token = access_token
-        tokens.refresh_token = refresh_token
-        tokens.expires_in = expires_in
-        tokens.token_type = token_type
+        # Save a new instance, the old one may still be read by other threads
+        tokens = SpotifyToken(pk=tokens.pk, user=session_id, created_at=tokens.created_at,
+                              access_token=access_token, refresh_token=refresh_token,
+                              token_type=token_type, expires_in=expires_in)
         tokens.save(update_fields=['access_token',
                                    'refresh_token', 'expires_in', 'token_type'])
     else:
@@ -38,14 +133,12 @@ def update_or_create_user_tokens(session_id, access_token, token_type, expires_i
                               refresh_token=refresh_token, token_type=token_type, expires_in=expires_in)
         tokens.save()
 
+    token_cache.set(session_id, tokens)
 
-def is_spotify_authenticated(session_id):
-    tokens = get_user_tokens(session_id)
-    if tokens:
-        expiry = tokens.expires_in
-        if expiry <= timezone.now():
-            refresh_spotify_token(session_id)
 
+def is_spotify_authenticated(session_id):
+    if get_user_tokens(session_id):
+        token_refresher.ensure_fresh(session_id)
         return True
 
     return False
@@ -54,6 +147,7 @@ def is_spotify_authenticated(session_id):
 def clear_spotify_tokens(session_id):
     """Clear invalid Spotify tokens from the database."""
     tokens = get_user_tokens(session_id)
+    token_cache.invalidate(session_id)
     if tokens:
         logger.warning(f"Clearing invalid Spotify tokens for session {session_id}")
         tokens.delete()
@@ -66,23 +160,28 @@ def refresh_spotify_token(session_id):
         return False
         
     refresh_token = tokens.refresh_token
+    policy = RetryPolicy()
+    deadline = current_deadline()
     
-    # Maximum retry attempts
-    max_retries = 3
-    retry_delay = 1  # seconds
-    
-    for attempt in range(max_retries):
+    for attempt in range(policy.max_attempts):
+        if deadline.expired():
+            logger.error(f"Token refresh for session {session_id} ran out of time")
+            return False
+
+        retry_after = None
         try:
-            response = post(
-                'https://accounts.spotify.com/api/token', 
-                data={
-                    'grant_type': 'refresh_token',
-                    'refresh_token': refresh_token,
-                    'client_id': CLIENT_ID,
-                    'client_secret': CLIENT_SECRET
-                },
-                timeout=10  # Set a timeout
-            )
+            with spotify_call('POST', 'token') as call:
+                response = get_http_session().post(
+                    accounts_url('api/token'),
+                    data={
+                        'grant_type': 'refresh_token',
+                        'refresh_token': refresh_token,
+                        'client_id': CLIENT_ID,
+                        'client_secret': CLIENT_SECRET
+                    },
+                    timeout=deadline.timeout(http_timeout())
+                )
+                call.status = response.status_code
             
             # Check if we got a 400 Bad Request error (invalid token)
             if response.status_code == 400:
@@ -99,320 +198,465 @@ def refresh_spotify_token(session_id):
             # Check for error in response
             if 'error' in response_data:
                 logger.error(f"Spotify API error: {response_data.get('error_description', 'Unknown error')}")
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
-                    retry_delay *= 2  # Exponential backoff
-                    continue
                 
                 # Check if it's an invalid token error
                 error_desc = response_data.get('error_description', '').lower()
                 if 'invalid' in error_desc and 'token' in error_desc:
                     clear_spotify_tokens(session_id)
+                    return False
+            else:
+                access_token = response_data.get('access_token')
+                token_type = response_data.get('token_type')
+                expires_in = response_data.get('expires_in')
                 
-                return False
+                # If refresh token is returned, use it; otherwise, keep the old one
+                new_refresh_token = response_data.get('refresh_token', refresh_token)
                 
-            access_token = response_data.get('access_token')
-            token_type = response_data.get('token_type')
-            expires_in = response_data.get('expires_in')
-            
-            # If refresh token is returned, use it; otherwise, keep the old one
-            new_refresh_token = response_data.get('refresh_token', refresh_token)
-            
-            update_or_create_user_tokens(
-                session_id, access_token, token_type, expires_in, new_refresh_token)
-            
-            return True
+                update_or_create_user_tokens(
+                    session_id, access_token, token_type, expires_in, new_refresh_token)
+                
+                return True
             
-        except ConnectionError as e:
+        except (ConnectionError, Timeout) as e:
             logger.error(f"Connection error when refreshing token: {str(e)}")
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                retry_delay *= 2
-                continue
-            return False
-            
-        except Timeout as e:
-            logger.error(f"Timeout when refreshing token: {str(e)}")
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                retry_delay *= 2
-                continue
-            return False
             
         except RequestException as e:
             logger.error(f"Request exception when refreshing token: {str(e)}")
-            if attempt < max_retries - 1:
-                time.sleep(retry_delay)
-                retry_delay *= 2
-                continue
-            return False
+            if not is_retryable_status(getattr(e.response, 'status_code', None)):
+                return False
+            retry_after = parse_retry_after(e.response)
             
         except Exception as e:
             logger.error(f"Unexpected error when refreshing token: {str(e)}")
             return False
+
+        # Only immediate retries happen here, never sleep in the calling thread
+        if policy.next_delay(attempt, deadline, retry_after) != 0:
+            return False
+        record_retry('token')
     
     return False
 
 
-def execute_spotify_api_request(session_id, endpoint, post_=False, put_=False, data=None):
-    # Check if the user is authenticated and tokens are valid
-    if not is_spotify_authenticated(session_id):
+class TokenRefreshManager:
+    """
+    Coordinates access token refreshes so each session refreshes once.
+
+    Concurrent refreshes for a session are collapsed by a per-session lock
+    within the process, and by a lock in the shared cache between processes
+    (once CACHE_URL points at a shared backend). Tokens that expire within
+    SPOTIFY_TOKEN_REFRESH_MARGIN seconds are refreshed in a background
+    thread while the request carries on with the still-valid token.
+    """
+
+    def __init__(self):
+        self._locks = KeyedLocks()
+        self._process_locks = SharedCache('token-refresh')
+        self._refreshing = set()
+        self._guard = threading.Lock()
+
+    def needs_refresh(self, tokens):
+        margin = timedelta(seconds=getattr(settings, 'SPOTIFY_TOKEN_REFRESH_MARGIN', 60))
+        return tokens.expires_in <= timezone.now() + margin
+
+    def ensure_fresh(self, session_id):
+        """Return the session's tokens, refreshing them first if they have expired."""
+        tokens = get_user_tokens(session_id)
+        if tokens is None:
+            return None
+
+        if tokens.expires_in <= timezone.now():
+            return self.refresh(session_id, stale_access_token=tokens.access_token)
+        if self.needs_refresh(tokens):
+            self.refresh_in_background(session_id)
+        return tokens
+
+    def refresh(self, session_id, stale_access_token=None):
+        """
+        Refresh the session's tokens and return them, or None if they are gone.
+
+        When stale_access_token is given and the stored token has already
+        moved on from it, another thread or process did the refresh, and
+        the stored tokens are returned without calling Spotify.
+        """
+        with self._locks.hold(session_id):
+            # Always decide from the database row, not a cached copy
+            token_cache.invalidate(session_id)
+            tokens = get_user_tokens(session_id)
+            if tokens is None:
+                return None
+            if stale_access_token is not None and tokens.access_token != stale_access_token:
+                return tokens
+            if stale_access_token is None and not self.needs_refresh(tokens):
+                return tokens
+
+            lock_timeout = getattr(settings, 'SPOTIFY_TOKEN_REFRESH_LOCK_TIMEOUT', 30)
+            if not self._process_locks.add(session_id, True, lock_timeout):
+                logger.info(f"Token refresh for session {session_id} already running in another process")
+                return tokens
+
+            try:
+                record_token_refresh(refresh_spotify_token(session_id))
+            finally:
+                self._process_locks.delete(session_id)
+            return get_user_tokens(session_id)
+
+    def refresh_in_background(self, session_id):
+        with self._guard:
+            if session_id in self._refreshing:
+                return
+            self._refreshing.add(session_id)
+
+        def run():
+            try:
+                self.refresh(session_id)
+            except Exception as e:
+                logger.error(f"Background token refresh failed for session {session_id}: {str(e)}")
+            finally:
+                with self._guard:
+                    self._refreshing.discard(session_id)
+                # This thread's connection is never reused, so close it outright
+                connection.close()
+
+        threading.Thread(target=run, name='spotify-token-refresh', daemon=True).start()
+
+
+token_refresher = TokenRefreshManager()
+
+
+def execute_spotify_api_request(session_id, endpoint, post_=False, put_=False, data=None, priority=None):
+    """
+    Call the Spotify Web API and return the JSON body, {} for commands, or an error dict.
+
+    Calls go through rate_limiter, GETs as polls and everything else as
+    commands unless a priority is given. Calls it holds back, and calls
+    Spotify answers with 429, return a 429 error with 'retry_after'.
+
+    Retries follow RetryPolicy within the current request's time budget, and
+    are only made when they can happen right away. When a retry would need
+    a wait, the error is returned instead, with 'retry_after' seconds when
+    known, so the caller (the now-playing cache, the poller or the client)
+    can try again later without holding this thread.
+    """
+    # Check if the user is authenticated and tokens are valid, refreshing them if needed
+    tokens = token_refresher.ensure_fresh(session_id)
+    if not tokens:
         logger.error(f"User {session_id} is not authenticated with Spotify")
         return {'error': 'Authentication error', 'message': 'User not authenticated with Spotify'}
     
-    tokens = get_user_tokens(session_id)
-    if not tokens:
-        logger.error(f"No tokens found for session {session_id}")
-        return {'error': 'Authentication error', 'message': 'No Spotify tokens found'}
-    
-    # Check token expiration and refresh if needed
     if tokens.expires_in <= timezone.now():
-        logger.info(f"Token expired for session {session_id}, refreshing...")
-        refresh_success = refresh_spotify_token(session_id)
-        if not refresh_success:
-            logger.error(f"Failed to refresh token for session {session_id}")
-            return {'error': 'Authentication error', 'message': 'Failed to refresh Spotify token'}
-        # Get updated tokens
-        tokens = get_user_tokens(session_id)
+        logger.error(f"Failed to refresh token for session {session_id}")
+        return {'error': 'Authentication error', 'message': 'Failed to refresh Spotify token'}
     
     headers = {
         'Content-Type': 'application/json',
         'Authorization': f"Bearer {tokens.access_token}"
     }
     
-    url = BASE_URL + endpoint
-    max_retries = 2
-    retry_delay = 1  # seconds
-    
-    # Handle POST request
-    if post_:
-        for attempt in range(max_retries + 1):
-            try:
-                post_response = post(url, headers=headers, json=data, timeout=10)
-                post_response.raise_for_status()
-                break
-            except (ConnectionError, Timeout) as e:
-                logger.error(f"Connection error on POST to {endpoint}: {str(e)}")
-                if attempt < max_retries:
-                    time.sleep(retry_delay)
-                    retry_delay *= 2
-                else:
-                    return {'error': 'Connection error', 'message': f'Failed to connect to Spotify API: {str(e)}'}
-            except RequestException as e:
-                status_code = getattr(e.response, 'status_code', None)
-                if status_code == 401:  # Unauthorized, try to refresh token
-                    refresh_success = refresh_spotify_token(session_id)
-                    if refresh_success and attempt < max_retries:
-                        tokens = get_user_tokens(session_id)
-                        headers['Authorization'] = f"Bearer {tokens.access_token}"
-                        time.sleep(0.5)
-                        continue
-                logger.error(f"Request error on POST to {endpoint}: {str(e)}")
-                return {'error': 'API error', 'message': f'Spotify API error: {str(e)}'}
+    method = 'POST' if post_ else 'PUT' if put_ else 'GET'
+    if priority is None:
+        priority = POLL if method == 'GET' else COMMAND
+    url = api_url(endpoint)
+    breaker = circuit_breakers.for_endpoint(method, endpoint)
+    policy = RetryPolicy()
+    deadline = current_deadline()
     
-    # Handle PUT request
-    if put_:
-        for attempt in range(max_retries + 1):
-            try:
-                put_response = put(url, headers=headers, json=data, timeout=10)
-                put_response.raise_for_status()
-                break
-            except (ConnectionError, Timeout) as e:
-                logger.error(f"Connection error on PUT to {endpoint}: {str(e)}")
-                if attempt < max_retries:
-                    time.sleep(retry_delay)
-                    retry_delay *= 2
-                else:
-                    return {'error': 'Connection error', 'message': f'Failed to connect to Spotify API: {str(e)}'}
-            except RequestException as e:
-                status_code = getattr(e.response, 'status_code', None)
-                if status_code == 401:  # Unauthorized, try to refresh token
-                    refresh_success = refresh_spotify_token(session_id)
-                    if refresh_success and attempt < max_retries:
-                        tokens = get_user_tokens(session_id)
-                        headers['Authorization'] = f"Bearer {tokens.access_token}"
-                        time.sleep(0.5)
-                        continue
-                logger.error(f"Request error on PUT to {endpoint}: {str(e)}")
-                return {'error': 'API error', 'message': f'Spotify API error: {str(e)}'}
-    
-    # Handle GET request
-    for attempt in range(max_retries + 1):
+    for attempt in range(policy.max_attempts):
+        if deadline.expired():
+            break
+
+        wait = breaker.allow()
+        if wait:
+            logger.warning(f"Not calling {endpoint}, circuit {breaker.name} is open for {wait:.1f}s")
+            record_shed(endpoint, 'circuit_open')
+            return circuit_open_result(wait)
+
+        wait = rate_limiter.acquire(session_id, priority)
+        if wait:
+            breaker.release()
+            logger.warning(f"Holding back {method} to {endpoint} for session {session_id}, rate limited for {wait:.1f}s")
+            record_shed(endpoint, 'rate_limited')
+            return rate_limited_result(wait)
+
+        retry_after = None
         try:
-            get_response = get(url, {}, headers=headers, timeout=10)
-            get_response.raise_for_status()
+            with spotify_call(method, endpoint) as call:
+                response = get_http_session().request(
+                    method, url, headers=headers, json=data if method != 'GET' else None,
+                    timeout=deadline.timeout(http_timeout()))
+                call.status = response.status_code
+            breaker.record_response(response.status_code)
+            response.raise_for_status()
             
-            return get_response.json()
+            # Commands have no useful body, don't follow them with a GET
+            if method != 'GET':
+                return {}
+            # 204 No Content, e.g. currently-playing while nothing plays
+            if not response.content:
+                return {}
+            return response.json()
             
         except (ConnectionError, Timeout) as e:
-            logger.error(f"Connection error on GET to {endpoint}: {str(e)}")
-            if attempt < max_retries:
-                time.sleep(retry_delay)
-                retry_delay *= 2
-            else:
-                return {'error': 'Connection error', 'message': f'Failed to connect to Spotify API: {str(e)}'}
+            breaker.record_failure()
+            logger.error(f"Connection error on {method} to {endpoint}: {str(e)}")
+            error = {'error': 'Connection error', 'message': f'Failed to connect to Spotify API: {str(e)}'}
         except RequestException as e:
             status_code = getattr(e.response, 'status_code', None)
-            if status_code == 401:  # Unauthorized, try to refresh token
-                refresh_success = refresh_spotify_token(session_id)
-                if refresh_success and attempt < max_retries:
-                    tokens = get_user_tokens(session_id)
+            if e.response is None:
+                breaker.release()
+            if status_code == 401 and attempt + 1 < policy.max_attempts:  # Unauthorized, try to refresh token
+                refreshed = token_refresher.refresh(session_id, stale_access_token=tokens.access_token)
+                if refreshed and refreshed.access_token != tokens.access_token:
+                    tokens = refreshed
                     headers['Authorization'] = f"Bearer {tokens.access_token}"
-                    time.sleep(0.5)
+                    record_retry(endpoint)
                     continue
-            logger.error(f"Request error on GET to {endpoint}: {str(e)}")
-            return {'error': 'API error', 'message': f'Spotify API error: {str(e)}'}
+            logger.error(f"Request error on {method} to {endpoint}: {str(e)}")
+            error = {'error': 'API error', 'message': f'Spotify API error: {str(e)}', 'status': status_code}
+            if status_code == 429:
+                # Retrying would only prolong the throttling
+                error['retry_after'] = rate_limiter.throttled(session_id, parse_retry_after(e.response))
+                return error
+            if not is_retryable_status(status_code):
+                return error
+            retry_after = parse_retry_after(e.response)
         except ValueError as e:
             logger.error(f"JSON decode error for {endpoint}: {str(e)}")
             return {'error': 'Parse error', 'message': 'Invalid response from Spotify API'}
         except Exception as e:
+            breaker.release()
             logger.error(f"Unexpected error for {endpoint}: {str(e)}")
             return {'error': 'Unknown error', 'message': f'An unexpected error occurred: {str(e)}'}
+
+        delay = policy.next_delay(attempt, deadline, retry_after)
+        if delay != 0:
+            if delay is not None:
+                retry_after = delay
+            if retry_after is not None:
+                error['retry_after'] = retry_after
+            return error
+        record_retry(endpoint)
     
-    return {'error': 'Request failed', 'message': 'All request attempts failed'}
-def check_for_active_spotify_device(session_id, max_retries=2):
+    logger.error(f"{method} to {endpoint} ran out of time")
+    return {'error': 'Timeout', 'message': 'Spotify API request exceeded its time budget'}
+
+
+def check_for_active_spotify_device(session_id):
     """
     Check if there's an active Spotify device and try to activate one if not.
     Returns a tuple (success, message, device_name)
     """
-    # Maximum retry attempts for getting devices
-    for attempt in range(max_retries):
-        # Get available devices
-        devices = get_available_devices(session_id)
-        
-        if devices is None:
-            if attempt < max_retries - 1:
-                logger.warning(f"Failed to get devices, retrying in 1 second (attempt {attempt+1}/{max_retries})")
-                time.sleep(1)
-                continue
-            return False, "Failed to retrieve Spotify devices", None
-        
-        # Check for active devices
-        active_devices = [d for d in devices if d.get('is_active', True)]
-        if active_devices:
-            logger.info(f"Found active Spotify device: {active_devices[0].get('name', 'Unknown')}")
-            return True, "Active device found", active_devices[0].get('name', 'Unknown')
-        
-        # If no active devices but there are available devices
-        available_devices = devices
-        if available_devices:
-            # Try to activate the first available device
-            logger.info(f"No active device found. Attempting to activate device: {available_devices[0].get('name', 'Unknown')}")
-            
-            # Try to transfer playback
-            for transfer_attempt in range(2):
-                transfer_result = execute_spotify_api_request(
-                    session_id, 
-                    "player", 
-                    put_=True, 
-                    data={
-                        "device_ids": [available_devices[0].get('id')],
-                        "play": False  # Don't auto-play yet
-                    }
-                )
-                
-                if transfer_result is None or 'error' not in transfer_result:
-                    logger.info(f"Successfully activated device: {available_devices[0].get('name', 'Unknown')}")
-                    return True, f"Activated Spotify on {available_devices[0].get('name', 'Unknown')}", available_devices[0].get('name', 'Unknown')
-                
-                # If failed to transfer, try again after a short delay
-                error_msg = transfer_result.get('message', 'Unknown error')
-                logger.warning(f"Failed to activate device (attempt {transfer_attempt+1}/2): {error_msg}")
-                
-                if transfer_attempt < 1:
-                    time.sleep(1)
-        
-        # If we got here with no success and there are retries left
-        if attempt < max_retries - 1:
-            logger.warning(f"No active Spotify devices found, retrying in 2 seconds (attempt {attempt+1}/{max_retries})")
-            time.sleep(2)
-    
-    # If we exhausted all retries, check if there were any devices at all
     devices = get_available_devices(session_id)
-    if not devices or len(devices) == 0:
+    if devices is None:
+        return False, "Failed to retrieve Spotify devices", None
+    
+    # Check for active devices
+    active_devices = [d for d in devices if d.get('is_active', True)]
+    if active_devices:
+        logger.info(f"Found active Spotify device: {active_devices[0].get('name', 'Unknown')}")
+        return True, "Active device found", active_devices[0].get('name', 'Unknown')
+    
+    if not devices:
         return False, "No Spotify devices found. Please open Spotify on any device and try again.", None
     
+    # Try to activate the first available device
+    device = devices[0]
+    logger.info(f"No active device found. Attempting to activate device: {device.get('name', 'Unknown')}")
+    transfer_result = execute_spotify_api_request(
+        session_id, 
+        "player", 
+        put_=True, 
+        data={
+            "device_ids": [device.get('id')],
+            "play": False  # Don't auto-play yet
+        }
+    )
+    
+    if transfer_result is None or 'error' not in transfer_result:
+        device_cache.invalidate(session_id)
+        logger.info(f"Successfully activated device: {device.get('name', 'Unknown')}")
+        return True, f"Activated Spotify on {device.get('name', 'Unknown')}", device.get('name', 'Unknown')
+    
+    logger.warning(f"Failed to activate device: {transfer_result.get('message', 'Unknown error')}")
     return False, "Failed to activate Spotify device. Please manually start playback on your device.", None
 
-def get_available_devices(session_id):
+
+class DeviceCache:
+    """
+    Short-lived per-host cache of the player/devices list.
+
+    Device lists change rarely compared to how often rooms are polled, so
+    they are reused for SPOTIFY_DEVICE_CACHE_TTL seconds and dropped
+    whenever a command moves playback to another device.
+    """
+
+    def __init__(self):
+        self._store = SharedCache('devices')
+
+    def get(self, session_id):
+        return self._store.get(session_id)
+
+    def set(self, session_id, devices):
+        self._store.set(session_id, devices, getattr(settings, 'SPOTIFY_DEVICE_CACHE_TTL', 10))
+
+    def invalidate(self, session_id):
+        self._store.delete(session_id)
+
+
+device_cache = DeviceCache()
+
+
+class NoActiveDeviceError(ConnectionError):
+    """Raised when a playback command finds no Spotify device to run on."""
+
+    def __init__(self, message, devices=None):
+        super().__init__(message)
+        self.devices = devices
+
+
+class RateLimitedError(ConnectionError):
+    """Raised when a playback command is rate limited, by Spotify or by rate_limiter."""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def rate_limited_result(retry_after):
+    """The error result for a call that rate_limiter held back."""
+    return {'error': 'Rate limited', 'message': 'Spotify API error: 429 Too Many Requests (rate limited)',
+            'status': 429, 'retry_after': retry_after}
+
+
+def circuit_open_result(retry_after):
+    """The error result for a call skipped because its circuit breaker is open."""
+    return {'error': 'Circuit open', 'message': 'Spotify API is unavailable, please try again shortly',
+            'status': 503, 'retry_after': retry_after}
+
+
+def is_upstream_unavailable(result):
+    """Whether an error result means Spotify couldn't be reached, rather than refusing the call."""
+    return (result.get('error') in ('Connection error', 'Timeout', 'Circuit open', 'Rate limited')
+            or is_retryable_status(result.get('status')))
+
+
+def get_available_devices(session_id, refresh=False, priority=POLL):
     """
     Get a list of available Spotify devices for the user.
+    Served from the device cache unless refresh is True.
     """
-    result = execute_spotify_api_request(session_id, "player/devices")
+    if not refresh:
+        devices = device_cache.get(session_id)
+        if devices is not None:
+            return devices
+
+    result = execute_spotify_api_request(session_id, "player/devices", priority=priority)
     if result and 'error' in result:
         logger.error(f"Error getting devices for session {session_id}: {result.get('message', 'Unknown error')}")
         return None
-        
-    return result.get('devices', [])
+
+    devices = result.get('devices', [])
+    device_cache.set(session_id, devices)
+    return devices
+
+
+def with_device_id(endpoint, device_id):
+    separator = '&' if '?' in endpoint else '?'
+    return f"{endpoint}{separator}device_id={device_id}"
+
+
+def pick_fallback_device(session_id, devices):
+    """Return the device to retry a command on, or raise NoActiveDeviceError."""
+    if devices is None:
+        raise NoActiveDeviceError("Failed to retrieve Spotify devices")
+    if not devices:
+        raise NoActiveDeviceError("No Spotify devices found. Please open Spotify on any device and try again.", devices)
+
+    device = devices[0]
+    logger.info(f"No active device for session {session_id}, targeting device: {device.get('name', 'Unknown')}")
+    return device
+
+
+def send_playback_command(session_id, endpoint, post_=False, put_=False, data=None):
+    """
+    Send a playback command, assuming the host already has an active device.
+
+    Only if Spotify answers 404 (no active device) are the host's devices
+    looked up, and the command is sent once more addressed to the first of
+    them, which also activates it.
+    """
+    result = execute_spotify_api_request(session_id, endpoint, post_=post_, put_=put_, data=data)
+    if not (result and result.get('status') == 404):
+        return result
+
+    device = pick_fallback_device(session_id, get_available_devices(session_id, refresh=True, priority=COMMAND))
+    result = execute_spotify_api_request(
+        session_id, with_device_id(endpoint, device.get('id')), post_=post_, put_=put_, data=data)
+    device_cache.invalidate(session_id)
+    return result
+
+def get_playback_error_message(result, premium_message="Cannot control playback: No active device found or premium required.",
+                               handle_auth=False):
+    """Turn an error result from a playback command into a message for the user."""
+    error_message = result.get('message', 'Unknown error')
+
+    if result.get('status') == 429:
+        retry_after = result.get('retry_after')
+        if retry_after:
+            return f"Spotify is receiving too many requests. Please try again in {math.ceil(retry_after)} seconds."
+        return "Spotify is receiving too many requests. Please try again shortly."
+
+    # Extract Spotify error code if present
+    if 'Spotify API error:' in error_message and '403' in error_message:
+        return premium_message
+    elif 'Spotify API error:' in error_message and '404' in error_message:
+        return "No active Spotify device found. Please open Spotify on your device."
+    elif handle_auth and 'Spotify API error:' in error_message and '401' in error_message:
+        return "Authentication error. Please reconnect your Spotify account."
+
+    return error_message
+
+
+def playback_error(result, message):
+    """The exception to raise for a failed playback command."""
+    if result.get('status') == 429:
+        return RateLimitedError(message, result.get('retry_after'))
+    return ConnectionError(message)
 
 def play_song(session_id):
     """
     Start or resume playback on user's Spotify account.
-    Checks for active devices and handles common errors.
-    Returns dict with error information if unsuccessful.
+    Raises NoActiveDeviceError, RateLimitedError or ConnectionError if unsuccessful.
     """
-    # First check if we have an active Spotify device
-    success, message, device_name = check_for_active_spotify_device(session_id)
-    
-    if not success:
-        # If we couldn't find or activate a device, return a helpful error
-        logger.error(f"Cannot play song: {message}")
-        raise ConnectionError(message)
-    
-    # Log the action
-    logger.info(f"Attempting to play song on device: {device_name}")
-    
-    # Try to play
-    result = execute_spotify_api_request(session_id, "player/play", put_=True)
+    logger.info(f"Attempting to play song for session {session_id}")
+    result = send_playback_command(session_id, "player/play", put_=True)
     
     # Handle specific error cases
     if result and 'error' in result:
-        error_message = result.get('message', 'Unknown error')
-        
-        # Extract Spotify error code if present
-        if 'Spotify API error:' in error_message and '403' in error_message:
-            error_message = "Cannot control playback: No active device found or premium required. Please start Spotify on a device first."
-        elif 'Spotify API error:' in error_message and '404' in error_message:
-            error_message = "No active Spotify device found. Please open Spotify on your device."
-        elif 'Spotify API error:' in error_message and '401' in error_message:
-            error_message = "Authentication error. Please reconnect your Spotify account."
+        error_message = get_playback_error_message(
+            result,
+            premium_message="Cannot control playback: No active device found or premium required. Please start Spotify on a device first.",
+            handle_auth=True)
         
         logger.error(f"Error playing song for session {session_id}: {error_message}")
-        raise ConnectionError(error_message)
+        raise playback_error(result, error_message)
         
     return result
 
 def pause_song(session_id):
     """
     Pause playback on user's Spotify account.
-    Returns dict with error information if unsuccessful.
+    Raises NoActiveDeviceError, RateLimitedError or ConnectionError if unsuccessful.
     """
-    # First check if we have an active Spotify device
-    success, message, device_name = check_for_active_spotify_device(session_id)
-    
-    if not success:
-        # If we couldn't find or activate a device, return a helpful error
-        logger.error(f"Cannot pause song: {message}")
-        raise ConnectionError(message)
-    
-    # Log the action
-    logger.info(f"Attempting to pause song on device: {device_name}")
-    
-    # Try to pause
-    result = execute_spotify_api_request(session_id, "player/pause", put_=True)
+    logger.info(f"Attempting to pause song for session {session_id}")
+    result = send_playback_command(session_id, "player/pause", put_=True)
     
     # Handle errors
     if result and 'error' in result:
-        error_message = result.get('message', 'Unknown error')
-        
-        # Extract Spotify error code if present
-        if 'Spotify API error:' in error_message and '403' in error_message:
-            error_message = "Cannot control playback: No active device found or premium required."
-        elif 'Spotify API error:' in error_message and '404' in error_message:
-            error_message = "No active Spotify device found. Please open Spotify on your device."
+        error_message = get_playback_error_message(result)
         
         logger.error(f"Error pausing song for session {session_id}: {error_message}")
-        raise ConnectionError(error_message)
+        raise playback_error(result, error_message)
         
     return result
 
@@ -420,33 +664,16 @@ def pause_song(session_id):
 def skip_song(session_id):
     """
     Skip to the next track in user's Spotify queue.
-    Returns dict with error information if unsuccessful.
+    Raises NoActiveDeviceError, RateLimitedError or ConnectionError if unsuccessful.
     """
-    # First check if we have an active Spotify device
-    success, message, device_name = check_for_active_spotify_device(session_id)
-    
-    if not success:
-        # If we couldn't find or activate a device, return a helpful error
-        logger.error(f"Cannot skip song: {message}")
-        raise ConnectionError(message)
-    
-    # Log the action
-    logger.info(f"Attempting to skip song on device: {device_name}")
-    
-    # Try to skip
-    result = execute_spotify_api_request(session_id, "player/next", post_=True)
+    logger.info(f"Attempting to skip song for session {session_id}")
+    result = send_playback_command(session_id, "player/next", post_=True)
     
     # Handle errors
     if result and 'error' in result:
-        error_message = result.get('message', 'Unknown error')
-        
-        # Extract Spotify error code if present
-        if 'Spotify API error:' in error_message and '403' in error_message:
-            error_message = "Cannot control playback: No active device found or premium required."
-        elif 'Spotify API error:' in error_message and '404' in error_message:
-            error_message = "No active Spotify device found. Please open Spotify on your device."
+        error_message = get_playback_error_message(result)
         
         logger.error(f"Error skipping song for session {session_id}: {error_message}")
-        raise ConnectionError(error_message)
+        raise playback_error(result, error_message)
         
     return result
@@ -1,17 +1,26 @@
+from django.conf import settings
 from django.shortcuts import render, redirect
+from django.http import HttpResponse, JsonResponse
+from django.views import View
+from asgiref.sync import sync_to_async
 from .credentials import REDIRECT_URI, CLIENT_SECRET, CLIENT_ID, SCOPE
 from rest_framework.views import APIView
-from requests import Request, post, ConnectionError, Timeout, RequestException
+from requests import Request, ConnectionError, Timeout, RequestException
 from rest_framework.response import Response
 from rest_framework import status
 import logging
+import math
 
 # Set up logger
 logger = logging.getLogger('spotify.views')
 from .util import *
-from .util import check_for_active_spotify_device, get_available_devices
-from api.models import Room
-from .models import Vote
+from .util import check_for_active_spotify_device, NoActiveDeviceError, RateLimitedError
+from .async_util import acheck_for_active_spotify_device, aplay_song, apause_song, askip_song
+from .now_playing import (now_playing_cache, get_room_now_playing, aget_room_now_playing,
+                          conditional_now_playing)
+from .metrics import registry
+from api.room_cache import get_room
+from .votes import record_vote, claim_skip, clear_votes, NoCurrentSongError
 
 
 class AuthURL(APIView):
@@ -20,12 +29,7 @@ class AuthURL(APIView):
             logger.info("Generating Spotify authorization URL")
             
             # Use the comprehensive scope from credentials
-            url = Request('GET', 'https://accounts.spotify.com/authorize', params={
-                'scope': SCOPE,
-                'response_type': 'code',
-                'redirect_uri': REDIRECT_URI,
-                'client_id': CLIENT_ID
-            }).prepare().url
+            url = get_spotify_auth_url()
             
             logger.debug(f"Generated auth URL with scopes: {SCOPE}")
             return Response({'url': url})
@@ -54,8 +58,8 @@ def spotify_callback(request, format=None):
     logger.info(f"Exchanging auth code for token")
     
     try:
-        response = post(
-            'https://accounts.spotify.com/api/token', 
+        response = get_http_session().post(
+            accounts_url('api/token'),
             data={
                 'grant_type': 'authorization_code',
                 'code': code,
@@ -109,15 +113,9 @@ def spotify_callback(request, format=None):
         logger.error("Missing access_token or refresh_token in Spotify response")
         return redirect('frontend:')
 
-    if not request.session.exists(request.session.session_key):
-        request.session.create()
-        logger.debug(f"Created new session with key: {request.session.session_key}")
-    else:
-        logger.debug(f"Using existing session with key: {request.session.session_key}")
-
     logger.info(f"Storing Spotify tokens for user session")
     update_or_create_user_tokens(
-        request.session.session_key, access_token, token_type, expires_in, refresh_token)
+        request.session.get_or_create_key(), access_token, token_type, expires_in, refresh_token)
 
     return redirect('frontend:')
 
@@ -163,168 +161,161 @@ class CurrentSong(APIView):
         if not room_code:
             return Response({"error": "No room code in session"}, status=status.HTTP_404_NOT_FOUND)
             
-        room = Room.objects.filter(code=room_code)
-        if room.exists():
-            room = room[0]
-        else:
+        room = get_room(room_code)
+        if room is None:
             return Response({"error": "Room not found"}, status=status.HTTP_404_NOT_FOUND)
             
         host = room.host
-        
-        # Check if there's an active Spotify device
-        devices = get_available_devices(host)
-        has_devices = devices is not None and len(devices) > 0
-        has_active_device = False
-        
-        if has_devices:
-            active_devices = [d for d in devices if d.get('is_active', False)]
-            has_active_device = len(active_devices) > 0
-            if has_active_device:
-                logger.info(f"Found active Spotify device: {active_devices[0].get('name', 'Unknown')}")
-        device_info = {
-            'has_devices': has_devices,
-            'has_active_device': has_active_device,
-            'devices': [{'id': d.get('id'), 'name': d.get('name'), 'type': d.get('type'), 'is_active': d.get('is_active', False)} 
-                        for d in (devices or [])]
-        }
+        status_code, song = get_room_now_playing(room)
+        device_info = song.get('device_info', {})
         
         # Try to activate a device if host and no active device
-        if request.session.session_key == host and has_devices and not has_active_device:
+        if request.session.session_key == host and device_info.get('has_devices') and not device_info.get('has_active_device'):
             logger.info("No active device found for host, attempting to activate one")
             success, message, device_name = check_for_active_spotify_device(host)
             if success:
                 logger.info(f"Successfully activated device: {device_name}")
-                device_info['has_active_device'] = True
-                device_info['activated_device'] = device_name
-        
-        endpoint = "player/currently-playing"
-        
-        # Check for token refresh errors
-        token = get_user_tokens(host)
-        if not token:
-            return Response({
-                "error": "Authentication Required",
-                "message": "Spotify authentication required. Please re-authenticate with Spotify.",
-                "requires_authentication": True,
-                "auth_url": Request('GET', 'https://accounts.spotify.com/authorize', params={
-                    'scope': SCOPE,
-                    'response_type': 'code',
-                    'redirect_uri': REDIRECT_URI,
-                    'client_id': CLIENT_ID
-                }).prepare().url
-            }, status=status.HTTP_401_UNAUTHORIZED)
-        
-        try:
-            response = execute_spotify_api_request(host, endpoint)
-        except ConnectionError as e:
-            error_msg = str(e)
-            # Check if the error indicates an authentication issue
-            if "authentication" in error_msg.lower() or "token" in error_msg.lower():
-                # Clear invalid tokens
-                clear_spotify_tokens(host)
-                return Response({
-                    "error": "Authentication Required",
-                    "message": "Your Spotify session has expired. Please re-authenticate.",
-                    "requires_authentication": True,
-                    "auth_url": Request('GET', 'https://accounts.spotify.com/authorize', params={
-                        'scope': SCOPE,
-                        'response_type': 'code',
-                        'redirect_uri': REDIRECT_URI,
-                        'client_id': CLIENT_ID
-                    }).prepare().url
-                }, status=status.HTTP_401_UNAUTHORIZED)
-            
-            return Response({
-                "error": "Failed to connect to Spotify API",
-                "device_info": device_info,
-                "requires_premium": True,
-                "spotify_open": has_devices
-            }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
-        except Exception as e:
-            error_msg = str(e)
-            # Check if the error indicates an authentication issue
-            if "authentication" in error_msg.lower() or "token" in error_msg.lower():
-                # Clear invalid tokens
-                clear_spotify_tokens(host)
-                return Response({
-                    "error": "Authentication Required",
-                    "message": "Your Spotify session has expired. Please re-authenticate.",
-                    "requires_authentication": True
-                }, status=status.HTTP_401_UNAUTHORIZED)
-                
-            return Response({
-                "error": str(e), 
-                "device_info": device_info,
-                "requires_premium": True,
-                "spotify_open": has_devices
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-
-        # Return device status even when no song is playing
-        if 'error' in response or 'item' not in response:
-            error_info = {}
-            if 'error' in response:
-                error_info = response.get('error', {})
-                logger.warning(f"Spotify API error: {error_info}")
-                
-            status_msg = 'ready' if has_active_device else 'no_active_device'
-            status_text = 'No song is currently playing'
-            
-            if not has_devices:
-                status_msg = 'no_devices'
-                status_text = 'No Spotify devices found. Please open Spotify on any device.'
-            elif not has_active_device:
-                status_text = 'No active Spotify device found. Please start Spotify on a device.'
-                
-            return Response({
-                'is_playing': False,
-                'device_info': device_info,
-                'requires_premium': True,
-                'spotify_open': has_devices,
-                'message': status_text,
-                'status': status_msg,
-                'error_details': error_info,
-                'has_premium': 'premium' not in str(error_info).lower()
-            }, status=status.HTTP_200_OK)
-
-        # Song is playing, extract details
-        item = response.get('item')
-        duration = item.get('duration_ms')
-        progress = response.get('progress_ms')
-        album_cover = item.get('album').get('images')[0].get('url')
-        is_playing = response.get('is_playing')
-        song_id = item.get('id')
-        
-        # Build artist string
-        artist_string = ""
-        for i, artist in enumerate(item.get('artists')):
-            if i > 0:
-                artist_string += ", "
-            name = artist.get('name')
-            artist_string += name
-
-        votes = len(Vote.objects.filter(room=room, song_id=song_id))
-        song = {
-            'title': item.get('name'),
-            'artist': artist_string,
-            'duration': duration,
-            'time': progress,
-            'image_url': album_cover,
-            'is_playing': is_playing,
-            'votes': votes,
-            'votes_required': room.votes_to_skip,
-            'id': song_id,
-            'device_info': device_info
-        }
-        self.update_room_song(room, song_id)
-        
-        return Response(song, status=status.HTTP_200_OK)
-    def update_room_song(self, room, song_id):
-        current_song = room.current_song
+                now_playing_cache.invalidate(room.code)
+                status_code, song = get_room_now_playing(room)
+                if 'device_info' in song:
+                    song['device_info'] = dict(song['device_info'], activated_device=device_name)
+
+        status_code, body, etag = conditional_now_playing(
+            room, status_code, song, request.headers.get('If-None-Match'), delta=request.GET.get('delta') == '1')
+        return Response(body, status=status_code, headers=now_playing_headers(etag))
+
+
+def now_playing_headers(etag):
+    if etag is None:
+        return None
+    # Clients revalidate every poll, the browser should not answer from its cache
+    return {'ETag': etag, 'Cache-Control': 'no-cache'}
+
+
+def current_song_stream(request):
+    # NowPlayingStreamRouter answers the stream under ASGI. Here, each open
+    # stream would hold a worker thread, so rooms poll current-song instead.
+    return JsonResponse({"error": "The song stream is only served by the ASGI application"},
+                        status=status.HTTP_404_NOT_FOUND)
+
+
+def metrics(request):
+    """Process-wide metrics in the Prometheus text format."""
+    allowed_ips = getattr(settings, 'SPOTIFY_METRICS_ALLOWED_IPS', None)
+    if allowed_ips is not None and request.META.get('REMOTE_ADDR') not in allowed_ips:
+        return HttpResponse(status=status.HTTP_403_FORBIDDEN)
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
+def no_device_error(message):
+    return {
+        "error": "No active Spotify device",
+        "message": message,
+        "details": "Please open Spotify on a device and try again."
+    }
+
 
-        if current_song != song_id:
-            room.current_song = song_id
-            room.save(update_fields=['current_song'])
-            votes = Vote.objects.filter(room=room).delete()
+def no_device_play_error(message, devices):
+    has_devices = devices is not None and len(devices) > 0
+
+    error_message = message
+    if not has_devices:
+        error_message = "No Spotify devices found. Please open Spotify on any device and try again."
+
+    return {
+        "error": "No active Spotify device",
+        "message": error_message,
+        "has_devices": has_devices,
+        "devices": [{'name': d.get('name'), 'type': d.get('type')} for d in (devices or [])]
+    }
+
+
+def rate_limit_error(message):
+    return {
+        "error": "Too Many Requests",
+        "message": message,
+        "details": "Spotify is limiting how often this room can be controlled."
+    }
+
+
+def retry_after_header(error):
+    if error.retry_after is None:
+        return None
+    return {'Retry-After': str(math.ceil(error.retry_after))}
+
+
+def pause_error(error_msg):
+    error_response = {
+        "error": "Failed to connect to Spotify API",
+        "message": error_msg
+    }
+
+    # Check for premium requirement error (403 Forbidden)
+    if "403" in error_msg:
+        error_response["error"] = "Spotify Premium Required"
+        error_response["message"] = "This action requires a Spotify Premium account"
+        error_response["details"] = "Playback control features like pause/play require Spotify Premium"
+
+    return error_response
+
+
+def play_error(error_msg):
+    error_response = {
+        "error": "Failed to connect to Spotify API",
+        "message": error_msg,
+        "hint": "This may be due to Spotify premium requirements or device issues."
+    }
+
+    # Check for premium requirement error (403 Forbidden)
+    if "403" in error_msg:
+        error_response["error"] = "Spotify Premium Required"
+        error_response["message"] = "This action requires a Spotify Premium account"
+        error_response["details"] = "Playback control features like pause/play require Spotify Premium"
+    elif "404" in error_msg:
+        error_response["error"] = "Player Not Available"
+        error_response["message"] = "No active player was found"
+        error_response["details"] = "Open Spotify on your device and start playing music first"
+
+    return error_response
+
+
+def skip_error(error_msg):
+    error_response = {
+        "error": "Failed to connect to Spotify API",
+        "message": error_msg
+    }
+
+    if "403" in error_msg:
+        error_response["error"] = "Spotify Premium Required"
+        error_response["message"] = "Skipping tracks requires a Spotify Premium account"
+        error_response["details"] = "Playback control features require Spotify Premium"
+    elif "404" in error_msg:
+        error_response["error"] = "No Active Playback"
+        error_response["message"] = "Cannot find active playback to skip"
+        error_response["details"] = "Start playing music on Spotify first"
+
+    return error_response
+
+
+def cast_skip_vote(room, session_key):
+    """
+    Count a skip request against the room's current song.
+
+    Returns True when the song should be skipped now (the host asked, or
+    this vote reaches votes_to_skip), otherwise records the vote and
+    returns False. Of many guests voting at once, only one gets True.
+    """
+    song_id = room.current_song
+
+    if session_key == room.host:
+        clear_votes(room, song_id)
+        return True
+
+    votes = record_vote(room, song_id, session_key)
+    if votes is None or votes < room.votes_to_skip:
+        return False
+
+    return claim_skip(room, song_id, room.votes_to_skip)
 
 
 class PauseSong(APIView):
@@ -334,41 +325,23 @@ class PauseSong(APIView):
             return Response({"error": "Not in a room"}, status=status.HTTP_404_NOT_FOUND)
             
         try:
-            room = Room.objects.filter(code=room_code)
-            if not room.exists():
+            room = get_room(room_code)
+            if room is None:
                 return Response({"error": "Room not found"}, status=status.HTTP_404_NOT_FOUND)
-                
-            room = room[0]
+
             if self.request.session.session_key == room.host or room.guest_can_pause:
-                # Check for active Spotify device before attempting to pause
-                success, message, device_name = check_for_active_spotify_device(room.host)
-                
-                if not success:
-                    return Response({
-                        "error": "No active Spotify device",
-                        "message": message,
-                        "details": "Please open Spotify on a device and try again."
-                    }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
-                
                 try:
                     pause_song(room.host)
+                    now_playing_cache.invalidate(room.code)
                     return Response({}, status=status.HTTP_204_NO_CONTENT)
+                except NoActiveDeviceError as e:
+                    return Response(no_device_error(str(e)), status=status.HTTP_503_SERVICE_UNAVAILABLE)
+                except RateLimitedError as e:
+                    return Response(rate_limit_error(str(e)), status=status.HTTP_429_TOO_MANY_REQUESTS,
+                                    headers=retry_after_header(e))
                 except ConnectionError as e:
                     logger.error(f"Failed to pause playback: {str(e)}")
-                    # Check for premium requirement error (403 Forbidden)
-                    error_msg = str(e)
-                    error_status = status.HTTP_503_SERVICE_UNAVAILABLE
-                    error_response = {
-                        "error": "Failed to connect to Spotify API",
-                        "message": error_msg
-                    }
-                    
-                    if "403" in error_msg:
-                        error_response["error"] = "Spotify Premium Required"
-                        error_response["message"] = "This action requires a Spotify Premium account"
-                        error_response["details"] = "Playback control features like pause/play require Spotify Premium"
-                    
-                    return Response(error_response, status=error_status)
+                    return Response(pause_error(str(e)), status=status.HTTP_503_SERVICE_UNAVAILABLE)
                 except Exception as e:
                     logger.error(f"Error pausing song: {str(e)}")
                     return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -385,57 +358,23 @@ class PlaySong(APIView):
             return Response({"error": "Not in a room"}, status=status.HTTP_404_NOT_FOUND)
             
         try:
-            room = Room.objects.filter(code=room_code)
-            if not room.exists():
+            room = get_room(room_code)
+            if room is None:
                 return Response({"error": "Room not found"}, status=status.HTTP_404_NOT_FOUND)
-                
-            room = room[0]
+
             if self.request.session.session_key == room.host or room.guest_can_pause:
-                # Check for active Spotify device before attempting to play
-                success, message, device_name = check_for_active_spotify_device(room.host)
-                
-                if not success:
-                    # Get available devices for better error message
-                    devices = get_available_devices(room.host)
-                    has_devices = devices is not None and len(devices) > 0
-                    
-                    error_message = message
-                    if not has_devices:
-                        error_message = "No Spotify devices found. Please open Spotify on any device and try again."
-                    
-                    return Response({
-                        "error": "No active Spotify device",
-                        "message": error_message,
-                        "has_devices": has_devices,
-                        "devices": [{'name': d.get('name'), 'type': d.get('type')} for d in (devices or [])]
-                    }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
-                
-                logger.info(f"Attempting to play music on device: {device_name}")
-                
                 try:
                     play_song(room.host)
+                    now_playing_cache.invalidate(room.code)
                     return Response({}, status=status.HTTP_204_NO_CONTENT)
+                except NoActiveDeviceError as e:
+                    return Response(no_device_play_error(str(e), e.devices), status=status.HTTP_503_SERVICE_UNAVAILABLE)
+                except RateLimitedError as e:
+                    return Response(rate_limit_error(str(e)), status=status.HTTP_429_TOO_MANY_REQUESTS,
+                                    headers=retry_after_header(e))
                 except ConnectionError as e:
-                    # Check for premium requirement error (403 Forbidden)
-                    error_msg = str(e)
-                    logger.error(f"Failed to play music: {error_msg}")
-                    
-                    error_response = {
-                        "error": "Failed to connect to Spotify API",
-                        "message": error_msg,
-                        "hint": "This may be due to Spotify premium requirements or device issues."
-                    }
-                    
-                    if "403" in error_msg:
-                        error_response["error"] = "Spotify Premium Required"
-                        error_response["message"] = "This action requires a Spotify Premium account"
-                        error_response["details"] = "Playback control features like pause/play require Spotify Premium"
-                    elif "404" in error_msg:
-                        error_response["error"] = "Player Not Available"
-                        error_response["message"] = "No active player was found"
-                        error_response["details"] = "Open Spotify on your device and start playing music first"
-                    
-                    return Response(error_response, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+                    logger.error(f"Failed to play music: {str(e)}")
+                    return Response(play_error(str(e)), status=status.HTTP_503_SERVICE_UNAVAILABLE)
                 except Exception as e:
                     logger.error(f"Error playing song: {str(e)}")
                     return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -452,61 +391,184 @@ class SkipSong(APIView):
             return Response({"error": "Not in a room"}, status=status.HTTP_404_NOT_FOUND)
             
         try:
-            room = Room.objects.filter(code=room_code)
-            if not room.exists():
+            room = get_room(room_code)
+            if room is None:
                 return Response({"error": "Room not found"}, status=status.HTTP_404_NOT_FOUND)
-                
-            room = room[0]
-            votes = Vote.objects.filter(room=room, song_id=room.current_song)
-            votes_needed = room.votes_to_skip
-
-            if self.request.session.session_key == room.host or len(votes) + 1 >= votes_needed:
-                votes.delete()
-                
-                # Check for active Spotify device before attempting to skip
-                success, message, device_name = check_for_active_spotify_device(room.host)
-                
-                if not success:
-                    return Response({
-                        "error": "No active Spotify device",
-                        "message": message,
-                        "details": "Please open Spotify on a device and try again."
-                    }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
-                    
+
+            try:
+                should_skip = cast_skip_vote(room, self.request.session.session_key)
+            except NoCurrentSongError as e:
+                return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
+            except Exception as e:
+                return Response({"error": f"Failed to save vote: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+            if should_skip:
                 try:
-                    logger.info(f"Attempting to skip song on device: {device_name}")
                     skip_song(room.host)
+                    now_playing_cache.invalidate(room.code)
+                except NoActiveDeviceError as e:
+                    return Response(no_device_error(str(e)), status=status.HTTP_503_SERVICE_UNAVAILABLE)
+                except RateLimitedError as e:
+                    return Response(rate_limit_error(str(e)), status=status.HTTP_429_TOO_MANY_REQUESTS,
+                                    headers=retry_after_header(e))
                 except ConnectionError as e:
-                    error_msg = str(e)
-                    logger.error(f"Failed to skip song: {error_msg}")
-                    
-                    error_response = {
-                        "error": "Failed to connect to Spotify API",
-                        "message": error_msg
-                    }
-                    
-                    if "403" in error_msg:
-                        error_response["error"] = "Spotify Premium Required"
-                        error_response["message"] = "Skipping tracks requires a Spotify Premium account"
-                        error_response["details"] = "Playback control features require Spotify Premium"
-                    elif "404" in error_msg:
-                        error_response["error"] = "No Active Playback"
-                        error_response["message"] = "Cannot find active playback to skip"
-                        error_response["details"] = "Start playing music on Spotify first"
-                    
-                    return Response(error_response, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+                    logger.error(f"Failed to skip song: {str(e)}")
+                    return Response(skip_error(str(e)), status=status.HTTP_503_SERVICE_UNAVAILABLE)
                 except Exception as e:
                     logger.error(f"Error skipping song: {str(e)}")
                     return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
-            else:
-                # Create a new vote
-                try:
-                    vote = Vote(user=self.request.session.session_key,
-                                room=room, song_id=room.current_song)
-                    vote.save()
-                except Exception as e:
-                    return Response({"error": f"Failed to save vote: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
             return Response({}, status=status.HTTP_204_NO_CONTENT)
         except Exception as e:
             return Response({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class AsyncSpotifyView(View):
+    """
+    Base class for the async versions of the playback views.
+
+    Under ASGI their Spotify calls are awaited rather than blocking a thread,
+    and database work is moved off the event loop with sync_to_async.
+    Like the DRF views they replace, they are exempt from CSRF checks.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        view = super().as_view(**initkwargs)
+        view.csrf_exempt = True
+        return view
+
+
+def get_session_room(request):
+    """Return (session_key, room_code, room) for the requesting session."""
+    room_code = request.session.get('room_code')
+    room = get_room(room_code)
+    return request.session.session_key, room_code, room
+
+
+aget_session_room = sync_to_async(get_session_room)
+
+
+class AsyncCurrentSong(AsyncSpotifyView):
+    async def get(self, request, *args, **kwargs):
+        session_key, room_code, room = await aget_session_room(request)
+
+        if not room_code:
+            return JsonResponse({"error": "No room code in session"}, status=status.HTTP_404_NOT_FOUND)
+        if room is None:
+            return JsonResponse({"error": "Room not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        host = room.host
+        status_code, song = await aget_room_now_playing(room)
+        device_info = song.get('device_info', {})
+
+        # Try to activate a device if host and no active device
+        if session_key == host and device_info.get('has_devices') and not device_info.get('has_active_device'):
+            logger.info("No active device found for host, attempting to activate one")
+            success, message, device_name = await acheck_for_active_spotify_device(host)
+            if success:
+                logger.info(f"Successfully activated device: {device_name}")
+                now_playing_cache.invalidate(room.code)
+                status_code, song = await aget_room_now_playing(room)
+                if 'device_info' in song:
+                    song['device_info'] = dict(song['device_info'], activated_device=device_name)
+
+        status_code, body, etag = conditional_now_playing(
+            room, status_code, song, request.headers.get('If-None-Match'), delta=request.GET.get('delta') == '1')
+        if body is None:
+            return HttpResponse(status=status_code, headers=now_playing_headers(etag))
+        return JsonResponse(body, status=status_code, headers=now_playing_headers(etag))
+
+
+class AsyncPauseSong(AsyncSpotifyView):
+    async def put(self, request, *args, **kwargs):
+        session_key, room_code, room = await aget_session_room(request)
+
+        if not room_code:
+            return JsonResponse({"error": "Not in a room"}, status=status.HTTP_404_NOT_FOUND)
+        if room is None:
+            return JsonResponse({"error": "Room not found"}, status=status.HTTP_404_NOT_FOUND)
+        if not (session_key == room.host or room.guest_can_pause):
+            return JsonResponse({"error": "You don't have permission to pause"}, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            await apause_song(room.host)
+        except NoActiveDeviceError as e:
+            return JsonResponse(no_device_error(str(e)), status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        except RateLimitedError as e:
+            return JsonResponse(rate_limit_error(str(e)), status=status.HTTP_429_TOO_MANY_REQUESTS,
+                                headers=retry_after_header(e))
+        except ConnectionError as e:
+            logger.error(f"Failed to pause playback: {str(e)}")
+            return JsonResponse(pause_error(str(e)), status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        except Exception as e:
+            logger.error(f"Error pausing song: {str(e)}")
+            return JsonResponse({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        now_playing_cache.invalidate(room.code)
+        return HttpResponse(status=status.HTTP_204_NO_CONTENT)
+
+
+class AsyncPlaySong(AsyncSpotifyView):
+    async def put(self, request, *args, **kwargs):
+        session_key, room_code, room = await aget_session_room(request)
+
+        if not room_code:
+            return JsonResponse({"error": "Not in a room"}, status=status.HTTP_404_NOT_FOUND)
+        if room is None:
+            return JsonResponse({"error": "Room not found"}, status=status.HTTP_404_NOT_FOUND)
+        if not (session_key == room.host or room.guest_can_pause):
+            return JsonResponse({"error": "You don't have permission to play"}, status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            await aplay_song(room.host)
+        except NoActiveDeviceError as e:
+            return JsonResponse(no_device_play_error(str(e), e.devices), status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        except RateLimitedError as e:
+            return JsonResponse(rate_limit_error(str(e)), status=status.HTTP_429_TOO_MANY_REQUESTS,
+                                headers=retry_after_header(e))
+        except ConnectionError as e:
+            logger.error(f"Failed to play music: {str(e)}")
+            return JsonResponse(play_error(str(e)), status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        except Exception as e:
+            logger.error(f"Error playing song: {str(e)}")
+            return JsonResponse({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        now_playing_cache.invalidate(room.code)
+        return HttpResponse(status=status.HTTP_204_NO_CONTENT)
+
+
+class AsyncSkipSong(AsyncSpotifyView):
+    async def post(self, request, *args, **kwargs):
+        session_key, room_code, room = await aget_session_room(request)
+
+        if not room_code:
+            return JsonResponse({"error": "Not in a room"}, status=status.HTTP_404_NOT_FOUND)
+        if room is None:
+            return JsonResponse({"error": "Room not found"}, status=status.HTTP_404_NOT_FOUND)
+
+        try:
+            should_skip = await sync_to_async(cast_skip_vote)(room, session_key)
+        except NoCurrentSongError as e:
+            return JsonResponse({"error": str(e)}, status=status.HTTP_409_CONFLICT)
+        except Exception as e:
+            return JsonResponse({"error": f"Failed to save vote: {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+        if should_skip:
+            try:
+                await askip_song(room.host)
+            except NoActiveDeviceError as e:
+                return JsonResponse(no_device_error(str(e)), status=status.HTTP_503_SERVICE_UNAVAILABLE)
+            except RateLimitedError as e:
+                return JsonResponse(rate_limit_error(str(e)), status=status.HTTP_429_TOO_MANY_REQUESTS,
+                                    headers=retry_after_header(e))
+            except ConnectionError as e:
+                logger.error(f"Failed to skip song: {str(e)}")
+                return JsonResponse(skip_error(str(e)), status=status.HTTP_503_SERVICE_UNAVAILABLE)
+            except Exception as e:
+                logger.error(f"Error skipping song: {str(e)}")
+                return JsonResponse({"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+            now_playing_cache.invalidate(room.code)
+
+        return HttpResponse(status=status.HTTP_204_NO_CONTENT)
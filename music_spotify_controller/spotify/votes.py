@@ -0,0 +1,100 @@
+from django.conf import settings
+from django.db import transaction, IntegrityError
+from django.db.models import F
+
+from .models import Vote, VoteTally
+from .shared_cache import SharedCache
+
+# Vote counts as shown to listeners, read through from the tally rows. Any
+# change to a tally drops its entry once the change is committed.
+vote_counts = SharedCache('votes')
+
+
+class NoCurrentSongError(Exception):
+    """A skip vote was cast in a room that isn't playing a song yet."""
+
+
+def vote_count_key(room, song_id):
+    return f"{room.pk}:{song_id}"
+
+
+def forget_vote_counts(room, song_ids):
+    keys = [vote_count_key(room, song_id) for song_id in song_ids]
+    transaction.on_commit(lambda: vote_counts.delete_many(keys))
+
+
+def cached_vote_count(room, song_id):
+    """The vote count from the shared cache alone, or None on a miss."""
+    return vote_counts.get(vote_count_key(room, song_id))
+
+
+def get_vote_count(room, song_id):
+    """Number of skip votes for a song in a room, read from the shared cache or its tally row."""
+    count = cached_vote_count(room, song_id)
+    if count is None:
+        counts = VoteTally.objects.filter(room=room, song_id=song_id).values_list('count', flat=True)[:1]
+        count = counts[0] if counts else 0
+        vote_counts.set(vote_count_key(room, song_id), count, getattr(settings, 'SPOTIFY_VOTE_CACHE_TTL', 5))
+    return count
+
+
+def record_vote(room, song_id, session_key):
+    """
+    Save a guest's skip vote and return the song's new vote count, or None
+    if the guest has already voted. Raises NoCurrentSongError if song_id is
+    None, i.e. the room hasn't seen a song yet.
+
+    The vote row and the tally increment are written in one transaction.
+    The increment is an UPDATE with an F() expression, which locks the
+    tally row, so concurrent voters each read back a distinct count.
+    """
+    if song_id is None:
+        raise NoCurrentSongError("No song is playing in this room yet")
+
+    with transaction.atomic():
+        try:
+            with transaction.atomic():
+                Vote.objects.create(user=session_key, room=room, song_id=song_id)
+        except IntegrityError:
+            # Only the unique vote per guest means they have already voted
+            if Vote.objects.filter(user=session_key).exists():
+                return None
+            raise
+
+        updated = VoteTally.objects.filter(room=room, song_id=song_id).update(count=F('count') + 1)
+        if not updated:
+            tally, created = VoteTally.objects.get_or_create(room=room, song_id=song_id, defaults={'count': 1})
+            if not created:
+                VoteTally.objects.filter(pk=tally.pk).update(count=F('count') + 1)
+
+        forget_vote_counts(room, [song_id])
+        counts = VoteTally.objects.filter(room=room, song_id=song_id).values_list('count', flat=True)[:1]
+        return counts[0]
+
+
+def claim_skip(room, song_id, votes_required):
+    """
+    Claim the skip once a song has enough votes. Only the caller whose
+    conditional DELETE removes the tally row gets True, so a burst of votes
+    past the threshold skips the song once.
+    """
+    with transaction.atomic():
+        claimed, _ = VoteTally.objects.filter(room=room, song_id=song_id, count__gte=votes_required).delete()
+        if claimed:
+            Vote.objects.filter(room=room, song_id=song_id).delete()
+            forget_vote_counts(room, [song_id])
+    return bool(claimed)
+
+
+def clear_votes(room, song_id=None):
+    """Delete a room's votes and tallies, for one song or all of them."""
+    votes = Vote.objects.filter(room=room)
+    tallies = VoteTally.objects.filter(room=room)
+    if song_id is not None:
+        votes = votes.filter(song_id=song_id)
+        tallies = tallies.filter(song_id=song_id)
+
+    with transaction.atomic():
+        forget_vote_counts(room, tallies.values_list('song_id', flat=True))
+        votes.delete()
+        tallies.delete()